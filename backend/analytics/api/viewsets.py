@@ -3,7 +3,9 @@ from datetime import timedelta
 from analytics.api.serializer import AnalyticsPlanAggregateSerializer
 from analytics.models import AnalyticsEmpireMaterialSnapshot, AnalyticsPlanAggregate
 from analytics.services.analytics_cache_manager import AnalyticsCacheManager
-from django.db.models import Sum
+from api.columnar import LAYOUT_COLUMNS, LAYOUT_PARAMETER, requested_layout, to_columns
+from django.db.models import FloatField, Sum
+from django.db.models.functions import Cast
 from django.http import Http404
 from django.utils import timezone
 from drf_spectacular.utils import extend_schema
@@ -45,21 +47,31 @@ class AnalyticsPlanAggregateViewSet(viewsets.ReadOnlyModelViewSet):
 
 
 class AnalyticsMarketInsightViewSet(viewsets.ViewSet):
-    @extend_schema(auth=[], summary='Fetch planning insights for materials')
+    TRACKER_COLUMNS = ['material_ticker', 'total_p', 'total_c', 'net_d']
+
+    @extend_schema(auth=[], summary='Fetch planning insights for materials', parameters=[LAYOUT_PARAMETER])
     @action(detail=False, methods=['get'], url_path='get-global-tracker')
     def get_global_materials(self, request):
 
+        layout = requested_layout(request)
+
         def fetch_data():
 
             active_cutoff = timezone.now() - timedelta(days=30)
 
+            sums = {'total_p': Sum('production'), 'total_c': Sum('consumption'), 'net_d': Sum('delta')}
+            if layout == LAYOUT_COLUMNS:
+                # cast in the database, the columns render as plain float arrays
+                sums = {name: Cast(expr, FloatField()) for name, expr in sums.items()}
+
             stats_queryset = (
                 AnalyticsEmpireMaterialSnapshot.objects.filter(empire__modified_at__gte=active_cutoff)
                 .values('material_ticker')
-                .annotate(total_p=Sum('production'), total_c=Sum('consumption'), net_d=Sum('delta'))
+                .annotate(**sums)
                 .order_by('material_ticker')
             )
+            rows = list(stats_queryset.values_list(*self.TRACKER_COLUMNS))
 
-            return list(stats_queryset.values_list('material_ticker', 'total_p', 'total_c', 'net_d'))
+            return to_columns(self.TRACKER_COLUMNS, rows) if layout == LAYOUT_COLUMNS else rows
 
-        return AnalyticsCacheManager.get_planning_insight_materials(fetch_data)
+        return AnalyticsCacheManager.get_planning_insight_materials(fetch_data, layout)
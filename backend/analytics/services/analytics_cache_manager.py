@@ -1,6 +1,7 @@
 from collections.abc import Callable
 from typing import Any
 
+from api.columnar import LAYOUT_ROWS
 from core.services.cache_manager import CacheManager
 from django.http import HttpResponse
 
@@ -16,7 +17,9 @@ class AnalyticsCacheManager(CacheManager):
         return cls.make_key('plan_aggregate', planet_natural_id)
 
     @classmethod
-    def key_planning_insight_materials(cls) -> str:
+    def key_planning_insight_materials(cls, layout: str = LAYOUT_ROWS) -> str:
+        if layout != LAYOUT_ROWS:
+            return cls.make_key('planning_insight_materials', layout)
         return cls.make_key('planning_insight_materials')
 
     # Operations
@@ -26,6 +29,6 @@ class AnalyticsCacheManager(CacheManager):
         return cls.get_or_set_response(key, func, timeout=cls.CACHE_TIMEOUT_3HOURS)
 
     @classmethod
-    def get_planning_insight_materials(cls, func: Callable[[], Any]) -> HttpResponse:
-        key = cls.key_planning_insight_materials()
+    def get_planning_insight_materials(cls, func: Callable[[], Any], layout: str = LAYOUT_ROWS) -> HttpResponse:
+        key = cls.key_planning_insight_materials(layout)
         return cls.get_or_set_response(key, func, timeout=cls.CACHE_TIMEOUT_3HOURS)
@@ -0,0 +1,38 @@
+from collections.abc import Sequence
+
+from drf_spectacular.types import OpenApiTypes
+from drf_spectacular.utils import OpenApiParameter
+from rest_framework.exceptions import ValidationError
+from rest_framework.request import Request
+
+LAYOUT_ROWS = 'rows'
+LAYOUT_COLUMNS = 'columns'
+
+LAYOUT_PARAMETER = OpenApiParameter(
+    'layout',
+    OpenApiTypes.STR,
+    enum=[LAYOUT_ROWS, LAYOUT_COLUMNS],
+    default=LAYOUT_ROWS,
+    description='`columns` returns `{columns: [...], data: {column: [...]}}` instead of one object per row',
+)
+
+
+def requested_layout(request: Request) -> str:
+    layout = request.query_params.get('layout', LAYOUT_ROWS)
+    if layout not in (LAYOUT_ROWS, LAYOUT_COLUMNS):
+        raise ValidationError({'layout': f'Supported: {LAYOUT_ROWS}, {LAYOUT_COLUMNS}'})
+    return layout
+
+
+def to_columns(columns: list[str], rows: Sequence[Sequence]) -> dict:
+    """
+    Column oriented representation of `rows`, each a sequence of values in `columns` order.
+
+    Values are taken as they are, so numeric columns should already be floats
+    (e.g. cast in the database) to be rendered by orjson without a fallback per cell.
+    """
+
+    if not rows:
+        return {'columns': columns, 'data': {column: [] for column in columns}}
+
+    return {'columns': columns, 'data': dict(zip(columns, map(list, zip(*rows, strict=True)), strict=True))}
@@ -0,0 +1,37 @@
+from collections.abc import Sequence
+
+from drf_spectacular.types import OpenApiTypes
+from drf_spectacular.utils import OpenApiParameter
+from rest_framework.exceptions import ValidationError
+from rest_framework.request import Request
+
+FIELDS_PARAMETER = OpenApiParameter(
+    'fields',
+    OpenApiTypes.STR,
+    description=(
+        'Comma separated fields to return, e.g. `uuid,plan_name`. '
+        'Prefixing every field with `-` returns all fields but those, e.g. `-plan_data`'
+    ),
+)
+
+
+def requested_fields(request: Request, available: Sequence[str]) -> list[str] | None:
+    """Fields of `available` selected by `?fields=`, in `available` order. None without the parameter."""
+
+    raw = request.query_params.get('fields')
+    if raw is None:
+        return None
+
+    names = [name.strip() for name in raw.split(',') if name.strip()]
+    excluded = [name[1:] for name in names if name.startswith('-')]
+
+    if not names or (excluded and len(excluded) != len(names)):
+        raise ValidationError({'fields': 'Either list the fields to include or prefix all of them with `-`'})
+
+    unknown = sorted(set(excluded or names) - set(available))
+    if unknown:
+        raise ValidationError({'fields': f'Unknown fields: {", ".join(unknown)}'})
+
+    if excluded:
+        return [name for name in available if name not in excluded]
+    return [name for name in available if name in names]
@@ -1,8 +1,12 @@
 from typing import Any
 
 from rest_framework.renderers import JSONRenderer
+from rest_framework.response import Response
 from rest_framework.utils import json as drf_json
 
+from api.fieldsets import requested_fields
+from api.pagination import OptInCursorPagination
+
 
 class JSONSafeSerializerMixin:
     """
@@ -15,3 +19,65 @@ class JSONSafeSerializerMixin:
         encoder_class = JSONRenderer.encoder_class
         string_version = drf_json.dumps(data, cls=encoder_class)
         return drf_json.loads(string_version)
+
+
+class SparseFieldsetMixin:
+    """
+    Serializer taking an optional `fields` argument, all other fields are dropped.
+    """
+
+    def __init__(self, *args: Any, fields: list[str] | None = None, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+
+        if fields is not None:
+            for name in set(self.fields) - set(fields):  # type: ignore
+                self.fields.pop(name)  # type: ignore
+
+
+class SparseListMixin:
+    """
+    List views with `?fields=` projection and opt-in cursor pagination, for a serializer
+    using `SparseFieldsetMixin`.
+
+    `sparse_list` returns None for plain list requests, which views keep serving from
+    their cache. Requests of `value_fields` only are read with `.values()`, otherwise the
+    columns in `deferrable_fields` that are not requested are deferred, and relations of
+    `field_prefetches` are only prefetched if requested.
+    """
+
+    cursor_ordering: tuple[str, ...] = ('uuid',)
+    value_fields: frozenset[str] = frozenset()
+    deferrable_fields: tuple[str, ...] = ()
+    field_prefetches: dict[str, str] = {}
+
+    @property
+    def cursor_paginator(self) -> OptInCursorPagination:
+        if not hasattr(self, '_cursor_paginator'):
+            self._cursor_paginator = OptInCursorPagination()
+        return self._cursor_paginator
+
+    def sparse_list(self, request) -> Response | None:
+        serializer_fields = self.get_serializer().fields  # type: ignore
+        fields = requested_fields(request, [name for name, field in serializer_fields.items() if not field.write_only])
+
+        if fields is None and not self.cursor_paginator.is_requested(request):
+            return None
+
+        queryset = self.get_queryset().prefetch_related(None)  # type: ignore
+        paginator = self.cursor_paginator
+
+        if fields is not None and set(fields) <= self.value_fields:
+            # the cursor position is read from the ordering fields, so they are always selected
+            queryset = queryset.values(*fields, *[name for name in self.cursor_ordering if name not in fields])
+            page = paginator.paginate_queryset(queryset, request, view=self)
+            data = [{name: row[name] for name in fields} for row in (page if page is not None else queryset)]
+        else:
+            selected = fields if fields is not None else list(serializer_fields)
+            queryset = queryset.defer(*[name for name in self.deferrable_fields if name not in selected])
+            queryset = queryset.prefetch_related(
+                *[lookup for name, lookup in self.field_prefetches.items() if name in selected]
+            )
+            page = paginator.paginate_queryset(queryset, request, view=self)
+            data = self.get_serializer(page if page is not None else queryset, many=True, fields=fields).data  # type: ignore
+
+        return paginator.get_paginated_response(data) if page is not None else Response(data)
@@ -0,0 +1,38 @@
+from drf_spectacular.types import OpenApiTypes
+from drf_spectacular.utils import OpenApiParameter
+from rest_framework.pagination import CursorPagination
+
+CURSOR_PARAMETERS = [
+    OpenApiParameter('cursor', OpenApiTypes.STR, description='Page cursor, from `next` / `previous` of a page'),
+    OpenApiParameter(
+        'page_size',
+        OpenApiTypes.INT,
+        description='Paginates the list: `{next, previous, results}` instead of a plain list (max 500)',
+    ),
+]
+
+
+class OptInCursorPagination(CursorPagination):
+    """
+    Cursor pagination only applied when a `cursor` or `page_size` is requested,
+    plain lists stay unpaginated for existing clients.
+
+    Views set the ordering with `cursor_ordering`, the cursor position is taken from its first field.
+    """
+
+    page_size = 50
+    page_size_query_param = 'page_size'
+    max_page_size = 500
+    ordering = ('uuid',)
+
+    def is_requested(self, request) -> bool:
+        params = request.query_params
+        return self.cursor_query_param in params or self.page_size_query_param in params
+
+    def paginate_queryset(self, queryset, request, view=None):
+        if not self.is_requested(request):
+            return None
+        return super().paginate_queryset(queryset, request, view)
+
+    def get_ordering(self, request, queryset, view):
+        return getattr(view, 'cursor_ordering', self.ordering)
@@ -0,0 +1,66 @@
+import io
+from functools import cache
+
+from core.fields import ValidatedJSON
+from pydantic import BaseModel, ConfigDict, ValidationError, create_model
+from rest_framework.parsers import JSONParser
+from rest_framework.serializers import Serializer
+
+from api.serializer import PydanticJSONField
+
+
+class JSONPatchParser(JSONParser):
+    """RFC 6902 JSON Patch documents, parsed like JSON."""
+
+    media_type = 'application/json-patch+json'
+
+
+@cache
+def _body_model(serializer_class: type[Serializer]) -> type[BaseModel] | None:
+    """Request body model validating the `PydanticJSONField`s of a serializer, other keys pass through."""
+
+    fields = {
+        name: (field.pydantic_model | None, None)
+        for name, field in serializer_class._declared_fields.items()  # type: ignore
+        if isinstance(field, PydanticJSONField)
+    }
+    if not fields:
+        return None
+
+    return create_model(  # type: ignore
+        f'{serializer_class.__name__}Body', __config__=ConfigDict(extra='allow'), **fields
+    )
+
+
+class PydanticJSONParser(JSONParser):
+    """
+    JSON parser validating the `PydanticJSONField`s of the views serializer with
+    `model_validate_json`, in one pass over the raw request bytes.
+
+    Validated fields are passed on as `ValidatedJSON`, which `PydanticJSONField` accepts
+    as is and `PrevalidatedJSONField` stores from its encoding. Bodies that do not validate
+    are parsed as plain JSON, the serializer then reports the errors.
+    """
+
+    def parse(self, stream, media_type=None, parser_context=None):
+        body = stream.read() if stream is not None else b''
+
+        view = (parser_context or {}).get('view')
+        model = _body_model(view.get_serializer_class()) if hasattr(view, 'get_serializer_class') else None
+
+        if model is not None and body:
+            try:
+                parsed = model.model_validate_json(body)
+            except ValidationError:
+                pass
+            else:
+                data = dict(parsed.__pydantic_extra__ or {})
+                for name in type(parsed).model_fields:
+                    value = getattr(parsed, name)
+                    if isinstance(value, BaseModel):
+                        data[name] = ValidatedJSON(value.model_dump(), type(value), value.model_dump_json())
+                    elif name in parsed.model_fields_set:
+                        data[name] = value
+                return data
+
+        return super().parse(io.BytesIO(body), media_type, parser_context)
@@ -1,3 +1,4 @@
+from core.fields import ValidatedJSON
 from pydantic import BaseModel
 from rest_framework import serializers
 
@@ -8,14 +9,19 @@ class PydanticJSONField(serializers.JSONField):
         super().__init__(**kwargs)
 
     def to_internal_value(self, data):
+        # already validated while parsing the request, see api.parsers.PydanticJSONParser
+        if isinstance(data, ValidatedJSON) and data.schema is self.pydantic_model:
+            return data
+
         # raw JSON to Pydantic Model
         data = super().to_internal_value(data)
 
         try:
             model_instance = self.pydantic_model.model_validate(data)
-            return model_instance.model_dump()
         except Exception as exc:
             raise serializers.ValidationError(str(exc)) from exc
 
+        return ValidatedJSON(model_instance.model_dump(), self.pydantic_model, model_instance.model_dump_json())
+
     def to_representation(self, value):
         return value
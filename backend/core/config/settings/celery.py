@@ -57,7 +57,6 @@ CELERY_TASK_ANNOTATIONS = {
         'priority': 5,
         'rate_limit': '2/s',
     },
-    'gamedata_process_fio_webhook': {'priority': 4},
     'gamedata_dispatch_fio_updates': {'priority': 3},
     'gamedata_refresh_user_fiodata': {
         'priority': 3,
@@ -65,4 +64,11 @@ CELERY_TASK_ANNOTATIONS = {
     },
     'gamedata_refresh_cxpc': {'priority': 9, 'rate_limit': '10/s', 'acks_late': True, 'ignore_results': False},
     'gamedata_refresh_exchange_analytics': {'priority': 9},
+    'gamedata_compact_cxpc': {'priority': 9},
+    # planning
+    'planning_refresh_plan_contribution': {'priority': 4},
+    'planning_attach_empire_plan': {'priority': 4},
+    'planning_detach_empire_plan': {'priority': 4},
+    'planning_purge_deletions': {'priority': 9},
+    'planning_flush_shared_views': {'priority': 9},
 }
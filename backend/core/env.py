@@ -59,6 +59,12 @@ class EmailSettings(BaseSettings):
     model_config = SettingsConfigDict(extra='ignore', env_file=str(ENV_FILE) if ENV_FILE else None, env_prefix='EMAIL_')
 
 
+class FIOSettings(BaseSettings):
+    base_url: str = Field(default='https://rest.fnar.net/')
+
+    model_config = SettingsConfigDict(extra='ignore', env_file=str(ENV_FILE) if ENV_FILE else None, env_prefix='FIO_')
+
+
 class Settings(BaseSettings):
     django_settings_module: str = Field(default='core.config.django.local')
     django_secret_key: str = Field(default='---')
@@ -68,6 +74,7 @@ class Settings(BaseSettings):
     cache: CacheSettings = CacheSettings()
     celery: CelerySettings = CelerySettings()
     email: EmailSettings = EmailSettings()
+    fio: FIOSettings = FIOSettings()
     rest_framework: RestFrameworkSettings = RestFrameworkSettings()
 
     model_config = SettingsConfigDict(env_file=str(ENV_FILE) if ENV_FILE else None, extra='ignore')
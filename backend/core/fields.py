@@ -0,0 +1,34 @@
+from typing import Any
+
+from django.db import models
+
+
+class ValidatedJSON(dict):
+    """
+    JSON object that was validated against a pydantic model, together with its JSON encoding.
+
+    `PrevalidatedJSONField` stores the encoding as is instead of encoding the object again.
+    The encoding is not updated on changes, modify a copy instead.
+    """
+
+    __slots__ = ('schema', 'json')
+
+    def __init__(self, data: dict, schema: type, json: str) -> None:
+        super().__init__(data)
+        self.schema = schema
+        self.json = json
+
+
+class PrevalidatedJSONField(models.JSONField):
+    """JSONField writing `ValidatedJSON` values from their encoding, any other value like a JSONField."""
+
+    def get_db_prep_value(self, value: Any, connection: Any, prepared: bool = False) -> Any:
+        if not isinstance(value, ValidatedJSON):
+            return super().get_db_prep_value(value, connection, prepared)
+
+        if connection.vendor == 'postgresql':
+            from psycopg.types.json import Jsonb
+
+            return Jsonb(value, dumps=lambda obj: obj.json)
+
+        return value.json
@@ -0,0 +1,81 @@
+from collections.abc import Callable, Hashable, Iterable
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from fnmatch import fnmatchcase
+from typing import Any
+
+from core.services.cache_manager import CacheManager
+from django.db import transaction
+
+Refresh = Callable[[Any, set], Any]
+
+
+@dataclass
+class _Batch:
+    keys: set[str] = field(default_factory=set)
+    patterns: set[str] = field(default_factory=set)
+    refreshes: dict[tuple[Refresh, Hashable], set] = field(default_factory=dict)
+
+
+_pending: ContextVar[_Batch | None] = ContextVar('cache_invalidation_pending', default=None)
+
+
+class CacheInvalidation:
+    """
+    Collects the cache keys, key patterns and cached data refreshes of a transaction and runs
+    them once after it commits: one `CacheManager.purge` (a single pipeline of DELs), then
+    each refresh with all items collected for it. Outside of a transaction they run right away.
+
+    Every call registers the idempotent `flush` with `transaction.on_commit`, the first one
+    run at commit handles the whole batch. Keys and patterns covered by a collected pattern
+    are dropped. Work collected in a rolled back transaction is purged with the next flush
+    of the same context, which only invalidates more than needed.
+    """
+
+    @classmethod
+    def _batch(cls) -> _Batch:
+        batch = _pending.get()
+        if batch is None:
+            batch = _Batch()
+            _pending.set(batch)
+        return batch
+
+    @classmethod
+    def _schedule(cls) -> None:
+        # registered after the work is collected, outside of a transaction on_commit runs right away
+        transaction.on_commit(cls.flush)
+
+    @classmethod
+    def delete(cls, *keys: str) -> None:
+        cls._batch().keys.update(keys)
+        cls._schedule()
+
+    @classmethod
+    def delete_pattern(cls, *patterns: str) -> None:
+        cls._batch().patterns.update(patterns)
+        cls._schedule()
+
+    @classmethod
+    def refresh(cls, callback: Refresh, key: Hashable, items: Iterable) -> None:
+        """Calls `callback(key, items)` after the purge, with the items of all calls for the same callback and key."""
+
+        cls._batch().refreshes.setdefault((callback, key), set()).update(items)
+        cls._schedule()
+
+    @classmethod
+    def flush(cls) -> None:
+        batch = _pending.get()
+        if batch is None:
+            return
+        _pending.set(None)
+
+        patterns = {
+            pattern
+            for pattern in batch.patterns
+            if not any(other != pattern and fnmatchcase(pattern, other) for other in batch.patterns)
+        }
+        keys = {key for key in batch.keys if not any(fnmatchcase(key, pattern) for pattern in patterns)}
+        CacheManager.purge(keys, patterns)
+
+        for (callback, key), items in batch.refreshes.items():
+            callback(key, items)
@@ -1,5 +1,5 @@
 import decimal
-from collections.abc import Callable
+from collections.abc import Callable, Iterable
 from typing import Any, cast
 from uuid import UUID
 
@@ -8,6 +8,7 @@ import structlog
 from django.core.cache import cache as django_cache
 from django.http import HttpResponse
 from django.utils.cache import patch_cache_control
+from django_redis import get_redis_connection
 from django_redis.cache import RedisCache
 from rest_framework.response import Response
 
@@ -18,6 +19,9 @@ cache = cast(RedisCache, django_cache)
 class CacheManager:
     BASE_KEY = 'BASE'
 
+    # keys per SCAN round trip and per DEL command of `purge`
+    PURGE_BATCH_SIZE = 1000
+
     @classmethod
     def make_key(cls, *parts: str | int | UUID) -> str:
         safe_parts = [str(p) for p in parts if p is not None]
@@ -31,16 +35,59 @@ class CacheManager:
     def set(cls, key: str, value: Any, timeout: int = 300) -> None:
         cache.set(key, value, timeout)
 
+    @classmethod
+    def get_many(cls, keys: list[str]) -> dict[str, Any]:
+        return cache.get_many(keys)
+
+    @classmethod
+    def set_many(cls, data: dict[str, Any], timeout: int = 300) -> None:
+        if data:
+            cache.set_many(data, timeout)
+
     @classmethod
     def delete(cls, key: str) -> None:
         logger.info('cache_key_purged', key=key)
         cache.delete(key)
 
+    @classmethod
+    def delete_many(cls, keys: list[str]) -> None:
+        if not keys:
+            return
+        logger.info('cache_keys_purged', count=len(keys))
+        cache.delete_many(keys)
+
     @classmethod
     def delete_pattern(cls, pattern: str) -> None:
         logger.info('cache_pattern_purged', pattern=pattern)
         cache.delete_pattern(pattern)
 
+    @classmethod
+    def purge(cls, keys: Iterable[str], patterns: Iterable[str]) -> int:
+        """
+        Deletes `keys` and the keys matching `patterns` with a single pipeline of DELs, after
+        scanning the patterns. Returns the number of keys deleted.
+        """
+
+        names = {cache.make_key(key) for key in keys}
+        patterns = sorted(patterns)
+        if not names and not patterns:
+            return 0
+
+        r = get_redis_connection('default')
+        for pattern in patterns:
+            names.update(r.scan_iter(match=cache.make_key(pattern), count=cls.PURGE_BATCH_SIZE))
+
+        deleted = 0
+        if names:
+            ordered = list(names)
+            with r.pipeline(transaction=False) as pipe:
+                for start in range(0, len(ordered), cls.PURGE_BATCH_SIZE):
+                    pipe.delete(*ordered[start : start + cls.PURGE_BATCH_SIZE])
+                deleted = sum(pipe.execute())
+
+        logger.info('cache_purged', keys=len(names), patterns=patterns, deleted=deleted)
+        return deleted
+
     @classmethod
     def add(cls, key: str, content: Any, timeout: int) -> bool:
         return cache.add(key, content, timeout=timeout)
@@ -15,6 +15,8 @@ from gamedata.models import (
     GameRecipeInput,
     GameRecipeOutput,
 )
+from gamedata.services.exchange_cxpc import CXPCHistoryService
+from gamedata.services.exchange_indicators import CXPCIndicatorService
 from rest_framework import serializers
 
 
@@ -251,6 +253,69 @@ class GameExchangeCXPCSerializer(serializers.ModelSerializer):
         read_only_fields = fields
 
 
+class ExchangeCXPCQuerySerializer(serializers.Serializer):
+    to = serializers.IntegerField(required=False, min_value=0, help_text='Last day, epoch milliseconds (inclusive)')
+    limit = serializers.IntegerField(
+        required=False,
+        min_value=1,
+        max_value=CXPCHistoryService.MAX_LIMIT,
+        help_text='Latest rows or buckets to return',
+    )
+    interval = serializers.ChoiceField(choices=CXPCHistoryService.INTERVALS, default='day')
+
+    def get_fields(self):
+        # `from` is a keyword and can't be declared as class attribute
+        fields = super().get_fields()
+        fields['from'] = serializers.IntegerField(
+            required=False, min_value=0, help_text='First day, epoch milliseconds (inclusive)'
+        )
+        return fields
+
+    def validate(self, attrs):
+        if 'from' in attrs and 'to' in attrs and attrs['from'] > attrs['to']:
+            raise serializers.ValidationError({'from': 'Must not be after `to`.'})
+        return attrs
+
+
+class ExchangeIndicatorQuerySerializer(serializers.Serializer):
+    tickers = serializers.CharField(help_text='Comma separated material tickers')
+    exchange_code = serializers.ChoiceField(choices=['AI1', 'CI1', 'IC1', 'NC1', 'UNIVERSE'], default='UNIVERSE')
+    window = serializers.IntegerField(
+        min_value=CXPCIndicatorService.MIN_WINDOW,
+        max_value=CXPCIndicatorService.MAX_WINDOW,
+        default=7,
+        help_text='Trailing window in days',
+    )
+    days = serializers.IntegerField(
+        min_value=1, max_value=CXPCIndicatorService.MAX_DAYS, default=30, help_text='Days of indicators to return'
+    )
+
+    def validate_tickers(self, value: str) -> list[str]:
+        tickers = sorted({t.strip() for t in value.split(',') if t.strip()})
+        if not tickers:
+            raise serializers.ValidationError('At least one ticker is required.')
+        if len(tickers) > CXPCIndicatorService.MAX_TICKERS:
+            raise serializers.ValidationError(f'At most {CXPCIndicatorService.MAX_TICKERS} tickers.')
+        return tickers
+
+    def validate(self, attrs):
+        if attrs['days'] + attrs['window'] > CXPCIndicatorService.MAX_HISTORY_DAYS:
+            raise serializers.ValidationError(
+                {'days': f'`days` and `window` together must not exceed {CXPCIndicatorService.MAX_HISTORY_DAYS}.'}
+            )
+        return attrs
+
+
+class ExchangeIndicatorsSerializer(serializers.Serializer):
+    exchange_code = serializers.CharField()
+    window = serializers.IntegerField()
+    date_epoch = serializers.ListField(child=serializers.IntegerField())
+    tickers = serializers.DictField(
+        child=serializers.DictField(child=serializers.ListField(child=serializers.FloatField(allow_null=True))),
+        help_text=f'Per ticker, one value per `date_epoch` of each of {", ".join(CXPCIndicatorService.INDICATORS)}',
+    )
+
+
 class GamePlanetInfrastructureReportSerializer(serializers.ModelSerializer):
     class Meta:
         model = GamePlanetInfrastructureReport
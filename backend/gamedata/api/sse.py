@@ -1,65 +1,155 @@
 import asyncio
-import time
-import uuid
 
+import orjson
 import structlog
-from django.conf import settings
 from django.http import StreamingHttpResponse
 from drf_spectacular.utils import extend_schema
-from redis import asyncio as aioredis
+from gamedata.services.sse_hub import SSEFilter, SSEHub, SSEMessage
 from rest_framework.decorators import permission_classes
 from rest_framework.permissions import AllowAny
 
 logger = structlog.get_logger(__name__)
 
+KEEPALIVE_S = 5
+CX_STREAM = 'stream:cx'
+
+MAX_BATCH_MS = 5000
+MAX_BATCH_SIZE = 500
+
+FILTER_FIELDS = {
+    'demand',
+    'supply',
+    'traded',
+    'buy_orders',
+    'sell_orders',
+    'price',
+    'ask',
+    'ask_count',
+    'bid',
+    'bid_count',
+    'price_average',
+    'volume',
+    'mm_buy',
+    'mm_sell',
+}
+
+
+def _query_list(request, name: str) -> list[str]:
+    return [v.strip() for v in request.GET.get(name, '').split(',') if v.strip()]
+
+
+def _build_filter(request) -> SSEFilter:
+    return SSEFilter(
+        tickers=frozenset(t.upper() for t in _query_list(request, 'tickers')),
+        exchanges=frozenset(e.upper() for e in _query_list(request, 'exchanges')),
+        fields=tuple(sorted(f for f in set(_query_list(request, 'fields')) if f in FILTER_FIELDS)),
+    )
+
+
+def _batch_ms(request) -> int:
+    try:
+        return min(max(int(request.GET.get('batch_ms', 0)), 0), MAX_BATCH_MS)
+    except ValueError:
+        return 0
+
+
+def _snapshot_frame(resume_id: str, snapshot: list[dict]) -> str:
+    return f'id: {resume_id}\nevent: snapshot\ndata: {orjson.dumps(snapshot).decode("utf-8")}\n\n'
+
+
+async def _collect(queue: asyncio.Queue, first: SSEMessage, batch_ms: int) -> tuple[list[SSEMessage], bool]:
+    """Gathers queued messages after `first`, waiting up to `batch_ms`. Returns the messages and if evicted."""
+
+    messages = [first]
+
+    if not batch_ms:
+        # flush everything already queued as one chunk
+        while not queue.empty():
+            message = queue.get_nowait()
+            if message is None:
+                return messages, True
+            messages.append(message)
+        return messages, False
+
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + batch_ms / 1000
+
+    while len(messages) < MAX_BATCH_SIZE:
+        remaining = deadline - loop.time()
+        if remaining <= 0:
+            break
+        try:
+            message = await asyncio.wait_for(queue.get(), timeout=remaining)
+        except TimeoutError:
+            break
+        if message is None:
+            return messages, True
+        messages.append(message)
+
+    return messages, False
+
 
 @extend_schema(
     summary='Real-time data stream (SSE)',
-    description='Connect to this endpoint using EventSource to receive real-time updates.',
+    description=(
+        'Connect to this endpoint using EventSource to receive real-time updates. '
+        'Optional filters: `tickers`, `exchanges` and `fields` (comma separated). '
+        'With `batch_ms` updates are sent as one `batch` event holding a JSON array, at most every `batch_ms`. '
+        'New `cx` subscribers without `Last-Event-ID` first receive one `snapshot` event with the latest state '
+        'per ticker, followed by live deltas only.'
+    ),
     responses={200: str},
 )
 @permission_classes([AllowAny])
 async def sse_stream_view(request):
     channels = [c.strip() for c in request.GET.get('channels', 'beat').split(',') if c.strip()]
-    redis_keys = {f'stream:{c}': request.headers.get('Last-Event-ID', '0') for c in channels}
-
-    # unique connection ID for stats
-    conn_id = str(uuid.uuid4())
-    stats_key = 'stream:active_connections'
+    streams = [f'stream:{c}' for c in channels]
+    # new clients get a snapshot instead of a replay, reconnecting clients catch up from their last id
+    last_event_id = request.headers.get('Last-Event-ID') or None
 
-    redis_url = settings.CACHES['default']['LOCATION']
+    sse_filter = _build_filter(request)
+    batch_ms = _batch_ms(request)
 
     async def event_generator():
-        log = logger.bind(name='data_stream', channels=channels)
+        log = logger.bind(name='data_stream', channels=channels, batch_ms=batch_ms)
         log.info(action='stream_open')
 
-        # initiate redis, pubsub and subscribe to channels
-        redis = await aioredis.from_url(redis_url)
+        # one shared reader per worker, this connection only owns a bounded queue
+        hub = SSEHub.instance()
+        subscription = await hub.subscribe(streams, last_event_id, sse_filter)
+        # everything after this id is delivered as delta
+        resume_id = hub.stream_ids.get(CX_STREAM, '0-0')
 
         total_sent_count = 0
 
         try:
-            # register connection with current timestamp
-            await redis.zadd(stats_key, {conn_id: time.time()})
+            if last_event_id is None and CX_STREAM in streams:
+                snapshot = await hub.cx_snapshot(sse_filter)
+                yield _snapshot_frame(resume_id, snapshot)
+                total_sent_count += len(snapshot)
 
-            # loop
             while True:
-                # XREAD expects a dict with { key: last_id }
-                events = await redis.xread(redis_keys, count=1, block=5000)
+                try:
+                    message = await asyncio.wait_for(subscription.queue.get(), timeout=KEEPALIVE_S)
+                except TimeoutError:
+                    # keep-alive
+                    yield ': \n\n'
+                    continue
 
-                if events:
-                    for stream_name, messages in events:
-                        for message_id, data in messages:
-                            last_id = message_id.decode('utf-8')
+                # evicted as slow consumer, the client reconnects with its Last-Event-ID
+                if message is None:
+                    break
 
-                            redis_keys[stream_name.decode('utf-8')] = last_id
+                messages, evicted = await _collect(subscription.queue, message, batch_ms)
+                total_sent_count += len(messages)
 
-                            payload = data[b'payload'].decode('utf-8')
-                            yield f'id: {last_id}\ndata: {payload}\n\n'
+                if batch_ms:
+                    yield subscription.batch_frame(messages)
                 else:
-                    # keep-alive + heartbeat in redis
-                    await redis.zadd(stats_key, {conn_id: time.time()})
-                    yield ': \n\n'
+                    yield ''.join(subscription.frame(m) for m in messages)
+
+                if evicted:
+                    break
 
         # user left stream
         except asyncio.CancelledError:
@@ -67,15 +157,8 @@ async def sse_stream_view(request):
 
         # cleanup
         finally:
-            # prune this connection
-            await redis.zrem(stats_key, conn_id)
-
-            # prune stale connections (> 30s)
-            await redis.zremrangebyscore(stats_key, 0, time.time() - 30)
-
-            await redis.close()
-
-            log.info(action='stream_close', messages_sent=total_sent_count)
+            hub.unsubscribe(subscription)
+            log.info(action='stream_close', messages_sent=total_sent_count, evicted=subscription.evicted)
 
     response = StreamingHttpResponse(event_generator(), content_type='text/event-stream')
     response['Cache-Control'] = 'no-cache'
@@ -2,6 +2,7 @@ from django.urls import path
 from gamedata.api.sse import sse_stream_view
 from gamedata.api.viewsets import (
     ExchangeCXPCViewSet,
+    ExchangeIndicatorViewSet,
     FIOWebhookIngest,
     GameBuildingViewSet,
     GameExchangeCSVViewSet,
@@ -36,6 +37,11 @@ urlpatterns = [
         'planets/<str:search_term>/', GamePlanetViewSet.as_view({'get': 'search_single'}), name='planet-search-single'
     ),
     path('planets/', GamePlanetViewSet.as_view({'get': 'list'}), name='planet-list'),
+    path(
+        'cxpc/indicators/',
+        ExchangeIndicatorViewSet.as_view({'get': 'indicators'}),
+        name='cxpc-indicators',
+    ),
     path(
         'cxpc/<str:ticker>/<str:exchange_code>/',
         ExchangeCXPCViewSet.as_view({'get': 'cxpc_exchange_data'}),
@@ -1,16 +1,19 @@
-from datetime import timedelta
 from itertools import chain
 from typing import Any, cast
 
+import orjson
 import structlog
-from django.db import connection
-from django.db.models import Case, CharField, F, Q, Value, When
-from django.db.models.functions import Concat
+from api.columnar import LAYOUT_COLUMNS, LAYOUT_PARAMETER, requested_layout, to_columns
+from django.http import HttpResponse
 from django.shortcuts import get_object_or_404
 from django.utils import timezone
+from django.utils.cache import patch_cache_control
 from drf_spectacular.types import OpenApiTypes
 from drf_spectacular.utils import OpenApiExample, OpenApiResponse, extend_schema
 from gamedata.api.serializer import (
+    ExchangeCXPCQuerySerializer,
+    ExchangeIndicatorQuerySerializer,
+    ExchangeIndicatorsSerializer,
     GameBuildingSerializer,
     GameExchangeCXPCSerializer,
     GameExchangeSerializer,
@@ -32,8 +35,6 @@ from gamedata.fio.schemas import (
 from gamedata.gamedata_cache_manager import GamedataCacheManager
 from gamedata.models import (
     GameBuilding,
-    GameExchange,
-    GameExchangeAnalytics,
     GameExchangeCXPC,
     GameFIOPlayerData,
     GameMaterial,
@@ -41,8 +42,11 @@ from gamedata.models import (
     GameRecipe,
     queryset_gameplanet,
 )
+from gamedata.services.exchange_cxpc import CXPCHistoryService
+from gamedata.services.exchange_indicators import CXPCIndicatorService
+from gamedata.services.exchange_market import ExchangeMarketCache
+from gamedata.services.fio_webhook_stream import FIOWebhookStream
 from gamedata.services.planet_search import GamePlanetSearchService
-from gamedata.tasks import gamedata_process_fio_webhook
 from pydantic import TypeAdapter, ValidationError as PydanticValidationError
 from rest_framework import exceptions, mixins, status, viewsets
 from rest_framework.decorators import action
@@ -191,78 +195,31 @@ class GameExchangeViewSet(viewsets.GenericViewSet, mixins.ListModelMixin):
     serializer_class = GameExchangeSerializer
     permission_classes = [AllowAny]
 
-    @extend_schema(auth=[], summary='List all exchanges')
+    @extend_schema(auth=[], summary='List all exchanges', parameters=[LAYOUT_PARAMETER])
     def list(self, request, *args, **kwargs):
 
         fmt = getattr(request.accepted_renderer, 'format', 'json')
 
-        def fetch_data():
-            target_exchanges = ['AI1', 'NC1', 'CI1', 'IC1', 'UNIVERSE']
-            two_days_ago = timezone.now().date() - timedelta(days=2)
-
-            qs = (
-                GameExchangeAnalytics.objects.filter(exchange_code__in=target_exchanges)
-                .annotate(
-                    ticker_id=Concat(F('ticker'), Value('.'), F('exchange_code'), output_field=CharField()),
-                    exchange_status=Case(
-                        When(calendar_date__lt=two_days_ago, then=Value('STALE')),
-                        When(Q(vwap_7d__gt=0) & Q(avg_traded_7d__gt=0), then=Value('ACTIVE')),
-                        default=Value('INACTIVE'),
-                        output_field=CharField(),
-                    ),
-                )
-                .order_by('ticker', 'exchange_code', '-date_epoch')
-            )
+        if fmt != 'csv' and requested_layout(request) == LAYOUT_COLUMNS:
 
-            if connection.vendor == 'postgresql':
-                qs = qs.distinct('ticker', 'exchange_code')
-
-            analytics_list = list(
-                qs.values(
-                    'ticker',
-                    'exchange_code',
-                    'date_epoch',
-                    'calendar_date',
-                    'traded_daily',
-                    'vwap_daily',
-                    'sum_traded_7d',
-                    'avg_traded_7d',
-                    'vwap_7d',
-                    'sum_traded_30d',
-                    'avg_traded_30d',
-                    'vwap_30d',
-                    'ticker_id',
-                    'exchange_status',
-                )
-            )
-
-            live_exchanges = ['AI1', 'NC1', 'CI1', 'IC1']
-            live_data = GameExchange.objects.filter(exchange_code__in=live_exchanges).values(
-                'ticker', 'exchange_code', 'ask', 'bid', 'supply', 'demand'
-            )
+            def fetch_columns():
+                rows = [orjson.loads(row) for row in ExchangeMarketCache.raw_rows()]
+                columns = ExchangeMarketCache.COLUMNS
+                return to_columns(columns, [[row.get(c) for c in columns] for row in rows])
 
-            live_map = {}
-            for item in live_data:
-                t = item['ticker']
-                ec = item['exchange_code']
-                if t not in live_map:
-                    live_map[t] = {}
-                live_map[t][ec] = item
+            return GamedataCacheManager.get_exchange_list_columns_response(fetch_columns)
 
-            for row in analytics_list:
-                ticker = row['ticker']
-                exchange_code = row['exchange_code']
-                ticker_live_data = live_map.get(ticker, {})
+        rows = ExchangeMarketCache.raw_rows()
 
-                ext = ticker_live_data.get(exchange_code, {})
-                row['ask'] = ext.get('ask') or 0.0
-                row['bid'] = ext.get('bid') or 0.0
-                row['supply'] = ext.get('supply') or 0.0
-                row['demand'] = ext.get('demand') or 0.0
+        if fmt == 'csv':
+            response = Response([orjson.loads(row) for row in rows])
+            response['Content-Type'] = 'text/csv; charset=utf-8'
+        else:
+            # pre-rendered rows, joined without decoding
+            response = HttpResponse(b'[' + b','.join(rows) + b']', content_type='application/json')
 
-            return analytics_list
-
-        return GamedataCacheManager.get_exchange_list_response(fetch_data, fmt)
+        patch_cache_control(response, public=True, max_age=ExchangeMarketCache.MAX_AGE)
+        return response
 
 
 @extend_schema(
@@ -367,36 +324,46 @@ class ExchangeCXPCViewSet(viewsets.ReadOnlyModelViewSet):
     queryset = GameExchangeCXPC.objects.all()
     permission_classes = [AllowAny]
 
-    def _get_cxpc_response(self, ticker, exchange_code=None):
+    def _get_cxpc_response(self, request, ticker, exchange_code=None):
+        params = ExchangeCXPCQuerySerializer(data=request.query_params)
+        params.is_valid(raise_exception=True)
+
+        query = CXPCHistoryService.normalize(
+            interval=params.validated_data['interval'],
+            from_epoch=params.validated_data.get('from'),
+            to_epoch=params.validated_data.get('to'),
+            limit=params.validated_data.get('limit'),
+        )
+        exchange_codes = [exchange_code] if exchange_code else self.ALLOWED_EXCHANGES
+        layout = requested_layout(request)
+
         def fetch_data():
-            qs = self.get_queryset().filter(ticker=ticker)
-            if exchange_code:
-                qs = qs.filter(exchange_code=exchange_code)
-            else:
-                qs = qs.filter(exchange_code__in=self.ALLOWED_EXCHANGES)
-
-            return list(
-                qs.order_by('-date_epoch').values(
-                    'ticker', 'exchange_code', 'date_epoch', 'open_p', 'close_p', 'high_p', 'low_p', 'volume', 'traded'
+            if layout == LAYOUT_COLUMNS:
+                return to_columns(
+                    CXPCHistoryService.FIELDS, CXPCHistoryService.fetch_rows(ticker, exchange_codes, query)
                 )
-            )
+            return CXPCHistoryService.fetch(ticker, exchange_codes, query)
 
-        return GamedataCacheManager.get_exchange_cxpc_response(ticker, exchange_code, fetch_data)
+        return GamedataCacheManager.get_exchange_cxpc_response(
+            ticker, exchange_code, fetch_data, query.cache_key, layout
+        )
 
     @extend_schema(
         auth=[],
         summary='Get ticker CXPC data (All Exchanges)',
         operation_id='exchange_cxpc_all',
+        parameters=[ExchangeCXPCQuerySerializer, LAYOUT_PARAMETER],
         responses={200: GameExchangeCXPCSerializer(many=True)},
     )
     @action(detail=False, url_path='market_data/(?P<ticker>[^/.]+)')
     def cxpc_ticker_data(self, request, ticker):
-        return self._get_cxpc_response(ticker)
+        return self._get_cxpc_response(request, ticker)
 
     @extend_schema(
         auth=[],
         summary='Get ticker CXPC data for specific Exchange',
         operation_id='exchange_cxpc_specific',
+        parameters=[ExchangeCXPCQuerySerializer, LAYOUT_PARAMETER],
         responses={200: GameExchangeCXPCSerializer(many=True)},
     )
     @action(detail=False, url_path='market_data/(?P<ticker>[^/.]+)/(?P<exchange_code>[^/.]+)')
@@ -406,7 +373,43 @@ class ExchangeCXPCViewSet(viewsets.ReadOnlyModelViewSet):
                 {'error': f'Invalid exchange code. Supported: {", ".join(self.ALLOWED_EXCHANGES)}'},
                 status=status.HTTP_400_BAD_REQUEST,
             )
-        return self._get_cxpc_response(ticker, exchange_code)
+        return self._get_cxpc_response(request, ticker, exchange_code)
+
+
+class ExchangeIndicatorViewSet(viewsets.GenericViewSet):
+    permission_classes = [AllowAny]
+
+    @extend_schema(
+        auth=[],
+        summary='Get rolling CXPC indicators of tickers',
+        description=(
+            'VWAP, simple and exponential moving average, high/low bands and volatility over a trailing window, '
+            'one value per day of the last `days` days.'
+        ),
+        operation_id='exchange_cxpc_indicators',
+        parameters=[ExchangeIndicatorQuerySerializer],
+        responses={200: ExchangeIndicatorsSerializer},
+    )
+    def indicators(self, request):
+        params = ExchangeIndicatorQuerySerializer(data=request.query_params)
+        params.is_valid(raise_exception=True)
+        query = params.validated_data
+
+        today = timezone.now().date()
+
+        def fetch_data():
+            return CXPCIndicatorService.indicators(
+                query['tickers'], query['exchange_code'], query['window'], query['days'], today
+            )
+
+        return GamedataCacheManager.get_exchange_cxpc_indicators_response(
+            query['tickers'],
+            query['exchange_code'],
+            query['window'],
+            query['days'],
+            CXPCIndicatorService.day_epoch(today),
+            fetch_data,
+        )
 
 
 class FIOWebhookIngest(APIView):
@@ -427,10 +430,11 @@ class FIOWebhookIngest(APIView):
     def post(self, request, token):
         config = get_object_or_404(GlobalConfigWebhook, path=token, is_active=True, sender=WebhookSenderChoices.FIOAPI)
 
-        # pydantic validation
+        # single pydantic validation straight from the raw body, no DRF parsing
+        raw_payload = request.body
         try:
-            FIOWebhookRootSchema.model_validate(request.data)
-        except Exception as err:
+            FIOWebhookRootSchema.model_validate_json(raw_payload)
+        except PydanticValidationError as err:
             logger.error('fio_webhook_ingest_failed', exc_info=err)
             return Response(status=400)
 
@@ -439,7 +443,7 @@ class FIOWebhookIngest(APIView):
         config.last_received_at = timezone.now()
         config.save(update_fields=['total_calls', 'last_received_at'])
 
-        # handoff to celery
-        gamedata_process_fio_webhook.delay(request.data)
+        # handoff raw bytes to the webhook stream, consumed by `manage.py consume_fio_webhooks`
+        FIOWebhookStream.append(raw_payload)
 
         return Response(status=202)
@@ -23,6 +23,8 @@ from gamedata.models import (
     GameRecipeInput,
     GameRecipeOutput,
 )
+from gamedata.services.exchange_market import ExchangeMarketCache
+from gamedata.services.exchange_state import ExchangeStateCache
 
 
 def import_planet(planet_natural_id: str) -> bool:
@@ -311,9 +313,9 @@ def import_all_exchanges() -> bool:
                 ],
             )
 
-        # clear cache as live data changes
-        GamedataCacheManager.delete(GamedataCacheManager.key_exchange_list(fmt='json'))
-        GamedataCacheManager.delete(GamedataCacheManager.key_exchange_list(fmt='csv'))
+        # live data changed outside the webhook path
+        ExchangeStateCache.invalidate()
+        ExchangeMarketCache.rebuild()
         return True
 
     except Exception:
@@ -1,9 +1,13 @@
 from datetime import datetime
-from typing import Literal, Union
+from typing import Annotated, Literal, Union
 
 from pydantic import BaseModel, Field, field_validator
 
 from gamedata.fio.schemas.fio_exchange import EXCHANGE_CODES
+from gamedata.fio.schemas.fio_ships import FIOUserShipSiteSchema
+from gamedata.fio.schemas.fio_sites import FIOUserSiteSchema
+from gamedata.fio.schemas.fio_sites_warehouses import FIOUserSiteWarehouseSchema
+from gamedata.fio.schemas.fio_storage import FIOUserStorageSchema
 
 
 # Reference: https://gitlab.com/fnar/fio/fioapi/-/blob/main/FIOAPI/Controllers/CXController.cs
@@ -101,7 +105,41 @@ class FIOWebhookExchangeEndpoint(BaseModel):
     Data: list[FIOWebhookExchangeEndpointSchema]
 
 
-FIOWebhookEndpointUnion = Union[FIOWebhookExchangeEndpoint]  # noqa: UP007
+# user scoped endpoints, Data mirrors the REST payload of the same path for the user in UserName
+class FIOWebhookUserStorageEndpoint(BaseModel):
+    Endpoint: Literal['/storage']
+    UserName: str = Field(..., min_length=1)
+    Data: list[FIOUserStorageSchema]
+
+
+class FIOWebhookUserSitesEndpoint(BaseModel):
+    Endpoint: Literal['/sites']
+    UserName: str = Field(..., min_length=1)
+    Data: list[FIOUserSiteSchema]
+
+
+class FIOWebhookUserWarehousesEndpoint(BaseModel):
+    Endpoint: Literal['/sites/warehouses']
+    UserName: str = Field(..., min_length=1)
+    Data: list[FIOUserSiteWarehouseSchema]
+
+
+class FIOWebhookUserShipsEndpoint(BaseModel):
+    Endpoint: Literal['/ship/ships']
+    UserName: str = Field(..., min_length=1)
+    Data: list[FIOUserShipSiteSchema]
+
+
+FIOWebhookEndpointUnion = Annotated[
+    Union[  # noqa: UP007
+        FIOWebhookExchangeEndpoint,
+        FIOWebhookUserStorageEndpoint,
+        FIOWebhookUserSitesEndpoint,
+        FIOWebhookUserWarehousesEndpoint,
+        FIOWebhookUserShipsEndpoint,
+    ],
+    Field(discriminator='Endpoint'),
+]
 
 
 class FIOWebhookRootSchema(BaseModel):
@@ -114,6 +152,6 @@ class FIOWebhookRootSchema(BaseModel):
         if not isinstance(v, list):
             return [v]
 
-        allowed_endpoints: set[str] = {'/cx'}
+        allowed_endpoints: set[str] = {'/cx', '/storage', '/sites', '/sites/warehouses', '/ship/ships'}
 
         return [item for item in v if isinstance(item, dict) and item.get('Endpoint') in allowed_endpoints]
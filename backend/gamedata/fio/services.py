@@ -4,6 +4,7 @@ from typing import Literal, TypeVar
 
 import httpx
 import structlog
+from core.env import settings
 from pydantic import TypeAdapter, ValidationError
 
 from gamedata.fio.schemas import (
@@ -39,22 +40,23 @@ type Endpoint = Literal[
 
 
 class FIOURL:
-    FIO_BASE_URL: str = 'https://rest.fnar.net/'
-
-    endpoint_url: dict[Endpoint, str] = {
-        'allrecipes': FIO_BASE_URL + 'recipes/allrecipes',
-        'allmaterials': FIO_BASE_URL + 'material/allmaterials',
-        'allbuildings': FIO_BASE_URL + 'building/allbuildings',
-        'allexchange': FIO_BASE_URL + 'exchange/all',
-        'cxpc': FIO_BASE_URL + 'exchange/cxpc/',
-        'fullexchange': FIO_BASE_URL + 'exchange/full',
-        'allplanets': FIO_BASE_URL + 'planet/allplanets/full',
-        'planet': FIO_BASE_URL + 'planet/',
-        'planet_infrastructure': FIO_BASE_URL + 'infrastructure/',
-        'user_storage': FIO_BASE_URL + 'storage/',
-        'user_sites': FIO_BASE_URL + 'sites/',
-        'user_sites_warehouses': FIO_BASE_URL + 'sites/warehouses/',
-        'user_ships': FIO_BASE_URL + 'ship/ships/',
+    # configurable, so a local stand-in (see gamedata.fio.standin) can replace rest.fnar.net
+    FIO_BASE_URL: str = settings.fio.base_url
+
+    endpoint_path: dict[Endpoint, str] = {
+        'allrecipes': 'recipes/allrecipes',
+        'allmaterials': 'material/allmaterials',
+        'allbuildings': 'building/allbuildings',
+        'allexchange': 'exchange/all',
+        'cxpc': 'exchange/cxpc/',
+        'fullexchange': 'exchange/full',
+        'allplanets': 'planet/allplanets/full',
+        'planet': 'planet/',
+        'planet_infrastructure': 'infrastructure/',
+        'user_storage': 'storage/',
+        'user_sites': 'sites/',
+        'user_sites_warehouses': 'sites/warehouses/',
+        'user_ships': 'ship/ships/',
     }
 
     endpoint_timeouts: dict[Endpoint, int] = {
@@ -75,7 +77,7 @@ class FIOURL:
 
     @staticmethod
     def get_url(endpoint: Endpoint) -> str:
-        return FIOURL.endpoint_url[endpoint]
+        return FIOURL.FIO_BASE_URL + FIOURL.endpoint_path[endpoint]
 
     @staticmethod
     def get_timeout(endpoint: Endpoint) -> int:
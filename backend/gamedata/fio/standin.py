@@ -0,0 +1,234 @@
+"""
+Local stand-in for rest.fnar.net, used to measure importer and refresh throughput offline.
+
+Serves the recorded payloads in `standin_data/` (sites, storage, warehouses, ships, Montem),
+which double as test fixtures, plus synthetic data that scales with `scale`. Latency and
+error rates are configurable per instance.
+
+Run standalone:
+    FIO_STANDIN_SCALE=10 uv run uvicorn --app-dir backend gamedata.fio.standin:app --port 8765
+
+and point the backend towards it with FIO_BASE_URL='http://127.0.0.1:8765/'.
+"""
+
+import asyncio
+import copy
+import os
+import random
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+from typing import Any
+
+import orjson
+
+STANDIN_DATA_DIR = Path(__file__).resolve().parent / 'standin_data'
+
+STANDIN_PLANET_PREFIX = 'BM-'
+STANDIN_RECIPE_BUILDING = 'BMK'
+STANDIN_TICKERS = ['BMA', 'BMB', 'BMC', 'BMD', 'BME', 'BMF', 'BMG', 'BMH']
+STANDIN_EXCHANGES = ['AI1', 'CI1', 'IC1', 'NC1']
+
+
+def load_standin_payload(name: str) -> Any:
+    return orjson.loads((STANDIN_DATA_DIR / f'{name}.json').read_bytes())
+
+
+def _hex_id(prefix: int, i: int) -> str:
+    return f'{prefix:02x}{i:030x}'
+
+
+class FIOStandinDataset:
+    """Builds the response payloads once, so serving them does not skew measurements."""
+
+    def __init__(self, scale: int = 1, cxpc_days: int = 365) -> None:
+        self.scale = max(1, scale)
+        self.cxpc_days = cxpc_days
+
+    def user_storage(self) -> list[dict[str, Any]]:
+        return load_standin_payload('storage') * self.scale
+
+    def user_sites(self) -> list[dict[str, Any]]:
+        return load_standin_payload('sites') * self.scale
+
+    def user_sites_warehouses(self) -> list[dict[str, Any]]:
+        return load_standin_payload('warehouses') * self.scale
+
+    def user_ships(self) -> list[dict[str, Any]]:
+        return load_standin_payload('ships') * self.scale
+
+    def planet(self) -> dict[str, Any]:
+        return load_standin_payload('montem')
+
+    def all_planets(self) -> list[dict[str, Any]]:
+        montem = self.planet()
+        planets = []
+
+        for i in range(self.scale * 100):
+            planet = copy.deepcopy(montem)
+            planet['PlanetId'] = _hex_id(1, i)
+            planet['PlanetNaturalId'] = f'{STANDIN_PLANET_PREFIX}{i:04d}'
+            planet['PlanetName'] = f'Benchmark {i}'
+            planet['PopulationId'] = _hex_id(2, i)
+            planets.append(planet)
+
+        return planets
+
+    def all_recipes(self) -> list[dict[str, Any]]:
+        recipes = []
+
+        for i in range(self.scale * 100):
+            inputs = [
+                {'Ticker': STANDIN_TICKERS[(i + n) % len(STANDIN_TICKERS)], 'Amount': n + 1} for n in range(i % 4 + 1)
+            ]
+            outputs = [{'Ticker': STANDIN_TICKERS[i % len(STANDIN_TICKERS)], 'Amount': i % 3 + 1}]
+
+            recipes.append(
+                {
+                    'StandardRecipeName': f'{STANDIN_RECIPE_BUILDING}:{i}',
+                    'RecipeName': f'Benchmark Recipe {i}',
+                    'BuildingTicker': STANDIN_RECIPE_BUILDING,
+                    'TimeMs': 3600000 + i,
+                    'Inputs': inputs,
+                    'Outputs': outputs,
+                }
+            )
+
+        return recipes
+
+    def all_exchanges(self) -> list[dict[str, Any]]:
+        return [
+            {
+                'MaterialTicker': ticker,
+                'ExchangeCode': exchange_code,
+                'MMBuy': None,
+                'MMSell': None,
+                'PriceAverage': 100.0,
+                'Ask': 105.0,
+                'Bid': 95.0,
+                'AskCount': 10,
+                'BidCount': 12,
+                'Supply': 1000,
+                'Demand': 900,
+            }
+            for ticker in STANDIN_TICKERS
+            for exchange_code in STANDIN_EXCHANGES
+        ]
+
+    def cxpc(self) -> list[dict[str, Any]]:
+        today = datetime.now(UTC).replace(hour=0, minute=0, second=0, microsecond=0)
+        rows = []
+
+        for d in range(self.cxpc_days):
+            day = today - timedelta(days=d)
+            price = 100.0 + (d % 17)
+            rows.append(
+                {
+                    'Interval': 'DAY_ONE',
+                    'DateEpochMs': int(day.timestamp() * 1000),
+                    'Open': price,
+                    'Close': price + 1.5,
+                    'High': price + 3.0,
+                    'Low': price - 2.0,
+                    'Volume': price * 250,
+                    'Traded': 250,
+                }
+            )
+
+        return rows
+
+
+class FIOStandinApp:
+    """
+    Minimal ASGI app mirroring the FIO REST endpoints used by `gamedata.fio.services.FIOService`.
+
+    Paths are matched by prefix, longest first, so the same route table as `FIOURL.endpoint_path` applies.
+    """
+
+    def __init__(
+        self,
+        scale: int = 1,
+        latency_ms: float = 0.0,
+        jitter_ms: float = 0.0,
+        error_rate: float = 0.0,
+        cxpc_days: int = 365,
+        seed: int | None = None,
+    ) -> None:
+        self.dataset = FIOStandinDataset(scale=scale, cxpc_days=cxpc_days)
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.error_rate = error_rate
+        self.random = random.Random(seed)
+
+        self.routes: dict[str, Any] = {
+            'recipes/allrecipes': self.dataset.all_recipes,
+            'planet/allplanets/full': self.dataset.all_planets,
+            'planet/': self.dataset.planet,
+            'exchange/all': self.dataset.all_exchanges,
+            'exchange/cxpc/': self.dataset.cxpc,
+            'storage/': self.dataset.user_storage,
+            'sites/warehouses/': self.dataset.user_sites_warehouses,
+            'sites/': self.dataset.user_sites,
+            'ship/ships/': self.dataset.user_ships,
+        }
+
+        self._rendered: dict[str, bytes] = {}
+        self.request_count = 0
+        self.error_count = 0
+
+    def _resolve(self, path: str) -> bytes | None:
+        for prefix in sorted(self.routes, key=lambda p: len(p), reverse=True):
+            if path == prefix or (prefix.endswith('/') and path.startswith(prefix)):
+                if prefix not in self._rendered:
+                    self._rendered[prefix] = orjson.dumps(self.routes[prefix]())
+                return self._rendered[prefix]
+        return None
+
+    async def _respond(self, send, status: int, body: bytes) -> None:
+        await send(
+            {
+                'type': 'http.response.start',
+                'status': status,
+                'headers': [(b'content-type', b'application/json'), (b'content-length', str(len(body)).encode())],
+            }
+        )
+        await send({'type': 'http.response.body', 'body': body})
+
+    async def __call__(self, scope, receive, send) -> None:
+        if scope['type'] == 'lifespan':
+            while True:
+                message = await receive()
+                if message['type'] == 'lifespan.startup':
+                    await send({'type': 'lifespan.startup.complete'})
+                elif message['type'] == 'lifespan.shutdown':
+                    await send({'type': 'lifespan.shutdown.complete'})
+                    return
+
+        if scope['type'] != 'http':
+            return
+
+        self.request_count += 1
+
+        delay_ms = self.latency_ms + self.random.uniform(0, self.jitter_ms)
+        if delay_ms > 0:
+            await asyncio.sleep(delay_ms / 1000)
+
+        if self.error_rate and self.random.random() < self.error_rate:
+            self.error_count += 1
+            await self._respond(send, 503, b'{"error": "stand-in injected failure"}')
+            return
+
+        body = self._resolve(scope['path'].lstrip('/'))
+
+        if body is None:
+            await self._respond(send, 404, b'{"error": "unknown endpoint"}')
+            return
+
+        await self._respond(send, 200, body)
+
+
+app = FIOStandinApp(
+    scale=int(os.environ.get('FIO_STANDIN_SCALE', 1)),
+    latency_ms=float(os.environ.get('FIO_STANDIN_LATENCY_MS', 0)),
+    jitter_ms=float(os.environ.get('FIO_STANDIN_JITTER_MS', 0)),
+    error_rate=float(os.environ.get('FIO_STANDIN_ERROR_RATE', 0)),
+)
@@ -2,6 +2,7 @@ import re
 from collections.abc import Callable
 from typing import Any
 
+from api.columnar import LAYOUT_ROWS
 from core.services.cache_manager import CacheManager
 from django.http import HttpResponse
 from rest_framework.response import Response
@@ -10,6 +11,7 @@ from rest_framework.response import Response
 class GamedataCacheManager(CacheManager):
     BASE_KEY = 'GAMEDATA'
 
+    CACHE_TIMEOUT_1MIN = 60
     CACHE_TIMEOUT = 60 * 15
     CACHE_TIMEOUT_30MIN = 60 * 30
     CACHE_TIMEOUT_3HOURS = 60 * 60 * 3
@@ -29,8 +31,8 @@ class GamedataCacheManager(CacheManager):
         return cls.make_key('building', 'list')
 
     @classmethod
-    def key_exchange_list(cls, fmt: str = 'json') -> str:
-        return cls.make_key('exchange', 'list', fmt)
+    def key_exchange_list_columns(cls) -> str:
+        return cls.make_key('exchange', 'list', 'columns')
 
     @classmethod
     def key_planet_list(cls) -> str:
@@ -57,11 +59,24 @@ class GamedataCacheManager(CacheManager):
         return cls.make_key('storage', user_id)
 
     @classmethod
-    def key_exchange_cxpc_response(cls, ticker: str, exchange_code: str | None) -> str:
-        if exchange_code:
-            return cls.make_key('exchange', 'cxpc', ticker, exchange_code)
-        else:
-            return cls.make_key('exchange', 'cxpc', ticker)
+    def key_exchange_cxpc_response(
+        cls, ticker: str, exchange_code: str | None, query_key: str | None = None, layout: str = LAYOUT_ROWS
+    ) -> str:
+        parts = [ticker, exchange_code] if exchange_code else [ticker]
+
+        # normalized range / interval (see CXPCQuery.cache_key) and non-default layouts
+        extra = [p for p in (query_key, layout if layout != LAYOUT_ROWS else None) if p]
+        if extra:
+            parts = [ticker, exchange_code or 'all', *extra]
+
+        return cls.make_key('exchange', 'cxpc', *parts)
+
+    @classmethod
+    def key_exchange_cxpc_indicators(
+        cls, tickers: list[str], exchange_code: str, window: int, days: int, day_epoch: int
+    ) -> str:
+        # `cxpc` in the key, CXPC refreshes drop it with the histories
+        return cls.make_key('exchange', 'cxpc', 'indicators', exchange_code, window, days, day_epoch, ','.join(tickers))
 
     @classmethod
     def key_user_fio_lock(cls, user_id: int) -> str:
@@ -108,9 +123,10 @@ class GamedataCacheManager(CacheManager):
         return cls.get_or_set_response(key, func, timeout=cls.CACHE_TIMEOUT_1DAY)
 
     @classmethod
-    def get_exchange_list_response(cls, func: Callable[[], Any], fmt: str = 'json') -> Response | HttpResponse:
-        key = cls.key_exchange_list(fmt)
-        return cls.get_or_set_response(key, func, timeout=cls.CACHE_TIMEOUT_1DAY, fmt=fmt)
+    def get_exchange_list_columns_response(cls, func: Callable[[], Any]) -> Response | HttpResponse:
+        # built from the live market snapshot, kept only as long as clients may cache the list
+        key = cls.key_exchange_list_columns()
+        return cls.get_or_set_response(key, func, timeout=cls.CACHE_TIMEOUT_1MIN)
 
     @classmethod
     def get_planet_list_response(cls, func: Callable[[], Any]) -> Response | HttpResponse:
@@ -155,8 +171,17 @@ class GamedataCacheManager(CacheManager):
         ticker: str,
         exchange_code: str | None,
         func: Callable[[], Any],
+        query_key: str | None = None,
+        layout: str = LAYOUT_ROWS,
+    ) -> Response | HttpResponse:
+        key = cls.key_exchange_cxpc_response(ticker, exchange_code, query_key, layout)
+        return cls.get_or_set_response(key, func, timeout=cls.CACHE_TIMEOUT_3HOURS)
+
+    @classmethod
+    def get_exchange_cxpc_indicators_response(
+        cls, tickers: list[str], exchange_code: str, window: int, days: int, day_epoch: int, func: Callable[[], Any]
     ) -> Response | HttpResponse:
-        key = cls.key_exchange_cxpc_response(ticker, exchange_code)
+        key = cls.key_exchange_cxpc_indicators(tickers, exchange_code, window, days, day_epoch)
         return cls.get_or_set_response(key, func, timeout=cls.CACHE_TIMEOUT_3HOURS)
 
     @classmethod
@@ -0,0 +1,164 @@
+import threading
+import time
+import tracemalloc
+from collections.abc import Callable
+from typing import Any
+
+import uvicorn
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from gamedata.fio.services import FIOURL
+from gamedata.fio.standin import (
+    STANDIN_EXCHANGES,
+    STANDIN_PLANET_PREFIX,
+    STANDIN_RECIPE_BUILDING,
+    STANDIN_TICKERS,
+    FIOStandinApp,
+)
+from gamedata.gamedata_cache_manager import GamedataCacheManager
+from gamedata.models import (
+    GameExchangeCXPC,
+    GameFIOPlayerData,
+    GamePlanet,
+    GamePlanetCOGCProgram,
+    GamePlanetProductionFee,
+    GamePlanetResource,
+    GameRecipe,
+)
+from user.models import User
+
+BENCHMARK_USERNAME = 'fio_benchmark'
+TARGETS = ['planets', 'recipes', 'cxpc', 'user_fiodata']
+
+
+class Command(BaseCommand):
+    help = (
+        'Benchmark FIO ingestion end to end against a local FIO stand-in. '
+        'Writes into the configured database and replaces recipes, only run against development databases.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--target', choices=TARGETS, action='append', help='Run only the given target(s)')
+        parser.add_argument('--runs', type=int, default=3, help='Runs per target')
+        parser.add_argument('--scale', type=int, default=1, help='Synthetic data scale factor')
+        parser.add_argument('--cxpc-days', type=int, default=365, help='Daily CXPC rows per ticker')
+        parser.add_argument('--latency-ms', type=float, default=0.0, help='Base latency per stand-in request')
+        parser.add_argument('--jitter-ms', type=float, default=0.0, help='Random extra latency per request')
+        parser.add_argument('--error-rate', type=float, default=0.0, help='Share of requests answered with 503')
+        parser.add_argument('--port', type=int, default=8765, help='Port of the stand-in server')
+        parser.add_argument('--noinput', action='store_true', help='Do not ask for confirmation')
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        if not settings.DEBUG:
+            raise CommandError('Refusing to run ingestion benchmarks with DEBUG=False.')
+
+        if not options['noinput']:
+            answer = input('This imports synthetic game data into the configured database. Continue? [y/N] ')
+            if answer.strip().lower() != 'y':
+                self.stdout.write('Aborted.')
+                return
+
+        app = FIOStandinApp(
+            scale=options['scale'],
+            latency_ms=options['latency_ms'],
+            jitter_ms=options['jitter_ms'],
+            error_rate=options['error_rate'],
+            cxpc_days=options['cxpc_days'],
+            seed=42,
+        )
+
+        server = uvicorn.Server(
+            uvicorn.Config(app, host='127.0.0.1', port=options['port'], log_level='warning', lifespan='off')
+        )
+        thread = threading.Thread(target=server.run, daemon=True)
+        thread.start()
+
+        while not server.started:
+            time.sleep(0.05)
+
+        original_base_url = FIOURL.FIO_BASE_URL
+        FIOURL.FIO_BASE_URL = f'http://127.0.0.1:{options["port"]}/'
+
+        try:
+            targets = options['target'] or TARGETS
+            runners: dict[str, Callable[[], int]] = {
+                'planets': self._run_planets,
+                'recipes': self._run_recipes,
+                'cxpc': self._run_cxpc,
+                'user_fiodata': self._run_user_fiodata,
+            }
+
+            self.stdout.write(f'{"target":<14}{"run":>5}{"rows":>10}{"seconds":>10}{"rows/s":>12}{"peak MiB":>10}')
+            for target in targets:
+                for run in range(1, options['runs'] + 1):
+                    self._measure(target, run, runners[target])
+
+            self.stdout.write(f'stand-in requests: {app.request_count}, injected errors: {app.error_count}')
+
+        finally:
+            FIOURL.FIO_BASE_URL = original_base_url
+            server.should_exit = True
+            thread.join()
+
+    def _measure(self, target: str, run: int, runner: Callable[[], int]) -> None:
+        tracemalloc.start()
+        start = time.perf_counter()
+
+        try:
+            rows = runner()
+        finally:
+            duration = time.perf_counter() - start
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+
+        rate = rows / duration if duration else 0.0
+        self.stdout.write(f'{target:<14}{run:>5}{rows:>10}{duration:>10.3f}{rate:>12.1f}{peak / 1024 / 1024:>10.1f}')
+
+    def _run_planets(self) -> int:
+        from gamedata.fio.importers import import_all_planets
+
+        import_all_planets()
+
+        planet_filter = {'planet__planet_natural_id__startswith': STANDIN_PLANET_PREFIX}
+        return (
+            GamePlanet.objects.filter(planet_natural_id__startswith=STANDIN_PLANET_PREFIX).count()
+            + GamePlanetResource.objects.filter(**planet_filter).count()
+            + GamePlanetProductionFee.objects.filter(**planet_filter).count()
+            + GamePlanetCOGCProgram.objects.filter(**planet_filter).count()
+        )
+
+    def _run_recipes(self) -> int:
+        from gamedata.fio.importers import import_all_recipes
+
+        recipes, inputs, outputs = import_all_recipes()
+
+        if not GameRecipe.objects.filter(building_ticker=STANDIN_RECIPE_BUILDING).exists():
+            raise CommandError('Recipe import did not persist any stand-in recipes.')
+
+        return recipes + inputs + outputs
+
+    def _run_cxpc(self) -> int:
+        from gamedata.services.exchange_analytics import ExchangeAnalyticsService
+        from gamedata.tasks import gamedata_refresh_cxpc
+
+        for ticker in STANDIN_TICKERS:
+            for exchange_code in STANDIN_EXCHANGES:
+                gamedata_refresh_cxpc(ticker, exchange_code, full=True)
+
+        # the chord callback of gamedata_trigger_refresh_cxpc
+        ExchangeAnalyticsService.refresh(list(STANDIN_TICKERS))
+
+        return GameExchangeCXPC.objects.filter(ticker__in=STANDIN_TICKERS).count()
+
+    def _run_user_fiodata(self) -> int:
+        from gamedata.tasks import gamedata_refresh_user_fiodata
+
+        # credentials are passed to the task directly, the user itself stays without FIO (no signal dispatch)
+        user, _ = User.objects.get_or_create(username=BENCHMARK_USERNAME)
+        GamedataCacheManager.delete_fio_refresh_lock(user.id)
+
+        if not gamedata_refresh_user_fiodata(user.id, BENCHMARK_USERNAME, 'benchmark-apikey'):
+            raise CommandError('User FIO data refresh failed, see log output.')
+
+        data = GameFIOPlayerData.objects.get(user=user)
+        return len(data.storage_data) + len(data.site_data) + len(data.warehouse_data) + len(data.ship_data)
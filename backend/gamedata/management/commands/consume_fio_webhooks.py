@@ -0,0 +1,53 @@
+import signal
+import socket
+import time
+from typing import Any
+
+import structlog
+from django.core.management.base import BaseCommand
+from gamedata.services.fio_webhook_stream import FIOWebhookStream
+
+logger = structlog.get_logger(__name__)
+
+
+class Command(BaseCommand):
+    help = 'Consume FIO webhook payloads from the Redis stream and dispatch them in batches'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--consumer', type=str, default=None, help='Consumer name, defaults to the hostname')
+        parser.add_argument('--batch-size', type=int, default=FIOWebhookStream.BATCH_SIZE)
+        parser.add_argument('--block-ms', type=int, default=FIOWebhookStream.BLOCK_MS)
+        parser.add_argument(
+            '--window-ms',
+            type=int,
+            default=FIOWebhookStream.COALESCE_WINDOW_MS,
+            help='Collect entries for this long after the first one before flushing',
+        )
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        consumer: str = options['consumer'] or socket.gethostname()
+        self._running = True
+
+        def stop(*_):
+            self._running = False
+
+        signal.signal(signal.SIGTERM, stop)
+        signal.signal(signal.SIGINT, stop)
+
+        log = logger.bind(consumer=consumer)
+        log.info('fio_webhook_consumer_started')
+
+        while self._running:
+            try:
+                FIOWebhookStream.consume(
+                    consumer,
+                    count=options['batch_size'],
+                    block_ms=options['block_ms'],
+                    window_ms=options['window_ms'],
+                )
+            except Exception as exc:
+                # unacknowledged entries are re-claimed on a later iteration
+                log.error('fio_webhook_consumer_exception', exc_info=exc)
+                time.sleep(1)
+
+        log.info('fio_webhook_consumer_stopped')
@@ -0,0 +1,18 @@
+# Generated by Django 6.0.4 on 2026-10-19 09:54
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('gamedata', '0020_auto_20260320_1254'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='gamefioplayerdata',
+            name='webhook_last_received_at',
+            field=models.DateTimeField(blank=True, db_index=True, null=True),
+        ),
+    ]
@@ -0,0 +1,59 @@
+from importlib import import_module
+
+from django.db import migrations
+
+
+def materialized_view_to_table(apps, schema_editor):
+    if schema_editor.connection.vendor == 'sqlite':
+        return
+
+    # keep today's rows, the table is maintained incrementally from here on (ExchangeAnalyticsService)
+    schema_editor.execute("""
+        CREATE TABLE prunplanner_game_exchanges_analytics_new (
+            id bigint GENERATED BY DEFAULT AS IDENTITY PRIMARY KEY,
+            ticker varchar(20) NOT NULL,
+            exchange_code varchar(20) NOT NULL,
+            date_epoch bigint NOT NULL,
+            calendar_date date NOT NULL,
+            traded_daily numeric NOT NULL,
+            vwap_daily numeric NOT NULL,
+            sum_traded_7d numeric NOT NULL,
+            avg_traded_7d numeric NOT NULL,
+            vwap_7d numeric NOT NULL,
+            sum_traded_30d numeric NOT NULL,
+            avg_traded_30d numeric NOT NULL,
+            vwap_30d numeric NOT NULL
+        );
+
+        INSERT INTO prunplanner_game_exchanges_analytics_new (
+            ticker, exchange_code, date_epoch, calendar_date, traded_daily, vwap_daily,
+            sum_traded_7d, avg_traded_7d, vwap_7d, sum_traded_30d, avg_traded_30d, vwap_30d
+        )
+        SELECT ticker, exchange_code, date_epoch, calendar_date, traded_daily, vwap_daily,
+            sum_traded_7d, avg_traded_7d, vwap_7d, sum_traded_30d, avg_traded_30d, vwap_30d
+        FROM prunplanner_game_exchanges_analytics;
+
+        DROP MATERIALIZED VIEW prunplanner_game_exchanges_analytics;
+        ALTER TABLE prunplanner_game_exchanges_analytics_new RENAME TO prunplanner_game_exchanges_analytics;
+
+        CREATE UNIQUE INDEX idx_game_analytics_unique ON prunplanner_game_exchanges_analytics (ticker, exchange_code, date_epoch);
+    """)
+
+
+def table_to_materialized_view(apps, schema_editor):
+    if schema_editor.connection.vendor == 'sqlite':
+        return
+
+    schema_editor.execute("DROP TABLE IF EXISTS prunplanner_game_exchanges_analytics;")
+    import_module('gamedata.migrations.0020_auto_20260320_1254').update_materialized_view(apps, schema_editor)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('gamedata', '0021_fio_playerdata_webhook_last_received'),
+    ]
+
+    operations = [
+        migrations.RunPython(materialized_view_to_table, reverse_code=table_to_materialized_view),
+    ]
@@ -0,0 +1,124 @@
+import re
+from datetime import UTC, date, datetime, time
+
+from django.db import migrations
+
+TABLE = 'prunplanner_game_exchanges_cxpc'
+
+COLUMNS = """
+    ticker varchar(3) NOT NULL,
+    exchange_code varchar(8) NOT NULL,
+    date_epoch bigint NOT NULL,
+    open_p numeric(20, 4) NOT NULL,
+    close_p numeric(20, 4) NOT NULL,
+    high_p numeric(20, 4) NOT NULL,
+    low_p numeric(20, 4) NOT NULL,
+    volume numeric(20, 4) NOT NULL,
+    traded numeric(20, 4) NOT NULL
+"""
+
+COPY_COLUMNS = 'id, ticker, exchange_code, date_epoch, open_p, close_p, high_p, low_p, volume, traded'
+
+# secondary indexes (Django's ticker index and its _like twin, idx_ticker_exchange), constraints excluded
+SECONDARY_INDEXES = """
+    SELECT indexdef FROM pg_indexes i
+    WHERE i.tablename = %s AND NOT EXISTS (
+        SELECT 1 FROM pg_constraint c WHERE c.conindid = to_regclass(quote_ident(i.indexname))
+    )
+"""
+
+
+def _year_epoch(year: int) -> int:
+    return int(datetime.combine(date(year, 1, 1), time(), tzinfo=UTC).timestamp() * 1000)
+
+
+def _secondary_indexes(cursor, table: str) -> list[str]:
+    cursor.execute(SECONDARY_INDEXES, [table])
+    # partitioned parents are listed as `ON ONLY`, which would leave the new index without partitions
+    target = re.compile(rf' ON (ONLY )?(\S+\.)?{table} ')
+    return [target.sub(f' ON {TABLE} ', row[0]) for row in cursor.fetchall()]
+
+
+def partition_by_year(apps, schema_editor):
+    if schema_editor.connection.vendor == 'sqlite':
+        return
+
+    legacy = f'{TABLE}_legacy'
+
+    with schema_editor.connection.cursor() as cursor:
+        cursor.execute(f'ALTER TABLE {TABLE} RENAME TO {legacy}')
+        cursor.execute(f'CREATE TABLE {TABLE} (id bigint NOT NULL, {COLUMNS}) PARTITION BY RANGE (date_epoch)')
+
+        # one partition per year of data up to next year, the default one catches anything else
+        cursor.execute(f'SELECT min(date_epoch) FROM {legacy}')
+        first_epoch = cursor.fetchone()[0]
+        current = datetime.now(tz=UTC).year
+        first = datetime.fromtimestamp(first_epoch / 1000, tz=UTC).year if first_epoch is not None else current
+
+        for year in range(min(first, current), current + 2):
+            cursor.execute(
+                f'CREATE TABLE {TABLE}_y{year} PARTITION OF {TABLE} '
+                f'FOR VALUES FROM ({_year_epoch(year)}) TO ({_year_epoch(year + 1)})'
+            )
+        cursor.execute(f'CREATE TABLE {TABLE}_default PARTITION OF {TABLE} DEFAULT')
+
+        cursor.execute(f'INSERT INTO {TABLE} ({COPY_COLUMNS}) SELECT {COPY_COLUMNS} FROM {legacy}')
+
+        indexes = _secondary_indexes(cursor, legacy)
+        cursor.execute(f'DROP TABLE {legacy}')
+
+        # unique keys of a partitioned table must contain the partition key
+        cursor.execute(f'ALTER TABLE {TABLE} ADD CONSTRAINT {TABLE}_pkey PRIMARY KEY (id, date_epoch)')
+        cursor.execute(
+            f'ALTER TABLE {TABLE} ADD CONSTRAINT unique_ticker_exchange_date '
+            'UNIQUE (ticker, exchange_code, date_epoch)'
+        )
+        for indexdef in indexes:
+            cursor.execute(indexdef)
+        # rows arrive in date order, a BRIN index covers date ranges at a fraction of a btree's size
+        cursor.execute(f'CREATE INDEX idx_cxpc_date_brin ON {TABLE} USING brin (date_epoch)')
+
+        cursor.execute(f'CREATE SEQUENCE {TABLE}_id_seq AS bigint OWNED BY {TABLE}.id')
+        cursor.execute(f"ALTER TABLE {TABLE} ALTER COLUMN id SET DEFAULT nextval('{TABLE}_id_seq')")
+        cursor.execute(f"SELECT setval('{TABLE}_id_seq', COALESCE((SELECT max(id) FROM {TABLE}), 0) + 1, false)")
+
+
+def merge_partitions(apps, schema_editor):
+    if schema_editor.connection.vendor == 'sqlite':
+        return
+
+    partitioned = f'{TABLE}_partitioned'
+
+    with schema_editor.connection.cursor() as cursor:
+        cursor.execute('DROP INDEX IF EXISTS idx_cxpc_date_brin')
+        cursor.execute(f'ALTER TABLE {TABLE} RENAME TO {partitioned}')
+        # free the names the plain table's primary key and identity take
+        cursor.execute(f'ALTER TABLE {partitioned} RENAME CONSTRAINT {TABLE}_pkey TO {partitioned}_pkey')
+        cursor.execute(f'ALTER SEQUENCE {TABLE}_id_seq RENAME TO {partitioned}_id_seq')
+        cursor.execute(f'CREATE TABLE {TABLE} (id bigint GENERATED BY DEFAULT AS IDENTITY PRIMARY KEY, {COLUMNS})')
+        cursor.execute(f'INSERT INTO {TABLE} ({COPY_COLUMNS}) SELECT {COPY_COLUMNS} FROM {partitioned}')
+
+        indexes = _secondary_indexes(cursor, partitioned)
+        cursor.execute(f'DROP TABLE {partitioned} CASCADE')
+
+        cursor.execute(
+            f'ALTER TABLE {TABLE} ADD CONSTRAINT unique_ticker_exchange_date '
+            'UNIQUE (ticker, exchange_code, date_epoch)'
+        )
+        for indexdef in indexes:
+            cursor.execute(indexdef)
+
+        cursor.execute(
+            f"SELECT setval(pg_get_serial_sequence('{TABLE}', 'id'), "
+            f'COALESCE((SELECT max(id) FROM {TABLE}), 0) + 1, false)'
+        )
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ('gamedata', '0022_exchange_analytics_table'),
+    ]
+
+    operations = [
+        migrations.RunPython(partition_by_year, reverse_code=merge_partitions),
+    ]
@@ -0,0 +1,29 @@
+from django.db import migrations
+
+
+def create_perf_index(apps, schema_editor):
+    if schema_editor.connection.vendor == 'sqlite':
+        return
+
+    # dropped with the materialized view in 0022
+    schema_editor.execute("""
+        CREATE INDEX IF NOT EXISTS idx_game_analytics_perf
+        ON prunplanner_game_exchanges_analytics (ticker, exchange_code, date_epoch DESC);
+    """)
+
+
+def drop_perf_index(apps, schema_editor):
+    if schema_editor.connection.vendor == 'sqlite':
+        return
+
+    schema_editor.execute("DROP INDEX IF EXISTS idx_game_analytics_perf;")
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ('gamedata', '0023_partition_exchange_cxpc'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_perf_index, reverse_code=drop_perf_index),
+    ]
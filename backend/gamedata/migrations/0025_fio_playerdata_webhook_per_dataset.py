@@ -0,0 +1,37 @@
+# Generated by Django 6.0.4 on 2026-10-19 11:28
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('gamedata', '0024_exchange_analytics_perf_index'),
+    ]
+
+    operations = [
+        migrations.RemoveField(
+            model_name='gamefioplayerdata',
+            name='webhook_last_received_at',
+        ),
+        migrations.AddField(
+            model_name='gamefioplayerdata',
+            name='ship_webhook_at',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='gamefioplayerdata',
+            name='site_webhook_at',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='gamefioplayerdata',
+            name='storage_webhook_at',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='gamefioplayerdata',
+            name='warehouse_webhook_at',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+    ]
@@ -43,6 +43,8 @@ class GameExchange(models.Model):
 
 class GameExchangeCXPC(models.Model):
     # Bronze Layer: Raw daily CXPC data
+    # Postgres: range-partitioned by date_epoch per year, with a BRIN index on date_epoch (migration 0023).
+    # Days older than CXPCStorageService.RETENTION_YEARS are compacted into weekly rows dated on Mondays.
 
     ticker = models.CharField(max_length=3, db_index=True, validators=[MinLengthValidator(1)])
     exchange_code = models.CharField(max_length=8, choices=GameExchangeCodeChoices.choices)
@@ -76,7 +78,7 @@ class GameExchangeCXPC(models.Model):
 
 
 class GameExchangeAnalytics(models.Model):
-    # Gold Layer: Read-only view of calculated stats.
+    # Gold Layer: Calculated stats, maintained incrementally by ExchangeAnalyticsService.
 
     ticker = models.CharField(max_length=20)
     exchange_code = models.CharField(max_length=20)
@@ -98,7 +100,7 @@ class GameExchangeAnalytics(models.Model):
     vwap_30d = models.DecimalField('30d VWAP', max_digits=20, decimal_places=4)
 
     class Meta:
-        managed = False  # Critical: Django will not create a table
+        managed = False  # Critical: table and its upserts are raw SQL
         db_table = 'prunplanner_game_exchanges_analytics'
         verbose_name = 'Exchange Analytics'
         verbose_name_plural = 'Exchange Analytics'
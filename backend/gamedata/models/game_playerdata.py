@@ -12,6 +12,14 @@ class GameFIOPlayerData(UUIDModel, CeleryAutomationModel):
     warehouse_data = models.JSONField(default=dict)
     ship_data = models.JSONField(default=dict)
 
+    # set whenever FIO pushed the dataset via webhook, polling backs off while all are recent
+    storage_webhook_at = models.DateTimeField(blank=True, null=True)
+    site_webhook_at = models.DateTimeField(blank=True, null=True)
+    warehouse_webhook_at = models.DateTimeField(blank=True, null=True)
+    ship_webhook_at = models.DateTimeField(blank=True, null=True)
+
+    WEBHOOK_FIELDS = ('storage_webhook_at', 'site_webhook_at', 'warehouse_webhook_at', 'ship_webhook_at')
+
     objects: models.Manager['GameFIOPlayerData'] = models.Manager()
 
     class Meta:
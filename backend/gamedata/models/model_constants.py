@@ -72,3 +72,32 @@ habitations: dict[str, dict[str, int]] = {
         'area': 18,
     },
 }
+
+# daily consumption per 100 workers: essentials, then the lux1 and lux2 luxuries
+workforce_needs: dict[str, dict[str, dict[str, float]]] = {
+    'pioneers': {
+        'essentials': {'DW': 4.0, 'RAT': 4.0, 'OVE': 0.5},
+        'lux1': {'COF': 0.5},
+        'lux2': {'PWO': 0.2},
+    },
+    'settlers': {
+        'essentials': {'DW': 5.0, 'RAT': 6.0, 'EXO': 0.5, 'PT': 0.5},
+        'lux1': {'KOM': 1.0},
+        'lux2': {'REP': 0.2},
+    },
+    'technicians': {
+        'essentials': {'DW': 7.5, 'RAT': 7.0, 'MED': 0.5, 'HMS': 0.5, 'SCN': 0.1},
+        'lux1': {'ALE': 1.0},
+        'lux2': {'SC': 0.1},
+    },
+    'engineers': {
+        'essentials': {'DW': 10.0, 'FIM': 7.0, 'MED': 0.5, 'HSS': 0.2, 'PDA': 0.1},
+        'lux1': {'GIN': 1.0},
+        'lux2': {'VG': 0.2},
+    },
+    'scientists': {
+        'essentials': {'DW': 10.0, 'MEA': 7.0, 'MED': 0.5, 'LC': 0.2, 'WS': 0.1},
+        'lux1': {'WIN': 1.0},
+        'lux2': {'NST': 0.1},
+    },
+}
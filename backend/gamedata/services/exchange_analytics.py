@@ -0,0 +1,176 @@
+from datetime import timedelta
+
+import structlog
+from django.db import connection, transaction
+from django.utils import timezone
+from structlog.typing import FilteringBoundLogger
+
+from gamedata.services.exchange_market import ExchangeMarketCache
+
+logger: FilteringBoundLogger = structlog.get_logger(__name__)
+
+# Same derivation as the former materialized view (migration 0020), restricted to `%(tickers)s` (NULL = all).
+# Only today's row per (ticker, exchange) is kept, its 7d/30d windows and LOCF VWAP read CXPC of the last 30 days.
+# That bound is passed as `%(since_epoch)s`, a plan time constant prunes the yearly CXPC partitions.
+_ANALYTICS_CTE = """
+    WITH constants AS (
+        SELECT (EXTRACT(epoch FROM date_trunc('day'::text, now())) * 1000::numeric)::bigint AS today_epoch
+    ), physical_exchanges AS (
+        SELECT unnest(ARRAY['AI1'::text, 'IC1'::text, 'NC1'::text, 'CI1'::text])::character varying AS exchange_code
+    ), ticker_scaffold AS (
+        SELECT m.ticker, e.exchange_code, c.today_epoch AS date_epoch, 0::numeric AS volume, 0::numeric AS traded
+        FROM prunplanner_game_materials m
+            CROSS JOIN physical_exchanges e
+            CROSS JOIN constants c
+        WHERE %(tickers)s::varchar[] IS NULL OR m.ticker = ANY(%(tickers)s::varchar[])
+    ), combined_source AS (
+        SELECT ticker, exchange_code, date_epoch, volume::numeric AS volume, traded::numeric AS traded
+        FROM prunplanner_game_exchanges_cxpc
+        WHERE date_epoch >= %(since_epoch)s
+            AND exchange_code IN ('AI1', 'IC1', 'NC1', 'CI1')
+            AND (%(tickers)s::varchar[] IS NULL OR ticker = ANY(%(tickers)s::varchar[]))
+        UNION ALL
+        SELECT ticker, exchange_code, date_epoch, volume, traded FROM ticker_scaffold
+    ), base_aggregated AS (
+        SELECT ticker,
+            COALESCE(exchange_code, 'UNIVERSE'::character varying) AS exchange_code,
+            date_epoch,
+            sum(volume) AS volume,
+            sum(traded) AS traded
+        FROM combined_source
+        GROUP BY GROUPING SETS ((ticker, exchange_code, date_epoch), (ticker, date_epoch))
+    ), windowed_stats AS (
+        SELECT ticker, exchange_code, date_epoch, volume, traded,
+            sum(volume) OVER w7 AS sum_volume_7d,
+            sum(volume) OVER w30 AS sum_volume_30d,
+            sum(traded) OVER w7 AS sum_traded_7d,
+            sum(traded) OVER w30 AS sum_traded_30d,
+            avg(traded) OVER w7 AS avg_traded_7d,
+            avg(traded) OVER w30 AS avg_traded_30d,
+            CASE WHEN traded > 0::numeric THEN volume / traded ELSE NULL::numeric END AS instant_vwap
+        FROM base_aggregated
+        WINDOW
+            w7 AS (PARTITION BY ticker, exchange_code ORDER BY date_epoch
+                RANGE BETWEEN 604800000 PRECEDING AND CURRENT ROW),
+            w30 AS (PARTITION BY ticker, exchange_code ORDER BY date_epoch
+                RANGE BETWEEN '2592000000'::bigint PRECEDING AND CURRENT ROW)
+    ), locf_logic AS (
+        SELECT *,
+            (array_remove(array_agg(instant_vwap) OVER w_locf, NULL::numeric))
+                [array_upper(array_remove(array_agg(instant_vwap) OVER w_locf, NULL::numeric), 1)] AS last_known_vwap
+        FROM windowed_stats
+        WINDOW w_locf AS (PARTITION BY ticker, exchange_code ORDER BY date_epoch
+            ROWS BETWEEN UNBOUNDED PRECEDING AND CURRENT ROW)
+    )
+"""
+
+_ANALYTICS_UPSERT = (
+    _ANALYTICS_CTE
+    + """
+    INSERT INTO prunplanner_game_exchanges_analytics (
+        ticker, exchange_code, date_epoch, calendar_date, traded_daily, vwap_daily,
+        sum_traded_7d, avg_traded_7d, vwap_7d, sum_traded_30d, avg_traded_30d, vwap_30d
+    )
+    SELECT ticker,
+        exchange_code,
+        date_epoch,
+        to_timestamp((date_epoch / 1000)::double precision)::date,
+        traded,
+        COALESCE(instant_vwap, last_known_vwap, 0::numeric),
+        sum_traded_7d,
+        COALESCE(avg_traded_7d, 0::numeric),
+        COALESCE(sum_volume_7d / NULLIF(sum_traded_7d, 0::numeric), last_known_vwap, 0::numeric),
+        sum_traded_30d,
+        COALESCE(avg_traded_30d, 0::numeric),
+        COALESCE(sum_volume_30d / NULLIF(sum_traded_30d, 0::numeric), last_known_vwap, 0::numeric)
+    FROM locf_logic
+    WHERE date_epoch = (SELECT today_epoch FROM constants)
+    ORDER BY ticker, exchange_code
+    ON CONFLICT (ticker, exchange_code, date_epoch) DO UPDATE SET
+        calendar_date = EXCLUDED.calendar_date,
+        traded_daily = EXCLUDED.traded_daily,
+        vwap_daily = EXCLUDED.vwap_daily,
+        sum_traded_7d = EXCLUDED.sum_traded_7d,
+        avg_traded_7d = EXCLUDED.avg_traded_7d,
+        vwap_7d = EXCLUDED.vwap_7d,
+        sum_traded_30d = EXCLUDED.sum_traded_30d,
+        avg_traded_30d = EXCLUDED.avg_traded_30d,
+        vwap_30d = EXCLUDED.vwap_30d
+"""
+)
+
+_TODAY_EPOCH = "(EXTRACT(epoch FROM date_trunc('day'::text, now())) * 1000::numeric)::bigint"
+
+_DELETE_OUTDATED = f"""
+    DELETE FROM prunplanner_game_exchanges_analytics
+    WHERE date_epoch < {_TODAY_EPOCH}
+        AND (%(tickers)s::varchar[] IS NULL OR ticker = ANY(%(tickers)s::varchar[]))
+"""
+
+_STALE_TICKERS = f"""
+    SELECT DISTINCT ticker FROM prunplanner_game_exchanges_analytics WHERE date_epoch < {_TODAY_EPOCH}
+    UNION
+    SELECT m.ticker FROM prunplanner_game_materials m
+    WHERE NOT EXISTS (SELECT 1 FROM prunplanner_game_exchanges_analytics a WHERE a.ticker = m.ticker)
+"""
+
+
+class ExchangeAnalyticsService:
+    """
+    Maintains `GameExchangeAnalytics` incrementally.
+
+    The analytics table holds one row per (ticker, exchange) for today, plus the UNIVERSE
+    aggregate. A row only depends on the last 30 days of CXPC of its ticker, so after a CXPC
+    refresh just its tickers are recomputed and upserted, all other rows stay untouched.
+    Rows are upserted in key order, concurrent refreshes lock them in the same order.
+
+    Rows of past days are replaced once the day rolls over, see `refresh_stale`.
+    Recomputed tickers are rewritten in `ExchangeMarketCache` on commit.
+
+    Postgres only, a no-op on other databases.
+    """
+
+    @classmethod
+    def refresh(cls, tickers: list[str] | None = None) -> int:
+        """Recomputes today's rows of `tickers` (None = all), returns the number of rows upserted."""
+
+        if connection.vendor != 'postgresql':
+            return 0
+
+        if tickers is not None and not tickers:
+            return 0
+
+        selected = sorted(set(tickers)) if tickers is not None else None
+        today = timezone.now().replace(hour=0, minute=0, second=0, microsecond=0)
+        params = {'tickers': selected, 'since_epoch': int((today - timedelta(days=30)).timestamp() * 1000)}
+
+        with transaction.atomic(), connection.cursor() as cursor:
+            cursor.execute(_ANALYTICS_UPSERT, params)
+            upserted = cursor.rowcount
+            cursor.execute(_DELETE_OUTDATED, params)
+            deleted = cursor.rowcount
+
+            # the exchange list picks up the new rows only once they are visible
+            transaction.on_commit(lambda: ExchangeMarketCache.rebuild(selected))
+
+        logger.info(
+            'exchange_analytics_refreshed',
+            tickers=len(selected) if selected is not None else 'all',
+            upserted=upserted,
+            deleted=deleted,
+        )
+
+        return upserted
+
+    @classmethod
+    def refresh_stale(cls) -> int:
+        """Recomputes tickers whose rows are from a past day or missing entirely."""
+
+        if connection.vendor != 'postgresql':
+            return 0
+
+        with connection.cursor() as cursor:
+            cursor.execute(_STALE_TICKERS)
+            tickers = [row[0] for row in cursor.fetchall()]
+
+        return cls.refresh(tickers)
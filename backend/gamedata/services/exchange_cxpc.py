@@ -0,0 +1,215 @@
+from datetime import UTC, datetime, time, timedelta
+from decimal import Decimal
+from typing import NamedTuple
+
+from django.db.models import BigIntegerField, ExpressionWrapper, F, FloatField, Func, Max, Min, Sum, Window
+from django.db.models.functions import Cast, FirstValue, RowNumber
+from django.utils import timezone
+
+from gamedata.models.game_exchange import GameExchangeCXPC
+
+DAY_MS = 86_400_000
+
+
+class CXPCQuery(NamedTuple):
+    """Normalized CXPC history request, `from_epoch` aligned to its bucket and `to_epoch` to its day."""
+
+    interval: str = 'day'
+    from_epoch: int | None = None
+    to_epoch: int | None = None
+    limit: int | None = None
+
+    @property
+    def cache_key(self) -> str | None:
+        # the unbounded daily history keeps its original cache key
+        if self == CXPCQuery():
+            return None
+        return ':'.join('' if value is None else str(value) for value in self)
+
+
+class MonthStart(Func):
+    """date_epoch of the first day of the month of an epoch milliseconds value, in UTC."""
+
+    output_field = BigIntegerField()
+    template = (
+        "(EXTRACT(epoch FROM date_trunc('month', to_timestamp(%(expressions)s / 1000) AT TIME ZONE 'UTC'))"
+        ' * 1000)::bigint'
+    )
+
+    def as_sqlite(self, compiler, connection, **extra_context):
+        return self.as_sql(
+            compiler,
+            connection,
+            template="CAST((julianday(date(%(expressions)s / 1000, 'unixepoch', 'start of month')) - 2440587.5)"
+            ' * 86400000 AS INTEGER)',
+            **extra_context,
+        )
+
+
+class CXPCHistoryService:
+    """
+    CXPC history of a ticker, filtered by date range and optionally aggregated to weekly
+    (Monday based) or monthly OHLCV buckets.
+
+    The range is served by the (ticker, exchange_code, date_epoch) unique index. Buckets are
+    built in the database from the daily rows: open of the first day, close volume-weighted
+    over the bucket (falling back to the last close without trades), high/low extremes and
+    summed volume and traded amount. Rows and buckets are returned newest first, `limit`
+    keeps the latest.
+
+    Bucketed requests without `from` cover `DEFAULT_RANGE_DAYS` (or `limit` buckets, if
+    more), so they never aggregate the full history.
+    """
+
+    INTERVALS = ['day', 'week', 'month']
+    MAX_LIMIT = 5000
+    DEFAULT_RANGE_DAYS = {'week': 730, 'month': 1825}
+    BUCKET_DAYS = {'week': 7, 'month': 31}
+
+    FIELDS = ['ticker', 'exchange_code', 'date_epoch', 'open_p', 'close_p', 'high_p', 'low_p', 'volume', 'traded']
+    DECIMAL_FIELDS = ['open_p', 'close_p', 'high_p', 'low_p', 'volume', 'traded']
+
+    @staticmethod
+    def bucket_start(date_epoch: int, interval: str) -> int:
+        if interval == 'day':
+            return date_epoch - date_epoch % DAY_MS
+
+        day = datetime.fromtimestamp(date_epoch / 1000, tz=UTC).date()
+        start = day - timedelta(days=day.weekday()) if interval == 'week' else day.replace(day=1)
+        return int(datetime.combine(start, time(), tzinfo=UTC).timestamp() * 1000)
+
+    @classmethod
+    def normalize(
+        cls,
+        interval: str = 'day',
+        from_epoch: int | None = None,
+        to_epoch: int | None = None,
+        limit: int | None = None,
+    ) -> CXPCQuery:
+        to_epoch = cls.bucket_start(to_epoch, 'day') if to_epoch is not None else None
+
+        if from_epoch is None and interval != 'day':
+            days = max(cls.DEFAULT_RANGE_DAYS[interval], (limit or 0) * cls.BUCKET_DAYS[interval])
+            end = to_epoch if to_epoch is not None else cls.bucket_start(int(timezone.now().timestamp() * 1000), 'day')
+            from_epoch = end - days * DAY_MS
+
+        return CXPCQuery(
+            interval=interval,
+            from_epoch=cls.bucket_start(from_epoch, interval) if from_epoch is not None else None,
+            to_epoch=to_epoch,
+            limit=limit,
+        )
+
+    @staticmethod
+    def bucket_expression(interval: str):
+        if interval == 'month':
+            return MonthStart(F('date_epoch'))
+
+        # Monday 00:00 UTC, 1970-01-01 was a Thursday
+        day = F('date_epoch') / DAY_MS
+        return ExpressionWrapper((day - (day + 3) % 7) * DAY_MS, output_field=BigIntegerField())
+
+    @classmethod
+    def _range(cls, ticker: str, exchange_codes: list[str], query: CXPCQuery):
+        qs = GameExchangeCXPC.objects.filter(ticker=ticker, exchange_code__in=exchange_codes)
+
+        if query.from_epoch is not None:
+            qs = qs.filter(date_epoch__gte=query.from_epoch)
+        if query.to_epoch is not None:
+            # `to` includes its whole day
+            qs = qs.filter(date_epoch__lt=query.to_epoch + DAY_MS)
+
+        return qs
+
+    @classmethod
+    def fetch(cls, ticker: str, exchange_codes: list[str], query: CXPCQuery) -> list[dict]:
+        qs = cls._range(ticker, exchange_codes, query)
+
+        if query.interval == 'day':
+            qs = qs.order_by('-date_epoch')
+            if query.limit:
+                qs = qs[: query.limit]
+            return list(qs.values(*cls.FIELDS))
+
+        return cls.aggregate(qs, query.interval, query.limit)
+
+    @classmethod
+    def fetch_rows(cls, ticker: str, exchange_codes: list[str], query: CXPCQuery) -> list[tuple]:
+        """Same as `fetch`, as tuples in `FIELDS` order with floats instead of Decimals (columnar layout)."""
+
+        if query.interval != 'day':
+            return [
+                tuple(float(b[f]) if f in cls.DECIMAL_FIELDS else b[f] for f in cls.FIELDS)
+                for b in cls.fetch(ticker, exchange_codes, query)
+            ]
+
+        # cast in the database, no Decimal is ever built
+        qs = (
+            cls._range(ticker, exchange_codes, query)
+            .annotate(**{f'{f}_float': Cast(F(f), FloatField()) for f in cls.DECIMAL_FIELDS})
+            .order_by('-date_epoch')
+        )
+        if query.limit:
+            qs = qs[: query.limit]
+
+        return list(qs.values_list(*[f'{f}_float' if f in cls.DECIMAL_FIELDS else f for f in cls.FIELDS]))
+
+    @classmethod
+    def aggregate(cls, qs, interval: str, limit: int | None = None) -> list[dict]:
+        """
+        OHLCV buckets of the daily rows of `qs`, newest first. One row per bucket and exchange
+        is kept in SQL, its window columns carry the values of the whole bucket.
+        """
+
+        bucket = cls.bucket_expression(interval)
+        partition = [F('exchange_code'), bucket]
+
+        def over(expression, order_by=None):
+            return Window(expression, partition_by=partition, order_by=order_by)
+
+        qs = (
+            qs.annotate(
+                bucket_epoch=bucket,
+                bucket_row=over(RowNumber(), F('date_epoch').asc()),
+                bucket_open=over(FirstValue('open_p'), F('date_epoch').asc()),
+                bucket_last_close=over(FirstValue('close_p'), F('date_epoch').desc()),
+                bucket_high=over(Max('high_p')),
+                bucket_low=over(Min('low_p')),
+                bucket_volume=over(Sum('volume')),
+                bucket_traded=over(Sum('traded')),
+            )
+            .filter(bucket_row=1)
+            .order_by('-bucket_epoch', 'exchange_code')
+            .values(
+                'ticker',
+                'exchange_code',
+                'bucket_epoch',
+                'bucket_open',
+                'bucket_last_close',
+                'bucket_high',
+                'bucket_low',
+                'bucket_volume',
+                'bucket_traded',
+            )
+        )
+        if limit:
+            qs = qs[:limit]
+
+        return [
+            {
+                'ticker': row['ticker'],
+                'exchange_code': row['exchange_code'],
+                'date_epoch': row['bucket_epoch'],
+                'open_p': row['bucket_open'],
+                'close_p': (
+                    (row['bucket_volume'] / row['bucket_traded']).quantize(Decimal('0.0001'))
+                    if row['bucket_traded']
+                    else row['bucket_last_close']
+                ),
+                'high_p': row['bucket_high'],
+                'low_p': row['bucket_low'],
+                'volume': row['bucket_volume'],
+                'traded': row['bucket_traded'],
+            }
+            for row in qs
+        ]
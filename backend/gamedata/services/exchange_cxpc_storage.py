@@ -0,0 +1,136 @@
+from datetime import UTC, date, datetime, time
+
+import structlog
+from django.db import connection, transaction
+from django.utils import timezone
+from structlog.typing import FilteringBoundLogger
+
+from gamedata.services.exchange_cxpc import CXPCHistoryService
+
+logger: FilteringBoundLogger = structlog.get_logger(__name__)
+
+TABLE = 'prunplanner_game_exchanges_cxpc'
+WEEK_MS = 7 * 86_400_000
+
+# Monday 00:00 UTC of a date_epoch, 1970-01-01 was a Thursday
+_WEEK_START = '((({col} / 86400000) - (({col} / 86400000) + 3) %% 7) * 86400000)'
+
+_COMPACT_AGGREGATE = f"""
+    CREATE TEMPORARY TABLE cxpc_rollup ON COMMIT DROP AS
+    WITH weeks AS (
+        SELECT DISTINCT ticker, exchange_code, {_WEEK_START.format(col='date_epoch')} AS week_epoch
+        FROM {TABLE}
+        WHERE date_epoch < %(cutoff)s AND date_epoch <> {_WEEK_START.format(col='date_epoch')}
+    )
+    SELECT c.ticker,
+        c.exchange_code,
+        w.week_epoch AS date_epoch,
+        (array_agg(c.open_p ORDER BY c.date_epoch))[1] AS open_p,
+        CASE
+            WHEN sum(c.traded) > 0 THEN round(sum(c.volume) / sum(c.traded), 4)
+            ELSE (array_agg(c.close_p ORDER BY c.date_epoch DESC))[1]
+        END AS close_p,
+        max(c.high_p) AS high_p,
+        min(c.low_p) AS low_p,
+        sum(c.volume) AS volume,
+        sum(c.traded) AS traded
+    FROM {TABLE} c
+        JOIN weeks w ON c.ticker = w.ticker AND c.exchange_code = w.exchange_code
+            AND c.date_epoch >= w.week_epoch AND c.date_epoch < w.week_epoch + {WEEK_MS}
+    WHERE c.date_epoch < %(cutoff)s
+    GROUP BY c.ticker, c.exchange_code, w.week_epoch
+"""
+
+_COMPACT_DELETE = f"""
+    DELETE FROM {TABLE} c USING cxpc_rollup r
+    WHERE c.ticker = r.ticker AND c.exchange_code = r.exchange_code
+        AND c.date_epoch >= r.date_epoch AND c.date_epoch < r.date_epoch + {WEEK_MS}
+        AND c.date_epoch < %(cutoff)s
+"""
+
+_COMPACT_INSERT = f"""
+    INSERT INTO {TABLE} (ticker, exchange_code, date_epoch, open_p, close_p, high_p, low_p, volume, traded)
+    SELECT ticker, exchange_code, date_epoch, open_p, close_p, high_p, low_p, volume, traded FROM cxpc_rollup
+"""
+
+
+def _day_epoch(day: date) -> int:
+    return int(datetime.combine(day, time(), tzinfo=UTC).timestamp() * 1000)
+
+
+class CXPCStorageService:
+    """
+    Storage maintenance of the CXPC table, range-partitioned by `date_epoch` into yearly
+    partitions (see migration 0023).
+
+    - `ensure_partitions` creates the partitions of upcoming years ahead of time, so new rows
+      never land in the default partition.
+    - `compact` replaces daily rows older than `RETENTION_YEARS` by one weekly OHLCV rollup
+      row per (ticker, exchange), dated on the Monday and built like the weekly buckets of
+      `CXPCHistoryService`. Weeks already rolled up consist of their Monday row only and
+      are left alone.
+
+    Postgres only, a no-op on other databases.
+    """
+
+    RETENTION_YEARS = 3
+    PARTITIONS_AHEAD = 1
+
+    @staticmethod
+    def partition_name(year: int) -> str:
+        return f'{TABLE}_y{year}'
+
+    @classmethod
+    def retention_cutoff(cls) -> int:
+        """First date_epoch kept daily: the Monday of the week `RETENTION_YEARS` ago."""
+
+        today = timezone.now().date()
+        # day clamped, 29 February has no counterpart in most years
+        cutoff_day = today.replace(year=today.year - cls.RETENTION_YEARS, day=min(today.day, 28))
+        return CXPCHistoryService.bucket_start(_day_epoch(cutoff_day), 'week')
+
+    @classmethod
+    def ensure_partitions(cls) -> list[str]:
+        if connection.vendor != 'postgresql':
+            return []
+
+        current = timezone.now().year
+        created = []
+
+        with connection.cursor() as cursor:
+            for year in range(current, current + cls.PARTITIONS_AHEAD + 1):
+                name = cls.partition_name(year)
+                cursor.execute('SELECT to_regclass(%s)', [name])
+                if cursor.fetchone()[0] is not None:
+                    continue
+
+                cursor.execute(
+                    f'CREATE TABLE {name} PARTITION OF {TABLE} '
+                    f'FOR VALUES FROM ({_day_epoch(date(year, 1, 1))}) TO ({_day_epoch(date(year + 1, 1, 1))})'
+                )
+                created.append(name)
+
+        if created:
+            logger.info('cxpc_partitions_created', partitions=created)
+
+        return created
+
+    @classmethod
+    def compact(cls) -> int:
+        """Rolls up daily rows older than the retention cutoff, returns the number of weekly rows written."""
+
+        if connection.vendor != 'postgresql':
+            return 0
+
+        params = {'cutoff': cls.retention_cutoff()}
+
+        with transaction.atomic(), connection.cursor() as cursor:
+            cursor.execute(_COMPACT_AGGREGATE, params)
+            cursor.execute(_COMPACT_DELETE, params)
+            deleted = cursor.rowcount
+            cursor.execute(_COMPACT_INSERT)
+            written = cursor.rowcount
+
+        logger.info('cxpc_compacted', cutoff=params['cutoff'], daily_rows=deleted, weekly_rows=written)
+
+        return written
@@ -0,0 +1,198 @@
+from datetime import UTC, date, datetime, time
+from itertools import groupby
+
+import numpy as np
+from django.db.models import Avg, F, FloatField, Max, Min, Sum
+from django.db.models.functions import Cast, Coalesce, NullIf
+
+from gamedata.models.game_exchange import GameExchangeCXPC
+from gamedata.services.exchange_cxpc import DAY_MS
+from gamedata.services.exchange_cxpc_storage import CXPCStorageService
+
+
+class CXPCIndicatorService:
+    """
+    Rolling market indicators over CXPC, for any window of days and many tickers at once.
+
+    Each (ticker, exchange) series is loaded as contiguous float64 arrays on a daily grid:
+    days without a CXPC row carry no volume and the previous day's prices. Per day of the
+    requested range the result holds, over the trailing `window` days:
+
+    - `vwap`: summed volume / summed traded amount, null without trades
+    - `sma` / `ema`: simple and exponential (alpha = 2 / (window + 1)) moving average of close
+    - `high` / `low`: band of the highest high and lowest low
+    - `volatility`: sample standard deviation of daily log returns of close
+
+    Values are null until the series has `window` days of history.
+
+    There are no CXPC rows of `UNIVERSE`, its series is aggregated per day from the physical
+    exchanges: volume and traded amount summed, close weighted by the traded amount (the plain
+    average on days without trades), high and low the extremes.
+
+    Only daily rows are read: rows before the CXPC retention cutoff are weekly rollups (see
+    `CXPCStorageService.compact`) and are skipped, `days + window` is limited to
+    `MAX_HISTORY_DAYS` so requests stay within the daily history.
+    """
+
+    INDICATORS = ['vwap', 'sma', 'ema', 'high', 'low', 'volatility']
+
+    MIN_WINDOW = 2
+    MAX_WINDOW = 365
+    # daily CXPC kept by the retention, less the week its cutoff is aligned to
+    MAX_HISTORY_DAYS = CXPCStorageService.RETENTION_YEARS * 365 - 7
+    MAX_DAYS = MAX_HISTORY_DAYS - MIN_WINDOW
+    MAX_TICKERS = 50
+
+    UNIVERSE = 'UNIVERSE'
+    UNIVERSE_EXCHANGES = ['AI1', 'CI1', 'IC1', 'NC1']
+
+    @staticmethod
+    def day_epoch(day: date) -> int:
+        return int(datetime.combine(day, time(), tzinfo=UTC).timestamp() * 1000)
+
+    @classmethod
+    def load(cls, tickers: list[str], exchange_code: str, first_epoch: int, last_epoch: int) -> dict:
+        """Daily arrays per ticker between both day epochs (inclusive), keyed by ticker."""
+
+        exchange_codes = cls.UNIVERSE_EXCHANGES if exchange_code == cls.UNIVERSE else [exchange_code]
+        qs = GameExchangeCXPC.objects.filter(
+            ticker__in=tickers,
+            exchange_code__in=exchange_codes,
+            # weekly rollups before the cutoff would be read as single days
+            date_epoch__gte=max(first_epoch, CXPCStorageService.retention_cutoff()),
+            date_epoch__lt=last_epoch + DAY_MS,
+        )
+
+        def as_float(field: str) -> Cast:
+            return Cast(F(field), FloatField())
+
+        if exchange_code == cls.UNIVERSE:
+            qs = qs.values('ticker', 'date_epoch').annotate(
+                close_p_float=Coalesce(
+                    Sum(as_float('close_p') * as_float('traded')) / NullIf(Sum(as_float('traded')), 0.0),
+                    Avg(as_float('close_p')),
+                ),
+                high_p_float=Max(as_float('high_p')),
+                low_p_float=Min(as_float('low_p')),
+                volume_float=Sum(as_float('volume')),
+                traded_float=Sum(as_float('traded')),
+            )
+        else:
+            qs = qs.annotate(**{f'{f}_float': as_float(f) for f in ('close_p', 'high_p', 'low_p', 'volume', 'traded')})
+
+        rows = qs.order_by('ticker', 'date_epoch').values_list(
+            'ticker', 'date_epoch', 'close_p_float', 'high_p_float', 'low_p_float', 'volume_float', 'traded_float'
+        )
+
+        size = (last_epoch - first_epoch) // DAY_MS + 1
+        series = {}
+
+        for ticker, group in groupby(rows, key=lambda r: r[0]):
+            data = np.array([r[1:] for r in group], dtype=np.float64)
+            index = ((data[:, 0].astype(np.int64) - first_epoch) // DAY_MS).astype(np.intp)
+
+            # prices carried forward over days without a row, NaN before the first one
+            position = np.full(size, -1, dtype=np.intp)
+            position[index] = np.arange(len(index))
+            position = np.maximum.accumulate(position)
+            known = position >= 0
+
+            def spread(column: int, known=known, position=position, data=data) -> np.ndarray:
+                values = np.full(size, np.nan)
+                values[known] = data[position[known], column]
+                return values
+
+            volume = np.zeros(size)
+            traded = np.zeros(size)
+            volume[index] = data[:, 4]
+            traded[index] = data[:, 5]
+
+            series[ticker] = {
+                'close': spread(1),
+                'high': spread(2),
+                'low': spread(3),
+                'volume': volume,
+                'traded': traded,
+            }
+
+        return series
+
+    @staticmethod
+    def _rolling_sum(values: np.ndarray, window: int) -> np.ndarray:
+        sums = np.cumsum(values)
+        sums[window:] = sums[window:] - sums[:-window]
+        return sums
+
+    @classmethod
+    def _ema(cls, close: np.ndarray, window: int) -> np.ndarray:
+        alpha = 2 / (window + 1)
+        ema = np.full(close.shape, np.nan)
+
+        start = int(np.argmax(~np.isnan(close))) if not np.isnan(close).all() else close.size
+        if start + window > close.size:
+            return ema
+
+        # seeded with the SMA of the first full window, the recursion itself is inherently sequential
+        value = float(close[start : start + window].mean())
+        ema[start + window - 1] = value
+        for i, price in enumerate(close[start + window :].tolist(), start=start + window):
+            value += alpha * (price - value)
+            ema[i] = value
+
+        return ema
+
+    @classmethod
+    def compute(cls, series: dict[str, np.ndarray], window: int) -> dict[str, np.ndarray]:
+        """Indicators of one series loaded by `load`, same length as its arrays."""
+
+        close, high, low = series['close'], series['high'], series['low']
+        size = close.size
+        result = {name: np.full(size, np.nan) for name in cls.INDICATORS}
+
+        if size < window:
+            return result
+
+        tail = slice(window - 1, None)
+        windows = np.lib.stride_tricks.sliding_window_view
+
+        volume = cls._rolling_sum(series['volume'], window)[tail]
+        traded = cls._rolling_sum(series['traded'], window)[tail]
+        with np.errstate(divide='ignore', invalid='ignore'):
+            result['vwap'][tail] = np.where(traded > 0, volume / traded, np.nan)
+
+        # NaN propagates, windows reaching before the first CXPC row stay empty
+        result['sma'][tail] = windows(close, window).mean(axis=1)
+        result['ema'] = cls._ema(close, window)
+        result['high'][tail] = windows(high, window).max(axis=1)
+        result['low'][tail] = windows(low, window).min(axis=1)
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            returns = np.diff(np.log(close), prepend=np.nan)
+        result['volatility'][tail] = windows(returns, window).std(axis=1, ddof=1)
+
+        return result
+
+    @classmethod
+    def indicators(cls, tickers: list[str], exchange_code: str, window: int, days: int, until: date) -> dict:
+        """
+        Indicators of the last `days` days up to `until` (inclusive), as columns per ticker.
+
+        Tickers without CXPC in the range are omitted. NaN values render as null.
+        """
+
+        last_epoch = cls.day_epoch(until)
+        first_epoch = last_epoch - (days - 1) * DAY_MS
+        # the first returned day needs `window` days of history, plus one for its return
+        loaded = cls.load(tickers, exchange_code, first_epoch - window * DAY_MS, last_epoch)
+
+        result = {}
+        for ticker, series in loaded.items():
+            values = cls.compute(series, window)
+            result[ticker] = {name: values[name][-days:].tolist() for name in cls.INDICATORS}
+
+        return {
+            'exchange_code': exchange_code,
+            'window': window,
+            'date_epoch': list(range(first_epoch, last_epoch + 1, DAY_MS)),
+            'tickers': result,
+        }
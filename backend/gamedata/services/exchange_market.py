@@ -0,0 +1,197 @@
+import decimal
+import time
+from datetime import timedelta
+
+import orjson
+import structlog
+from django.db import connection
+from django.db.models import Case, CharField, F, Q, Value, When
+from django.db.models.functions import Concat
+from django.utils import timezone
+from django_redis import get_redis_connection
+from redis.exceptions import WatchError
+from structlog.typing import FilteringBoundLogger
+
+from gamedata.models.game_exchange import GameExchange, GameExchangeAnalytics
+
+logger: FilteringBoundLogger = structlog.get_logger(__name__)
+
+
+class ExchangeMarketCache:
+    """
+    Current market per ticker_id: the latest `GameExchangeAnalytics` row merged with the
+    live quotes of `GameExchange`, kept in a single Redis hash.
+
+    Each hash field is a ticker_id, its value the orjson-encoded exchange list row, so the
+    exchange list is one HGETALL and a byte join.
+
+    The analytics job rewrites the rows of the tickers it recomputed (`rebuild`), webhook
+    driven quote changes only patch `QUOTE_FIELDS` of their rows (`update_quotes`).
+    """
+
+    KEY = 'cx:market'
+    REBUILD_LOCK_KEY = 'cx:market:rebuild'
+    REBUILD_LOCK_TTL = 30
+    REBUILD_WAIT_S = 5
+    UPDATE_ATTEMPTS = 5
+    # rows carry live quotes, so HTTP clients only keep the list briefly
+    MAX_AGE = 60
+
+    EXCHANGES = ['AI1', 'NC1', 'CI1', 'IC1', 'UNIVERSE']
+    LIVE_EXCHANGES = ['AI1', 'NC1', 'CI1', 'IC1']
+    QUOTE_FIELDS = ['ask', 'bid', 'supply', 'demand']
+    ANALYTICS_FIELDS = [
+        'ticker',
+        'exchange_code',
+        'date_epoch',
+        'calendar_date',
+        'traded_daily',
+        'vwap_daily',
+        'sum_traded_7d',
+        'avg_traded_7d',
+        'vwap_7d',
+        'sum_traded_30d',
+        'avg_traded_30d',
+        'vwap_30d',
+        'ticker_id',
+        'exchange_status',
+    ]
+    COLUMNS = ANALYTICS_FIELDS + QUOTE_FIELDS
+
+    @staticmethod
+    def _encode(row: dict) -> bytes:
+        return orjson.dumps(row, default=lambda obj: float(obj) if isinstance(obj, decimal.Decimal) else None)
+
+    @classmethod
+    def build_rows(cls, tickers: list[str] | None = None) -> dict[str, dict]:
+        """Exchange list rows of `tickers` (None = all) from the database, by ticker_id."""
+
+        two_days_ago = timezone.now().date() - timedelta(days=2)
+
+        qs = (
+            GameExchangeAnalytics.objects.filter(exchange_code__in=cls.EXCHANGES)
+            .annotate(
+                ticker_id=Concat(F('ticker'), Value('.'), F('exchange_code'), output_field=CharField()),
+                exchange_status=Case(
+                    When(calendar_date__lt=two_days_ago, then=Value('STALE')),
+                    When(Q(vwap_7d__gt=0) & Q(avg_traded_7d__gt=0), then=Value('ACTIVE')),
+                    default=Value('INACTIVE'),
+                    output_field=CharField(),
+                ),
+            )
+            .order_by('ticker', 'exchange_code', '-date_epoch')
+        )
+        live_qs = GameExchange.objects.filter(exchange_code__in=cls.LIVE_EXCHANGES)
+
+        if tickers is not None:
+            qs = qs.filter(ticker__in=tickers)
+            live_qs = live_qs.filter(ticker__in=tickers)
+
+        if connection.vendor == 'postgresql':
+            qs = qs.distinct('ticker', 'exchange_code')
+
+        live_map = {item['ticker_id']: item for item in live_qs.values('ticker_id', *cls.QUOTE_FIELDS)}
+
+        rows: dict[str, dict] = {}
+        for row in qs.values(*cls.ANALYTICS_FIELDS):
+            # latest date first, without DISTINCT ON the older rows are skipped here
+            if row['ticker_id'] in rows:
+                continue
+
+            live = live_map.get(row['ticker_id'], {})
+            for field in cls.QUOTE_FIELDS:
+                row[field] = live.get(field) or 0.0
+
+            rows[row['ticker_id']] = row
+
+        return rows
+
+    @classmethod
+    def rebuild(cls, tickers: list[str] | None = None) -> dict[str, bytes]:
+        """Rewrites the rows of `tickers`, None replaces the whole hash. Returns the encoded rows."""
+
+        encoded = {t_id: cls._encode(row) for t_id, row in cls.build_rows(tickers).items()}
+
+        r = get_redis_connection('default')
+        # MULTI, readers never see the hash emptied by a full rebuild
+        with r.pipeline(transaction=True) as pipe:
+            if tickers is None:
+                pipe.delete(cls.KEY)
+            if encoded:
+                pipe.hset(cls.KEY, mapping=encoded)
+            pipe.execute()
+
+        return encoded
+
+    @classmethod
+    def update_quotes(cls, objs: list[GameExchange]) -> int:
+        """
+        Patches the live quotes of rows already in the hash, returns the number of rows patched.
+
+        The read-modify-write runs under WATCH, a concurrent `rebuild` or patch makes it start
+        over on the new rows instead of being overwritten with the rows read before.
+        """
+
+        if not objs:
+            return 0
+
+        ticker_ids = [obj.ticker_id for obj in objs]
+
+        with get_redis_connection('default').pipeline(transaction=True) as pipe:
+            for _ in range(cls.UPDATE_ATTEMPTS):
+                try:
+                    pipe.watch(cls.KEY)
+                    values = pipe.hmget(cls.KEY, ticker_ids)
+
+                    patched = {}
+                    for obj, raw in zip(objs, values, strict=True):
+                        if raw is None:
+                            continue
+
+                        row = orjson.loads(raw)
+                        for field in cls.QUOTE_FIELDS:
+                            row[field] = getattr(obj, field) or 0.0
+                        patched[obj.ticker_id] = orjson.dumps(row)
+
+                    if not patched:
+                        pipe.reset()
+                        return 0
+
+                    pipe.multi()
+                    pipe.hset(cls.KEY, mapping=patched)
+                    pipe.execute()
+                    return len(patched)
+                except WatchError:
+                    continue
+
+        # the rows are rewritten with their quotes by the next rebuild
+        logger.warning('exchange_market_quotes_contended', tickers=len(ticker_ids))
+        return 0
+
+    @classmethod
+    def raw_rows(cls) -> list[bytes]:
+        """
+        Encoded rows ordered by ticker and exchange, rebuilt from the database if the hash is missing.
+
+        Only the request holding `REBUILD_LOCK_KEY` rebuilds, concurrent ones wait for its rows and
+        build them without writing only if it takes longer than `REBUILD_WAIT_S`.
+        """
+
+        r = get_redis_connection('default')
+        rows: dict = r.hgetall(cls.KEY)
+
+        if not rows:
+            if r.set(cls.REBUILD_LOCK_KEY, 1, nx=True, ex=cls.REBUILD_LOCK_TTL):
+                try:
+                    rows = cls.rebuild()
+                finally:
+                    r.delete(cls.REBUILD_LOCK_KEY)
+            else:
+                deadline = time.monotonic() + cls.REBUILD_WAIT_S
+                while not rows and time.monotonic() < deadline:
+                    time.sleep(0.05)
+                    rows = r.hgetall(cls.KEY)
+
+                rows = rows or {t_id: cls._encode(row) for t_id, row in cls.build_rows().items()}
+
+        return [value for _, value in sorted(rows.items())]
@@ -0,0 +1,60 @@
+import orjson
+from django_redis import get_redis_connection
+
+from gamedata.models.game_exchange import GameExchange
+
+ExchangeState = tuple[float | int | None, ...]
+
+
+class ExchangeStateCache:
+    """
+    Compact snapshot of the mutable `GameExchange` columns, kept in a single Redis hash.
+
+    Each hash field is a ticker_id, its value the orjson-encoded list of `FIELDS` in order.
+    Webhook handlers diff incoming data against it and only touch Postgres for tickers that
+    are missing from the snapshot or actually changed.
+
+    Writers bypassing the webhook path (e.g. `import_all_exchanges`) must call `invalidate`.
+    `TTL` bounds staleness from any writer that does not: it is set when the hash is created
+    and not extended by later writes, so the whole snapshot is dropped and rebuilt from
+    Postgres at least once per `TTL`.
+    """
+
+    KEY = 'cx:state'
+    TTL = 3600
+    FIELDS = ['mm_buy', 'mm_sell', 'price_average', 'ask', 'bid', 'ask_count', 'bid_count', 'supply', 'demand']
+
+    @classmethod
+    def from_instance(cls, obj: GameExchange) -> ExchangeState:
+        return tuple(getattr(obj, f) for f in cls.FIELDS)
+
+    @classmethod
+    def to_instance(cls, ticker_id: str, state: ExchangeState) -> GameExchange:
+        # unsaved instance carrying only what is needed for an update by primary key
+        return GameExchange(ticker_id=ticker_id, **dict(zip(cls.FIELDS, state, strict=True)))
+
+    @classmethod
+    def get_many(cls, ticker_ids: list[str]) -> dict[str, ExchangeState]:
+        if not ticker_ids:
+            return {}
+
+        r = get_redis_connection('default')
+        values = r.hmget(cls.KEY, ticker_ids)
+
+        return {t_id: tuple(orjson.loads(raw)) for t_id, raw in zip(ticker_ids, values, strict=True) if raw is not None}
+
+    @classmethod
+    def set_many(cls, states: dict[str, ExchangeState]) -> None:
+        if not states:
+            return
+
+        r = get_redis_connection('default')
+        with r.pipeline(transaction=False) as pipe:
+            pipe.hset(cls.KEY, mapping={t_id: orjson.dumps(state) for t_id, state in states.items()})
+            # NX: only a fresh hash gets the TTL, a steady stream of writes must not keep it alive
+            pipe.expire(cls.KEY, cls.TTL, nx=True)
+            pipe.execute()
+
+    @classmethod
+    def invalidate(cls) -> None:
+        get_redis_connection('default').delete(cls.KEY)
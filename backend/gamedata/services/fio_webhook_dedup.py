@@ -0,0 +1,103 @@
+from typing import Any
+
+import structlog
+from django_redis import get_redis_connection
+from structlog.typing import FilteringBoundLogger
+
+logger: FilteringBoundLogger = structlog.get_logger(__name__)
+
+
+class FIOWebhookDeduplicator:
+    """
+    Drops FIO webhook items that were already seen within `TTL` seconds.
+
+    Every item with a dedup key (see `BaseFIOWebhookHandler.dedup_key`) claims a short-lived
+    Redis key via `SET NX`; all claims of a batch go through a single pipeline. Items losing
+    the claim are redeliveries or overlaps and never reach a handler.
+
+    Claims only live for `CLAIM_TTL` while the batch is processed and are extended to `TTL`
+    by `confirm` once it succeeded. `CLAIM_TTL` stays below the stream re-claim idle time
+    (`FIOWebhookStream.CLAIM_IDLE_MS`), so a batch of a killed consumer is processed again
+    when re-claimed. Claims of a batch whose processing failed are released right away.
+
+    Per endpoint totals are counted in `STATS_KEY` and exposed through `stats`.
+    """
+
+    KEY_PREFIX = 'fio_webhook:dedup'
+    STATS_KEY = 'fio_webhook:dedup:stats'
+    TTL = 300
+    CLAIM_TTL = 30
+
+    @classmethod
+    def _key(cls, endpoint: str, dedup_key: str) -> str:
+        return f'{cls.KEY_PREFIX}:{endpoint}:{dedup_key}'
+
+    @classmethod
+    def claim(cls, endpoint: str, items: list[tuple[str | None, Any]]) -> tuple[list[Any], list[str]]:
+        """Returns the items seen for the first time and the Redis keys claimed for them."""
+
+        keyed = [(cls._key(endpoint, dedup_key), item) for dedup_key, item in items if dedup_key is not None]
+        fresh = [item for dedup_key, item in items if dedup_key is None]
+
+        if not keyed:
+            return fresh, []
+
+        r = get_redis_connection('default')
+        with r.pipeline(transaction=False) as pipe:
+            for key, _ in keyed:
+                pipe.set(key, 1, nx=True, ex=cls.CLAIM_TTL)
+            results = pipe.execute()
+
+        claimed = []
+        for (key, item), is_new in zip(keyed, results, strict=True):
+            if is_new:
+                fresh.append(item)
+                claimed.append(key)
+
+        duplicates = len(keyed) - len(claimed)
+
+        with r.pipeline(transaction=False) as pipe:
+            pipe.hincrby(cls.STATS_KEY, f'{endpoint}:received', len(items))
+            pipe.hincrby(cls.STATS_KEY, f'{endpoint}:duplicates', duplicates)
+            pipe.execute()
+
+        logger.info(
+            'fio_webhook_dedup',
+            endpoint=endpoint,
+            received=len(items),
+            duplicates=duplicates,
+            hit_rate=round(duplicates / len(items), 4),
+        )
+
+        return fresh, claimed
+
+    @classmethod
+    def confirm(cls, keys: list[str]) -> None:
+        """Keeps the claims of a successfully processed batch for the full `TTL`."""
+
+        if not keys:
+            return
+
+        with get_redis_connection('default').pipeline(transaction=False) as pipe:
+            for key in keys:
+                pipe.expire(key, cls.TTL)
+            pipe.execute()
+
+    @classmethod
+    def release(cls, keys: list[str]) -> None:
+        if keys:
+            get_redis_connection('default').delete(*keys)
+
+    @classmethod
+    def stats(cls) -> dict[str, dict[str, float]]:
+        raw: dict[bytes, bytes] = get_redis_connection('default').hgetall(cls.STATS_KEY)
+
+        stats: dict[str, dict[str, float]] = {}
+        for field, value in raw.items():
+            endpoint, _, counter = field.decode().rpartition(':')
+            stats.setdefault(endpoint, {'received': 0, 'duplicates': 0})[counter] = int(value)
+
+        for entry in stats.values():
+            entry['hit_rate'] = round(entry['duplicates'] / entry['received'], 4) if entry['received'] else 0.0
+
+        return stats
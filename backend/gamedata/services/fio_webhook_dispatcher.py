@@ -2,7 +2,15 @@ import structlog
 from structlog.typing import FilteringBoundLogger
 
 from gamedata.fio.schemas.fio_webhook import FIOWebhookRootSchema
-from gamedata.services.fio_webhook_handlers import BaseFIOWebhookHandler, FIOCXWebhookHandler
+from gamedata.services.fio_webhook_dedup import FIOWebhookDeduplicator
+from gamedata.services.fio_webhook_handlers import (
+    BaseFIOWebhookHandler,
+    FIOCXWebhookHandler,
+    FIOShipWebhookHandler,
+    FIOSitesWebhookHandler,
+    FIOStorageWebhookHandler,
+    FIOWarehouseWebhookHandler,
+)
 
 logger: FilteringBoundLogger = structlog.get_logger(__name__)
 
@@ -25,6 +33,19 @@ class FIOWebhookDispatcher:
         Handles Commodity Exchange (CX) updates. Performs ticker-based deduplication,
         database synchronization via bulk updates, and enriches data for downstream
         consumption in Redis Streams.
+    - '/storage', '/sites', '/sites/warehouses', '/ship/ships': FIOUserDataWebhookHandler subclasses
+        Patch the matching entries of the user's `GameFIOPlayerData` in place and invalidate
+        the storage cache only on change. Users covered by webhooks are polled rarely.
+
+    DEDUPLICATION:
+    Before any handler work, items are filtered through `FIOWebhookDeduplicator` using the
+    handler's `dedup_key` (CX: CXEntryId + Timestamp, user data: user + entry id + Timestamp).
+    Redelivered or overlapping items are dropped. Claims are kept once the handler succeeded;
+    if it fails, they are released so a retry is processed again.
+
+    BATCHING:
+    `dispatch_batch` merges the messages of several payloads per endpoint, so a handler
+    processes a whole stream batch with a single invocation (one SELECT, one bulk update).
 
     EXTENSION:
     To support new FIO endpoints, implement
@@ -33,15 +54,57 @@ class FIOWebhookDispatcher:
 
     _registry: dict[str, type[BaseFIOWebhookHandler]] = {
         '/cx': FIOCXWebhookHandler,
+        '/storage': FIOStorageWebhookHandler,
+        '/sites': FIOSitesWebhookHandler,
+        '/sites/warehouses': FIOWarehouseWebhookHandler,
+        '/ship/ships': FIOShipWebhookHandler,
     }
 
+    @classmethod
+    def _extract_items(cls, msg) -> list | None:
+        handler_class = cls._registry.get(msg.Endpoint)
+
+        if not handler_class:
+            logger.warning('unknown_fio_endpoint_received', endpoint=msg.Endpoint)
+            return None
+
+        return handler_class.extract_items(msg)
+
+    @classmethod
+    def _process(cls, endpoint: str, data: list):
+        handler_class = cls._registry[endpoint]
+
+        keyed_items = [(handler_class.dedup_key(item), item) for item in data]
+        fresh, claimed = FIOWebhookDeduplicator.claim(endpoint, keyed_items)
+
+        if not fresh:
+            return
+
+        try:
+            handler = handler_class()
+            handler.process(fresh)
+        except Exception:
+            FIOWebhookDeduplicator.release(claimed)
+            raise
+
+        FIOWebhookDeduplicator.confirm(claimed)
+
     @classmethod
     def dispatch(cls, validated_data: FIOWebhookRootSchema):
         for msg in validated_data.Data:
-            handler_class = cls._registry.get(msg.Endpoint)
+            items = cls._extract_items(msg)
+            if items is not None:
+                cls._process(msg.Endpoint, items)
+
+    @classmethod
+    def dispatch_batch(cls, payloads: list[FIOWebhookRootSchema]):
+        # keep delivery order inside each endpoint, so later updates win
+        data_by_endpoint: dict[str, list] = {}
+        for payload in payloads:
+            for msg in payload.Data:
+                items = cls._extract_items(msg)
+                if items is not None:
+                    data_by_endpoint.setdefault(msg.Endpoint, []).extend(items)
 
-            if handler_class:
-                handler = handler_class()
-                handler.process(msg.Data)
-            else:
-                logger.warning('unknown_fio_endpoint_received', endpoint=msg.Endpoint)
+        for endpoint, data in data_by_endpoint.items():
+            cls._process(endpoint, data)
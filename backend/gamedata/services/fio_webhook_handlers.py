@@ -1,13 +1,21 @@
 from abc import ABC, abstractmethod
+from datetime import datetime
+from typing import Any, NamedTuple
 
 import orjson
 import structlog
+from django.db import connection, transaction
 from django.utils import timezone
 from django_redis import get_redis_connection
+from pydantic import BaseModel
 from structlog.typing import FilteringBoundLogger
 
 from gamedata.fio.schemas.fio_webhook import FIOWebhookExchangeEndpointSchema
+from gamedata.gamedata_cache_manager import GamedataCacheManager
 from gamedata.models.game_exchange import GameExchange
+from gamedata.models.game_playerdata import GameFIOPlayerData
+from gamedata.services.exchange_market import ExchangeMarketCache
+from gamedata.services.exchange_state import ExchangeStateCache
 
 
 class BaseFIOWebhookHandler(ABC):
@@ -18,15 +26,33 @@ class BaseFIOWebhookHandler(ABC):
         """Each handler must implement its own processing logic"""
         pass
 
+    @classmethod
+    def extract_items(cls, msg: Any) -> list:
+        """Items of a webhook message handed to `process`, merged across messages of a batch"""
+        return list(msg.Data)
+
+    @classmethod
+    def dedup_key(cls, item) -> str | None:
+        """Identifies repeated deliveries of the same item, None disables deduplication"""
+        return None
+
 
 class FIOCXWebhookHandler(BaseFIOWebhookHandler):
     def __init__(self):
         self.log = structlog.get_logger().bind(handler='cx')
 
-    SYNC_FIELDS = ['mm_buy', 'mm_sell', 'price_average', 'ask', 'bid', 'ask_count', 'bid_count', 'supply', 'demand']
+    SYNC_FIELDS = ExchangeStateCache.FIELDS
     STREAM_ALLOWED_EXCHANGES = {'AI1', 'NC1', 'IC1', 'CI1'}
     STREAM_MAX_LEN = 500
 
+    # latest known stream payload per ticker_id, merged field by field (SSE snapshot-on-connect)
+    LATEST_KEY_PREFIX = 'cx:latest:'
+    LATEST_INDEX_KEY = 'cx:latest:index'
+
+    @classmethod
+    def dedup_key(cls, item: FIOWebhookExchangeEndpointSchema) -> str | None:
+        return f'{item.cx_entry_id}:{item.timestamp.isoformat()}'
+
     def process(self, data: list[FIOWebhookExchangeEndpointSchema]):
 
         updates_by_ticker = self._extract(data)
@@ -34,9 +60,20 @@ class FIOCXWebhookHandler(BaseFIOWebhookHandler):
         if not updates_by_ticker:
             return
 
-        # fetch & update logic
+        # fetch & update logic, the state snapshot spares the SELECT for known tickers
         ticker_ids = list(updates_by_ticker.keys())
-        existing_records = {obj.ticker_id: obj for obj in GameExchange.objects.filter(ticker_id__in=ticker_ids)}
+        existing_records = {
+            t_id: ExchangeStateCache.to_instance(t_id, state)
+            for t_id, state in ExchangeStateCache.get_many(ticker_ids).items()
+        }
+        state_hits = len(existing_records)
+
+        missing_ids = [t_id for t_id in ticker_ids if t_id not in existing_records]
+        loaded_ids = set()
+        if missing_ids:
+            for obj in GameExchange.objects.filter(ticker_id__in=missing_ids):
+                existing_records[obj.ticker_id] = obj
+                loaded_ids.add(obj.ticker_id)
 
         if not existing_records:
             self.log.info('no_existing_tickers_found', count=len(ticker_ids))
@@ -57,19 +94,37 @@ class FIOCXWebhookHandler(BaseFIOWebhookHandler):
 
         # persisting
         if to_update_db:
-            GameExchange.objects.bulk_update(to_update_db, fields=self.SYNC_FIELDS)
+            self._write_changes(to_update_db)
+
+        # refresh the snapshot only after the database write succeeded
+        ExchangeStateCache.set_many(
+            {obj.ticker_id: ExchangeStateCache.from_instance(obj) for obj in to_update_db}
+            | {t_id: ExchangeStateCache.from_instance(existing_records[t_id]) for t_id in loaded_ids}
+        )
+        market_patched = ExchangeMarketCache.update_quotes(to_update_db)
 
         if redis_payloads:
             self._push_to_redis(redis_payloads)
 
-        self.log.info('sync_complete', db_updated=len(to_update_db), stream_pushed=len(redis_payloads))
+        self.log.info(
+            'sync_complete',
+            received=len(data),
+            coalesced=len(updates_by_ticker),
+            state_hits=state_hits,
+            db_loaded=len(loaded_ids),
+            db_updated=len(to_update_db),
+            market_patched=market_patched,
+            stream_pushed=len(redis_payloads),
+        )
 
     def _extract(self, data: list[FIOWebhookExchangeEndpointSchema]) -> dict[str, FIOWebhookExchangeEndpointSchema]:
-
-        updates = {}
+        # coalesce per ticker_id, keeping only the latest state (by FIO timestamp, then delivery order)
+        updates: dict[str, FIOWebhookExchangeEndpointSchema] = {}
         for cx_info in data:
             t_id = f'{cx_info.material_ticker}.{cx_info.exchange_code}'
-            updates[t_id] = cx_info
+            current = updates.get(t_id)
+            if current is None or cx_info.timestamp >= current.timestamp:
+                updates[t_id] = cx_info
         return updates
 
     def _merge(self, db_obj: GameExchange, incoming: FIOWebhookExchangeEndpointSchema) -> bool:
@@ -82,10 +137,172 @@ class FIOCXWebhookHandler(BaseFIOWebhookHandler):
                 changed = True
         return changed
 
+    def _write_changes(self, objs: list[GameExchange]):
+        # bulk_update renders one CASE WHEN per field and row; on Postgres a single UPDATE ... FROM (VALUES ...) is
+        # far cheaper to plan and execute
+        if connection.vendor != 'postgresql':
+            GameExchange.objects.bulk_update(objs, fields=self.SYNC_FIELDS)
+            return
+
+        fields = [f for f in GameExchange._meta.concrete_fields if f.name in self.SYNC_FIELDS]
+        pk_type = GameExchange._meta.get_field('ticker_id').db_type(connection)
+
+        row_template = '(' + ', '.join([f'%s::{pk_type}', *[f'%s::{f.db_type(connection)}' for f in fields]]) + ')'
+        columns = ', '.join(['ticker_id', *[f.column for f in fields]])
+        assignments = ', '.join(f'{f.column} = v.{f.column}' for f in fields)
+
+        sql = (
+            f'UPDATE {GameExchange._meta.db_table} AS t SET {assignments} '
+            f'FROM (VALUES {", ".join([row_template] * len(objs))}) AS v({columns}) '
+            'WHERE t.ticker_id = v.ticker_id'
+        )
+        params = [value for obj in objs for value in (obj.ticker_id, *[getattr(obj, f.attname) for f in fields])]
+
+        with connection.cursor() as cursor:
+            cursor.execute(sql, params)
+
     def _push_to_redis(self, payloads: list[dict]):
 
+        ticker_ids = []
+
         r = get_redis_connection('default')
         with r.pipeline(transaction=False) as pipe:
             for p in payloads:
                 pipe.xadd('stream:cx', {'payload': orjson.dumps(p)}, maxlen=self.STREAM_MAX_LEN, approximate=True)
+
+                # payloads omit None values, so HSET keeps the last known value of those fields
+                t_id = f'{p["material_ticker"]}.{p["exchange_code"]}'
+                pipe.hset(f'{self.LATEST_KEY_PREFIX}{t_id}', mapping={k: orjson.dumps(v) for k, v in p.items()})
+                ticker_ids.append(t_id)
+
+            pipe.sadd(self.LATEST_INDEX_KEY, *ticker_ids)
             pipe.execute()
+
+
+class FIOUserWebhookItem(NamedTuple):
+    user_name: str
+    record: BaseModel
+
+
+class FIOUserDataWebhookHandler(BaseFIOWebhookHandler):
+    """
+    Patches the entries of one `GameFIOPlayerData` JSON list in place, matched by `ID_FIELD`.
+
+    Only users whose stored data actually changed are written and get their
+    `key_user_storage` cache invalidated. Every user seen gets the dataset's `WEBHOOK_FIELD`
+    bumped, once all polled datasets are covered they move to the slow polling safety net.
+
+    Webhooks only carry entries that exist, removals (a scrapped ship, a demolished site) are
+    not sent. Removed entries stay until the next poll replaces the whole list, which the
+    safety net still runs daily for webhook-covered users.
+    """
+
+    DATA_FIELD: str
+    ID_FIELD: str
+    WEBHOOK_FIELD: str
+
+    def __init__(self):
+        self.log = structlog.get_logger().bind(handler=self.DATA_FIELD)
+
+    @classmethod
+    def extract_items(cls, msg: Any) -> list[FIOUserWebhookItem]:
+        return [FIOUserWebhookItem(msg.UserName, record) for record in msg.Data]
+
+    @classmethod
+    def dedup_key(cls, item: FIOUserWebhookItem) -> str | None:
+        timestamp: datetime | None = getattr(item.record, 'Timestamp', None)
+        if timestamp is None:
+            return None
+        return f'{item.user_name}:{getattr(item.record, cls.ID_FIELD)}:{timestamp.isoformat()}'
+
+    def process(self, data: list[FIOUserWebhookItem]):
+
+        # latest record per user and entry id wins
+        records_by_user: dict[str, dict[str, dict]] = {}
+        for item in data:
+            entry_id = getattr(item.record, self.ID_FIELD)
+            records_by_user.setdefault(item.user_name, {})[entry_id] = item.record.model_dump(mode='json')
+
+        with transaction.atomic():
+            # locked until written, concurrent batches for a user would otherwise drop each other's entries
+            player_data = list(
+                GameFIOPlayerData.objects.select_related('user')
+                .select_for_update(of=('self',))
+                .filter(user__prun_username__in=list(records_by_user))
+                .only('uuid', 'user_id', 'user__prun_username', self.DATA_FIELD)
+                .order_by('pk')
+            )
+
+            if not player_data:
+                self.log.info('no_player_data_found', users=len(records_by_user))
+                return
+
+            changed = [obj for obj in player_data if self._patch(obj, records_by_user[obj.user.prun_username])]
+            changed_user_ids = [obj.user.id for obj in changed]
+
+            if changed:
+                GameFIOPlayerData.objects.bulk_update(changed, fields=[self.DATA_FIELD])
+
+            GameFIOPlayerData.objects.filter(pk__in=[obj.pk for obj in player_data]).update(
+                **{self.WEBHOOK_FIELD: timezone.now()}
+            )
+
+            def clear_cache():
+                for user_id in changed_user_ids:
+                    GamedataCacheManager.delete(GamedataCacheManager.key_user_storage(user_id))
+
+            transaction.on_commit(clear_cache)
+
+        self.log.info('sync_complete', received=len(data), users=len(player_data), users_changed=len(changed))
+
+    def _patch(self, obj: GameFIOPlayerData, incoming: dict[str, dict]) -> bool:
+        current = getattr(obj, self.DATA_FIELD)
+        # fresh rows default to an empty dict
+        entries: list[dict] = [*current] if isinstance(current, list) else []
+        index = {entry.get(self.ID_FIELD): i for i, entry in enumerate(entries)}
+
+        changed = False
+        for entry_id, record in incoming.items():
+            i = index.get(entry_id)
+
+            if i is None:
+                entries.append(record)
+                changed = True
+            elif entries[i] != record and not self._is_older(record, entries[i]):
+                entries[i] = record
+                changed = True
+
+        if changed:
+            setattr(obj, self.DATA_FIELD, entries)
+        return changed
+
+    @staticmethod
+    def _is_older(record: dict, stored: dict) -> bool:
+        # a delayed webhook must not overwrite a newer poll result
+        if not record.get('Timestamp') or not stored.get('Timestamp'):
+            return False
+        return datetime.fromisoformat(record['Timestamp']) < datetime.fromisoformat(stored['Timestamp'])
+
+
+class FIOStorageWebhookHandler(FIOUserDataWebhookHandler):
+    DATA_FIELD = 'storage_data'
+    ID_FIELD = 'StorageId'
+    WEBHOOK_FIELD = 'storage_webhook_at'
+
+
+class FIOSitesWebhookHandler(FIOUserDataWebhookHandler):
+    DATA_FIELD = 'site_data'
+    ID_FIELD = 'SiteId'
+    WEBHOOK_FIELD = 'site_webhook_at'
+
+
+class FIOWarehouseWebhookHandler(FIOUserDataWebhookHandler):
+    DATA_FIELD = 'warehouse_data'
+    ID_FIELD = 'WarehouseId'
+    WEBHOOK_FIELD = 'warehouse_webhook_at'
+
+
+class FIOShipWebhookHandler(FIOUserDataWebhookHandler):
+    DATA_FIELD = 'ship_data'
+    ID_FIELD = 'ShipId'
+    WEBHOOK_FIELD = 'ship_webhook_at'
@@ -0,0 +1,218 @@
+import time
+
+import structlog
+from django_redis import get_redis_connection
+from pydantic import ValidationError
+from redis.exceptions import ResponseError
+from structlog.typing import FilteringBoundLogger
+
+from gamedata.fio.schemas.fio_webhook import FIOWebhookRootSchema
+from gamedata.services.fio_webhook_dispatcher import FIOWebhookDispatcher
+
+logger: FilteringBoundLogger = structlog.get_logger(__name__)
+
+
+class FIOWebhookStream:
+    """
+    Redis Stream buffer between the webhook ingest and the webhook processing.
+
+    The ingest validates the raw request body once (`model_validate_json`) and appends the
+    untouched bytes to `STREAM_KEY`. Consumers of `GROUP` read batches, validate each entry
+    straight from bytes and hand them to `FIOWebhookDispatcher.dispatch_batch`.
+
+    Entries are only acknowledged after a successful dispatch. Entries of consumers that died
+    or failed mid-batch are re-claimed after `CLAIM_IDLE_MS` and retried one at a time, so a
+    failing entry does not hold back the others. Entries delivered more than `MAX_DELIVERIES`
+    times are moved to `DEAD_LETTER_KEY` and acknowledged.
+
+    MICRO-BATCHING:
+    After the first entry arrives, the consumer keeps reading for up to `COALESCE_WINDOW_MS`
+    (or until `BATCH_SIZE` entries) before flushing. Bursts for the same ticker then collapse
+    into one row update inside the handler.
+    """
+
+    STREAM_KEY = 'stream:fio_webhook'
+    GROUP = 'fio_webhook_workers'
+    DEAD_LETTER_KEY = 'stream:fio_webhook:dead'
+    MAX_LEN = 10000
+
+    BATCH_SIZE = 200
+    BLOCK_MS = 5000
+    CLAIM_IDLE_MS = 60000
+    COALESCE_WINDOW_MS = 250
+    MAX_DELIVERIES = 5
+
+    _group_ready = False
+
+    @classmethod
+    def append(cls, raw_payload: bytes) -> None:
+        r = get_redis_connection('default')
+        r.xadd(cls.STREAM_KEY, {'payload': raw_payload}, maxlen=cls.MAX_LEN, approximate=True)
+
+    @classmethod
+    def ensure_group(cls, r) -> None:
+        if cls._group_ready:
+            return
+
+        try:
+            r.xgroup_create(cls.STREAM_KEY, cls.GROUP, id='0', mkstream=True)
+        except ResponseError as err:
+            if 'BUSYGROUP' not in str(err):
+                raise
+
+        cls._group_ready = True
+
+    @staticmethod
+    def _entry_epoch_ms(entry_id: bytes | str) -> int:
+        raw = entry_id.decode() if isinstance(entry_id, bytes) else entry_id
+        return int(raw.split('-')[0])
+
+    @classmethod
+    def _collect_window(cls, r, consumer: str, entries: list, count: int, window_ms: int) -> list:
+        deadline = time.monotonic() + window_ms / 1000
+
+        while len(entries) < count:
+            remaining_ms = int((deadline - time.monotonic()) * 1000)
+            # block=0 would wait forever
+            if remaining_ms <= 0:
+                break
+
+            response = r.xreadgroup(
+                cls.GROUP, consumer, {cls.STREAM_KEY: '>'}, count=count - len(entries), block=remaining_ms
+            )
+            if not response:
+                break
+            entries.extend(response[0][1])
+
+        return entries
+
+    @classmethod
+    def _read(cls, r, consumer: str, count: int, block_ms: int, window_ms: int) -> tuple[list, bool]:
+        """Entries of the next batch and if they are re-claimed from crashed or failed consumers."""
+
+        # recover entries left pending by crashed consumers first
+        _, entries, *_ = r.xautoclaim(
+            cls.STREAM_KEY, cls.GROUP, consumer, min_idle_time=cls.CLAIM_IDLE_MS, start_id='0-0', count=count
+        )
+        if entries:
+            return list(entries), True
+
+        response = r.xreadgroup(cls.GROUP, consumer, {cls.STREAM_KEY: '>'}, count=count, block=block_ms)
+        entries = response[0][1] if response else []
+        if not entries:
+            return [], False
+
+        return cls._collect_window(r, consumer, list(entries), count, window_ms), False
+
+    @classmethod
+    def _dead_letter(cls, r, consumer: str, entries: list) -> list:
+        """Moves entries delivered more than `MAX_DELIVERIES` times to `DEAD_LETTER_KEY`, returns the others."""
+
+        # one lookup per claimed entry, a range over the group would also return entries pending elsewhere
+        with r.pipeline(transaction=False) as pipe:
+            for entry_id, _ in entries:
+                pipe.xpending_range(
+                    cls.STREAM_KEY, cls.GROUP, min=entry_id, max=entry_id, count=1, consumername=consumer
+                )
+            pending = [item for items in pipe.execute() for item in items]
+        deliveries = {item['message_id']: item['times_delivered'] for item in pending}
+
+        poisoned = [
+            (entry_id, fields) for entry_id, fields in entries if deliveries.get(entry_id, 0) > cls.MAX_DELIVERIES
+        ]
+        if not poisoned:
+            return entries
+
+        with r.pipeline(transaction=False) as pipe:
+            for entry_id, fields in poisoned:
+                pipe.xadd(
+                    cls.DEAD_LETTER_KEY,
+                    {
+                        'payload': (fields or {}).get(b'payload', b''),
+                        'entry_id': entry_id,
+                        'deliveries': deliveries[entry_id],
+                    },
+                    maxlen=cls.MAX_LEN,
+                    approximate=True,
+                )
+            pipe.xack(cls.STREAM_KEY, cls.GROUP, *[entry_id for entry_id, _ in poisoned])
+            pipe.execute()
+
+        logger.error('fio_webhook_stream_dead_lettered', entry_ids=[entry_id for entry_id, _ in poisoned])
+
+        dead = {entry_id for entry_id, _ in poisoned}
+        return [entry for entry in entries if entry[0] not in dead]
+
+    @classmethod
+    def _process(cls, r, entries: list, log: FilteringBoundLogger) -> int:
+        """Dispatches and acknowledges `entries`, returns the number of payloads dispatched."""
+
+        payloads: list[FIOWebhookRootSchema] = []
+        for entry_id, fields in entries:
+            # trimmed entries are returned without fields
+            if not fields:
+                continue
+            try:
+                payloads.append(FIOWebhookRootSchema.model_validate_json(fields[b'payload']))
+            except ValidationError as err:
+                log.error('fio_webhook_stream_invalid_entry', entry_id=entry_id, exc_info=err)
+
+        if payloads:
+            FIOWebhookDispatcher.dispatch_batch(payloads)
+
+        r.xack(cls.STREAM_KEY, cls.GROUP, *[entry_id for entry_id, _ in entries])
+        return len(payloads)
+
+    @classmethod
+    def consume(
+        cls,
+        consumer: str,
+        count: int = BATCH_SIZE,
+        block_ms: int = BLOCK_MS,
+        window_ms: int = COALESCE_WINDOW_MS,
+    ) -> int:
+        """Processes one coalesced batch of stream entries, returns the number of entries handled."""
+
+        r = get_redis_connection('default')
+        cls.ensure_group(r)
+
+        try:
+            entries, retried = cls._read(r, consumer, count, block_ms, window_ms)
+        except ResponseError as err:
+            # stream or group deleted meanwhile, create them again on the next call
+            if 'NOGROUP' not in str(err):
+                raise
+            cls._group_ready = False
+            logger.warning('fio_webhook_stream_group_missing', consumer=consumer)
+            return 0
+
+        if retried:
+            entries = cls._dead_letter(r, consumer, entries)
+
+        if not entries:
+            return 0
+
+        log = logger.bind(consumer=consumer, batch_size=len(entries))
+
+        if retried:
+            # one entry at a time, a failing entry does not hold back the others of its batch
+            dispatched = 0
+            for entry in entries:
+                try:
+                    dispatched += cls._process(r, [entry], log)
+                except Exception as exc:
+                    log.error('fio_webhook_stream_retry_failed', entry_id=entry[0], exc_info=exc)
+        else:
+            dispatched = cls._process(r, entries, log)
+
+        # flush latency: oldest entry in the batch until acknowledged
+        oldest_ms = min(cls._entry_epoch_ms(entry_id) for entry_id, _ in entries)
+        log.info(
+            'fio_webhook_stream_batch_processed',
+            flush_size=len(entries),
+            dispatched=dispatched,
+            retried=retried,
+            flush_latency_ms=max(0, int(time.time() * 1000) - oldest_ms),
+        )
+
+        return len(entries)
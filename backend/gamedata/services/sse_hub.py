@@ -0,0 +1,357 @@
+import asyncio
+import time
+import uuid
+from collections.abc import Awaitable
+from dataclasses import dataclass, field
+from functools import cached_property
+from typing import cast
+
+import orjson
+import structlog
+from django.conf import settings
+from redis import asyncio as aioredis
+from structlog.typing import FilteringBoundLogger
+
+from gamedata.services.fio_webhook_handlers import FIOCXWebhookHandler
+
+logger: FilteringBoundLogger = structlog.get_logger(__name__)
+
+
+def parse_stream_id(stream_id: str) -> tuple[int, int]:
+    ms, _, seq = stream_id.partition('-')
+    return int(ms), int(seq or 0)
+
+
+@dataclass(eq=False)
+class SSEMessage:
+    stream: str
+    id: str
+    payload: bytes
+
+    _projections: dict[tuple[str, ...], bytes] = field(default_factory=dict, repr=False)
+
+    # rendered once, shared by every connection receiving it
+    @cached_property
+    def frame(self) -> str:
+        return f'id: {self.id}\ndata: {self.payload.decode("utf-8")}\n\n'
+
+    # parsed lazily, only when a connection filters on it
+    @cached_property
+    def data(self) -> dict | None:
+        try:
+            data = orjson.loads(self.payload)
+        except orjson.JSONDecodeError:
+            return None
+        return data if isinstance(data, dict) else None
+
+    def project(self, fields: tuple[str, ...]) -> bytes:
+        """Payload reduced to `fields`, cached per field set across connections."""
+
+        if fields not in self._projections:
+            data = self.data or {}
+            self._projections[fields] = orjson.dumps({k: data[k] for k in fields if k in data})
+        return self._projections[fields]
+
+
+@dataclass(frozen=True)
+class SSEFilter:
+    """
+    Server-side subscription filter for exchange payloads (see `pubsub_dump`).
+
+    Empty sets match everything. Payloads without `material_ticker` (e.g. beats) always pass.
+    `fields` limits the payload to these keys plus `IDENTITY_FIELDS`.
+    """
+
+    IDENTITY_FIELDS = ('material_ticker', 'exchange_code', 'timestamp')
+
+    tickers: frozenset[str] = frozenset()
+    exchanges: frozenset[str] = frozenset()
+    fields: tuple[str, ...] = ()
+
+    def matches(self, message: SSEMessage) -> bool:
+        if not self.tickers and not self.exchanges:
+            return True
+
+        data = message.data
+        if data is None or 'material_ticker' not in data:
+            return True
+
+        if self.tickers and data['material_ticker'] not in self.tickers:
+            return False
+        return not self.exchanges or data.get('exchange_code') in self.exchanges
+
+    def payload(self, message: SSEMessage) -> bytes:
+        if not self.fields or message.data is None:
+            return message.payload
+        return message.project(self.IDENTITY_FIELDS + self.fields)
+
+
+@dataclass(eq=False)
+class SSESubscription:
+    streams: list[str]
+    queue: asyncio.Queue
+    # live messages queued at most, on top of the catch-up
+    capacity: int
+    filter: SSEFilter = field(default_factory=SSEFilter)
+    conn_id: str = field(default_factory=lambda: str(uuid.uuid4()))
+    last_ids: dict[str, tuple[int, int]] = field(default_factory=dict)
+
+    evicted: bool = False
+    # messages fanned out while the catch-up read is still running
+    pending: list[SSEMessage] | None = field(default_factory=list)
+
+    def offer(self, message: SSEMessage, replay: bool = False) -> bool:
+        """
+        Queues a message unless already delivered, returns False if the queue is full.
+        Replayed messages are always queued, `capacity` is raised by them afterwards.
+        """
+
+        if self.pending is not None:
+            self.pending.append(message)
+            return True
+
+        msg_id = parse_stream_id(message.id)
+        if msg_id <= self.last_ids.get(message.stream, (-1, -1)):
+            return True
+
+        if not self.filter.matches(message):
+            self.last_ids[message.stream] = msg_id
+            return True
+
+        if not replay and self.queue.qsize() >= self.capacity:
+            return False
+
+        self.queue.put_nowait(message)
+        self.last_ids[message.stream] = msg_id
+        return True
+
+    def frame(self, message: SSEMessage) -> str:
+        if not self.filter.fields:
+            return message.frame
+        return f'id: {message.id}\ndata: {self.filter.payload(message).decode("utf-8")}\n\n'
+
+    def batch_frame(self, messages: list[SSEMessage]) -> str:
+        """One `batch` event carrying a JSON array of payloads, identified by the last message."""
+
+        data = b'[' + b','.join(self.filter.payload(m) for m in messages) + b']'
+        return f'id: {messages[-1].id}\nevent: batch\ndata: {data.decode("utf-8")}\n\n'
+
+    def close(self) -> None:
+        # drop whatever is queued, the sentinel tells the consumer to end the response
+        while not self.queue.empty():
+            self.queue.get_nowait()
+        self.queue.put_nowait(None)
+
+
+class SSEHub:
+    """
+    Per-process fan-out of Redis streams to Server-Sent-Events connections.
+
+    A single reader task runs one batched `XREAD` over all streams with at least one
+    subscriber and hands each message to bounded per-connection queues. A connection whose
+    queue is full is evicted; the client reconnects with `Last-Event-ID` and catches up. The
+    catch-up itself is queued on top of the bound.
+
+    Connection accounting for `STATS_KEY` is flushed by one pipelined ZADD/ZREM every
+    `ACCOUNTING_INTERVAL_S` instead of one round trip per connection and keep-alive.
+
+    The hub is bound to the event loop it was first used on (one per ASGI worker).
+    """
+
+    STATS_KEY = 'stream:active_connections'
+    STATS_STALE_S = 30
+
+    READ_COUNT = 500
+    BLOCK_MS = 1000
+    QUEUE_SIZE = 256
+    REPLAY_LIMIT = 1000
+    ACCOUNTING_INTERVAL_S = 10
+
+    _instance: 'SSEHub | None' = None
+
+    def __init__(self, redis_url: str) -> None:
+        self.redis_url = redis_url
+        self.subscribers: dict[str, set[SSESubscription]] = {}
+        self.stream_ids: dict[str, str] = {}
+
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._redis: aioredis.Redis | None = None
+        self._tasks: list[asyncio.Task] = []
+        self._has_subscribers = asyncio.Event()
+
+        self._connected: set[str] = set()
+        self._disconnected: set[str] = set()
+
+    @classmethod
+    def instance(cls) -> 'SSEHub':
+        if cls._instance is None:
+            cls._instance = cls(settings.CACHES['default']['LOCATION'])
+        return cls._instance
+
+    def _client(self) -> aioredis.Redis:
+        loop = asyncio.get_running_loop()
+
+        if self._redis is None or self._loop is not loop:
+            # (re)bind to the running loop, e.g. after a worker restart in tests
+            self._loop = loop
+            self._redis = aioredis.from_url(self.redis_url)
+            self._has_subscribers = asyncio.Event()
+            self._tasks = [loop.create_task(self._read_loop()), loop.create_task(self._accounting_loop())]
+
+        return self._redis
+
+    async def subscribe(
+        self, streams: list[str], last_event_id: str | None, sse_filter: SSEFilter | None = None
+    ) -> SSESubscription:
+        redis = self._client()
+        sub = SSESubscription(
+            streams=streams, queue=asyncio.Queue(), capacity=self.QUEUE_SIZE, filter=sse_filter or SSEFilter()
+        )
+
+        for stream in streams:
+            if stream not in self.stream_ids:
+                # pin the read position now, '$' would skip entries between two XREAD calls
+                latest = await redis.xrevrange(stream, count=1)
+                self.stream_ids[stream] = latest[0][0].decode('utf-8') if latest else '0-0'
+            self.subscribers.setdefault(stream, set()).add(sub)
+
+        self._connected.add(sub.conn_id)
+        self._has_subscribers.set()
+
+        try:
+            catch_up = await self._catch_up(streams, last_event_id) if last_event_id is not None else []
+        except Exception:
+            self.unsubscribe(sub)
+            raise
+
+        # the catch-up (up to REPLAY_LIMIT per stream) is queued in full, evicting on it would send the
+        # client back with the same Last-Event-ID forever
+        pending, sub.pending = sub.pending or [], None
+        for message in [*catch_up, *pending]:
+            sub.offer(message, replay=True)
+        sub.capacity += sub.queue.qsize()
+
+        return sub
+
+    async def cx_snapshot(self, sse_filter: SSEFilter) -> list[dict]:
+        """Latest merged state per exchange ticker matching `sse_filter`, see `FIOCXWebhookHandler._push_to_redis`."""
+
+        redis = self._client()
+
+        if sse_filter.tickers and sse_filter.exchanges:
+            ticker_ids = [f'{t}.{e}' for t in sorted(sse_filter.tickers) for e in sorted(sse_filter.exchanges)]
+        else:
+            members = await cast(Awaitable[set[bytes]], redis.smembers(FIOCXWebhookHandler.LATEST_INDEX_KEY))
+            ticker_ids = sorted(m.decode('utf-8') for m in members)
+            ticker_ids = [
+                t_id
+                for t_id in ticker_ids
+                if (not sse_filter.tickers or t_id.partition('.')[0] in sse_filter.tickers)
+                and (not sse_filter.exchanges or t_id.partition('.')[2] in sse_filter.exchanges)
+            ]
+
+        if not ticker_ids:
+            return []
+
+        async with redis.pipeline(transaction=False) as pipe:
+            for t_id in ticker_ids:
+                pipe.hgetall(f'{FIOCXWebhookHandler.LATEST_KEY_PREFIX}{t_id}')
+            states = await pipe.execute()
+
+        keep = set(SSEFilter.IDENTITY_FIELDS + sse_filter.fields) if sse_filter.fields else None
+        return [
+            {k.decode('utf-8'): orjson.loads(v) for k, v in state.items() if keep is None or k.decode('utf-8') in keep}
+            for state in states
+            if state
+        ]
+
+    async def _catch_up(self, streams: list[str], last_event_id: str) -> list[SSEMessage]:
+        start = '-' if last_event_id in ('', '0') else f'({last_event_id}'
+
+        messages = []
+        for stream in streams:
+            entries = await self._client().xrange(stream, min=start, count=self.REPLAY_LIMIT)
+            messages.extend(self._to_messages(stream, entries))
+        return messages
+
+    def unsubscribe(self, sub: SSESubscription) -> None:
+        for stream in sub.streams:
+            subscribers = self.subscribers.get(stream)
+            if subscribers is None:
+                continue
+
+            subscribers.discard(sub)
+            if not subscribers:
+                del self.subscribers[stream]
+                self.stream_ids.pop(stream, None)
+
+        if not self.subscribers:
+            self._has_subscribers.clear()
+
+        self._connected.discard(sub.conn_id)
+        self._disconnected.add(sub.conn_id)
+
+    def _evict(self, sub: SSESubscription) -> None:
+        sub.evicted = True
+        self.unsubscribe(sub)
+        sub.close()
+        logger.warning('sse_slow_consumer_evicted', conn_id=sub.conn_id, streams=sub.streams)
+
+    @staticmethod
+    def _to_messages(stream: str, entries) -> list[SSEMessage]:
+        return [
+            SSEMessage(stream=stream, id=entry_id.decode('utf-8'), payload=fields[b'payload'])
+            for entry_id, fields in entries
+            if fields and b'payload' in fields
+        ]
+
+    def fan_out(self, stream: str, messages: list[SSEMessage]) -> None:
+        for sub in list(self.subscribers.get(stream, ())):
+            for message in messages:
+                if not sub.offer(message):
+                    self._evict(sub)
+                    break
+
+    async def _read_loop(self) -> None:
+        while True:
+            await self._has_subscribers.wait()
+
+            try:
+                response = await self._client().xread(dict(self.stream_ids), count=self.READ_COUNT, block=self.BLOCK_MS)
+            except asyncio.CancelledError:
+                raise
+            except Exception as exc:
+                logger.error('sse_hub_read_failed', exc_info=exc)
+                await asyncio.sleep(1)
+                continue
+
+            for stream_name, entries in response or []:
+                stream = stream_name.decode('utf-8')
+                # unsubscribed while reading
+                if stream not in self.stream_ids or not entries:
+                    continue
+
+                self.stream_ids[stream] = entries[-1][0].decode('utf-8')
+                self.fan_out(stream, self._to_messages(stream, entries))
+
+    async def _accounting_loop(self) -> None:
+        while True:
+            await asyncio.sleep(self.ACCOUNTING_INTERVAL_S)
+            try:
+                await self.flush_accounting()
+            except asyncio.CancelledError:
+                raise
+            except Exception as exc:
+                logger.error('sse_hub_accounting_failed', exc_info=exc)
+
+    async def flush_accounting(self) -> None:
+        now = time.time()
+        disconnected, self._disconnected = self._disconnected, set()
+
+        async with self._client().pipeline(transaction=False) as pipe:
+            if self._connected:
+                pipe.zadd(self.STATS_KEY, dict.fromkeys(self._connected, now))
+            if disconnected:
+                pipe.zrem(self.STATS_KEY, *disconnected)
+            pipe.zremrangebyscore(self.STATS_KEY, 0, now - self.STATS_STALE_S)
+            await pipe.execute()
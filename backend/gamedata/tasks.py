@@ -2,11 +2,10 @@ from datetime import timedelta
 
 import structlog
 from celery import chord, shared_task
-from django.db import connection, transaction
+from django.db import transaction
 from django.db.models import F, Q
 from django.utils import timezone
 
-from gamedata.fio.schemas import FIOWebhookRootSchema
 from gamedata.fio.services import get_fio_service
 from gamedata.gamedata_cache_manager import GamedataCacheManager
 
@@ -100,6 +99,11 @@ def gamedata_dispatch_fio_updates():
     inactive_cut = now - timedelta(hours=6)
     recent_login_threshold = now - timedelta(days=1)
 
+    # users receiving FIO webhooks for every polled dataset are only polled as a safety net
+    webhook_cut = now - timedelta(hours=6)
+    webhook_covered = Q(**{f'{field}__gte': webhook_cut for field in GameFIOPlayerData.WEBHOOK_FIELDS})
+    webhook_safety_cut = now - timedelta(hours=24)
+
     # User Base
     eligible_base = (
         GameFIOPlayerData.objects.select_related('user')
@@ -124,8 +128,14 @@ def gamedata_dispatch_fio_updates():
     # timing filters
     candidates = candidates.filter(
         Q(automation_last_refreshed_at__isnull=True)
-        | Q(user__last_login__gte=recent_login_threshold, automation_last_refreshed_at__lte=active_cut)
-        | Q(automation_last_refreshed_at__lte=inactive_cut)
+        | (
+            ~webhook_covered
+            & (
+                Q(user__last_login__gte=recent_login_threshold, automation_last_refreshed_at__lte=active_cut)
+                | Q(automation_last_refreshed_at__lte=inactive_cut)
+            )
+        )
+        | (webhook_covered & Q(automation_last_refreshed_at__lte=webhook_safety_cut))
     )
 
     candidates = candidates.order_by(F('automation_last_refreshed_at').asc(nulls_first=True))[:100]
@@ -241,8 +251,8 @@ def gamedata_trigger_refresh_cxpc(full: bool = False):
     # create material ticker + exchange code pairs
     header = [gamedata_refresh_cxpc.s(p.ticker, p.exchange_code, full=full) for p in exchanges_all]
 
-    # execute all tasks, then run the materialized view refresh
-    callback = refresh_exchange_analytics.si()
+    # execute all tasks, then recompute the analytics of their tickers once
+    callback = refresh_exchange_analytics.si(sorted({p.ticker for p in exchanges_all}))
 
     chord(header)(callback)
 
@@ -254,6 +264,7 @@ def gamedata_refresh_cxpc(ticker: str, exchange_code: str, full: bool = False):
     )
 
     from gamedata.models import GameExchangeCXPC
+    from gamedata.services.exchange_cxpc_storage import CXPCStorageService
 
     log = logger.bind(name='fetch_create_exchange_cxpc', ticker=ticker, exchange_code=exchange_code)
 
@@ -261,6 +272,9 @@ def gamedata_refresh_cxpc(ticker: str, exchange_code: str, full: bool = False):
         with get_fio_service() as fio:
             cxpc_data = fio.get_cxpc(ticker, exchange_code)
 
+        # days past retention are kept as weekly rollups only, don't bring the daily rows back
+        retention_cutoff = CXPCStorageService.retention_cutoff()
+
         objs = [
             (
                 GameExchangeCXPC(
@@ -276,7 +290,7 @@ def gamedata_refresh_cxpc(ticker: str, exchange_code: str, full: bool = False):
                 )
             )
             for item in cxpc_data
-            if item.interval == 'DAY_ONE'
+            if item.interval == 'DAY_ONE' and item.date_epoch >= retention_cutoff
         ]
 
         if not objs:
@@ -341,38 +355,35 @@ def gamedata_refresh_cxpc(ticker: str, exchange_code: str, full: bool = False):
 
 
 @shared_task(name='gamedata_refresh_exchange_analytics')
-def refresh_exchange_analytics():
+def refresh_exchange_analytics(tickers: list[str] | None = None):
     structlog.contextvars.bind_contextvars(
         task_category='gamedata_refresh_exchange_analytics',
     )
 
-    # update materialized view
-    with connection.cursor() as cursor:
-        cursor.execute('REFRESH MATERIALIZED VIEW CONCURRENTLY prunplanner_game_exchanges_analytics;')
+    from gamedata.services.exchange_analytics import ExchangeAnalyticsService
+
+    # tickers of a CXPC refresh chord are recomputed once, not per exchange, then the ones left from a past day
+    if tickers:
+        ExchangeAnalyticsService.refresh(tickers)
+    ExchangeAnalyticsService.refresh_stale()
 
-    GamedataCacheManager.delete(GamedataCacheManager.key_exchange_list(fmt='json'))
-    GamedataCacheManager.delete(GamedataCacheManager.key_exchange_list(fmt='csv'))
     GamedataCacheManager.delete_pattern('*cxpc*')
 
     return True
 
 
-@shared_task(name='gamedata_process_fio_webhook')
-def gamedata_process_fio_webhook(payload):
+@shared_task(name='gamedata_compact_cxpc')
+def gamedata_compact_cxpc():
     structlog.contextvars.bind_contextvars(
-        task_category='gamedata_process_fio_webhook',
+        task_category='gamedata_compact_cxpc',
     )
 
-    from gamedata.services.fio_webhook_dispatcher import FIOWebhookDispatcher
+    from gamedata.services.exchange_cxpc_storage import CXPCStorageService
 
-    log = logger.bind(name='gamedata_process_fio_webhook')
+    CXPCStorageService.ensure_partitions()
+    written = CXPCStorageService.compact()
 
-    try:
-        # validate data
-        validated_data = FIOWebhookRootSchema.model_validate(payload)
-
-        # hand-off to webhook dispatcher
-        FIOWebhookDispatcher.dispatch(validated_data)
+    if written:
+        GamedataCacheManager.delete_pattern('*cxpc*')
 
-    except Exception as exc:
-        log.error('exception', exc_info=exc)
+    return True
@@ -1,3 +1,5 @@
+from .changes import *
+from .patch import *
 from .cx import *
 from .empire import *
 from .plan import *
@@ -0,0 +1,28 @@
+from rest_framework import serializers
+
+from .cx import PlanningCXDetailSerializer
+from .empire import PlanningEmpireDetailSerializer
+from .plan import PlanningPlanDetailSerializer
+
+
+class PlanningChangesQuerySerializer(serializers.Serializer):
+    since = serializers.DateTimeField(help_text='`until` of the previous sync')
+
+
+class PlanningChangesDeletedSerializer(serializers.Serializer):
+    plans = serializers.ListField(child=serializers.UUIDField())
+    empires = serializers.ListField(child=serializers.UUIDField())
+    cxs = serializers.ListField(child=serializers.UUIDField())
+
+
+class PlanningChangesSerializer(serializers.Serializer):
+    since = serializers.DateTimeField()
+    until = serializers.DateTimeField(help_text='Server time of this sync, the `since` of the next one')
+    plans = PlanningPlanDetailSerializer(many=True)
+    empires = PlanningEmpireDetailSerializer(many=True)
+    cxs = PlanningCXDetailSerializer(many=True)
+    deleted = PlanningChangesDeletedSerializer()
+
+
+class PlanningChangesExpiredSerializer(serializers.Serializer):
+    error = serializers.CharField()
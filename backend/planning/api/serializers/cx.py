@@ -1,3 +1,4 @@
+from api.mixins import SparseFieldsetMixin
 from api.serializer import PydanticJSONField
 from django.db import transaction
 from planning.models import PlanningCX
@@ -7,7 +8,7 @@ from rest_framework import serializers
 from .empire import PlanningEmpireNestedSerializer
 
 
-class PlanningCXDetailSerializer(serializers.ModelSerializer):
+class PlanningCXDetailSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
     empires = PlanningEmpireNestedSerializer(source='cxs', many=True, read_only=True)
 
     cx_data = PydanticJSONField(pydantic_model=LATEST_SCHEMA['CX_DATA'])
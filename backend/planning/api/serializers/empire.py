@@ -1,3 +1,4 @@
+from api.mixins import SparseFieldsetMixin
 from django.db import transaction
 from planning.models import PlanningCOGCChoices, PlanningEmpire, PlanningFactionChoices
 from rest_framework import serializers
@@ -21,7 +22,7 @@ class PlanningEmpireListSerializer(serializers.ModelSerializer):
         fields = ['uuid', 'empire_name', 'empire_faction', 'empire_permits_used', 'empire_permits_total', 'cx']
 
 
-class PlanningEmpireDetailSerializer(serializers.ModelSerializer):
+class PlanningEmpireDetailSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
     plans = PlanningPlanMinimalSerializer(many=True, read_only=True)
     cx = PlanningCXMinimal(read_only=True)
 
@@ -100,3 +101,8 @@ class PlanningEmpireStateUpdateSerializer(serializers.Serializer):
 
     def create(self, validated_data):
         raise NotImplementedError('Use the main Empire serializer for creation.')
+
+
+# the sections of the empire state a client may patch, totals and plan details are server-computed
+class PlanningEmpireStatePatchSerializer(serializers.Serializer):
+    metadata = PlanningEmpireMetadataSerializer()
@@ -0,0 +1,22 @@
+from rest_framework import serializers
+
+
+class PlanningJSONPatchOperationSerializer(serializers.Serializer):
+    op = serializers.ChoiceField(choices=['add', 'remove', 'replace', 'move', 'copy', 'test'])
+    path = serializers.CharField(help_text='JSON pointer, e.g. `/buildings/0/amount`')
+    value = serializers.JSONField(required=False)
+
+    def get_fields(self):
+        fields = super().get_fields()
+        # `from` is a keyword, declared here
+        fields['from'] = serializers.CharField(required=False, help_text='Source pointer of move and copy')
+        return fields
+
+
+class PlanningJSONPatchResultSerializer(serializers.Serializer):
+    uuid = serializers.UUIDField()
+    modified_at = serializers.DateTimeField()
+
+
+class PlanningJSONPatchErrorSerializer(serializers.Serializer):
+    error = serializers.CharField()
@@ -1,5 +1,6 @@
 from typing import Any
 
+from api.mixins import SparseFieldsetMixin
 from api.serializer import PydanticJSONField
 from django.db import transaction
 from django.shortcuts import get_object_or_404
@@ -8,10 +9,11 @@ from gamedata.models import GamePlanetCOGCProgram
 from gamedata.models.game_planet import GamePlanetCOGCProgramChoices
 from planning.models import PlanningCOGCChoices, PlanningEmpire, PlanningEmpirePlan, PlanningPlan, PlanningShared
 from planning.schemas.latest_schemas import LATEST_SCHEMA
+from planning.services.plan_bulk_service import PlanBulkService
 from rest_framework import serializers
 
 from .cx import PlanningCXDetailSerializer
-from .empire import PlanningEmpireListSerializer
+from .empire import PlanningEmpireListSerializer, PlanningEmpireMaterialIOSerializer
 
 COGC_MAP: dict[GamePlanetCOGCProgramChoices, PlanningCOGCChoices] = {
     GamePlanetCOGCProgramChoices.Agriculture: PlanningCOGCChoices.AGRICULTURE,
@@ -31,7 +33,7 @@ COGC_MAP: dict[GamePlanetCOGCProgramChoices, PlanningCOGCChoices] = {
 }
 
 
-class PlanningPlanDetailSerializer(serializers.ModelSerializer):
+class PlanningPlanDetailSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
     empires = PlanningEmpireListSerializer(many=True, read_only=True)
     cx = PlanningCXDetailSerializer(read_only=True)
 
@@ -149,6 +151,51 @@ class PlanningPlanListSerializer(PlanningPlanDetailSerializer):
         ]
 
 
+class PlanningPlanWorkforceSerializer(serializers.Serializer):
+    required = serializers.FloatField()
+    capacity = serializers.FloatField()
+
+
+class PlanningPlanProductionSerializer(serializers.Serializer):
+    materials = serializers.DictField(
+        child=PlanningEmpireMaterialIOSerializer(), help_text='Map of material tickers to their daily P/C/D values'
+    )
+    workforce = serializers.DictField(
+        child=PlanningPlanWorkforceSerializer(), help_text='Workers required by buildings and housed, per tier'
+    )
+
+
+class PlanningPlanBulkOperationSerializer(serializers.Serializer):
+    op = serializers.ChoiceField(choices=['create', 'update', 'delete'])
+    uuid = serializers.UUIDField(required=False, help_text='Plan to update or delete')
+    data = serializers.DictField(required=False, help_text='Plan fields of a create or a full update')
+
+    def validate(self, attrs: dict[str, Any]) -> dict[str, Any]:
+        if attrs['op'] != 'create' and attrs.get('uuid') is None:
+            raise serializers.ValidationError({'uuid': 'Required for update and delete operations.'})
+        if attrs['op'] != 'delete' and attrs.get('data') is None:
+            raise serializers.ValidationError({'data': 'Required for create and update operations.'})
+        return attrs
+
+
+class PlanningPlanBulkSerializer(serializers.Serializer):
+    operations = PlanningPlanBulkOperationSerializer(
+        many=True, allow_empty=False, max_length=PlanBulkService.MAX_OPERATIONS
+    )
+
+
+class PlanningPlanBulkResultSerializer(serializers.Serializer):
+    index = serializers.IntegerField()
+    op = serializers.CharField()
+    uuid = serializers.UUIDField(allow_null=True)
+    status = serializers.ChoiceField(choices=['created', 'updated', 'deleted', 'failed'])
+    errors = serializers.DictField(required=False)
+
+
+class PlanningPlanBulkResponseSerializer(serializers.Serializer):
+    results = PlanningPlanBulkResultSerializer(many=True)
+
+
 class PlanningSharedSerializer(serializers.ModelSerializer):
     class Meta:
         model = PlanningShared
@@ -1,10 +1,11 @@
 from django.urls import path
 
-from .viewsets import CXViewSet, EmpireViewSet, PlanViewSet, SharedViewSet
+from .viewsets import ChangesViewSet, CXViewSet, EmpireViewSet, PlanViewSet, SharedViewSet
 
 app_name = 'planning'
 urlpatterns = [
     path('plan/', PlanViewSet.as_view({'get': 'list', 'post': 'create'}), name='plan'),
+    path('plan/bulk/', PlanViewSet.as_view({'post': 'bulk'}), name='plan-bulk'),
     path(
         'plan/<uuid:pk>/',
         PlanViewSet.as_view({'get': 'retrieve', 'put': 'update', 'delete': 'destroy'}),
@@ -15,6 +16,17 @@ urlpatterns = [
         PlanViewSet.as_view({'post': 'clone'}),
         name='plan-clone',
     ),
+    path(
+        'plan/<uuid:pk>/plan-data/',
+        # initkwargs of the action (parser_classes), as a router would pass them
+        PlanViewSet.as_view({'patch': 'patch_plan_data'}, **PlanViewSet.patch_plan_data.kwargs),
+        name='plan-data-patch',
+    ),
+    path(
+        'plan/<uuid:pk>/production/',
+        PlanViewSet.as_view({'get': 'production'}),
+        name='plan-production',
+    ),
     path('empire/', EmpireViewSet.as_view({'get': 'list', 'post': 'create'}), name='empire'),
     path('empire/junctions/', EmpireViewSet.as_view({'post': 'sync_junctions'}), name='empire-junctions'),
     path(
@@ -32,6 +44,11 @@ urlpatterns = [
         EmpireViewSet.as_view({'patch': 'sync_state'}),
         name='empire-sync-state',
     ),
+    path(
+        'empire/<uuid:pk>/state/patch/',
+        EmpireViewSet.as_view({'patch': 'patch_state'}, **EmpireViewSet.patch_state.kwargs),
+        name='empire-state-patch',
+    ),
     path('cx/', CXViewSet.as_view({'get': 'list', 'post': 'create'}), name='cx'),
     path('cx/junctions/', CXViewSet.as_view({'post': 'sync_junctions'}), name='cx-junctions'),
     path(
@@ -39,6 +56,7 @@ urlpatterns = [
         CXViewSet.as_view({'get': 'retrieve', 'put': 'update', 'delete': 'destroy'}),
         name='cx-detail',
     ),
+    path('changes/', ChangesViewSet.as_view({'get': 'list'}), name='changes'),
     path('shared/', SharedViewSet.as_view({'get': 'list', 'post': 'create'}), name='shared'),
     path('shared/<uuid:pk>/', SharedViewSet.as_view({'get': 'retrieve', 'delete': 'destroy'}), name='shared-detail'),
     path('shared/<uuid:pk>/clone/', SharedViewSet.as_view({'post': 'clone'}), name='shared-clone'),
@@ -1,3 +1,4 @@
+from .changes_viewset import *
 from .cx_viewset import *
 from .empire_viewset import *
 from .plan_viewset import *
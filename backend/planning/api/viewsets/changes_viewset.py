@@ -0,0 +1,40 @@
+from drf_spectacular.utils import extend_schema
+from planning.api.serializers import (
+    PlanningChangesExpiredSerializer,
+    PlanningChangesQuerySerializer,
+    PlanningChangesSerializer,
+)
+from planning.services.changes_service import PlanningChangesService
+from rest_framework import status, viewsets
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.response import Response
+
+
+@extend_schema(tags=['planning : changes'])
+class ChangesViewSet(viewsets.GenericViewSet):
+    permission_classes = [IsAuthenticated]
+    serializer_class = PlanningChangesSerializer
+
+    @extend_schema(
+        summary='Plans, empires and cxs changed or deleted since a timestamp',
+        description=(
+            'Delta sync for clients holding the planning lists: changed objects are returned in full, '
+            'deleted ones as uuids. Deletions are kept for a limited time, an older `since` responds '
+            'with 410 and requires a full sync of the lists.'
+        ),
+        parameters=[PlanningChangesQuerySerializer],
+        responses={200: PlanningChangesSerializer, 410: PlanningChangesExpiredSerializer},
+    )
+    def list(self, request, *args, **kwargs):
+        params = PlanningChangesQuerySerializer(data=request.query_params)
+        params.is_valid(raise_exception=True)
+        since = params.validated_data['since']
+
+        if PlanningChangesService.is_expired(since):
+            return Response(
+                {'error': f'Changes are kept for {PlanningChangesService.RETENTION_DAYS} days, full sync required.'},
+                status=status.HTTP_410_GONE,
+            )
+
+        changes = PlanningChangesService.changes(request.user, since)
+        return Response(self.get_serializer(changes).data)
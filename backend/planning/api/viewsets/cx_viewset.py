@@ -1,9 +1,15 @@
 from typing import cast
 from uuid import UUID
 
+from api.fieldsets import FIELDS_PARAMETER
+from api.mixins import SparseListMixin
+from api.pagination import CURSOR_PARAMETERS
+from api.parsers import PydanticJSONParser
+from core.services.cache_invalidation import CacheInvalidation
 from django.db import transaction
 from django.db.models import Case, Value, When
 from django.shortcuts import get_object_or_404
+from django.utils import timezone
 from drf_spectacular.utils import extend_schema
 from planning.api.serializers import (
     PlanningCXDetailSerializer,
@@ -14,6 +20,7 @@ from planning.models import PlanningCX, PlanningEmpire
 from planning.planning_cache_manager import PlanningCacheManager
 from rest_framework import mixins, status, viewsets
 from rest_framework.decorators import action
+from rest_framework.parsers import FormParser, MultiPartParser
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 from user.models import User
@@ -21,6 +28,7 @@ from user.models import User
 
 @extend_schema(tags=['planning : cx'])
 class CXViewSet(
+    SparseListMixin,
     mixins.ListModelMixin,
     mixins.RetrieveModelMixin,
     mixins.CreateModelMixin,
@@ -30,12 +38,22 @@ class CXViewSet(
 ):
     permission_classes = [IsAuthenticated]
     serializer_class = PlanningCXDetailSerializer
+    parser_classes = [PydanticJSONParser, FormParser, MultiPartParser]
+
+    cursor_ordering = ('cx_name', 'uuid')
+    value_fields = frozenset(['uuid', 'cx_name', 'cx_data'])
+    deferrable_fields = ('cx_data',)
+    field_prefetches = {'empires': 'cxs'}
 
     def get_queryset(self):
         return PlanningCX.objects.filter(user=self.request.user).prefetch_related('cxs').order_by('cx_name')
 
-    @extend_schema(summary='List all cx preferences')
+    @extend_schema(summary='List all cx preferences', parameters=[FIELDS_PARAMETER, *CURSOR_PARAMETERS])
     def list(self, request, *args, **kwargs) -> Response:
+        sparse = self.sparse_list(request)
+        if sparse is not None:
+            return sparse
+
         user_id = request.user.id
 
         def fetch_data():
@@ -101,15 +119,25 @@ class CXViewSet(
 
         # build the update conditions
         update_conditions = []
+        assigned = {}
         for item in payload:
             cx_uuid = item['cx_uuid']
             for emp in item['empires']:
                 update_conditions.append(When(uuid=emp['empire_uuid'], then=Value(cx_uuid)))
+                assigned[emp['empire_uuid']] = cx_uuid
+
+        # only empires whose cx changes are written, they and their old and new cx count as modified
+        current = dict(PlanningEmpire.objects.filter(user=user).values_list('uuid', 'cx_id'))
+        changed = [e_uuid for e_uuid, cx_id in current.items() if assigned.get(e_uuid) != cx_id]
+        touched_cxs = {current[e_uuid] for e_uuid in changed} | {assigned.get(e_uuid) for e_uuid in changed}
 
         # apply changes
         with transaction.atomic():
-            PlanningEmpire.objects.filter(user=user).update(cx_id=Case(*update_conditions, default=None))
-
-        PlanningCacheManager.delete_pattern(f'*PLANNING:{user.id}:*')
+            now = timezone.now()
+            PlanningEmpire.objects.filter(user=user, uuid__in=changed).update(
+                cx_id=Case(*update_conditions, default=None), modified_at=now
+            )
+            PlanningCX.objects.filter(user=user, uuid__in=touched_cxs - {None}).update(modified_at=now)
+            CacheInvalidation.delete_pattern(f'*PLANNING:{user.id}:*')
 
         return self.list(request)
@@ -1,28 +1,46 @@
+from functools import partial
 from typing import cast
 from uuid import UUID
 
+from api.fieldsets import FIELDS_PARAMETER
+from api.mixins import SparseListMixin
+from api.pagination import CURSOR_PARAMETERS
+from api.parsers import JSONPatchParser
+from core.services.cache_invalidation import CacheInvalidation
 from django.db import transaction
+from django.http import Http404, HttpResponse
 from django.shortcuts import get_object_or_404
+from django.utils import timezone
 from drf_spectacular.utils import extend_schema
 from planning.api.serializers import (
     PlanningEmpireDetailSerializer,
     PlanningEmpireJunctionsSerializer,
     PlanningEmpirePlanSyncErrorSerializer,
+    PlanningJSONPatchErrorSerializer,
+    PlanningJSONPatchOperationSerializer,
+    PlanningJSONPatchResultSerializer,
     PlanningPlanListSerializer,
 )
-from planning.api.serializers.empire import PlanningEmpireStateUpdateSerializer
+from planning.api.serializers.empire import PlanningEmpireStatePatchSerializer
 from planning.models import PlanningEmpire, PlanningEmpirePlan, PlanningPlan
 from planning.planning_cache_manager import PlanningCacheManager
+from planning.services.empire_document_service import EmpireDocumentService
 from planning.services.empire_state_service import EmpireStateService
+from planning.services.json_patch_service import JSONPatchError, JSONPatchService, JSONPatchTestFailed, PatchSchema
+from planning.tasks import planning_attach_empire_plan
 from rest_framework import mixins, status, viewsets
 from rest_framework.decorators import action
+from rest_framework.parsers import JSONParser
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 from user.models import User
 
+EMPIRE_STATE_PATCH_SCHEMA = PatchSchema.from_serializer(PlanningEmpireStatePatchSerializer())
+
 
 @extend_schema(tags=['planning : empire'])
 class EmpireViewSet(
+    SparseListMixin,
     mixins.ListModelMixin,
     mixins.RetrieveModelMixin,
     mixins.CreateModelMixin,
@@ -33,6 +51,13 @@ class EmpireViewSet(
     permission_classes = [IsAuthenticated]
     serializer_class = PlanningEmpireDetailSerializer
 
+    cursor_ordering = ('empire_name', 'uuid')
+    value_fields = frozenset(
+        ['uuid', 'empire_name', 'empire_faction', 'empire_permits_used', 'empire_permits_total', 'needs_state_sync']
+    )
+    deferrable_fields = ('empire_state',)
+    field_prefetches = {'plans': 'plans', 'cx': 'cx'}
+
     def get_queryset(self):
         return (
             PlanningEmpire.objects.filter(user=self.request.user)
@@ -40,34 +65,27 @@ class EmpireViewSet(
             .order_by('empire_name')
         )
 
-    def get_serializer_class(self):
-        if self.action == 'sync_state':
-            return PlanningEmpireStateUpdateSerializer
-        return super().get_serializer_class()
-
-    @extend_schema(summary='List all users empires')
-    def list(self, request, *args, **kwargs) -> Response:
-        user_id = request.user.id
-
-        def fetch_data():
-            empires = self.get_queryset()
-            return self.get_serializer(empires, many=True).data
+    @extend_schema(summary='List all users empires', parameters=[FIELDS_PARAMETER, *CURSOR_PARAMETERS])
+    def list(self, request, *args, **kwargs) -> HttpResponse:
+        sparse = self.sparse_list(request)
+        if sparse is not None:
+            return sparse
 
-        return PlanningCacheManager.get_empire_list_response(user_id=user_id, func=fetch_data)
+        return self._document_response(EmpireDocumentService.empire_list(request.user.id))
 
     @extend_schema(summary='Get a users specific empire')
-    def retrieve(self, request, *args, **kwargs) -> Response:
+    def retrieve(self, request, *args, **kwargs) -> HttpResponse:
         pk: UUID = cast(UUID, kwargs.get('pk'))
-        user_id = request.user.id
 
-        def fetch_data():
-            return self.get_serializer(get_object_or_404(self.get_queryset(), pk=pk)).data
+        document = EmpireDocumentService.empire(request.user.id, pk)
+        if document is None:
+            raise Http404
 
-        return PlanningCacheManager.get_empire_retrieve_response(
-            user_id=user_id,
-            empire_id=pk,
-            func=fetch_data,
-        )
+        return self._document_response(document)
+
+    @staticmethod
+    def _document_response(data: bytes) -> HttpResponse:
+        return HttpResponse(data, content_type='application/json')
 
     @extend_schema(summary='Get all plans of the users specific empire')
     def retrieve_plans(self, request, *args, **kwargs) -> Response:
@@ -159,31 +177,73 @@ class EmpireViewSet(
                     [PlanningEmpirePlan(user=user, empire_id=e_id, plan_id=p_id) for e_id, p_id in to_create_pairs]
                 )
 
-        if to_delete_uuids or to_create_pairs:
-            PlanningCacheManager.delete_pattern(f'*PLANNING:{user.id}:*')
+                # bulk_create sends no post_save, mark the linked objects as modified and add the
+                # new plans to their empire states here
+                now = timezone.now()
+                PlanningEmpire.objects.filter(uuid__in={e_id for e_id, _ in to_create_pairs}).update(modified_at=now)
+                PlanningPlan.objects.filter(uuid__in={p_id for _, p_id in to_create_pairs}).update(modified_at=now)
+                for e_id, p_id in to_create_pairs:
+                    transaction.on_commit(partial(planning_attach_empire_plan.delay, str(e_id), str(p_id)))
+
+            # purged once at commit, together with what the junction signals collected
+            if to_delete_uuids or to_create_pairs:
+                CacheInvalidation.delete_pattern(f'*PLANNING:{user.id}:*')
 
         return self.list(request)
 
     @extend_schema(
         summary='Sync empire state (empire material i/o, plan material i/o and metadata)',
-        request=PlanningEmpireStateUpdateSerializer,
+        description=(
+            'Rebuilds the empire state from the server-side material i/o of its plans and returns it. '
+            'A request body is ignored, the state is never taken from the client.'
+        ),
+        request=None,
         responses={200: PlanningEmpireDetailSerializer},
     )
     @action(detail=True, methods=['patch'], url_path='empire-sync-state')
     def sync_state(self, request, pk=None):
 
-        instance = self.get_object()
-        serializer = self.get_serializer(instance, data=request.data)
-        serializer.is_valid(raise_exception=True)
-
-        # handle empire + relational snapshot refresh
-        EmpireStateService.update_state(instance, serializer.validated_data)
+        instance = EmpireStateService.sync_state(self.get_object().uuid)
 
         # clear caches
-        PlanningCacheManager.delete_pattern(f'*PLANNING:{request.user.id}:*')
+        CacheInvalidation.delete_pattern(f'*PLANNING:{request.user.id}:*')
 
         return Response(PlanningEmpireDetailSerializer(instance).data)
 
+    @extend_schema(
+        summary='Patch an empires state',
+        description=(
+            'RFC 6902 JSON Patch of the empire state `metadata`, e.g. `/metadata/permits_used`. '
+            '`empire_total` and `plan_details` are computed server-side, patching them responds with 400. '
+            'Only the edited entries are validated. A failed `test` operation responds with 409.'
+        ),
+        request=PlanningJSONPatchOperationSerializer(many=True),
+        responses={
+            200: PlanningJSONPatchResultSerializer,
+            400: PlanningJSONPatchErrorSerializer,
+            409: PlanningJSONPatchErrorSerializer,
+        },
+    )
+    @action(detail=True, methods=['patch'], parser_classes=[JSONPatchParser, JSONParser])
+    def patch_state(self, request, pk=None):
+        empire = self.get_object()
+
+        try:
+            empire = JSONPatchService.patch_field(
+                PlanningEmpire.objects.filter(user=request.user),
+                empire.pk,
+                'empire_state',
+                request.data,
+                EMPIRE_STATE_PATCH_SCHEMA,
+                needs_state_sync=True,
+            )
+        except JSONPatchTestFailed as exc:
+            return Response({'error': str(exc)}, status=status.HTTP_409_CONFLICT)
+        except JSONPatchError as exc:
+            return Response({'error': str(exc)}, status=status.HTTP_400_BAD_REQUEST)
+
+        return Response(PlanningJSONPatchResultSerializer(empire).data)
+
     def perform_update(self, serializer):
         serializer.save()
 
@@ -1,20 +1,39 @@
-from typing import Any
+from typing import Any, cast
 
+from api.fieldsets import FIELDS_PARAMETER
+from api.mixins import SparseListMixin
+from api.pagination import CURSOR_PARAMETERS
+from api.parsers import JSONPatchParser, PydanticJSONParser
 from django.shortcuts import get_object_or_404
 from drf_spectacular.utils import extend_schema
 from planning.api.serializers import (
+    PlanningJSONPatchErrorSerializer,
+    PlanningJSONPatchOperationSerializer,
+    PlanningJSONPatchResultSerializer,
+    PlanningPlanBulkResponseSerializer,
+    PlanningPlanBulkSerializer,
     PlanningPlanDetailSerializer,
+    PlanningPlanProductionSerializer,
 )
-from planning.models import PlanningPlan
+from planning.models import PlanningEmpire, PlanningPlan
 from planning.planning_cache_manager import PlanningCacheManager
+from planning.schemas.latest_schemas import LATEST_SCHEMA
+from planning.services.json_patch_service import JSONPatchError, JSONPatchService, JSONPatchTestFailed, PatchSchema
+from planning.services.plan_bulk_service import PlanBulkOperations, PlanBulkService
+from planning.services.plan_production_service import PlanProductionService
 from rest_framework import mixins, status, viewsets
 from rest_framework.decorators import action
+from rest_framework.parsers import FormParser, JSONParser, MultiPartParser
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
+from user.models import User
+
+PLAN_DATA_PATCH_SCHEMA = PatchSchema.from_pydantic(LATEST_SCHEMA['PLANNING_DATA'])
 
 
 @extend_schema(tags=['planning : plans'])
 class PlanViewSet(
+    SparseListMixin,
     mixins.ListModelMixin,
     mixins.RetrieveModelMixin,
     mixins.CreateModelMixin,
@@ -24,12 +43,24 @@ class PlanViewSet(
 ):
     permission_classes = [IsAuthenticated]
     serializer_class = PlanningPlanDetailSerializer
+    parser_classes = [PydanticJSONParser, FormParser, MultiPartParser]
+
+    cursor_ordering = ('plan_name', 'uuid')
+    value_fields = frozenset(
+        ['uuid', 'plan_name', 'planet_natural_id', 'plan_permits_used', 'plan_cogc', 'plan_corphq', 'plan_data']
+    )
+    deferrable_fields = ('plan_data', 'material_io')
+    field_prefetches = {'empires': 'empires'}
 
     def get_queryset(self):
         return PlanningPlan.objects.filter(user=self.request.user).prefetch_related('empires').order_by('plan_name')
 
-    @extend_schema(summary='List all users plans')
+    @extend_schema(summary='List all users plans', parameters=[FIELDS_PARAMETER, *CURSOR_PARAMETERS])
     def list(self, request, *args, **kwargs):
+        sparse = self.sparse_list(request)
+        if sparse is not None:
+            return sparse
+
         user_id = request.user.id
 
         def fetch_data() -> list[dict[str, Any]]:
@@ -82,9 +113,147 @@ class PlanViewSet(
         serializer = self.get_serializer(new_plan)
         return Response(serializer.data, status=status.HTTP_201_CREATED)
 
+    @extend_schema(
+        summary='Compute a plans daily production',
+        description='Material production and consumption, workforce and housing computed from the stored plan data.',
+        responses={200: PlanningPlanProductionSerializer},
+    )
+    @action(detail=True, methods=['get'])
+    def production(self, request, *args, **kwargs):
+        lookup_url_kwarg = self.lookup_url_kwarg or self.lookup_field
+        pk = self.kwargs.get(lookup_url_kwarg)
+        user_id = request.user.id
+
+        def fetch_data() -> dict[str, Any]:
+            return PlanProductionService.evaluate_plan(get_object_or_404(self.get_queryset(), pk=pk))
+
+        return PlanningCacheManager.get_plan_production_response(user_id=user_id, plan_id=pk, func=fetch_data)
+
+    @extend_schema(
+        summary='Create, update and delete many plans at once',
+        description=(
+            'Applies all valid operations in one transaction, invalid ones are skipped and reported with '
+            'their errors. Updates replace all plan fields like PUT does.'
+        ),
+        request=PlanningPlanBulkSerializer,
+        responses={200: PlanningPlanBulkResponseSerializer},
+    )
+    @action(detail=False, methods=['post'])
+    def bulk(self, request):
+        serializer = PlanningPlanBulkSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+
+        results, operations, create_results = _validate_bulk(
+            request.user, serializer.validated_data['operations'], self.get_serializer_context()
+        )
+
+        created, _deleted = PlanBulkService.apply(request.user, operations)
+
+        for result, plan in zip(create_results, created, strict=True):
+            result['uuid'] = plan.uuid
+
+        return Response(PlanningPlanBulkResponseSerializer({'results': results}).data)
+
+    @extend_schema(
+        summary='Patch a plans plan_data',
+        description=(
+            'RFC 6902 JSON Patch of `plan_data`. Only the edited buildings, experts, workforce or '
+            'infrastructure entries are validated. A failed `test` operation responds with 409.'
+        ),
+        request=PlanningJSONPatchOperationSerializer(many=True),
+        responses={
+            200: PlanningJSONPatchResultSerializer,
+            400: PlanningJSONPatchErrorSerializer,
+            409: PlanningJSONPatchErrorSerializer,
+        },
+    )
+    @action(detail=True, methods=['patch'], parser_classes=[JSONPatchParser, JSONParser])
+    def patch_plan_data(self, request, *args, **kwargs):
+        plan = self.get_object()
+
+        try:
+            plan = JSONPatchService.patch_field(
+                PlanningPlan.objects.filter(user=request.user),
+                plan.pk,
+                'plan_data',
+                request.data,
+                PLAN_DATA_PATCH_SCHEMA,
+            )
+        except JSONPatchTestFailed as exc:
+            return Response({'error': str(exc)}, status=status.HTTP_409_CONFLICT)
+        except JSONPatchError as exc:
+            return Response({'error': str(exc)}, status=status.HTTP_400_BAD_REQUEST)
+
+        return Response(PlanningJSONPatchResultSerializer(plan).data)
+
     # will also lead to the signals
     def perform_create(self, serializer):
         serializer.save()
 
     def perform_update(self, serializer):
         serializer.save()
+
+
+def _validate_bulk(
+    user: User, items: list[dict], context: dict[str, Any]
+) -> tuple[list[dict], PlanBulkOperations, list[dict]]:
+    """Per item results, the valid operations and the results of the creates, which get their uuid once applied."""
+
+    owned = PlanningPlan.objects.filter(
+        user=user, uuid__in=[item['uuid'] for item in items if item['op'] != 'create']
+    ).in_bulk()
+
+    results: list[dict] = []
+    operations = PlanBulkOperations()
+    creates: list[tuple[dict, dict]] = []
+    seen = set()
+
+    for index, item in enumerate(items):
+        result = {'index': index, 'op': item['op'], 'uuid': item.get('uuid'), 'status': 'failed'}
+        results.append(result)
+
+        plan = None
+        if item['op'] != 'create':
+            plan = owned.get(item['uuid'])
+            if plan is None or item['uuid'] in seen:
+                result['errors'] = {'uuid': ['Plan not found or referenced more than once.']}
+                continue
+            seen.add(item['uuid'])
+
+        if item['op'] == 'delete':
+            operations.deletes.append(item['uuid'])
+            result['status'] = 'deleted'
+            continue
+
+        detail = PlanningPlanDetailSerializer(plan, data=item['data'], context=context)
+        if not detail.is_valid():
+            result['errors'] = detail.errors
+            continue
+
+        values = dict(cast(dict, detail.validated_data))
+        if plan is None:
+            creates.append((result, values))
+            continue
+
+        # no junction change on update
+        values.pop('empire_uuid', None)
+        for attr, value in values.items():
+            setattr(plan, attr, value)
+        operations.updates.append(plan)
+        result['status'] = 'updated'
+
+    owned_empires = set(
+        PlanningEmpire.objects.filter(
+            user=user, uuid__in=[values['empire_uuid'] for _, values in creates if values.get('empire_uuid')]
+        ).values_list('uuid', flat=True)
+    )
+    create_results = []
+    for result, values in creates:
+        if values.get('empire_uuid') and values['empire_uuid'] not in owned_empires:
+            result['errors'] = {'empire_uuid': ['Empire not found.']}
+            continue
+        result['status'] = 'created'
+        create_results.append(result)
+        operations.creates.append(values)
+
+    return results, operations, create_results
@@ -1,5 +1,9 @@
+import decimal
+
+import orjson
 from django.db import transaction
-from django.db.models import F
+from django.http import HttpResponse
+from django.utils.cache import get_conditional_response, patch_cache_control
 from drf_spectacular.utils import extend_schema
 from planning.api.serializers import (
     PlanningPlanDetailSerializer,
@@ -8,6 +12,8 @@ from planning.api.serializers import (
     PlanningSharedSerializer,
 )
 from planning.models import PlanningPlan, PlanningShared
+from planning.planning_cache_manager import PlanningCacheManager
+from planning.services.shared_view_service import SharedViewService
 from rest_framework import mixins, status, viewsets
 from rest_framework.decorators import action
 from rest_framework.permissions import AllowAny, IsAuthenticated
@@ -27,8 +33,13 @@ class SharedViewSet(
     lookup_field = 'uuid'
     lookup_url_kwarg = 'pk'
 
+    # shares change with their plan, so HTTP caches revalidate shortly
+    SHARED_MAX_AGE = 60
+
     def get_queryset(self):
-        if self.action in ['retrieve', 'clone']:
+        if self.action == 'retrieve':
+            return PlanningShared.objects.select_related('plan').prefetch_related('plan__empires')
+        if self.action == 'clone':
             return PlanningShared.objects.all()
 
         user = self.request.user
@@ -57,16 +68,28 @@ class SharedViewSet(
     def destroy(self, request, *args, **kwargs):
         return super().destroy(request, *args, **kwargs)
 
-    @extend_schema(auth=[], summary='Get a shared plans information')
+    @extend_schema(auth=[], summary='Get a shared plans information', responses=PlanningSharedDetailSerializer)
     def retrieve(self, request, *args, **kwargs):
-        instance = self.get_object()
-
-        PlanningShared.objects.filter(pk=instance.pk).update(view_count=F('view_count') + 1)
+        shared_uuid = kwargs['pk']
+        cached = PlanningCacheManager.get_shared_retrieve(shared_uuid)
+
+        if cached is None:
+            instance = self.get_object()
+            data = orjson.dumps(
+                self.get_serializer(instance).data,
+                default=lambda obj: float(obj) if isinstance(obj, decimal.Decimal) else None,
+            )
+            cached = PlanningCacheManager.set_shared_retrieve(instance.user_id, shared_uuid, data)
 
-        instance.refresh_from_db()
+        # counted in redis, written to the share by the planning_flush_shared_views task
+        SharedViewService.increment(shared_uuid)
 
-        serializer = self.get_serializer(instance)
-        return Response(serializer.data)
+        response = get_conditional_response(request, etag=cached['etag']) or HttpResponse(
+            cached['data'], content_type='application/json'
+        )
+        response['ETag'] = cached['etag']
+        patch_cache_control(response, public=True, max_age=self.SHARED_MAX_AGE)
+        return response
 
     @extend_schema(auth=[], summary='Share a plan')
     def create(self, request, *args, **kwargs):
@@ -0,0 +1,12 @@
+from typing import Any
+
+from django.core.management.base import BaseCommand
+from planning.services.empire_state_service import EmpireStateService
+
+
+class Command(BaseCommand):
+    help = 'Recompute the material i/o of all plans and rebuild all empire states from it'
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        plans, empires = EmpireStateService.backfill()
+        self.stdout.write(self.style.SUCCESS(f'Backfilled {plans} plans and {empires} empires.'))
@@ -0,0 +1,92 @@
+import io
+import json
+import time
+from collections.abc import Callable
+from types import SimpleNamespace
+from typing import Any
+
+import orjson
+from api.parsers import PydanticJSONParser
+from api.serializer import PydanticJSONField
+from django.core.management.base import BaseCommand
+from planning.api.serializers import PlanningPlanDetailSerializer
+from planning.schemas.latest_schemas import LATEST_SCHEMA
+from rest_framework import serializers
+from rest_framework.parsers import JSONParser
+
+PLAN_MODEL = LATEST_SCHEMA['PLANNING_DATA']
+
+
+def synthetic_plan_data(buildings: int, recipes: int) -> dict:
+    return {
+        'experts': [{'type': 'Agriculture', 'amount': 2}, {'type': 'Chemistry', 'amount': 1}],
+        'workforce': [
+            {'type': workforce, 'lux1': True, 'lux2': False}
+            for workforce in ('pioneer', 'settler', 'technician', 'engineer', 'scientist')
+        ],
+        'infrastructure': [{'building': 'HB1', 'amount': 10}, {'building': 'STO', 'amount': 4}],
+        'buildings': [
+            {
+                'name': f'B{i % 100:02d}',
+                'amount': i % 25 + 1,
+                'active_recipes': [
+                    {'recipeid': f'B{i % 100:02d}#{r}=>PRODUCT{r}', 'amount': r + 1} for r in range(recipes)
+                ],
+            }
+            for i in range(buildings)
+        ],
+    }
+
+
+class Command(BaseCommand):
+    help = (
+        'Benchmark plan write validation: the former path (JSON parse, DRF JSONField, pydantic model_validate, '
+        'model_dump, json.dumps for storage) against validating plan_data with model_validate_json while parsing.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--buildings', type=int, action='append', help='Buildings per plan, repeat for several sizes'
+        )
+        parser.add_argument('--recipes', type=int, default=4, help='Active recipes per building')
+        parser.add_argument('--runs', type=int, default=50, help='Runs per size and path')
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        view = SimpleNamespace(get_serializer_class=lambda: PlanningPlanDetailSerializer)
+        field = PydanticJSONField(pydantic_model=PLAN_MODEL)
+
+        def legacy(body: bytes) -> str:
+            data = JSONParser().parse(io.BytesIO(body))
+            plan_data = serializers.JSONField().to_internal_value(data['plan_data'])
+            validated = PLAN_MODEL.model_validate(plan_data).model_dump()
+            # encoding of models.JSONField when saving
+            return json.dumps(validated)
+
+        def prevalidated(body: bytes) -> str:
+            data = PydanticJSONParser().parse(io.BytesIO(body), parser_context={'view': view})
+            return field.to_internal_value(data['plan_data']).json
+
+        self.stdout.write(f'{"buildings":>10}{"KiB":>10}{"path":>14}{"ms/write":>12}{"speedup":>10}')
+        for buildings in options['buildings'] or [50, 500, 5000]:
+            body = orjson.dumps(
+                {'plan_name': 'Benchmark', 'plan_data': synthetic_plan_data(buildings, options['recipes'])}
+            )
+            # both paths must store the same document
+            if json.loads(legacy(body)) != json.loads(prevalidated(body)):
+                raise RuntimeError('Write paths disagree on the stored plan_data')
+
+            baseline = self._measure(legacy, body, options['runs'])
+            for name, runner in (('legacy', legacy), ('prevalidated', prevalidated)):
+                duration = baseline if runner is legacy else self._measure(runner, body, options['runs'])
+                self.stdout.write(
+                    f'{buildings:>10}{len(body) / 1024:>10.1f}{name:>14}{duration * 1000:>12.3f}'
+                    f'{baseline / duration:>10.2f}'
+                )
+
+    @staticmethod
+    def _measure(runner: Callable[[bytes], str], body: bytes, runs: int) -> float:
+        runner(body)
+        start = time.perf_counter()
+        for _ in range(runs):
+            runner(body)
+        return (time.perf_counter() - start) / runs
@@ -0,0 +1,18 @@
+# Generated by Django 6.0.4 on 2026-10-19 10:25
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('planning', '0007_planningempire_needs_state_sync'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='planningplan',
+            name='material_io',
+            field=models.JSONField(blank=True, default=dict),
+        ),
+    ]
@@ -0,0 +1,55 @@
+# Generated by Django 6.0.4 on 2026-10-19 10:34
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('planning', '0008_planningplan_material_io'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='PlanningDeletion',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('object_type', models.CharField(choices=[('plan', 'Plan'), ('empire', 'Empire'), ('cx', 'Cx')], max_length=10)),
+                ('object_uuid', models.UUIDField()),
+                ('deleted_at', models.DateTimeField(auto_now_add=True)),
+            ],
+            options={
+                'verbose_name': 'Deletion',
+                'verbose_name_plural': 'Deletions',
+                'db_table': 'prunplanner_planning_deletions',
+            },
+        ),
+        migrations.AddIndex(
+            model_name='planningcx',
+            index=models.Index(fields=['user', 'modified_at'], name='idx_cx_user_modified'),
+        ),
+        migrations.AddIndex(
+            model_name='planningempire',
+            index=models.Index(fields=['user', 'modified_at'], name='idx_empire_user_modified'),
+        ),
+        migrations.AddIndex(
+            model_name='planningplan',
+            index=models.Index(fields=['user', 'modified_at'], name='idx_plan_user_modified'),
+        ),
+        migrations.AddField(
+            model_name='planningdeletion',
+            name='user',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='planning_deletions', to=settings.AUTH_USER_MODEL),
+        ),
+        migrations.AddIndex(
+            model_name='planningdeletion',
+            index=models.Index(fields=['user', 'deleted_at'], name='idx_deletion_user_deleted'),
+        ),
+        migrations.AddIndex(
+            model_name='planningdeletion',
+            index=models.Index(fields=['deleted_at'], name='idx_deletion_deleted'),
+        ),
+    ]
@@ -0,0 +1,24 @@
+# Generated by Django 6.0.4 on 2026-10-19 10:49
+
+import core.fields
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('planning', '0009_planning_changes_sync'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='planningcx',
+            name='cx_data',
+            field=core.fields.PrevalidatedJSONField(default=dict),
+        ),
+        migrations.AlterField(
+            model_name='planningplan',
+            name='plan_data',
+            field=core.fields.PrevalidatedJSONField(default=dict),
+        ),
+    ]
@@ -0,0 +1,19 @@
+from django.db import migrations
+
+
+def backfill_empire_states(apps, schema_editor):
+    # the deltas come from the production model, which is only available as service code
+    from planning.services.empire_state_service import EmpireStateService
+
+    EmpireStateService.backfill()
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ('planning', '0010_prevalidated_json_data'),
+        ('gamedata', '0024_exchange_analytics_perf_index'),
+    ]
+
+    operations = [
+        migrations.RunPython(backfill_empire_states, reverse_code=migrations.RunPython.noop),
+    ]
@@ -1,3 +1,4 @@
+from core.fields import PrevalidatedJSONField
 from core.models import ChangeTrackedModel, UUIDModel
 from django.core.validators import MaxValueValidator, MinLengthValidator, MinValueValidator
 from django.db import models
@@ -42,9 +43,12 @@ class PlanningPlan(UUIDModel, ChangeTrackedModel):
     plan_corphq = models.BooleanField(default=False)
 
     # plan data json
-    plan_data = models.JSONField(default=dict)
+    plan_data = PrevalidatedJSONField(default=dict)
     schema_version = models.PositiveIntegerField(default=1, validators=[MinValueValidator(1)], db_index=True)
 
+    # server computed daily material i/o of plan_data, see EmpireStateService.refresh_plan
+    material_io = models.JSONField(default=dict, blank=True)
+
     def __str__(self) -> str:
         return f'{self.plan_name} ({self.uuid})'
 
@@ -53,6 +57,11 @@ class PlanningPlan(UUIDModel, ChangeTrackedModel):
         verbose_name = 'Plan'
         verbose_name_plural = 'Plans'
 
+        indexes = [
+            # delta sync: changes of a user since
+            models.Index(fields=['user', 'modified_at'], name='idx_plan_user_modified'),
+        ]
+
 
 class PlanningEmpire(UUIDModel, ChangeTrackedModel):
     user = models.ForeignKey('user.User', on_delete=models.CASCADE, related_name='empires')
@@ -91,6 +100,11 @@ class PlanningEmpire(UUIDModel, ChangeTrackedModel):
         verbose_name = 'Empire'
         verbose_name_plural = 'Empires'
 
+        indexes = [
+            # delta sync: changes of a user since
+            models.Index(fields=['user', 'modified_at'], name='idx_empire_user_modified'),
+        ]
+
         # Note, on Postgres there are two GIN indexes generated:
         # idx_gin_empire_total -> gin (((empire_state -> \'empire_total\')) jsonb_path_ops)
         # idx_gin_plan_details -> gin ((empire_state -> \'plan_details\'))
@@ -125,7 +139,7 @@ class PlanningCX(UUIDModel, ChangeTrackedModel):
     cx_name = models.CharField(max_length=200)
 
     # cx data json
-    cx_data = models.JSONField(default=dict)
+    cx_data = PrevalidatedJSONField(default=dict)
     schema_version = models.PositiveIntegerField(default=1, validators=[MinValueValidator(1)], db_index=True)
 
     objects: models.Manager['PlanningCX'] = models.Manager()
@@ -135,6 +149,11 @@ class PlanningCX(UUIDModel, ChangeTrackedModel):
         verbose_name = 'CX Preference'
         verbose_name_plural = 'CX Preferences'
 
+        indexes = [
+            # delta sync: changes of a user since
+            models.Index(fields=['user', 'modified_at'], name='idx_cx_user_modified'),
+        ]
+
 
 class PlanningShared(UUIDModel, ChangeTrackedModel):
     user = models.ForeignKey('user.User', on_delete=models.CASCADE, related_name='shared_plans')
@@ -152,3 +171,35 @@ class PlanningShared(UUIDModel, ChangeTrackedModel):
         verbose_name = 'Shared Plan'
         verbose_name_plural = 'Shared Plans'
         constraints = [models.UniqueConstraint(fields=['user', 'plan'], name='unique_user_plan_share')]
+
+
+class PlanningDeletionTypeChoices(models.TextChoices):
+    PLAN = 'plan'
+    EMPIRE = 'empire'
+    CX = 'cx'
+
+
+class PlanningDeletion(models.Model):
+    """Tombstone of a deleted plan, empire or cx, for clients syncing changes since a timestamp."""
+
+    user = models.ForeignKey('user.User', on_delete=models.CASCADE, related_name='planning_deletions')
+
+    object_type = models.CharField(max_length=10, choices=PlanningDeletionTypeChoices.choices)
+    object_uuid = models.UUIDField()
+    deleted_at = models.DateTimeField(auto_now_add=True)
+
+    objects: models.Manager['PlanningDeletion'] = models.Manager()
+
+    class Meta:
+        db_table = 'prunplanner_planning_deletions'
+        verbose_name = 'Deletion'
+        verbose_name_plural = 'Deletions'
+
+        indexes = [
+            models.Index(fields=['user', 'deleted_at'], name='idx_deletion_user_deleted'),
+            # retention cleanup
+            models.Index(fields=['deleted_at'], name='idx_deletion_deleted'),
+        ]
+
+    def __str__(self) -> str:
+        return f'{self.object_type} {self.object_uuid} (deleted {self.deleted_at})'
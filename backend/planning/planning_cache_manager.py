@@ -1,3 +1,4 @@
+import hashlib
 from collections.abc import Callable
 from typing import Any
 from uuid import UUID
@@ -9,6 +10,7 @@ class PlanningCacheManager(CacheManager):
     BASE_KEY = 'PLANNING'
 
     CACHE_TIMEOUT_1Hour = 60 * 60
+    CACHE_TIMEOUT_1Day = 60 * 60 * 24
 
     # Keys
     ## Plan
@@ -20,14 +22,18 @@ class PlanningCacheManager(CacheManager):
     def key_plan_retrieve(cls, user_id: int, plan_id: UUID) -> str:
         return cls.make_key(user_id, 'plan', 'retrieve', plan_id)
 
+    @classmethod
+    def key_plan_production(cls, user_id: int, plan_id: UUID) -> str:
+        return cls.make_key(user_id, 'plan', 'production', plan_id)
+
     ## Empire
     @classmethod
-    def key_for_empire_list(cls, user_id: int) -> str:
-        return cls.make_key(user_id, 'empire', 'list')
+    def key_for_empire_index(cls, user_id: int) -> str:
+        return cls.make_key(user_id, 'empire', 'index')
 
     @classmethod
-    def key_for_empire_retrieve(cls, user_id: int, empire_id: UUID) -> str:
-        return cls.make_key(user_id, 'empire', 'retrieve', empire_id)
+    def key_for_empire_document(cls, user_id: int, empire_id: UUID | str) -> str:
+        return cls.make_key(user_id, 'empire', 'document', empire_id)
 
     @classmethod
     def key_for_empire_retrieve_plans(cls, user_id: int, empire_id: UUID) -> str:
@@ -42,6 +48,16 @@ class PlanningCacheManager(CacheManager):
     def key_for_cx_retrieve(cls, user_id: int, cx_id: UUID) -> str:
         return cls.make_key(user_id, 'cx', 'retrieve', cx_id)
 
+    ## Shared
+    @classmethod
+    def key_for_shared_owner(cls, shared_id: UUID) -> str:
+        # shares are public, their payload lives under the owners keys to be purged with them
+        return cls.make_key('shared', 'owner', shared_id)
+
+    @classmethod
+    def key_for_shared_retrieve(cls, user_id: int, shared_id: UUID | str) -> str:
+        return cls.make_key(user_id, 'shared', 'retrieve', shared_id)
+
     # Operations
     ## Plan
     @classmethod
@@ -54,17 +70,12 @@ class PlanningCacheManager(CacheManager):
         key = cls.key_plan_retrieve(user_id, plan_id)
         return cls.get_or_set_response(key, func, timeout=cls.CACHE_TIMEOUT_1Hour)
 
-    ## Empire
     @classmethod
-    def get_empire_list_response(cls, user_id: int, func: Callable[[], Any]):
-        key = cls.key_for_empire_list(user_id)
-        return cls.get_or_set_response(key, func, timeout=cls.CACHE_TIMEOUT_1Hour)
-
-    @classmethod
-    def get_empire_retrieve_response(cls, user_id: int, empire_id: UUID, func: Callable[[], Any]):
-        key = cls.key_for_empire_retrieve(user_id, empire_id)
+    def get_plan_production_response(cls, user_id: int, plan_id: UUID, func: Callable[[], Any]):
+        key = cls.key_plan_production(user_id, plan_id)
         return cls.get_or_set_response(key, func, timeout=cls.CACHE_TIMEOUT_1Hour)
 
+    ## Empire
     @classmethod
     def get_empire_retrieve_plans_response(cls, user_id: int, empire_id: UUID, func: Callable[[], Any]):
         key = cls.key_for_empire_retrieve_plans(user_id, empire_id)
@@ -80,3 +91,21 @@ class PlanningCacheManager(CacheManager):
     def get_cx_retrieve_response(cls, user_id: int, cx_id: UUID, func: Callable[[], Any]):
         key = cls.key_for_cx_retrieve(user_id, cx_id)
         return cls.get_or_set_response(key, func, timeout=cls.CACHE_TIMEOUT_1Hour)
+
+    ## Shared
+    @classmethod
+    def get_shared_retrieve(cls, shared_id: UUID) -> dict | None:
+        """Cached payload of a share as {'data': bytes, 'etag': str}, None on a miss."""
+
+        user_id = cls.get(cls.key_for_shared_owner(shared_id))
+        if user_id is None:
+            return None
+        return cls.get(cls.key_for_shared_retrieve(user_id, shared_id))
+
+    @classmethod
+    def set_shared_retrieve(cls, user_id: int, shared_id: UUID, data: bytes) -> dict:
+        wrapped = {'data': data, 'etag': f'"{hashlib.blake2b(data, digest_size=16).hexdigest()}"'}
+
+        cls.set(cls.key_for_shared_owner(shared_id), user_id, cls.CACHE_TIMEOUT_1Day)
+        cls.set(cls.key_for_shared_retrieve(user_id, shared_id), wrapped, cls.CACHE_TIMEOUT_1Hour)
+        return wrapped
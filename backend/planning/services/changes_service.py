@@ -0,0 +1,65 @@
+from datetime import datetime, timedelta
+
+from django.db.models import QuerySet
+from django.utils import timezone
+from planning.models import PlanningCX, PlanningDeletion, PlanningDeletionTypeChoices, PlanningEmpire, PlanningPlan
+from user.models import User
+
+
+class PlanningChangesService:
+    """
+    Delta sync of a users plans, empires and cxs: everything modified and deleted since a timestamp.
+
+    `until` is the server time the changes were read at, clients pass it as the next `since`.
+    Rows are only visible once their transaction commits, which can be after `until` for a
+    `modified_at` set before it. `since` is therefore moved back by `OVERLAP`, clients receive
+    such rows again and apply them idempotently.
+
+    Tombstones are kept for `RETENTION_DAYS`, clients with an older `since` need a full sync.
+    """
+
+    OVERLAP = timedelta(seconds=10)
+    RETENTION_DAYS = 30
+
+    @classmethod
+    def is_expired(cls, since: datetime) -> bool:
+        return since < timezone.now() - timedelta(days=cls.RETENTION_DAYS)
+
+    @classmethod
+    def changes(cls, user: User, since: datetime) -> dict:
+        """Querysets of the changed objects and uuids of the deleted ones, by type."""
+
+        until = timezone.now()
+        after = since - cls.OVERLAP
+
+        deletions: dict[str, list] = {choice.value: [] for choice in PlanningDeletionTypeChoices}
+        for object_type, object_uuid in PlanningDeletion.objects.filter(user=user, deleted_at__gte=after).values_list(
+            'object_type', 'object_uuid'
+        ):
+            deletions[object_type].append(object_uuid)
+
+        def changed(queryset: QuerySet, object_type: PlanningDeletionTypeChoices) -> QuerySet:
+            return queryset.filter(user=user, modified_at__gte=after).exclude(uuid__in=deletions[object_type])
+
+        return {
+            'since': since,
+            'until': until,
+            'plans': changed(PlanningPlan.objects.prefetch_related('empires'), PlanningDeletionTypeChoices.PLAN),
+            'empires': changed(
+                PlanningEmpire.objects.prefetch_related('plans', 'cx'), PlanningDeletionTypeChoices.EMPIRE
+            ),
+            'cxs': changed(PlanningCX.objects.prefetch_related('cxs'), PlanningDeletionTypeChoices.CX),
+            'deleted': {
+                'plans': deletions[PlanningDeletionTypeChoices.PLAN],
+                'empires': deletions[PlanningDeletionTypeChoices.EMPIRE],
+                'cxs': deletions[PlanningDeletionTypeChoices.CX],
+            },
+        }
+
+    @classmethod
+    def purge_deletions(cls) -> int:
+        """Removes tombstones past the retention, returns the number removed."""
+
+        cutoff = timezone.now() - timedelta(days=cls.RETENTION_DAYS)
+        deleted, _ = PlanningDeletion.objects.filter(deleted_at__lt=cutoff).delete()
+        return deleted
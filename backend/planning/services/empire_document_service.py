@@ -0,0 +1,88 @@
+from collections.abc import Iterable
+from uuid import UUID
+
+import orjson
+from planning.api.serializers.empire import PlanningEmpireDetailSerializer
+from planning.models import PlanningEmpire
+from planning.planning_cache_manager import PlanningCacheManager
+
+
+class EmpireDocumentService:
+    """
+    Read model of the empire list and detail endpoints.
+
+    Every empire is kept as its pre-rendered detail representation (plans summary and cx), next
+    to the users index of empire uuids in list order. Planning signals rebuild the documents of
+    the empires a write touches after commit; reads are a get / get_many and a byte join.
+
+    Documents and index missing from the cache are rebuilt from the database on read, so purging
+    the users cache namespace only costs the next read its queries.
+    """
+
+    TIMEOUT = PlanningCacheManager.CACHE_TIMEOUT_1Hour
+
+    @staticmethod
+    def _encode(empire: PlanningEmpire) -> bytes:
+        return orjson.dumps(PlanningEmpireDetailSerializer(empire).data)
+
+    @classmethod
+    def refresh(cls, user_id: int, empire_uuids: Iterable[UUID | str]) -> dict[str, bytes]:
+        """Rebuilds the documents of `empire_uuids`, dropping those of deleted empires. Returns them by uuid."""
+
+        uuids = {str(uuid) for uuid in empire_uuids}
+        if not uuids:
+            return {}
+
+        empires = PlanningEmpire.objects.filter(user_id=user_id, uuid__in=uuids).prefetch_related('plans', 'cx')
+        documents = {str(empire.uuid): cls._encode(empire) for empire in empires}
+
+        PlanningCacheManager.set_many(
+            {PlanningCacheManager.key_for_empire_document(user_id, uuid): doc for uuid, doc in documents.items()},
+            cls.TIMEOUT,
+        )
+        PlanningCacheManager.delete_many(
+            [PlanningCacheManager.key_for_empire_document(user_id, uuid) for uuid in uuids - set(documents)]
+        )
+
+        return documents
+
+    @classmethod
+    def index(cls, user_id: int) -> list[str]:
+        """Empire uuids in list order, the signals drop it on empire creation, deletion and renames."""
+
+        key = PlanningCacheManager.key_for_empire_index(user_id)
+
+        uuids = PlanningCacheManager.get(key)
+        if uuids is None:
+            uuids = [
+                str(uuid)
+                for uuid in PlanningEmpire.objects.filter(user_id=user_id)
+                .order_by('empire_name')
+                .values_list('uuid', flat=True)
+            ]
+            PlanningCacheManager.set(key, uuids, cls.TIMEOUT)
+
+        return uuids
+
+    @classmethod
+    def documents(cls, user_id: int, empire_uuids: list[str]) -> list[bytes]:
+        """Documents in order of `empire_uuids`, rebuilding missing ones. Deleted empires are skipped."""
+
+        keys = {uuid: PlanningCacheManager.key_for_empire_document(user_id, uuid) for uuid in empire_uuids}
+        cached = PlanningCacheManager.get_many(list(keys.values()))
+
+        found = {uuid: cached[key] for uuid, key in keys.items() if key in cached}
+        missing = [uuid for uuid in empire_uuids if uuid not in found]
+        if missing:
+            found.update(cls.refresh(user_id, missing))
+
+        return [found[uuid] for uuid in empire_uuids if uuid in found]
+
+    @classmethod
+    def empire_list(cls, user_id: int) -> bytes:
+        return b'[' + b','.join(cls.documents(user_id, cls.index(user_id))) + b']'
+
+    @classmethod
+    def empire(cls, user_id: int, empire_uuid: UUID | str) -> bytes | None:
+        documents = cls.documents(user_id, [str(empire_uuid)])
+        return documents[0] if documents else None
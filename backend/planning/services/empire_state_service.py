@@ -1,19 +1,193 @@
 from decimal import ROUND_HALF_UP, Decimal
+from itertools import batched
+from uuid import UUID
 
 from analytics.models import AnalyticsEmpireMaterialSnapshot
 from django.db import transaction
-from planning.models import PlanningEmpire
+from django.utils import timezone
+from planning.models import PlanningEmpire, PlanningPlan
+from planning.services.plan_production_service import PlanProductionService
 
 
 class EmpireStateService:
+    """
+    Empire state: `plan_details` holds the material deltas of each plan in the empire, `empire_total`
+    their sum.
+
+    Plan deltas are computed server-side (`PlanProductionService`) and kept on the plan as
+    `material_io`. When a plan changes, only its contribution is recomputed and every empire
+    containing it swaps the old deltas for the new ones in its total, other plans are not
+    re-summed. Linking and unlinking a plan adds or subtracts its deltas the same way.
+    """
+
+    # float noise left by adding and subtracting, anything below is dropped from totals
+    PRECISION = 6
+    BACKFILL_BATCH_SIZE = 500
+
+    @staticmethod
+    def _add(total: dict, deltas: dict, sign: int) -> None:
+        for ticker, io in deltas.items():
+            current = total.setdefault(ticker, {'p': 0.0, 'c': 0.0, 'd': 0.0})
+            current['p'] += sign * io.get('p', 0)
+            current['c'] += sign * io.get('c', 0)
+
+    @classmethod
+    def _normalize(cls, total: dict) -> dict:
+        normalized = {}
+        for ticker, io in total.items():
+            p, c = round(io['p'], cls.PRECISION), round(io['c'], cls.PRECISION)
+            if p or c:
+                normalized[ticker] = {'p': p, 'c': c, 'd': round(p - c, cls.PRECISION)}
+        return normalized
+
     @staticmethod
-    def update_state(empire: PlanningEmpire, state_data: dict) -> None:
-        """Updates the empires state JSON dict only and sets the needs_state_sync flag to True"""
+    def _plan_details(plan: PlanningPlan) -> dict:
+        return {
+            'metadata': {'planet_natural_id': plan.planet_natural_id, 'cogc': plan.plan_cogc},
+            'deltas': plan.material_io,
+        }
 
-        empire.empire_state = state_data
+    @classmethod
+    def _write(cls, empire: PlanningEmpire, plan_details: dict, total: dict) -> None:
+        empire.empire_state = {
+            'metadata': {
+                'faction': empire.empire_faction,
+                'permits_used': empire.empire_permits_used,
+                'permits_total': empire.empire_permits_total,
+                'plan_count': len(plan_details),
+                'timestamp': timezone.now().isoformat(),
+            },
+            'empire_total': cls._normalize(total),
+            'plan_details': plan_details,
+        }
         empire.needs_state_sync = True
         empire.save(update_fields=['empire_state', 'modified_at', 'needs_state_sync'])
 
+    @classmethod
+    def _swap_plan(cls, empire: PlanningEmpire, plan_uuid: UUID | str, plan: PlanningPlan | None) -> None:
+        """Replaces the contribution of `plan_uuid` in the empire state, `plan` None removes it."""
+
+        state = empire.empire_state or {}
+        plan_details = state.get('plan_details', {})
+        total = state.get('empire_total', {})
+
+        previous = plan_details.pop(str(plan_uuid), None)
+        if previous:
+            cls._add(total, previous.get('deltas', {}), -1)
+
+        if plan is not None:
+            plan_details[str(plan_uuid)] = cls._plan_details(plan)
+            cls._add(total, plan.material_io, 1)
+
+        cls._write(empire, plan_details, total)
+
+    @classmethod
+    def refresh_plan(cls, plan_uuid: UUID | str) -> int:
+        """Recomputes a plan's material i/o and swaps it in all its empires, returns the number of empires."""
+
+        with transaction.atomic():
+            plan = PlanningPlan.objects.select_for_update().filter(uuid=plan_uuid).first()
+            if plan is None:
+                return 0
+
+            plan.material_io = PlanProductionService.evaluate_plan(plan)['materials']
+            # queryset update, saving the plan would trigger this refresh again
+            PlanningPlan.objects.filter(uuid=plan_uuid).update(material_io=plan.material_io)
+
+            empires = list(PlanningEmpire.objects.select_for_update().filter(empire_plans__plan_id=plan_uuid))
+            for empire in empires:
+                cls._swap_plan(empire, plan_uuid, plan)
+
+        return len(empires)
+
+    @classmethod
+    def attach_plan(cls, empire_uuid: UUID | str, plan_uuid: UUID | str) -> None:
+        """Adds a newly linked plan to the empire, with its stored material i/o."""
+
+        with transaction.atomic():
+            # plan before empire like `refresh_plan`, a concurrent refresh either sees the link or is waited for
+            plan = (
+                PlanningPlan.objects.select_for_update(of=('self',))
+                .filter(uuid=plan_uuid, plan_empires__empire_id=empire_uuid)
+                .first()
+            )
+            empire = PlanningEmpire.objects.select_for_update().filter(uuid=empire_uuid).first()
+            if empire is None or plan is None:
+                return
+
+            if not plan.material_io and plan.plan_data:
+                plan.material_io = PlanProductionService.evaluate_plan(plan)['materials']
+                PlanningPlan.objects.filter(uuid=plan_uuid).update(material_io=plan.material_io)
+
+            cls._swap_plan(empire, plan_uuid, plan)
+
+    @classmethod
+    def detach_plan(cls, empire_uuid: UUID | str, plan_uuid: UUID | str) -> None:
+        """Subtracts an unlinked or deleted plan from the empire."""
+
+        with transaction.atomic():
+            empire = PlanningEmpire.objects.select_for_update().filter(uuid=empire_uuid).first()
+            if empire is None or str(plan_uuid) not in (empire.empire_state or {}).get('plan_details', {}):
+                return
+
+            cls._swap_plan(empire, plan_uuid, None)
+
+    @classmethod
+    def rebuild(cls, empire: PlanningEmpire) -> None:
+        """Full re-sum of the empire state from the stored material i/o of its plans."""
+
+        plans = list(PlanningPlan.objects.filter(plan_empires__empire_id=empire.uuid))
+
+        total: dict = {}
+        for plan in plans:
+            cls._add(total, plan.material_io, 1)
+
+        cls._write(empire, {str(plan.uuid): cls._plan_details(plan) for plan in plans}, total)
+
+    @classmethod
+    def sync_state(cls, empire_uuid: UUID | str) -> PlanningEmpire | None:
+        """
+        Locks and rebuilds the empire state from server data, returns the refreshed empire.
+        Client-computed totals are not accepted, the state is only ever derived from the plans.
+        """
+
+        with transaction.atomic():
+            empire = PlanningEmpire.objects.select_for_update().filter(uuid=empire_uuid).first()
+            if empire is not None:
+                cls.rebuild(empire)
+        return empire
+
+    @classmethod
+    def backfill(cls) -> tuple[int, int]:
+        """
+        Computes the material i/o of every plan, then rebuilds every empire state from it.
+        Returns the number of plans and empires written.
+
+        Brings plans created before server-side deltas and empires holding client-computed
+        totals onto the state the incremental swaps expect, see migration 0011.
+        """
+
+        plans = 0
+        for batch in batched(
+            PlanningPlan.objects.order_by('uuid').iterator(cls.BACKFILL_BATCH_SIZE), cls.BACKFILL_BATCH_SIZE
+        ):
+            batch = list(batch)
+            for plan, result in zip(batch, PlanProductionService.evaluate(batch), strict=True):
+                plan.material_io = result['materials']
+            # queryset update, saving the plans would enqueue a refresh per plan
+            PlanningPlan.objects.bulk_update(batch, ['material_io'])
+            plans += len(batch)
+
+        empires = 0
+        for empire_uuid in PlanningEmpire.objects.order_by('uuid').values_list('uuid', flat=True).iterator():
+            with transaction.atomic():
+                empire = PlanningEmpire.objects.select_for_update().filter(uuid=empire_uuid).first()
+                if empire is not None:
+                    cls.rebuild(empire)
+                    empires += 1
+
+        return plans, empires
+
     @staticmethod
     def sync_snapshot(empire: PlanningEmpire) -> None:
         """Performs snapshot sync into AnalyticsEmpireMaterialSnapshot object"""
@@ -0,0 +1,361 @@
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Any, get_args
+
+import orjson
+from django.contrib.postgres.fields import ArrayField
+from django.db import connection, models, transaction
+from django.db.models import F, Func, QuerySet, Value
+from django.db.models.expressions import Combinable
+from django.db.models.functions import Cast
+from django.db.models.signals import post_save
+from django.utils import timezone
+from pydantic import BaseModel, TypeAdapter, ValidationError as PydanticValidationError
+from rest_framework import serializers
+from rest_framework.exceptions import ValidationError as DRFValidationError
+
+_MISSING = object()
+
+
+class JSONPatchError(Exception):
+    """Invalid patch, or a patch whose result does not validate."""
+
+
+class JSONPatchTestFailed(JSONPatchError):
+    """A `test` operation did not match, the document changed meanwhile."""
+
+
+@dataclass(frozen=True, slots=True)
+class PatchSchema:
+    """
+    Validators of a JSON document's top-level sections, and of single elements of a section
+    (list items or object values). Each returns the normalized value or raises.
+    """
+
+    sections: dict[str, Callable[[Any], Any]]
+    elements: dict[str, Callable[[Any], Any]]
+    # sections that are lists, their items shift on inserts and removals
+    list_sections: frozenset[str]
+    required: frozenset[str]
+
+    @classmethod
+    def from_pydantic(cls, model: type[BaseModel]) -> 'PatchSchema':
+        sections, elements, list_sections = {}, {}, set()
+
+        for name, field in model.model_fields.items():
+            adapter = TypeAdapter(field.annotation)
+            sections[name] = lambda value, adapter=adapter: adapter.dump_python(adapter.validate_python(value))
+
+            args = get_args(field.annotation)
+            if args:
+                item = TypeAdapter(args[-1])
+                elements[name] = lambda value, item=item: item.dump_python(item.validate_python(value))
+                list_sections.add(name)
+
+        required = {name for name, field in model.model_fields.items() if field.is_required()}
+        return cls(sections, elements, frozenset(list_sections), frozenset(required))
+
+    @classmethod
+    def from_serializer(cls, serializer: serializers.Serializer) -> 'PatchSchema':
+        sections, elements, list_sections = {}, {}, set()
+
+        for name, field in serializer.fields.items():
+            sections[name] = field.run_validation
+            child = getattr(field, 'child', None)
+            if child is not None:
+                elements[name] = child.run_validation
+                if isinstance(field, serializers.ListField | serializers.ListSerializer):
+                    list_sections.add(name)
+
+        required = {name for name, field in serializer.fields.items() if field.required}
+        return cls(sections, elements, frozenset(list_sections), frozenset(required))
+
+
+class JSONBSet(Func):
+    """jsonb_set(target, path, value) on Postgres."""
+
+    function = 'jsonb_set'
+    output_field = models.JSONField()
+
+    def __init__(self, target: Combinable, path: list[str], value: Any):
+        super().__init__(
+            target,
+            Cast(Value(JSONPatchService.path_literal(path)), output_field=ArrayField(models.TextField())),
+            Cast(Value(orjson.dumps(value).decode()), output_field=models.JSONField()),
+        )
+
+
+class JSONBDeletePath(Func):
+    """target #- path on Postgres."""
+
+    template = '(%(expressions)s)'
+    arg_joiner = ' #- '
+    output_field = models.JSONField()
+
+    def __init__(self, target: Combinable, path: list[str]):
+        super().__init__(
+            target, Cast(Value(JSONPatchService.path_literal(path)), output_field=ArrayField(models.TextField()))
+        )
+
+
+class JSONPatchService:
+    """
+    RFC 6902 JSON Patch for the JSON documents of planning objects (plan_data, empire_state).
+
+    A patch is applied to the stored document in Python, then only what it touched is
+    validated against the `PatchSchema`: the single elements edited below an element of
+    a section, or whole sections when a patch inserts into, removes from or moves within
+    a list section (indices shift) or replaces the section itself.
+
+    On Postgres, the validated values of the touched locations are written with jsonb_set /
+    #- instead of the full document (`expression`). The request carries the edit only and
+    validation scales with it; Postgres still writes a new version of the whole JSONB value.
+    """
+
+    OPERATIONS = ('add', 'remove', 'replace', 'move', 'copy', 'test')
+    MAX_OPERATIONS = 200
+
+    @staticmethod
+    def parse_pointer(pointer: str) -> list[str]:
+        """RFC 6901 JSON pointer to its reference tokens."""
+
+        if not isinstance(pointer, str) or (pointer and not pointer.startswith('/')):
+            raise JSONPatchError(f'Invalid JSON pointer: {pointer!r}')
+        if not pointer:
+            return []
+        return [token.replace('~1', '/').replace('~0', '~') for token in pointer[1:].split('/')]
+
+    @staticmethod
+    def path_literal(path: list[str]) -> str:
+        """Postgres text[] literal of a path."""
+
+        quoted = ['"' + token.replace('\\', '\\\\').replace('"', '\\"') + '"' for token in path]
+        return '{' + ','.join(quoted) + '}'
+
+    # document access
+
+    @staticmethod
+    def _index(container: list, token: str, *, insert: bool = False) -> int:
+        if insert and token == '-':
+            return len(container)
+        if not token.isdigit() or (token != '0' and token.startswith('0')):
+            raise JSONPatchError(f'Invalid array index: {token!r}')
+
+        index = int(token)
+        if index > len(container) or (not insert and index == len(container)):
+            raise JSONPatchError(f'Array index out of range: {index}')
+        return index
+
+    @classmethod
+    def _parent(cls, document: Any, path: list[str]) -> Any:
+        target = document
+        for token in path[:-1]:
+            if isinstance(target, list):
+                target = target[cls._index(target, token)]
+            elif isinstance(target, dict) and token in target:
+                target = target[token]
+            else:
+                raise JSONPatchError(f'Path not found: /{"/".join(path)}')
+        return target
+
+    @classmethod
+    def _get(cls, document: Any, path: list[str]) -> Any:
+        if not path:
+            return document
+
+        parent = cls._parent(document, path)
+        if isinstance(parent, list):
+            return parent[cls._index(parent, path[-1])]
+        if isinstance(parent, dict) and path[-1] in parent:
+            return parent[path[-1]]
+        raise JSONPatchError(f'Path not found: /{"/".join(path)}')
+
+    @classmethod
+    def _add(cls, document: Any, path: list[str], value: Any) -> None:
+        parent = cls._parent(document, path)
+        if isinstance(parent, list):
+            parent.insert(cls._index(parent, path[-1], insert=True), value)
+        elif isinstance(parent, dict):
+            parent[path[-1]] = value
+        else:
+            raise JSONPatchError(f'Cannot add to a scalar at /{"/".join(path)}')
+
+    @classmethod
+    def _remove(cls, document: Any, path: list[str]) -> Any:
+        parent = cls._parent(document, path)
+        if isinstance(parent, list):
+            return parent.pop(cls._index(parent, path[-1]))
+        if isinstance(parent, dict) and path[-1] in parent:
+            return parent.pop(path[-1])
+        raise JSONPatchError(f'Path not found: /{"/".join(path)}')
+
+    @classmethod
+    def _apply_operation(cls, document: dict, operation: dict) -> None:
+        op = operation.get('op')
+        path = cls.parse_pointer(operation.get('path'))  # type: ignore
+        value = operation.get('value', _MISSING)
+
+        if op not in cls.OPERATIONS:
+            raise JSONPatchError(f'Unsupported operation: {op!r}')
+        if not path:
+            raise JSONPatchError('Operations on the whole document are not supported')
+        if op in ('add', 'replace', 'test') and value is _MISSING:
+            raise JSONPatchError(f'Operation {op} requires a value')
+
+        if op == 'test':
+            if cls._get(document, path) != value:
+                raise JSONPatchTestFailed(f'Test failed at {operation["path"]}')
+        elif op == 'add':
+            cls._add(document, path, value)
+        elif op == 'remove':
+            cls._remove(document, path)
+        elif op == 'replace':
+            cls._remove(document, path)
+            cls._add(document, path, value)
+        else:
+            source = cls.parse_pointer(operation.get('from'))  # type: ignore
+            if op == 'move' and path[: len(source)] == source:
+                raise JSONPatchError('Cannot move a value into itself')
+            moved = (
+                cls._remove(document, source)
+                if op == 'move'
+                else orjson.loads(orjson.dumps(cls._get(document, source)))
+            )
+            cls._add(document, path, moved)
+
+    # touched locations
+
+    @classmethod
+    def _touched(cls, operations: list[dict], schema: PatchSchema) -> tuple[set[str], set[tuple[str, str]]]:
+        """Sections to validate whole and (section, key) elements to validate alone."""
+
+        sections: set[str] = set()
+        elements: set[tuple[str, str]] = set()
+
+        for operation in operations:
+            if operation['op'] == 'test':
+                continue
+
+            paths = [cls.parse_pointer(operation['path'])]
+            if operation['op'] == 'move':
+                paths.append(cls.parse_pointer(operation['from']))
+
+            for path in paths:
+                section = path[0]
+                if section not in schema.sections:
+                    raise JSONPatchError(f'Unknown section: /{section}')
+
+                structural = len(path) == 2 and operation['op'] != 'replace'
+                if len(path) == 1 or section not in schema.elements or (structural and section in schema.list_sections):
+                    sections.add(section)
+                else:
+                    elements.add((section, path[1]))
+
+        return sections, {(section, key) for section, key in elements if section not in sections}
+
+    @staticmethod
+    def _validate(validator: Callable[[Any], Any], value: Any, location: str) -> Any:
+        try:
+            return validator(value)
+        except PydanticValidationError as exc:
+            raise JSONPatchError(f'{location}: {exc.errors(include_url=False)}') from exc
+        except DRFValidationError as exc:
+            raise JSONPatchError(f'{location}: {exc.detail}') from exc
+
+    @classmethod
+    def apply(cls, document: dict, operations: list[dict], schema: PatchSchema) -> tuple[dict, list[list[str]]]:
+        """
+        Patches `document` in place and validates what changed.
+
+        Returns the document and the paths whose value changed, each a section or an element of one.
+        Elements removed from object sections are paths no longer in the document.
+        """
+
+        if not isinstance(operations, list) or not operations:
+            raise JSONPatchError('A patch is a non-empty list of operations')
+        if len(operations) > cls.MAX_OPERATIONS:
+            raise JSONPatchError(f'At most {cls.MAX_OPERATIONS} operations per patch')
+        if not all(isinstance(operation, dict) for operation in operations):
+            raise JSONPatchError('Operations must be objects')
+
+        for operation in operations:
+            cls._apply_operation(document, operation)
+
+        sections, elements = cls._touched(operations, schema)
+
+        missing = schema.required - set(document)
+        if missing:
+            raise JSONPatchError(f'Required sections removed: {", ".join(sorted(missing))}')
+
+        changed = []
+        for section in sorted(sections):
+            if section in document:
+                document[section] = cls._validate(schema.sections[section], document[section], f'/{section}')
+            changed.append([section])
+
+        for section, key in sorted(elements):
+            container = document.get(section)
+            path = [section, key]
+            if isinstance(container, list):
+                index = cls._index(container, key)
+                container[index] = cls._validate(schema.elements[section], container[index], f'/{section}/{key}')
+            elif isinstance(container, dict) and key in container:
+                container[key] = cls._validate(schema.elements[section], container[key], f'/{section}/{key}')
+            elif not isinstance(container, dict):
+                raise JSONPatchError(f'Path not found: /{section}')
+            changed.append(path)
+
+        return document, changed
+
+    @classmethod
+    def expression(cls, field_name: str, document: dict, changed: list[list[str]]) -> Any:
+        """Update value of `field_name` writing the changed paths only on Postgres, else the whole document."""
+
+        if connection.vendor != 'postgresql':
+            return document
+
+        value: Combinable = F(field_name)
+        for path in changed:
+            current = document
+            for token in path:
+                current = current[int(token)] if isinstance(current, list) else current.get(token, _MISSING)
+                if current is _MISSING:
+                    break
+
+            value = JSONBDeletePath(value, path) if current is _MISSING else JSONBSet(value, path, current)
+
+        return value
+
+    @classmethod
+    def patch_field(
+        cls, queryset: QuerySet, pk: Any, field_name: str, operations: list[dict], schema: PatchSchema, **updates: Any
+    ) -> models.Model:
+        """
+        Patches the JSON field of the object `pk` of `queryset` under a row lock, with `updates` written along.
+
+        Sends post_save like a regular save, so cache invalidation and follow-up work run as usual.
+        """
+
+        with transaction.atomic():
+            instance = queryset.select_for_update().get(pk=pk)
+            document, changed = cls.apply(getattr(instance, field_name) or {}, operations, schema)
+
+            updates = {**updates, 'modified_at': timezone.now()}
+            queryset.model.objects.filter(pk=pk).update(
+                **{field_name: cls.expression(field_name, document, changed)}, **updates
+            )
+
+            setattr(instance, field_name, document)
+            for name, value in updates.items():
+                setattr(instance, name, value)
+
+            post_save.send(
+                sender=queryset.model,
+                instance=instance,
+                created=False,
+                update_fields=frozenset([field_name, *updates]),
+                raw=False,
+                using=queryset.db,
+            )
+
+        return instance
@@ -0,0 +1,90 @@
+from dataclasses import dataclass, field
+from functools import partial
+from uuid import UUID
+
+from core.services.cache_invalidation import CacheInvalidation
+from django.db import transaction
+from django.utils import timezone
+from planning.models import PlanningEmpire, PlanningEmpirePlan, PlanningPlan
+from planning.signals import deferred_cache_invalidation
+from planning.tasks import planning_attach_empire_plan, planning_refresh_plan_contribution
+from user.models import User
+
+
+@dataclass
+class PlanBulkOperations:
+    # validated plan fields, optionally with the `empire_uuid` to link a new plan to
+    creates: list[dict] = field(default_factory=list)
+    # plans with their new field values applied
+    updates: list[PlanningPlan] = field(default_factory=list)
+    deletes: list[UUID] = field(default_factory=list)
+
+
+class PlanBulkService:
+    """
+    Applies many plan creates, updates and deletes of one user in a single transaction.
+
+    Creates and updates go through `bulk_create` / `bulk_update`, which send no model signals:
+    the users planning caches are purged once after commit, and the empire contributions of
+    the written plans are refreshed like a regular save does. Deletes cascade as usual, their
+    per-instance cache invalidation is deferred to the same single purge.
+    """
+
+    MAX_OPERATIONS = 100
+
+    UPDATE_FIELDS = [
+        'plan_name',
+        'planet_natural_id',
+        'plan_permits_used',
+        'plan_cogc',
+        'plan_corphq',
+        'plan_data',
+        'modified_at',
+    ]
+
+    @classmethod
+    def apply(cls, user: User, operations: PlanBulkOperations) -> tuple[list[PlanningPlan], int]:
+        """Returns the created plans, in order of `operations.creates`, and the number of plans deleted."""
+
+        now = timezone.now()
+        created: list[PlanningPlan] = []
+        links: list[PlanningEmpirePlan] = []
+
+        for data in operations.creates:
+            values = dict(data)
+            empire_uuid = values.pop('empire_uuid', None)
+            plan = PlanningPlan(user=user, **values)
+            created.append(plan)
+            if empire_uuid:
+                links.append(PlanningEmpirePlan(user=user, empire_id=empire_uuid, plan=plan))
+
+        for plan in operations.updates:
+            # auto_now is not applied by bulk_update
+            plan.modified_at = now
+
+        with transaction.atomic(), deferred_cache_invalidation():
+            PlanningPlan.objects.bulk_create(created)
+            PlanningEmpirePlan.objects.bulk_create(links, ignore_conflicts=True)
+            # links are part of the empire representation, see planning.signals.touch_linked_objects
+            PlanningEmpire.objects.filter(uuid__in={link.empire_id for link in links}).update(  # type: ignore
+                modified_at=now
+            )
+            PlanningPlan.objects.bulk_update(operations.updates, cls.UPDATE_FIELDS)
+
+            deleted = 0
+            if operations.deletes:
+                deleted = (
+                    PlanningPlan.objects.filter(user=user, uuid__in=operations.deletes)
+                    .delete()[1]
+                    .get(PlanningPlan._meta.label, 0)
+                )
+
+            CacheInvalidation.delete_pattern(f'*PLANNING:{user.id}:*')
+            for plan in [*created, *operations.updates]:
+                transaction.on_commit(partial(planning_refresh_plan_contribution.delay, str(plan.uuid)))
+            for link in links:
+                transaction.on_commit(
+                    partial(planning_attach_empire_plan.delay, str(link.empire_id), str(link.plan.uuid))  # type: ignore
+                )
+
+        return created, deleted
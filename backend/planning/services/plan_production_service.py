@@ -0,0 +1,320 @@
+import time
+from collections.abc import Iterable
+from dataclasses import dataclass
+from typing import Any, ClassVar
+
+import numpy as np
+from gamedata.models import GameBuilding, GameMaterial, GamePlanet, GameRecipe, GameRecipeInput, GameRecipeOutput
+from gamedata.models.model_constants import habitations, workforce_needs
+from planning.models import PlanningPlan
+
+DAY_MS = 86_400_000
+
+WORKFORCE_TIERS = ['pioneers', 'settlers', 'technicians', 'engineers', 'scientists']
+NEED_LEVELS = ['essentials', 'lux1', 'lux2']
+
+# plan_data workforce types and COGC workforce programs to building workforce fields
+PLAN_WORKFORCE = {
+    'pioneer': 'pioneers',
+    'settler': 'settlers',
+    'technician': 'technicians',
+    'engineer': 'engineers',
+    'scientist': 'scientists',
+}
+COGC_WORKFORCE = {
+    'PIONEERS': 'pioneers',
+    'SETTLERS': 'settlers',
+    'TECHNICIANS': 'technicians',
+    'ENGINEERS': 'engineers',
+    'SCIENTISTS': 'scientists',
+}
+
+
+@dataclass(frozen=True, slots=True)
+class ProductionMatrices:
+    """
+    Game data in matrix form, rows indexed by recipe id (`<building>#<recipe name>`) or building ticker,
+    columns by material ticker or workforce tier.
+    """
+
+    materials: list[str]
+    material_index: dict[str, int]
+    recipe_index: dict[str, int]
+    recipe_time_ms: np.ndarray  # (recipes,)
+    recipe_inputs: np.ndarray  # (recipes, materials) per run
+    recipe_outputs: np.ndarray  # (recipes, materials) per run
+    building_index: dict[str, int]
+    building_expertise: list[str]
+    building_workforce: np.ndarray  # (buildings, tiers)
+    building_capacity: np.ndarray  # (buildings, tiers) housing
+    workforce_needs: np.ndarray  # (tiers * levels, materials) per 100 workers and day
+
+    @classmethod
+    def build(cls) -> 'ProductionMatrices':
+        recipes = list(GameRecipe.objects.order_by('standard_recipe_name'))
+        buildings = list(GameBuilding.objects.order_by('building_ticker'))
+        inputs = list(GameRecipeInput.objects.values_list('recipe_id', 'material_ticker', 'material_amount'))
+        outputs = list(GameRecipeOutput.objects.values_list('recipe_id', 'material_ticker', 'material_amount'))
+
+        tickers = set(GameMaterial.objects.values_list('ticker', flat=True))
+        tickers |= {ticker for _, ticker, _ in (*inputs, *outputs)}
+        tickers |= {m for tier in workforce_needs.values() for level in tier.values() for m in level}
+        materials = sorted(tickers)
+        material_index = {ticker: i for i, ticker in enumerate(materials)}
+
+        recipe_rows = {r.standard_recipe_name: i for i, r in enumerate(recipes)}
+        recipe_index = {f'{r.building_ticker}#{r.recipe_name}': i for i, r in enumerate(recipes)}
+        recipe_inputs = np.zeros((len(recipes), len(materials)))
+        recipe_outputs = np.zeros((len(recipes), len(materials)))
+        for matrix, items in ((recipe_inputs, inputs), (recipe_outputs, outputs)):
+            for recipe_id, ticker, amount in items:
+                matrix[recipe_rows[recipe_id], material_index[ticker]] += amount
+
+        building_capacity = np.array(
+            [[habitations.get(b.building_ticker, {}).get(tier, 0) for tier in WORKFORCE_TIERS] for b in buildings],
+            dtype=np.float64,
+        ).reshape(len(buildings), len(WORKFORCE_TIERS))
+
+        needs = np.zeros((len(WORKFORCE_TIERS) * len(NEED_LEVELS), len(materials)))
+        for t, tier in enumerate(WORKFORCE_TIERS):
+            for lvl, level in enumerate(NEED_LEVELS):
+                for ticker, amount in workforce_needs[tier][level].items():
+                    needs[t * len(NEED_LEVELS) + lvl, material_index[ticker]] = amount
+
+        return cls(
+            materials=materials,
+            material_index=material_index,
+            recipe_index=recipe_index,
+            recipe_time_ms=np.array([r.time_ms for r in recipes], dtype=np.float64),
+            recipe_inputs=recipe_inputs,
+            recipe_outputs=recipe_outputs,
+            building_index={b.building_ticker: i for i, b in enumerate(buildings)},
+            building_expertise=[b.expertise or '' for b in buildings],
+            building_workforce=np.array(
+                [[getattr(b, tier) for tier in WORKFORCE_TIERS] for b in buildings], dtype=np.float64
+            ).reshape(len(buildings), len(WORKFORCE_TIERS)),
+            building_capacity=building_capacity,
+            workforce_needs=needs,
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class PlanetContext:
+    fertility: float
+    # material ticker -> daily extraction of one extraction building at 100% efficiency
+    extraction: dict[str, float]
+
+
+class PlanProductionService:
+    """
+    Server-side production engine: daily material production and consumption, workforce and
+    housing of plans, computed from their `plan_data`.
+
+    Game data is turned into matrices once per process (`matrices`, refreshed after
+    `MATRICES_TTL`). Evaluating plans only walks their buildings to fill a (plans x recipes)
+    matrix of daily runs and a (plans x workforce needs) matrix of workers, both are then
+    multiplied with the recipe and needs matrices for the whole batch at once.
+
+    Building efficiency is the satisfaction of its workforce (essentials, lux1, lux2), times
+    the expert bonus of its expertise, the COGC program bonus, the CorpHQ bonus and, for
+    farms, the planet's fertility. A building's production line cycles through its active
+    recipes, each run `amount` times per cycle. Extraction buildings produce the planet's
+    resource rate instead of running recipes. Workforce is assumed fully supplied with the
+    essentials, unhoused workers are reported but not penalised.
+    """
+
+    MATRICES_TTL = 60 * 60
+    BATCH_SIZE = 2000
+
+    EXTRACTION_BUILDINGS = {'COL', 'EXT', 'RIG'}
+    FERTILITY_BUILDINGS = {'FRM', 'ORC'}
+    # the fertility rating -1..1 moves farm speed by up to a third
+    FERTILITY_FACTOR = 10 / 33
+
+    SATISFACTION = {'essentials': 0.79, 'lux1': 0.1, 'lux2': 0.11}
+    EXPERT_BONUS = [0.0, 0.0306, 0.0696, 0.1248, 0.1974, 0.2842]
+    COGC_INDUSTRY_BONUS = 0.25
+    COGC_WORKFORCE_BONUS = 0.1
+    CORPHQ_BONUS = 0.1
+
+    _matrices: ClassVar[ProductionMatrices | None] = None
+    _matrices_built_at: ClassVar[float] = 0.0
+
+    @classmethod
+    def matrices(cls) -> ProductionMatrices:
+        if cls._matrices is None or time.monotonic() - cls._matrices_built_at > cls.MATRICES_TTL:
+            cls._matrices = ProductionMatrices.build()
+            cls._matrices_built_at = time.monotonic()
+        return cls._matrices
+
+    @classmethod
+    def invalidate(cls) -> None:
+        cls._matrices = None
+
+    @staticmethod
+    def planet_contexts(planet_natural_ids: Iterable[str]) -> dict[str, PlanetContext]:
+        planets = GamePlanet.objects.filter(planet_natural_id__in=set(planet_natural_ids)).prefetch_related('resources')
+        return {
+            p.planet_natural_id: PlanetContext(
+                fertility=p.fertility,
+                extraction={r.material_ticker: r.daily_extraction for r in p.resources.all() if r.material_ticker},
+            )
+            for p in planets
+        }
+
+    @classmethod
+    def evaluate_plan(cls, plan: PlanningPlan) -> dict[str, Any]:
+        return cls.evaluate([plan])[0]
+
+    @classmethod
+    def evaluate(cls, plans: list[PlanningPlan]) -> list[dict[str, Any]]:
+        """Production of each plan, in the order given."""
+
+        if not plans:
+            return []
+
+        matrices = cls.matrices()
+        planets = cls.planet_contexts(p.planet_natural_id for p in plans)
+
+        results = []
+        for start in range(0, len(plans), cls.BATCH_SIZE):
+            results.extend(cls._evaluate_batch(matrices, planets, plans[start : start + cls.BATCH_SIZE]))
+        return results
+
+    @classmethod
+    def _satisfaction(cls, plan_data: dict) -> np.ndarray:
+        """(tiers, levels) share of each need level supplied, essentials always are."""
+
+        supplied = np.zeros((len(WORKFORCE_TIERS), len(NEED_LEVELS)))
+        supplied[:, 0] = 1.0
+        for workforce in plan_data.get('workforce', []):
+            tier = PLAN_WORKFORCE.get(workforce.get('type'))
+            if tier is not None:
+                t = WORKFORCE_TIERS.index(tier)
+                supplied[t, 1] = float(bool(workforce.get('lux1')))
+                supplied[t, 2] = float(bool(workforce.get('lux2')))
+        return supplied
+
+    @classmethod
+    def _efficiency(
+        cls, m: ProductionMatrices, b: int, tier_satisfaction: np.ndarray, experts: dict, plan: PlanningPlan
+    ) -> float:
+        staff = m.building_workforce[b]
+        staff_total = staff.sum()
+        efficiency = float(staff @ tier_satisfaction / staff_total) if staff_total else 1.0
+
+        expertise = m.building_expertise[b]
+        efficiency *= 1 + cls.EXPERT_BONUS[min(experts.get(expertise, 0), len(cls.EXPERT_BONUS) - 1)]
+
+        cogc = (plan.plan_cogc or '').upper()
+        if expertise and cogc == expertise:
+            efficiency *= 1 + cls.COGC_INDUSTRY_BONUS
+        elif cogc in COGC_WORKFORCE and staff_total:
+            share = staff[WORKFORCE_TIERS.index(COGC_WORKFORCE[cogc])] / staff_total
+            efficiency *= 1 + cls.COGC_WORKFORCE_BONUS * share
+
+        if plan.plan_corphq:
+            efficiency *= 1 + cls.CORPHQ_BONUS
+
+        return efficiency
+
+    @classmethod
+    def _add_building(
+        cls,
+        m: ProductionMatrices,
+        planet: PlanetContext,
+        building: dict,
+        efficiency: float,
+        runs: np.ndarray,
+        extracted: np.ndarray,
+    ) -> None:
+        """Adds the daily recipe runs, or extracted resources, of one plan building."""
+
+        ticker = building.get('name')
+        amount = building.get('amount', 0)
+        active = [(r.get('recipeid', ''), r.get('amount', 0)) for r in building.get('active_recipes', [])]
+        active = [(recipe_id, count) for recipe_id, count in active if count > 0]
+
+        if ticker in cls.EXTRACTION_BUILDINGS:
+            # one resource per queued order, shared by amount
+            total = sum(count for _, count in active)
+            for recipe_id, count in active:
+                resource = recipe_id.partition('#')[2]
+                material = m.material_index.get(resource)
+                if material is not None:
+                    extracted[material] += planet.extraction.get(resource, 0.0) * efficiency * amount * count / total
+            return
+
+        if ticker in cls.FERTILITY_BUILDINGS:
+            efficiency *= max(0.0, 1 + planet.fertility * cls.FERTILITY_FACTOR)
+
+        # the production line cycles through its orders, each queued `count` times
+        known = [(m.recipe_index[recipe_id], count) for recipe_id, count in active if recipe_id in m.recipe_index]
+        cycle_ms = sum(m.recipe_time_ms[r] * count for r, count in known)
+        if not cycle_ms:
+            return
+
+        cycles_per_day = DAY_MS / cycle_ms * efficiency * amount
+        for r, count in known:
+            runs[r] += cycles_per_day * count
+
+    @classmethod
+    def _evaluate_batch(
+        cls, m: ProductionMatrices, planets: dict[str, PlanetContext], plans: list[PlanningPlan]
+    ) -> list[dict[str, Any]]:
+        size = len(plans)
+        runs = np.zeros((size, len(m.recipe_index)))
+        extracted = np.zeros((size, len(m.materials)))
+        workers = np.zeros((size, len(WORKFORCE_TIERS)))
+        capacity = np.zeros((size, len(WORKFORCE_TIERS)))
+        supplied = np.zeros((size, len(WORKFORCE_TIERS), len(NEED_LEVELS)))
+
+        level_weights = np.array([cls.SATISFACTION[level] for level in NEED_LEVELS])
+
+        for i, plan in enumerate(plans):
+            data = plan.plan_data or {}
+            planet = planets.get(plan.planet_natural_id, PlanetContext(fertility=0.0, extraction={}))
+
+            supplied[i] = cls._satisfaction(data)
+            tier_satisfaction = supplied[i] @ level_weights
+            experts = {e.get('type', '').upper(): e.get('amount', 0) for e in data.get('experts', [])}
+
+            for infrastructure in data.get('infrastructure', []):
+                b = m.building_index.get(infrastructure.get('building'))
+                if b is not None:
+                    capacity[i] += m.building_capacity[b] * infrastructure.get('amount', 0)
+
+            for building in data.get('buildings', []):
+                b = m.building_index.get(building.get('name'))
+                if b is None or building.get('amount', 0) <= 0:
+                    continue
+
+                workers[i] += m.building_workforce[b] * building['amount']
+                efficiency = cls._efficiency(m, b, tier_satisfaction, experts, plan)
+                cls._add_building(m, planet, building, efficiency, runs[i], extracted[i])
+
+        production = runs @ m.recipe_outputs + extracted
+        # workforce needs, weighted by hundreds of workers per tier and supplied need level
+        need_weights = (workers[:, :, None] / 100 * supplied).reshape(size, -1)
+        consumption = runs @ m.recipe_inputs + need_weights @ m.workforce_needs
+
+        results = []
+        for i in range(size):
+            active = np.flatnonzero(production[i] + consumption[i])
+            results.append(
+                {
+                    'materials': {
+                        m.materials[j]: {
+                            'p': float(production[i, j]),
+                            'c': float(consumption[i, j]),
+                            'd': float(production[i, j] - consumption[i, j]),
+                        }
+                        for j in active
+                    },
+                    'workforce': {
+                        tier: {'required': float(workers[i, t]), 'capacity': float(capacity[i, t])}
+                        for t, tier in enumerate(WORKFORCE_TIERS)
+                    },
+                }
+            )
+        return results
@@ -0,0 +1,64 @@
+from uuid import UUID
+
+from django.db import models
+from django.db.models import Case, F, Value, When
+from django_redis import get_redis_connection
+from planning.models import PlanningShared
+from planning.planning_cache_manager import PlanningCacheManager
+
+
+class SharedViewService:
+    """
+    View counts of shared plans, buffered in a Redis hash of share uuid to views not yet
+    written to `PlanningShared.view_count`.
+
+    Views only cost a HINCRBY. `flush` moves the buffered counts into the database in a single
+    UPDATE and drops the cached payloads of the flushed shares, so their `view_count` catches up.
+    """
+
+    KEY = 'planning:shared:views'
+
+    @classmethod
+    def increment(cls, shared_uuid: UUID | str) -> None:
+        get_redis_connection('default').hincrby(cls.KEY, str(shared_uuid), 1)
+
+    @classmethod
+    def flush(cls) -> int:
+        """Writes the buffered view counts, returns the number of views written."""
+
+        r = get_redis_connection('default')
+        # MULTI, views counted meanwhile land in a new hash
+        with r.pipeline(transaction=True) as pipe:
+            pipe.hgetall(cls.KEY)
+            pipe.delete(cls.KEY)
+            buffered, _ = pipe.execute()
+
+        counts = {key.decode(): int(value) for key, value in buffered.items()}
+        if not counts:
+            return 0
+
+        try:
+            PlanningShared.objects.filter(uuid__in=counts).update(
+                view_count=F('view_count')
+                + Case(
+                    *[When(uuid=uuid, then=Value(count)) for uuid, count in counts.items()],
+                    default=Value(0),
+                    output_field=models.PositiveIntegerField(),
+                )
+            )
+        except Exception:
+            # put the counts back for the next flush
+            with r.pipeline(transaction=False) as pipe:
+                for uuid, count in counts.items():
+                    pipe.hincrby(cls.KEY, uuid, count)
+                pipe.execute()
+            raise
+
+        PlanningCacheManager.delete_many(
+            [
+                PlanningCacheManager.key_for_shared_retrieve(user_id, uuid)
+                for uuid, user_id in PlanningShared.objects.filter(uuid__in=counts).values_list('uuid', 'user_id')
+            ]
+        )
+
+        return sum(counts.values())
@@ -1,68 +1,220 @@
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
 from typing import Any
 
+from core.services.cache_invalidation import CacheInvalidation
 from django.db import transaction
+from django.db.models import QuerySet
 from django.db.models.signals import post_delete, post_save
 from django.dispatch import receiver
-
-from planning.models import PlanningCX, PlanningEmpire, PlanningEmpirePlan, PlanningPlan
+from django.utils import timezone
+from user.models import User
+
+from planning.models import (
+    PlanningCX,
+    PlanningDeletion,
+    PlanningDeletionTypeChoices,
+    PlanningEmpire,
+    PlanningEmpirePlan,
+    PlanningPlan,
+    PlanningShared,
+)
 from planning.planning_cache_manager import PlanningCacheManager
 
+# set while bulk operations run, they purge the users caches once themselves
+_cache_invalidation_deferred: ContextVar[bool] = ContextVar('planning_cache_invalidation_deferred', default=False)
+
+
+@contextmanager
+def deferred_cache_invalidation() -> Iterator[None]:
+    """Skips the per-instance cache invalidation of plans, empires and junctions inside the block."""
+
+    token = _cache_invalidation_deferred.set(True)
+    try:
+        yield
+    finally:
+        _cache_invalidation_deferred.reset(token)
+
 
 @receiver([post_save, post_delete], sender=PlanningPlan, dispatch_uid='planning_invalidate_plan_caches')
 def invalidate_plan_caches(sender: type[PlanningPlan], instance: PlanningPlan, **kwargs: Any) -> None:
+    if _cache_invalidation_deferred.get():
+        return
+
     # get ids without additional db lookups
     user_id: int = instance.user_id  # type: ignore
     plan_uuid = instance.uuid
 
-    def clear_cache():
+    CacheInvalidation.delete(
         # lists
-        PlanningCacheManager.delete(PlanningCacheManager.key_for_plan_list(user_id))
-        PlanningCacheManager.delete(PlanningCacheManager.key_for_empire_list(user_id))
-        PlanningCacheManager.delete_pattern(f'*{user_id}:empire:retrieve*')
-
+        PlanningCacheManager.key_for_plan_list(user_id),
         # details
-        PlanningCacheManager.delete(PlanningCacheManager.key_plan_retrieve(user_id, plan_uuid))
+        PlanningCacheManager.key_plan_retrieve(user_id, plan_uuid),
+        PlanningCacheManager.key_plan_production(user_id, plan_uuid),
+    )
+    # shared payloads embed the plan with its empires
+    CacheInvalidation.delete_pattern(
+        f'*PLANNING:{user_id}:empire:retrieve:plans:*',
+        f'*PLANNING:{user_id}:shared:*',
+    )
+
+
+# plan fields of the empire documents, see planning.services.empire_document_service
+PLAN_DOCUMENT_FIELDS = {'plan_name', 'planet_natural_id'}
+
+
+@receiver(post_save, sender=PlanningPlan, dispatch_uid='planning_refresh_plan_empire_documents')
+def refresh_plan_empire_documents(
+    sender: type[PlanningPlan],
+    instance: PlanningPlan,
+    created: bool = False,
+    update_fields: frozenset | None = None,
+    **kwargs: Any,
+) -> None:
+    from planning.services.empire_document_service import EmpireDocumentService
+
+    # new plans are not linked yet, links refresh their empire in refresh_empire_plan_documents
+    if created or _cache_invalidation_deferred.get():
+        return
+    if update_fields is not None and not PLAN_DOCUMENT_FIELDS & update_fields:
+        return
+
+    empire_uuids = list(PlanningEmpirePlan.objects.filter(plan=instance).values_list('empire_id', flat=True))
+    if empire_uuids:
+        CacheInvalidation.refresh(EmpireDocumentService.refresh, instance.user_id, empire_uuids)  # type: ignore
 
-    transaction.on_commit(clear_cache)
+
+# plan fields the empire contribution depends on
+PLAN_CONTRIBUTION_FIELDS = {'plan_data', 'planet_natural_id', 'plan_cogc'}
+
+
+@receiver(post_save, sender=PlanningPlan, dispatch_uid='planning_refresh_plan_contribution')
+def refresh_plan_contribution(
+    sender: type[PlanningPlan], instance: PlanningPlan, update_fields: frozenset | None = None, **kwargs: Any
+) -> None:
+    from planning.tasks import planning_refresh_plan_contribution
+
+    if update_fields is not None and not PLAN_CONTRIBUTION_FIELDS & update_fields:
+        return
+
+    plan_uuid = str(instance.uuid)
+    transaction.on_commit(lambda: planning_refresh_plan_contribution.delay(plan_uuid))
 
 
 @receiver([post_save, post_delete], sender=PlanningEmpire, dispatch_uid='planning_invalidate_empire_caches')
 def invalidate_empire_caches(sender: type[PlanningEmpire], instance: PlanningEmpire, **kwargs: Any) -> None:
+    from planning.services.empire_document_service import EmpireDocumentService
+
+    if _cache_invalidation_deferred.get():
+        return
+
     # get ids without additional db lookups
     user_id: int = instance.user_id  # type: ignore
     empire_uuid = instance.uuid
 
-    def clear_cache():
-        # lists
-        PlanningCacheManager.delete(PlanningCacheManager.key_for_plan_list(user_id))
-        PlanningCacheManager.delete(PlanningCacheManager.key_for_empire_list(user_id))
-        PlanningCacheManager.delete_pattern(f'*{user_id}:empire:retrieve*')
+    # the list order changes with the set of empires and their names
+    update_fields = kwargs.get('update_fields')
+    reordered = update_fields is None or 'empire_name' in update_fields
 
-        # details
-        PlanningCacheManager.delete(PlanningCacheManager.key_for_empire_retrieve(user_id, empire_uuid))
+    CacheInvalidation.delete(
+        PlanningCacheManager.key_for_plan_list(user_id),
+        PlanningCacheManager.key_for_empire_retrieve_plans(user_id, empire_uuid),
+    )
+    CacheInvalidation.delete_pattern(f'*PLANNING:{user_id}:shared:*')
 
-    transaction.on_commit(clear_cache)
+    # read model
+    CacheInvalidation.refresh(EmpireDocumentService.refresh, user_id, [empire_uuid])
+    if reordered:
+        CacheInvalidation.delete(PlanningCacheManager.key_for_empire_index(user_id))
 
 
 @receiver([post_save, post_delete], sender=PlanningEmpirePlan, dispatch_uid='planning_invalidate_empire_plan_caches')
 def invalidate_empire_plan_caches(
     sender: type[PlanningEmpirePlan], instance: PlanningEmpirePlan, **kwargs: Any
 ) -> None:
+    from planning.services.empire_document_service import EmpireDocumentService
+
+    if _cache_invalidation_deferred.get():
+        return
+
     # get ids without additional db lookups
     user_id: int = instance.user_id  # type: ignore
+    empire_uuid, plan_uuid = instance.empire_id, instance.plan_id  # type: ignore
+
+    # the link is part of the empire and plan representations only
+    CacheInvalidation.delete(
+        PlanningCacheManager.key_plan_retrieve(user_id, plan_uuid),
+        PlanningCacheManager.key_for_empire_retrieve_plans(user_id, empire_uuid),
+    )
+    CacheInvalidation.delete_pattern(f'*PLANNING:{user_id}:shared:*')
+    CacheInvalidation.refresh(EmpireDocumentService.refresh, user_id, [empire_uuid])
+
 
-    def clear_cache():
-        PlanningCacheManager.delete_pattern(f'*PLANNING:{user_id}:*')
+@receiver([post_save, post_delete], sender=PlanningEmpirePlan, dispatch_uid='planning_update_empire_contribution')
+def update_empire_contribution(
+    sender: type[PlanningEmpirePlan], instance: PlanningEmpirePlan, created: bool = False, **kwargs: Any
+) -> None:
+    from planning.tasks import planning_attach_empire_plan, planning_detach_empire_plan
+
+    empire_uuid, plan_uuid = str(instance.empire_id), str(instance.plan_id)  # type: ignore
 
-    transaction.on_commit(clear_cache)
+    # post_delete sends no `created`, post_save of existing links changes nothing
+    if kwargs['signal'] is post_delete:
+        transaction.on_commit(lambda: planning_detach_empire_plan.delay(empire_uuid, plan_uuid))
+    elif created:
+        transaction.on_commit(lambda: planning_attach_empire_plan.delay(empire_uuid, plan_uuid))
 
 
 @receiver([post_save, post_delete], sender=PlanningCX, dispatch_uid='planning_invalidate_cx_caches')
 def invalidate_cx_caches(sender: type[PlanningCX], instance: PlanningCX, **kwargs: Any) -> None:
     user_id: int = instance.user_id  # type: ignore
 
-    def clear_cache():
-        # cxs are attached to plans and empires, so we need to do a full user cleaning
-        PlanningCacheManager.delete_pattern(f'*PLANNING:{user_id}:*')
+    # cxs are attached to plans and empires, so we need to do a full user cleaning
+    CacheInvalidation.delete_pattern(f'*PLANNING:{user_id}:*')
+
+
+@receiver(post_delete, sender=PlanningShared, dispatch_uid='planning_invalidate_shared_caches')
+def invalidate_shared_caches(sender: type[PlanningShared], instance: PlanningShared, **kwargs: Any) -> None:
+    CacheInvalidation.delete(PlanningCacheManager.key_for_shared_retrieve(instance.user_id, instance.uuid))  # type: ignore
+
+
+DELETION_TYPES: dict[type, PlanningDeletionTypeChoices] = {
+    PlanningPlan: PlanningDeletionTypeChoices.PLAN,
+    PlanningEmpire: PlanningDeletionTypeChoices.EMPIRE,
+    PlanningCX: PlanningDeletionTypeChoices.CX,
+}
+
+
+@receiver(post_delete, sender=PlanningPlan, dispatch_uid='planning_record_plan_deletion')
+@receiver(post_delete, sender=PlanningEmpire, dispatch_uid='planning_record_empire_deletion')
+@receiver(post_delete, sender=PlanningCX, dispatch_uid='planning_record_cx_deletion')
+def record_deletion(
+    sender: type[PlanningPlan | PlanningEmpire | PlanningCX],
+    instance: PlanningPlan | PlanningEmpire | PlanningCX,
+    origin: Any = None,
+    **kwargs: Any,
+) -> None:
+    # the user is deleted along, a tombstone would reference it
+    if isinstance(origin, User) or (isinstance(origin, QuerySet) and origin.model is User):
+        return
+
+    PlanningDeletion.objects.create(
+        user_id=instance.user_id,  # type: ignore
+        object_type=DELETION_TYPES[sender],
+        object_uuid=instance.uuid,
+    )
+
+
+@receiver([post_save, post_delete], sender=PlanningEmpirePlan, dispatch_uid='planning_touch_linked_objects')
+def touch_linked_objects(
+    sender: type[PlanningEmpirePlan], instance: PlanningEmpirePlan, created: bool = False, **kwargs: Any
+) -> None:
+    """Links are part of the empire and plan representations, changing one marks both as modified."""
+
+    if kwargs['signal'] is post_save and not created:
+        return
 
-    transaction.on_commit(clear_cache)
+    now = timezone.now()
+    PlanningEmpire.objects.filter(uuid=instance.empire_id).update(modified_at=now)  # type: ignore
+    PlanningPlan.objects.filter(uuid=instance.plan_id).update(modified_at=now)  # type: ignore
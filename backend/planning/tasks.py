@@ -0,0 +1,56 @@
+import structlog
+from celery import shared_task
+
+from planning.services.changes_service import PlanningChangesService
+from planning.services.empire_state_service import EmpireStateService
+from planning.services.shared_view_service import SharedViewService
+
+logger = structlog.get_logger(__name__)
+
+
+@shared_task(name='planning_refresh_plan_contribution')
+def planning_refresh_plan_contribution(plan_uuid: str):
+    structlog.contextvars.bind_contextvars(
+        task_category='planning_refresh_plan_contribution',
+    )
+
+    empire_count = EmpireStateService.refresh_plan(plan_uuid)
+    logger.info('plan_contribution_refreshed', plan_uuid=plan_uuid, empires=empire_count)
+
+
+@shared_task(name='planning_attach_empire_plan')
+def planning_attach_empire_plan(empire_uuid: str, plan_uuid: str):
+    structlog.contextvars.bind_contextvars(
+        task_category='planning_attach_empire_plan',
+    )
+
+    EmpireStateService.attach_plan(empire_uuid, plan_uuid)
+
+
+@shared_task(name='planning_detach_empire_plan')
+def planning_detach_empire_plan(empire_uuid: str, plan_uuid: str):
+    structlog.contextvars.bind_contextvars(
+        task_category='planning_detach_empire_plan',
+    )
+
+    EmpireStateService.detach_plan(empire_uuid, plan_uuid)
+
+
+@shared_task(name='planning_purge_deletions')
+def planning_purge_deletions():
+    structlog.contextvars.bind_contextvars(
+        task_category='planning_purge_deletions',
+    )
+
+    deleted = PlanningChangesService.purge_deletions()
+    logger.info('deletions_purged', deleted=deleted)
+
+
+@shared_task(name='planning_flush_shared_views')
+def planning_flush_shared_views():
+    structlog.contextvars.bind_contextvars(
+        task_category='planning_flush_shared_views',
+    )
+
+    views = SharedViewService.flush()
+    logger.info('shared_views_flushed', views=views)
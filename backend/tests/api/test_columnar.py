@@ -0,0 +1,30 @@
+import pytest
+from api.columnar import LAYOUT_COLUMNS, LAYOUT_ROWS, requested_layout, to_columns
+from rest_framework.exceptions import ValidationError
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory
+
+
+class TestColumnar:
+    def test_to_columns(self):
+        assert to_columns(['ticker', 'price'], [('DW', 1.5), ('RAT', 2.0)]) == {
+            'columns': ['ticker', 'price'],
+            'data': {'ticker': ['DW', 'RAT'], 'price': [1.5, 2.0]},
+        }
+
+    def test_to_columns_empty(self):
+        assert to_columns(['ticker', 'price'], []) == {
+            'columns': ['ticker', 'price'],
+            'data': {'ticker': [], 'price': []},
+        }
+
+    @pytest.mark.parametrize(
+        'query, expected',
+        [({}, LAYOUT_ROWS), ({'layout': 'rows'}, LAYOUT_ROWS), ({'layout': 'columns'}, LAYOUT_COLUMNS)],
+    )
+    def test_requested_layout(self, query, expected):
+        assert requested_layout(Request(APIRequestFactory().get('/', query))) == expected
+
+    def test_requested_layout_invalid(self):
+        with pytest.raises(ValidationError):
+            requested_layout(Request(APIRequestFactory().get('/', {'layout': 'table'})))
@@ -0,0 +1,31 @@
+import pytest
+from api.fieldsets import requested_fields
+from rest_framework.exceptions import ValidationError
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory
+
+AVAILABLE = ['uuid', 'plan_name', 'plan_data']
+
+
+def _request(query: dict) -> Request:
+    return Request(APIRequestFactory().get('/', query))
+
+
+class TestFieldsets:
+    @pytest.mark.parametrize(
+        'query, expected',
+        [
+            ({}, None),
+            ({'fields': 'plan_name,uuid'}, ['uuid', 'plan_name']),
+            ({'fields': ' uuid , '}, ['uuid']),
+            ({'fields': '-plan_data'}, ['uuid', 'plan_name']),
+            ({'fields': '-plan_data,-uuid'}, ['plan_name']),
+        ],
+    )
+    def test_requested_fields(self, query, expected):
+        assert requested_fields(_request(query), AVAILABLE) == expected
+
+    @pytest.mark.parametrize('fields', ['', 'uuid,-plan_data', 'unknown', '-unknown'])
+    def test_requested_fields_invalid(self, fields):
+        with pytest.raises(ValidationError):
+            requested_fields(_request({'fields': fields}), AVAILABLE)
@@ -0,0 +1,58 @@
+import io
+from unittest.mock import MagicMock
+
+import orjson
+import pytest
+from api.parsers import PydanticJSONParser
+from core.fields import PrevalidatedJSONField, ValidatedJSON
+from django.db import connection
+from planning.api.serializers import PlanningPlanDetailSerializer
+from planning.schemas.latest_schemas import LATEST_SCHEMA
+from rest_framework.exceptions import ParseError
+from tests.fixtures.planning.fxt_plan_vallis import plan_data_vallis
+
+PLAN_MODEL = LATEST_SCHEMA['PLANNING_DATA']
+
+
+def parse(body: bytes):
+    view = MagicMock()
+    view.get_serializer_class.return_value = PlanningPlanDetailSerializer
+    return PydanticJSONParser().parse(io.BytesIO(body), parser_context={'view': view})
+
+
+class TestPydanticJSONParser:
+    def test_validates_fields_while_parsing(self):
+        data = parse(orjson.dumps({'plan_name': 'Vallis', 'plan_data': plan_data_vallis}))
+
+        assert data['plan_name'] == 'Vallis'
+        assert isinstance(data['plan_data'], ValidatedJSON)
+        assert data['plan_data'].schema is PLAN_MODEL
+        assert data['plan_data'] == PLAN_MODEL.model_validate(plan_data_vallis).model_dump()
+        assert orjson.loads(data['plan_data'].json) == data['plan_data']
+
+    def test_missing_fields_stay_missing(self):
+        assert parse(b'{"plan_name": "Vallis"}') == {'plan_name': 'Vallis'}
+
+    @pytest.mark.parametrize(
+        'body, expected',
+        [
+            (b'{"plan_data": {"buildings": 1}}', {'plan_data': {'buildings': 1}}),
+            (b'[1, 2]', [1, 2]),
+        ],
+    )
+    def test_invalid_bodies_parse_as_plain_json(self, body, expected):
+        data = parse(body)
+
+        assert data == expected
+        assert not isinstance(data, dict) or not isinstance(data['plan_data'], ValidatedJSON)
+
+    def test_malformed_json(self):
+        with pytest.raises(ParseError):
+            parse(b'{"plan_data": ')
+
+    def test_field_stores_the_encoding(self):
+        field = PrevalidatedJSONField()
+        value = ValidatedJSON({'a': 1}, PLAN_MODEL, '{"a":1}')
+
+        assert field.get_db_prep_value(value, connection) == '{"a":1}'
+        assert field.get_db_prep_value({'a': 1}, connection) == '{"a": 1}'
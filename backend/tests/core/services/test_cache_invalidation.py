@@ -0,0 +1,52 @@
+from unittest.mock import MagicMock, patch
+
+import pytest
+from core.services.cache_invalidation import CacheInvalidation, _pending
+from django.db import transaction
+
+pytestmark = pytest.mark.django_db
+
+
+@pytest.fixture
+def purge():
+    # work left over by rolled back test transactions
+    _pending.set(None)
+    with patch('core.services.cache_invalidation.CacheManager.purge') as purge:
+        yield purge
+
+
+class TestCacheInvalidation:
+    def test_transaction_is_flushed_once(self, purge, django_capture_on_commit_callbacks):
+        refresh = MagicMock()
+
+        with django_capture_on_commit_callbacks(execute=True) as callbacks, transaction.atomic():
+            for i in range(3):
+                CacheInvalidation.delete('PLANNING:1:plan:list', f'PLANNING:2:plan:retrieve:{i}')
+                CacheInvalidation.delete_pattern('*PLANNING:1:shared:*', '*PLANNING:2:shared:*')
+                CacheInvalidation.refresh(refresh, 1, [f'empire-{i}'])
+            CacheInvalidation.delete_pattern('*PLANNING:1:*')
+
+            purge.assert_not_called()
+
+        assert len(callbacks) == 10
+        # keys and patterns covered by the user namespace of user 1 are dropped
+        purge.assert_called_once_with(
+            {'PLANNING:2:plan:retrieve:0', 'PLANNING:2:plan:retrieve:1', 'PLANNING:2:plan:retrieve:2'},
+            {'*PLANNING:1:*', '*PLANNING:2:shared:*'},
+        )
+        refresh.assert_called_once_with(1, {'empire-0', 'empire-1', 'empire-2'})
+
+    def test_flush_without_work(self, purge):
+        CacheInvalidation.flush()
+        purge.assert_not_called()
+
+    @pytest.mark.django_db(transaction=True)
+    def test_runs_right_away_outside_of_a_transaction(self, purge):
+        refresh = MagicMock()
+
+        CacheInvalidation.delete('PLANNING:1:plan:list')
+        purge.assert_called_once_with({'PLANNING:1:plan:list'}, set())
+
+        CacheInvalidation.refresh(refresh, 1, ['empire'])
+        refresh.assert_called_once_with(1, {'empire'})
+        assert purge.call_count == 2
@@ -28,6 +28,27 @@ class TestCacheManager:
         CacheManager.delete_pattern('user:*')
         mock_cache.delete_pattern.assert_called_with('user:*')
 
+    @patch('core.services.cache_manager.get_redis_connection')
+    @patch('core.services.cache_manager.cache')
+    def test_purge(self, mock_cache, mock_connection):
+        mock_cache.make_key.side_effect = lambda key: f':1:{key}'
+        redis = mock_connection.return_value
+        redis.scan_iter.return_value = iter([':1:p:1', ':1:k:1'])
+        pipe = redis.pipeline.return_value.__enter__.return_value
+        pipe.execute.return_value = [2]
+
+        assert CacheManager.purge(['k:1'], ['p:*']) == 2
+
+        redis.scan_iter.assert_called_once_with(match=':1:p:*', count=CacheManager.PURGE_BATCH_SIZE)
+        redis.pipeline.assert_called_once_with(transaction=False)
+        pipe.delete.assert_called_once()
+        assert set(pipe.delete.call_args.args) == {':1:p:1', ':1:k:1'}
+
+    @patch('core.services.cache_manager.get_redis_connection')
+    def test_purge_nothing(self, mock_connection):
+        assert CacheManager.purge([], []) == 0
+        mock_connection.assert_not_called()
+
     @patch('core.services.cache_manager.cache')
     def test_get_response(self, mock_cache):
 
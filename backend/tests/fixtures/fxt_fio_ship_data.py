@@ -1,2944 +1,3 @@
-fio_ship_data = [
-    {
-        'Name': 'Hydrogen',
-        'ShipId': '09b5c5080f7c1e2c46aff0b66a33bf09',
-        'StoreId': '63556c02d9d03a2ff2aa005bac3885f3',
-        'Location': 'Antares I (ZV-307) - STATION',
-        'Condition': 0.9401990175247192,
-        'AddressLines': [
-            {
-                'Name': 'Antares I',
-                'LineId': '8ecf9670ba070d78cfb5537e8d9f1b6c',
-                'LineType': 'SYSTEM',
-                'NaturalId': 'ZV-307',
-            },
-            {
-                'Name': 'Antares Station',
-                'LineId': '1deca369a92788b8079e7ac245be66f7',
-                'LineType': 'STATION',
-                'NaturalId': 'ANT',
-            },
-        ],
-        'Registration': 'AVI-01CC1',
-        'FtlFuelStoreId': 'ba7f0bcf3f55085e465ee5bfe98eca1e',
-        'StlFuelStoreId': 'fa7e608a026510ae9c54eeaf1d81c5f2',
-        'RepairMaterials': [
-            {
-                'Amount': 3,
-                'MaterialId': 'c03644ad9e74ee585b1148f608010003',
-                'MaterialName': 'basicHullPlate',
-                'MaterialTicker': 'BHP',
-                'ShipRepairMaterialId': '09b5c5080f7c1e2c46aff0b66a33bf09-BHP',
-            },
-            {
-                'Amount': 4,
-                'MaterialId': 'b700f9670131981590e77238d7c207d3',
-                'MaterialName': 'structuralSpacecraftComponent',
-                'MaterialTicker': 'SSC',
-                'ShipRepairMaterialId': '09b5c5080f7c1e2c46aff0b66a33bf09-SSC',
-            },
-            {
-                'Amount': 12,
-                'MaterialId': '432414a579f1fccd66136b257eb44408',
-                'MaterialName': 'fastenerKitMedium',
-                'MaterialTicker': 'MFK',
-                'ShipRepairMaterialId': '09b5c5080f7c1e2c46aff0b66a33bf09-MFK',
-            },
-            {
-                'Amount': 8,
-                'MaterialId': 'f1d402957a88fd396f302372a6912158',
-                'MaterialName': 'fluidPiping',
-                'MaterialTicker': 'FLP',
-                'ShipRepairMaterialId': '09b5c5080f7c1e2c46aff0b66a33bf09-FLP',
-            },
-        ],
-        'LastRepairEpochMs': 0,
-        'CommissioningTimeEpochMs': 1664344241429,
-    },
-    {
-        'Name': '53 Iodine',
-        'ShipId': '0f99161e9049c837a4c72956502dd9a3',
-        'StoreId': '7ec07f84e2dd177e794d32fab0e4f1e3',
-        'Location': 'Antares I (ZV-307) - STATION',
-        'Condition': 0.9706943035125732,
-        'AddressLines': [
-            {
-                'Name': 'Antares Station',
-                'LineId': '1deca369a92788b8079e7ac245be66f7',
-                'LineType': 'STATION',
-                'NaturalId': 'ANT',
-            },
-            {
-                'Name': 'Antares I',
-                'LineId': '8ecf9670ba070d78cfb5537e8d9f1b6c',
-                'LineType': 'SYSTEM',
-                'NaturalId': 'ZV-307',
-            },
-        ],
-        'Registration': 'AVI-06MYQ',
-        'FtlFuelStoreId': 'ed6b06d30e59af388e0fd727403a33f8',
-        'StlFuelStoreId': '287a4c85a47c3ed447ca4c62c1388c66',
-        'RepairMaterials': [
-            {
-                'Amount': 8,
-                'MaterialId': 'f1d402957a88fd396f302372a6912158',
-                'MaterialName': 'fluidPiping',
-                'MaterialTicker': 'FLP',
-                'ShipRepairMaterialId': '0f99161e9049c837a4c72956502dd9a3-FLP',
-            },
-            {
-                'Amount': 12,
-                'MaterialId': '432414a579f1fccd66136b257eb44408',
-                'MaterialName': 'fastenerKitMedium',
-                'MaterialTicker': 'MFK',
-                'ShipRepairMaterialId': '0f99161e9049c837a4c72956502dd9a3-MFK',
-            },
-            {
-                'Amount': 3,
-                'MaterialId': 'b700f9670131981590e77238d7c207d3',
-                'MaterialName': 'structuralSpacecraftComponent',
-                'MaterialTicker': 'SSC',
-                'ShipRepairMaterialId': '0f99161e9049c837a4c72956502dd9a3-SSC',
-            },
-            {
-                'Amount': 3,
-                'MaterialId': 'f3f12b5b3adebdd25f3067e5aa4589f0',
-                'MaterialName': 'lightweightHullPlate',
-                'MaterialTicker': 'LHP',
-                'ShipRepairMaterialId': '0f99161e9049c837a4c72956502dd9a3-LHP',
-            },
-        ],
-        'LastRepairEpochMs': None,
-        'CommissioningTimeEpochMs': 1770097964602,
-    },
-    {
-        'Name': 'Germanium',
-        'ShipId': '13c545faa7e5bac208310aba8193cb1f',
-        'StoreId': '287ca0b87a9e111f6efe534a1224680f',
-        'Location': 'Antares I (ZV-307) - STATION',
-        'Condition': 0.9808261394500732,
-        'AddressLines': [
-            {
-                'Name': 'Antares I',
-                'LineId': '8ecf9670ba070d78cfb5537e8d9f1b6c',
-                'LineType': 'SYSTEM',
-                'NaturalId': 'ZV-307',
-            },
-            {
-                'Name': 'Antares Station',
-                'LineId': '1deca369a92788b8079e7ac245be66f7',
-                'LineType': 'STATION',
-                'NaturalId': 'ANT',
-            },
-        ],
-        'Registration': 'AVI-06K6M',
-        'FtlFuelStoreId': 'c0b49860f357b839ba74e66f1504d8be',
-        'StlFuelStoreId': '1798a6a46337d863ff17952be16ab528',
-        'RepairMaterials': [
-            {
-                'Amount': 8,
-                'MaterialId': 'f1d402957a88fd396f302372a6912158',
-                'MaterialName': 'fluidPiping',
-                'MaterialTicker': 'FLP',
-                'ShipRepairMaterialId': '13c545faa7e5bac208310aba8193cb1f-FLP',
-            },
-            {
-                'Amount': 2,
-                'MaterialId': 'f3f12b5b3adebdd25f3067e5aa4589f0',
-                'MaterialName': 'lightweightHullPlate',
-                'MaterialTicker': 'LHP',
-                'ShipRepairMaterialId': '13c545faa7e5bac208310aba8193cb1f-LHP',
-            },
-            {
-                'Amount': 2,
-                'MaterialId': 'b700f9670131981590e77238d7c207d3',
-                'MaterialName': 'structuralSpacecraftComponent',
-                'MaterialTicker': 'SSC',
-                'ShipRepairMaterialId': '13c545faa7e5bac208310aba8193cb1f-SSC',
-            },
-            {
-                'Amount': 12,
-                'MaterialId': '432414a579f1fccd66136b257eb44408',
-                'MaterialName': 'fastenerKitMedium',
-                'MaterialTicker': 'MFK',
-                'ShipRepairMaterialId': '13c545faa7e5bac208310aba8193cb1f-MFK',
-            },
-        ],
-        'LastRepairEpochMs': None,
-        'CommissioningTimeEpochMs': 1768393968524,
-    },
-    {
-        'Name': 'Titanium',
-        'ShipId': '22f309cda9d4e088545376dd40bc4b9f',
-        'StoreId': '76fa7ab2ab52b936f8d52a02cf015df9',
-        'Location': 'Antares I (ZV-307) - STATION',
-        'Condition': 0.9623362421989441,
-        'AddressLines': [
-            {
-                'Name': 'Antares I',
-                'LineId': '8ecf9670ba070d78cfb5537e8d9f1b6c',
-                'LineType': 'SYSTEM',
-                'NaturalId': 'ZV-307',
-            },
-            {
-                'Name': 'Antares Station',
-                'LineId': '1deca369a92788b8079e7ac245be66f7',
-                'LineType': 'STATION',
-                'NaturalId': 'ANT',
-            },
-        ],
-        'Registration': 'AVI-056GF',
-        'FtlFuelStoreId': 'c9c0cd3b4fe083c8b25c62aac800e887',
-        'StlFuelStoreId': '9652a3526c68b902acf5816572153229',
-        'RepairMaterials': [
-            {
-                'Amount': 3,
-                'MaterialId': 'f3f12b5b3adebdd25f3067e5aa4589f0',
-                'MaterialName': 'lightweightHullPlate',
-                'MaterialTicker': 'LHP',
-                'ShipRepairMaterialId': '22f309cda9d4e088545376dd40bc4b9f-LHP',
-            },
-            {
-                'Amount': 4,
-                'MaterialId': 'b700f9670131981590e77238d7c207d3',
-                'MaterialName': 'structuralSpacecraftComponent',
-                'MaterialTicker': 'SSC',
-                'ShipRepairMaterialId': '22f309cda9d4e088545376dd40bc4b9f-SSC',
-            },
-            {
-                'Amount': 12,
-                'MaterialId': '432414a579f1fccd66136b257eb44408',
-                'MaterialName': 'fastenerKitMedium',
-                'MaterialTicker': 'MFK',
-                'ShipRepairMaterialId': '22f309cda9d4e088545376dd40bc4b9f-MFK',
-            },
-            {
-                'Amount': 8,
-                'MaterialId': 'f1d402957a88fd396f302372a6912158',
-                'MaterialName': 'fluidPiping',
-                'MaterialTicker': 'FLP',
-                'ShipRepairMaterialId': '22f309cda9d4e088545376dd40bc4b9f-FLP',
-            },
-        ],
-        'LastRepairEpochMs': 0,
-        'CommissioningTimeEpochMs': 1723122467148,
-    },
-    {
-        'Name': 'Molybdenum',
-        'ShipId': '260f304a705e06d8bb003296dd5f8953',
-        'StoreId': '152577aebc889b7fbc218de504d2d1cc',
-        'Location': 'Antares I (ZV-307) - STATION',
-        'Condition': 0.9977940320968628,
-        'AddressLines': [
-            {
-                'Name': 'Antares Station',
-                'LineId': '1deca369a92788b8079e7ac245be66f7',
-                'LineType': 'STATION',
-                'NaturalId': 'ANT',
-            },
-            {
-                'Name': 'Antares I',
-                'LineId': '8ecf9670ba070d78cfb5537e8d9f1b6c',
-                'LineType': 'SYSTEM',
-                'NaturalId': 'ZV-307',
-            },
-        ],
-        'Registration': 'AVI-06M36',
-        'FtlFuelStoreId': 'a68826e8a1627203ea043c9418043161',
-        'StlFuelStoreId': 'd3bda61a55b9a88f63954c3e1ade2861',
-        'RepairMaterials': [
-            {
-                'Amount': 1,
-                'MaterialId': 'f3f12b5b3adebdd25f3067e5aa4589f0',
-                'MaterialName': 'lightweightHullPlate',
-                'MaterialTicker': 'LHP',
-                'ShipRepairMaterialId': '260f304a705e06d8bb003296dd5f8953-LHP',
-            },
-            {
-                'Amount': 8,
-                'MaterialId': 'f1d402957a88fd396f302372a6912158',
-                'MaterialName': 'fluidPiping',
-                'MaterialTicker': 'FLP',
-                'ShipRepairMaterialId': '260f304a705e06d8bb003296dd5f8953-FLP',
-            },
-            {
-                'Amount': 12,
-                'MaterialId': '432414a579f1fccd66136b257eb44408',
-                'MaterialName': 'fastenerKitMedium',
-                'MaterialTicker': 'MFK',
-                'ShipRepairMaterialId': '260f304a705e06d8bb003296dd5f8953-MFK',
-            },
-            {
-                'Amount': 1,
-                'MaterialId': 'b700f9670131981590e77238d7c207d3',
-                'MaterialName': 'structuralSpacecraftComponent',
-                'MaterialTicker': 'SSC',
-                'ShipRepairMaterialId': '260f304a705e06d8bb003296dd5f8953-SSC',
-            },
-        ],
-        'LastRepairEpochMs': None,
-        'CommissioningTimeEpochMs': 1769503340006,
-    },
-    {
-        'Name': 'Boron',
-        'ShipId': '2b14db4e8fd72dd90e0b1a9b3a91e005',
-        'StoreId': '12649736a2ab94316983fbe42e73c725',
-        'Location': 'Antares I (ZV-307) - STATION',
-        'Condition': 0.862632691860199,
-        'AddressLines': [
-            {
-                'Name': 'Antares I',
-                'LineId': '8ecf9670ba070d78cfb5537e8d9f1b6c',
-                'LineType': 'SYSTEM',
-                'NaturalId': 'ZV-307',
-            },
-            {
-                'Name': 'Antares Station',
-                'LineId': '1deca369a92788b8079e7ac245be66f7',
-                'LineType': 'STATION',
-                'NaturalId': 'ANT',
-            },
-        ],
-        'Registration': 'AVI-03CXE',
-        'FtlFuelStoreId': 'e866d57d6031632c141aa4b012fffe57',
-        'StlFuelStoreId': '2f78a2743d1eb6fbbee30428a971aefa',
-        'RepairMaterials': [
-            {
-                'Amount': 10,
-                'MaterialId': 'f3f12b5b3adebdd25f3067e5aa4589f0',
-                'MaterialName': 'lightweightHullPlate',
-                'MaterialTicker': 'LHP',
-                'ShipRepairMaterialId': '2b14db4e8fd72dd90e0b1a9b3a91e005-LHP',
-            },
-            {
-                'Amount': 8,
-                'MaterialId': 'f1d402957a88fd396f302372a6912158',
-                'MaterialName': 'fluidPiping',
-                'MaterialTicker': 'FLP',
-                'ShipRepairMaterialId': '2b14db4e8fd72dd90e0b1a9b3a91e005-FLP',
-            },
-            {
-                'Amount': 12,
-                'MaterialId': '432414a579f1fccd66136b257eb44408',
-                'MaterialName': 'fastenerKitMedium',
-                'MaterialTicker': 'MFK',
-                'ShipRepairMaterialId': '2b14db4e8fd72dd90e0b1a9b3a91e005-MFK',
-            },
-            {
-                'Amount': 14,
-                'MaterialId': 'b700f9670131981590e77238d7c207d3',
-                'MaterialName': 'structuralSpacecraftComponent',
-                'MaterialTicker': 'SSC',
-                'ShipRepairMaterialId': '2b14db4e8fd72dd90e0b1a9b3a91e005-SSC',
-            },
-        ],
-        'LastRepairEpochMs': 0,
-        'CommissioningTimeEpochMs': 1680587732391,
-    },
-    {
-        'Name': 'Manganese',
-        'ShipId': '3528adb0e89f733b199363da3ed8aa1b',
-        'StoreId': '7eb744a18c6668e822157a88712f5875',
-        'Location': 'Antares I (ZV-307) - STATION',
-        'Condition': 0.9349309802055359,
-        'AddressLines': [
-            {
-                'Name': 'Antares I',
-                'LineId': '8ecf9670ba070d78cfb5537e8d9f1b6c',
-                'LineType': 'SYSTEM',
-                'NaturalId': 'ZV-307',
-            },
-            {
-                'Name': 'Antares Station',
-                'LineId': '1deca369a92788b8079e7ac245be66f7',
-                'LineType': 'STATION',
-                'NaturalId': 'ANT',
-            },
-        ],
-        'Registration': 'AVI-060OH',
-        'FtlFuelStoreId': '9145bd9150d93f38d5a5c01d9f729ebd',
-        'StlFuelStoreId': '10a1725450549ca911036239f2fd5ea4',
-        'RepairMaterials': [
-            {
-                'Amount': 12,
-                'MaterialId': '432414a579f1fccd66136b257eb44408',
-                'MaterialName': 'fastenerKitMedium',
-                'MaterialTicker': 'MFK',
-                'ShipRepairMaterialId': '3528adb0e89f733b199363da3ed8aa1b-MFK',
-            },
-            {
-                'Amount': 8,
-                'MaterialId': 'f1d402957a88fd396f302372a6912158',
-                'MaterialName': 'fluidPiping',
-                'MaterialTicker': 'FLP',
-                'ShipRepairMaterialId': '3528adb0e89f733b199363da3ed8aa1b-FLP',
-            },
-            {
-                'Amount': 7,
-                'MaterialId': 'b700f9670131981590e77238d7c207d3',
-                'MaterialName': 'structuralSpacecraftComponent',
-                'MaterialTicker': 'SSC',
-                'ShipRepairMaterialId': '3528adb0e89f733b199363da3ed8aa1b-SSC',
-            },
-            {
-                'Amount': 5,
-                'MaterialId': 'f3f12b5b3adebdd25f3067e5aa4589f0',
-                'MaterialName': 'lightweightHullPlate',
-                'MaterialTicker': 'LHP',
-                'ShipRepairMaterialId': '3528adb0e89f733b199363da3ed8aa1b-LHP',
-            },
-        ],
-        'LastRepairEpochMs': None,
-        'CommissioningTimeEpochMs': 1753361827446,
-    },
-    {
-        'Name': 'Palladium',
-        'ShipId': '3e8a23cf3dc8fe97f89f20dbdc992a28',
-        'StoreId': '5fd796088f3d139337339652541d2107',
-        'Location': 'Antares I (ZV-307) - STATION',
-        'Condition': 0.9987308979034424,
-        'AddressLines': [
-            {
-                'Name': 'Antares I',
-                'LineId': '8ecf9670ba070d78cfb5537e8d9f1b6c',
-                'LineType': 'SYSTEM',
-                'NaturalId': 'ZV-307',
-            },
-            {
-                'Name': 'Antares Station',
-                'LineId': '1deca369a92788b8079e7ac245be66f7',
-                'LineType': 'STATION',
-                'NaturalId': 'ANT',
-            },
-        ],
-        'Registration': 'AVI-06ML0',
-        'FtlFuelStoreId': '98c6744302aeac946ca731ebea2b8c63',
-        'StlFuelStoreId': '85b9462b5bc03c0f314823ab859c9264',
-        'RepairMaterials': [
-            {
-                'Amount': 8,
-                'MaterialId': 'f1d402957a88fd396f302372a6912158',
-                'MaterialName': 'fluidPiping',
-                'MaterialTicker': 'FLP',
-                'ShipRepairMaterialId': '3e8a23cf3dc8fe97f89f20dbdc992a28-FLP',
-            },
-            {
-                'Amount': 1,
-                'MaterialId': 'f3f12b5b3adebdd25f3067e5aa4589f0',
-                'MaterialName': 'lightweightHullPlate',
-                'MaterialTicker': 'LHP',
-                'ShipRepairMaterialId': '3e8a23cf3dc8fe97f89f20dbdc992a28-LHP',
-            },
-            {
-                'Amount': 1,
-                'MaterialId': 'b700f9670131981590e77238d7c207d3',
-                'MaterialName': 'structuralSpacecraftComponent',
-                'MaterialTicker': 'SSC',
-                'ShipRepairMaterialId': '3e8a23cf3dc8fe97f89f20dbdc992a28-SSC',
-            },
-            {
-                'Amount': 12,
-                'MaterialId': '432414a579f1fccd66136b257eb44408',
-                'MaterialName': 'fastenerKitMedium',
-                'MaterialTicker': 'MFK',
-                'ShipRepairMaterialId': '3e8a23cf3dc8fe97f89f20dbdc992a28-MFK',
-            },
-        ],
-        'LastRepairEpochMs': None,
-        'CommissioningTimeEpochMs': 1769850532027,
-    },
-    {
-        'Name': 'Strontium',
-        'ShipId': '44430f53bf6e837ad79821d8d213d9ab',
-        'StoreId': '2ddd9021f3e4be99267797fc8f9dcbee',
-        'Location': 'Antares I (ZV-307) - STATION',
-        'Condition': 0.9859979152679443,
-        'AddressLines': [
-            {
-                'Name': 'Antares I',
-                'LineId': '8ecf9670ba070d78cfb5537e8d9f1b6c',
-                'LineType': 'SYSTEM',
-                'NaturalId': 'ZV-307',
-            },
-            {
-                'Name': 'Antares Station',
-                'LineId': '1deca369a92788b8079e7ac245be66f7',
-                'LineType': 'STATION',
-                'NaturalId': 'ANT',
-            },
-        ],
-        'Registration': 'AVI-06LMI',
-        'FtlFuelStoreId': '506d400efb8e9f0a6389a81c0cd1c44c',
-        'StlFuelStoreId': '050bbc2743fdc746c04a9286282409d3',
-        'RepairMaterials': [
-            {
-                'Amount': 1,
-                'MaterialId': 'f3f12b5b3adebdd25f3067e5aa4589f0',
-                'MaterialName': 'lightweightHullPlate',
-                'MaterialTicker': 'LHP',
-                'ShipRepairMaterialId': '44430f53bf6e837ad79821d8d213d9ab-LHP',
-            },
-            {
-                'Amount': 8,
-                'MaterialId': 'f1d402957a88fd396f302372a6912158',
-                'MaterialName': 'fluidPiping',
-                'MaterialTicker': 'FLP',
-                'ShipRepairMaterialId': '44430f53bf6e837ad79821d8d213d9ab-FLP',
-            },
-            {
-                'Amount': 12,
-                'MaterialId': '432414a579f1fccd66136b257eb44408',
-                'MaterialName': 'fastenerKitMedium',
-                'MaterialTicker': 'MFK',
-                'ShipRepairMaterialId': '44430f53bf6e837ad79821d8d213d9ab-MFK',
-            },
-            {
-                'Amount': 2,
-                'MaterialId': 'b700f9670131981590e77238d7c207d3',
-                'MaterialName': 'structuralSpacecraftComponent',
-                'MaterialTicker': 'SSC',
-                'ShipRepairMaterialId': '44430f53bf6e837ad79821d8d213d9ab-SSC',
-            },
-        ],
-        'LastRepairEpochMs': None,
-        'CommissioningTimeEpochMs': 1769232380363,
-    },
-    {
-        'Name': 'Tellurium',
-        'ShipId': '477742fec32e2b0feb0771bb944696d6',
-        'StoreId': '7ba3ebb28b24de18804ad1d773fccf00',
-        'Location': 'Antares I (ZV-307) - STATION',
-        'Condition': 0.9977656602859497,
-        'AddressLines': [
-            {
-                'Name': 'Antares Station',
-                'LineId': '1deca369a92788b8079e7ac245be66f7',
-                'LineType': 'STATION',
-                'NaturalId': 'ANT',
-            },
-            {
-                'Name': 'Antares I',
-                'LineId': '8ecf9670ba070d78cfb5537e8d9f1b6c',
-                'LineType': 'SYSTEM',
-                'NaturalId': 'ZV-307',
-            },
-        ],
-        'Registration': 'AVI-06MYP',
-        'FtlFuelStoreId': '6a2874bddf584c2f1335ca2d150b8057',
-        'StlFuelStoreId': 'b349076c45d3c1d76947b4b044fe5e17',
-        'RepairMaterials': [
-            {
-                'Amount': 8,
-                'MaterialId': 'f1d402957a88fd396f302372a6912158',
-                'MaterialName': 'fluidPiping',
-                'MaterialTicker': 'FLP',
-                'ShipRepairMaterialId': '477742fec32e2b0feb0771bb944696d6-FLP',
-            },
-            {
-                'Amount': 1,
-                'MaterialId': 'f3f12b5b3adebdd25f3067e5aa4589f0',
-                'MaterialName': 'lightweightHullPlate',
-                'MaterialTicker': 'LHP',
-                'ShipRepairMaterialId': '477742fec32e2b0feb0771bb944696d6-LHP',
-            },
-            {
-                'Amount': 1,
-                'MaterialId': 'b700f9670131981590e77238d7c207d3',
-                'MaterialName': 'structuralSpacecraftComponent',
-                'MaterialTicker': 'SSC',
-                'ShipRepairMaterialId': '477742fec32e2b0feb0771bb944696d6-SSC',
-            },
-            {
-                'Amount': 12,
-                'MaterialId': '432414a579f1fccd66136b257eb44408',
-                'MaterialName': 'fastenerKitMedium',
-                'MaterialTicker': 'MFK',
-                'ShipRepairMaterialId': '477742fec32e2b0feb0771bb944696d6-MFK',
-            },
-        ],
-        'LastRepairEpochMs': None,
-        'CommissioningTimeEpochMs': 1770097963414,
-    },
-    {
-        'Name': 'Calcium',
-        'ShipId': '490df9657539e5eecb445c3ffd2d6cc6',
-        'StoreId': '963ef57a155122f81dc8e9ae85a1cc8e',
-        'Location': 'Antares I (ZV-307) - STATION',
-        'Condition': 0.8837310075759888,
-        'AddressLines': [
-            {
-                'Name': 'Antares Station',
-                'LineId': '1deca369a92788b8079e7ac245be66f7',
-                'LineType': 'STATION',
-                'NaturalId': 'ANT',
-            },
-            {
-                'Name': 'Antares I',
-                'LineId': '8ecf9670ba070d78cfb5537e8d9f1b6c',
-                'LineType': 'SYSTEM',
-                'NaturalId': 'ZV-307',
-            },
-        ],
-        'Registration': 'AVI-04WDB',
-        'FtlFuelStoreId': '6d340b75bb7a41054837a29a755bbbd4',
-        'StlFuelStoreId': '47cc0425adbc764df4eb0b2ab1257060',
-        'RepairMaterials': [
-            {
-                'Amount': 12,
-                'MaterialId': 'b700f9670131981590e77238d7c207d3',
-                'MaterialName': 'structuralSpacecraftComponent',
-                'MaterialTicker': 'SSC',
-                'ShipRepairMaterialId': '490df9657539e5eecb445c3ffd2d6cc6-SSC',
-            },
-            {
-                'Amount': 8,
-                'MaterialId': 'f1d402957a88fd396f302372a6912158',
-                'MaterialName': 'fluidPiping',
-                'MaterialTicker': 'FLP',
-                'ShipRepairMaterialId': '490df9657539e5eecb445c3ffd2d6cc6-FLP',
-            },
-            {
-                'Amount': 12,
-                'MaterialId': '432414a579f1fccd66136b257eb44408',
-                'MaterialName': 'fastenerKitMedium',
-                'MaterialTicker': 'MFK',
-                'ShipRepairMaterialId': '490df9657539e5eecb445c3ffd2d6cc6-MFK',
-            },
-            {
-                'Amount': 9,
-                'MaterialId': 'f3f12b5b3adebdd25f3067e5aa4589f0',
-                'MaterialName': 'lightweightHullPlate',
-                'MaterialTicker': 'LHP',
-                'ShipRepairMaterialId': '490df9657539e5eecb445c3ffd2d6cc6-LHP',
-            },
-        ],
-        'LastRepairEpochMs': 0,
-        'CommissioningTimeEpochMs': 1716880289340,
-    },
-    {
-        'Name': 'Silicon',
-        'ShipId': '4d249613111db220f2f6bbe3d060238f',
-        'StoreId': 'f56ebd1c13daf6fe8c80cd953bc53c7f',
-        'Location': 'Antares I (ZV-307) - STATION',
-        'Condition': 0.9809589385986328,
-        'AddressLines': [
-            {
-                'Name': 'Antares Station',
-                'LineId': '1deca369a92788b8079e7ac245be66f7',
-                'LineType': 'STATION',
-                'NaturalId': 'ANT',
-            },
-            {
-                'Name': 'Antares I',
-                'LineId': '8ecf9670ba070d78cfb5537e8d9f1b6c',
-                'LineType': 'SYSTEM',
-                'NaturalId': 'ZV-307',
-            },
-        ],
-        'Registration': 'AVI-04E0G',
-        'FtlFuelStoreId': '195dc429fc89fe48451962f7ed81e56c',
-        'StlFuelStoreId': '522dc7f77918f04c2fb16d966de60539',
-        'RepairMaterials': [
-            {
-                'Amount': 12,
-                'MaterialId': '432414a579f1fccd66136b257eb44408',
-                'MaterialName': 'fastenerKitMedium',
-                'MaterialTicker': 'MFK',
-                'ShipRepairMaterialId': '4d249613111db220f2f6bbe3d060238f-MFK',
-            },
-            {
-                'Amount': 2,
-                'MaterialId': 'b700f9670131981590e77238d7c207d3',
-                'MaterialName': 'structuralSpacecraftComponent',
-                'MaterialTicker': 'SSC',
-                'ShipRepairMaterialId': '4d249613111db220f2f6bbe3d060238f-SSC',
-            },
-            {
-                'Amount': 2,
-                'MaterialId': 'f3f12b5b3adebdd25f3067e5aa4589f0',
-                'MaterialName': 'lightweightHullPlate',
-                'MaterialTicker': 'LHP',
-                'ShipRepairMaterialId': '4d249613111db220f2f6bbe3d060238f-LHP',
-            },
-            {
-                'Amount': 8,
-                'MaterialId': 'f1d402957a88fd396f302372a6912158',
-                'MaterialName': 'fluidPiping',
-                'MaterialTicker': 'FLP',
-                'ShipRepairMaterialId': '4d249613111db220f2f6bbe3d060238f-FLP',
-            },
-        ],
-        'LastRepairEpochMs': 0,
-        'CommissioningTimeEpochMs': 1706858501839,
-    },
-    {
-        'Name': 'Silver',
-        'ShipId': '4dadd0112370ca4b4c141d95c6a8cf21',
-        'StoreId': '7b3b86a1d64cd3ecc97cf0573dbe1a80',
-        'Location': 'Antares I (ZV-307) - STATION',
-        'Condition': 0.9987486600875854,
-        'AddressLines': [
-            {
-                'Name': 'Antares Station',
-                'LineId': '1deca369a92788b8079e7ac245be66f7',
-                'LineType': 'STATION',
-                'NaturalId': 'ANT',
-            },
-            {
-                'Name': 'Antares I',
-                'LineId': '8ecf9670ba070d78cfb5537e8d9f1b6c',
-                'LineType': 'SYSTEM',
-                'NaturalId': 'ZV-307',
-            },
-        ],
-        'Registration': 'AVI-06ML1',
-        'FtlFuelStoreId': '53b6474804dbe10f65714849831cde74',
-        'StlFuelStoreId': '924a55f6bf81567832186424803a7a21',
-        'RepairMaterials': [
-            {
-                'Amount': 1,
-                'MaterialId': 'b700f9670131981590e77238d7c207d3',
-                'MaterialName': 'structuralSpacecraftComponent',
-                'MaterialTicker': 'SSC',
-                'ShipRepairMaterialId': '4dadd0112370ca4b4c141d95c6a8cf21-SSC',
-            },
-            {
-                'Amount': 1,
-                'MaterialId': 'f3f12b5b3adebdd25f3067e5aa4589f0',
-                'MaterialName': 'lightweightHullPlate',
-                'MaterialTicker': 'LHP',
-                'ShipRepairMaterialId': '4dadd0112370ca4b4c141d95c6a8cf21-LHP',
-            },
-            {
-                'Amount': 12,
-                'MaterialId': '432414a579f1fccd66136b257eb44408',
-                'MaterialName': 'fastenerKitMedium',
-                'MaterialTicker': 'MFK',
-                'ShipRepairMaterialId': '4dadd0112370ca4b4c141d95c6a8cf21-MFK',
-            },
-            {
-                'Amount': 8,
-                'MaterialId': 'f1d402957a88fd396f302372a6912158',
-                'MaterialName': 'fluidPiping',
-                'MaterialTicker': 'FLP',
-                'ShipRepairMaterialId': '4dadd0112370ca4b4c141d95c6a8cf21-FLP',
-            },
-        ],
-        'LastRepairEpochMs': None,
-        'CommissioningTimeEpochMs': 1769850533522,
-    },
-    {
-        'Name': 'Selenium',
-        'ShipId': '4eece2c7f352df023c43b14d65b3237a',
-        'StoreId': 'ea3adcff3ca3517ff6f0935315a02bcd',
-        'Location': 'Antares I (ZV-307) - STATION',
-        'Condition': 0.9927616119384766,
-        'AddressLines': [
-            {
-                'Name': 'Antares I',
-                'LineId': '8ecf9670ba070d78cfb5537e8d9f1b6c',
-                'LineType': 'SYSTEM',
-                'NaturalId': 'ZV-307',
-            },
-            {
-                'Name': 'Antares Station',
-                'LineId': '1deca369a92788b8079e7ac245be66f7',
-                'LineType': 'STATION',
-                'NaturalId': 'ANT',
-            },
-        ],
-        'Registration': 'AVI-06KT7',
-        'FtlFuelStoreId': '7c6300b08e172d5c4e32aab24dab4072',
-        'StlFuelStoreId': '6805bdf27f75b75574474265bd305cc7',
-        'RepairMaterials': [
-            {
-                'Amount': 8,
-                'MaterialId': 'f1d402957a88fd396f302372a6912158',
-                'MaterialName': 'fluidPiping',
-                'MaterialTicker': 'FLP',
-                'ShipRepairMaterialId': '4eece2c7f352df023c43b14d65b3237a-FLP',
-            },
-            {
-                'Amount': 1,
-                'MaterialId': 'f3f12b5b3adebdd25f3067e5aa4589f0',
-                'MaterialName': 'lightweightHullPlate',
-                'MaterialTicker': 'LHP',
-                'ShipRepairMaterialId': '4eece2c7f352df023c43b14d65b3237a-LHP',
-            },
-            {
-                'Amount': 1,
-                'MaterialId': 'b700f9670131981590e77238d7c207d3',
-                'MaterialName': 'structuralSpacecraftComponent',
-                'MaterialTicker': 'SSC',
-                'ShipRepairMaterialId': '4eece2c7f352df023c43b14d65b3237a-SSC',
-            },
-            {
-                'Amount': 12,
-                'MaterialId': '432414a579f1fccd66136b257eb44408',
-                'MaterialName': 'fastenerKitMedium',
-                'MaterialTicker': 'MFK',
-                'ShipRepairMaterialId': '4eece2c7f352df023c43b14d65b3237a-MFK',
-            },
-        ],
-        'LastRepairEpochMs': None,
-        'CommissioningTimeEpochMs': 1768741439600,
-    },
-    {
-        'Name': 'Cadmium',
-        'ShipId': '50dfff773688cc2285e4813a1078a544',
-        'StoreId': 'd84ad4a6da4a68e77fd9cb74f8627fc0',
-        'Location': 'Antares I (ZV-307) - STATION',
-        'Condition': 0.9874102473258972,
-        'AddressLines': [
-            {
-                'Name': 'Antares Station',
-                'LineId': '1deca369a92788b8079e7ac245be66f7',
-                'LineType': 'STATION',
-                'NaturalId': 'ANT',
-            },
-            {
-                'Name': 'Antares I',
-                'LineId': '8ecf9670ba070d78cfb5537e8d9f1b6c',
-                'LineType': 'SYSTEM',
-                'NaturalId': 'ZV-307',
-            },
-        ],
-        'Registration': 'AVI-06MPH',
-        'FtlFuelStoreId': '6ee6a3fc5ce3dbaaa15b3075bc60492c',
-        'StlFuelStoreId': '5a5a3a11e43395e07d414c4eea3de07b',
-        'RepairMaterials': [
-            {
-                'Amount': 2,
-                'MaterialId': 'b700f9670131981590e77238d7c207d3',
-                'MaterialName': 'structuralSpacecraftComponent',
-                'MaterialTicker': 'SSC',
-                'ShipRepairMaterialId': '50dfff773688cc2285e4813a1078a544-SSC',
-            },
-            {
-                'Amount': 8,
-                'MaterialId': 'f1d402957a88fd396f302372a6912158',
-                'MaterialName': 'fluidPiping',
-                'MaterialTicker': 'FLP',
-                'ShipRepairMaterialId': '50dfff773688cc2285e4813a1078a544-FLP',
-            },
-            {
-                'Amount': 12,
-                'MaterialId': '432414a579f1fccd66136b257eb44408',
-                'MaterialName': 'fastenerKitMedium',
-                'MaterialTicker': 'MFK',
-                'ShipRepairMaterialId': '50dfff773688cc2285e4813a1078a544-MFK',
-            },
-            {
-                'Amount': 1,
-                'MaterialId': 'f3f12b5b3adebdd25f3067e5aa4589f0',
-                'MaterialName': 'lightweightHullPlate',
-                'MaterialTicker': 'LHP',
-                'ShipRepairMaterialId': '50dfff773688cc2285e4813a1078a544-LHP',
-            },
-        ],
-        'LastRepairEpochMs': None,
-        'CommissioningTimeEpochMs': 1769947713496,
-    },
-    {
-        'Name': 'Rubidium',
-        'ShipId': '579cf5e6798a28b94b17b6f688841ee6',
-        'StoreId': '57b3a9bdd3c5e50979952e971de91607',
-        'Location': '',
-        'Condition': 0.9850157499313354,
-        'AddressLines': [],
-        'Registration': 'AVI-06LMH',
-        'FtlFuelStoreId': '1c9123e97fc13adb8ae502777a01631a',
-        'StlFuelStoreId': '06ad5c789b2899988ec664c6e936845e',
-        'RepairMaterials': [
-            {
-                'Amount': 2,
-                'MaterialId': 'f3f12b5b3adebdd25f3067e5aa4589f0',
-                'MaterialName': 'lightweightHullPlate',
-                'MaterialTicker': 'LHP',
-                'ShipRepairMaterialId': '579cf5e6798a28b94b17b6f688841ee6-LHP',
-            },
-            {
-                'Amount': 8,
-                'MaterialId': 'f1d402957a88fd396f302372a6912158',
-                'MaterialName': 'fluidPiping',
-                'MaterialTicker': 'FLP',
-                'ShipRepairMaterialId': '579cf5e6798a28b94b17b6f688841ee6-FLP',
-            },
-            {
-                'Amount': 12,
-                'MaterialId': '432414a579f1fccd66136b257eb44408',
-                'MaterialName': 'fastenerKitMedium',
-                'MaterialTicker': 'MFK',
-                'ShipRepairMaterialId': '579cf5e6798a28b94b17b6f688841ee6-MFK',
-            },
-            {
-                'Amount': 2,
-                'MaterialId': 'b700f9670131981590e77238d7c207d3',
-                'MaterialName': 'structuralSpacecraftComponent',
-                'MaterialTicker': 'SSC',
-                'ShipRepairMaterialId': '579cf5e6798a28b94b17b6f688841ee6-SSC',
-            },
-        ],
-        'LastRepairEpochMs': None,
-        'CommissioningTimeEpochMs': 1769232379210,
-    },
-    {
-        'Name': 'Helium',
-        'ShipId': '5c24c3953be8753479b742a05b162ffa',
-        'StoreId': '57f5a0b461d1a2bfa074ad042186b01b',
-        'Location': 'Antares I (ZV-307) - STATION',
-        'Condition': 0.9316340684890747,
-        'AddressLines': [
-            {
-                'Name': 'Antares Station',
-                'LineId': '1deca369a92788b8079e7ac245be66f7',
-                'LineType': 'STATION',
-                'NaturalId': 'ANT',
-            },
-            {
-                'Name': 'Antares I',
-                'LineId': '8ecf9670ba070d78cfb5537e8d9f1b6c',
-                'LineType': 'SYSTEM',
-                'NaturalId': 'ZV-307',
-            },
-        ],
-        'Registration': 'AVI-01CC2',
-        'FtlFuelStoreId': '14c37ab1ace8bb999123cafab3d2179c',
-        'StlFuelStoreId': '815cbfb9ad7b2be3362e7eea60dce675',
-        'RepairMaterials': [
-            {
-                'Amount': 12,
-                'MaterialId': '432414a579f1fccd66136b257eb44408',
-                'MaterialName': 'fastenerKitMedium',
-                'MaterialTicker': 'MFK',
-                'ShipRepairMaterialId': '5c24c3953be8753479b742a05b162ffa-MFK',
-            },
-            {
-                'Amount': 8,
-                'MaterialId': 'f1d402957a88fd396f302372a6912158',
-                'MaterialName': 'fluidPiping',
-                'MaterialTicker': 'FLP',
-                'ShipRepairMaterialId': '5c24c3953be8753479b742a05b162ffa-FLP',
-            },
-            {
-                'Amount': 4,
-                'MaterialId': 'c03644ad9e74ee585b1148f608010003',
-                'MaterialName': 'basicHullPlate',
-                'MaterialTicker': 'BHP',
-                'ShipRepairMaterialId': '5c24c3953be8753479b742a05b162ffa-BHP',
-            },
-            {
-                'Amount': 4,
-                'MaterialId': 'b700f9670131981590e77238d7c207d3',
-                'MaterialName': 'structuralSpacecraftComponent',
-                'MaterialTicker': 'SSC',
-                'ShipRepairMaterialId': '5c24c3953be8753479b742a05b162ffa-SSC',
-            },
-        ],
-        'LastRepairEpochMs': 0,
-        'CommissioningTimeEpochMs': 1666293821927,
-    },
-    {
-        'Name': 'Carbon',
-        'ShipId': '672a6acd3e13304c0d3f7db21244a4cf',
-        'StoreId': '4dba197b2b104d4c54c0dd0bd9b5c5d7',
-        'Location': 'Antares I (ZV-307) - STATION',
-        'Condition': 0.8966472148895264,
-        'AddressLines': [
-            {
-                'Name': 'Antares I',
-                'LineId': '8ecf9670ba070d78cfb5537e8d9f1b6c',
-                'LineType': 'SYSTEM',
-                'NaturalId': 'ZV-307',
-            },
-            {
-                'Name': 'Antares Station',
-                'LineId': '1deca369a92788b8079e7ac245be66f7',
-                'LineType': 'STATION',
-                'NaturalId': 'ANT',
-            },
-        ],
-        'Registration': 'AVI-03FQV',
-        'FtlFuelStoreId': '960e8bbc0773d3b903a5404a07004e00',
-        'StlFuelStoreId': '7171a173563d1d57d0a04bf5a36a505f',
-        'RepairMaterials': [
-            {
-                'Amount': 8,
-                'MaterialId': 'f3f12b5b3adebdd25f3067e5aa4589f0',
-                'MaterialName': 'lightweightHullPlate',
-                'MaterialTicker': 'LHP',
-                'ShipRepairMaterialId': '672a6acd3e13304c0d3f7db21244a4cf-LHP',
-            },
-            {
-                'Amount': 10,
-                'MaterialId': 'b700f9670131981590e77238d7c207d3',
-                'MaterialName': 'structuralSpacecraftComponent',
-                'MaterialTicker': 'SSC',
-                'ShipRepairMaterialId': '672a6acd3e13304c0d3f7db21244a4cf-SSC',
-            },
-            {
-                'Amount': 12,
-                'MaterialId': '432414a579f1fccd66136b257eb44408',
-                'MaterialName': 'fastenerKitMedium',
-                'MaterialTicker': 'MFK',
-                'ShipRepairMaterialId': '672a6acd3e13304c0d3f7db21244a4cf-MFK',
-            },
-            {
-                'Amount': 8,
-                'MaterialId': 'f1d402957a88fd396f302372a6912158',
-                'MaterialName': 'fluidPiping',
-                'MaterialTicker': 'FLP',
-                'ShipRepairMaterialId': '672a6acd3e13304c0d3f7db21244a4cf-FLP',
-            },
-        ],
-        'LastRepairEpochMs': 0,
-        'CommissioningTimeEpochMs': 1683111307002,
-    },
-    {
-        'Name': 'Zinc',
-        'ShipId': '6c9ad6b6462bbce6667ff6361c424ba4',
-        'StoreId': '0e725fc17f8ff283bf186566ac821795',
-        'Location': 'Antares I (ZV-307) - STATION',
-        'Condition': 0.9838421940803528,
-        'AddressLines': [
-            {
-                'Name': 'Antares Station',
-                'LineId': '1deca369a92788b8079e7ac245be66f7',
-                'LineType': 'STATION',
-                'NaturalId': 'ANT',
-            },
-            {
-                'Name': 'Antares I',
-                'LineId': '8ecf9670ba070d78cfb5537e8d9f1b6c',
-                'LineType': 'SYSTEM',
-                'NaturalId': 'ZV-307',
-            },
-        ],
-        'Registration': 'AVI-063YR',
-        'FtlFuelStoreId': 'd5dbd776d0f50d5ac450e15151df2ad5',
-        'StlFuelStoreId': '59f7902e0ced8420793ac3fafa276cb6',
-        'RepairMaterials': [
-            {
-                'Amount': 2,
-                'MaterialId': 'b700f9670131981590e77238d7c207d3',
-                'MaterialName': 'structuralSpacecraftComponent',
-                'MaterialTicker': 'SSC',
-                'ShipRepairMaterialId': '6c9ad6b6462bbce6667ff6361c424ba4-SSC',
-            },
-            {
-                'Amount': 8,
-                'MaterialId': 'f1d402957a88fd396f302372a6912158',
-                'MaterialName': 'fluidPiping',
-                'MaterialTicker': 'FLP',
-                'ShipRepairMaterialId': '6c9ad6b6462bbce6667ff6361c424ba4-FLP',
-            },
-            {
-                'Amount': 12,
-                'MaterialId': '432414a579f1fccd66136b257eb44408',
-                'MaterialName': 'fastenerKitMedium',
-                'MaterialTicker': 'MFK',
-                'ShipRepairMaterialId': '6c9ad6b6462bbce6667ff6361c424ba4-MFK',
-            },
-            {
-                'Amount': 2,
-                'MaterialId': 'f3f12b5b3adebdd25f3067e5aa4589f0',
-                'MaterialName': 'lightweightHullPlate',
-                'MaterialTicker': 'LHP',
-                'ShipRepairMaterialId': '6c9ad6b6462bbce6667ff6361c424ba4-LHP',
-            },
-        ],
-        'LastRepairEpochMs': None,
-        'CommissioningTimeEpochMs': 1757561719018,
-    },
-    {
-        'Name': 'Magnesium',
-        'ShipId': '70f3646bcd1e077928b399807012778d',
-        'StoreId': 'cae48a5e7ce9ed0f08c137a382d78f42',
-        'Location': 'Antares I (ZV-307) - STATION',
-        'Condition': 0.9990139603614807,
-        'AddressLines': [
-            {
-                'Name': 'Antares Station',
-                'LineId': '1deca369a92788b8079e7ac245be66f7',
-                'LineType': 'STATION',
-                'NaturalId': 'ANT',
-            },
-            {
-                'Name': 'Antares I',
-                'LineId': '8ecf9670ba070d78cfb5537e8d9f1b6c',
-                'LineType': 'SYSTEM',
-                'NaturalId': 'ZV-307',
-            },
-        ],
-        'Registration': 'AVI-03XZW',
-        'FtlFuelStoreId': '3dbc768396e973acbbf9ce6b04c66baf',
-        'StlFuelStoreId': '0403ca452f65cdc759f0756c409555d9',
-        'RepairMaterials': [
-            {
-                'Amount': 1,
-                'MaterialId': 'f3f12b5b3adebdd25f3067e5aa4589f0',
-                'MaterialName': 'lightweightHullPlate',
-                'MaterialTicker': 'LHP',
-                'ShipRepairMaterialId': '70f3646bcd1e077928b399807012778d-LHP',
-            },
-            {
-                'Amount': 1,
-                'MaterialId': 'b700f9670131981590e77238d7c207d3',
-                'MaterialName': 'structuralSpacecraftComponent',
-                'MaterialTicker': 'SSC',
-                'ShipRepairMaterialId': '70f3646bcd1e077928b399807012778d-SSC',
-            },
-            {
-                'Amount': 12,
-                'MaterialId': '432414a579f1fccd66136b257eb44408',
-                'MaterialName': 'fastenerKitMedium',
-                'MaterialTicker': 'MFK',
-                'ShipRepairMaterialId': '70f3646bcd1e077928b399807012778d-MFK',
-            },
-            {
-                'Amount': 8,
-                'MaterialId': 'f1d402957a88fd396f302372a6912158',
-                'MaterialName': 'fluidPiping',
-                'MaterialTicker': 'FLP',
-                'ShipRepairMaterialId': '70f3646bcd1e077928b399807012778d-FLP',
-            },
-        ],
-        'LastRepairEpochMs': 0,
-        'CommissioningTimeEpochMs': 1698236772838,
-    },
-    {
-        'Name': 'Copper',
-        'ShipId': '815f5c70425fce2c4942de12f40a561a',
-        'StoreId': '1b57087db0546a261a2e5fed553a9c13',
-        'Location': 'Antares I (ZV-307) - STATION',
-        'Condition': 0.9247249960899353,
-        'AddressLines': [
-            {
-                'Name': 'Antares I',
-                'LineId': '8ecf9670ba070d78cfb5537e8d9f1b6c',
-                'LineType': 'SYSTEM',
-                'NaturalId': 'ZV-307',
-            },
-            {
-                'Name': 'Antares Station',
-                'LineId': '1deca369a92788b8079e7ac245be66f7',
-                'LineType': 'STATION',
-                'NaturalId': 'ANT',
-            },
-        ],
-        'Registration': 'AVI-06120',
-        'FtlFuelStoreId': 'b6ada540b48451de04a32d70d5813802',
-        'StlFuelStoreId': 'a873533390adb49da9e677b0f621f8a0',
-        'RepairMaterials': [
-            {
-                'Amount': 8,
-                'MaterialId': 'b700f9670131981590e77238d7c207d3',
-                'MaterialName': 'structuralSpacecraftComponent',
-                'MaterialTicker': 'SSC',
-                'ShipRepairMaterialId': '815f5c70425fce2c4942de12f40a561a-SSC',
-            },
-            {
-                'Amount': 8,
-                'MaterialId': 'f1d402957a88fd396f302372a6912158',
-                'MaterialName': 'fluidPiping',
-                'MaterialTicker': 'FLP',
-                'ShipRepairMaterialId': '815f5c70425fce2c4942de12f40a561a-FLP',
-            },
-            {
-                'Amount': 12,
-                'MaterialId': '432414a579f1fccd66136b257eb44408',
-                'MaterialName': 'fastenerKitMedium',
-                'MaterialTicker': 'MFK',
-                'ShipRepairMaterialId': '815f5c70425fce2c4942de12f40a561a-MFK',
-            },
-            {
-                'Amount': 6,
-                'MaterialId': 'f3f12b5b3adebdd25f3067e5aa4589f0',
-                'MaterialName': 'lightweightHullPlate',
-                'MaterialTicker': 'LHP',
-                'ShipRepairMaterialId': '815f5c70425fce2c4942de12f40a561a-LHP',
-            },
-        ],
-        'LastRepairEpochMs': None,
-        'CommissioningTimeEpochMs': 1753871139988,
-    },
-    {
-        'Name': 'Technetium',
-        'ShipId': '85f6886a99c04bf77317f2e5ab992ffc',
-        'StoreId': '712f2f0c4fd87946541800fb171d8d0b',
-        'Location': 'Antares I (ZV-307) - STATION',
-        'Condition': 0.9931697249412537,
-        'AddressLines': [
-            {
-                'Name': 'Antares I',
-                'LineId': '8ecf9670ba070d78cfb5537e8d9f1b6c',
-                'LineType': 'SYSTEM',
-                'NaturalId': 'ZV-307',
-            },
-            {
-                'Name': 'Antares Station',
-                'LineId': '1deca369a92788b8079e7ac245be66f7',
-                'LineType': 'STATION',
-                'NaturalId': 'ANT',
-            },
-        ],
-        'Registration': 'AVI-06M37',
-        'FtlFuelStoreId': 'bcc78d1e3f9709aeb26b2fdf83ee3d72',
-        'StlFuelStoreId': '3faf9f6abd141f73b54e46fafdf3a06e',
-        'RepairMaterials': [
-            {
-                'Amount': 8,
-                'MaterialId': 'f1d402957a88fd396f302372a6912158',
-                'MaterialName': 'fluidPiping',
-                'MaterialTicker': 'FLP',
-                'ShipRepairMaterialId': '85f6886a99c04bf77317f2e5ab992ffc-FLP',
-            },
-            {
-                'Amount': 1,
-                'MaterialId': 'f3f12b5b3adebdd25f3067e5aa4589f0',
-                'MaterialName': 'lightweightHullPlate',
-                'MaterialTicker': 'LHP',
-                'ShipRepairMaterialId': '85f6886a99c04bf77317f2e5ab992ffc-LHP',
-            },
-            {
-                'Amount': 1,
-                'MaterialId': 'b700f9670131981590e77238d7c207d3',
-                'MaterialName': 'structuralSpacecraftComponent',
-                'MaterialTicker': 'SSC',
-                'ShipRepairMaterialId': '85f6886a99c04bf77317f2e5ab992ffc-SSC',
-            },
-            {
-                'Amount': 12,
-                'MaterialId': '432414a579f1fccd66136b257eb44408',
-                'MaterialName': 'fastenerKitMedium',
-                'MaterialTicker': 'MFK',
-                'ShipRepairMaterialId': '85f6886a99c04bf77317f2e5ab992ffc-MFK',
-            },
-        ],
-        'LastRepairEpochMs': None,
-        'CommissioningTimeEpochMs': 1769503340965,
-    },
-    {
-        'Name': 'Tin',
-        'ShipId': '88722534103087695b5daf5321cc2281',
-        'StoreId': 'e6acc7c466c44b3fe51f6f1bf0302883',
-        'Location': 'Antares I (ZV-307) - STATION',
-        'Condition': 0.9987455606460571,
-        'AddressLines': [
-            {
-                'Name': 'Antares I',
-                'LineId': '8ecf9670ba070d78cfb5537e8d9f1b6c',
-                'LineType': 'SYSTEM',
-                'NaturalId': 'ZV-307',
-            },
-            {
-                'Name': 'Antares Station',
-                'LineId': '1deca369a92788b8079e7ac245be66f7',
-                'LineType': 'STATION',
-                'NaturalId': 'ANT',
-            },
-        ],
-        'Registration': 'AVI-06MPJ',
-        'FtlFuelStoreId': '7facd06c6743c71a5dc5dbf46fc7e634',
-        'StlFuelStoreId': 'aa578cf7bf878a90a7103bd82463137a',
-        'RepairMaterials': [
-            {
-                'Amount': 8,
-                'MaterialId': 'f1d402957a88fd396f302372a6912158',
-                'MaterialName': 'fluidPiping',
-                'MaterialTicker': 'FLP',
-                'ShipRepairMaterialId': '88722534103087695b5daf5321cc2281-FLP',
-            },
-            {
-                'Amount': 1,
-                'MaterialId': 'f3f12b5b3adebdd25f3067e5aa4589f0',
-                'MaterialName': 'lightweightHullPlate',
-                'MaterialTicker': 'LHP',
-                'ShipRepairMaterialId': '88722534103087695b5daf5321cc2281-LHP',
-            },
-            {
-                'Amount': 1,
-                'MaterialId': 'b700f9670131981590e77238d7c207d3',
-                'MaterialName': 'structuralSpacecraftComponent',
-                'MaterialTicker': 'SSC',
-                'ShipRepairMaterialId': '88722534103087695b5daf5321cc2281-SSC',
-            },
-            {
-                'Amount': 12,
-                'MaterialId': '432414a579f1fccd66136b257eb44408',
-                'MaterialName': 'fastenerKitMedium',
-                'MaterialTicker': 'MFK',
-                'ShipRepairMaterialId': '88722534103087695b5daf5321cc2281-MFK',
-            },
-        ],
-        'LastRepairEpochMs': None,
-        'CommissioningTimeEpochMs': 1769947715487,
-    },
-    {
-        'Name': 'Sulfur',
-        'ShipId': '8d18fa846e0bb56da7fcb8a01e5ba4a2',
-        'StoreId': 'caeb0b439d05a3102da84bbdca7dbe16',
-        'Location': 'Antares I (ZV-307) - STATION',
-        'Condition': 0.9827815890312195,
-        'AddressLines': [
-            {
-                'Name': 'Antares I',
-                'LineId': '8ecf9670ba070d78cfb5537e8d9f1b6c',
-                'LineType': 'SYSTEM',
-                'NaturalId': 'ZV-307',
-            },
-            {
-                'Name': 'Antares Station',
-                'LineId': '1deca369a92788b8079e7ac245be66f7',
-                'LineType': 'STATION',
-                'NaturalId': 'ANT',
-            },
-        ],
-        'Registration': 'AVI-04WD7',
-        'FtlFuelStoreId': '8c0e783e69bd3c20de6f449e3dff149a',
-        'StlFuelStoreId': '88d5947230155d6e1a15abfb79d76ad8',
-        'RepairMaterials': [
-            {
-                'Amount': 2,
-                'MaterialId': 'f3f12b5b3adebdd25f3067e5aa4589f0',
-                'MaterialName': 'lightweightHullPlate',
-                'MaterialTicker': 'LHP',
-                'ShipRepairMaterialId': '8d18fa846e0bb56da7fcb8a01e5ba4a2-LHP',
-            },
-            {
-                'Amount': 8,
-                'MaterialId': 'f1d402957a88fd396f302372a6912158',
-                'MaterialName': 'fluidPiping',
-                'MaterialTicker': 'FLP',
-                'ShipRepairMaterialId': '8d18fa846e0bb56da7fcb8a01e5ba4a2-FLP',
-            },
-            {
-                'Amount': 12,
-                'MaterialId': '432414a579f1fccd66136b257eb44408',
-                'MaterialName': 'fastenerKitMedium',
-                'MaterialTicker': 'MFK',
-                'ShipRepairMaterialId': '8d18fa846e0bb56da7fcb8a01e5ba4a2-MFK',
-            },
-            {
-                'Amount': 2,
-                'MaterialId': 'b700f9670131981590e77238d7c207d3',
-                'MaterialName': 'structuralSpacecraftComponent',
-                'MaterialTicker': 'SSC',
-                'ShipRepairMaterialId': '8d18fa846e0bb56da7fcb8a01e5ba4a2-SSC',
-            },
-        ],
-        'LastRepairEpochMs': 0,
-        'CommissioningTimeEpochMs': 1716880261424,
-    },
-    {
-        'Name': 'Fluorine',
-        'ShipId': '95a21e5c9e8a1e14cf93394a1e48d3d9',
-        'StoreId': 'b5eb3fbf14b92ec0c208afc8bfb81424',
-        'Location': 'Antares I (ZV-307) - STATION',
-        'Condition': 0.9154970645904541,
-        'AddressLines': [
-            {
-                'Name': 'Antares Station',
-                'LineId': '1deca369a92788b8079e7ac245be66f7',
-                'LineType': 'STATION',
-                'NaturalId': 'ANT',
-            },
-            {
-                'Name': 'Antares I',
-                'LineId': '8ecf9670ba070d78cfb5537e8d9f1b6c',
-                'LineType': 'SYSTEM',
-                'NaturalId': 'ZV-307',
-            },
-        ],
-        'Registration': 'AVI-03MZ8',
-        'FtlFuelStoreId': '7adb092655a6b928bfdcf27edd6968ea',
-        'StlFuelStoreId': '794ce655d60e4fd53b3157dfc3b50f4e',
-        'RepairMaterials': [
-            {
-                'Amount': 6,
-                'MaterialId': 'f3f12b5b3adebdd25f3067e5aa4589f0',
-                'MaterialName': 'lightweightHullPlate',
-                'MaterialTicker': 'LHP',
-                'ShipRepairMaterialId': '95a21e5c9e8a1e14cf93394a1e48d3d9-LHP',
-            },
-            {
-                'Amount': 8,
-                'MaterialId': 'f1d402957a88fd396f302372a6912158',
-                'MaterialName': 'fluidPiping',
-                'MaterialTicker': 'FLP',
-                'ShipRepairMaterialId': '95a21e5c9e8a1e14cf93394a1e48d3d9-FLP',
-            },
-            {
-                'Amount': 12,
-                'MaterialId': '432414a579f1fccd66136b257eb44408',
-                'MaterialName': 'fastenerKitMedium',
-                'MaterialTicker': 'MFK',
-                'ShipRepairMaterialId': '95a21e5c9e8a1e14cf93394a1e48d3d9-MFK',
-            },
-            {
-                'Amount': 9,
-                'MaterialId': 'b700f9670131981590e77238d7c207d3',
-                'MaterialName': 'structuralSpacecraftComponent',
-                'MaterialTicker': 'SSC',
-                'ShipRepairMaterialId': '95a21e5c9e8a1e14cf93394a1e48d3d9-SSC',
-            },
-        ],
-        'LastRepairEpochMs': 0,
-        'CommissioningTimeEpochMs': 1689761764479,
-    },
-    {
-        'Name': 'Rhodium',
-        'ShipId': '978f94d7689f3e77ea90bdc438ab9024',
-        'StoreId': '95d557b20aa9a8d218204a84b6d7d6c2',
-        'Location': 'Antares I (ZV-307) - STATION',
-        'Condition': 0.9987287521362305,
-        'AddressLines': [
-            {
-                'Name': 'Antares I',
-                'LineId': '8ecf9670ba070d78cfb5537e8d9f1b6c',
-                'LineType': 'SYSTEM',
-                'NaturalId': 'ZV-307',
-            },
-            {
-                'Name': 'Antares Station',
-                'LineId': '1deca369a92788b8079e7ac245be66f7',
-                'LineType': 'STATION',
-                'NaturalId': 'ANT',
-            },
-        ],
-        'Registration': 'AVI-06MKZ',
-        'FtlFuelStoreId': '41efb3599d975f5928f3759425776d5a',
-        'StlFuelStoreId': 'a56d8cf037ef4bdecd513441a4f3a2aa',
-        'RepairMaterials': [
-            {
-                'Amount': 1,
-                'MaterialId': 'f3f12b5b3adebdd25f3067e5aa4589f0',
-                'MaterialName': 'lightweightHullPlate',
-                'MaterialTicker': 'LHP',
-                'ShipRepairMaterialId': '978f94d7689f3e77ea90bdc438ab9024-LHP',
-            },
-            {
-                'Amount': 8,
-                'MaterialId': 'f1d402957a88fd396f302372a6912158',
-                'MaterialName': 'fluidPiping',
-                'MaterialTicker': 'FLP',
-                'ShipRepairMaterialId': '978f94d7689f3e77ea90bdc438ab9024-FLP',
-            },
-            {
-                'Amount': 12,
-                'MaterialId': '432414a579f1fccd66136b257eb44408',
-                'MaterialName': 'fastenerKitMedium',
-                'MaterialTicker': 'MFK',
-                'ShipRepairMaterialId': '978f94d7689f3e77ea90bdc438ab9024-MFK',
-            },
-            {
-                'Amount': 1,
-                'MaterialId': 'b700f9670131981590e77238d7c207d3',
-                'MaterialName': 'structuralSpacecraftComponent',
-                'MaterialTicker': 'SSC',
-                'ShipRepairMaterialId': '978f94d7689f3e77ea90bdc438ab9024-SSC',
-            },
-        ],
-        'LastRepairEpochMs': None,
-        'CommissioningTimeEpochMs': 1769850529624,
-    },
-    {
-        'Name': 'Bromine',
-        'ShipId': '985b1255ea002b44e81767cfb54cafba',
-        'StoreId': '0951c22566890d32c8dc80a01d1e9830',
-        'Location': 'Antares I (ZV-307) - STATION',
-        'Condition': 0.959166944026947,
-        'AddressLines': [
-            {
-                'Name': 'Antares I',
-                'LineId': '8ecf9670ba070d78cfb5537e8d9f1b6c',
-                'LineType': 'SYSTEM',
-                'NaturalId': 'ZV-307',
-            },
-            {
-                'Name': 'Antares Station',
-                'LineId': '1deca369a92788b8079e7ac245be66f7',
-                'LineType': 'STATION',
-                'NaturalId': 'ANT',
-            },
-        ],
-        'Registration': 'AVI-06LMF',
-        'FtlFuelStoreId': '5f9ed3d1a897ae5f31ef3588a0db572b',
-        'StlFuelStoreId': 'bce70f472066e85da75961de48e7d012',
-        'RepairMaterials': [
-            {
-                'Amount': 8,
-                'MaterialId': 'f1d402957a88fd396f302372a6912158',
-                'MaterialName': 'fluidPiping',
-                'MaterialTicker': 'FLP',
-                'ShipRepairMaterialId': '985b1255ea002b44e81767cfb54cafba-FLP',
-            },
-            {
-                'Amount': 3,
-                'MaterialId': 'f3f12b5b3adebdd25f3067e5aa4589f0',
-                'MaterialName': 'lightweightHullPlate',
-                'MaterialTicker': 'LHP',
-                'ShipRepairMaterialId': '985b1255ea002b44e81767cfb54cafba-LHP',
-            },
-            {
-                'Amount': 4,
-                'MaterialId': 'b700f9670131981590e77238d7c207d3',
-                'MaterialName': 'structuralSpacecraftComponent',
-                'MaterialTicker': 'SSC',
-                'ShipRepairMaterialId': '985b1255ea002b44e81767cfb54cafba-SSC',
-            },
-            {
-                'Amount': 12,
-                'MaterialId': '432414a579f1fccd66136b257eb44408',
-                'MaterialName': 'fastenerKitMedium',
-                'MaterialTicker': 'MFK',
-                'ShipRepairMaterialId': '985b1255ea002b44e81767cfb54cafba-MFK',
-            },
-        ],
-        'LastRepairEpochMs': None,
-        'CommissioningTimeEpochMs': 1769232375799,
-    },
-    {
-        'Name': 'Scandium',
-        'ShipId': '98e0a736ee0e789e99e494629369c53d',
-        'StoreId': '96be6caca30592d8c491e66ef58daecf',
-        'Location': 'Antares I (ZV-307) - STATION',
-        'Condition': 0.9811856746673584,
-        'AddressLines': [
-            {
-                'Name': 'Antares I',
-                'LineId': '8ecf9670ba070d78cfb5537e8d9f1b6c',
-                'LineType': 'SYSTEM',
-                'NaturalId': 'ZV-307',
-            },
-            {
-                'Name': 'Antares Station',
-                'LineId': '1deca369a92788b8079e7ac245be66f7',
-                'LineType': 'STATION',
-                'NaturalId': 'ANT',
-            },
-        ],
-        'Registration': 'AVI-056GE',
-        'FtlFuelStoreId': '607a88e0a1271c83ead2a27b92a6a411',
-        'StlFuelStoreId': '2fd4b3b00d7a53f42222740e904a668c',
-        'RepairMaterials': [
-            {
-                'Amount': 12,
-                'MaterialId': '432414a579f1fccd66136b257eb44408',
-                'MaterialName': 'fastenerKitMedium',
-                'MaterialTicker': 'MFK',
-                'ShipRepairMaterialId': '98e0a736ee0e789e99e494629369c53d-MFK',
-            },
-            {
-                'Amount': 8,
-                'MaterialId': 'f1d402957a88fd396f302372a6912158',
-                'MaterialName': 'fluidPiping',
-                'MaterialTicker': 'FLP',
-                'ShipRepairMaterialId': '98e0a736ee0e789e99e494629369c53d-FLP',
-            },
-            {
-                'Amount': 2,
-                'MaterialId': 'b700f9670131981590e77238d7c207d3',
-                'MaterialName': 'structuralSpacecraftComponent',
-                'MaterialTicker': 'SSC',
-                'ShipRepairMaterialId': '98e0a736ee0e789e99e494629369c53d-SSC',
-            },
-            {
-                'Amount': 2,
-                'MaterialId': 'f3f12b5b3adebdd25f3067e5aa4589f0',
-                'MaterialName': 'lightweightHullPlate',
-                'MaterialTicker': 'LHP',
-                'ShipRepairMaterialId': '98e0a736ee0e789e99e494629369c53d-LHP',
-            },
-        ],
-        'LastRepairEpochMs': 0,
-        'CommissioningTimeEpochMs': 1723122465689,
-    },
-    {
-        'Name': 'Nickel',
-        'ShipId': 'a065bb621216956949eef6ed89514436',
-        'StoreId': '514b629212c3db0b421b997a9d457c8b',
-        'Location': 'Antares I (ZV-307) - STATION',
-        'Condition': 0.9547313451766968,
-        'AddressLines': [
-            {
-                'Name': 'Antares I',
-                'LineId': '8ecf9670ba070d78cfb5537e8d9f1b6c',
-                'LineType': 'SYSTEM',
-                'NaturalId': 'ZV-307',
-            },
-            {
-                'Name': 'Antares Station',
-                'LineId': '1deca369a92788b8079e7ac245be66f7',
-                'LineType': 'STATION',
-                'NaturalId': 'ANT',
-            },
-        ],
-        'Registration': 'AVI-0611Z',
-        'FtlFuelStoreId': '991aea22ce1fa6ac3f0c4d8f0979631d',
-        'StlFuelStoreId': 'aa6e27fb86874559117e325f5772467d',
-        'RepairMaterials': [
-            {
-                'Amount': 4,
-                'MaterialId': 'f3f12b5b3adebdd25f3067e5aa4589f0',
-                'MaterialName': 'lightweightHullPlate',
-                'MaterialTicker': 'LHP',
-                'ShipRepairMaterialId': 'a065bb621216956949eef6ed89514436-LHP',
-            },
-            {
-                'Amount': 8,
-                'MaterialId': 'f1d402957a88fd396f302372a6912158',
-                'MaterialName': 'fluidPiping',
-                'MaterialTicker': 'FLP',
-                'ShipRepairMaterialId': 'a065bb621216956949eef6ed89514436-FLP',
-            },
-            {
-                'Amount': 12,
-                'MaterialId': '432414a579f1fccd66136b257eb44408',
-                'MaterialName': 'fastenerKitMedium',
-                'MaterialTicker': 'MFK',
-                'ShipRepairMaterialId': 'a065bb621216956949eef6ed89514436-MFK',
-            },
-            {
-                'Amount': 5,
-                'MaterialId': 'b700f9670131981590e77238d7c207d3',
-                'MaterialName': 'structuralSpacecraftComponent',
-                'MaterialTicker': 'SSC',
-                'ShipRepairMaterialId': 'a065bb621216956949eef6ed89514436-SSC',
-            },
-        ],
-        'LastRepairEpochMs': None,
-        'CommissioningTimeEpochMs': 1753871138766,
-    },
-    {
-        'Name': 'Arsenic',
-        'ShipId': 'a4f8006868f4836fec0a3385304f243c',
-        'StoreId': 'a1225e6d244827c266c4b97da427eff1',
-        'Location': 'Antares I (ZV-307) - STATION',
-        'Condition': 0.9529342651367188,
-        'AddressLines': [
-            {
-                'Name': 'Antares Station',
-                'LineId': '1deca369a92788b8079e7ac245be66f7',
-                'LineType': 'STATION',
-                'NaturalId': 'ANT',
-            },
-            {
-                'Name': 'Antares I',
-                'LineId': '8ecf9670ba070d78cfb5537e8d9f1b6c',
-                'LineType': 'SYSTEM',
-                'NaturalId': 'ZV-307',
-            },
-        ],
-        'Registration': 'AVI-06K6P',
-        'FtlFuelStoreId': '7883dec2455007404ae87b1e755a6617',
-        'StlFuelStoreId': 'ab7e280261450d245623e9592fe65fea',
-        'RepairMaterials': [
-            {
-                'Amount': 8,
-                'MaterialId': 'f1d402957a88fd396f302372a6912158',
-                'MaterialName': 'fluidPiping',
-                'MaterialTicker': 'FLP',
-                'ShipRepairMaterialId': 'a4f8006868f4836fec0a3385304f243c-FLP',
-            },
-            {
-                'Amount': 12,
-                'MaterialId': '432414a579f1fccd66136b257eb44408',
-                'MaterialName': 'fastenerKitMedium',
-                'MaterialTicker': 'MFK',
-                'ShipRepairMaterialId': 'a4f8006868f4836fec0a3385304f243c-MFK',
-            },
-            {
-                'Amount': 4,
-                'MaterialId': 'f3f12b5b3adebdd25f3067e5aa4589f0',
-                'MaterialName': 'lightweightHullPlate',
-                'MaterialTicker': 'LHP',
-                'ShipRepairMaterialId': 'a4f8006868f4836fec0a3385304f243c-LHP',
-            },
-            {
-                'Amount': 5,
-                'MaterialId': 'b700f9670131981590e77238d7c207d3',
-                'MaterialName': 'structuralSpacecraftComponent',
-                'MaterialTicker': 'SSC',
-                'ShipRepairMaterialId': 'a4f8006868f4836fec0a3385304f243c-SSC',
-            },
-        ],
-        'LastRepairEpochMs': None,
-        'CommissioningTimeEpochMs': 1768393969811,
-    },
-    {
-        'Name': 'Chlorine',
-        'ShipId': 'b1e1ed9eb0c4841118a99435edfb0c94',
-        'StoreId': '92241d817b3f05f58e9c31c895bdcce5',
-        'Location': 'Antares I (ZV-307) - STATION',
-        'Condition': 0.8890942335128784,
-        'AddressLines': [
-            {
-                'Name': 'Antares I',
-                'LineId': '8ecf9670ba070d78cfb5537e8d9f1b6c',
-                'LineType': 'SYSTEM',
-                'NaturalId': 'ZV-307',
-            },
-            {
-                'Name': 'Antares Station',
-                'LineId': '1deca369a92788b8079e7ac245be66f7',
-                'LineType': 'STATION',
-                'NaturalId': 'ANT',
-            },
-        ],
-        'Registration': 'AVI-04WD8',
-        'FtlFuelStoreId': '71609d71f9ebdd01150faecb03d83274',
-        'StlFuelStoreId': 'e8f01e84fd5bf9a9995b2a63f6564deb',
-        'RepairMaterials': [
-            {
-                'Amount': 11,
-                'MaterialId': 'b700f9670131981590e77238d7c207d3',
-                'MaterialName': 'structuralSpacecraftComponent',
-                'MaterialTicker': 'SSC',
-                'ShipRepairMaterialId': 'b1e1ed9eb0c4841118a99435edfb0c94-SSC',
-            },
-            {
-                'Amount': 8,
-                'MaterialId': 'f3f12b5b3adebdd25f3067e5aa4589f0',
-                'MaterialName': 'lightweightHullPlate',
-                'MaterialTicker': 'LHP',
-                'ShipRepairMaterialId': 'b1e1ed9eb0c4841118a99435edfb0c94-LHP',
-            },
-            {
-                'Amount': 8,
-                'MaterialId': 'f1d402957a88fd396f302372a6912158',
-                'MaterialName': 'fluidPiping',
-                'MaterialTicker': 'FLP',
-                'ShipRepairMaterialId': 'b1e1ed9eb0c4841118a99435edfb0c94-FLP',
-            },
-            {
-                'Amount': 12,
-                'MaterialId': '432414a579f1fccd66136b257eb44408',
-                'MaterialName': 'fastenerKitMedium',
-                'MaterialTicker': 'MFK',
-                'ShipRepairMaterialId': 'b1e1ed9eb0c4841118a99435edfb0c94-MFK',
-            },
-        ],
-        'LastRepairEpochMs': 0,
-        'CommissioningTimeEpochMs': 1716880267872,
-    },
-    {
-        'Name': 'Yttrium',
-        'ShipId': 'b6c3e584b96f887b029268c712a32821',
-        'StoreId': '36406266818057defa6f95d7c40de82f',
-        'Location': 'Antares I (ZV-307) - STATION',
-        'Condition': 0.9943243265151978,
-        'AddressLines': [
-            {
-                'Name': 'Antares I',
-                'LineId': '8ecf9670ba070d78cfb5537e8d9f1b6c',
-                'LineType': 'SYSTEM',
-                'NaturalId': 'ZV-307',
-            },
-            {
-                'Name': 'Antares Station',
-                'LineId': '1deca369a92788b8079e7ac245be66f7',
-                'LineType': 'STATION',
-                'NaturalId': 'ANT',
-            },
-        ],
-        'Registration': 'AVI-06LTF',
-        'FtlFuelStoreId': '2a7769f01a36928edb50d3ad908048b4',
-        'StlFuelStoreId': 'd05384b48b6c00b11b8b6fbcaf73c01b',
-        'RepairMaterials': [
-            {
-                'Amount': 1,
-                'MaterialId': 'f3f12b5b3adebdd25f3067e5aa4589f0',
-                'MaterialName': 'lightweightHullPlate',
-                'MaterialTicker': 'LHP',
-                'ShipRepairMaterialId': 'b6c3e584b96f887b029268c712a32821-LHP',
-            },
-            {
-                'Amount': 8,
-                'MaterialId': 'f1d402957a88fd396f302372a6912158',
-                'MaterialName': 'fluidPiping',
-                'MaterialTicker': 'FLP',
-                'ShipRepairMaterialId': 'b6c3e584b96f887b029268c712a32821-FLP',
-            },
-            {
-                'Amount': 12,
-                'MaterialId': '432414a579f1fccd66136b257eb44408',
-                'MaterialName': 'fastenerKitMedium',
-                'MaterialTicker': 'MFK',
-                'ShipRepairMaterialId': 'b6c3e584b96f887b029268c712a32821-MFK',
-            },
-            {
-                'Amount': 1,
-                'MaterialId': 'b700f9670131981590e77238d7c207d3',
-                'MaterialName': 'structuralSpacecraftComponent',
-                'MaterialTicker': 'SSC',
-                'ShipRepairMaterialId': 'b6c3e584b96f887b029268c712a32821-SSC',
-            },
-        ],
-        'LastRepairEpochMs': None,
-        'CommissioningTimeEpochMs': 1769324602624,
-    },
-    {
-        'Name': 'Neon',
-        'ShipId': 'b87025991fbc969ce70f9210caa51110',
-        'StoreId': 'b616870e7d0e023d7b2f6af8f8c04585',
-        'Location': 'Antares I (ZV-307) - STATION',
-        'Condition': 0.9279629588127136,
-        'AddressLines': [
-            {
-                'Name': 'Antares I',
-                'LineId': '8ecf9670ba070d78cfb5537e8d9f1b6c',
-                'LineType': 'SYSTEM',
-                'NaturalId': 'ZV-307',
-            },
-            {
-                'Name': 'Antares Station',
-                'LineId': '1deca369a92788b8079e7ac245be66f7',
-                'LineType': 'STATION',
-                'NaturalId': 'ANT',
-            },
-        ],
-        'Registration': 'AVI-03QO1',
-        'FtlFuelStoreId': '7e1fb462121ed3838e58f3a2b768bd4d',
-        'StlFuelStoreId': 'e77bad9a750768c359bc314a9d7113e6',
-        'RepairMaterials': [
-            {
-                'Amount': 12,
-                'MaterialId': '432414a579f1fccd66136b257eb44408',
-                'MaterialName': 'fastenerKitMedium',
-                'MaterialTicker': 'MFK',
-                'ShipRepairMaterialId': 'b87025991fbc969ce70f9210caa51110-MFK',
-            },
-            {
-                'Amount': 8,
-                'MaterialId': 'f1d402957a88fd396f302372a6912158',
-                'MaterialName': 'fluidPiping',
-                'MaterialTicker': 'FLP',
-                'ShipRepairMaterialId': 'b87025991fbc969ce70f9210caa51110-FLP',
-            },
-            {
-                'Amount': 6,
-                'MaterialId': 'f3f12b5b3adebdd25f3067e5aa4589f0',
-                'MaterialName': 'lightweightHullPlate',
-                'MaterialTicker': 'LHP',
-                'ShipRepairMaterialId': 'b87025991fbc969ce70f9210caa51110-LHP',
-            },
-            {
-                'Amount': 7,
-                'MaterialId': 'b700f9670131981590e77238d7c207d3',
-                'MaterialName': 'structuralSpacecraftComponent',
-                'MaterialTicker': 'SSC',
-                'ShipRepairMaterialId': 'b87025991fbc969ce70f9210caa51110-SSC',
-            },
-        ],
-        'LastRepairEpochMs': 0,
-        'CommissioningTimeEpochMs': 1693127666004,
-    },
-    {
-        'Name': 'Lithium',
-        'ShipId': 'bb42c6e0de182b7d86dc35b61b8bf9b9',
-        'StoreId': '8ca3bc50f316cfda8f63e5dd3373e52d',
-        'Location': 'Antares I (ZV-307) - STATION',
-        'Condition': 0.909512996673584,
-        'AddressLines': [
-            {
-                'Name': 'Antares I',
-                'LineId': '8ecf9670ba070d78cfb5537e8d9f1b6c',
-                'LineType': 'SYSTEM',
-                'NaturalId': 'ZV-307',
-            },
-            {
-                'Name': 'Antares Station',
-                'LineId': '1deca369a92788b8079e7ac245be66f7',
-                'LineType': 'STATION',
-                'NaturalId': 'ANT',
-            },
-        ],
-        'Registration': 'AVI-02XR6',
-        'FtlFuelStoreId': 'edd92e134aedd9b75c21373cf190da83',
-        'StlFuelStoreId': 'bd22d7ecd7b643f6c726128470f0ab5c',
-        'RepairMaterials': [
-            {
-                'Amount': 8,
-                'MaterialId': 'f1d402957a88fd396f302372a6912158',
-                'MaterialName': 'fluidPiping',
-                'MaterialTicker': 'FLP',
-                'ShipRepairMaterialId': 'bb42c6e0de182b7d86dc35b61b8bf9b9-FLP',
-            },
-            {
-                'Amount': 9,
-                'MaterialId': 'b700f9670131981590e77238d7c207d3',
-                'MaterialName': 'structuralSpacecraftComponent',
-                'MaterialTicker': 'SSC',
-                'ShipRepairMaterialId': 'bb42c6e0de182b7d86dc35b61b8bf9b9-SSC',
-            },
-            {
-                'Amount': 12,
-                'MaterialId': '432414a579f1fccd66136b257eb44408',
-                'MaterialName': 'fastenerKitMedium',
-                'MaterialTicker': 'MFK',
-                'ShipRepairMaterialId': 'bb42c6e0de182b7d86dc35b61b8bf9b9-MFK',
-            },
-            {
-                'Amount': 7,
-                'MaterialId': 'f3f12b5b3adebdd25f3067e5aa4589f0',
-                'MaterialName': 'lightweightHullPlate',
-                'MaterialTicker': 'LHP',
-                'ShipRepairMaterialId': 'bb42c6e0de182b7d86dc35b61b8bf9b9-LHP',
-            },
-        ],
-        'LastRepairEpochMs': 0,
-        'CommissioningTimeEpochMs': 1670430133194,
-    },
-    {
-        'Name': 'Cobalt',
-        'ShipId': 'bb606e05994019edd659b35322990904',
-        'StoreId': 'e45400e5fdb2f91118617e5703e2894c',
-        'Location': 'Antares I (ZV-307) - STATION',
-        'Condition': 0.9212815165519714,
-        'AddressLines': [
-            {
-                'Name': 'Antares Station',
-                'LineId': '1deca369a92788b8079e7ac245be66f7',
-                'LineType': 'STATION',
-                'NaturalId': 'ANT',
-            },
-            {
-                'Name': 'Antares I',
-                'LineId': '8ecf9670ba070d78cfb5537e8d9f1b6c',
-                'LineType': 'SYSTEM',
-                'NaturalId': 'ZV-307',
-            },
-        ],
-        'Registration': 'AVI-0611Y',
-        'FtlFuelStoreId': '6f9f5292857f365bbb37ad0d78dfb9da',
-        'StlFuelStoreId': '7f79b88b9406192a4459213a0541afb1',
-        'RepairMaterials': [
-            {
-                'Amount': 8,
-                'MaterialId': 'b700f9670131981590e77238d7c207d3',
-                'MaterialName': 'structuralSpacecraftComponent',
-                'MaterialTicker': 'SSC',
-                'ShipRepairMaterialId': 'bb606e05994019edd659b35322990904-SSC',
-            },
-            {
-                'Amount': 8,
-                'MaterialId': 'f1d402957a88fd396f302372a6912158',
-                'MaterialName': 'fluidPiping',
-                'MaterialTicker': 'FLP',
-                'ShipRepairMaterialId': 'bb606e05994019edd659b35322990904-FLP',
-            },
-            {
-                'Amount': 6,
-                'MaterialId': 'f3f12b5b3adebdd25f3067e5aa4589f0',
-                'MaterialName': 'lightweightHullPlate',
-                'MaterialTicker': 'LHP',
-                'ShipRepairMaterialId': 'bb606e05994019edd659b35322990904-LHP',
-            },
-            {
-                'Amount': 12,
-                'MaterialId': '432414a579f1fccd66136b257eb44408',
-                'MaterialName': 'fastenerKitMedium',
-                'MaterialTicker': 'MFK',
-                'ShipRepairMaterialId': 'bb606e05994019edd659b35322990904-MFK',
-            },
-        ],
-        'LastRepairEpochMs': None,
-        'CommissioningTimeEpochMs': 1753871137125,
-    },
-    {
-        'Name': 'Zirconium',
-        'ShipId': 'bdb6e90f91dfe9cec48077d746b70993',
-        'StoreId': '4364b9273bd416524e4e9cc222013140',
-        'Location': 'Antares I (ZV-307) - STATION',
-        'Condition': 0.9978539943695068,
-        'AddressLines': [
-            {
-                'Name': 'Antares I',
-                'LineId': '8ecf9670ba070d78cfb5537e8d9f1b6c',
-                'LineType': 'SYSTEM',
-                'NaturalId': 'ZV-307',
-            },
-            {
-                'Name': 'Antares Station',
-                'LineId': '1deca369a92788b8079e7ac245be66f7',
-                'LineType': 'STATION',
-                'NaturalId': 'ANT',
-            },
-        ],
-        'Registration': 'AVI-06LTG',
-        'FtlFuelStoreId': '48d78e121190a8e3c166f8796ae4bffe',
-        'StlFuelStoreId': '37261cb3e8f32b7fde893334f67d1520',
-        'RepairMaterials': [
-            {
-                'Amount': 8,
-                'MaterialId': 'f1d402957a88fd396f302372a6912158',
-                'MaterialName': 'fluidPiping',
-                'MaterialTicker': 'FLP',
-                'ShipRepairMaterialId': 'bdb6e90f91dfe9cec48077d746b70993-FLP',
-            },
-            {
-                'Amount': 1,
-                'MaterialId': 'f3f12b5b3adebdd25f3067e5aa4589f0',
-                'MaterialName': 'lightweightHullPlate',
-                'MaterialTicker': 'LHP',
-                'ShipRepairMaterialId': 'bdb6e90f91dfe9cec48077d746b70993-LHP',
-            },
-            {
-                'Amount': 1,
-                'MaterialId': 'b700f9670131981590e77238d7c207d3',
-                'MaterialName': 'structuralSpacecraftComponent',
-                'MaterialTicker': 'SSC',
-                'ShipRepairMaterialId': 'bdb6e90f91dfe9cec48077d746b70993-SSC',
-            },
-            {
-                'Amount': 12,
-                'MaterialId': '432414a579f1fccd66136b257eb44408',
-                'MaterialName': 'fastenerKitMedium',
-                'MaterialTicker': 'MFK',
-                'ShipRepairMaterialId': 'bdb6e90f91dfe9cec48077d746b70993-MFK',
-            },
-        ],
-        'LastRepairEpochMs': None,
-        'CommissioningTimeEpochMs': 1769324645018,
-    },
-    {
-        'Name': 'Gallium',
-        'ShipId': 'c314789df16a9920317a230ef7e9ac66',
-        'StoreId': '4be68273221fcc97555f2ce1168affae',
-        'Location': 'Antares I (ZV-307) - STATION',
-        'Condition': 0.9439056515693665,
-        'AddressLines': [
-            {
-                'Name': 'Antares Station',
-                'LineId': '1deca369a92788b8079e7ac245be66f7',
-                'LineType': 'STATION',
-                'NaturalId': 'ANT',
-            },
-            {
-                'Name': 'Antares I',
-                'LineId': '8ecf9670ba070d78cfb5537e8d9f1b6c',
-                'LineType': 'SYSTEM',
-                'NaturalId': 'ZV-307',
-            },
-        ],
-        'Registration': 'AVI-063YS',
-        'FtlFuelStoreId': '921a8bcd869a26bb38e9146eecf19449',
-        'StlFuelStoreId': 'cf24c81d7c22d16409d11d35866466a1',
-        'RepairMaterials': [
-            {
-                'Amount': 6,
-                'MaterialId': 'b700f9670131981590e77238d7c207d3',
-                'MaterialName': 'structuralSpacecraftComponent',
-                'MaterialTicker': 'SSC',
-                'ShipRepairMaterialId': 'c314789df16a9920317a230ef7e9ac66-SSC',
-            },
-            {
-                'Amount': 8,
-                'MaterialId': 'f1d402957a88fd396f302372a6912158',
-                'MaterialName': 'fluidPiping',
-                'MaterialTicker': 'FLP',
-                'ShipRepairMaterialId': 'c314789df16a9920317a230ef7e9ac66-FLP',
-            },
-            {
-                'Amount': 12,
-                'MaterialId': '432414a579f1fccd66136b257eb44408',
-                'MaterialName': 'fastenerKitMedium',
-                'MaterialTicker': 'MFK',
-                'ShipRepairMaterialId': 'c314789df16a9920317a230ef7e9ac66-MFK',
-            },
-            {
-                'Amount': 4,
-                'MaterialId': 'f3f12b5b3adebdd25f3067e5aa4589f0',
-                'MaterialName': 'lightweightHullPlate',
-                'MaterialTicker': 'LHP',
-                'ShipRepairMaterialId': 'c314789df16a9920317a230ef7e9ac66-LHP',
-            },
-        ],
-        'LastRepairEpochMs': None,
-        'CommissioningTimeEpochMs': 1757561749686,
-    },
-    {
-        'Name': 'Argon',
-        'ShipId': 'c6bd8fa4139dcc7bdaf0cb722db30489',
-        'StoreId': 'def4ed53c1d69b4f927845e82c5dd195',
-        'Location': '',
-        'Condition': 0.9720073938369751,
-        'AddressLines': [],
-        'Registration': 'AVI-04WD9',
-        'FtlFuelStoreId': 'd047916d44251e0a985008487d5d47df',
-        'StlFuelStoreId': '59e055b06ac11f14e609395a44bd77f3',
-        'RepairMaterials': [
-            {
-                'Amount': 8,
-                'MaterialId': 'f1d402957a88fd396f302372a6912158',
-                'MaterialName': 'fluidPiping',
-                'MaterialTicker': 'FLP',
-                'ShipRepairMaterialId': 'c6bd8fa4139dcc7bdaf0cb722db30489-FLP',
-            },
-            {
-                'Amount': 12,
-                'MaterialId': '432414a579f1fccd66136b257eb44408',
-                'MaterialName': 'fastenerKitMedium',
-                'MaterialTicker': 'MFK',
-                'ShipRepairMaterialId': 'c6bd8fa4139dcc7bdaf0cb722db30489-MFK',
-            },
-            {
-                'Amount': 3,
-                'MaterialId': 'b700f9670131981590e77238d7c207d3',
-                'MaterialName': 'structuralSpacecraftComponent',
-                'MaterialTicker': 'SSC',
-                'ShipRepairMaterialId': 'c6bd8fa4139dcc7bdaf0cb722db30489-SSC',
-            },
-            {
-                'Amount': 2,
-                'MaterialId': 'f3f12b5b3adebdd25f3067e5aa4589f0',
-                'MaterialName': 'lightweightHullPlate',
-                'MaterialTicker': 'LHP',
-                'ShipRepairMaterialId': 'c6bd8fa4139dcc7bdaf0cb722db30489-LHP',
-            },
-        ],
-        'LastRepairEpochMs': 0,
-        'CommissioningTimeEpochMs': 1716880274521,
-    },
-    {
-        'Name': 'Vanadium',
-        'ShipId': 'c7d6c5b746839107f026e1b07aaf4748',
-        'StoreId': '58c35d14171a605093bb16075994e3ba',
-        'Location': 'Antares I (ZV-307) - STATION',
-        'Condition': 0.9199627041816711,
-        'AddressLines': [
-            {
-                'Name': 'Antares Station',
-                'LineId': '1deca369a92788b8079e7ac245be66f7',
-                'LineType': 'STATION',
-                'NaturalId': 'ANT',
-            },
-            {
-                'Name': 'Antares I',
-                'LineId': '8ecf9670ba070d78cfb5537e8d9f1b6c',
-                'LineType': 'SYSTEM',
-                'NaturalId': 'ZV-307',
-            },
-        ],
-        'Registration': 'AVI-056GG',
-        'FtlFuelStoreId': '3762ee33128e277b817f06bf4e5e3c3c',
-        'StlFuelStoreId': '57658de1827c039e0fa9bd6ea56b2411',
-        'RepairMaterials': [
-            {
-                'Amount': 6,
-                'MaterialId': 'f3f12b5b3adebdd25f3067e5aa4589f0',
-                'MaterialName': 'lightweightHullPlate',
-                'MaterialTicker': 'LHP',
-                'ShipRepairMaterialId': 'c7d6c5b746839107f026e1b07aaf4748-LHP',
-            },
-            {
-                'Amount': 8,
-                'MaterialId': 'b700f9670131981590e77238d7c207d3',
-                'MaterialName': 'structuralSpacecraftComponent',
-                'MaterialTicker': 'SSC',
-                'ShipRepairMaterialId': 'c7d6c5b746839107f026e1b07aaf4748-SSC',
-            },
-            {
-                'Amount': 12,
-                'MaterialId': '432414a579f1fccd66136b257eb44408',
-                'MaterialName': 'fastenerKitMedium',
-                'MaterialTicker': 'MFK',
-                'ShipRepairMaterialId': 'c7d6c5b746839107f026e1b07aaf4748-MFK',
-            },
-            {
-                'Amount': 8,
-                'MaterialId': 'f1d402957a88fd396f302372a6912158',
-                'MaterialName': 'fluidPiping',
-                'MaterialTicker': 'FLP',
-                'ShipRepairMaterialId': 'c7d6c5b746839107f026e1b07aaf4748-FLP',
-            },
-        ],
-        'LastRepairEpochMs': None,
-        'CommissioningTimeEpochMs': 1723122468764,
-    },
-    {
-        'Name': 'Beryllium',
-        'ShipId': 'cdecb2bd28a30d5f4d49d13a33b23dbc',
-        'StoreId': 'd206396f01cfdcba89cfd5078c7ce233',
-        'Location': 'Antares I (ZV-307) - STATION',
-        'Condition': 0.8713192939758301,
-        'AddressLines': [
-            {
-                'Name': 'Antares I',
-                'LineId': '8ecf9670ba070d78cfb5537e8d9f1b6c',
-                'LineType': 'SYSTEM',
-                'NaturalId': 'ZV-307',
-            },
-            {
-                'Name': 'Antares Station',
-                'LineId': '1deca369a92788b8079e7ac245be66f7',
-                'LineType': 'STATION',
-                'NaturalId': 'ANT',
-            },
-        ],
-        'Registration': 'AVI-03CXB',
-        'FtlFuelStoreId': '33dde5a00084262051d84392974a5d60',
-        'StlFuelStoreId': 'd6ba8ba4a66123f481acd7b6c995e246',
-        'RepairMaterials': [
-            {
-                'Amount': 13,
-                'MaterialId': 'b700f9670131981590e77238d7c207d3',
-                'MaterialName': 'structuralSpacecraftComponent',
-                'MaterialTicker': 'SSC',
-                'ShipRepairMaterialId': 'cdecb2bd28a30d5f4d49d13a33b23dbc-SSC',
-            },
-            {
-                'Amount': 10,
-                'MaterialId': 'f3f12b5b3adebdd25f3067e5aa4589f0',
-                'MaterialName': 'lightweightHullPlate',
-                'MaterialTicker': 'LHP',
-                'ShipRepairMaterialId': 'cdecb2bd28a30d5f4d49d13a33b23dbc-LHP',
-            },
-            {
-                'Amount': 8,
-                'MaterialId': 'f1d402957a88fd396f302372a6912158',
-                'MaterialName': 'fluidPiping',
-                'MaterialTicker': 'FLP',
-                'ShipRepairMaterialId': 'cdecb2bd28a30d5f4d49d13a33b23dbc-FLP',
-            },
-            {
-                'Amount': 12,
-                'MaterialId': '432414a579f1fccd66136b257eb44408',
-                'MaterialName': 'fastenerKitMedium',
-                'MaterialTicker': 'MFK',
-                'ShipRepairMaterialId': 'cdecb2bd28a30d5f4d49d13a33b23dbc-MFK',
-            },
-        ],
-        'LastRepairEpochMs': 0,
-        'CommissioningTimeEpochMs': 1680583270298,
-    },
-    {
-        'Name': 'Iron',
-        'ShipId': 'd1f8c4e5ba748868f93811eb9e3e967e',
-        'StoreId': 'd5d7529918edb555a94a58e1e0f61f0d',
-        'Location': 'Antares I (ZV-307) - STATION',
-        'Condition': 0.9182049632072449,
-        'AddressLines': [
-            {
-                'Name': 'Antares I',
-                'LineId': '8ecf9670ba070d78cfb5537e8d9f1b6c',
-                'LineType': 'SYSTEM',
-                'NaturalId': 'ZV-307',
-            },
-            {
-                'Name': 'Antares Station',
-                'LineId': '1deca369a92788b8079e7ac245be66f7',
-                'LineType': 'STATION',
-                'NaturalId': 'ANT',
-            },
-        ],
-        'Registration': 'AVI-060SJ',
-        'FtlFuelStoreId': '74fa6a8d921433da3eba6bdd64c33d5a',
-        'StlFuelStoreId': 'd6f646dcbec2cd20b46d065a1b194efc',
-        'RepairMaterials': [
-            {
-                'Amount': 8,
-                'MaterialId': 'f1d402957a88fd396f302372a6912158',
-                'MaterialName': 'fluidPiping',
-                'MaterialTicker': 'FLP',
-                'ShipRepairMaterialId': 'd1f8c4e5ba748868f93811eb9e3e967e-FLP',
-            },
-            {
-                'Amount': 6,
-                'MaterialId': 'f3f12b5b3adebdd25f3067e5aa4589f0',
-                'MaterialName': 'lightweightHullPlate',
-                'MaterialTicker': 'LHP',
-                'ShipRepairMaterialId': 'd1f8c4e5ba748868f93811eb9e3e967e-LHP',
-            },
-            {
-                'Amount': 8,
-                'MaterialId': 'b700f9670131981590e77238d7c207d3',
-                'MaterialName': 'structuralSpacecraftComponent',
-                'MaterialTicker': 'SSC',
-                'ShipRepairMaterialId': 'd1f8c4e5ba748868f93811eb9e3e967e-SSC',
-            },
-            {
-                'Amount': 12,
-                'MaterialId': '432414a579f1fccd66136b257eb44408',
-                'MaterialName': 'fastenerKitMedium',
-                'MaterialTicker': 'MFK',
-                'ShipRepairMaterialId': 'd1f8c4e5ba748868f93811eb9e3e967e-MFK',
-            },
-        ],
-        'LastRepairEpochMs': None,
-        'CommissioningTimeEpochMs': 1753520677672,
-    },
-    {
-        'Name': 'Indium',
-        'ShipId': 'd3e384b2c5135773788e17e193a17690',
-        'StoreId': '35a901617613b57d4be0594191a12f80',
-        'Location': 'Antares I (ZV-307) - STATION',
-        'Condition': 0.9887215495109558,
-        'AddressLines': [
-            {
-                'Name': 'Antares Station',
-                'LineId': '1deca369a92788b8079e7ac245be66f7',
-                'LineType': 'STATION',
-                'NaturalId': 'ANT',
-            },
-            {
-                'Name': 'Antares I',
-                'LineId': '8ecf9670ba070d78cfb5537e8d9f1b6c',
-                'LineType': 'SYSTEM',
-                'NaturalId': 'ZV-307',
-            },
-        ],
-        'Registration': 'AVI-06MPI',
-        'FtlFuelStoreId': '7339c77033e4f92008fd80f74484ea21',
-        'StlFuelStoreId': '466faa75aded59fcd5b95c89cc79b548',
-        'RepairMaterials': [
-            {
-                'Amount': 1,
-                'MaterialId': 'f3f12b5b3adebdd25f3067e5aa4589f0',
-                'MaterialName': 'lightweightHullPlate',
-                'MaterialTicker': 'LHP',
-                'ShipRepairMaterialId': 'd3e384b2c5135773788e17e193a17690-LHP',
-            },
-            {
-                'Amount': 8,
-                'MaterialId': 'f1d402957a88fd396f302372a6912158',
-                'MaterialName': 'fluidPiping',
-                'MaterialTicker': 'FLP',
-                'ShipRepairMaterialId': 'd3e384b2c5135773788e17e193a17690-FLP',
-            },
-            {
-                'Amount': 12,
-                'MaterialId': '432414a579f1fccd66136b257eb44408',
-                'MaterialName': 'fastenerKitMedium',
-                'MaterialTicker': 'MFK',
-                'ShipRepairMaterialId': 'd3e384b2c5135773788e17e193a17690-MFK',
-            },
-            {
-                'Amount': 2,
-                'MaterialId': 'b700f9670131981590e77238d7c207d3',
-                'MaterialName': 'structuralSpacecraftComponent',
-                'MaterialTicker': 'SSC',
-                'ShipRepairMaterialId': 'd3e384b2c5135773788e17e193a17690-SSC',
-            },
-        ],
-        'LastRepairEpochMs': None,
-        'CommissioningTimeEpochMs': 1769947714527,
-    },
-    {
-        'Name': 'Chromium',
-        'ShipId': 'd95ef01aead4472e8dce94cdab8aeccb',
-        'StoreId': '3dbd4df55c669b8fd9710d84f7b836bc',
-        'Location': 'Antares I (ZV-307) - STATION',
-        'Condition': 0.8828319311141968,
-        'AddressLines': [
-            {
-                'Name': 'Antares I',
-                'LineId': '8ecf9670ba070d78cfb5537e8d9f1b6c',
-                'LineType': 'SYSTEM',
-                'NaturalId': 'ZV-307',
-            },
-            {
-                'Name': 'Antares Station',
-                'LineId': '1deca369a92788b8079e7ac245be66f7',
-                'LineType': 'STATION',
-                'NaturalId': 'ANT',
-            },
-        ],
-        'Registration': 'AVI-056GH',
-        'FtlFuelStoreId': '91447e553ee5cbee650dce8c8f8534f6',
-        'StlFuelStoreId': 'd955d92feeb3b0ffea4c0f1a7c89a611',
-        'RepairMaterials': [
-            {
-                'Amount': 8,
-                'MaterialId': 'f1d402957a88fd396f302372a6912158',
-                'MaterialName': 'fluidPiping',
-                'MaterialTicker': 'FLP',
-                'ShipRepairMaterialId': 'd95ef01aead4472e8dce94cdab8aeccb-FLP',
-            },
-            {
-                'Amount': 9,
-                'MaterialId': 'f3f12b5b3adebdd25f3067e5aa4589f0',
-                'MaterialName': 'lightweightHullPlate',
-                'MaterialTicker': 'LHP',
-                'ShipRepairMaterialId': 'd95ef01aead4472e8dce94cdab8aeccb-LHP',
-            },
-            {
-                'Amount': 12,
-                'MaterialId': 'b700f9670131981590e77238d7c207d3',
-                'MaterialName': 'structuralSpacecraftComponent',
-                'MaterialTicker': 'SSC',
-                'ShipRepairMaterialId': 'd95ef01aead4472e8dce94cdab8aeccb-SSC',
-            },
-            {
-                'Amount': 12,
-                'MaterialId': '432414a579f1fccd66136b257eb44408',
-                'MaterialName': 'fastenerKitMedium',
-                'MaterialTicker': 'MFK',
-                'ShipRepairMaterialId': 'd95ef01aead4472e8dce94cdab8aeccb-MFK',
-            },
-        ],
-        'LastRepairEpochMs': 0,
-        'CommissioningTimeEpochMs': 1723122470301,
-    },
-    {
-        'Name': 'Potassium',
-        'ShipId': 'd971f7b29931540f77302c4c72a0a07e',
-        'StoreId': '83c050cd64fae115977ecc6172e371df',
-        'Location': 'Antares I (ZV-307) - STATION',
-        'Condition': 0.9775262475013733,
-        'AddressLines': [
-            {
-                'Name': 'Antares Station',
-                'LineId': '1deca369a92788b8079e7ac245be66f7',
-                'LineType': 'STATION',
-                'NaturalId': 'ANT',
-            },
-            {
-                'Name': 'Antares I',
-                'LineId': '8ecf9670ba070d78cfb5537e8d9f1b6c',
-                'LineType': 'SYSTEM',
-                'NaturalId': 'ZV-307',
-            },
-        ],
-        'Registration': 'AVI-04WDA',
-        'FtlFuelStoreId': 'd18fa4b24a32e5f00b6feee755083025',
-        'StlFuelStoreId': '2a12264e9f0471fbb7a56d6171316992',
-        'RepairMaterials': [
-            {
-                'Amount': 3,
-                'MaterialId': 'b700f9670131981590e77238d7c207d3',
-                'MaterialName': 'structuralSpacecraftComponent',
-                'MaterialTicker': 'SSC',
-                'ShipRepairMaterialId': 'd971f7b29931540f77302c4c72a0a07e-SSC',
-            },
-            {
-                'Amount': 8,
-                'MaterialId': 'f1d402957a88fd396f302372a6912158',
-                'MaterialName': 'fluidPiping',
-                'MaterialTicker': 'FLP',
-                'ShipRepairMaterialId': 'd971f7b29931540f77302c4c72a0a07e-FLP',
-            },
-            {
-                'Amount': 12,
-                'MaterialId': '432414a579f1fccd66136b257eb44408',
-                'MaterialName': 'fastenerKitMedium',
-                'MaterialTicker': 'MFK',
-                'ShipRepairMaterialId': 'd971f7b29931540f77302c4c72a0a07e-MFK',
-            },
-            {
-                'Amount': 2,
-                'MaterialId': 'f3f12b5b3adebdd25f3067e5aa4589f0',
-                'MaterialName': 'lightweightHullPlate',
-                'MaterialTicker': 'LHP',
-                'ShipRepairMaterialId': 'd971f7b29931540f77302c4c72a0a07e-LHP',
-            },
-        ],
-        'LastRepairEpochMs': 0,
-        'CommissioningTimeEpochMs': 1716880281776,
-    },
-    {
-        'Name': 'Krypton',
-        'ShipId': 'da3e544a5882353437092caa05ab7ea9',
-        'StoreId': 'ab9240a2897368d5c0660f4a59c1cd72',
-        'Location': 'Antares I (ZV-307) - STATION',
-        'Condition': 0.988073468208313,
-        'AddressLines': [
-            {
-                'Name': 'Antares I',
-                'LineId': '8ecf9670ba070d78cfb5537e8d9f1b6c',
-                'LineType': 'SYSTEM',
-                'NaturalId': 'ZV-307',
-            },
-            {
-                'Name': 'Antares Station',
-                'LineId': '1deca369a92788b8079e7ac245be66f7',
-                'LineType': 'STATION',
-                'NaturalId': 'ANT',
-            },
-        ],
-        'Registration': 'AVI-06LMG',
-        'FtlFuelStoreId': 'b9e52585314a2e86fe1b71dc2e3a0386',
-        'StlFuelStoreId': '07824fd397cae2d31d6ce204c2d27b97',
-        'RepairMaterials': [
-            {
-                'Amount': 12,
-                'MaterialId': '432414a579f1fccd66136b257eb44408',
-                'MaterialName': 'fastenerKitMedium',
-                'MaterialTicker': 'MFK',
-                'ShipRepairMaterialId': 'da3e544a5882353437092caa05ab7ea9-MFK',
-            },
-            {
-                'Amount': 1,
-                'MaterialId': 'f3f12b5b3adebdd25f3067e5aa4589f0',
-                'MaterialName': 'lightweightHullPlate',
-                'MaterialTicker': 'LHP',
-                'ShipRepairMaterialId': 'da3e544a5882353437092caa05ab7ea9-LHP',
-            },
-            {
-                'Amount': 2,
-                'MaterialId': 'b700f9670131981590e77238d7c207d3',
-                'MaterialName': 'structuralSpacecraftComponent',
-                'MaterialTicker': 'SSC',
-                'ShipRepairMaterialId': 'da3e544a5882353437092caa05ab7ea9-SSC',
-            },
-            {
-                'Amount': 8,
-                'MaterialId': 'f1d402957a88fd396f302372a6912158',
-                'MaterialName': 'fluidPiping',
-                'MaterialTicker': 'FLP',
-                'ShipRepairMaterialId': 'da3e544a5882353437092caa05ab7ea9-FLP',
-            },
-        ],
-        'LastRepairEpochMs': None,
-        'CommissioningTimeEpochMs': 1769232377841,
-    },
-    {
-        'Name': 'Sodium',
-        'ShipId': 'dcad2c65b4b05a1a75f005d912a25ff6',
-        'StoreId': 'a30e10cf81109a93d301b502047967b1',
-        'Location': 'Antares I (ZV-307) - STATION',
-        'Condition': 0.8761328458786011,
-        'AddressLines': [
-            {
-                'Name': 'Antares Station',
-                'LineId': '1deca369a92788b8079e7ac245be66f7',
-                'LineType': 'STATION',
-                'NaturalId': 'ANT',
-            },
-            {
-                'Name': 'Antares I',
-                'LineId': '8ecf9670ba070d78cfb5537e8d9f1b6c',
-                'LineType': 'SYSTEM',
-                'NaturalId': 'ZV-307',
-            },
-        ],
-        'Registration': 'AVI-03VHX',
-        'FtlFuelStoreId': '837d78f6ae34687eaba7bc28bb089eb0',
-        'StlFuelStoreId': '584654f3ccd5e579324b255f7a0cc2ba',
-        'RepairMaterials': [
-            {
-                'Amount': 12,
-                'MaterialId': 'b700f9670131981590e77238d7c207d3',
-                'MaterialName': 'structuralSpacecraftComponent',
-                'MaterialTicker': 'SSC',
-                'ShipRepairMaterialId': 'dcad2c65b4b05a1a75f005d912a25ff6-SSC',
-            },
-            {
-                'Amount': 8,
-                'MaterialId': 'f1d402957a88fd396f302372a6912158',
-                'MaterialName': 'fluidPiping',
-                'MaterialTicker': 'FLP',
-                'ShipRepairMaterialId': 'dcad2c65b4b05a1a75f005d912a25ff6-FLP',
-            },
-            {
-                'Amount': 12,
-                'MaterialId': '432414a579f1fccd66136b257eb44408',
-                'MaterialName': 'fastenerKitMedium',
-                'MaterialTicker': 'MFK',
-                'ShipRepairMaterialId': 'dcad2c65b4b05a1a75f005d912a25ff6-MFK',
-            },
-            {
-                'Amount': 9,
-                'MaterialId': 'f3f12b5b3adebdd25f3067e5aa4589f0',
-                'MaterialName': 'lightweightHullPlate',
-                'MaterialTicker': 'LHP',
-                'ShipRepairMaterialId': 'dcad2c65b4b05a1a75f005d912a25ff6-LHP',
-            },
-        ],
-        'LastRepairEpochMs': 0,
-        'CommissioningTimeEpochMs': 1696516606536,
-    },
-    {
-        'Name': 'Niobium',
-        'ShipId': 'e0e7cb8ce2b0c29c6d6f12f7a9409994',
-        'StoreId': '97557759875426110874a90fcad70246',
-        'Location': 'Antares I (ZV-307) - STATION',
-        'Condition': 0.9977840781211853,
-        'AddressLines': [
-            {
-                'Name': 'Antares Station',
-                'LineId': '1deca369a92788b8079e7ac245be66f7',
-                'LineType': 'STATION',
-                'NaturalId': 'ANT',
-            },
-            {
-                'Name': 'Antares I',
-                'LineId': '8ecf9670ba070d78cfb5537e8d9f1b6c',
-                'LineType': 'SYSTEM',
-                'NaturalId': 'ZV-307',
-            },
-        ],
-        'Registration': 'AVI-06M35',
-        'FtlFuelStoreId': '9463365586538c290b4462caff23c1d3',
-        'StlFuelStoreId': '2d07e4f6886675855c24068787c834c8',
-        'RepairMaterials': [
-            {
-                'Amount': 12,
-                'MaterialId': '432414a579f1fccd66136b257eb44408',
-                'MaterialName': 'fastenerKitMedium',
-                'MaterialTicker': 'MFK',
-                'ShipRepairMaterialId': 'e0e7cb8ce2b0c29c6d6f12f7a9409994-MFK',
-            },
-            {
-                'Amount': 1,
-                'MaterialId': 'b700f9670131981590e77238d7c207d3',
-                'MaterialName': 'structuralSpacecraftComponent',
-                'MaterialTicker': 'SSC',
-                'ShipRepairMaterialId': 'e0e7cb8ce2b0c29c6d6f12f7a9409994-SSC',
-            },
-            {
-                'Amount': 8,
-                'MaterialId': 'f1d402957a88fd396f302372a6912158',
-                'MaterialName': 'fluidPiping',
-                'MaterialTicker': 'FLP',
-                'ShipRepairMaterialId': 'e0e7cb8ce2b0c29c6d6f12f7a9409994-FLP',
-            },
-            {
-                'Amount': 1,
-                'MaterialId': 'f3f12b5b3adebdd25f3067e5aa4589f0',
-                'MaterialName': 'lightweightHullPlate',
-                'MaterialTicker': 'LHP',
-                'ShipRepairMaterialId': 'e0e7cb8ce2b0c29c6d6f12f7a9409994-LHP',
-            },
-        ],
-        'LastRepairEpochMs': None,
-        'CommissioningTimeEpochMs': 1769503339009,
-    },
-    {
-        'Name': 'Oxygen',
-        'ShipId': 'e1b36a7b1fba4354356a091f8f413ecf',
-        'StoreId': 'd3a9fab26c46e49b90c4b7fe00b92efb',
-        'Location': 'Antares I (ZV-307) - STATION',
-        'Condition': 0.9613880515098572,
-        'AddressLines': [
-            {
-                'Name': 'Antares I',
-                'LineId': '8ecf9670ba070d78cfb5537e8d9f1b6c',
-                'LineType': 'SYSTEM',
-                'NaturalId': 'ZV-307',
-            },
-            {
-                'Name': 'Antares Station',
-                'LineId': '1deca369a92788b8079e7ac245be66f7',
-                'LineType': 'STATION',
-                'NaturalId': 'ANT',
-            },
-        ],
-        'Registration': 'AVI-03MDE',
-        'FtlFuelStoreId': '090857970873ebdc9ef73561ec5e3552',
-        'StlFuelStoreId': 'e7f2cb50a215b6525518194aa4ac7509',
-        'RepairMaterials': [
-            {
-                'Amount': 12,
-                'MaterialId': '432414a579f1fccd66136b257eb44408',
-                'MaterialName': 'fastenerKitMedium',
-                'MaterialTicker': 'MFK',
-                'ShipRepairMaterialId': 'e1b36a7b1fba4354356a091f8f413ecf-MFK',
-            },
-            {
-                'Amount': 3,
-                'MaterialId': 'f3f12b5b3adebdd25f3067e5aa4589f0',
-                'MaterialName': 'lightweightHullPlate',
-                'MaterialTicker': 'LHP',
-                'ShipRepairMaterialId': 'e1b36a7b1fba4354356a091f8f413ecf-LHP',
-            },
-            {
-                'Amount': 8,
-                'MaterialId': 'f1d402957a88fd396f302372a6912158',
-                'MaterialName': 'fluidPiping',
-                'MaterialTicker': 'FLP',
-                'ShipRepairMaterialId': 'e1b36a7b1fba4354356a091f8f413ecf-FLP',
-            },
-            {
-                'Amount': 4,
-                'MaterialId': 'b700f9670131981590e77238d7c207d3',
-                'MaterialName': 'structuralSpacecraftComponent',
-                'MaterialTicker': 'SSC',
-                'ShipRepairMaterialId': 'e1b36a7b1fba4354356a091f8f413ecf-SSC',
-            },
-        ],
-        'LastRepairEpochMs': 0,
-        'CommissioningTimeEpochMs': 1689258577276,
-    },
-    {
-        'Name': 'Aluminium',
-        'ShipId': 'e641f1296919ffdea8f19f5e48db1b42',
-        'StoreId': 'b4082fb987348e5f8dec2453afc99d2d',
-        'Location': 'Antares I (ZV-307) - STATION',
-        'Condition': 0.8632583618164062,
-        'AddressLines': [
-            {
-                'Name': 'Antares I',
-                'LineId': '8ecf9670ba070d78cfb5537e8d9f1b6c',
-                'LineType': 'SYSTEM',
-                'NaturalId': 'ZV-307',
-            },
-            {
-                'Name': 'Antares Station',
-                'LineId': '1deca369a92788b8079e7ac245be66f7',
-                'LineType': 'STATION',
-                'NaturalId': 'ANT',
-            },
-        ],
-        'Registration': 'AVI-03YL5',
-        'FtlFuelStoreId': '2a22dd90ffaa6033b83903f07826013d',
-        'StlFuelStoreId': '8354ac18f5ac71ffd54f4a549d0dd4ac',
-        'RepairMaterials': [
-            {
-                'Amount': 14,
-                'MaterialId': 'b700f9670131981590e77238d7c207d3',
-                'MaterialName': 'structuralSpacecraftComponent',
-                'MaterialTicker': 'SSC',
-                'ShipRepairMaterialId': 'e641f1296919ffdea8f19f5e48db1b42-SSC',
-            },
-            {
-                'Amount': 10,
-                'MaterialId': 'f3f12b5b3adebdd25f3067e5aa4589f0',
-                'MaterialName': 'lightweightHullPlate',
-                'MaterialTicker': 'LHP',
-                'ShipRepairMaterialId': 'e641f1296919ffdea8f19f5e48db1b42-LHP',
-            },
-            {
-                'Amount': 8,
-                'MaterialId': 'f1d402957a88fd396f302372a6912158',
-                'MaterialName': 'fluidPiping',
-                'MaterialTicker': 'FLP',
-                'ShipRepairMaterialId': 'e641f1296919ffdea8f19f5e48db1b42-FLP',
-            },
-            {
-                'Amount': 12,
-                'MaterialId': '432414a579f1fccd66136b257eb44408',
-                'MaterialName': 'fastenerKitMedium',
-                'MaterialTicker': 'MFK',
-                'ShipRepairMaterialId': 'e641f1296919ffdea8f19f5e48db1b42-MFK',
-            },
-        ],
-        'LastRepairEpochMs': 0,
-        'CommissioningTimeEpochMs': 1698759472631,
-    },
-    {
-        'Name': 'Phosphorus',
-        'ShipId': 'eaeb72e975eba33df85e530c14f810ec',
-        'StoreId': '09cd071f57780af711ca9d48d5718716',
-        'Location': 'Antares I (ZV-307) - STATION',
-        'Condition': 0.8764885067939758,
-        'AddressLines': [
-            {
-                'Name': 'Antares Station',
-                'LineId': '1deca369a92788b8079e7ac245be66f7',
-                'LineType': 'STATION',
-                'NaturalId': 'ANT',
-            },
-            {
-                'Name': 'Antares I',
-                'LineId': '8ecf9670ba070d78cfb5537e8d9f1b6c',
-                'LineType': 'SYSTEM',
-                'NaturalId': 'ZV-307',
-            },
-        ],
-        'Registration': 'AVI-04E0R',
-        'FtlFuelStoreId': 'f2974f84b5de34db6e0e0219e41c81a5',
-        'StlFuelStoreId': '2423dc3f2de69b0a869cacd2121a29a7',
-        'RepairMaterials': [
-            {
-                'Amount': 12,
-                'MaterialId': 'b700f9670131981590e77238d7c207d3',
-                'MaterialName': 'structuralSpacecraftComponent',
-                'MaterialTicker': 'SSC',
-                'ShipRepairMaterialId': 'eaeb72e975eba33df85e530c14f810ec-SSC',
-            },
-            {
-                'Amount': 12,
-                'MaterialId': '432414a579f1fccd66136b257eb44408',
-                'MaterialName': 'fastenerKitMedium',
-                'MaterialTicker': 'MFK',
-                'ShipRepairMaterialId': 'eaeb72e975eba33df85e530c14f810ec-MFK',
-            },
-            {
-                'Amount': 9,
-                'MaterialId': 'f3f12b5b3adebdd25f3067e5aa4589f0',
-                'MaterialName': 'lightweightHullPlate',
-                'MaterialTicker': 'LHP',
-                'ShipRepairMaterialId': 'eaeb72e975eba33df85e530c14f810ec-LHP',
-            },
-            {
-                'Amount': 8,
-                'MaterialId': 'f1d402957a88fd396f302372a6912158',
-                'MaterialName': 'fluidPiping',
-                'MaterialTicker': 'FLP',
-                'ShipRepairMaterialId': 'eaeb72e975eba33df85e530c14f810ec-FLP',
-            },
-        ],
-        'LastRepairEpochMs': 0,
-        'CommissioningTimeEpochMs': 1706863083042,
-    },
-    {
-        'Name': 'Antimony',
-        'ShipId': 'f2085c49847885ef760ee305cd6cd7e2',
-        'StoreId': '1c6ebc60f1c4059035c271e28688c216',
-        'Location': 'Antares I (ZV-307) - STATION',
-        'Condition': 0.9865238070487976,
-        'AddressLines': [
-            {
-                'Name': 'Antares I',
-                'LineId': '8ecf9670ba070d78cfb5537e8d9f1b6c',
-                'LineType': 'SYSTEM',
-                'NaturalId': 'ZV-307',
-            },
-            {
-                'Name': 'Antares Station',
-                'LineId': '1deca369a92788b8079e7ac245be66f7',
-                'LineType': 'STATION',
-                'NaturalId': 'ANT',
-            },
-        ],
-        'Registration': 'AVI-06MPK',
-        'FtlFuelStoreId': 'ac94ea19b1622a21899beb9875a93012',
-        'StlFuelStoreId': 'd51f955e1e28ad7bf422dffe4db925b2',
-        'RepairMaterials': [
-            {
-                'Amount': 12,
-                'MaterialId': '432414a579f1fccd66136b257eb44408',
-                'MaterialName': 'fastenerKitMedium',
-                'MaterialTicker': 'MFK',
-                'ShipRepairMaterialId': 'f2085c49847885ef760ee305cd6cd7e2-MFK',
-            },
-            {
-                'Amount': 1,
-                'MaterialId': 'f3f12b5b3adebdd25f3067e5aa4589f0',
-                'MaterialName': 'lightweightHullPlate',
-                'MaterialTicker': 'LHP',
-                'ShipRepairMaterialId': 'f2085c49847885ef760ee305cd6cd7e2-LHP',
-            },
-            {
-                'Amount': 2,
-                'MaterialId': 'b700f9670131981590e77238d7c207d3',
-                'MaterialName': 'structuralSpacecraftComponent',
-                'MaterialTicker': 'SSC',
-                'ShipRepairMaterialId': 'f2085c49847885ef760ee305cd6cd7e2-SSC',
-            },
-            {
-                'Amount': 8,
-                'MaterialId': 'f1d402957a88fd396f302372a6912158',
-                'MaterialName': 'fluidPiping',
-                'MaterialTicker': 'FLP',
-                'ShipRepairMaterialId': 'f2085c49847885ef760ee305cd6cd7e2-FLP',
-            },
-        ],
-        'LastRepairEpochMs': None,
-        'CommissioningTimeEpochMs': 1769947716541,
-    },
-    {
-        'Name': 'Ruthenium',
-        'ShipId': 'f3296b313d2f98774a9aeab4a9eb7e59',
-        'StoreId': '56bac61ae3ca88c951e234564e51a2cc',
-        'Location': 'Antares I (ZV-307) - STATION',
-        'Condition': 0.9917660355567932,
-        'AddressLines': [
-            {
-                'Name': 'Antares Station',
-                'LineId': '1deca369a92788b8079e7ac245be66f7',
-                'LineType': 'STATION',
-                'NaturalId': 'ANT',
-            },
-            {
-                'Name': 'Antares I',
-                'LineId': '8ecf9670ba070d78cfb5537e8d9f1b6c',
-                'LineType': 'SYSTEM',
-                'NaturalId': 'ZV-307',
-            },
-        ],
-        'Registration': 'AVI-06M38',
-        'FtlFuelStoreId': '7198ec410f48fa47e16d7180971c3e08',
-        'StlFuelStoreId': 'de2499ab5eb90ea04edf5b8323ec6b24',
-        'RepairMaterials': [
-            {
-                'Amount': 1,
-                'MaterialId': 'b700f9670131981590e77238d7c207d3',
-                'MaterialName': 'structuralSpacecraftComponent',
-                'MaterialTicker': 'SSC',
-                'ShipRepairMaterialId': 'f3296b313d2f98774a9aeab4a9eb7e59-SSC',
-            },
-            {
-                'Amount': 12,
-                'MaterialId': '432414a579f1fccd66136b257eb44408',
-                'MaterialName': 'fastenerKitMedium',
-                'MaterialTicker': 'MFK',
-                'ShipRepairMaterialId': 'f3296b313d2f98774a9aeab4a9eb7e59-MFK',
-            },
-            {
-                'Amount': 8,
-                'MaterialId': 'f1d402957a88fd396f302372a6912158',
-                'MaterialName': 'fluidPiping',
-                'MaterialTicker': 'FLP',
-                'ShipRepairMaterialId': 'f3296b313d2f98774a9aeab4a9eb7e59-FLP',
-            },
-            {
-                'Amount': 1,
-                'MaterialId': 'f3f12b5b3adebdd25f3067e5aa4589f0',
-                'MaterialName': 'lightweightHullPlate',
-                'MaterialTicker': 'LHP',
-                'ShipRepairMaterialId': 'f3296b313d2f98774a9aeab4a9eb7e59-LHP',
-            },
-        ],
-        'LastRepairEpochMs': None,
-        'CommissioningTimeEpochMs': 1769503342569,
-    },
-    {
-        'Name': 'Nitrogen',
-        'ShipId': 'f42fa27da9ff072f8cb8c90d87aa0727',
-        'StoreId': '0892176c9185afc5c2f27c189b12e257',
-        'Location': 'Antares I (ZV-307) - STATION',
-        'Condition': 0.960541844367981,
-        'AddressLines': [
-            {
-                'Name': 'Antares Station',
-                'LineId': '1deca369a92788b8079e7ac245be66f7',
-                'LineType': 'STATION',
-                'NaturalId': 'ANT',
-            },
-            {
-                'Name': 'Antares I',
-                'LineId': '8ecf9670ba070d78cfb5537e8d9f1b6c',
-                'LineType': 'SYSTEM',
-                'NaturalId': 'ZV-307',
-            },
-        ],
-        'Registration': 'AVI-03LH5',
-        'FtlFuelStoreId': '7f1162ec905d640139034486ee73bb10',
-        'StlFuelStoreId': 'ac71e9bf7973070bbe673ebcde8651b9',
-        'RepairMaterials': [
-            {
-                'Amount': 12,
-                'MaterialId': '432414a579f1fccd66136b257eb44408',
-                'MaterialName': 'fastenerKitMedium',
-                'MaterialTicker': 'MFK',
-                'ShipRepairMaterialId': 'f42fa27da9ff072f8cb8c90d87aa0727-MFK',
-            },
-            {
-                'Amount': 3,
-                'MaterialId': 'f3f12b5b3adebdd25f3067e5aa4589f0',
-                'MaterialName': 'lightweightHullPlate',
-                'MaterialTicker': 'LHP',
-                'ShipRepairMaterialId': 'f42fa27da9ff072f8cb8c90d87aa0727-LHP',
-            },
-            {
-                'Amount': 8,
-                'MaterialId': 'f1d402957a88fd396f302372a6912158',
-                'MaterialName': 'fluidPiping',
-                'MaterialTicker': 'FLP',
-                'ShipRepairMaterialId': 'f42fa27da9ff072f8cb8c90d87aa0727-FLP',
-            },
-            {
-                'Amount': 4,
-                'MaterialId': 'b700f9670131981590e77238d7c207d3',
-                'MaterialName': 'structuralSpacecraftComponent',
-                'MaterialTicker': 'SSC',
-                'ShipRepairMaterialId': 'f42fa27da9ff072f8cb8c90d87aa0727-SSC',
-            },
-        ],
-        'LastRepairEpochMs': 0,
-        'CommissioningTimeEpochMs': 1688323183238,
-    },
-]
+from gamedata.fio.standin import load_standin_payload
+
+fio_ship_data = load_standin_payload('ships')
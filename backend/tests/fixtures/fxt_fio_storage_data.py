@@ -1,8852 +1,3 @@
-fio_storage_data = [
-    {
-        'Name': None,
-        'Type': 'STORE',
-        'StorageId': '00e14a526b92f0c7675732f90b0a2aeb',
-        'Timestamp': '2026-03-02T15:31:47.378343Z',
-        'VolumeLoad': 2925.902,
-        'WeightLoad': 2885.766,
-        'StorageItems': [
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': 'b5744244bb7913cee262ec29abc3b9d0',
-                'TotalVolume': 6.4,
-                'TotalWeight': 8,
-                'MaterialName': 'settlerTools',
-                'MaterialValue': 0,
-                'MaterialAmount': 32,
-                'MaterialTicker': 'PT',
-                'MaterialVolume': 0.20000000298023224,
-                'MaterialWeight': 0.25,
-                'MaterialCategory': '3f047ec3043bdd795fd7272d6be98799',
-                'MaterialValueCurrency': 'NCC',
-            },
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': '87dd9b56a69e118e8c778de2dce11e8c',
-                'TotalVolume': 28.05,
-                'TotalWeight': 56.1,
-                'MaterialName': 'settlerClothing',
-                'MaterialValue': 0,
-                'MaterialAmount': 561,
-                'MaterialTicker': 'EXO',
-                'MaterialVolume': 0.05000000074505806,
-                'MaterialWeight': 0.10000000149011612,
-                'MaterialCategory': '3f047ec3043bdd795fd7272d6be98799',
-                'MaterialValueCurrency': 'NCC',
-            },
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': 'a1d1d61f8085de53455dd4e8a7813788',
-                'TotalVolume': 2.6,
-                'TotalWeight': 2.6,
-                'MaterialName': 'settlerLuxuryDrink',
-                'MaterialValue': 25961.84,
-                'MaterialAmount': 26,
-                'MaterialTicker': 'KOM',
-                'MaterialVolume': 0.10000000149011612,
-                'MaterialWeight': 0.10000000149011612,
-                'MaterialCategory': '8a0bd8b6a329c3d632da9da63c818b3d',
-                'MaterialValueCurrency': 'NCC',
-            },
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': '7171933481f022ca74200b216f98ca60',
-                'TotalVolume': 0.012,
-                'TotalWeight': 0.036,
-                'MaterialName': 'settlerLuxuryTools',
-                'MaterialValue': 4117.65,
-                'MaterialAmount': 6,
-                'MaterialTicker': 'REP',
-                'MaterialVolume': 0.0020000000949949026,
-                'MaterialWeight': 0.006000000052154064,
-                'MaterialCategory': '8a0bd8b6a329c3d632da9da63c818b3d',
-                'MaterialValueCurrency': 'NCC',
-            },
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': '4fca6f5b5e6c3b8a1b887c6dc99db146',
-                'TotalVolume': 109,
-                'TotalWeight': 109,
-                'MaterialName': 'drinkingWater',
-                'MaterialValue': 67060.25,
-                'MaterialAmount': 1090,
-                'MaterialTicker': 'DW',
-                'MaterialVolume': 0.10000000149011612,
-                'MaterialWeight': 0.10000000149011612,
-                'MaterialCategory': '3f047ec3043bdd795fd7272d6be98799',
-                'MaterialValueCurrency': 'NCC',
-            },
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': 'db4fbfd5c434a3952e7e1d37ae36158f',
-                'TotalVolume': 21.6,
-                'TotalWeight': 2.16,
-                'MaterialName': 'largePlasticsBoard',
-                'MaterialValue': 0,
-                'MaterialAmount': 27,
-                'MaterialTicker': 'PSL',
-                'MaterialVolume': 0.800000011920929,
-                'MaterialWeight': 0.07999999821186066,
-                'MaterialCategory': '6316282906a9f68b0c7bb4396a26aa95',
-                'MaterialValueCurrency': 'NCC',
-            },
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': '820d081096fd3e8fbd98b4344f6250ad',
-                'TotalVolume': 2.4,
-                'TotalWeight': 2.4,
-                'MaterialName': 'pioneerLuxuryClothing',
-                'MaterialValue': 16236.9,
-                'MaterialAmount': 48,
-                'MaterialTicker': 'PWO',
-                'MaterialVolume': 0.05000000074505806,
-                'MaterialWeight': 0.05000000074505806,
-                'MaterialCategory': '8a0bd8b6a329c3d632da9da63c818b3d',
-                'MaterialValueCurrency': 'NCC',
-            },
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': '12fb94d0184c18455533bffb4b8b7e51',
-                'TotalVolume': 96,
-                'TotalWeight': 108.48,
-                'MaterialName': 'nylon',
-                'MaterialValue': 0,
-                'MaterialAmount': 96,
-                'MaterialTicker': 'NL',
-                'MaterialVolume': 1,
-                'MaterialWeight': 1.1299999952316284,
-                'MaterialCategory': '7028d7d532ccd4c6c878b069e7bbb634',
-                'MaterialValueCurrency': 'NCC',
-            },
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': '64666b2eb0faaba594a62818e48229b8',
-                'TotalVolume': 5.74,
-                'TotalWeight': 11.48,
-                'MaterialName': 'polymerGranulate',
-                'MaterialValue': 0,
-                'MaterialAmount': 5740,
-                'MaterialTicker': 'PG',
-                'MaterialVolume': 0.0010000000474974513,
-                'MaterialWeight': 0.0020000000949949026,
-                'MaterialCategory': '6316282906a9f68b0c7bb4396a26aa95',
-                'MaterialValueCurrency': 'NCC',
-            },
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': '1205efe7810a94592524a53e87c3299b',
-                'TotalVolume': 1259,
-                'TotalWeight': 1196.05,
-                'MaterialName': 'cottonRaw',
-                'MaterialValue': 494088.25,
-                'MaterialAmount': 1259,
-                'MaterialTicker': 'RCO',
-                'MaterialVolume': 1,
-                'MaterialWeight': 0.949999988079071,
-                'MaterialCategory': '510e7751c0eb6a51fd0fa73565365d1c',
-                'MaterialValueCurrency': 'NCC',
-            },
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': '9842ad8d9dfdf8e4c2e80117e7b5ebaf',
-                'TotalVolume': 12,
-                'TotalWeight': 12,
-                'MaterialName': 'pioneerLuxuryDrink',
-                'MaterialValue': 0,
-                'MaterialAmount': 120,
-                'MaterialTicker': 'COF',
-                'MaterialVolume': 0.10000000149011612,
-                'MaterialWeight': 0.10000000149011612,
-                'MaterialCategory': '8a0bd8b6a329c3d632da9da63c818b3d',
-                'MaterialValueCurrency': 'NCC',
-            },
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': '83dd61885cf6879ff49fe1419f068f10',
-                'TotalVolume': 111.6,
-                'TotalWeight': 234.36,
-                'MaterialName': 'rations',
-                'MaterialValue': 95538.48,
-                'MaterialAmount': 1116,
-                'MaterialTicker': 'RAT',
-                'MaterialVolume': 0.10000000149011612,
-                'MaterialWeight': 0.20999999344348907,
-                'MaterialCategory': '3f047ec3043bdd795fd7272d6be98799',
-                'MaterialValueCurrency': 'NCC',
-            },
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': 'ee8e92a632d1b5f4847fe9d4e376aeca',
-                'TotalVolume': 629.5,
-                'TotalWeight': 629.5,
-                'MaterialName': 'polyEthylene',
-                'MaterialValue': 596470.1,
-                'MaterialAmount': 62950,
-                'MaterialTicker': 'PE',
-                'MaterialVolume': 0.009999999776482582,
-                'MaterialWeight': 0.009999999776482582,
-                'MaterialCategory': '6316282906a9f68b0c7bb4396a26aa95',
-                'MaterialValueCurrency': 'NCC',
-            },
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': '9788890100fd2191fb065cb0d5e624cb',
-                'TotalVolume': 642,
-                'TotalWeight': 513.6,
-                'MaterialName': 'pioneerClothing',
-                'MaterialValue': 0,
-                'MaterialAmount': 25680,
-                'MaterialTicker': 'OVE',
-                'MaterialVolume': 0.02500000037252903,
-                'MaterialWeight': 0.019999999552965164,
-                'MaterialCategory': '3f047ec3043bdd795fd7272d6be98799',
-                'MaterialValueCurrency': 'NCC',
-            },
-        ],
-        'AddressableId': '6eab22c0630c8081c4be75986dcb0780',
-        'VolumeCapacity': 11500,
-        'WeightCapacity': 11500,
-        'UserNameSubmitted': 'SFSCORPIO',
-    },
-    {
-        'Name': 'Magnesium',
-        'Type': 'STL_FUEL_STORE',
-        'StorageId': '0403ca452f65cdc759f0756c409555d9',
-        'Timestamp': '2026-03-02T15:31:47.378343Z',
-        'VolumeLoad': 210,
-        'WeightLoad': 210,
-        'StorageItems': [
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': '7756a0779efe67f0f293f41eda4944d4',
-                'TotalVolume': 210,
-                'TotalWeight': 210,
-                'MaterialName': 'stlFuel',
-                'MaterialValue': 53404.13,
-                'MaterialAmount': 3500,
-                'MaterialTicker': 'SF',
-                'MaterialVolume': 0.05999999865889549,
-                'MaterialWeight': 0.05999999865889549,
-                'MaterialCategory': 'ba98fa0cf77040a96cd8a608ad0d08e9',
-                'MaterialValueCurrency': 'NCC',
-            }
-        ],
-        'AddressableId': '70f3646bcd1e077928b399807012778d',
-        'VolumeCapacity': 210,
-        'WeightCapacity': 210,
-        'UserNameSubmitted': 'SFSCORPIO',
-    },
-    {
-        'Name': 'Strontium',
-        'Type': 'STL_FUEL_STORE',
-        'StorageId': '050bbc2743fdc746c04a9286282409d3',
-        'Timestamp': '2026-03-02T15:31:47.378343Z',
-        'VolumeLoad': 210,
-        'WeightLoad': 210,
-        'StorageItems': [
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': '7756a0779efe67f0f293f41eda4944d4',
-                'TotalVolume': 210,
-                'TotalWeight': 210,
-                'MaterialName': 'stlFuel',
-                'MaterialValue': 14405.52,
-                'MaterialAmount': 3500,
-                'MaterialTicker': 'SF',
-                'MaterialVolume': 0.05999999865889549,
-                'MaterialWeight': 0.05999999865889549,
-                'MaterialCategory': 'ba98fa0cf77040a96cd8a608ad0d08e9',
-                'MaterialValueCurrency': 'NCC',
-            }
-        ],
-        'AddressableId': '44430f53bf6e837ad79821d8d213d9ab',
-        'VolumeCapacity': 210,
-        'WeightCapacity': 210,
-        'UserNameSubmitted': 'SFSCORPIO',
-    },
-    {
-        'Name': None,
-        'Type': 'STORE',
-        'StorageId': '06ad0156f1c5333b2045682a177cbd7f',
-        'Timestamp': '2026-03-02T15:31:47.378343Z',
-        'VolumeLoad': 724.9590000000001,
-        'WeightLoad': 1283.967,
-        'StorageItems': [
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': '5b0e02208dbbb99695707001d626963a',
-                'TotalVolume': 0.45,
-                'TotalWeight': 0.45,
-                'MaterialName': 'technicianClothing',
-                'MaterialValue': 17233.29,
-                'MaterialAmount': 9,
-                'MaterialTicker': 'HMS',
-                'MaterialVolume': 0.05000000074505806,
-                'MaterialWeight': 0.05000000074505806,
-                'MaterialCategory': '3f047ec3043bdd795fd7272d6be98799',
-                'MaterialValueCurrency': 'NCC',
-            },
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': '08b3d1994643df5efe095b335be3a029',
-                'TotalVolume': 48,
-                'TotalWeight': 134.4,
-                'MaterialName': 'nanoCarbonSheeting',
-                'MaterialValue': 0,
-                'MaterialAmount': 4800,
-                'MaterialTicker': 'NCS',
-                'MaterialVolume': 0.009999999776482582,
-                'MaterialWeight': 0.02800000086426735,
-                'MaterialCategory': '156bbcce730fba6169338d560f05fd26',
-                'MaterialValueCurrency': 'NCC',
-            },
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': 'cd0c4bd7aae87c7e402d359b6e908b05',
-                'TotalVolume': 1.8,
-                'TotalWeight': 1.8,
-                'MaterialName': 'technicianLuxuryDrink',
-                'MaterialValue': 37811.29,
-                'MaterialAmount': 18,
-                'MaterialTicker': 'ALE',
-                'MaterialVolume': 0.10000000149011612,
-                'MaterialWeight': 0.10000000149011612,
-                'MaterialCategory': '8a0bd8b6a329c3d632da9da63c818b3d',
-                'MaterialValueCurrency': 'NCC',
-            },
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': '4bbcc7dc5dd16e9af90528ed04d9c6ba',
-                'TotalVolume': 326,
-                'TotalWeight': 733.5,
-                'MaterialName': 'carbon',
-                'MaterialValue': 0.01,
-                'MaterialAmount': 326,
-                'MaterialTicker': 'C',
-                'MaterialVolume': 1,
-                'MaterialWeight': 2.25,
-                'MaterialCategory': 'ef1d03e7ef924395c2173fc4e4ee8a6f',
-                'MaterialValueCurrency': 'NCC',
-            },
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': '5d36829593b5fd61674320cd66e4bb5c',
-                'TotalVolume': 3.9,
-                'TotalWeight': 11.7,
-                'MaterialName': 'technicianHealth',
-                'MaterialValue': 114198.55,
-                'MaterialAmount': 39,
-                'MaterialTicker': 'MED',
-                'MaterialVolume': 0.10000000149011612,
-                'MaterialWeight': 0.30000001192092896,
-                'MaterialCategory': '3f047ec3043bdd795fd7272d6be98799',
-                'MaterialValueCurrency': 'NCC',
-            },
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': '87dd9b56a69e118e8c778de2dce11e8c',
-                'TotalVolume': 0.75,
-                'TotalWeight': 1.5,
-                'MaterialName': 'settlerClothing',
-                'MaterialValue': 0,
-                'MaterialAmount': 15,
-                'MaterialTicker': 'EXO',
-                'MaterialVolume': 0.05000000074505806,
-                'MaterialWeight': 0.10000000149011612,
-                'MaterialCategory': '3f047ec3043bdd795fd7272d6be98799',
-                'MaterialValueCurrency': 'NCC',
-            },
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': '9c80515790fcd5fefc84d56c80f4bb2a',
-                'TotalVolume': 1.2,
-                'TotalWeight': 2.52,
-                'MaterialName': 'engineerLuxuryHealth',
-                'MaterialValue': 27762.2,
-                'MaterialAmount': 12,
-                'MaterialTicker': 'VG',
-                'MaterialVolume': 0.10000000149011612,
-                'MaterialWeight': 0.20999999344348907,
-                'MaterialCategory': '8a0bd8b6a329c3d632da9da63c818b3d',
-                'MaterialValueCurrency': 'NCC',
-            },
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': 'a1d1d61f8085de53455dd4e8a7813788',
-                'TotalVolume': 3,
-                'TotalWeight': 3,
-                'MaterialName': 'settlerLuxuryDrink',
-                'MaterialValue': 29948.22,
-                'MaterialAmount': 30,
-                'MaterialTicker': 'KOM',
-                'MaterialVolume': 0.10000000149011612,
-                'MaterialWeight': 0.10000000149011612,
-                'MaterialCategory': '8a0bd8b6a329c3d632da9da63c818b3d',
-                'MaterialValueCurrency': 'NCC',
-            },
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': '7171933481f022ca74200b216f98ca60',
-                'TotalVolume': 0.014,
-                'TotalWeight': 0.042,
-                'MaterialName': 'settlerLuxuryTools',
-                'MaterialValue': 4803.92,
-                'MaterialAmount': 7,
-                'MaterialTicker': 'REP',
-                'MaterialVolume': 0.0020000000949949026,
-                'MaterialWeight': 0.006000000052154064,
-                'MaterialCategory': '8a0bd8b6a329c3d632da9da63c818b3d',
-                'MaterialValueCurrency': 'NCC',
-            },
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': '1d2a14dda2d950fe0dfa51cb76e79e54',
-                'TotalVolume': 0.012,
-                'TotalWeight': 0.012,
-                'MaterialName': 'engineerTools',
-                'MaterialValue': 21822.31,
-                'MaterialAmount': 6,
-                'MaterialTicker': 'PDA',
-                'MaterialVolume': 0.0020000000949949026,
-                'MaterialWeight': 0.0020000000949949026,
-                'MaterialCategory': '3f047ec3043bdd795fd7272d6be98799',
-                'MaterialValueCurrency': 'NCC',
-            },
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': '73e138a825968b0132230d02591af63f',
-                'TotalVolume': 210.5,
-                'TotalWeight': 231.55,
-                'MaterialName': 'engineerFood',
-                'MaterialValue': 0,
-                'MaterialAmount': 421,
-                'MaterialTicker': 'FIM',
-                'MaterialVolume': 0.5,
-                'MaterialWeight': 0.550000011920929,
-                'MaterialCategory': '3f047ec3043bdd795fd7272d6be98799',
-                'MaterialValueCurrency': 'NCC',
-            },
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': 'a9c439ab4a206915c370ad05e0af62d9',
-                'TotalVolume': 6,
-                'TotalWeight': 6,
-                'MaterialName': 'engineerLuxuryDrink',
-                'MaterialValue': 78626.46,
-                'MaterialAmount': 60,
-                'MaterialTicker': 'GIN',
-                'MaterialVolume': 0.10000000149011612,
-                'MaterialWeight': 0.10000000149011612,
-                'MaterialCategory': '8a0bd8b6a329c3d632da9da63c818b3d',
-                'MaterialValueCurrency': 'NCC',
-            },
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': '83dd61885cf6879ff49fe1419f068f10',
-                'TotalVolume': 30.7,
-                'TotalWeight': 64.47,
-                'MaterialName': 'rations',
-                'MaterialValue': 16142.78,
-                'MaterialAmount': 307,
-                'MaterialTicker': 'RAT',
-                'MaterialVolume': 0.10000000149011612,
-                'MaterialWeight': 0.20999999344348907,
-                'MaterialCategory': '3f047ec3043bdd795fd7272d6be98799',
-                'MaterialValueCurrency': 'NCC',
-            },
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': '66369803dbe73bee8a78105d3ca00554',
-                'TotalVolume': 0.003,
-                'TotalWeight': 0.003,
-                'MaterialName': 'technicianTools',
-                'MaterialValue': 6732.74,
-                'MaterialAmount': 3,
-                'MaterialTicker': 'SCN',
-                'MaterialVolume': 0.0010000000474974513,
-                'MaterialWeight': 0.0010000000474974513,
-                'MaterialCategory': '3f047ec3043bdd795fd7272d6be98799',
-                'MaterialValueCurrency': 'NCC',
-            },
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': 'a36d549d1340c1d489cc4a9ccccf22d0',
-                'TotalVolume': 0.5,
-                'TotalWeight': 0.05,
-                'MaterialName': 'entertainmentDataCore',
-                'MaterialValue': 0,
-                'MaterialAmount': 50,
-                'MaterialTicker': 'EDC',
-                'MaterialVolume': 0.009999999776482582,
-                'MaterialWeight': 0.0010000000474974513,
-                'MaterialCategory': '1dfe943824ceb52d332b4650ce457218',
-                'MaterialValueCurrency': 'NCC',
-            },
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': '4fca6f5b5e6c3b8a1b887c6dc99db146',
-                'TotalVolume': 88.5,
-                'TotalWeight': 88.5,
-                'MaterialName': 'drinkingWater',
-                'MaterialValue': 41977.06,
-                'MaterialAmount': 885,
-                'MaterialTicker': 'DW',
-                'MaterialVolume': 0.10000000149011612,
-                'MaterialWeight': 0.10000000149011612,
-                'MaterialCategory': '3f047ec3043bdd795fd7272d6be98799',
-                'MaterialValueCurrency': 'NCC',
-            },
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': 'b5744244bb7913cee262ec29abc3b9d0',
-                'TotalVolume': 3,
-                'TotalWeight': 3.75,
-                'MaterialName': 'settlerTools',
-                'MaterialValue': 8843.84,
-                'MaterialAmount': 15,
-                'MaterialTicker': 'PT',
-                'MaterialVolume': 0.20000000298023224,
-                'MaterialWeight': 0.25,
-                'MaterialCategory': '3f047ec3043bdd795fd7272d6be98799',
-                'MaterialValueCurrency': 'NCC',
-            },
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': '379f7bc12b6d2800c0a9f72c4943628b',
-                'TotalVolume': 0.6,
-                'TotalWeight': 0.6,
-                'MaterialName': 'engineerClothing',
-                'MaterialValue': 28511.68,
-                'MaterialAmount': 12,
-                'MaterialTicker': 'HSS',
-                'MaterialVolume': 0.05000000074505806,
-                'MaterialWeight': 0.05000000074505806,
-                'MaterialCategory': '3f047ec3043bdd795fd7272d6be98799',
-                'MaterialValueCurrency': 'NCC',
-            },
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': '5952bfbf043018679334e7ea71b1504e',
-                'TotalVolume': 0.03,
-                'TotalWeight': 0.12,
-                'MaterialName': 'technicianLuxuryHealth',
-                'MaterialValue': 3647.53,
-                'MaterialAmount': 3,
-                'MaterialTicker': 'SC',
-                'MaterialVolume': 0.009999999776482582,
-                'MaterialWeight': 0.03999999910593033,
-                'MaterialCategory': '8a0bd8b6a329c3d632da9da63c818b3d',
-                'MaterialValueCurrency': 'NCC',
-            },
-        ],
-        'AddressableId': '752b8d1a0837c5f418ba3d1936e66c23',
-        'VolumeCapacity': 6500,
-        'WeightCapacity': 6500,
-        'UserNameSubmitted': 'SFSCORPIO',
-    },
-    {
-        'Name': 'Rubidium',
-        'Type': 'STL_FUEL_STORE',
-        'StorageId': '06ad5c789b2899988ec664c6e936845e',
-        'Timestamp': '2026-03-02T15:31:47.378343Z',
-        'VolumeLoad': 174.96,
-        'WeightLoad': 174.96,
-        'StorageItems': [
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': '7756a0779efe67f0f293f41eda4944d4',
-                'TotalVolume': 174.96,
-                'TotalWeight': 174.96,
-                'MaterialName': 'stlFuel',
-                'MaterialValue': 6660.77,
-                'MaterialAmount': 2916,
-                'MaterialTicker': 'SF',
-                'MaterialVolume': 0.05999999865889549,
-                'MaterialWeight': 0.05999999865889549,
-                'MaterialCategory': 'ba98fa0cf77040a96cd8a608ad0d08e9',
-                'MaterialValueCurrency': 'NCC',
-            }
-        ],
-        'AddressableId': '579cf5e6798a28b94b17b6f688841ee6',
-        'VolumeCapacity': 210,
-        'WeightCapacity': 210,
-        'UserNameSubmitted': 'SFSCORPIO',
-    },
-    {
-        'Name': 'Krypton',
-        'Type': 'STL_FUEL_STORE',
-        'StorageId': '07824fd397cae2d31d6ce204c2d27b97',
-        'Timestamp': '2026-03-02T15:31:47.378343Z',
-        'VolumeLoad': 210,
-        'WeightLoad': 210,
-        'StorageItems': [
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': '7756a0779efe67f0f293f41eda4944d4',
-                'TotalVolume': 210,
-                'TotalWeight': 210,
-                'MaterialName': 'stlFuel',
-                'MaterialValue': 11488.46,
-                'MaterialAmount': 3500,
-                'MaterialTicker': 'SF',
-                'MaterialVolume': 0.05999999865889549,
-                'MaterialWeight': 0.05999999865889549,
-                'MaterialCategory': 'ba98fa0cf77040a96cd8a608ad0d08e9',
-                'MaterialValueCurrency': 'NCC',
-            }
-        ],
-        'AddressableId': 'da3e544a5882353437092caa05ab7ea9',
-        'VolumeCapacity': 210,
-        'WeightCapacity': 210,
-        'UserNameSubmitted': 'SFSCORPIO',
-    },
-    {
-        'Name': None,
-        'Type': 'STORE',
-        'StorageId': '0805826d504f4cf4fa039df0dfd9ef45',
-        'Timestamp': '2026-03-02T15:31:47.378343Z',
-        'VolumeLoad': 2154.9500000000003,
-        'WeightLoad': 4267.494000000001,
-        'StorageItems': [
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': '9788890100fd2191fb065cb0d5e624cb',
-                'TotalVolume': 1.4,
-                'TotalWeight': 1.12,
-                'MaterialName': 'pioneerClothing',
-                'MaterialValue': 0,
-                'MaterialAmount': 56,
-                'MaterialTicker': 'OVE',
-                'MaterialVolume': 0.02500000037252903,
-                'MaterialWeight': 0.019999999552965164,
-                'MaterialCategory': '3f047ec3043bdd795fd7272d6be98799',
-                'MaterialValueCurrency': 'NCC',
-            },
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': '6e16dbf050b98d9c4fc9c615b3367a0f',
-                'TotalVolume': 394,
-                'TotalWeight': 449.554,
-                'MaterialName': 'oxygen',
-                'MaterialValue': 3244.1,
-                'MaterialAmount': 394,
-                'MaterialTicker': 'O',
-                'MaterialVolume': 1,
-                'MaterialWeight': 1.1410000324249268,
-                'MaterialCategory': '54dec1e42eba44dda423dd774393326a',
-                'MaterialValueCurrency': 'NCC',
-            },
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': 'ed72545a5db1f16430d79a240dc61e6c',
-                'TotalVolume': 760,
-                'TotalWeight': 2052,
-                'MaterialName': 'aluminium',
-                'MaterialValue': 0,
-                'MaterialAmount': 760,
-                'MaterialTicker': 'AL',
-                'MaterialVolume': 1,
-                'MaterialWeight': 2.700000047683716,
-                'MaterialCategory': 'cae48680d4c4e6f98d593a8c3778cb56',
-                'MaterialValueCurrency': 'NCC',
-            },
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': '4fca6f5b5e6c3b8a1b887c6dc99db146',
-                'TotalVolume': 44.7,
-                'TotalWeight': 44.7,
-                'MaterialName': 'drinkingWater',
-                'MaterialValue': 25310.7,
-                'MaterialAmount': 447,
-                'MaterialTicker': 'DW',
-                'MaterialVolume': 0.10000000149011612,
-                'MaterialWeight': 0.10000000149011612,
-                'MaterialCategory': '3f047ec3043bdd795fd7272d6be98799',
-                'MaterialValueCurrency': 'NCC',
-            },
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': '820d081096fd3e8fbd98b4344f6250ad',
-                'TotalVolume': 1.15,
-                'TotalWeight': 1.15,
-                'MaterialName': 'pioneerLuxuryClothing',
-                'MaterialValue': 7785.05,
-                'MaterialAmount': 23,
-                'MaterialTicker': 'PWO',
-                'MaterialVolume': 0.05000000074505806,
-                'MaterialWeight': 0.05000000074505806,
-                'MaterialCategory': '8a0bd8b6a329c3d632da9da63c818b3d',
-                'MaterialValueCurrency': 'NCC',
-            },
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': '51c829b6e62e70223024ffa6688db9f7',
-                'TotalVolume': 39.4,
-                'TotalWeight': 98.5,
-                'MaterialName': 'flux',
-                'MaterialValue': 0.01,
-                'MaterialAmount': 394,
-                'MaterialTicker': 'FLX',
-                'MaterialVolume': 0.10000000149011612,
-                'MaterialWeight': 0.25,
-                'MaterialCategory': '9b32ea2333917ee2632ba7ae7675643f',
-                'MaterialValueCurrency': 'NCC',
-            },
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': '4bbcc7dc5dd16e9af90528ed04d9c6ba',
-                'TotalVolume': 394,
-                'TotalWeight': 886.5,
-                'MaterialName': 'carbon',
-                'MaterialValue': 0.01,
-                'MaterialAmount': 394,
-                'MaterialTicker': 'C',
-                'MaterialVolume': 1,
-                'MaterialWeight': 2.25,
-                'MaterialCategory': 'ef1d03e7ef924395c2173fc4e4ee8a6f',
-                'MaterialValueCurrency': 'NCC',
-            },
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': '9842ad8d9dfdf8e4c2e80117e7b5ebaf',
-                'TotalVolume': 5.6,
-                'TotalWeight': 5.6,
-                'MaterialName': 'pioneerLuxuryDrink',
-                'MaterialValue': 0,
-                'MaterialAmount': 56,
-                'MaterialTicker': 'COF',
-                'MaterialVolume': 0.10000000149011612,
-                'MaterialWeight': 0.10000000149011612,
-                'MaterialCategory': '8a0bd8b6a329c3d632da9da63c818b3d',
-                'MaterialValueCurrency': 'NCC',
-            },
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': '04f72b0c957b769c6d45c011e9c9b4b5',
-                'TotalVolume': 470,
-                'TotalWeight': 634.5,
-                'MaterialName': 'aluminiumOre',
-                'MaterialValue': 0,
-                'MaterialAmount': 470,
-                'MaterialTicker': 'ALO',
-                'MaterialVolume': 1,
-                'MaterialWeight': 1.350000023841858,
-                'MaterialCategory': '4c0430b40fbf7fa175ed4a5a13682c6f',
-                'MaterialValueCurrency': 'NCC',
-            },
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': '83dd61885cf6879ff49fe1419f068f10',
-                'TotalVolume': 44.7,
-                'TotalWeight': 93.87,
-                'MaterialName': 'rations',
-                'MaterialValue': 35009.11,
-                'MaterialAmount': 447,
-                'MaterialTicker': 'RAT',
-                'MaterialVolume': 0.10000000149011612,
-                'MaterialWeight': 0.20999999344348907,
-                'MaterialCategory': '3f047ec3043bdd795fd7272d6be98799',
-                'MaterialValueCurrency': 'NCC',
-            },
-        ],
-        'AddressableId': '5f4ca69314f6d00552d3fc35b7bd7ca7',
-        'VolumeCapacity': 6500,
-        'WeightCapacity': 6500,
-        'UserNameSubmitted': 'SFSCORPIO',
-    },
-    {
-        'Name': 'Nitrogen',
-        'Type': 'SHIP_STORE',
-        'StorageId': '0892176c9185afc5c2f27c189b12e257',
-        'Timestamp': '2026-03-02T15:31:47.378343Z',
-        'VolumeLoad': 0,
-        'WeightLoad': 0,
-        'StorageItems': [],
-        'AddressableId': 'f42fa27da9ff072f8cb8c90d87aa0727',
-        'VolumeCapacity': 2000,
-        'WeightCapacity': 2000,
-        'UserNameSubmitted': 'SFSCORPIO',
-    },
-    {
-        'Name': 'Oxygen',
-        'Type': 'FTL_FUEL_STORE',
-        'StorageId': '090857970873ebdc9ef73561ec5e3552',
-        'Timestamp': '2026-03-02T15:31:47.378343Z',
-        'VolumeLoad': 20,
-        'WeightLoad': 100,
-        'StorageItems': [
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': '7a2a12cd6872b89a6b97532618788a4d',
-                'TotalVolume': 20,
-                'TotalWeight': 100,
-                'MaterialName': 'ftlFuel',
-                'MaterialValue': 34864.48,
-                'MaterialAmount': 2000,
-                'MaterialTicker': 'FF',
-                'MaterialVolume': 0.009999999776482582,
-                'MaterialWeight': 0.05000000074505806,
-                'MaterialCategory': 'ba98fa0cf77040a96cd8a608ad0d08e9',
-                'MaterialValueCurrency': 'NCC',
-            }
-        ],
-        'AddressableId': 'e1b36a7b1fba4354356a091f8f413ecf',
-        'VolumeCapacity': 20,
-        'WeightCapacity': 100,
-        'UserNameSubmitted': 'SFSCORPIO',
-    },
-    {
-        'Name': 'Bromine',
-        'Type': 'SHIP_STORE',
-        'StorageId': '0951c22566890d32c8dc80a01d1e9830',
-        'Timestamp': '2026-03-02T15:31:47.378343Z',
-        'VolumeLoad': 0,
-        'WeightLoad': 0,
-        'StorageItems': [],
-        'AddressableId': '985b1255ea002b44e81767cfb54cafba',
-        'VolumeCapacity': 2000,
-        'WeightCapacity': 2000,
-        'UserNameSubmitted': 'SFSCORPIO',
-    },
-    {
-        'Name': 'Phosphorus',
-        'Type': 'SHIP_STORE',
-        'StorageId': '09cd071f57780af711ca9d48d5718716',
-        'Timestamp': '2026-03-02T15:31:47.378343Z',
-        'VolumeLoad': 0,
-        'WeightLoad': 0,
-        'StorageItems': [],
-        'AddressableId': 'eaeb72e975eba33df85e530c14f810ec',
-        'VolumeCapacity': 2000,
-        'WeightCapacity': 2000,
-        'UserNameSubmitted': 'SFSCORPIO',
-    },
-    {
-        'Name': 'Zinc',
-        'Type': 'SHIP_STORE',
-        'StorageId': '0e725fc17f8ff283bf186566ac821795',
-        'Timestamp': '2026-03-02T15:31:47.378343Z',
-        'VolumeLoad': 0,
-        'WeightLoad': 0,
-        'StorageItems': [],
-        'AddressableId': '6c9ad6b6462bbce6667ff6361c424ba4',
-        'VolumeCapacity': 2000,
-        'WeightCapacity': 2000,
-        'UserNameSubmitted': 'SFSCORPIO',
-    },
-    {
-        'Name': 'Manganese',
-        'Type': 'STL_FUEL_STORE',
-        'StorageId': '10a1725450549ca911036239f2fd5ea4',
-        'Timestamp': '2026-03-02T15:31:47.378343Z',
-        'VolumeLoad': 210,
-        'WeightLoad': 210,
-        'StorageItems': [
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': '7756a0779efe67f0f293f41eda4944d4',
-                'TotalVolume': 210,
-                'TotalWeight': 210,
-                'MaterialName': 'stlFuel',
-                'MaterialValue': 56173.55,
-                'MaterialAmount': 3500,
-                'MaterialTicker': 'SF',
-                'MaterialVolume': 0.05999999865889549,
-                'MaterialWeight': 0.05999999865889549,
-                'MaterialCategory': 'ba98fa0cf77040a96cd8a608ad0d08e9',
-                'MaterialValueCurrency': 'NCC',
-            }
-        ],
-        'AddressableId': '3528adb0e89f733b199363da3ed8aa1b',
-        'VolumeCapacity': 210,
-        'WeightCapacity': 210,
-        'UserNameSubmitted': 'SFSCORPIO',
-    },
-    {
-        'Name': 'Boron',
-        'Type': 'SHIP_STORE',
-        'StorageId': '12649736a2ab94316983fbe42e73c725',
-        'Timestamp': '2026-03-02T15:31:47.378343Z',
-        'VolumeLoad': 0,
-        'WeightLoad': 0,
-        'StorageItems': [],
-        'AddressableId': '2b14db4e8fd72dd90e0b1a9b3a91e005',
-        'VolumeCapacity': 2000,
-        'WeightCapacity': 2000,
-        'UserNameSubmitted': 'SFSCORPIO',
-    },
-    {
-        'Name': 'Helium',
-        'Type': 'FTL_FUEL_STORE',
-        'StorageId': '14c37ab1ace8bb999123cafab3d2179c',
-        'Timestamp': '2026-03-02T15:31:47.378343Z',
-        'VolumeLoad': 3,
-        'WeightLoad': 15,
-        'StorageItems': [
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': '7a2a12cd6872b89a6b97532618788a4d',
-                'TotalVolume': 3,
-                'TotalWeight': 15,
-                'MaterialName': 'ftlFuel',
-                'MaterialValue': 5490.09,
-                'MaterialAmount': 300,
-                'MaterialTicker': 'FF',
-                'MaterialVolume': 0.009999999776482582,
-                'MaterialWeight': 0.05000000074505806,
-                'MaterialCategory': 'ba98fa0cf77040a96cd8a608ad0d08e9',
-                'MaterialValueCurrency': 'NCC',
-            }
-        ],
-        'AddressableId': '5c24c3953be8753479b742a05b162ffa',
-        'VolumeCapacity': 3,
-        'WeightCapacity': 15,
-        'UserNameSubmitted': 'SFSCORPIO',
-    },
-    {
-        'Name': 'Molybdenum',
-        'Type': 'SHIP_STORE',
-        'StorageId': '152577aebc889b7fbc218de504d2d1cc',
-        'Timestamp': '2026-03-02T15:31:47.378343Z',
-        'VolumeLoad': 0,
-        'WeightLoad': 0,
-        'StorageItems': [],
-        'AddressableId': '260f304a705e06d8bb003296dd5f8953',
-        'VolumeCapacity': 2000,
-        'WeightCapacity': 2000,
-        'UserNameSubmitted': 'SFSCORPIO',
-    },
-    {
-        'Name': None,
-        'Type': 'STORE',
-        'StorageId': '164c6746a9b468d1979c700937dd6071',
-        'Timestamp': '2026-03-02T15:31:47.378343Z',
-        'VolumeLoad': 1419.465,
-        'WeightLoad': 1942.9859999999999,
-        'StorageItems': [
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': '11ec662cd8ba85e87b111a7ba7aa4973',
-                'TotalVolume': 360,
-                'TotalWeight': 349.2,
-                'MaterialName': 'sodium',
-                'MaterialValue': 0,
-                'MaterialAmount': 360,
-                'MaterialTicker': 'NA',
-                'MaterialVolume': 1,
-                'MaterialWeight': 0.9700000286102295,
-                'MaterialCategory': 'ef1d03e7ef924395c2173fc4e4ee8a6f',
-                'MaterialValueCurrency': 'NCC',
-            },
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': '5b0e02208dbbb99695707001d626963a',
-                'TotalVolume': 0.65,
-                'TotalWeight': 0.65,
-                'MaterialName': 'technicianClothing',
-                'MaterialValue': 24774.65,
-                'MaterialAmount': 13,
-                'MaterialTicker': 'HMS',
-                'MaterialVolume': 0.05000000074505806,
-                'MaterialWeight': 0.05000000074505806,
-                'MaterialCategory': '3f047ec3043bdd795fd7272d6be98799',
-                'MaterialValueCurrency': 'NCC',
-            },
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': 'ec8dbb1d3f51d89c61b6f58fdd64a7f0',
-                'TotalVolume': 43.2,
-                'TotalWeight': 43.2,
-                'MaterialName': 'water',
-                'MaterialValue': 0.29,
-                'MaterialAmount': 216,
-                'MaterialTicker': 'H2O',
-                'MaterialVolume': 0.20000000298023224,
-                'MaterialWeight': 0.20000000298023224,
-                'MaterialCategory': '473218d3618453bf25d2cd0b5616a72f',
-                'MaterialValueCurrency': 'NCC',
-            },
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': '9842ad8d9dfdf8e4c2e80117e7b5ebaf',
-                'TotalVolume': 2.6,
-                'TotalWeight': 2.6,
-                'MaterialName': 'pioneerLuxuryDrink',
-                'MaterialValue': 0,
-                'MaterialAmount': 26,
-                'MaterialTicker': 'COF',
-                'MaterialVolume': 0.10000000149011612,
-                'MaterialWeight': 0.10000000149011612,
-                'MaterialCategory': '8a0bd8b6a329c3d632da9da63c818b3d',
-                'MaterialValueCurrency': 'NCC',
-            },
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': 'c04de28c3e717f236d6ed177b89d9523',
-                'TotalVolume': 202,
-                'TotalWeight': 14.14,
-                'MaterialName': 'hydrogen',
-                'MaterialValue': 25968.11,
-                'MaterialAmount': 202,
-                'MaterialTicker': 'H',
-                'MaterialVolume': 1,
-                'MaterialWeight': 0.07000000029802322,
-                'MaterialCategory': '54dec1e42eba44dda423dd774393326a',
-                'MaterialValueCurrency': 'NCC',
-            },
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': '83dd61885cf6879ff49fe1419f068f10',
-                'TotalVolume': 83.8,
-                'TotalWeight': 175.98,
-                'MaterialName': 'rations',
-                'MaterialValue': 58120.12,
-                'MaterialAmount': 838,
-                'MaterialTicker': 'RAT',
-                'MaterialVolume': 0.10000000149011612,
-                'MaterialWeight': 0.20999999344348907,
-                'MaterialCategory': '3f047ec3043bdd795fd7272d6be98799',
-                'MaterialValueCurrency': 'NCC',
-            },
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': '7e3f98a49ce2d3c8361975de8b4bbea4',
-                'TotalVolume': 135,
-                'TotalWeight': 292.95,
-                'MaterialName': 'halite',
-                'MaterialValue': 1823.83,
-                'MaterialAmount': 135,
-                'MaterialTicker': 'HAL',
-                'MaterialVolume': 1,
-                'MaterialWeight': 2.1700000762939453,
-                'MaterialCategory': '79f3917448cc4f6034ece865c41aea34',
-                'MaterialValueCurrency': 'NCC',
-            },
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': '5952bfbf043018679334e7ea71b1504e',
-                'TotalVolume': 0.03,
-                'TotalWeight': 0.12,
-                'MaterialName': 'technicianLuxuryHealth',
-                'MaterialValue': 3647.53,
-                'MaterialAmount': 3,
-                'MaterialTicker': 'SC',
-                'MaterialVolume': 0.009999999776482582,
-                'MaterialWeight': 0.03999999910593033,
-                'MaterialCategory': '8a0bd8b6a329c3d632da9da63c818b3d',
-                'MaterialValueCurrency': 'NCC',
-            },
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': 'fe5be65546733ffa4f619bbc76ac532d',
-                'TotalVolume': 19.2,
-                'TotalWeight': 21.12,
-                'MaterialName': 'pesticides',
-                'MaterialValue': 0,
-                'MaterialAmount': 192,
-                'MaterialTicker': 'DDT',
-                'MaterialVolume': 0.10000000149011612,
-                'MaterialWeight': 0.10999999940395355,
-                'MaterialCategory': '9b32ea2333917ee2632ba7ae7675643f',
-                'MaterialValueCurrency': 'NCC',
-            },
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': '9788890100fd2191fb065cb0d5e624cb',
-                'TotalVolume': 0.65,
-                'TotalWeight': 0.52,
-                'MaterialName': 'pioneerClothing',
-                'MaterialValue': 0,
-                'MaterialAmount': 26,
-                'MaterialTicker': 'OVE',
-                'MaterialVolume': 0.02500000037252903,
-                'MaterialWeight': 0.019999999552965164,
-                'MaterialCategory': '3f047ec3043bdd795fd7272d6be98799',
-                'MaterialValueCurrency': 'NCC',
-            },
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': 'b5744244bb7913cee262ec29abc3b9d0',
-                'TotalVolume': 7.8,
-                'TotalWeight': 9.75,
-                'MaterialName': 'settlerTools',
-                'MaterialValue': 23375.28,
-                'MaterialAmount': 39,
-                'MaterialTicker': 'PT',
-                'MaterialVolume': 0.20000000298023224,
-                'MaterialWeight': 0.25,
-                'MaterialCategory': '3f047ec3043bdd795fd7272d6be98799',
-                'MaterialValueCurrency': 'NCC',
-            },
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': '4bbcc7dc5dd16e9af90528ed04d9c6ba',
-                'TotalVolume': 202,
-                'TotalWeight': 454.5,
-                'MaterialName': 'carbon',
-                'MaterialValue': 0,
-                'MaterialAmount': 202,
-                'MaterialTicker': 'C',
-                'MaterialVolume': 1,
-                'MaterialWeight': 2.25,
-                'MaterialCategory': 'ef1d03e7ef924395c2173fc4e4ee8a6f',
-                'MaterialValueCurrency': 'NCC',
-            },
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': '19be1b1e67efe63de8127d057508fe0c',
-                'TotalVolume': 41,
-                'TotalWeight': 131.2,
-                'MaterialName': 'chlorine',
-                'MaterialValue': 0,
-                'MaterialAmount': 41,
-                'MaterialTicker': 'CL',
-                'MaterialVolume': 1,
-                'MaterialWeight': 3.200000047683716,
-                'MaterialCategory': 'ef1d03e7ef924395c2173fc4e4ee8a6f',
-                'MaterialValueCurrency': 'NCC',
-            },
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': '5d36829593b5fd61674320cd66e4bb5c',
-                'TotalVolume': 1.3,
-                'TotalWeight': 3.9,
-                'MaterialName': 'technicianHealth',
-                'MaterialValue': 21149.36,
-                'MaterialAmount': 13,
-                'MaterialTicker': 'MED',
-                'MaterialVolume': 0.10000000149011612,
-                'MaterialWeight': 0.30000001192092896,
-                'MaterialCategory': '3f047ec3043bdd795fd7272d6be98799',
-                'MaterialValueCurrency': 'NCC',
-            },
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': '78321af6ac08c494186fafff3965034f',
-                'TotalVolume': 103,
-                'TotalWeight': 206,
-                'MaterialName': 'epoxy',
-                'MaterialValue': 0,
-                'MaterialAmount': 5150,
-                'MaterialTicker': 'EPO',
-                'MaterialVolume': 0.019999999552965164,
-                'MaterialWeight': 0.03999999910593033,
-                'MaterialCategory': '156bbcce730fba6169338d560f05fd26',
-                'MaterialValueCurrency': 'NCC',
-            },
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': '87dd9b56a69e118e8c778de2dce11e8c',
-                'TotalVolume': 1.95,
-                'TotalWeight': 3.9,
-                'MaterialName': 'settlerClothing',
-                'MaterialValue': 0,
-                'MaterialAmount': 39,
-                'MaterialTicker': 'EXO',
-                'MaterialVolume': 0.05000000074505806,
-                'MaterialWeight': 0.10000000149011612,
-                'MaterialCategory': '3f047ec3043bdd795fd7272d6be98799',
-                'MaterialValueCurrency': 'NCC',
-            },
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': 'a1d1d61f8085de53455dd4e8a7813788',
-                'TotalVolume': 7.6,
-                'TotalWeight': 7.6,
-                'MaterialName': 'settlerLuxuryDrink',
-                'MaterialValue': 75922.86,
-                'MaterialAmount': 76,
-                'MaterialTicker': 'KOM',
-                'MaterialVolume': 0.10000000149011612,
-                'MaterialWeight': 0.10000000149011612,
-                'MaterialCategory': '8a0bd8b6a329c3d632da9da63c818b3d',
-                'MaterialValueCurrency': 'NCC',
-            },
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': '6e16dbf050b98d9c4fc9c615b3367a0f',
-                'TotalVolume': 127,
-                'TotalWeight': 144.907,
-                'MaterialName': 'oxygen',
-                'MaterialValue': 2637.15,
-                'MaterialAmount': 127,
-                'MaterialTicker': 'O',
-                'MaterialVolume': 1,
-                'MaterialWeight': 1.1410000324249268,
-                'MaterialCategory': '54dec1e42eba44dda423dd774393326a',
-                'MaterialValueCurrency': 'NCC',
-            },
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': '7171933481f022ca74200b216f98ca60',
-                'TotalVolume': 0.032,
-                'TotalWeight': 0.096,
-                'MaterialName': 'settlerLuxuryTools',
-                'MaterialValue': 10980.4,
-                'MaterialAmount': 16,
-                'MaterialTicker': 'REP',
-                'MaterialVolume': 0.0020000000949949026,
-                'MaterialWeight': 0.006000000052154064,
-                'MaterialCategory': '8a0bd8b6a329c3d632da9da63c818b3d',
-                'MaterialValueCurrency': 'NCC',
-            },
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': '4fca6f5b5e6c3b8a1b887c6dc99db146',
-                'TotalVolume': 77.5,
-                'TotalWeight': 77.5,
-                'MaterialName': 'drinkingWater',
-                'MaterialValue': 38956.86,
-                'MaterialAmount': 775,
-                'MaterialTicker': 'DW',
-                'MaterialVolume': 0.10000000149011612,
-                'MaterialWeight': 0.10000000149011612,
-                'MaterialCategory': '3f047ec3043bdd795fd7272d6be98799',
-                'MaterialValueCurrency': 'NCC',
-            },
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': '820d081096fd3e8fbd98b4344f6250ad',
-                'TotalVolume': 0.55,
-                'TotalWeight': 0.55,
-                'MaterialName': 'pioneerLuxuryClothing',
-                'MaterialValue': 3717.71,
-                'MaterialAmount': 11,
-                'MaterialTicker': 'PWO',
-                'MaterialVolume': 0.05000000074505806,
-                'MaterialWeight': 0.05000000074505806,
-                'MaterialCategory': '8a0bd8b6a329c3d632da9da63c818b3d',
-                'MaterialValueCurrency': 'NCC',
-            },
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': '66369803dbe73bee8a78105d3ca00554',
-                'TotalVolume': 0.003,
-                'TotalWeight': 0.003,
-                'MaterialName': 'technicianTools',
-                'MaterialValue': 6656.29,
-                'MaterialAmount': 3,
-                'MaterialTicker': 'SCN',
-                'MaterialVolume': 0.0010000000474974513,
-                'MaterialWeight': 0.0010000000474974513,
-                'MaterialCategory': '3f047ec3043bdd795fd7272d6be98799',
-                'MaterialValueCurrency': 'NCC',
-            },
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': 'cd0c4bd7aae87c7e402d359b6e908b05',
-                'TotalVolume': 2.6,
-                'TotalWeight': 2.6,
-                'MaterialName': 'technicianLuxuryDrink',
-                'MaterialValue': 38173.15,
-                'MaterialAmount': 26,
-                'MaterialTicker': 'ALE',
-                'MaterialVolume': 0.10000000149011612,
-                'MaterialWeight': 0.10000000149011612,
-                'MaterialCategory': '8a0bd8b6a329c3d632da9da63c818b3d',
-                'MaterialValueCurrency': 'NCC',
-            },
-        ],
-        'AddressableId': '6d1f25615487a3a4b891d34987372801',
-        'VolumeCapacity': 6500,
-        'WeightCapacity': 6500,
-        'UserNameSubmitted': 'SFSCORPIO',
-    },
-    {
-        'Name': 'Germanium',
-        'Type': 'STL_FUEL_STORE',
-        'StorageId': '1798a6a46337d863ff17952be16ab528',
-        'Timestamp': '2026-03-02T15:31:47.378343Z',
-        'VolumeLoad': 210,
-        'WeightLoad': 210,
-        'StorageItems': [
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': '7756a0779efe67f0f293f41eda4944d4',
-                'TotalVolume': 210,
-                'TotalWeight': 210,
-                'MaterialName': 'stlFuel',
-                'MaterialValue': 58569.91,
-                'MaterialAmount': 3500,
-                'MaterialTicker': 'SF',
-                'MaterialVolume': 0.05999999865889549,
-                'MaterialWeight': 0.05999999865889549,
-                'MaterialCategory': 'ba98fa0cf77040a96cd8a608ad0d08e9',
-                'MaterialValueCurrency': 'NCC',
-            }
-        ],
-        'AddressableId': '13c545faa7e5bac208310aba8193cb1f',
-        'VolumeCapacity': 210,
-        'WeightCapacity': 210,
-        'UserNameSubmitted': 'SFSCORPIO',
-    },
-    {
-        'Name': 'Silicon',
-        'Type': 'FTL_FUEL_STORE',
-        'StorageId': '195dc429fc89fe48451962f7ed81e56c',
-        'Timestamp': '2026-03-02T15:31:47.378343Z',
-        'VolumeLoad': 20,
-        'WeightLoad': 100,
-        'StorageItems': [
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': '7a2a12cd6872b89a6b97532618788a4d',
-                'TotalVolume': 20,
-                'TotalWeight': 100,
-                'MaterialName': 'ftlFuel',
-                'MaterialValue': 34023.91,
-                'MaterialAmount': 2000,
-                'MaterialTicker': 'FF',
-                'MaterialVolume': 0.009999999776482582,
-                'MaterialWeight': 0.05000000074505806,
-                'MaterialCategory': 'ba98fa0cf77040a96cd8a608ad0d08e9',
-                'MaterialValueCurrency': 'NCC',
-            }
-        ],
-        'AddressableId': '4d249613111db220f2f6bbe3d060238f',
-        'VolumeCapacity': 20,
-        'WeightCapacity': 100,
-        'UserNameSubmitted': 'SFSCORPIO',
-    },
-    {
-        'Name': 'Copper',
-        'Type': 'SHIP_STORE',
-        'StorageId': '1b57087db0546a261a2e5fed553a9c13',
-        'Timestamp': '2026-03-02T15:31:47.378343Z',
-        'VolumeLoad': 0,
-        'WeightLoad': 0,
-        'StorageItems': [],
-        'AddressableId': '815f5c70425fce2c4942de12f40a561a',
-        'VolumeCapacity': 2000,
-        'WeightCapacity': 2000,
-        'UserNameSubmitted': 'SFSCORPIO',
-    },
-    {
-        'Name': 'Antimony',
-        'Type': 'SHIP_STORE',
-        'StorageId': '1c6ebc60f1c4059035c271e28688c216',
-        'Timestamp': '2026-03-02T15:31:47.378343Z',
-        'VolumeLoad': 0,
-        'WeightLoad': 0,
-        'StorageItems': [],
-        'AddressableId': 'f2085c49847885ef760ee305cd6cd7e2',
-        'VolumeCapacity': 2000,
-        'WeightCapacity': 2000,
-        'UserNameSubmitted': 'SFSCORPIO',
-    },
-    {
-        'Name': 'Rubidium',
-        'Type': 'FTL_FUEL_STORE',
-        'StorageId': '1c9123e97fc13adb8ae502777a01631a',
-        'Timestamp': '2026-03-02T15:31:47.378343Z',
-        'VolumeLoad': 19.17,
-        'WeightLoad': 95.85,
-        'StorageItems': [
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': '7a2a12cd6872b89a6b97532618788a4d',
-                'TotalVolume': 19.17,
-                'TotalWeight': 95.85,
-                'MaterialName': 'ftlFuel',
-                'MaterialValue': 6442.63,
-                'MaterialAmount': 1917,
-                'MaterialTicker': 'FF',
-                'MaterialVolume': 0.009999999776482582,
-                'MaterialWeight': 0.05000000074505806,
-                'MaterialCategory': 'ba98fa0cf77040a96cd8a608ad0d08e9',
-                'MaterialValueCurrency': 'NCC',
-            }
-        ],
-        'AddressableId': '579cf5e6798a28b94b17b6f688841ee6',
-        'VolumeCapacity': 20,
-        'WeightCapacity': 100,
-        'UserNameSubmitted': 'SFSCORPIO',
-    },
-    {
-        'Name': 'Phosphorus',
-        'Type': 'STL_FUEL_STORE',
-        'StorageId': '2423dc3f2de69b0a869cacd2121a29a7',
-        'Timestamp': '2026-03-02T15:31:47.378343Z',
-        'VolumeLoad': 210,
-        'WeightLoad': 210,
-        'StorageItems': [
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': '7756a0779efe67f0f293f41eda4944d4',
-                'TotalVolume': 210,
-                'TotalWeight': 210,
-                'MaterialName': 'stlFuel',
-                'MaterialValue': 50949.94,
-                'MaterialAmount': 3500,
-                'MaterialTicker': 'SF',
-                'MaterialVolume': 0.05999999865889549,
-                'MaterialWeight': 0.05999999865889549,
-                'MaterialCategory': 'ba98fa0cf77040a96cd8a608ad0d08e9',
-                'MaterialValueCurrency': 'NCC',
-            }
-        ],
-        'AddressableId': 'eaeb72e975eba33df85e530c14f810ec',
-        'VolumeCapacity': 210,
-        'WeightCapacity': 210,
-        'UserNameSubmitted': 'SFSCORPIO',
-    },
-    {
-        'Name': None,
-        'Type': 'STORE',
-        'StorageId': '24462ad35266ab91f7c8a43649f49a12',
-        'Timestamp': '2026-03-02T15:31:47.378343Z',
-        'VolumeLoad': 2747.92,
-        'WeightLoad': 3917.5480000000002,
-        'StorageItems': [
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': '5952bfbf043018679334e7ea71b1504e',
-                'TotalVolume': 0.1,
-                'TotalWeight': 0.4,
-                'MaterialName': 'technicianLuxuryHealth',
-                'MaterialValue': 12158.45,
-                'MaterialAmount': 10,
-                'MaterialTicker': 'SC',
-                'MaterialVolume': 0.009999999776482582,
-                'MaterialWeight': 0.03999999910593033,
-                'MaterialCategory': '8a0bd8b6a329c3d632da9da63c818b3d',
-                'MaterialValueCurrency': 'NCC',
-            },
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': '66369803dbe73bee8a78105d3ca00554',
-                'TotalVolume': 0.01,
-                'TotalWeight': 0.01,
-                'MaterialName': 'technicianTools',
-                'MaterialValue': 22246.62,
-                'MaterialAmount': 10,
-                'MaterialTicker': 'SCN',
-                'MaterialVolume': 0.0010000000474974513,
-                'MaterialWeight': 0.0010000000474974513,
-                'MaterialCategory': '3f047ec3043bdd795fd7272d6be98799',
-                'MaterialValueCurrency': 'NCC',
-            },
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': 'cd0c4bd7aae87c7e402d359b6e908b05',
-                'TotalVolume': 9.3,
-                'TotalWeight': 9.3,
-                'MaterialName': 'technicianLuxuryDrink',
-                'MaterialValue': 172515.23,
-                'MaterialAmount': 93,
-                'MaterialTicker': 'ALE',
-                'MaterialVolume': 0.10000000149011612,
-                'MaterialWeight': 0.10000000149011612,
-                'MaterialCategory': '8a0bd8b6a329c3d632da9da63c818b3d',
-                'MaterialValueCurrency': 'NCC',
-            },
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': '83dd61885cf6879ff49fe1419f068f10',
-                'TotalVolume': 117.3,
-                'TotalWeight': 246.33,
-                'MaterialName': 'rations',
-                'MaterialValue': 71801.98,
-                'MaterialAmount': 1173,
-                'MaterialTicker': 'RAT',
-                'MaterialVolume': 0.10000000149011612,
-                'MaterialWeight': 0.20999999344348907,
-                'MaterialCategory': '3f047ec3043bdd795fd7272d6be98799',
-                'MaterialValueCurrency': 'NCC',
-            },
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': '5b0e02208dbbb99695707001d626963a',
-                'TotalVolume': 2.35,
-                'TotalWeight': 2.35,
-                'MaterialName': 'technicianClothing',
-                'MaterialValue': 89916.8,
-                'MaterialAmount': 47,
-                'MaterialTicker': 'HMS',
-                'MaterialVolume': 0.05000000074505806,
-                'MaterialWeight': 0.05000000074505806,
-                'MaterialCategory': '3f047ec3043bdd795fd7272d6be98799',
-                'MaterialValueCurrency': 'NCC',
-            },
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': '9842ad8d9dfdf8e4c2e80117e7b5ebaf',
-                'TotalVolume': 1,
-                'TotalWeight': 1,
-                'MaterialName': 'pioneerLuxuryDrink',
-                'MaterialValue': 0,
-                'MaterialAmount': 10,
-                'MaterialTicker': 'COF',
-                'MaterialVolume': 0.10000000149011612,
-                'MaterialWeight': 0.10000000149011612,
-                'MaterialCategory': '8a0bd8b6a329c3d632da9da63c818b3d',
-                'MaterialValueCurrency': 'NCC',
-            },
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': 'c04de28c3e717f236d6ed177b89d9523',
-                'TotalVolume': 875,
-                'TotalWeight': 61.25,
-                'MaterialName': 'hydrogen',
-                'MaterialValue': 110985.92,
-                'MaterialAmount': 875,
-                'MaterialTicker': 'H',
-                'MaterialVolume': 1,
-                'MaterialWeight': 0.07000000029802322,
-                'MaterialCategory': '54dec1e42eba44dda423dd774393326a',
-                'MaterialValueCurrency': 'NCC',
-            },
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': '64666b2eb0faaba594a62818e48229b8',
-                'TotalVolume': 7,
-                'TotalWeight': 14,
-                'MaterialName': 'polymerGranulate',
-                'MaterialValue': 0,
-                'MaterialAmount': 7000,
-                'MaterialTicker': 'PG',
-                'MaterialVolume': 0.0010000000474974513,
-                'MaterialWeight': 0.0020000000949949026,
-                'MaterialCategory': '6316282906a9f68b0c7bb4396a26aa95',
-                'MaterialValueCurrency': 'NCC',
-            },
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': '833efac228452f5d770c0693c3fb3d50',
-                'TotalVolume': 140,
-                'TotalWeight': 236.25,
-                'MaterialName': 'magnesium',
-                'MaterialValue': 111489.1,
-                'MaterialAmount': 875,
-                'MaterialTicker': 'MG',
-                'MaterialVolume': 0.1599999964237213,
-                'MaterialWeight': 0.27000001072883606,
-                'MaterialCategory': 'ef1d03e7ef924395c2173fc4e4ee8a6f',
-                'MaterialValueCurrency': 'NCC',
-            },
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': 'b5744244bb7913cee262ec29abc3b9d0',
-                'TotalVolume': 7.4,
-                'TotalWeight': 9.25,
-                'MaterialName': 'settlerTools',
-                'MaterialValue': 22328.01,
-                'MaterialAmount': 37,
-                'MaterialTicker': 'PT',
-                'MaterialVolume': 0.20000000298023224,
-                'MaterialWeight': 0.25,
-                'MaterialCategory': '3f047ec3043bdd795fd7272d6be98799',
-                'MaterialValueCurrency': 'NCC',
-            },
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': '4bbcc7dc5dd16e9af90528ed04d9c6ba',
-                'TotalVolume': 875,
-                'TotalWeight': 1968.75,
-                'MaterialName': 'carbon',
-                'MaterialValue': 0,
-                'MaterialAmount': 875,
-                'MaterialTicker': 'C',
-                'MaterialVolume': 1,
-                'MaterialWeight': 2.25,
-                'MaterialCategory': 'ef1d03e7ef924395c2173fc4e4ee8a6f',
-                'MaterialValueCurrency': 'NCC',
-            },
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': '5d36829593b5fd61674320cd66e4bb5c',
-                'TotalVolume': 4.7,
-                'TotalWeight': 14.1,
-                'MaterialName': 'technicianHealth',
-                'MaterialValue': 114242.22,
-                'MaterialAmount': 47,
-                'MaterialTicker': 'MED',
-                'MaterialVolume': 0.10000000149011612,
-                'MaterialWeight': 0.30000001192092896,
-                'MaterialCategory': '3f047ec3043bdd795fd7272d6be98799',
-                'MaterialValueCurrency': 'NCC',
-            },
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': '78321af6ac08c494186fafff3965034f',
-                'TotalVolume': 274.02,
-                'TotalWeight': 548.04,
-                'MaterialName': 'epoxy',
-                'MaterialValue': 0.01,
-                'MaterialAmount': 13701,
-                'MaterialTicker': 'EPO',
-                'MaterialVolume': 0.019999999552965164,
-                'MaterialWeight': 0.03999999910593033,
-                'MaterialCategory': '156bbcce730fba6169338d560f05fd26',
-                'MaterialValueCurrency': 'NCC',
-            },
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': '87dd9b56a69e118e8c778de2dce11e8c',
-                'TotalVolume': 1.85,
-                'TotalWeight': 3.7,
-                'MaterialName': 'settlerClothing',
-                'MaterialValue': 0,
-                'MaterialAmount': 37,
-                'MaterialTicker': 'EXO',
-                'MaterialVolume': 0.05000000074505806,
-                'MaterialWeight': 0.10000000149011612,
-                'MaterialCategory': '3f047ec3043bdd795fd7272d6be98799',
-                'MaterialValueCurrency': 'NCC',
-            },
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': 'a1d1d61f8085de53455dd4e8a7813788',
-                'TotalVolume': 7.4,
-                'TotalWeight': 7.4,
-                'MaterialName': 'settlerLuxuryDrink',
-                'MaterialValue': 73893.14,
-                'MaterialAmount': 74,
-                'MaterialTicker': 'KOM',
-                'MaterialVolume': 0.10000000149011612,
-                'MaterialWeight': 0.10000000149011612,
-                'MaterialCategory': '8a0bd8b6a329c3d632da9da63c818b3d',
-                'MaterialValueCurrency': 'NCC',
-            },
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': '7171933481f022ca74200b216f98ca60',
-                'TotalVolume': 0.03,
-                'TotalWeight': 0.09,
-                'MaterialName': 'settlerLuxuryTools',
-                'MaterialValue': 10294.12,
-                'MaterialAmount': 15,
-                'MaterialTicker': 'REP',
-                'MaterialVolume': 0.0020000000949949026,
-                'MaterialWeight': 0.006000000052154064,
-                'MaterialCategory': '8a0bd8b6a329c3d632da9da63c818b3d',
-                'MaterialValueCurrency': 'NCC',
-            },
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': '17229492d319a4d6a5d0d45ee5bef188',
-                'TotalVolume': 105,
-                'TotalWeight': 105,
-                'MaterialName': 'nanoResin',
-                'MaterialValue': 0,
-                'MaterialAmount': 2100,
-                'MaterialTicker': 'NR',
-                'MaterialVolume': 0.05000000074505806,
-                'MaterialWeight': 0.05000000074505806,
-                'MaterialCategory': '9b32ea2333917ee2632ba7ae7675643f',
-                'MaterialValueCurrency': 'NCC',
-            },
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': '820d081096fd3e8fbd98b4344f6250ad',
-                'TotalVolume': 0.2,
-                'TotalWeight': 0.2,
-                'MaterialName': 'pioneerLuxuryClothing',
-                'MaterialValue': 1353.14,
-                'MaterialAmount': 4,
-                'MaterialTicker': 'PWO',
-                'MaterialVolume': 0.05000000074505806,
-                'MaterialWeight': 0.05000000074505806,
-                'MaterialCategory': '8a0bd8b6a329c3d632da9da63c818b3d',
-                'MaterialValueCurrency': 'NCC',
-            },
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': '08b3d1994643df5efe095b335be3a029',
-                'TotalVolume': 205.51,
-                'TotalWeight': 575.428,
-                'MaterialName': 'nanoCarbonSheeting',
-                'MaterialValue': 483562.56,
-                'MaterialAmount': 20551,
-                'MaterialTicker': 'NCS',
-                'MaterialVolume': 0.009999999776482582,
-                'MaterialWeight': 0.02800000086426735,
-                'MaterialCategory': '156bbcce730fba6169338d560f05fd26',
-                'MaterialValueCurrency': 'NCC',
-            },
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': '4fca6f5b5e6c3b8a1b887c6dc99db146',
-                'TotalVolume': 114.5,
-                'TotalWeight': 114.5,
-                'MaterialName': 'drinkingWater',
-                'MaterialValue': 51387.67,
-                'MaterialAmount': 1145,
-                'MaterialTicker': 'DW',
-                'MaterialVolume': 0.10000000149011612,
-                'MaterialWeight': 0.10000000149011612,
-                'MaterialCategory': '3f047ec3043bdd795fd7272d6be98799',
-                'MaterialValueCurrency': 'NCC',
-            },
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': '9788890100fd2191fb065cb0d5e624cb',
-                'TotalVolume': 0.25,
-                'TotalWeight': 0.2,
-                'MaterialName': 'pioneerClothing',
-                'MaterialValue': 0,
-                'MaterialAmount': 10,
-                'MaterialTicker': 'OVE',
-                'MaterialVolume': 0.02500000037252903,
-                'MaterialWeight': 0.019999999552965164,
-                'MaterialCategory': '3f047ec3043bdd795fd7272d6be98799',
-                'MaterialValueCurrency': 'NCC',
-            },
-        ],
-        'AddressableId': '269bee29373ebe0fdda63094af7f5f1b',
-        'VolumeCapacity': 6500,
-        'WeightCapacity': 6500,
-        'UserNameSubmitted': 'SFSCORPIO',
-    },
-    {
-        'Name': '53 Iodine',
-        'Type': 'STL_FUEL_STORE',
-        'StorageId': '287a4c85a47c3ed447ca4c62c1388c66',
-        'Timestamp': '2026-03-02T15:31:47.378343Z',
-        'VolumeLoad': 191.88,
-        'WeightLoad': 191.88,
-        'StorageItems': [
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': '7756a0779efe67f0f293f41eda4944d4',
-                'TotalVolume': 191.88,
-                'TotalWeight': 191.88,
-                'MaterialName': 'stlFuel',
-                'MaterialValue': 26317.76,
-                'MaterialAmount': 3198,
-                'MaterialTicker': 'SF',
-                'MaterialVolume': 0.05999999865889549,
-                'MaterialWeight': 0.05999999865889549,
-                'MaterialCategory': 'ba98fa0cf77040a96cd8a608ad0d08e9',
-                'MaterialValueCurrency': 'NCC',
-            }
-        ],
-        'AddressableId': '0f99161e9049c837a4c72956502dd9a3',
-        'VolumeCapacity': 210,
-        'WeightCapacity': 210,
-        'UserNameSubmitted': 'SFSCORPIO',
-    },
-    {
-        'Name': 'Germanium',
-        'Type': 'SHIP_STORE',
-        'StorageId': '287ca0b87a9e111f6efe534a1224680f',
-        'Timestamp': '2026-03-02T15:31:47.378343Z',
-        'VolumeLoad': 0,
-        'WeightLoad': 0,
-        'StorageItems': [],
-        'AddressableId': '13c545faa7e5bac208310aba8193cb1f',
-        'VolumeCapacity': 2000,
-        'WeightCapacity': 2000,
-        'UserNameSubmitted': 'SFSCORPIO',
-    },
-    {
-        'Name': 'Potassium',
-        'Type': 'STL_FUEL_STORE',
-        'StorageId': '2a12264e9f0471fbb7a56d6171316992',
-        'Timestamp': '2026-03-02T15:31:47.378343Z',
-        'VolumeLoad': 210,
-        'WeightLoad': 210,
-        'StorageItems': [
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': '7756a0779efe67f0f293f41eda4944d4',
-                'TotalVolume': 210,
-                'TotalWeight': 210,
-                'MaterialName': 'stlFuel',
-                'MaterialValue': 49367.93,
-                'MaterialAmount': 3500,
-                'MaterialTicker': 'SF',
-                'MaterialVolume': 0.05999999865889549,
-                'MaterialWeight': 0.05999999865889549,
-                'MaterialCategory': 'ba98fa0cf77040a96cd8a608ad0d08e9',
-                'MaterialValueCurrency': 'NCC',
-            }
-        ],
-        'AddressableId': 'd971f7b29931540f77302c4c72a0a07e',
-        'VolumeCapacity': 210,
-        'WeightCapacity': 210,
-        'UserNameSubmitted': 'SFSCORPIO',
-    },
-    {
-        'Name': 'Aluminium',
-        'Type': 'FTL_FUEL_STORE',
-        'StorageId': '2a22dd90ffaa6033b83903f07826013d',
-        'Timestamp': '2026-03-02T15:31:47.378343Z',
-        'VolumeLoad': 18.3,
-        'WeightLoad': 91.5,
-        'StorageItems': [
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': '7a2a12cd6872b89a6b97532618788a4d',
-                'TotalVolume': 18.3,
-                'TotalWeight': 91.5,
-                'MaterialName': 'ftlFuel',
-                'MaterialValue': 31297.51,
-                'MaterialAmount': 1830,
-                'MaterialTicker': 'FF',
-                'MaterialVolume': 0.009999999776482582,
-                'MaterialWeight': 0.05000000074505806,
-                'MaterialCategory': 'ba98fa0cf77040a96cd8a608ad0d08e9',
-                'MaterialValueCurrency': 'NCC',
-            }
-        ],
-        'AddressableId': 'e641f1296919ffdea8f19f5e48db1b42',
-        'VolumeCapacity': 20,
-        'WeightCapacity': 100,
-        'UserNameSubmitted': 'SFSCORPIO',
-    },
-    {
-        'Name': 'Yttrium',
-        'Type': 'FTL_FUEL_STORE',
-        'StorageId': '2a7769f01a36928edb50d3ad908048b4',
-        'Timestamp': '2026-03-02T15:31:47.378343Z',
-        'VolumeLoad': 20,
-        'WeightLoad': 100,
-        'StorageItems': [
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': '7a2a12cd6872b89a6b97532618788a4d',
-                'TotalVolume': 20,
-                'TotalWeight': 100,
-                'MaterialName': 'ftlFuel',
-                'MaterialValue': 2300.93,
-                'MaterialAmount': 2000,
-                'MaterialTicker': 'FF',
-                'MaterialVolume': 0.009999999776482582,
-                'MaterialWeight': 0.05000000074505806,
-                'MaterialCategory': 'ba98fa0cf77040a96cd8a608ad0d08e9',
-                'MaterialValueCurrency': 'NCC',
-            }
-        ],
-        'AddressableId': 'b6c3e584b96f887b029268c712a32821',
-        'VolumeCapacity': 20,
-        'WeightCapacity': 100,
-        'UserNameSubmitted': 'SFSCORPIO',
-    },
-    {
-        'Name': 'Niobium',
-        'Type': 'STL_FUEL_STORE',
-        'StorageId': '2d07e4f6886675855c24068787c834c8',
-        'Timestamp': '2026-03-02T15:31:47.378343Z',
-        'VolumeLoad': 210,
-        'WeightLoad': 210,
-        'StorageItems': [
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': '7756a0779efe67f0f293f41eda4944d4',
-                'TotalVolume': 210,
-                'TotalWeight': 210,
-                'MaterialName': 'stlFuel',
-                'MaterialValue': 3488.88,
-                'MaterialAmount': 3500,
-                'MaterialTicker': 'SF',
-                'MaterialVolume': 0.05999999865889549,
-                'MaterialWeight': 0.05999999865889549,
-                'MaterialCategory': 'ba98fa0cf77040a96cd8a608ad0d08e9',
-                'MaterialValueCurrency': 'NCC',
-            }
-        ],
-        'AddressableId': 'e0e7cb8ce2b0c29c6d6f12f7a9409994',
-        'VolumeCapacity': 210,
-        'WeightCapacity': 210,
-        'UserNameSubmitted': 'SFSCORPIO',
-    },
-    {
-        'Name': None,
-        'Type': 'STORE',
-        'StorageId': '2d967c1f05f9996336532ba0eac231af',
-        'Timestamp': '2026-03-02T15:31:47.378343Z',
-        'VolumeLoad': 2651.374,
-        'WeightLoad': 6550.723,
-        'StorageItems': [
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': '9842ad8d9dfdf8e4c2e80117e7b5ebaf',
-                'TotalVolume': 3.2,
-                'TotalWeight': 3.2,
-                'MaterialName': 'pioneerLuxuryDrink',
-                'MaterialValue': 3220.68,
-                'MaterialAmount': 32,
-                'MaterialTicker': 'COF',
-                'MaterialVolume': 0.10000000149011612,
-                'MaterialWeight': 0.10000000149011612,
-                'MaterialCategory': '8a0bd8b6a329c3d632da9da63c818b3d',
-                'MaterialValueCurrency': 'NCC',
-            },
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': 'b5744244bb7913cee262ec29abc3b9d0',
-                'TotalVolume': 2.4,
-                'TotalWeight': 3,
-                'MaterialName': 'settlerTools',
-                'MaterialValue': 7319.96,
-                'MaterialAmount': 12,
-                'MaterialTicker': 'PT',
-                'MaterialVolume': 0.20000000298023224,
-                'MaterialWeight': 0.25,
-                'MaterialCategory': '3f047ec3043bdd795fd7272d6be98799',
-                'MaterialValueCurrency': 'NCC',
-            },
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': '9788890100fd2191fb065cb0d5e624cb',
-                'TotalVolume': 0.8,
-                'TotalWeight': 0.64,
-                'MaterialName': 'pioneerClothing',
-                'MaterialValue': 0,
-                'MaterialAmount': 32,
-                'MaterialTicker': 'OVE',
-                'MaterialVolume': 0.02500000037252903,
-                'MaterialWeight': 0.019999999552965164,
-                'MaterialCategory': '3f047ec3043bdd795fd7272d6be98799',
-                'MaterialValueCurrency': 'NCC',
-            },
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': '24cb7e11e07449e2a6966b92d4ee307d',
-                'TotalVolume': 11.6,
-                'TotalWeight': 23.2,
-                'MaterialName': 'fastenerKitSmall',
-                'MaterialValue': 0,
-                'MaterialAmount': 580,
-                'MaterialTicker': 'SFK',
-                'MaterialVolume': 0.019999999552965164,
-                'MaterialWeight': 0.03999999910593033,
-                'MaterialCategory': '5e022d8f199de1c70f8de4dfd2fdef64',
-                'MaterialValueCurrency': 'NCC',
-            },
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': 'b9640b0d66e7d0ca7e4d3132711c97fc',
-                'TotalVolume': 196,
-                'TotalWeight': 1156.4,
-                'MaterialName': 'ironOre',
-                'MaterialValue': 0,
-                'MaterialAmount': 196,
-                'MaterialTicker': 'FEO',
-                'MaterialVolume': 1,
-                'MaterialWeight': 5.900000095367432,
-                'MaterialCategory': '4c0430b40fbf7fa175ed4a5a13682c6f',
-                'MaterialValueCurrency': 'NCC',
-            },
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': '432414a579f1fccd66136b257eb44408',
-                'TotalVolume': 28.2,
-                'TotalWeight': 56.4,
-                'MaterialName': 'fastenerKitMedium',
-                'MaterialValue': 0,
-                'MaterialAmount': 564,
-                'MaterialTicker': 'MFK',
-                'MaterialVolume': 0.05000000074505806,
-                'MaterialWeight': 0.10000000149011612,
-                'MaterialCategory': '5e022d8f199de1c70f8de4dfd2fdef64',
-                'MaterialValueCurrency': 'NCC',
-            },
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': '83dd61885cf6879ff49fe1419f068f10',
-                'TotalVolume': 27.5,
-                'TotalWeight': 57.75,
-                'MaterialName': 'rations',
-                'MaterialValue': 17580.14,
-                'MaterialAmount': 275,
-                'MaterialTicker': 'RAT',
-                'MaterialVolume': 0.10000000149011612,
-                'MaterialWeight': 0.20999999344348907,
-                'MaterialCategory': '3f047ec3043bdd795fd7272d6be98799',
-                'MaterialValueCurrency': 'NCC',
-            },
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': '7921cd20f7add0b26ff77f76e3e911f8',
-                'TotalVolume': 122,
-                'TotalWeight': 960.628,
-                'MaterialName': 'iron',
-                'MaterialValue': 0,
-                'MaterialAmount': 122,
-                'MaterialTicker': 'FE',
-                'MaterialVolume': 1,
-                'MaterialWeight': 7.874000072479248,
-                'MaterialCategory': 'cae48680d4c4e6f98d593a8c3778cb56',
-                'MaterialValueCurrency': 'NCC',
-            },
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': '820d081096fd3e8fbd98b4344f6250ad',
-                'TotalVolume': 0.65,
-                'TotalWeight': 0.65,
-                'MaterialName': 'pioneerLuxuryClothing',
-                'MaterialValue': 4397.7,
-                'MaterialAmount': 13,
-                'MaterialTicker': 'PWO',
-                'MaterialVolume': 0.05000000074505806,
-                'MaterialWeight': 0.05000000074505806,
-                'MaterialCategory': '8a0bd8b6a329c3d632da9da63c818b3d',
-                'MaterialValueCurrency': 'NCC',
-            },
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': '51c829b6e62e70223024ffa6688db9f7',
-                'TotalVolume': 14,
-                'TotalWeight': 35,
-                'MaterialName': 'flux',
-                'MaterialValue': 0.04,
-                'MaterialAmount': 140,
-                'MaterialTicker': 'FLX',
-                'MaterialVolume': 0.10000000149011612,
-                'MaterialWeight': 0.25,
-                'MaterialCategory': '9b32ea2333917ee2632ba7ae7675643f',
-                'MaterialValueCurrency': 'NCC',
-            },
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': '4fca6f5b5e6c3b8a1b887c6dc99db146',
-                'TotalVolume': 27,
-                'TotalWeight': 27,
-                'MaterialName': 'drinkingWater',
-                'MaterialValue': 12662.25,
-                'MaterialAmount': 270,
-                'MaterialTicker': 'DW',
-                'MaterialVolume': 0.10000000149011612,
-                'MaterialWeight': 0.10000000149011612,
-                'MaterialCategory': '3f047ec3043bdd795fd7272d6be98799',
-                'MaterialValueCurrency': 'NCC',
-            },
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': '7171933481f022ca74200b216f98ca60',
-                'TotalVolume': 0.024,
-                'TotalWeight': 0.072,
-                'MaterialName': 'settlerLuxuryTools',
-                'MaterialValue': 8235.29,
-                'MaterialAmount': 12,
-                'MaterialTicker': 'REP',
-                'MaterialVolume': 0.0020000000949949026,
-                'MaterialWeight': 0.006000000052154064,
-                'MaterialCategory': '8a0bd8b6a329c3d632da9da63c818b3d',
-                'MaterialValueCurrency': 'NCC',
-            },
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': '6e16dbf050b98d9c4fc9c615b3367a0f',
-                'TotalVolume': 1813,
-                'TotalWeight': 2068.633,
-                'MaterialName': 'oxygen',
-                'MaterialValue': 47759.7,
-                'MaterialAmount': 1813,
-                'MaterialTicker': 'O',
-                'MaterialVolume': 1,
-                'MaterialWeight': 1.1410000324249268,
-                'MaterialCategory': '54dec1e42eba44dda423dd774393326a',
-                'MaterialValueCurrency': 'NCC',
-            },
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': 'a1d1d61f8085de53455dd4e8a7813788',
-                'TotalVolume': 1.4,
-                'TotalWeight': 1.4,
-                'MaterialName': 'settlerLuxuryDrink',
-                'MaterialValue': 13980.12,
-                'MaterialAmount': 14,
-                'MaterialTicker': 'KOM',
-                'MaterialVolume': 0.10000000149011612,
-                'MaterialWeight': 0.10000000149011612,
-                'MaterialCategory': '8a0bd8b6a329c3d632da9da63c818b3d',
-                'MaterialValueCurrency': 'NCC',
-            },
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': '87dd9b56a69e118e8c778de2dce11e8c',
-                'TotalVolume': 0.6,
-                'TotalWeight': 1.2,
-                'MaterialName': 'settlerClothing',
-                'MaterialValue': 0,
-                'MaterialAmount': 12,
-                'MaterialTicker': 'EXO',
-                'MaterialVolume': 0.05000000074505806,
-                'MaterialWeight': 0.10000000149011612,
-                'MaterialCategory': '3f047ec3043bdd795fd7272d6be98799',
-                'MaterialValueCurrency': 'NCC',
-            },
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': 'aaef669fed967abcfc188df59e1c4f4b',
-                'TotalVolume': 223,
-                'TotalWeight': 1750.55,
-                'MaterialName': 'steel',
-                'MaterialValue': 0,
-                'MaterialAmount': 223,
-                'MaterialTicker': 'STL',
-                'MaterialVolume': 1,
-                'MaterialWeight': 7.849999904632568,
-                'MaterialCategory': 'cae48680d4c4e6f98d593a8c3778cb56',
-                'MaterialValueCurrency': 'NCC',
-            },
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': '4bbcc7dc5dd16e9af90528ed04d9c6ba',
-                'TotalVolume': 180,
-                'TotalWeight': 405,
-                'MaterialName': 'carbon',
-                'MaterialValue': 0.11,
-                'MaterialAmount': 180,
-                'MaterialTicker': 'C',
-                'MaterialVolume': 1,
-                'MaterialWeight': 2.25,
-                'MaterialCategory': 'ef1d03e7ef924395c2173fc4e4ee8a6f',
-                'MaterialValueCurrency': 'NCC',
-            },
-        ],
-        'AddressableId': '848dbfa8427430106b693352338747cd',
-        'VolumeCapacity': 16500,
-        'WeightCapacity': 16500,
-        'UserNameSubmitted': 'SFSCORPIO',
-    },
-    {
-        'Name': 'Strontium',
-        'Type': 'SHIP_STORE',
-        'StorageId': '2ddd9021f3e4be99267797fc8f9dcbee',
-        'Timestamp': '2026-03-02T15:31:47.378343Z',
-        'VolumeLoad': 0,
-        'WeightLoad': 0,
-        'StorageItems': [],
-        'AddressableId': '44430f53bf6e837ad79821d8d213d9ab',
-        'VolumeCapacity': 2000,
-        'WeightCapacity': 2000,
-        'UserNameSubmitted': 'SFSCORPIO',
-    },
-    {
-        'Name': None,
-        'Type': 'STORE',
-        'StorageId': '2f26d84d8df974bb0cb662119d9c8e1b',
-        'Timestamp': '2026-03-02T15:31:47.378343Z',
-        'VolumeLoad': 1899.6,
-        'WeightLoad': 4082.3309999999997,
-        'StorageItems': [
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': 'ed72545a5db1f16430d79a240dc61e6c',
-                'TotalVolume': 888,
-                'TotalWeight': 2397.6,
-                'MaterialName': 'aluminium',
-                'MaterialValue': 0,
-                'MaterialAmount': 888,
-                'MaterialTicker': 'AL',
-                'MaterialVolume': 1,
-                'MaterialWeight': 2.700000047683716,
-                'MaterialCategory': 'cae48680d4c4e6f98d593a8c3778cb56',
-                'MaterialValueCurrency': 'NCC',
-            },
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': '04f72b0c957b769c6d45c011e9c9b4b5',
-                'TotalVolume': 132,
-                'TotalWeight': 178.2,
-                'MaterialName': 'aluminiumOre',
-                'MaterialValue': 0.06,
-                'MaterialAmount': 132,
-                'MaterialTicker': 'ALO',
-                'MaterialVolume': 1,
-                'MaterialWeight': 1.350000023841858,
-                'MaterialCategory': '4c0430b40fbf7fa175ed4a5a13682c6f',
-                'MaterialValueCurrency': 'NCC',
-            },
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': '9788890100fd2191fb065cb0d5e624cb',
-                'TotalVolume': 1.15,
-                'TotalWeight': 0.92,
-                'MaterialName': 'pioneerClothing',
-                'MaterialValue': 0,
-                'MaterialAmount': 46,
-                'MaterialTicker': 'OVE',
-                'MaterialVolume': 0.02500000037252903,
-                'MaterialWeight': 0.019999999552965164,
-                'MaterialCategory': '3f047ec3043bdd795fd7272d6be98799',
-                'MaterialValueCurrency': 'NCC',
-            },
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': '820d081096fd3e8fbd98b4344f6250ad',
-                'TotalVolume': 0.95,
-                'TotalWeight': 0.95,
-                'MaterialName': 'pioneerLuxuryClothing',
-                'MaterialValue': 6422.43,
-                'MaterialAmount': 19,
-                'MaterialTicker': 'PWO',
-                'MaterialVolume': 0.05000000074505806,
-                'MaterialWeight': 0.05000000074505806,
-                'MaterialCategory': '8a0bd8b6a329c3d632da9da63c818b3d',
-                'MaterialValueCurrency': 'NCC',
-            },
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': '51c829b6e62e70223024ffa6688db9f7',
-                'TotalVolume': 38.1,
-                'TotalWeight': 95.25,
-                'MaterialName': 'flux',
-                'MaterialValue': 0,
-                'MaterialAmount': 381,
-                'MaterialTicker': 'FLX',
-                'MaterialVolume': 0.10000000149011612,
-                'MaterialWeight': 0.25,
-                'MaterialCategory': '9b32ea2333917ee2632ba7ae7675643f',
-                'MaterialValueCurrency': 'NCC',
-            },
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': '4fca6f5b5e6c3b8a1b887c6dc99db146',
-                'TotalVolume': 36.4,
-                'TotalWeight': 36.4,
-                'MaterialName': 'drinkingWater',
-                'MaterialValue': 19193.54,
-                'MaterialAmount': 364,
-                'MaterialTicker': 'DW',
-                'MaterialVolume': 0.10000000149011612,
-                'MaterialWeight': 0.10000000149011612,
-                'MaterialCategory': '3f047ec3043bdd795fd7272d6be98799',
-                'MaterialValueCurrency': 'NCC',
-            },
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': '6e16dbf050b98d9c4fc9c615b3367a0f',
-                'TotalVolume': 381,
-                'TotalWeight': 434.721,
-                'MaterialName': 'oxygen',
-                'MaterialValue': 5107.3,
-                'MaterialAmount': 381,
-                'MaterialTicker': 'O',
-                'MaterialVolume': 1,
-                'MaterialWeight': 1.1410000324249268,
-                'MaterialCategory': '54dec1e42eba44dda423dd774393326a',
-                'MaterialValueCurrency': 'NCC',
-            },
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': '83dd61885cf6879ff49fe1419f068f10',
-                'TotalVolume': 36.4,
-                'TotalWeight': 76.44,
-                'MaterialName': 'rations',
-                'MaterialValue': 26256.05,
-                'MaterialAmount': 364,
-                'MaterialTicker': 'RAT',
-                'MaterialVolume': 0.10000000149011612,
-                'MaterialWeight': 0.20999999344348907,
-                'MaterialCategory': '3f047ec3043bdd795fd7272d6be98799',
-                'MaterialValueCurrency': 'NCC',
-            },
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': '4bbcc7dc5dd16e9af90528ed04d9c6ba',
-                'TotalVolume': 381,
-                'TotalWeight': 857.25,
-                'MaterialName': 'carbon',
-                'MaterialValue': 0.55,
-                'MaterialAmount': 381,
-                'MaterialTicker': 'C',
-                'MaterialVolume': 1,
-                'MaterialWeight': 2.25,
-                'MaterialCategory': 'ef1d03e7ef924395c2173fc4e4ee8a6f',
-                'MaterialValueCurrency': 'NCC',
-            },
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': '9842ad8d9dfdf8e4c2e80117e7b5ebaf',
-                'TotalVolume': 4.6,
-                'TotalWeight': 4.6,
-                'MaterialName': 'pioneerLuxuryDrink',
-                'MaterialValue': 1133.57,
-                'MaterialAmount': 46,
-                'MaterialTicker': 'COF',
-                'MaterialVolume': 0.10000000149011612,
-                'MaterialWeight': 0.10000000149011612,
-                'MaterialCategory': '8a0bd8b6a329c3d632da9da63c818b3d',
-                'MaterialValueCurrency': 'NCC',
-            },
-        ],
-        'AddressableId': 'cda3cef7ef483b187de87dc04bdb7291',
-        'VolumeCapacity': 6500,
-        'WeightCapacity': 6500,
-        'UserNameSubmitted': 'SFSCORPIO',
-    },
-    {
-        'Name': 'Boron',
-        'Type': 'STL_FUEL_STORE',
-        'StorageId': '2f78a2743d1eb6fbbee30428a971aefa',
-        'Timestamp': '2026-03-02T15:31:47.378343Z',
-        'VolumeLoad': 200.52,
-        'WeightLoad': 200.52,
-        'StorageItems': [
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': '7756a0779efe67f0f293f41eda4944d4',
-                'TotalVolume': 200.52,
-                'TotalWeight': 200.52,
-                'MaterialName': 'stlFuel',
-                'MaterialValue': 55284.57,
-                'MaterialAmount': 3342,
-                'MaterialTicker': 'SF',
-                'MaterialVolume': 0.05999999865889549,
-                'MaterialWeight': 0.05999999865889549,
-                'MaterialCategory': 'ba98fa0cf77040a96cd8a608ad0d08e9',
-                'MaterialValueCurrency': 'NCC',
-            }
-        ],
-        'AddressableId': '2b14db4e8fd72dd90e0b1a9b3a91e005',
-        'VolumeCapacity': 210,
-        'WeightCapacity': 210,
-        'UserNameSubmitted': 'SFSCORPIO',
-    },
-    {
-        'Name': 'Scandium',
-        'Type': 'STL_FUEL_STORE',
-        'StorageId': '2fd4b3b00d7a53f42222740e904a668c',
-        'Timestamp': '2026-03-02T15:31:47.378343Z',
-        'VolumeLoad': 210,
-        'WeightLoad': 210,
-        'StorageItems': [
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': '7756a0779efe67f0f293f41eda4944d4',
-                'TotalVolume': 210,
-                'TotalWeight': 210,
-                'MaterialName': 'stlFuel',
-                'MaterialValue': 48362.76,
-                'MaterialAmount': 3500,
-                'MaterialTicker': 'SF',
-                'MaterialVolume': 0.05999999865889549,
-                'MaterialWeight': 0.05999999865889549,
-                'MaterialCategory': 'ba98fa0cf77040a96cd8a608ad0d08e9',
-                'MaterialValueCurrency': 'NCC',
-            }
-        ],
-        'AddressableId': '98e0a736ee0e789e99e494629369c53d',
-        'VolumeCapacity': 210,
-        'WeightCapacity': 210,
-        'UserNameSubmitted': 'SFSCORPIO',
-    },
-    {
-        'Name': 'Beryllium',
-        'Type': 'FTL_FUEL_STORE',
-        'StorageId': '33dde5a00084262051d84392974a5d60',
-        'Timestamp': '2026-03-02T15:31:47.378343Z',
-        'VolumeLoad': 16.16,
-        'WeightLoad': 80.8,
-        'StorageItems': [
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': '7a2a12cd6872b89a6b97532618788a4d',
-                'TotalVolume': 16.16,
-                'TotalWeight': 80.8,
-                'MaterialName': 'ftlFuel',
-                'MaterialValue': 28673.11,
-                'MaterialAmount': 1616,
-                'MaterialTicker': 'FF',
-                'MaterialVolume': 0.009999999776482582,
-                'MaterialWeight': 0.05000000074505806,
-                'MaterialCategory': 'ba98fa0cf77040a96cd8a608ad0d08e9',
-                'MaterialValueCurrency': 'NCC',
-            }
-        ],
-        'AddressableId': 'cdecb2bd28a30d5f4d49d13a33b23dbc',
-        'VolumeCapacity': 20,
-        'WeightCapacity': 100,
-        'UserNameSubmitted': 'SFSCORPIO',
-    },
-    {
-        'Name': 'Indium',
-        'Type': 'SHIP_STORE',
-        'StorageId': '35a901617613b57d4be0594191a12f80',
-        'Timestamp': '2026-03-02T15:31:47.378343Z',
-        'VolumeLoad': 0,
-        'WeightLoad': 0,
-        'StorageItems': [],
-        'AddressableId': 'd3e384b2c5135773788e17e193a17690',
-        'VolumeCapacity': 2000,
-        'WeightCapacity': 2000,
-        'UserNameSubmitted': 'SFSCORPIO',
-    },
-    {
-        'Name': 'Yttrium',
-        'Type': 'SHIP_STORE',
-        'StorageId': '36406266818057defa6f95d7c40de82f',
-        'Timestamp': '2026-03-02T15:31:47.378343Z',
-        'VolumeLoad': 0,
-        'WeightLoad': 0,
-        'StorageItems': [],
-        'AddressableId': 'b6c3e584b96f887b029268c712a32821',
-        'VolumeCapacity': 2000,
-        'WeightCapacity': 2000,
-        'UserNameSubmitted': 'SFSCORPIO',
-    },
-    {
-        'Name': 'Zirconium',
-        'Type': 'STL_FUEL_STORE',
-        'StorageId': '37261cb3e8f32b7fde893334f67d1520',
-        'Timestamp': '2026-03-02T15:31:47.378343Z',
-        'VolumeLoad': 210,
-        'WeightLoad': 210,
-        'StorageItems': [
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': '7756a0779efe67f0f293f41eda4944d4',
-                'TotalVolume': 210,
-                'TotalWeight': 210,
-                'MaterialName': 'stlFuel',
-                'MaterialValue': 1094.22,
-                'MaterialAmount': 3500,
-                'MaterialTicker': 'SF',
-                'MaterialVolume': 0.05999999865889549,
-                'MaterialWeight': 0.05999999865889549,
-                'MaterialCategory': 'ba98fa0cf77040a96cd8a608ad0d08e9',
-                'MaterialValueCurrency': 'NCC',
-            }
-        ],
-        'AddressableId': 'bdb6e90f91dfe9cec48077d746b70993',
-        'VolumeCapacity': 210,
-        'WeightCapacity': 210,
-        'UserNameSubmitted': 'SFSCORPIO',
-    },
-    {
-        'Name': 'Vanadium',
-        'Type': 'FTL_FUEL_STORE',
-        'StorageId': '3762ee33128e277b817f06bf4e5e3c3c',
-        'Timestamp': '2026-03-02T15:31:47.378343Z',
-        'VolumeLoad': 20,
-        'WeightLoad': 100,
-        'StorageItems': [
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': '7a2a12cd6872b89a6b97532618788a4d',
-                'TotalVolume': 20,
-                'TotalWeight': 100,
-                'MaterialName': 'ftlFuel',
-                'MaterialValue': 32852.43,
-                'MaterialAmount': 2000,
-                'MaterialTicker': 'FF',
-                'MaterialVolume': 0.009999999776482582,
-                'MaterialWeight': 0.05000000074505806,
-                'MaterialCategory': 'ba98fa0cf77040a96cd8a608ad0d08e9',
-                'MaterialValueCurrency': 'NCC',
-            }
-        ],
-        'AddressableId': 'c7d6c5b746839107f026e1b07aaf4748',
-        'VolumeCapacity': 20,
-        'WeightCapacity': 100,
-        'UserNameSubmitted': 'SFSCORPIO',
-    },
-    {
-        'Name': 'Magnesium',
-        'Type': 'FTL_FUEL_STORE',
-        'StorageId': '3dbc768396e973acbbf9ce6b04c66baf',
-        'Timestamp': '2026-03-02T15:31:47.378343Z',
-        'VolumeLoad': 20,
-        'WeightLoad': 100,
-        'StorageItems': [
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': '7a2a12cd6872b89a6b97532618788a4d',
-                'TotalVolume': 20,
-                'TotalWeight': 100,
-                'MaterialName': 'ftlFuel',
-                'MaterialValue': 34406.08,
-                'MaterialAmount': 2000,
-                'MaterialTicker': 'FF',
-                'MaterialVolume': 0.009999999776482582,
-                'MaterialWeight': 0.05000000074505806,
-                'MaterialCategory': 'ba98fa0cf77040a96cd8a608ad0d08e9',
-                'MaterialValueCurrency': 'NCC',
-            }
-        ],
-        'AddressableId': '70f3646bcd1e077928b399807012778d',
-        'VolumeCapacity': 20,
-        'WeightCapacity': 100,
-        'UserNameSubmitted': 'SFSCORPIO',
-    },
-    {
-        'Name': 'Chromium',
-        'Type': 'SHIP_STORE',
-        'StorageId': '3dbd4df55c669b8fd9710d84f7b836bc',
-        'Timestamp': '2026-03-02T15:31:47.378343Z',
-        'VolumeLoad': 0,
-        'WeightLoad': 0,
-        'StorageItems': [],
-        'AddressableId': 'd95ef01aead4472e8dce94cdab8aeccb',
-        'VolumeCapacity': 2000,
-        'WeightCapacity': 2000,
-        'UserNameSubmitted': 'SFSCORPIO',
-    },
-    {
-        'Name': 'Technetium',
-        'Type': 'STL_FUEL_STORE',
-        'StorageId': '3faf9f6abd141f73b54e46fafdf3a06e',
-        'Timestamp': '2026-03-02T15:31:47.378343Z',
-        'VolumeLoad': 210,
-        'WeightLoad': 210,
-        'StorageItems': [
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': '7756a0779efe67f0f293f41eda4944d4',
-                'TotalVolume': 210,
-                'TotalWeight': 210,
-                'MaterialName': 'stlFuel',
-                'MaterialValue': 10336.64,
-                'MaterialAmount': 3500,
-                'MaterialTicker': 'SF',
-                'MaterialVolume': 0.05999999865889549,
-                'MaterialWeight': 0.05999999865889549,
-                'MaterialCategory': 'ba98fa0cf77040a96cd8a608ad0d08e9',
-                'MaterialValueCurrency': 'NCC',
-            }
-        ],
-        'AddressableId': '85f6886a99c04bf77317f2e5ab992ffc',
-        'VolumeCapacity': 210,
-        'WeightCapacity': 210,
-        'UserNameSubmitted': 'SFSCORPIO',
-    },
-    {
-        'Name': 'Rhodium',
-        'Type': 'FTL_FUEL_STORE',
-        'StorageId': '41efb3599d975f5928f3759425776d5a',
-        'Timestamp': '2026-03-02T15:31:47.378343Z',
-        'VolumeLoad': 20,
-        'WeightLoad': 100,
-        'StorageItems': [
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': '7a2a12cd6872b89a6b97532618788a4d',
-                'TotalVolume': 20,
-                'TotalWeight': 100,
-                'MaterialName': 'ftlFuel',
-                'MaterialValue': 1,
-                'MaterialAmount': 2000,
-                'MaterialTicker': 'FF',
-                'MaterialVolume': 0.009999999776482582,
-                'MaterialWeight': 0.05000000074505806,
-                'MaterialCategory': 'ba98fa0cf77040a96cd8a608ad0d08e9',
-                'MaterialValueCurrency': 'NCC',
-            }
-        ],
-        'AddressableId': '978f94d7689f3e77ea90bdc438ab9024',
-        'VolumeCapacity': 20,
-        'WeightCapacity': 100,
-        'UserNameSubmitted': 'SFSCORPIO',
-    },
-    {
-        'Name': 'Zirconium',
-        'Type': 'SHIP_STORE',
-        'StorageId': '4364b9273bd416524e4e9cc222013140',
-        'Timestamp': '2026-03-02T15:31:47.378343Z',
-        'VolumeLoad': 0,
-        'WeightLoad': 0,
-        'StorageItems': [],
-        'AddressableId': 'bdb6e90f91dfe9cec48077d746b70993',
-        'VolumeCapacity': 2000,
-        'WeightCapacity': 2000,
-        'UserNameSubmitted': 'SFSCORPIO',
-    },
-    {
-        'Name': 'Indium',
-        'Type': 'STL_FUEL_STORE',
-        'StorageId': '466faa75aded59fcd5b95c89cc79b548',
-        'Timestamp': '2026-03-02T15:31:47.378343Z',
-        'VolumeLoad': 185.16,
-        'WeightLoad': 185.16,
-        'StorageItems': [
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': '7756a0779efe67f0f293f41eda4944d4',
-                'TotalVolume': 185.16,
-                'TotalWeight': 185.16,
-                'MaterialName': 'stlFuel',
-                'MaterialValue': 5308.74,
-                'MaterialAmount': 3086,
-                'MaterialTicker': 'SF',
-                'MaterialVolume': 0.05999999865889549,
-                'MaterialWeight': 0.05999999865889549,
-                'MaterialCategory': 'ba98fa0cf77040a96cd8a608ad0d08e9',
-                'MaterialValueCurrency': 'NCC',
-            }
-        ],
-        'AddressableId': 'd3e384b2c5135773788e17e193a17690',
-        'VolumeCapacity': 210,
-        'WeightCapacity': 210,
-        'UserNameSubmitted': 'SFSCORPIO',
-    },
-    {
-        'Name': 'Calcium',
-        'Type': 'STL_FUEL_STORE',
-        'StorageId': '47cc0425adbc764df4eb0b2ab1257060',
-        'Timestamp': '2026-03-02T15:31:47.378343Z',
-        'VolumeLoad': 210,
-        'WeightLoad': 210,
-        'StorageItems': [
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': '7756a0779efe67f0f293f41eda4944d4',
-                'TotalVolume': 210,
-                'TotalWeight': 210,
-                'MaterialName': 'stlFuel',
-                'MaterialValue': 57917.43,
-                'MaterialAmount': 3500,
-                'MaterialTicker': 'SF',
-                'MaterialVolume': 0.05999999865889549,
-                'MaterialWeight': 0.05999999865889549,
-                'MaterialCategory': 'ba98fa0cf77040a96cd8a608ad0d08e9',
-                'MaterialValueCurrency': 'NCC',
-            }
-        ],
-        'AddressableId': '490df9657539e5eecb445c3ffd2d6cc6',
-        'VolumeCapacity': 210,
-        'WeightCapacity': 210,
-        'UserNameSubmitted': 'SFSCORPIO',
-    },
-    {
-        'Name': 'Zirconium',
-        'Type': 'FTL_FUEL_STORE',
-        'StorageId': '48d78e121190a8e3c166f8796ae4bffe',
-        'Timestamp': '2026-03-02T15:31:47.378343Z',
-        'VolumeLoad': 20,
-        'WeightLoad': 100,
-        'StorageItems': [
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': '7a2a12cd6872b89a6b97532618788a4d',
-                'TotalVolume': 20,
-                'TotalWeight': 100,
-                'MaterialName': 'ftlFuel',
-                'MaterialValue': 1,
-                'MaterialAmount': 2000,
-                'MaterialTicker': 'FF',
-                'MaterialVolume': 0.009999999776482582,
-                'MaterialWeight': 0.05000000074505806,
-                'MaterialCategory': 'ba98fa0cf77040a96cd8a608ad0d08e9',
-                'MaterialValueCurrency': 'NCC',
-            }
-        ],
-        'AddressableId': 'bdb6e90f91dfe9cec48077d746b70993',
-        'VolumeCapacity': 20,
-        'WeightCapacity': 100,
-        'UserNameSubmitted': 'SFSCORPIO',
-    },
-    {
-        'Name': 'Gallium',
-        'Type': 'SHIP_STORE',
-        'StorageId': '4be68273221fcc97555f2ce1168affae',
-        'Timestamp': '2026-03-02T15:31:47.378343Z',
-        'VolumeLoad': 0,
-        'WeightLoad': 0,
-        'StorageItems': [],
-        'AddressableId': 'c314789df16a9920317a230ef7e9ac66',
-        'VolumeCapacity': 2000,
-        'WeightCapacity': 2000,
-        'UserNameSubmitted': 'SFSCORPIO',
-    },
-    {
-        'Name': None,
-        'Type': 'STORE',
-        'StorageId': '4cde67bb890eb373e8348421205f4f00',
-        'Timestamp': '2026-03-02T15:31:47.378343Z',
-        'VolumeLoad': 518.3,
-        'WeightLoad': 564.15,
-        'StorageItems': [
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': '1a1f13b7fc3e0fb6aa292b7c28764f93',
-                'TotalVolume': 48,
-                'TotalWeight': 19.2,
-                'MaterialName': 'herbs',
-                'MaterialValue': 0,
-                'MaterialAmount': 48,
-                'MaterialTicker': 'HER',
-                'MaterialVolume': 1,
-                'MaterialWeight': 0.4000000059604645,
-                'MaterialCategory': '510e7751c0eb6a51fd0fa73565365d1c',
-                'MaterialValueCurrency': 'NCC',
-            },
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': 'ec8dbb1d3f51d89c61b6f58fdd64a7f0',
-                'TotalVolume': 266.4,
-                'TotalWeight': 266.4,
-                'MaterialName': 'water',
-                'MaterialValue': 0.06,
-                'MaterialAmount': 1332,
-                'MaterialTicker': 'H2O',
-                'MaterialVolume': 0.20000000298023224,
-                'MaterialWeight': 0.20000000298023224,
-                'MaterialCategory': '473218d3618453bf25d2cd0b5616a72f',
-                'MaterialValueCurrency': 'NCC',
-            },
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': '9788890100fd2191fb065cb0d5e624cb',
-                'TotalVolume': 2.2,
-                'TotalWeight': 1.76,
-                'MaterialName': 'pioneerClothing',
-                'MaterialValue': 0,
-                'MaterialAmount': 88,
-                'MaterialTicker': 'OVE',
-                'MaterialVolume': 0.02500000037252903,
-                'MaterialWeight': 0.019999999552965164,
-                'MaterialCategory': '3f047ec3043bdd795fd7272d6be98799',
-                'MaterialValueCurrency': 'NCC',
-            },
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': 'c76b4100059661084315938999623c26',
-                'TotalVolume': 12,
-                'TotalWeight': 9.6,
-                'MaterialName': 'hydrocarbonPlants',
-                'MaterialValue': 0,
-                'MaterialAmount': 12,
-                'MaterialTicker': 'HCP',
-                'MaterialVolume': 1,
-                'MaterialWeight': 0.800000011920929,
-                'MaterialCategory': '510e7751c0eb6a51fd0fa73565365d1c',
-                'MaterialValueCurrency': 'NCC',
-            },
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': 'e97e2535fec019710299709a7462c066',
-                'TotalVolume': 12,
-                'TotalWeight': 9.6,
-                'MaterialName': 'proteinBeans',
-                'MaterialValue': 0,
-                'MaterialAmount': 12,
-                'MaterialTicker': 'BEA',
-                'MaterialVolume': 1,
-                'MaterialWeight': 0.800000011920929,
-                'MaterialCategory': '510e7751c0eb6a51fd0fa73565365d1c',
-                'MaterialValueCurrency': 'NCC',
-            },
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': '820d081096fd3e8fbd98b4344f6250ad',
-                'TotalVolume': 1.8,
-                'TotalWeight': 1.8,
-                'MaterialName': 'pioneerLuxuryClothing',
-                'MaterialValue': 12168.33,
-                'MaterialAmount': 36,
-                'MaterialTicker': 'PWO',
-                'MaterialVolume': 0.05000000074505806,
-                'MaterialWeight': 0.05000000074505806,
-                'MaterialCategory': '8a0bd8b6a329c3d632da9da63c818b3d',
-                'MaterialValueCurrency': 'NCC',
-            },
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': 'fe5be65546733ffa4f619bbc76ac532d',
-                'TotalVolume': 26.7,
-                'TotalWeight': 29.37,
-                'MaterialName': 'pesticides',
-                'MaterialValue': 0.04,
-                'MaterialAmount': 267,
-                'MaterialTicker': 'DDT',
-                'MaterialVolume': 0.10000000149011612,
-                'MaterialWeight': 0.10999999940395355,
-                'MaterialCategory': '9b32ea2333917ee2632ba7ae7675643f',
-                'MaterialValueCurrency': 'NCC',
-            },
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': '4fca6f5b5e6c3b8a1b887c6dc99db146',
-                'TotalVolume': 70.2,
-                'TotalWeight': 70.2,
-                'MaterialName': 'drinkingWater',
-                'MaterialValue': 27851.26,
-                'MaterialAmount': 702,
-                'MaterialTicker': 'DW',
-                'MaterialVolume': 0.10000000149011612,
-                'MaterialWeight': 0.10000000149011612,
-                'MaterialCategory': '3f047ec3043bdd795fd7272d6be98799',
-                'MaterialValueCurrency': 'NCC',
-            },
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': '83dd61885cf6879ff49fe1419f068f10',
-                'TotalVolume': 70.2,
-                'TotalWeight': 147.42,
-                'MaterialName': 'rations',
-                'MaterialValue': 37157.73,
-                'MaterialAmount': 702,
-                'MaterialTicker': 'RAT',
-                'MaterialVolume': 0.10000000149011612,
-                'MaterialWeight': 0.20999999344348907,
-                'MaterialCategory': '3f047ec3043bdd795fd7272d6be98799',
-                'MaterialValueCurrency': 'NCC',
-            },
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': '9842ad8d9dfdf8e4c2e80117e7b5ebaf',
-                'TotalVolume': 8.8,
-                'TotalWeight': 8.8,
-                'MaterialName': 'pioneerLuxuryDrink',
-                'MaterialValue': 953.01,
-                'MaterialAmount': 88,
-                'MaterialTicker': 'COF',
-                'MaterialVolume': 0.10000000149011612,
-                'MaterialWeight': 0.10000000149011612,
-                'MaterialCategory': '8a0bd8b6a329c3d632da9da63c818b3d',
-                'MaterialValueCurrency': 'NCC',
-            },
-        ],
-        'AddressableId': '98c0745c67157d1134a7324a6139d913',
-        'VolumeCapacity': 6500,
-        'WeightCapacity': 6500,
-        'UserNameSubmitted': 'SFSCORPIO',
-    },
-    {
-        'Name': 'Carbon',
-        'Type': 'SHIP_STORE',
-        'StorageId': '4dba197b2b104d4c54c0dd0bd9b5c5d7',
-        'Timestamp': '2026-03-02T15:31:47.378343Z',
-        'VolumeLoad': 0,
-        'WeightLoad': 0,
-        'StorageItems': [],
-        'AddressableId': '672a6acd3e13304c0d3f7db21244a4cf',
-        'VolumeCapacity': 2000,
-        'WeightCapacity': 2000,
-        'UserNameSubmitted': 'SFSCORPIO',
-    },
-    {
-        'Name': 'Strontium',
-        'Type': 'FTL_FUEL_STORE',
-        'StorageId': '506d400efb8e9f0a6389a81c0cd1c44c',
-        'Timestamp': '2026-03-02T15:31:47.378343Z',
-        'VolumeLoad': 20,
-        'WeightLoad': 100,
-        'StorageItems': [
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': '7a2a12cd6872b89a6b97532618788a4d',
-                'TotalVolume': 20,
-                'TotalWeight': 100,
-                'MaterialName': 'ftlFuel',
-                'MaterialValue': 10388.88,
-                'MaterialAmount': 2000,
-                'MaterialTicker': 'FF',
-                'MaterialVolume': 0.009999999776482582,
-                'MaterialWeight': 0.05000000074505806,
-                'MaterialCategory': 'ba98fa0cf77040a96cd8a608ad0d08e9',
-                'MaterialValueCurrency': 'NCC',
-            }
-        ],
-        'AddressableId': '44430f53bf6e837ad79821d8d213d9ab',
-        'VolumeCapacity': 20,
-        'WeightCapacity': 100,
-        'UserNameSubmitted': 'SFSCORPIO',
-    },
-    {
-        'Name': None,
-        'Type': 'STORE',
-        'StorageId': '5073487e624d24660da126a7439be875',
-        'Timestamp': '2026-03-02T15:31:47.378343Z',
-        'VolumeLoad': 1619.783,
-        'WeightLoad': 1664.403,
-        'StorageItems': [
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': 'cd0c4bd7aae87c7e402d359b6e908b05',
-                'TotalVolume': 2.8,
-                'TotalWeight': 2.8,
-                'MaterialName': 'technicianLuxuryDrink',
-                'MaterialValue': 40983.39,
-                'MaterialAmount': 28,
-                'MaterialTicker': 'ALE',
-                'MaterialVolume': 0.10000000149011612,
-                'MaterialWeight': 0.10000000149011612,
-                'MaterialCategory': '8a0bd8b6a329c3d632da9da63c818b3d',
-                'MaterialValueCurrency': 'NCC',
-            },
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': '5b0e02208dbbb99695707001d626963a',
-                'TotalVolume': 0.7,
-                'TotalWeight': 0.7,
-                'MaterialName': 'technicianClothing',
-                'MaterialValue': 26727.45,
-                'MaterialAmount': 14,
-                'MaterialTicker': 'HMS',
-                'MaterialVolume': 0.05000000074505806,
-                'MaterialWeight': 0.05000000074505806,
-                'MaterialCategory': '3f047ec3043bdd795fd7272d6be98799',
-                'MaterialValueCurrency': 'NCC',
-            },
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': '1a1f13b7fc3e0fb6aa292b7c28764f93',
-                'TotalVolume': 409,
-                'TotalWeight': 163.6,
-                'MaterialName': 'herbs',
-                'MaterialValue': 0,
-                'MaterialAmount': 409,
-                'MaterialTicker': 'HER',
-                'MaterialVolume': 1,
-                'MaterialWeight': 0.4000000059604645,
-                'MaterialCategory': '510e7751c0eb6a51fd0fa73565365d1c',
-                'MaterialValueCurrency': 'NCC',
-            },
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': 'ec8dbb1d3f51d89c61b6f58fdd64a7f0',
-                'TotalVolume': 99.8,
-                'TotalWeight': 99.8,
-                'MaterialName': 'water',
-                'MaterialValue': 0.06,
-                'MaterialAmount': 499,
-                'MaterialTicker': 'H2O',
-                'MaterialVolume': 0.20000000298023224,
-                'MaterialWeight': 0.20000000298023224,
-                'MaterialCategory': '473218d3618453bf25d2cd0b5616a72f',
-                'MaterialValueCurrency': 'NCC',
-            },
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': 'a5de3e325e87c874fe395949728bb276',
-                'TotalVolume': 124,
-                'TotalWeight': 148.8,
-                'MaterialName': 'scientistFood',
-                'MaterialValue': 0,
-                'MaterialAmount': 248,
-                'MaterialTicker': 'MEA',
-                'MaterialVolume': 0.5,
-                'MaterialWeight': 0.6000000238418579,
-                'MaterialCategory': '3f047ec3043bdd795fd7272d6be98799',
-                'MaterialValueCurrency': 'NCC',
-            },
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': 'd9cfb2948188f49bfae2b6d9972837c8',
-                'TotalVolume': 42,
-                'TotalWeight': 50.4,
-                'MaterialName': 'nutrientSolution',
-                'MaterialValue': 0,
-                'MaterialAmount': 84,
-                'MaterialTicker': 'NS',
-                'MaterialVolume': 0.5,
-                'MaterialWeight': 0.6000000238418579,
-                'MaterialCategory': '9b32ea2333917ee2632ba7ae7675643f',
-                'MaterialValueCurrency': 'NCC',
-            },
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': '9842ad8d9dfdf8e4c2e80117e7b5ebaf',
-                'TotalVolume': 5.6,
-                'TotalWeight': 5.6,
-                'MaterialName': 'pioneerLuxuryDrink',
-                'MaterialValue': 8490.09,
-                'MaterialAmount': 56,
-                'MaterialTicker': 'COF',
-                'MaterialVolume': 0.10000000149011612,
-                'MaterialWeight': 0.10000000149011612,
-                'MaterialCategory': '8a0bd8b6a329c3d632da9da63c818b3d',
-                'MaterialValueCurrency': 'NCC',
-            },
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': '83dd61885cf6879ff49fe1419f068f10',
-                'TotalVolume': 146.1,
-                'TotalWeight': 306.81,
-                'MaterialName': 'rations',
-                'MaterialValue': 96757.33,
-                'MaterialAmount': 1461,
-                'MaterialTicker': 'RAT',
-                'MaterialVolume': 0.10000000149011612,
-                'MaterialWeight': 0.20999999344348907,
-                'MaterialCategory': '3f047ec3043bdd795fd7272d6be98799',
-                'MaterialValueCurrency': 'NCC',
-            },
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': '5f2011b6c605256dfa4626776cc7cf3c',
-                'TotalVolume': 184,
-                'TotalWeight': 368,
-                'MaterialName': 'proteinPaste',
-                'MaterialValue': 0,
-                'MaterialAmount': 184,
-                'MaterialTicker': 'PPA',
-                'MaterialVolume': 1,
-                'MaterialWeight': 2,
-                'MaterialCategory': '510e7751c0eb6a51fd0fa73565365d1c',
-                'MaterialValueCurrency': 'NCC',
-            },
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': '73e138a825968b0132230d02591af63f',
-                'TotalVolume': 125,
-                'TotalWeight': 137.5,
-                'MaterialName': 'engineerFood',
-                'MaterialValue': 0,
-                'MaterialAmount': 250,
-                'MaterialTicker': 'FIM',
-                'MaterialVolume': 0.5,
-                'MaterialWeight': 0.550000011920929,
-                'MaterialCategory': '3f047ec3043bdd795fd7272d6be98799',
-                'MaterialValueCurrency': 'NCC',
-            },
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': '5952bfbf043018679334e7ea71b1504e',
-                'TotalVolume': 0.03,
-                'TotalWeight': 0.12,
-                'MaterialName': 'technicianLuxuryHealth',
-                'MaterialValue': 3647.53,
-                'MaterialAmount': 3,
-                'MaterialTicker': 'SC',
-                'MaterialVolume': 0.009999999776482582,
-                'MaterialWeight': 0.03999999910593033,
-                'MaterialCategory': '8a0bd8b6a329c3d632da9da63c818b3d',
-                'MaterialValueCurrency': 'NCC',
-            },
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': 'e97e2535fec019710299709a7462c066',
-                'TotalVolume': 119,
-                'TotalWeight': 95.2,
-                'MaterialName': 'proteinBeans',
-                'MaterialValue': 0,
-                'MaterialAmount': 119,
-                'MaterialTicker': 'BEA',
-                'MaterialVolume': 1,
-                'MaterialWeight': 0.800000011920929,
-                'MaterialCategory': '510e7751c0eb6a51fd0fa73565365d1c',
-                'MaterialValueCurrency': 'NCC',
-            },
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': '9788890100fd2191fb065cb0d5e624cb',
-                'TotalVolume': 1.4,
-                'TotalWeight': 1.12,
-                'MaterialName': 'pioneerClothing',
-                'MaterialValue': 0,
-                'MaterialAmount': 56,
-                'MaterialTicker': 'OVE',
-                'MaterialVolume': 0.02500000037252903,
-                'MaterialWeight': 0.019999999552965164,
-                'MaterialCategory': '3f047ec3043bdd795fd7272d6be98799',
-                'MaterialValueCurrency': 'NCC',
-            },
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': 'c76b4100059661084315938999623c26',
-                'TotalVolume': 84,
-                'TotalWeight': 67.2,
-                'MaterialName': 'hydrocarbonPlants',
-                'MaterialValue': 0,
-                'MaterialAmount': 84,
-                'MaterialTicker': 'HCP',
-                'MaterialVolume': 1,
-                'MaterialWeight': 0.800000011920929,
-                'MaterialCategory': '510e7751c0eb6a51fd0fa73565365d1c',
-                'MaterialValueCurrency': 'NCC',
-            },
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': '5d36829593b5fd61674320cd66e4bb5c',
-                'TotalVolume': 1.4,
-                'TotalWeight': 4.2,
-                'MaterialName': 'technicianHealth',
-                'MaterialValue': 22511.93,
-                'MaterialAmount': 14,
-                'MaterialTicker': 'MED',
-                'MaterialVolume': 0.10000000149011612,
-                'MaterialWeight': 0.30000001192092896,
-                'MaterialCategory': '3f047ec3043bdd795fd7272d6be98799',
-                'MaterialValueCurrency': 'NCC',
-            },
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': '52cc5c8aeab6bb1778e7ce93a1bbdc80',
-                'TotalVolume': 208,
-                'TotalWeight': 145.6,
-                'MaterialName': 'meat',
-                'MaterialValue': 0,
-                'MaterialAmount': 208,
-                'MaterialTicker': 'MTP',
-                'MaterialVolume': 1,
-                'MaterialWeight': 0.699999988079071,
-                'MaterialCategory': '510e7751c0eb6a51fd0fa73565365d1c',
-                'MaterialValueCurrency': 'NCC',
-            },
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': '4fca6f5b5e6c3b8a1b887c6dc99db146',
-                'TotalVolume': 65.8,
-                'TotalWeight': 65.8,
-                'MaterialName': 'drinkingWater',
-                'MaterialValue': 38966.89,
-                'MaterialAmount': 658,
-                'MaterialTicker': 'DW',
-                'MaterialVolume': 0.10000000149011612,
-                'MaterialWeight': 0.10000000149011612,
-                'MaterialCategory': '3f047ec3043bdd795fd7272d6be98799',
-                'MaterialValueCurrency': 'NCC',
-            },
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': '820d081096fd3e8fbd98b4344f6250ad',
-                'TotalVolume': 1.15,
-                'TotalWeight': 1.15,
-                'MaterialName': 'pioneerLuxuryClothing',
-                'MaterialValue': 7770.2,
-                'MaterialAmount': 23,
-                'MaterialTicker': 'PWO',
-                'MaterialVolume': 0.05000000074505806,
-                'MaterialWeight': 0.05000000074505806,
-                'MaterialCategory': '8a0bd8b6a329c3d632da9da63c818b3d',
-                'MaterialValueCurrency': 'NCC',
-            },
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': '66369803dbe73bee8a78105d3ca00554',
-                'TotalVolume': 0.003,
-                'TotalWeight': 0.003,
-                'MaterialName': 'technicianTools',
-                'MaterialValue': 6703.33,
-                'MaterialAmount': 3,
-                'MaterialTicker': 'SCN',
-                'MaterialVolume': 0.0010000000474974513,
-                'MaterialWeight': 0.0010000000474974513,
-                'MaterialCategory': '3f047ec3043bdd795fd7272d6be98799',
-                'MaterialValueCurrency': 'NCC',
-            },
-        ],
-        'AddressableId': '7b8d61acc5736e2901c483e7bc7c2a69',
-        'VolumeCapacity': 6500,
-        'WeightCapacity': 6500,
-        'UserNameSubmitted': 'SFSCORPIO',
-    },
-    {
-        'Name': 'Nickel',
-        'Type': 'SHIP_STORE',
-        'StorageId': '514b629212c3db0b421b997a9d457c8b',
-        'Timestamp': '2026-03-02T15:31:47.378343Z',
-        'VolumeLoad': 0,
-        'WeightLoad': 0,
-        'StorageItems': [],
-        'AddressableId': 'a065bb621216956949eef6ed89514436',
-        'VolumeCapacity': 2000,
-        'WeightCapacity': 2000,
-        'UserNameSubmitted': 'SFSCORPIO',
-    },
-    {
-        'Name': 'Silicon',
-        'Type': 'STL_FUEL_STORE',
-        'StorageId': '522dc7f77918f04c2fb16d966de60539',
-        'Timestamp': '2026-03-02T15:31:47.378343Z',
-        'VolumeLoad': 210,
-        'WeightLoad': 210,
-        'StorageItems': [
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': '7756a0779efe67f0f293f41eda4944d4',
-                'TotalVolume': 210,
-                'TotalWeight': 210,
-                'MaterialName': 'stlFuel',
-                'MaterialValue': 49912.32,
-                'MaterialAmount': 3500,
-                'MaterialTicker': 'SF',
-                'MaterialVolume': 0.05999999865889549,
-                'MaterialWeight': 0.05999999865889549,
-                'MaterialCategory': 'ba98fa0cf77040a96cd8a608ad0d08e9',
-                'MaterialValueCurrency': 'NCC',
-            }
-        ],
-        'AddressableId': '4d249613111db220f2f6bbe3d060238f',
-        'VolumeCapacity': 210,
-        'WeightCapacity': 210,
-        'UserNameSubmitted': 'SFSCORPIO',
-    },
-    {
-        'Name': None,
-        'Type': 'WAREHOUSE_STORE',
-        'StorageId': '5331561fb3a9391cd173dd5205c2ed6f',
-        'Timestamp': '2026-03-02T15:31:47.378343Z',
-        'VolumeLoad': 0,
-        'WeightLoad': 0,
-        'StorageItems': [],
-        'AddressableId': 'f7aec400e11912141df1685b27cd7422',
-        'VolumeCapacity': 500,
-        'WeightCapacity': 500,
-        'UserNameSubmitted': 'SFSCORPIO',
-    },
-    {
-        'Name': 'Silver',
-        'Type': 'FTL_FUEL_STORE',
-        'StorageId': '53b6474804dbe10f65714849831cde74',
-        'Timestamp': '2026-03-02T15:31:47.378343Z',
-        'VolumeLoad': 20,
-        'WeightLoad': 100,
-        'StorageItems': [
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': '7a2a12cd6872b89a6b97532618788a4d',
-                'TotalVolume': 20,
-                'TotalWeight': 100,
-                'MaterialName': 'ftlFuel',
-                'MaterialValue': 1,
-                'MaterialAmount': 2000,
-                'MaterialTicker': 'FF',
-                'MaterialVolume': 0.009999999776482582,
-                'MaterialWeight': 0.05000000074505806,
-                'MaterialCategory': 'ba98fa0cf77040a96cd8a608ad0d08e9',
-                'MaterialValueCurrency': 'NCC',
-            }
-        ],
-        'AddressableId': '4dadd0112370ca4b4c141d95c6a8cf21',
-        'VolumeCapacity': 20,
-        'WeightCapacity': 100,
-        'UserNameSubmitted': 'SFSCORPIO',
-    },
-    {
-        'Name': 'Ruthenium',
-        'Type': 'SHIP_STORE',
-        'StorageId': '56bac61ae3ca88c951e234564e51a2cc',
-        'Timestamp': '2026-03-02T15:31:47.378343Z',
-        'VolumeLoad': 0,
-        'WeightLoad': 0,
-        'StorageItems': [],
-        'AddressableId': 'f3296b313d2f98774a9aeab4a9eb7e59',
-        'VolumeCapacity': 2000,
-        'WeightCapacity': 2000,
-        'UserNameSubmitted': 'SFSCORPIO',
-    },
-    {
-        'Name': None,
-        'Type': 'STORE',
-        'StorageId': '56c67104ff5c33b4a7a123c443bc3f5e',
-        'Timestamp': '2026-03-02T15:31:47.378343Z',
-        'VolumeLoad': 3011.799,
-        'WeightLoad': 6003.239999999999,
-        'StorageItems': [
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': '83dd61885cf6879ff49fe1419f068f10',
-                'TotalVolume': 83.4,
-                'TotalWeight': 175.14,
-                'MaterialName': 'rations',
-                'MaterialValue': 58922.55,
-                'MaterialAmount': 834,
-                'MaterialTicker': 'RAT',
-                'MaterialVolume': 0.10000000149011612,
-                'MaterialWeight': 0.20999999344348907,
-                'MaterialCategory': '3f047ec3043bdd795fd7272d6be98799',
-                'MaterialValueCurrency': 'NCC',
-            },
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': '4bbcc7dc5dd16e9af90528ed04d9c6ba',
-                'TotalVolume': 76,
-                'TotalWeight': 171,
-                'MaterialName': 'carbon',
-                'MaterialValue': 0,
-                'MaterialAmount': 76,
-                'MaterialTicker': 'C',
-                'MaterialVolume': 1,
-                'MaterialWeight': 2.25,
-                'MaterialCategory': 'ef1d03e7ef924395c2173fc4e4ee8a6f',
-                'MaterialValueCurrency': 'NCC',
-            },
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': '87dd9b56a69e118e8c778de2dce11e8c',
-                'TotalVolume': 4.95,
-                'TotalWeight': 9.9,
-                'MaterialName': 'settlerClothing',
-                'MaterialValue': 0,
-                'MaterialAmount': 99,
-                'MaterialTicker': 'EXO',
-                'MaterialVolume': 0.05000000074505806,
-                'MaterialWeight': 0.10000000149011612,
-                'MaterialCategory': '3f047ec3043bdd795fd7272d6be98799',
-                'MaterialValueCurrency': 'NCC',
-            },
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': 'ed72545a5db1f16430d79a240dc61e6c',
-                'TotalVolume': 1592,
-                'TotalWeight': 4298.4,
-                'MaterialName': 'aluminium',
-                'MaterialValue': 0,
-                'MaterialAmount': 1592,
-                'MaterialTicker': 'AL',
-                'MaterialVolume': 1,
-                'MaterialWeight': 2.700000047683716,
-                'MaterialCategory': 'cae48680d4c4e6f98d593a8c3778cb56',
-                'MaterialValueCurrency': 'NCC',
-            },
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': 'a1d1d61f8085de53455dd4e8a7813788',
-                'TotalVolume': 3.5,
-                'TotalWeight': 3.5,
-                'MaterialName': 'settlerLuxuryDrink',
-                'MaterialValue': 34950.75,
-                'MaterialAmount': 35,
-                'MaterialTicker': 'KOM',
-                'MaterialVolume': 0.10000000149011612,
-                'MaterialWeight': 0.10000000149011612,
-                'MaterialCategory': '8a0bd8b6a329c3d632da9da63c818b3d',
-                'MaterialValueCurrency': 'NCC',
-            },
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': '3010d90fde69729f4754b092fdcda826',
-                'TotalVolume': 48,
-                'TotalWeight': 4,
-                'MaterialName': 'lightweightDeckElements',
-                'MaterialValue': 0,
-                'MaterialAmount': 40,
-                'MaterialTicker': 'LDE',
-                'MaterialVolume': 1.2000000476837158,
-                'MaterialWeight': 0.10000000149011612,
-                'MaterialCategory': 'ef423f673d9e8c82043b4c5c63f6b55e',
-                'MaterialValueCurrency': 'NCC',
-            },
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': '7171933481f022ca74200b216f98ca60',
-                'TotalVolume': 0.062,
-                'TotalWeight': 0.186,
-                'MaterialName': 'settlerLuxuryTools',
-                'MaterialValue': 21274.52,
-                'MaterialAmount': 31,
-                'MaterialTicker': 'REP',
-                'MaterialVolume': 0.0020000000949949026,
-                'MaterialWeight': 0.006000000052154064,
-                'MaterialCategory': '8a0bd8b6a329c3d632da9da63c818b3d',
-                'MaterialValueCurrency': 'NCC',
-            },
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': '8d4e0986419d2769fe50ac6497be6b7e',
-                'TotalVolume': 46.8,
-                'TotalWeight': 11.7,
-                'MaterialName': 'lightweightStructuralElements',
-                'MaterialValue': 0,
-                'MaterialAmount': 39,
-                'MaterialTicker': 'LSE',
-                'MaterialVolume': 1.2000000476837158,
-                'MaterialWeight': 0.30000001192092896,
-                'MaterialCategory': 'ef423f673d9e8c82043b4c5c63f6b55e',
-                'MaterialValueCurrency': 'NCC',
-            },
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': '4fca6f5b5e6c3b8a1b887c6dc99db146',
-                'TotalVolume': 85.9,
-                'TotalWeight': 85.9,
-                'MaterialName': 'drinkingWater',
-                'MaterialValue': 44293.32,
-                'MaterialAmount': 859,
-                'MaterialTicker': 'DW',
-                'MaterialVolume': 0.10000000149011612,
-                'MaterialWeight': 0.10000000149011612,
-                'MaterialCategory': '3f047ec3043bdd795fd7272d6be98799',
-                'MaterialValueCurrency': 'NCC',
-            },
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': '63b98e9700f6630cbfd9c824e0882388',
-                'TotalVolume': 62.4,
-                'TotalWeight': 39,
-                'MaterialName': 'basicBulkhead',
-                'MaterialValue': 0,
-                'MaterialAmount': 78,
-                'MaterialTicker': 'BBH',
-                'MaterialVolume': 0.800000011920929,
-                'MaterialWeight': 0.5,
-                'MaterialCategory': 'ef423f673d9e8c82043b4c5c63f6b55e',
-                'MaterialValueCurrency': 'NCC',
-            },
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': '820d081096fd3e8fbd98b4344f6250ad',
-                'TotalVolume': 1.1,
-                'TotalWeight': 1.1,
-                'MaterialName': 'pioneerLuxuryClothing',
-                'MaterialValue': 7438.79,
-                'MaterialAmount': 22,
-                'MaterialTicker': 'PWO',
-                'MaterialVolume': 0.05000000074505806,
-                'MaterialWeight': 0.05000000074505806,
-                'MaterialCategory': '8a0bd8b6a329c3d632da9da63c818b3d',
-                'MaterialValueCurrency': 'NCC',
-            },
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': '12fb94d0184c18455533bffb4b8b7e51',
-                'TotalVolume': 120,
-                'TotalWeight': 135.6,
-                'MaterialName': 'nylon',
-                'MaterialValue': 398747.28,
-                'MaterialAmount': 120,
-                'MaterialTicker': 'NL',
-                'MaterialVolume': 1,
-                'MaterialWeight': 1.1299999952316284,
-                'MaterialCategory': '7028d7d532ccd4c6c878b069e7bbb634',
-                'MaterialValueCurrency': 'NCC',
-            },
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': 'e9dc6ec89adb62b9ef83031d89e3ce99',
-                'TotalVolume': 78,
-                'TotalWeight': 11.31,
-                'MaterialName': 'helium',
-                'MaterialValue': 19741.08,
-                'MaterialAmount': 78,
-                'MaterialTicker': 'HE',
-                'MaterialVolume': 1,
-                'MaterialWeight': 0.14499999582767487,
-                'MaterialCategory': '54dec1e42eba44dda423dd774393326a',
-                'MaterialValueCurrency': 'NCC',
-            },
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': '64666b2eb0faaba594a62818e48229b8',
-                'TotalVolume': 14.847,
-                'TotalWeight': 29.694,
-                'MaterialName': 'polymerGranulate',
-                'MaterialValue': 0.01,
-                'MaterialAmount': 14847,
-                'MaterialTicker': 'PG',
-                'MaterialVolume': 0.0010000000474974513,
-                'MaterialWeight': 0.0020000000949949026,
-                'MaterialCategory': '6316282906a9f68b0c7bb4396a26aa95',
-                'MaterialValueCurrency': 'NCC',
-            },
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': '9842ad8d9dfdf8e4c2e80117e7b5ebaf',
-                'TotalVolume': 3.2,
-                'TotalWeight': 3.2,
-                'MaterialName': 'pioneerLuxuryDrink',
-                'MaterialValue': 0,
-                'MaterialAmount': 32,
-                'MaterialTicker': 'COF',
-                'MaterialVolume': 0.10000000149011612,
-                'MaterialWeight': 0.10000000149011612,
-                'MaterialCategory': '8a0bd8b6a329c3d632da9da63c818b3d',
-                'MaterialValueCurrency': 'NCC',
-            },
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': 'c04de28c3e717f236d6ed177b89d9523',
-                'TotalVolume': 130,
-                'TotalWeight': 9.1,
-                'MaterialName': 'hydrogen',
-                'MaterialValue': 16281.65,
-                'MaterialAmount': 130,
-                'MaterialTicker': 'H',
-                'MaterialVolume': 1,
-                'MaterialWeight': 0.07000000029802322,
-                'MaterialCategory': '54dec1e42eba44dda423dd774393326a',
-                'MaterialValueCurrency': 'NCC',
-            },
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': 'ec53c7423b75ca0d868f9580ae921561',
-                'TotalVolume': 234,
-                'TotalWeight': 15.6,
-                'MaterialName': 'truss',
-                'MaterialValue': 0,
-                'MaterialAmount': 156,
-                'MaterialTicker': 'TRU',
-                'MaterialVolume': 1.5,
-                'MaterialWeight': 0.10000000149011612,
-                'MaterialCategory': 'f8aebc7dd84ce14fae131aa0203d4498',
-                'MaterialValueCurrency': 'NCC',
-            },
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': 'ee8e92a632d1b5f4847fe9d4e376aeca',
-                'TotalVolume': 43.09,
-                'TotalWeight': 43.09,
-                'MaterialName': 'polyEthylene',
-                'MaterialValue': 0,
-                'MaterialAmount': 4309,
-                'MaterialTicker': 'PE',
-                'MaterialVolume': 0.009999999776482582,
-                'MaterialWeight': 0.009999999776482582,
-                'MaterialCategory': '6316282906a9f68b0c7bb4396a26aa95',
-                'MaterialValueCurrency': 'NCC',
-            },
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': '6bbdf7d0503153753c8cb23653a4d22b',
-                'TotalVolume': 39,
-                'TotalWeight': 23.4,
-                'MaterialName': 'basicStructuralElements',
-                'MaterialValue': 0,
-                'MaterialAmount': 78,
-                'MaterialTicker': 'BSE',
-                'MaterialVolume': 0.5,
-                'MaterialWeight': 0.30000001192092896,
-                'MaterialCategory': 'ef423f673d9e8c82043b4c5c63f6b55e',
-                'MaterialValueCurrency': 'NCC',
-            },
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': '1f9a0293d9ba9bf519f71432e695edeb',
-                'TotalVolume': 339,
-                'TotalWeight': 925.47,
-                'MaterialName': 'limestone',
-                'MaterialValue': 0.03,
-                'MaterialAmount': 339,
-                'MaterialTicker': 'LST',
-                'MaterialVolume': 1,
-                'MaterialWeight': 2.7300000190734863,
-                'MaterialCategory': '79f3917448cc4f6034ece865c41aea34',
-                'MaterialValueCurrency': 'NCC',
-            },
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': '9788890100fd2191fb065cb0d5e624cb',
-                'TotalVolume': 2.75,
-                'TotalWeight': 2.2,
-                'MaterialName': 'pioneerClothing',
-                'MaterialValue': 0,
-                'MaterialAmount': 110,
-                'MaterialTicker': 'OVE',
-                'MaterialVolume': 0.02500000037252903,
-                'MaterialWeight': 0.019999999552965164,
-                'MaterialCategory': '3f047ec3043bdd795fd7272d6be98799',
-                'MaterialValueCurrency': 'NCC',
-            },
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': 'b5744244bb7913cee262ec29abc3b9d0',
-                'TotalVolume': 3.8,
-                'TotalWeight': 4.75,
-                'MaterialName': 'settlerTools',
-                'MaterialValue': 11608.94,
-                'MaterialAmount': 19,
-                'MaterialTicker': 'PT',
-                'MaterialVolume': 0.20000000298023224,
-                'MaterialWeight': 0.25,
-                'MaterialCategory': '3f047ec3043bdd795fd7272d6be98799',
-                'MaterialValueCurrency': 'NCC',
-            },
-        ],
-        'AddressableId': 'ea90c3b31b6f4b387c440d93c6df66a4',
-        'VolumeCapacity': 11500,
-        'WeightCapacity': 11500,
-        'UserNameSubmitted': 'SFSCORPIO',
-    },
-    {
-        'Name': 'Vanadium',
-        'Type': 'STL_FUEL_STORE',
-        'StorageId': '57658de1827c039e0fa9bd6ea56b2411',
-        'Timestamp': '2026-03-02T15:31:47.378343Z',
-        'VolumeLoad': 210,
-        'WeightLoad': 210,
-        'StorageItems': [
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': '7756a0779efe67f0f293f41eda4944d4',
-                'TotalVolume': 210,
-                'TotalWeight': 210,
-                'MaterialName': 'stlFuel',
-                'MaterialValue': 40660.59,
-                'MaterialAmount': 3500,
-                'MaterialTicker': 'SF',
-                'MaterialVolume': 0.05999999865889549,
-                'MaterialWeight': 0.05999999865889549,
-                'MaterialCategory': 'ba98fa0cf77040a96cd8a608ad0d08e9',
-                'MaterialValueCurrency': 'NCC',
-            }
-        ],
-        'AddressableId': 'c7d6c5b746839107f026e1b07aaf4748',
-        'VolumeCapacity': 210,
-        'WeightCapacity': 210,
-        'UserNameSubmitted': 'SFSCORPIO',
-    },
-    {
-        'Name': 'Rubidium',
-        'Type': 'SHIP_STORE',
-        'StorageId': '57b3a9bdd3c5e50979952e971de91607',
-        'Timestamp': '2026-03-02T15:31:47.378343Z',
-        'VolumeLoad': 459.7,
-        'WeightLoad': 734.0999999999999,
-        'StorageItems': [
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': '51c829b6e62e70223024ffa6688db9f7',
-                'TotalVolume': 21,
-                'TotalWeight': 52.5,
-                'MaterialName': 'flux',
-                'MaterialValue': 0,
-                'MaterialAmount': 210,
-                'MaterialTicker': 'FLX',
-                'MaterialVolume': 0.10000000149011612,
-                'MaterialWeight': 0.25,
-                'MaterialCategory': '9b32ea2333917ee2632ba7ae7675643f',
-                'MaterialValueCurrency': 'NCC',
-            },
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': '1f9a0293d9ba9bf519f71432e695edeb',
-                'TotalVolume': 100,
-                'TotalWeight': 273,
-                'MaterialName': 'limestone',
-                'MaterialValue': 0,
-                'MaterialAmount': 100,
-                'MaterialTicker': 'LST',
-                'MaterialVolume': 1,
-                'MaterialWeight': 2.7300000190734863,
-                'MaterialCategory': '79f3917448cc4f6034ece865c41aea34',
-                'MaterialValueCurrency': 'NCC',
-            },
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': 'd9cfb2948188f49bfae2b6d9972837c8',
-                'TotalVolume': 336,
-                'TotalWeight': 403.2,
-                'MaterialName': 'nutrientSolution',
-                'MaterialValue': 0,
-                'MaterialAmount': 672,
-                'MaterialTicker': 'NS',
-                'MaterialVolume': 0.5,
-                'MaterialWeight': 0.6000000238418579,
-                'MaterialCategory': '9b32ea2333917ee2632ba7ae7675643f',
-                'MaterialValueCurrency': 'NCC',
-            },
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': '64666b2eb0faaba594a62818e48229b8',
-                'TotalVolume': 2.7,
-                'TotalWeight': 5.4,
-                'MaterialName': 'polymerGranulate',
-                'MaterialValue': 0,
-                'MaterialAmount': 2700,
-                'MaterialTicker': 'PG',
-                'MaterialVolume': 0.0010000000474974513,
-                'MaterialWeight': 0.0020000000949949026,
-                'MaterialCategory': '6316282906a9f68b0c7bb4396a26aa95',
-                'MaterialValueCurrency': 'NCC',
-            },
-        ],
-        'AddressableId': '579cf5e6798a28b94b17b6f688841ee6',
-        'VolumeCapacity': 2000,
-        'WeightCapacity': 2000,
-        'UserNameSubmitted': 'SFSCORPIO',
-    },
-    {
-        'Name': 'Helium',
-        'Type': 'SHIP_STORE',
-        'StorageId': '57f5a0b461d1a2bfa074ad042186b01b',
-        'Timestamp': '2026-03-02T15:31:47.378343Z',
-        'VolumeLoad': 0,
-        'WeightLoad': 0,
-        'StorageItems': [],
-        'AddressableId': '5c24c3953be8753479b742a05b162ffa',
-        'VolumeCapacity': 1000,
-        'WeightCapacity': 3000,
-        'UserNameSubmitted': 'SFSCORPIO',
-    },
-    {
-        'Name': 'Sodium',
-        'Type': 'STL_FUEL_STORE',
-        'StorageId': '584654f3ccd5e579324b255f7a0cc2ba',
-        'Timestamp': '2026-03-02T15:31:47.378343Z',
-        'VolumeLoad': 210,
-        'WeightLoad': 210,
-        'StorageItems': [
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': '7756a0779efe67f0f293f41eda4944d4',
-                'TotalVolume': 210,
-                'TotalWeight': 210,
-                'MaterialName': 'stlFuel',
-                'MaterialValue': 45820.67,
-                'MaterialAmount': 3500,
-                'MaterialTicker': 'SF',
-                'MaterialVolume': 0.05999999865889549,
-                'MaterialWeight': 0.05999999865889549,
-                'MaterialCategory': 'ba98fa0cf77040a96cd8a608ad0d08e9',
-                'MaterialValueCurrency': 'NCC',
-            }
-        ],
-        'AddressableId': 'dcad2c65b4b05a1a75f005d912a25ff6',
-        'VolumeCapacity': 210,
-        'WeightCapacity': 210,
-        'UserNameSubmitted': 'SFSCORPIO',
-    },
-    {
-        'Name': 'Vanadium',
-        'Type': 'SHIP_STORE',
-        'StorageId': '58c35d14171a605093bb16075994e3ba',
-        'Timestamp': '2026-03-02T15:31:47.378343Z',
-        'VolumeLoad': 0,
-        'WeightLoad': 0,
-        'StorageItems': [],
-        'AddressableId': 'c7d6c5b746839107f026e1b07aaf4748',
-        'VolumeCapacity': 2000,
-        'WeightCapacity': 2000,
-        'UserNameSubmitted': 'SFSCORPIO',
-    },
-    {
-        'Name': None,
-        'Type': 'STORE',
-        'StorageId': '5921564e1e19a0e7e8849d0a5a834dea',
-        'Timestamp': '2026-03-02T15:31:47.378343Z',
-        'VolumeLoad': 2515.862,
-        'WeightLoad': 3471.526,
-        'StorageItems': [
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': '83dd61885cf6879ff49fe1419f068f10',
-                'TotalVolume': 155.2,
-                'TotalWeight': 325.92,
-                'MaterialName': 'rations',
-                'MaterialValue': 0,
-                'MaterialAmount': 1552,
-                'MaterialTicker': 'RAT',
-                'MaterialVolume': 0.10000000149011612,
-                'MaterialWeight': 0.20999999344348907,
-                'MaterialCategory': '3f047ec3043bdd795fd7272d6be98799',
-                'MaterialValueCurrency': 'NCC',
-            },
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': '005252da5904d755c10d3abd4442bdeb',
-                'TotalVolume': 187,
-                'TotalWeight': 149.6,
-                'MaterialName': 'mushrooms',
-                'MaterialValue': 0,
-                'MaterialAmount': 187,
-                'MaterialTicker': 'MUS',
-                'MaterialVolume': 1,
-                'MaterialWeight': 0.800000011920929,
-                'MaterialCategory': '510e7751c0eb6a51fd0fa73565365d1c',
-                'MaterialValueCurrency': 'NCC',
-            },
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': '4bbcc7dc5dd16e9af90528ed04d9c6ba',
-                'TotalVolume': 420,
-                'TotalWeight': 945,
-                'MaterialName': 'carbon',
-                'MaterialValue': 0,
-                'MaterialAmount': 420,
-                'MaterialTicker': 'C',
-                'MaterialVolume': 1,
-                'MaterialWeight': 2.25,
-                'MaterialCategory': 'ef1d03e7ef924395c2173fc4e4ee8a6f',
-                'MaterialValueCurrency': 'NCC',
-            },
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': '87dd9b56a69e118e8c778de2dce11e8c',
-                'TotalVolume': 0.65,
-                'TotalWeight': 1.3,
-                'MaterialName': 'settlerClothing',
-                'MaterialValue': 0,
-                'MaterialAmount': 13,
-                'MaterialTicker': 'EXO',
-                'MaterialVolume': 0.05000000074505806,
-                'MaterialWeight': 0.10000000149011612,
-                'MaterialCategory': '3f047ec3043bdd795fd7272d6be98799',
-                'MaterialValueCurrency': 'NCC',
-            },
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': 'a1d1d61f8085de53455dd4e8a7813788',
-                'TotalVolume': 2.5,
-                'TotalWeight': 2.5,
-                'MaterialName': 'settlerLuxuryDrink',
-                'MaterialValue': 24990.19,
-                'MaterialAmount': 25,
-                'MaterialTicker': 'KOM',
-                'MaterialVolume': 0.10000000149011612,
-                'MaterialWeight': 0.10000000149011612,
-                'MaterialCategory': '8a0bd8b6a329c3d632da9da63c818b3d',
-                'MaterialValueCurrency': 'NCC',
-            },
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': '7171933481f022ca74200b216f98ca60',
-                'TotalVolume': 0.012,
-                'TotalWeight': 0.036,
-                'MaterialName': 'settlerLuxuryTools',
-                'MaterialValue': 4117.65,
-                'MaterialAmount': 6,
-                'MaterialTicker': 'REP',
-                'MaterialVolume': 0.0020000000949949026,
-                'MaterialWeight': 0.006000000052154064,
-                'MaterialCategory': '8a0bd8b6a329c3d632da9da63c818b3d',
-                'MaterialValueCurrency': 'NCC',
-            },
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': '4fca6f5b5e6c3b8a1b887c6dc99db146',
-                'TotalVolume': 188.3,
-                'TotalWeight': 188.3,
-                'MaterialName': 'drinkingWater',
-                'MaterialValue': 0,
-                'MaterialAmount': 1883,
-                'MaterialTicker': 'DW',
-                'MaterialVolume': 0.10000000149011612,
-                'MaterialWeight': 0.10000000149011612,
-                'MaterialCategory': '3f047ec3043bdd795fd7272d6be98799',
-                'MaterialValueCurrency': 'NCC',
-            },
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': '363f35e6ebb48062872112416e49424c',
-                'TotalVolume': 114,
-                'TotalWeight': 98.04,
-                'MaterialName': 'caffeinatedBeans',
-                'MaterialValue': 0,
-                'MaterialAmount': 114,
-                'MaterialTicker': 'CAF',
-                'MaterialVolume': 1,
-                'MaterialWeight': 0.8600000143051147,
-                'MaterialCategory': '510e7751c0eb6a51fd0fa73565365d1c',
-                'MaterialValueCurrency': 'NCC',
-            },
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': 'cc2dcb3699225b81cf63bf3e044a4f05',
-                'TotalVolume': 156,
-                'TotalWeight': 171.6,
-                'MaterialName': 'fattyVegetables',
-                'MaterialValue': 0,
-                'MaterialAmount': 156,
-                'MaterialTicker': 'VEG',
-                'MaterialVolume': 1,
-                'MaterialWeight': 1.100000023841858,
-                'MaterialCategory': '510e7751c0eb6a51fd0fa73565365d1c',
-                'MaterialValueCurrency': 'NCC',
-            },
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': '820d081096fd3e8fbd98b4344f6250ad',
-                'TotalVolume': 2.4,
-                'TotalWeight': 2.4,
-                'MaterialName': 'pioneerLuxuryClothing',
-                'MaterialValue': 16205.82,
-                'MaterialAmount': 48,
-                'MaterialTicker': 'PWO',
-                'MaterialVolume': 0.05000000074505806,
-                'MaterialWeight': 0.05000000074505806,
-                'MaterialCategory': '8a0bd8b6a329c3d632da9da63c818b3d',
-                'MaterialValueCurrency': 'NCC',
-            },
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': 'c76b4100059661084315938999623c26',
-                'TotalVolume': 251,
-                'TotalWeight': 200.8,
-                'MaterialName': 'hydrocarbonPlants',
-                'MaterialValue': 0,
-                'MaterialAmount': 251,
-                'MaterialTicker': 'HCP',
-                'MaterialVolume': 1,
-                'MaterialWeight': 0.800000011920929,
-                'MaterialCategory': '510e7751c0eb6a51fd0fa73565365d1c',
-                'MaterialValueCurrency': 'NCC',
-            },
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': 'ec8dbb1d3f51d89c61b6f58fdd64a7f0',
-                'TotalVolume': 112.4,
-                'TotalWeight': 112.4,
-                'MaterialName': 'water',
-                'MaterialValue': 0,
-                'MaterialAmount': 562,
-                'MaterialTicker': 'H2O',
-                'MaterialVolume': 0.20000000298023224,
-                'MaterialWeight': 0.20000000298023224,
-                'MaterialCategory': '473218d3618453bf25d2cd0b5616a72f',
-                'MaterialValueCurrency': 'NCC',
-            },
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': 'd9cfb2948188f49bfae2b6d9972837c8',
-                'TotalVolume': 402.5,
-                'TotalWeight': 483,
-                'MaterialName': 'nutrientSolution',
-                'MaterialValue': 25185.48,
-                'MaterialAmount': 805,
-                'MaterialTicker': 'NS',
-                'MaterialVolume': 0.5,
-                'MaterialWeight': 0.6000000238418579,
-                'MaterialCategory': '9b32ea2333917ee2632ba7ae7675643f',
-                'MaterialValueCurrency': 'NCC',
-            },
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': '9842ad8d9dfdf8e4c2e80117e7b5ebaf',
-                'TotalVolume': 57.3,
-                'TotalWeight': 57.3,
-                'MaterialName': 'pioneerLuxuryDrink',
-                'MaterialValue': 0,
-                'MaterialAmount': 573,
-                'MaterialTicker': 'COF',
-                'MaterialVolume': 0.10000000149011612,
-                'MaterialWeight': 0.10000000149011612,
-                'MaterialCategory': '8a0bd8b6a329c3d632da9da63c818b3d',
-                'MaterialValueCurrency': 'NCC',
-            },
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': 'a381f9434f9105a4f8179f6c6cffe007',
-                'TotalVolume': 199,
-                'TotalWeight': 258.7,
-                'MaterialName': 'carbohydrateMaize',
-                'MaterialValue': 0,
-                'MaterialAmount': 199,
-                'MaterialTicker': 'MAI',
-                'MaterialVolume': 1,
-                'MaterialWeight': 1.2999999523162842,
-                'MaterialCategory': '510e7751c0eb6a51fd0fa73565365d1c',
-                'MaterialValueCurrency': 'NCC',
-            },
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': '9788890100fd2191fb065cb0d5e624cb',
-                'TotalVolume': 3,
-                'TotalWeight': 2.4,
-                'MaterialName': 'pioneerClothing',
-                'MaterialValue': 0,
-                'MaterialAmount': 120,
-                'MaterialTicker': 'OVE',
-                'MaterialVolume': 0.02500000037252903,
-                'MaterialWeight': 0.019999999552965164,
-                'MaterialCategory': '3f047ec3043bdd795fd7272d6be98799',
-                'MaterialValueCurrency': 'NCC',
-            },
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': 'eeff5ee913d34354be84177847fbfe48',
-                'TotalVolume': 262,
-                'TotalWeight': 468.98,
-                'MaterialName': 'siliconOre',
-                'MaterialValue': 0,
-                'MaterialAmount': 262,
-                'MaterialTicker': 'SIO',
-                'MaterialVolume': 1,
-                'MaterialWeight': 1.7899999618530273,
-                'MaterialCategory': '4c0430b40fbf7fa175ed4a5a13682c6f',
-                'MaterialValueCurrency': 'NCC',
-            },
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': 'b5744244bb7913cee262ec29abc3b9d0',
-                'TotalVolume': 2.6,
-                'TotalWeight': 3.25,
-                'MaterialName': 'settlerTools',
-                'MaterialValue': 7777.29,
-                'MaterialAmount': 13,
-                'MaterialTicker': 'PT',
-                'MaterialVolume': 0.20000000298023224,
-                'MaterialWeight': 0.25,
-                'MaterialCategory': '3f047ec3043bdd795fd7272d6be98799',
-                'MaterialValueCurrency': 'NCC',
-            },
-        ],
-        'AddressableId': '2f4e4cc6b7a326c11294ae672c46c08b',
-        'VolumeCapacity': 6500,
-        'WeightCapacity': 6500,
-        'UserNameSubmitted': 'SFSCORPIO',
-    },
-    {
-        'Name': 'Argon',
-        'Type': 'STL_FUEL_STORE',
-        'StorageId': '59e055b06ac11f14e609395a44bd77f3',
-        'Timestamp': '2026-03-02T15:31:47.378343Z',
-        'VolumeLoad': 194.94,
-        'WeightLoad': 194.94,
-        'StorageItems': [
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': '7756a0779efe67f0f293f41eda4944d4',
-                'TotalVolume': 194.94,
-                'TotalWeight': 194.94,
-                'MaterialName': 'stlFuel',
-                'MaterialValue': 54315.7,
-                'MaterialAmount': 3249,
-                'MaterialTicker': 'SF',
-                'MaterialVolume': 0.05999999865889549,
-                'MaterialWeight': 0.05999999865889549,
-                'MaterialCategory': 'ba98fa0cf77040a96cd8a608ad0d08e9',
-                'MaterialValueCurrency': 'NCC',
-            }
-        ],
-        'AddressableId': 'c6bd8fa4139dcc7bdaf0cb722db30489',
-        'VolumeCapacity': 210,
-        'WeightCapacity': 210,
-        'UserNameSubmitted': 'SFSCORPIO',
-    },
-    {
-        'Name': 'Zinc',
-        'Type': 'STL_FUEL_STORE',
-        'StorageId': '59f7902e0ced8420793ac3fafa276cb6',
-        'Timestamp': '2026-03-02T15:31:47.378343Z',
-        'VolumeLoad': 210,
-        'WeightLoad': 210,
-        'StorageItems': [
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': '7756a0779efe67f0f293f41eda4944d4',
-                'TotalVolume': 210,
-                'TotalWeight': 210,
-                'MaterialName': 'stlFuel',
-                'MaterialValue': 55707.51,
-                'MaterialAmount': 3500,
-                'MaterialTicker': 'SF',
-                'MaterialVolume': 0.05999999865889549,
-                'MaterialWeight': 0.05999999865889549,
-                'MaterialCategory': 'ba98fa0cf77040a96cd8a608ad0d08e9',
-                'MaterialValueCurrency': 'NCC',
-            }
-        ],
-        'AddressableId': '6c9ad6b6462bbce6667ff6361c424ba4',
-        'VolumeCapacity': 210,
-        'WeightCapacity': 210,
-        'UserNameSubmitted': 'SFSCORPIO',
-    },
-    {
-        'Name': 'Cadmium',
-        'Type': 'STL_FUEL_STORE',
-        'StorageId': '5a5a3a11e43395e07d414c4eea3de07b',
-        'Timestamp': '2026-03-02T15:31:47.378343Z',
-        'VolumeLoad': 202.56,
-        'WeightLoad': 202.56,
-        'StorageItems': [
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': '7756a0779efe67f0f293f41eda4944d4',
-                'TotalVolume': 202.56,
-                'TotalWeight': 202.56,
-                'MaterialName': 'stlFuel',
-                'MaterialValue': 13991.64,
-                'MaterialAmount': 3376,
-                'MaterialTicker': 'SF',
-                'MaterialVolume': 0.05999999865889549,
-                'MaterialWeight': 0.05999999865889549,
-                'MaterialCategory': 'ba98fa0cf77040a96cd8a608ad0d08e9',
-                'MaterialValueCurrency': 'NCC',
-            }
-        ],
-        'AddressableId': '50dfff773688cc2285e4813a1078a544',
-        'VolumeCapacity': 210,
-        'WeightCapacity': 210,
-        'UserNameSubmitted': 'SFSCORPIO',
-    },
-    {
-        'Name': None,
-        'Type': 'WAREHOUSE_STORE',
-        'StorageId': '5d238f91f74c890e532ccb3fb47dcca3',
-        'Timestamp': '2026-03-02T15:31:47.378343Z',
-        'VolumeLoad': 52448.539,
-        'WeightLoad': 71901.092,
-        'StorageItems': [
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': '1f9a0293d9ba9bf519f71432e695edeb',
-                'TotalVolume': 1908,
-                'TotalWeight': 5208.84,
-                'MaterialName': 'limestone',
-                'MaterialValue': 0.04,
-                'MaterialAmount': 1908,
-                'MaterialTicker': 'LST',
-                'MaterialVolume': 1,
-                'MaterialWeight': 2.7300000190734863,
-                'MaterialCategory': '79f3917448cc4f6034ece865c41aea34',
-                'MaterialValueCurrency': 'NCC',
-            },
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': '87488698340ed6d9db87e26e35360c20',
-                'TotalVolume': 640,
-                'TotalWeight': 576,
-                'MaterialName': 'fattyNuts',
-                'MaterialValue': 0,
-                'MaterialAmount': 640,
-                'MaterialTicker': 'NUT',
-                'MaterialVolume': 1,
-                'MaterialWeight': 0.8999999761581421,
-                'MaterialCategory': '510e7751c0eb6a51fd0fa73565365d1c',
-                'MaterialValueCurrency': 'NCC',
-            },
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': '83dd61885cf6879ff49fe1419f068f10',
-                'TotalVolume': 2259.7,
-                'TotalWeight': 4745.37,
-                'MaterialName': 'rations',
-                'MaterialValue': 989896.5,
-                'MaterialAmount': 22597,
-                'MaterialTicker': 'RAT',
-                'MaterialVolume': 0.10000000149011612,
-                'MaterialWeight': 0.20999999344348907,
-                'MaterialCategory': '3f047ec3043bdd795fd7272d6be98799',
-                'MaterialValueCurrency': 'NCC',
-            },
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': 'a381f9434f9105a4f8179f6c6cffe007',
-                'TotalVolume': 501,
-                'TotalWeight': 651.3,
-                'MaterialName': 'carbohydrateMaize',
-                'MaterialValue': 0,
-                'MaterialAmount': 501,
-                'MaterialTicker': 'MAI',
-                'MaterialVolume': 1,
-                'MaterialWeight': 1.2999999523162842,
-                'MaterialCategory': '510e7751c0eb6a51fd0fa73565365d1c',
-                'MaterialValueCurrency': 'NCC',
-            },
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': '1205efe7810a94592524a53e87c3299b',
-                'TotalVolume': 2329,
-                'TotalWeight': 2212.55,
-                'MaterialName': 'cottonRaw',
-                'MaterialValue': 0,
-                'MaterialAmount': 2329,
-                'MaterialTicker': 'RCO',
-                'MaterialVolume': 1,
-                'MaterialWeight': 0.949999988079071,
-                'MaterialCategory': '510e7751c0eb6a51fd0fa73565365d1c',
-                'MaterialValueCurrency': 'NCC',
-            },
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': 'b29a0e901300857a8672f0643f7d796a',
-                'TotalVolume': 22,
-                'TotalWeight': 13.2,
-                'MaterialName': 'lightweightWindow',
-                'MaterialValue': 185995.7,
-                'MaterialAmount': 44,
-                'MaterialTicker': 'LTA',
-                'MaterialVolume': 0.5,
-                'MaterialWeight': 0.30000001192092896,
-                'MaterialCategory': 'ef423f673d9e8c82043b4c5c63f6b55e',
-                'MaterialValueCurrency': 'NCC',
-            },
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': 'ec8dbb1d3f51d89c61b6f58fdd64a7f0',
-                'TotalVolume': 536.6,
-                'TotalWeight': 536.6,
-                'MaterialName': 'water',
-                'MaterialValue': 0,
-                'MaterialAmount': 2683,
-                'MaterialTicker': 'H2O',
-                'MaterialVolume': 0.20000000298023224,
-                'MaterialWeight': 0.20000000298023224,
-                'MaterialCategory': '473218d3618453bf25d2cd0b5616a72f',
-                'MaterialValueCurrency': 'NCC',
-            },
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': '363f35e6ebb48062872112416e49424c',
-                'TotalVolume': 415,
-                'TotalWeight': 356.9,
-                'MaterialName': 'caffeinatedBeans',
-                'MaterialValue': 0,
-                'MaterialAmount': 415,
-                'MaterialTicker': 'CAF',
-                'MaterialVolume': 1,
-                'MaterialWeight': 0.8600000143051147,
-                'MaterialCategory': '510e7751c0eb6a51fd0fa73565365d1c',
-                'MaterialValueCurrency': 'NCC',
-            },
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': '274e35935b4ba9f4032f657b0ab6e0e5',
-                'TotalVolume': 209.7,
-                'TotalWeight': 139.8,
-                'MaterialName': 'advancedBulkhead',
-                'MaterialValue': 58.93,
-                'MaterialAmount': 233,
-                'MaterialTicker': 'ABH',
-                'MaterialVolume': 0.8999999761581421,
-                'MaterialWeight': 0.6000000238418579,
-                'MaterialCategory': 'ef423f673d9e8c82043b4c5c63f6b55e',
-                'MaterialValueCurrency': 'NCC',
-            },
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': '87dd9b56a69e118e8c778de2dce11e8c',
-                'TotalVolume': 373.7,
-                'TotalWeight': 747.4,
-                'MaterialName': 'settlerClothing',
-                'MaterialValue': 0,
-                'MaterialAmount': 7474,
-                'MaterialTicker': 'EXO',
-                'MaterialVolume': 0.05000000074505806,
-                'MaterialWeight': 0.10000000149011612,
-                'MaterialCategory': '3f047ec3043bdd795fd7272d6be98799',
-                'MaterialValueCurrency': 'NCC',
-            },
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': 'a4eeeb1b4c85b0637cfa7ca0a47c78d6',
-                'TotalVolume': 17,
-                'TotalWeight': 1.7,
-                'MaterialName': 'scientistTools',
-                'MaterialValue': 281418.3,
-                'MaterialAmount': 34,
-                'MaterialTicker': 'WS',
-                'MaterialVolume': 0.5,
-                'MaterialWeight': 0.05000000074505806,
-                'MaterialCategory': '3f047ec3043bdd795fd7272d6be98799',
-                'MaterialValueCurrency': 'NCC',
-            },
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': '9c80515790fcd5fefc84d56c80f4bb2a',
-                'TotalVolume': 29.2,
-                'TotalWeight': 61.32,
-                'MaterialName': 'engineerLuxuryHealth',
-                'MaterialValue': 675547.2,
-                'MaterialAmount': 292,
-                'MaterialTicker': 'VG',
-                'MaterialVolume': 0.10000000149011612,
-                'MaterialWeight': 0.20999999344348907,
-                'MaterialCategory': '8a0bd8b6a329c3d632da9da63c818b3d',
-                'MaterialValueCurrency': 'NCC',
-            },
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': '78321af6ac08c494186fafff3965034f',
-                'TotalVolume': 189.86,
-                'TotalWeight': 379.72,
-                'MaterialName': 'epoxy',
-                'MaterialValue': 0,
-                'MaterialAmount': 9493,
-                'MaterialTicker': 'EPO',
-                'MaterialVolume': 0.019999999552965164,
-                'MaterialWeight': 0.03999999910593033,
-                'MaterialCategory': '156bbcce730fba6169338d560f05fd26',
-                'MaterialValueCurrency': 'NCC',
-            },
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': '19be1b1e67efe63de8127d057508fe0c',
-                'TotalVolume': 81,
-                'TotalWeight': 259.2,
-                'MaterialName': 'chlorine',
-                'MaterialValue': 0,
-                'MaterialAmount': 81,
-                'MaterialTicker': 'CL',
-                'MaterialVolume': 1,
-                'MaterialWeight': 3.200000047683716,
-                'MaterialCategory': 'ef1d03e7ef924395c2173fc4e4ee8a6f',
-                'MaterialValueCurrency': 'NCC',
-            },
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': 'aaef669fed967abcfc188df59e1c4f4b',
-                'TotalVolume': 349,
-                'TotalWeight': 2739.65,
-                'MaterialName': 'steel',
-                'MaterialValue': 1.94,
-                'MaterialAmount': 349,
-                'MaterialTicker': 'STL',
-                'MaterialVolume': 1,
-                'MaterialWeight': 7.849999904632568,
-                'MaterialCategory': 'cae48680d4c4e6f98d593a8c3778cb56',
-                'MaterialValueCurrency': 'NCC',
-            },
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': 'b5744244bb7913cee262ec29abc3b9d0',
-                'TotalVolume': 266,
-                'TotalWeight': 332.5,
-                'MaterialName': 'settlerTools',
-                'MaterialValue': 813197.06,
-                'MaterialAmount': 1330,
-                'MaterialTicker': 'PT',
-                'MaterialVolume': 0.20000000298023224,
-                'MaterialWeight': 0.25,
-                'MaterialCategory': '3f047ec3043bdd795fd7272d6be98799',
-                'MaterialValueCurrency': 'NCC',
-            },
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': 'eeff5ee913d34354be84177847fbfe48',
-                'TotalVolume': 1389,
-                'TotalWeight': 2486.31,
-                'MaterialName': 'siliconOre',
-                'MaterialValue': 0,
-                'MaterialAmount': 1389,
-                'MaterialTicker': 'SIO',
-                'MaterialVolume': 1,
-                'MaterialWeight': 1.7899999618530273,
-                'MaterialCategory': '4c0430b40fbf7fa175ed4a5a13682c6f',
-                'MaterialValueCurrency': 'NCC',
-            },
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': 'ec3491b37050a8c780dc514033131843',
-                'TotalVolume': 6.3,
-                'TotalWeight': 27.9,
-                'MaterialName': 'hardenedStructuralElements',
-                'MaterialValue': 118486.36,
-                'MaterialAmount': 9,
-                'MaterialTicker': 'HSE',
-                'MaterialVolume': 0.699999988079071,
-                'MaterialWeight': 3.0999999046325684,
-                'MaterialCategory': 'ef423f673d9e8c82043b4c5c63f6b55e',
-                'MaterialValueCurrency': 'NCC',
-            },
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': 'b9640b0d66e7d0ca7e4d3132711c97fc',
-                'TotalVolume': 324,
-                'TotalWeight': 1911.6,
-                'MaterialName': 'ironOre',
-                'MaterialValue': 0.02,
-                'MaterialAmount': 324,
-                'MaterialTicker': 'FEO',
-                'MaterialVolume': 1,
-                'MaterialWeight': 5.900000095367432,
-                'MaterialCategory': '4c0430b40fbf7fa175ed4a5a13682c6f',
-                'MaterialValueCurrency': 'NCC',
-            },
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': 'fe5be65546733ffa4f619bbc76ac532d',
-                'TotalVolume': 122.2,
-                'TotalWeight': 134.42,
-                'MaterialName': 'pesticides',
-                'MaterialValue': 0,
-                'MaterialAmount': 1222,
-                'MaterialTicker': 'DDT',
-                'MaterialVolume': 0.10000000149011612,
-                'MaterialWeight': 0.10999999940395355,
-                'MaterialCategory': '9b32ea2333917ee2632ba7ae7675643f',
-                'MaterialValueCurrency': 'NCC',
-            },
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': '24cb7e11e07449e2a6966b92d4ee307d',
-                'TotalVolume': 106.16,
-                'TotalWeight': 212.32,
-                'MaterialName': 'fastenerKitSmall',
-                'MaterialValue': 0,
-                'MaterialAmount': 5308,
-                'MaterialTicker': 'SFK',
-                'MaterialVolume': 0.019999999552965164,
-                'MaterialWeight': 0.03999999910593033,
-                'MaterialCategory': '5e022d8f199de1c70f8de4dfd2fdef64',
-                'MaterialValueCurrency': 'NCC',
-            },
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': '73e138a825968b0132230d02591af63f',
-                'TotalVolume': 406,
-                'TotalWeight': 446.6,
-                'MaterialName': 'engineerFood',
-                'MaterialValue': 0,
-                'MaterialAmount': 812,
-                'MaterialTicker': 'FIM',
-                'MaterialVolume': 0.5,
-                'MaterialWeight': 0.550000011920929,
-                'MaterialCategory': '3f047ec3043bdd795fd7272d6be98799',
-                'MaterialValueCurrency': 'NCC',
-            },
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': '0fd977ac87d641a5bfcadea33e24641c',
-                'TotalVolume': 193.2,
-                'TotalWeight': 524.4,
-                'MaterialName': 'reinforcedStructuralElements',
-                'MaterialValue': 7203960,
-                'MaterialAmount': 276,
-                'MaterialTicker': 'RSE',
-                'MaterialVolume': 0.699999988079071,
-                'MaterialWeight': 1.899999976158142,
-                'MaterialCategory': 'ef423f673d9e8c82043b4c5c63f6b55e',
-                'MaterialValueCurrency': 'NCC',
-            },
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': '5cd2b3729f1de46d80cbf7300c905bef',
-                'TotalVolume': 14.4,
-                'TotalWeight': 1.44,
-                'MaterialName': 'informationDataCore',
-                'MaterialValue': 0,
-                'MaterialAmount': 1440,
-                'MaterialTicker': 'IDC',
-                'MaterialVolume': 0.009999999776482582,
-                'MaterialWeight': 0.0010000000474974513,
-                'MaterialCategory': '9e8bc2a092cc3361b6949eca3e95921a',
-                'MaterialValueCurrency': 'NCC',
-            },
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': '1d2a14dda2d950fe0dfa51cb76e79e54',
-                'TotalVolume': 0.184,
-                'TotalWeight': 0.184,
-                'MaterialName': 'engineerTools',
-                'MaterialValue': 334608.7,
-                'MaterialAmount': 92,
-                'MaterialTicker': 'PDA',
-                'MaterialVolume': 0.0020000000949949026,
-                'MaterialWeight': 0.0020000000949949026,
-                'MaterialCategory': '3f047ec3043bdd795fd7272d6be98799',
-                'MaterialValueCurrency': 'NCC',
-            },
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': '772408d48cf5842fb003698aaa7a6a94',
-                'TotalVolume': 442.2,
-                'TotalWeight': 147.4,
-                'MaterialName': 'lightweightBulkhead',
-                'MaterialValue': 2410.02,
-                'MaterialAmount': 737,
-                'MaterialTicker': 'LBH',
-                'MaterialVolume': 0.6000000238418579,
-                'MaterialWeight': 0.20000000298023224,
-                'MaterialCategory': 'ef423f673d9e8c82043b4c5c63f6b55e',
-                'MaterialValueCurrency': 'NCC',
-            },
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': 'cc5fb1618f0506e80bfbcee9ae2605ab',
-                'TotalVolume': 769.7,
-                'TotalWeight': 1847.28,
-                'MaterialName': 'mineralConstructionGranulate',
-                'MaterialValue': 296688.8,
-                'MaterialAmount': 7697,
-                'MaterialTicker': 'MCG',
-                'MaterialVolume': 0.10000000149011612,
-                'MaterialWeight': 0.23999999463558197,
-                'MaterialCategory': '156bbcce730fba6169338d560f05fd26',
-                'MaterialValueCurrency': 'NCC',
-            },
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': '4fca6f5b5e6c3b8a1b887c6dc99db146',
-                'TotalVolume': 2052.3,
-                'TotalWeight': 2052.3,
-                'MaterialName': 'drinkingWater',
-                'MaterialValue': 686096.5,
-                'MaterialAmount': 20523,
-                'MaterialTicker': 'DW',
-                'MaterialVolume': 0.10000000149011612,
-                'MaterialWeight': 0.10000000149011612,
-                'MaterialCategory': '3f047ec3043bdd795fd7272d6be98799',
-                'MaterialValueCurrency': 'NCC',
-            },
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': '8d4e0986419d2769fe50ac6497be6b7e',
-                'TotalVolume': 1539.6,
-                'TotalWeight': 384.9,
-                'MaterialName': 'lightweightStructuralElements',
-                'MaterialValue': 0,
-                'MaterialAmount': 1283,
-                'MaterialTicker': 'LSE',
-                'MaterialVolume': 1.2000000476837158,
-                'MaterialWeight': 0.30000001192092896,
-                'MaterialCategory': 'ef423f673d9e8c82043b4c5c63f6b55e',
-                'MaterialValueCurrency': 'NCC',
-            },
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': '08b3d1994643df5efe095b335be3a029',
-                'TotalVolume': 348,
-                'TotalWeight': 974.4,
-                'MaterialName': 'nanoCarbonSheeting',
-                'MaterialValue': 0,
-                'MaterialAmount': 34800,
-                'MaterialTicker': 'NCS',
-                'MaterialVolume': 0.009999999776482582,
-                'MaterialWeight': 0.02800000086426735,
-                'MaterialCategory': '156bbcce730fba6169338d560f05fd26',
-                'MaterialValueCurrency': 'NCC',
-            },
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': '17229492d319a4d6a5d0d45ee5bef188',
-                'TotalVolume': 245,
-                'TotalWeight': 245,
-                'MaterialName': 'nanoResin',
-                'MaterialValue': 0,
-                'MaterialAmount': 4900,
-                'MaterialTicker': 'NR',
-                'MaterialVolume': 0.05000000074505806,
-                'MaterialWeight': 0.05000000074505806,
-                'MaterialCategory': '9b32ea2333917ee2632ba7ae7675643f',
-                'MaterialValueCurrency': 'NCC',
-            },
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': 'f3f12b5b3adebdd25f3067e5aa4589f0',
-                'TotalVolume': 50,
-                'TotalWeight': 20,
-                'MaterialName': 'lightweightHullPlate',
-                'MaterialValue': 19558.82,
-                'MaterialAmount': 5,
-                'MaterialTicker': 'LHP',
-                'MaterialVolume': 10,
-                'MaterialWeight': 4,
-                'MaterialCategory': 'd23b9225010ad7978e5496e55359e19b',
-                'MaterialValueCurrency': 'NCC',
-            },
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': 'b88aaf3dba6caa7e6d437e49e7620f0b',
-                'TotalVolume': 162.1,
-                'TotalWeight': 97.26,
-                'MaterialName': 'insuFoam',
-                'MaterialValue': 290150.2,
-                'MaterialAmount': 1621,
-                'MaterialTicker': 'INS',
-                'MaterialVolume': 0.10000000149011612,
-                'MaterialWeight': 0.05999999865889549,
-                'MaterialCategory': '156bbcce730fba6169338d560f05fd26',
-                'MaterialValueCurrency': 'NCC',
-            },
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': 'bf1f62e450627f2db02884657c399284',
-                'TotalVolume': 762,
-                'TotalWeight': 203.2,
-                'MaterialName': 'advancedDeckElements',
-                'MaterialValue': 48.94,
-                'MaterialAmount': 508,
-                'MaterialTicker': 'ADE',
-                'MaterialVolume': 1.5,
-                'MaterialWeight': 0.4000000059604645,
-                'MaterialCategory': 'ef423f673d9e8c82043b4c5c63f6b55e',
-                'MaterialValueCurrency': 'NCC',
-            },
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': '9930460f6d54364954dcf0af905029c5',
-                'TotalVolume': 201.6,
-                'TotalWeight': 537.6,
-                'MaterialName': 'reinforcedBulkhead',
-                'MaterialValue': 4091244.5,
-                'MaterialAmount': 224,
-                'MaterialTicker': 'RBH',
-                'MaterialVolume': 0.8999999761581421,
-                'MaterialWeight': 2.4000000953674316,
-                'MaterialCategory': 'ef423f673d9e8c82043b4c5c63f6b55e',
-                'MaterialValueCurrency': 'NCC',
-            },
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': '9282cf0c801f5b5adcee3b44621ea1bb',
-                'TotalVolume': 46.1,
-                'TotalWeight': 92.2,
-                'MaterialName': 'metalHalideLamp',
-                'MaterialValue': 4899799.5,
-                'MaterialAmount': 922,
-                'MaterialTicker': 'MHL',
-                'MaterialVolume': 0.05000000074505806,
-                'MaterialWeight': 0.10000000149011612,
-                'MaterialCategory': 'f8aebc7dd84ce14fae131aa0203d4498',
-                'MaterialValueCurrency': 'NCC',
-            },
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': '3010d90fde69729f4754b092fdcda826',
-                'TotalVolume': 1492.8,
-                'TotalWeight': 124.4,
-                'MaterialName': 'lightweightDeckElements',
-                'MaterialValue': 5537.38,
-                'MaterialAmount': 1244,
-                'MaterialTicker': 'LDE',
-                'MaterialVolume': 1.2000000476837158,
-                'MaterialWeight': 0.10000000149011612,
-                'MaterialCategory': 'ef423f673d9e8c82043b4c5c63f6b55e',
-                'MaterialValueCurrency': 'NCC',
-            },
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': '005252da5904d755c10d3abd4442bdeb',
-                'TotalVolume': 380,
-                'TotalWeight': 304,
-                'MaterialName': 'mushrooms',
-                'MaterialValue': 0,
-                'MaterialAmount': 380,
-                'MaterialTicker': 'MUS',
-                'MaterialVolume': 1,
-                'MaterialWeight': 0.800000011920929,
-                'MaterialCategory': '510e7751c0eb6a51fd0fa73565365d1c',
-                'MaterialValueCurrency': 'NCC',
-            },
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': 'a531fd67223d12e94103dff359c50e0d',
-                'TotalVolume': 37.2,
-                'TotalWeight': 27.9,
-                'MaterialName': 'advancedWindow',
-                'MaterialValue': 18.98,
-                'MaterialAmount': 93,
-                'MaterialTicker': 'ATA',
-                'MaterialVolume': 0.4000000059604645,
-                'MaterialWeight': 0.30000001192092896,
-                'MaterialCategory': 'ef423f673d9e8c82043b4c5c63f6b55e',
-                'MaterialValueCurrency': 'NCC',
-            },
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': '432414a579f1fccd66136b257eb44408',
-                'TotalVolume': 266.2,
-                'TotalWeight': 532.4,
-                'MaterialName': 'fastenerKitMedium',
-                'MaterialValue': 0,
-                'MaterialAmount': 5324,
-                'MaterialTicker': 'MFK',
-                'MaterialVolume': 0.05000000074505806,
-                'MaterialWeight': 0.10000000149011612,
-                'MaterialCategory': '5e022d8f199de1c70f8de4dfd2fdef64',
-                'MaterialValueCurrency': 'NCC',
-            },
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': '379f7bc12b6d2800c0a9f72c4943628b',
-                'TotalVolume': 0.2,
-                'TotalWeight': 0.2,
-                'MaterialName': 'engineerClothing',
-                'MaterialValue': 9503.89,
-                'MaterialAmount': 4,
-                'MaterialTicker': 'HSS',
-                'MaterialVolume': 0.05000000074505806,
-                'MaterialWeight': 0.05000000074505806,
-                'MaterialCategory': '3f047ec3043bdd795fd7272d6be98799',
-                'MaterialValueCurrency': 'NCC',
-            },
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': 'e97e2535fec019710299709a7462c066',
-                'TotalVolume': 307,
-                'TotalWeight': 245.6,
-                'MaterialName': 'proteinBeans',
-                'MaterialValue': 0,
-                'MaterialAmount': 307,
-                'MaterialTicker': 'BEA',
-                'MaterialVolume': 1,
-                'MaterialWeight': 0.800000011920929,
-                'MaterialCategory': '510e7751c0eb6a51fd0fa73565365d1c',
-                'MaterialValueCurrency': 'NCC',
-            },
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': '420b38d32301dfe56403d1f3967d5b86',
-                'TotalVolume': 487.5,
-                'TotalWeight': 32.5,
-                'MaterialName': 'basicDeckElements',
-                'MaterialValue': 6.24,
-                'MaterialAmount': 325,
-                'MaterialTicker': 'BDE',
-                'MaterialVolume': 1.5,
-                'MaterialWeight': 0.10000000149011612,
-                'MaterialCategory': 'ef423f673d9e8c82043b4c5c63f6b55e',
-                'MaterialValueCurrency': 'NCC',
-            },
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': '04f72b0c957b769c6d45c011e9c9b4b5',
-                'TotalVolume': 210,
-                'TotalWeight': 283.5,
-                'MaterialName': 'aluminiumOre',
-                'MaterialValue': 0,
-                'MaterialAmount': 210,
-                'MaterialTicker': 'ALO',
-                'MaterialVolume': 1,
-                'MaterialWeight': 1.350000023841858,
-                'MaterialCategory': '4c0430b40fbf7fa175ed4a5a13682c6f',
-                'MaterialValueCurrency': 'NCC',
-            },
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': '5f2011b6c605256dfa4626776cc7cf3c',
-                'TotalVolume': 1048,
-                'TotalWeight': 2096,
-                'MaterialName': 'proteinPaste',
-                'MaterialValue': 0,
-                'MaterialAmount': 1048,
-                'MaterialTicker': 'PPA',
-                'MaterialVolume': 1,
-                'MaterialWeight': 2,
-                'MaterialCategory': '510e7751c0eb6a51fd0fa73565365d1c',
-                'MaterialValueCurrency': 'NCC',
-            },
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': '9842ad8d9dfdf8e4c2e80117e7b5ebaf',
-                'TotalVolume': 77.2,
-                'TotalWeight': 77.2,
-                'MaterialName': 'pioneerLuxuryDrink',
-                'MaterialValue': 0,
-                'MaterialAmount': 772,
-                'MaterialTicker': 'COF',
-                'MaterialVolume': 0.10000000149011612,
-                'MaterialWeight': 0.10000000149011612,
-                'MaterialCategory': '8a0bd8b6a329c3d632da9da63c818b3d',
-                'MaterialValueCurrency': 'NCC',
-            },
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': '334f3510e3265410da15174160fbf8f5',
-                'TotalVolume': 8,
-                'TotalWeight': 6,
-                'MaterialName': 'basicWindow',
-                'MaterialValue': 30892.3,
-                'MaterialAmount': 20,
-                'MaterialTicker': 'BTA',
-                'MaterialVolume': 0.4000000059604645,
-                'MaterialWeight': 0.30000001192092896,
-                'MaterialCategory': 'ef423f673d9e8c82043b4c5c63f6b55e',
-                'MaterialValueCurrency': 'NCC',
-            },
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': '165dab5e1f913b2a4769f57f64c2505e',
-                'TotalVolume': 198,
-                'TotalWeight': 184.8,
-                'MaterialName': 'reinforcedDeckElements',
-                'MaterialValue': 4025955,
-                'MaterialAmount': 132,
-                'MaterialTicker': 'RDE',
-                'MaterialVolume': 1.5,
-                'MaterialWeight': 1.399999976158142,
-                'MaterialCategory': 'ef423f673d9e8c82043b4c5c63f6b55e',
-                'MaterialValueCurrency': 'NCC',
-            },
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': '83d83e8cf6fb9018ae7138a1b5d4b19c',
-                'TotalVolume': 2925,
-                'TotalWeight': 2632.5,
-                'MaterialName': 'carbohydrateGrains',
-                'MaterialValue': 0,
-                'MaterialAmount': 2925,
-                'MaterialTicker': 'GRN',
-                'MaterialVolume': 1,
-                'MaterialWeight': 0.8999999761581421,
-                'MaterialCategory': '510e7751c0eb6a51fd0fa73565365d1c',
-                'MaterialValueCurrency': 'NCC',
-            },
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': 'c76b4100059661084315938999623c26',
-                'TotalVolume': 564,
-                'TotalWeight': 451.2,
-                'MaterialName': 'hydrocarbonPlants',
-                'MaterialValue': 0,
-                'MaterialAmount': 564,
-                'MaterialTicker': 'HCP',
-                'MaterialVolume': 1,
-                'MaterialWeight': 0.800000011920929,
-                'MaterialCategory': '510e7751c0eb6a51fd0fa73565365d1c',
-                'MaterialValueCurrency': 'NCC',
-            },
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': 'a36d549d1340c1d489cc4a9ccccf22d0',
-                'TotalVolume': 5.7,
-                'TotalWeight': 0.57,
-                'MaterialName': 'entertainmentDataCore',
-                'MaterialValue': 0,
-                'MaterialAmount': 570,
-                'MaterialTicker': 'EDC',
-                'MaterialVolume': 0.009999999776482582,
-                'MaterialWeight': 0.0010000000474974513,
-                'MaterialCategory': '1dfe943824ceb52d332b4650ce457218',
-                'MaterialValueCurrency': 'NCC',
-            },
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': 'cc2dcb3699225b81cf63bf3e044a4f05',
-                'TotalVolume': 412,
-                'TotalWeight': 453.2,
-                'MaterialName': 'fattyVegetables',
-                'MaterialValue': 0,
-                'MaterialAmount': 412,
-                'MaterialTicker': 'VEG',
-                'MaterialVolume': 1,
-                'MaterialWeight': 1.100000023841858,
-                'MaterialCategory': '510e7751c0eb6a51fd0fa73565365d1c',
-                'MaterialValueCurrency': 'NCC',
-            },
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': '63b98e9700f6630cbfd9c824e0882388',
-                'TotalVolume': 1680,
-                'TotalWeight': 1050,
-                'MaterialName': 'basicBulkhead',
-                'MaterialValue': 6467.21,
-                'MaterialAmount': 2100,
-                'MaterialTicker': 'BBH',
-                'MaterialVolume': 0.800000011920929,
-                'MaterialWeight': 0.5,
-                'MaterialCategory': 'ef423f673d9e8c82043b4c5c63f6b55e',
-                'MaterialValueCurrency': 'NCC',
-            },
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': '52cc5c8aeab6bb1778e7ce93a1bbdc80',
-                'TotalVolume': 1293,
-                'TotalWeight': 905.1,
-                'MaterialName': 'meat',
-                'MaterialValue': 1151.94,
-                'MaterialAmount': 1293,
-                'MaterialTicker': 'MTP',
-                'MaterialVolume': 1,
-                'MaterialWeight': 0.699999988079071,
-                'MaterialCategory': '510e7751c0eb6a51fd0fa73565365d1c',
-                'MaterialValueCurrency': 'NCC',
-            },
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': '6e16dbf050b98d9c4fc9c615b3367a0f',
-                'TotalVolume': 2552,
-                'TotalWeight': 2911.832,
-                'MaterialName': 'oxygen',
-                'MaterialValue': 0,
-                'MaterialAmount': 2552,
-                'MaterialTicker': 'O',
-                'MaterialVolume': 1,
-                'MaterialWeight': 1.1410000324249268,
-                'MaterialCategory': '54dec1e42eba44dda423dd774393326a',
-                'MaterialValueCurrency': 'NCC',
-            },
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': 'a1d1d61f8085de53455dd4e8a7813788',
-                'TotalVolume': 56,
-                'TotalWeight': 56,
-                'MaterialName': 'settlerLuxuryDrink',
-                'MaterialValue': 559210.1,
-                'MaterialAmount': 560,
-                'MaterialTicker': 'KOM',
-                'MaterialVolume': 0.10000000149011612,
-                'MaterialWeight': 0.10000000149011612,
-                'MaterialCategory': '8a0bd8b6a329c3d632da9da63c818b3d',
-                'MaterialValueCurrency': 'NCC',
-            },
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': 'ed72545a5db1f16430d79a240dc61e6c',
-                'TotalVolume': 2000,
-                'TotalWeight': 5400,
-                'MaterialName': 'aluminium',
-                'MaterialValue': 0,
-                'MaterialAmount': 2000,
-                'MaterialTicker': 'AL',
-                'MaterialVolume': 1,
-                'MaterialWeight': 2.700000047683716,
-                'MaterialCategory': 'cae48680d4c4e6f98d593a8c3778cb56',
-                'MaterialValueCurrency': 'NCC',
-            },
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': '11ec662cd8ba85e87b111a7ba7aa4973',
-                'TotalVolume': 3208,
-                'TotalWeight': 3111.76,
-                'MaterialName': 'sodium',
-                'MaterialValue': 0.19,
-                'MaterialAmount': 3208,
-                'MaterialTicker': 'NA',
-                'MaterialVolume': 1,
-                'MaterialWeight': 0.9700000286102295,
-                'MaterialCategory': 'ef1d03e7ef924395c2173fc4e4ee8a6f',
-                'MaterialValueCurrency': 'NCC',
-            },
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': '4bbcc7dc5dd16e9af90528ed04d9c6ba',
-                'TotalVolume': 2784,
-                'TotalWeight': 6264,
-                'MaterialName': 'carbon',
-                'MaterialValue': 0,
-                'MaterialAmount': 2784,
-                'MaterialTicker': 'C',
-                'MaterialVolume': 1,
-                'MaterialWeight': 2.25,
-                'MaterialCategory': 'ef1d03e7ef924395c2173fc4e4ee8a6f',
-                'MaterialValueCurrency': 'NCC',
-            },
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': '04970fd8cd9c3bc423b46503985e55de',
-                'TotalVolume': 21.07,
-                'TotalWeight': 45.15,
-                'MaterialName': 'sealant',
-                'MaterialValue': 44687.52,
-                'MaterialAmount': 301,
-                'MaterialTicker': 'SEA',
-                'MaterialVolume': 0.07000000029802322,
-                'MaterialWeight': 0.15000000596046448,
-                'MaterialCategory': '156bbcce730fba6169338d560f05fd26',
-                'MaterialValueCurrency': 'NCC',
-            },
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': '6bbdf7d0503153753c8cb23653a4d22b',
-                'TotalVolume': 1311,
-                'TotalWeight': 786.6,
-                'MaterialName': 'basicStructuralElements',
-                'MaterialValue': 2373426.8,
-                'MaterialAmount': 2622,
-                'MaterialTicker': 'BSE',
-                'MaterialVolume': 0.5,
-                'MaterialWeight': 0.30000001192092896,
-                'MaterialCategory': 'ef423f673d9e8c82043b4c5c63f6b55e',
-                'MaterialValueCurrency': 'NCC',
-            },
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': '5952bfbf043018679334e7ea71b1504e',
-                'TotalVolume': 0.28,
-                'TotalWeight': 1.12,
-                'MaterialName': 'technicianLuxuryHealth',
-                'MaterialValue': 34043.73,
-                'MaterialAmount': 28,
-                'MaterialTicker': 'SC',
-                'MaterialVolume': 0.009999999776482582,
-                'MaterialWeight': 0.03999999910593033,
-                'MaterialCategory': '8a0bd8b6a329c3d632da9da63c818b3d',
-                'MaterialValueCurrency': 'NCC',
-            },
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': 'ee8e92a632d1b5f4847fe9d4e376aeca',
-                'TotalVolume': 235.27,
-                'TotalWeight': 235.27,
-                'MaterialName': 'polyEthylene',
-                'MaterialValue': 0,
-                'MaterialAmount': 23527,
-                'MaterialTicker': 'PE',
-                'MaterialVolume': 0.009999999776482582,
-                'MaterialWeight': 0.009999999776482582,
-                'MaterialCategory': '6316282906a9f68b0c7bb4396a26aa95',
-                'MaterialValueCurrency': 'NCC',
-            },
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': 'a24540c6c24595ca5bf47f091f11c8f9',
-                'TotalVolume': 137,
-                'TotalWeight': 411,
-                'MaterialName': 'reinforcedWindow',
-                'MaterialValue': 0,
-                'MaterialAmount': 274,
-                'MaterialTicker': 'RTA',
-                'MaterialVolume': 0.5,
-                'MaterialWeight': 1.5,
-                'MaterialCategory': 'ef423f673d9e8c82043b4c5c63f6b55e',
-                'MaterialValueCurrency': 'NCC',
-            },
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': 'ec53c7423b75ca0d868f9580ae921561',
-                'TotalVolume': 3171,
-                'TotalWeight': 211.4,
-                'MaterialName': 'truss',
-                'MaterialValue': 0.05,
-                'MaterialAmount': 2114,
-                'MaterialTicker': 'TRU',
-                'MaterialVolume': 1.5,
-                'MaterialWeight': 0.10000000149011612,
-                'MaterialCategory': 'f8aebc7dd84ce14fae131aa0203d4498',
-                'MaterialValueCurrency': 'NCC',
-            },
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': 'd9cfb2948188f49bfae2b6d9972837c8',
-                'TotalVolume': 2997,
-                'TotalWeight': 3596.4,
-                'MaterialName': 'nutrientSolution',
-                'MaterialValue': 0,
-                'MaterialAmount': 5994,
-                'MaterialTicker': 'NS',
-                'MaterialVolume': 0.5,
-                'MaterialWeight': 0.6000000238418579,
-                'MaterialCategory': '9b32ea2333917ee2632ba7ae7675643f',
-                'MaterialValueCurrency': 'NCC',
-            },
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': 'c83a4fc74233f9ffac3f5b7b7b83dce5',
-                'TotalVolume': 63.6,
-                'TotalWeight': 53,
-                'MaterialName': 'advancedStructuralElements',
-                'MaterialValue': 18.98,
-                'MaterialAmount': 106,
-                'MaterialTicker': 'ASE',
-                'MaterialVolume': 0.6000000238418579,
-                'MaterialWeight': 0.5,
-                'MaterialCategory': 'ef423f673d9e8c82043b4c5c63f6b55e',
-                'MaterialValueCurrency': 'NCC',
-            },
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': '64666b2eb0faaba594a62818e48229b8',
-                'TotalVolume': 84.565,
-                'TotalWeight': 169.13,
-                'MaterialName': 'polymerGranulate',
-                'MaterialValue': 0,
-                'MaterialAmount': 84565,
-                'MaterialTicker': 'PG',
-                'MaterialVolume': 0.0010000000474974513,
-                'MaterialWeight': 0.0020000000949949026,
-                'MaterialCategory': '6316282906a9f68b0c7bb4396a26aa95',
-                'MaterialValueCurrency': 'NCC',
-            },
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': 'a5de3e325e87c874fe395949728bb276',
-                'TotalVolume': 462,
-                'TotalWeight': 554.4,
-                'MaterialName': 'scientistFood',
-                'MaterialValue': 0,
-                'MaterialAmount': 924,
-                'MaterialTicker': 'MEA',
-                'MaterialVolume': 0.5,
-                'MaterialWeight': 0.6000000238418579,
-                'MaterialCategory': '3f047ec3043bdd795fd7272d6be98799',
-                'MaterialValueCurrency': 'NCC',
-            },
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': '1a1f13b7fc3e0fb6aa292b7c28764f93',
-                'TotalVolume': 654,
-                'TotalWeight': 261.6,
-                'MaterialName': 'herbs',
-                'MaterialValue': 0,
-                'MaterialAmount': 654,
-                'MaterialTicker': 'HER',
-                'MaterialVolume': 1,
-                'MaterialWeight': 0.4000000059604645,
-                'MaterialCategory': '510e7751c0eb6a51fd0fa73565365d1c',
-                'MaterialValueCurrency': 'NCC',
-            },
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': '93fb7db0a58375534661afd0dc88f4ad',
-                'TotalVolume': 620,
-                'TotalWeight': 558,
-                'MaterialName': 'artificialSoil',
-                'MaterialValue': 508582.7,
-                'MaterialAmount': 620,
-                'MaterialTicker': 'SOI',
-                'MaterialVolume': 1,
-                'MaterialWeight': 0.8999999761581421,
-                'MaterialCategory': '9b32ea2333917ee2632ba7ae7675643f',
-                'MaterialValueCurrency': 'NCC',
-            },
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': '7921cd20f7add0b26ff77f76e3e911f8',
-                'TotalVolume': 624,
-                'TotalWeight': 4913.376,
-                'MaterialName': 'iron',
-                'MaterialValue': 0,
-                'MaterialAmount': 624,
-                'MaterialTicker': 'FE',
-                'MaterialVolume': 1,
-                'MaterialWeight': 7.874000072479248,
-                'MaterialCategory': 'cae48680d4c4e6f98d593a8c3778cb56',
-                'MaterialValueCurrency': 'NCC',
-            },
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': '56afb81e665cf39883cdffbb26f81bf5',
-                'TotalVolume': 42,
-                'TotalWeight': 67.2,
-                'MaterialName': 'thermalShielding',
-                'MaterialValue': 843067.25,
-                'MaterialAmount': 28,
-                'MaterialTicker': 'TSH',
-                'MaterialVolume': 1.5,
-                'MaterialWeight': 2.4000000953674316,
-                'MaterialCategory': 'f8aebc7dd84ce14fae131aa0203d4498',
-                'MaterialValueCurrency': 'NCC',
-            },
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': '820d081096fd3e8fbd98b4344f6250ad',
-                'TotalVolume': 30.9,
-                'TotalWeight': 30.9,
-                'MaterialName': 'pioneerLuxuryClothing',
-                'MaterialValue': 208962.1,
-                'MaterialAmount': 618,
-                'MaterialTicker': 'PWO',
-                'MaterialVolume': 0.05000000074505806,
-                'MaterialWeight': 0.05000000074505806,
-                'MaterialCategory': '8a0bd8b6a329c3d632da9da63c818b3d',
-                'MaterialValueCurrency': 'NCC',
-            },
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': '51c829b6e62e70223024ffa6688db9f7',
-                'TotalVolume': 578.2,
-                'TotalWeight': 1445.5,
-                'MaterialName': 'flux',
-                'MaterialValue': 0,
-                'MaterialAmount': 5782,
-                'MaterialTicker': 'FLX',
-                'MaterialVolume': 0.10000000149011612,
-                'MaterialWeight': 0.25,
-                'MaterialCategory': '9b32ea2333917ee2632ba7ae7675643f',
-                'MaterialValueCurrency': 'NCC',
-            },
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': '7171933481f022ca74200b216f98ca60',
-                'TotalVolume': 2.55,
-                'TotalWeight': 7.65,
-                'MaterialName': 'settlerLuxuryTools',
-                'MaterialValue': 875000,
-                'MaterialAmount': 1275,
-                'MaterialTicker': 'REP',
-                'MaterialVolume': 0.0020000000949949026,
-                'MaterialWeight': 0.006000000052154064,
-                'MaterialCategory': '8a0bd8b6a329c3d632da9da63c818b3d',
-                'MaterialValueCurrency': 'NCC',
-            },
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': 'a636755a8531daa76ab6b1f95fd5d5e3',
-                'TotalVolume': 7.85,
-                'TotalWeight': 7.85,
-                'MaterialName': 'scientistLuxuryHealth',
-                'MaterialValue': 270464.53,
-                'MaterialAmount': 157,
-                'MaterialTicker': 'NST',
-                'MaterialVolume': 0.05000000074505806,
-                'MaterialWeight': 0.05000000074505806,
-                'MaterialCategory': '8a0bd8b6a329c3d632da9da63c818b3d',
-                'MaterialValueCurrency': 'NCC',
-            },
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': '9788890100fd2191fb065cb0d5e624cb',
-                'TotalVolume': 107.65,
-                'TotalWeight': 86.12,
-                'MaterialName': 'pioneerClothing',
-                'MaterialValue': 0,
-                'MaterialAmount': 4306,
-                'MaterialTicker': 'OVE',
-                'MaterialVolume': 0.02500000037252903,
-                'MaterialWeight': 0.019999999552965164,
-                'MaterialCategory': '3f047ec3043bdd795fd7272d6be98799',
-                'MaterialValueCurrency': 'NCC',
-            },
-        ],
-        'AddressableId': 'd4022e28a230c1b2f4354e373d169601',
-        'VolumeCapacity': 107500,
-        'WeightCapacity': 107500,
-        'UserNameSubmitted': 'SFSCORPIO',
-    },
-    {
-        'Name': None,
-        'Type': 'WAREHOUSE_STORE',
-        'StorageId': '5d817c73ae8c9c366d1f12da24b80c6e',
-        'Timestamp': '2026-03-02T15:31:47.378343Z',
-        'VolumeLoad': 0,
-        'WeightLoad': 0,
-        'StorageItems': [],
-        'AddressableId': 'e83d8b9da72479e292363c9d16ade4e5',
-        'VolumeCapacity': 2000,
-        'WeightCapacity': 2000,
-        'UserNameSubmitted': 'SFSCORPIO',
-    },
-    {
-        'Name': 'Bromine',
-        'Type': 'FTL_FUEL_STORE',
-        'StorageId': '5f9ed3d1a897ae5f31ef3588a0db572b',
-        'Timestamp': '2026-03-02T15:31:47.378343Z',
-        'VolumeLoad': 17.82,
-        'WeightLoad': 89.1,
-        'StorageItems': [
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': '7a2a12cd6872b89a6b97532618788a4d',
-                'TotalVolume': 17.82,
-                'TotalWeight': 89.1,
-                'MaterialName': 'ftlFuel',
-                'MaterialValue': 14636.06,
-                'MaterialAmount': 1782,
-                'MaterialTicker': 'FF',
-                'MaterialVolume': 0.009999999776482582,
-                'MaterialWeight': 0.05000000074505806,
-                'MaterialCategory': 'ba98fa0cf77040a96cd8a608ad0d08e9',
-                'MaterialValueCurrency': 'NCC',
-            }
-        ],
-        'AddressableId': '985b1255ea002b44e81767cfb54cafba',
-        'VolumeCapacity': 20,
-        'WeightCapacity': 100,
-        'UserNameSubmitted': 'SFSCORPIO',
-    },
-    {
-        'Name': 'Palladium',
-        'Type': 'SHIP_STORE',
-        'StorageId': '5fd796088f3d139337339652541d2107',
-        'Timestamp': '2026-03-02T15:31:47.378343Z',
-        'VolumeLoad': 0,
-        'WeightLoad': 0,
-        'StorageItems': [],
-        'AddressableId': '3e8a23cf3dc8fe97f89f20dbdc992a28',
-        'VolumeCapacity': 2000,
-        'WeightCapacity': 2000,
-        'UserNameSubmitted': 'SFSCORPIO',
-    },
-    {
-        'Name': 'Scandium',
-        'Type': 'FTL_FUEL_STORE',
-        'StorageId': '607a88e0a1271c83ead2a27b92a6a411',
-        'Timestamp': '2026-03-02T15:31:47.378343Z',
-        'VolumeLoad': 20,
-        'WeightLoad': 100,
-        'StorageItems': [
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': '7a2a12cd6872b89a6b97532618788a4d',
-                'TotalVolume': 20,
-                'TotalWeight': 100,
-                'MaterialName': 'ftlFuel',
-                'MaterialValue': 34776.76,
-                'MaterialAmount': 2000,
-                'MaterialTicker': 'FF',
-                'MaterialVolume': 0.009999999776482582,
-                'MaterialWeight': 0.05000000074505806,
-                'MaterialCategory': 'ba98fa0cf77040a96cd8a608ad0d08e9',
-                'MaterialValueCurrency': 'NCC',
-            }
-        ],
-        'AddressableId': '98e0a736ee0e789e99e494629369c53d',
-        'VolumeCapacity': 20,
-        'WeightCapacity': 100,
-        'UserNameSubmitted': 'SFSCORPIO',
-    },
-    {
-        'Name': None,
-        'Type': 'STORE',
-        'StorageId': '6086862ce5f7c48053a84d44b9f64605',
-        'Timestamp': '2026-03-02T15:31:47.378343Z',
-        'VolumeLoad': 861.55,
-        'WeightLoad': 1024.44,
-        'StorageItems': [
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': '83dd61885cf6879ff49fe1419f068f10',
-                'TotalVolume': 197.3,
-                'TotalWeight': 414.33,
-                'MaterialName': 'rations',
-                'MaterialValue': 0,
-                'MaterialAmount': 1973,
-                'MaterialTicker': 'RAT',
-                'MaterialVolume': 0.10000000149011612,
-                'MaterialWeight': 0.20999999344348907,
-                'MaterialCategory': '3f047ec3043bdd795fd7272d6be98799',
-                'MaterialValueCurrency': 'NCC',
-            },
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': '87488698340ed6d9db87e26e35360c20',
-                'TotalVolume': 149,
-                'TotalWeight': 134.1,
-                'MaterialName': 'fattyNuts',
-                'MaterialValue': 0.02,
-                'MaterialAmount': 149,
-                'MaterialTicker': 'NUT',
-                'MaterialVolume': 1,
-                'MaterialWeight': 0.8999999761581421,
-                'MaterialCategory': '510e7751c0eb6a51fd0fa73565365d1c',
-                'MaterialValueCurrency': 'NCC',
-            },
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': '4fca6f5b5e6c3b8a1b887c6dc99db146',
-                'TotalVolume': 134,
-                'TotalWeight': 134,
-                'MaterialName': 'drinkingWater',
-                'MaterialValue': 0,
-                'MaterialAmount': 1340,
-                'MaterialTicker': 'DW',
-                'MaterialVolume': 0.10000000149011612,
-                'MaterialWeight': 0.10000000149011612,
-                'MaterialCategory': '3f047ec3043bdd795fd7272d6be98799',
-                'MaterialValueCurrency': 'NCC',
-            },
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': '820d081096fd3e8fbd98b4344f6250ad',
-                'TotalVolume': 1.35,
-                'TotalWeight': 1.35,
-                'MaterialName': 'pioneerLuxuryClothing',
-                'MaterialValue': 9127.43,
-                'MaterialAmount': 27,
-                'MaterialTicker': 'PWO',
-                'MaterialVolume': 0.05000000074505806,
-                'MaterialWeight': 0.05000000074505806,
-                'MaterialCategory': '8a0bd8b6a329c3d632da9da63c818b3d',
-                'MaterialValueCurrency': 'NCC',
-            },
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': 'e97e2535fec019710299709a7462c066',
-                'TotalVolume': 125,
-                'TotalWeight': 100,
-                'MaterialName': 'proteinBeans',
-                'MaterialValue': 0,
-                'MaterialAmount': 125,
-                'MaterialTicker': 'BEA',
-                'MaterialVolume': 1,
-                'MaterialWeight': 0.800000011920929,
-                'MaterialCategory': '510e7751c0eb6a51fd0fa73565365d1c',
-                'MaterialValueCurrency': 'NCC',
-            },
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': '83d83e8cf6fb9018ae7138a1b5d4b19c',
-                'TotalVolume': 139,
-                'TotalWeight': 125.1,
-                'MaterialName': 'carbohydrateGrains',
-                'MaterialValue': 0,
-                'MaterialAmount': 139,
-                'MaterialTicker': 'GRN',
-                'MaterialVolume': 1,
-                'MaterialWeight': 0.8999999761581421,
-                'MaterialCategory': '510e7751c0eb6a51fd0fa73565365d1c',
-                'MaterialValueCurrency': 'NCC',
-            },
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': 'ec8dbb1d3f51d89c61b6f58fdd64a7f0',
-                'TotalVolume': 107.4,
-                'TotalWeight': 107.4,
-                'MaterialName': 'water',
-                'MaterialValue': 0,
-                'MaterialAmount': 537,
-                'MaterialTicker': 'H2O',
-                'MaterialVolume': 0.20000000298023224,
-                'MaterialWeight': 0.20000000298023224,
-                'MaterialCategory': '473218d3618453bf25d2cd0b5616a72f',
-                'MaterialValueCurrency': 'NCC',
-            },
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': '9788890100fd2191fb065cb0d5e624cb',
-                'TotalVolume': 1.7,
-                'TotalWeight': 1.36,
-                'MaterialName': 'pioneerClothing',
-                'MaterialValue': 0,
-                'MaterialAmount': 68,
-                'MaterialTicker': 'OVE',
-                'MaterialVolume': 0.02500000037252903,
-                'MaterialWeight': 0.019999999552965164,
-                'MaterialCategory': '3f047ec3043bdd795fd7272d6be98799',
-                'MaterialValueCurrency': 'NCC',
-            },
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': '9842ad8d9dfdf8e4c2e80117e7b5ebaf',
-                'TotalVolume': 6.8,
-                'TotalWeight': 6.8,
-                'MaterialName': 'pioneerLuxuryDrink',
-                'MaterialValue': 636.7,
-                'MaterialAmount': 68,
-                'MaterialTicker': 'COF',
-                'MaterialVolume': 0.10000000149011612,
-                'MaterialWeight': 0.10000000149011612,
-                'MaterialCategory': '8a0bd8b6a329c3d632da9da63c818b3d',
-                'MaterialValueCurrency': 'NCC',
-            },
-        ],
-        'AddressableId': 'c91e2dab52906d305311a637e084b999',
-        'VolumeCapacity': 6500,
-        'WeightCapacity': 6500,
-        'UserNameSubmitted': 'SFSCORPIO',
-    },
-    {
-        'Name': 'Hydrogen',
-        'Type': 'SHIP_STORE',
-        'StorageId': '63556c02d9d03a2ff2aa005bac3885f3',
-        'Timestamp': '2026-03-02T15:31:47.378343Z',
-        'VolumeLoad': 0,
-        'WeightLoad': 0,
-        'StorageItems': [],
-        'AddressableId': '09b5c5080f7c1e2c46aff0b66a33bf09',
-        'VolumeCapacity': 1000,
-        'WeightCapacity': 3000,
-        'UserNameSubmitted': 'SFSCORPIO',
-    },
-    {
-        'Name': None,
-        'Type': 'WAREHOUSE_STORE',
-        'StorageId': '6590b6e7c9e416a548e5ad761670c7b2',
-        'Timestamp': '2026-03-02T15:31:47.378343Z',
-        'VolumeLoad': 1316.94,
-        'WeightLoad': 817.88,
-        'StorageItems': [
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': 'b700f9670131981590e77238d7c207d3',
-                'TotalVolume': 4,
-                'TotalWeight': 4,
-                'MaterialName': 'structuralSpacecraftComponent',
-                'MaterialValue': 1952.91,
-                'MaterialAmount': 4,
-                'MaterialTicker': 'SSC',
-                'MaterialVolume': 1,
-                'MaterialWeight': 1,
-                'MaterialCategory': 'd23b9225010ad7978e5496e55359e19b',
-                'MaterialValueCurrency': 'NCC',
-            },
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': 'f3f12b5b3adebdd25f3067e5aa4589f0',
-                'TotalVolume': 790,
-                'TotalWeight': 316,
-                'MaterialName': 'lightweightHullPlate',
-                'MaterialValue': 304520.16,
-                'MaterialAmount': 79,
-                'MaterialTicker': 'LHP',
-                'MaterialVolume': 10,
-                'MaterialWeight': 4,
-                'MaterialCategory': 'd23b9225010ad7978e5496e55359e19b',
-                'MaterialValueCurrency': 'NCC',
-            },
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': '432414a579f1fccd66136b257eb44408',
-                'TotalVolume': 43.9,
-                'TotalWeight': 87.8,
-                'MaterialName': 'fastenerKitMedium',
-                'MaterialValue': 0,
-                'MaterialAmount': 878,
-                'MaterialTicker': 'MFK',
-                'MaterialVolume': 0.05000000074505806,
-                'MaterialWeight': 0.10000000149011612,
-                'MaterialCategory': '5e022d8f199de1c70f8de4dfd2fdef64',
-                'MaterialValueCurrency': 'NCC',
-            },
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': 'c03644ad9e74ee585b1148f608010003',
-                'TotalVolume': 330,
-                'TotalWeight': 297,
-                'MaterialName': 'basicHullPlate',
-                'MaterialValue': 82743.45,
-                'MaterialAmount': 33,
-                'MaterialTicker': 'BHP',
-                'MaterialVolume': 10,
-                'MaterialWeight': 9,
-                'MaterialCategory': 'd23b9225010ad7978e5496e55359e19b',
-                'MaterialValueCurrency': 'NCC',
-            },
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': 'f1d402957a88fd396f302372a6912158',
-                'TotalVolume': 100,
-                'TotalWeight': 15,
-                'MaterialName': 'fluidPiping',
-                'MaterialValue': 0,
-                'MaterialAmount': 50,
-                'MaterialTicker': 'FLP',
-                'MaterialVolume': 2,
-                'MaterialWeight': 0.30000001192092896,
-                'MaterialCategory': 'f8aebc7dd84ce14fae131aa0203d4498',
-                'MaterialValueCurrency': 'NCC',
-            },
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': '24cb7e11e07449e2a6966b92d4ee307d',
-                'TotalVolume': 49.04,
-                'TotalWeight': 98.08,
-                'MaterialName': 'fastenerKitSmall',
-                'MaterialValue': 0,
-                'MaterialAmount': 2452,
-                'MaterialTicker': 'SFK',
-                'MaterialVolume': 0.019999999552965164,
-                'MaterialWeight': 0.03999999910593033,
-                'MaterialCategory': '5e022d8f199de1c70f8de4dfd2fdef64',
-                'MaterialValueCurrency': 'NCC',
-            },
-        ],
-        'AddressableId': '3dcb8cb1af434538a31d927b5afc10e8',
-        'VolumeCapacity': 3000,
-        'WeightCapacity': 3000,
-        'UserNameSubmitted': 'SFSCORPIO',
-    },
-    {
-        'Name': None,
-        'Type': 'WAREHOUSE_STORE',
-        'StorageId': '6692d0681e4c1aab14b1cc7fa0c28249',
-        'Timestamp': '2026-03-02T15:31:47.378343Z',
-        'VolumeLoad': 0,
-        'WeightLoad': 0,
-        'StorageItems': [],
-        'AddressableId': 'd5e09edac5e0f21d66f460c56ddb8094',
-        'VolumeCapacity': 2000,
-        'WeightCapacity': 2000,
-        'UserNameSubmitted': 'SFSCORPIO',
-    },
-    {
-        'Name': 'Selenium',
-        'Type': 'STL_FUEL_STORE',
-        'StorageId': '6805bdf27f75b75574474265bd305cc7',
-        'Timestamp': '2026-03-02T15:31:47.378343Z',
-        'VolumeLoad': 210,
-        'WeightLoad': 210,
-        'StorageItems': [
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': '7756a0779efe67f0f293f41eda4944d4',
-                'TotalVolume': 210,
-                'TotalWeight': 210,
-                'MaterialName': 'stlFuel',
-                'MaterialValue': 10371.68,
-                'MaterialAmount': 3500,
-                'MaterialTicker': 'SF',
-                'MaterialVolume': 0.05999999865889549,
-                'MaterialWeight': 0.05999999865889549,
-                'MaterialCategory': 'ba98fa0cf77040a96cd8a608ad0d08e9',
-                'MaterialValueCurrency': 'NCC',
-            }
-        ],
-        'AddressableId': '4eece2c7f352df023c43b14d65b3237a',
-        'VolumeCapacity': 210,
-        'WeightCapacity': 210,
-        'UserNameSubmitted': 'SFSCORPIO',
-    },
-    {
-        'Name': 'Tellurium',
-        'Type': 'FTL_FUEL_STORE',
-        'StorageId': '6a2874bddf584c2f1335ca2d150b8057',
-        'Timestamp': '2026-03-02T15:31:47.378343Z',
-        'VolumeLoad': 20,
-        'WeightLoad': 100,
-        'StorageItems': [
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': '7a2a12cd6872b89a6b97532618788a4d',
-                'TotalVolume': 20,
-                'TotalWeight': 100,
-                'MaterialName': 'ftlFuel',
-                'MaterialValue': 1,
-                'MaterialAmount': 2000,
-                'MaterialTicker': 'FF',
-                'MaterialVolume': 0.009999999776482582,
-                'MaterialWeight': 0.05000000074505806,
-                'MaterialCategory': 'ba98fa0cf77040a96cd8a608ad0d08e9',
-                'MaterialValueCurrency': 'NCC',
-            }
-        ],
-        'AddressableId': '477742fec32e2b0feb0771bb944696d6',
-        'VolumeCapacity': 20,
-        'WeightCapacity': 100,
-        'UserNameSubmitted': 'SFSCORPIO',
-    },
-    {
-        'Name': 'Calcium',
-        'Type': 'FTL_FUEL_STORE',
-        'StorageId': '6d340b75bb7a41054837a29a755bbbd4',
-        'Timestamp': '2026-03-02T15:31:47.378343Z',
-        'VolumeLoad': 20,
-        'WeightLoad': 100,
-        'StorageItems': [
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': '7a2a12cd6872b89a6b97532618788a4d',
-                'TotalVolume': 20,
-                'TotalWeight': 100,
-                'MaterialName': 'ftlFuel',
-                'MaterialValue': 36042.65,
-                'MaterialAmount': 2000,
-                'MaterialTicker': 'FF',
-                'MaterialVolume': 0.009999999776482582,
-                'MaterialWeight': 0.05000000074505806,
-                'MaterialCategory': 'ba98fa0cf77040a96cd8a608ad0d08e9',
-                'MaterialValueCurrency': 'NCC',
-            }
-        ],
-        'AddressableId': '490df9657539e5eecb445c3ffd2d6cc6',
-        'VolumeCapacity': 20,
-        'WeightCapacity': 100,
-        'UserNameSubmitted': 'SFSCORPIO',
-    },
-    {
-        'Name': 'Cadmium',
-        'Type': 'FTL_FUEL_STORE',
-        'StorageId': '6ee6a3fc5ce3dbaaa15b3075bc60492c',
-        'Timestamp': '2026-03-02T15:31:47.378343Z',
-        'VolumeLoad': 20,
-        'WeightLoad': 100,
-        'StorageItems': [
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': '7a2a12cd6872b89a6b97532618788a4d',
-                'TotalVolume': 20,
-                'TotalWeight': 100,
-                'MaterialName': 'ftlFuel',
-                'MaterialValue': 3966.7,
-                'MaterialAmount': 2000,
-                'MaterialTicker': 'FF',
-                'MaterialVolume': 0.009999999776482582,
-                'MaterialWeight': 0.05000000074505806,
-                'MaterialCategory': 'ba98fa0cf77040a96cd8a608ad0d08e9',
-                'MaterialValueCurrency': 'NCC',
-            }
-        ],
-        'AddressableId': '50dfff773688cc2285e4813a1078a544',
-        'VolumeCapacity': 20,
-        'WeightCapacity': 100,
-        'UserNameSubmitted': 'SFSCORPIO',
-    },
-    {
-        'Name': 'Cobalt',
-        'Type': 'FTL_FUEL_STORE',
-        'StorageId': '6f9f5292857f365bbb37ad0d78dfb9da',
-        'Timestamp': '2026-03-02T15:31:47.378343Z',
-        'VolumeLoad': 8,
-        'WeightLoad': 40,
-        'StorageItems': [
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': '7a2a12cd6872b89a6b97532618788a4d',
-                'TotalVolume': 8,
-                'TotalWeight': 40,
-                'MaterialName': 'ftlFuel',
-                'MaterialValue': 15054.91,
-                'MaterialAmount': 800,
-                'MaterialTicker': 'FF',
-                'MaterialVolume': 0.009999999776482582,
-                'MaterialWeight': 0.05000000074505806,
-                'MaterialCategory': 'ba98fa0cf77040a96cd8a608ad0d08e9',
-                'MaterialValueCurrency': 'NCC',
-            }
-        ],
-        'AddressableId': 'bb606e05994019edd659b35322990904',
-        'VolumeCapacity': 8,
-        'WeightCapacity': 40,
-        'UserNameSubmitted': 'SFSCORPIO',
-    },
-    {
-        'Name': 'Technetium',
-        'Type': 'SHIP_STORE',
-        'StorageId': '712f2f0c4fd87946541800fb171d8d0b',
-        'Timestamp': '2026-03-02T15:31:47.378343Z',
-        'VolumeLoad': 0,
-        'WeightLoad': 0,
-        'StorageItems': [],
-        'AddressableId': '85f6886a99c04bf77317f2e5ab992ffc',
-        'VolumeCapacity': 2000,
-        'WeightCapacity': 2000,
-        'UserNameSubmitted': 'SFSCORPIO',
-    },
-    {
-        'Name': 'Chlorine',
-        'Type': 'FTL_FUEL_STORE',
-        'StorageId': '71609d71f9ebdd01150faecb03d83274',
-        'Timestamp': '2026-03-02T15:31:47.378343Z',
-        'VolumeLoad': 20,
-        'WeightLoad': 100,
-        'StorageItems': [
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': '7a2a12cd6872b89a6b97532618788a4d',
-                'TotalVolume': 20,
-                'TotalWeight': 100,
-                'MaterialName': 'ftlFuel',
-                'MaterialValue': 33923.81,
-                'MaterialAmount': 2000,
-                'MaterialTicker': 'FF',
-                'MaterialVolume': 0.009999999776482582,
-                'MaterialWeight': 0.05000000074505806,
-                'MaterialCategory': 'ba98fa0cf77040a96cd8a608ad0d08e9',
-                'MaterialValueCurrency': 'NCC',
-            }
-        ],
-        'AddressableId': 'b1e1ed9eb0c4841118a99435edfb0c94',
-        'VolumeCapacity': 20,
-        'WeightCapacity': 100,
-        'UserNameSubmitted': 'SFSCORPIO',
-    },
-    {
-        'Name': 'Carbon',
-        'Type': 'STL_FUEL_STORE',
-        'StorageId': '7171a173563d1d57d0a04bf5a36a505f',
-        'Timestamp': '2026-03-02T15:31:47.378343Z',
-        'VolumeLoad': 210,
-        'WeightLoad': 210,
-        'StorageItems': [
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': '7756a0779efe67f0f293f41eda4944d4',
-                'TotalVolume': 210,
-                'TotalWeight': 210,
-                'MaterialName': 'stlFuel',
-                'MaterialValue': 57257.4,
-                'MaterialAmount': 3500,
-                'MaterialTicker': 'SF',
-                'MaterialVolume': 0.05999999865889549,
-                'MaterialWeight': 0.05999999865889549,
-                'MaterialCategory': 'ba98fa0cf77040a96cd8a608ad0d08e9',
-                'MaterialValueCurrency': 'NCC',
-            }
-        ],
-        'AddressableId': '672a6acd3e13304c0d3f7db21244a4cf',
-        'VolumeCapacity': 210,
-        'WeightCapacity': 210,
-        'UserNameSubmitted': 'SFSCORPIO',
-    },
-    {
-        'Name': None,
-        'Type': 'STORE',
-        'StorageId': '717acd5b9d07823754612810c037fce8',
-        'Timestamp': '2026-03-02T15:31:47.378343Z',
-        'VolumeLoad': 1945.008,
-        'WeightLoad': 2175.594,
-        'StorageItems': [
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': '9842ad8d9dfdf8e4c2e80117e7b5ebaf',
-                'TotalVolume': 4.4,
-                'TotalWeight': 4.4,
-                'MaterialName': 'pioneerLuxuryDrink',
-                'MaterialValue': 0,
-                'MaterialAmount': 44,
-                'MaterialTicker': 'COF',
-                'MaterialVolume': 0.10000000149011612,
-                'MaterialWeight': 0.10000000149011612,
-                'MaterialCategory': '8a0bd8b6a329c3d632da9da63c818b3d',
-                'MaterialValueCurrency': 'NCC',
-            },
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': '87dd9b56a69e118e8c778de2dce11e8c',
-                'TotalVolume': 0.4,
-                'TotalWeight': 0.8,
-                'MaterialName': 'settlerClothing',
-                'MaterialValue': 0,
-                'MaterialAmount': 8,
-                'MaterialTicker': 'EXO',
-                'MaterialVolume': 0.05000000074505806,
-                'MaterialWeight': 0.10000000149011612,
-                'MaterialCategory': '3f047ec3043bdd795fd7272d6be98799',
-                'MaterialValueCurrency': 'NCC',
-            },
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': 'a1d1d61f8085de53455dd4e8a7813788',
-                'TotalVolume': 1.5,
-                'TotalWeight': 1.5,
-                'MaterialName': 'settlerLuxuryDrink',
-                'MaterialValue': 14982.94,
-                'MaterialAmount': 15,
-                'MaterialTicker': 'KOM',
-                'MaterialVolume': 0.10000000149011612,
-                'MaterialWeight': 0.10000000149011612,
-                'MaterialCategory': '8a0bd8b6a329c3d632da9da63c818b3d',
-                'MaterialValueCurrency': 'NCC',
-            },
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': '7171933481f022ca74200b216f98ca60',
-                'TotalVolume': 0.008,
-                'TotalWeight': 0.024,
-                'MaterialName': 'settlerLuxuryTools',
-                'MaterialValue': 2745.1,
-                'MaterialAmount': 4,
-                'MaterialTicker': 'REP',
-                'MaterialVolume': 0.0020000000949949026,
-                'MaterialWeight': 0.006000000052154064,
-                'MaterialCategory': '8a0bd8b6a329c3d632da9da63c818b3d',
-                'MaterialValueCurrency': 'NCC',
-            },
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': '4fca6f5b5e6c3b8a1b887c6dc99db146',
-                'TotalVolume': 41.4,
-                'TotalWeight': 41.4,
-                'MaterialName': 'drinkingWater',
-                'MaterialValue': 21174.34,
-                'MaterialAmount': 414,
-                'MaterialTicker': 'DW',
-                'MaterialVolume': 0.10000000149011612,
-                'MaterialWeight': 0.10000000149011612,
-                'MaterialCategory': '3f047ec3043bdd795fd7272d6be98799',
-                'MaterialValueCurrency': 'NCC',
-            },
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': '820d081096fd3e8fbd98b4344f6250ad',
-                'TotalVolume': 0.9,
-                'TotalWeight': 0.9,
-                'MaterialName': 'pioneerLuxuryClothing',
-                'MaterialValue': 6084.76,
-                'MaterialAmount': 18,
-                'MaterialTicker': 'PWO',
-                'MaterialVolume': 0.05000000074505806,
-                'MaterialWeight': 0.05000000074505806,
-                'MaterialCategory': '8a0bd8b6a329c3d632da9da63c818b3d',
-                'MaterialValueCurrency': 'NCC',
-            },
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': 'ec8dbb1d3f51d89c61b6f58fdd64a7f0',
-                'TotalVolume': 176.8,
-                'TotalWeight': 176.8,
-                'MaterialName': 'water',
-                'MaterialValue': 0,
-                'MaterialAmount': 884,
-                'MaterialTicker': 'H2O',
-                'MaterialVolume': 0.20000000298023224,
-                'MaterialWeight': 0.20000000298023224,
-                'MaterialCategory': '473218d3618453bf25d2cd0b5616a72f',
-                'MaterialValueCurrency': 'NCC',
-            },
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': 'd9cfb2948188f49bfae2b6d9972837c8',
-                'TotalVolume': 1066,
-                'TotalWeight': 1279.2,
-                'MaterialName': 'nutrientSolution',
-                'MaterialValue': 0,
-                'MaterialAmount': 2132,
-                'MaterialTicker': 'NS',
-                'MaterialVolume': 0.5,
-                'MaterialWeight': 0.6000000238418579,
-                'MaterialCategory': '9b32ea2333917ee2632ba7ae7675643f',
-                'MaterialValueCurrency': 'NCC',
-            },
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': '1205efe7810a94592524a53e87c3299b',
-                'TotalVolume': 608,
-                'TotalWeight': 577.6,
-                'MaterialName': 'cottonRaw',
-                'MaterialValue': 0,
-                'MaterialAmount': 608,
-                'MaterialTicker': 'RCO',
-                'MaterialVolume': 1,
-                'MaterialWeight': 0.949999988079071,
-                'MaterialCategory': '510e7751c0eb6a51fd0fa73565365d1c',
-                'MaterialValueCurrency': 'NCC',
-            },
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': '83dd61885cf6879ff49fe1419f068f10',
-                'TotalVolume': 42.9,
-                'TotalWeight': 90.09,
-                'MaterialName': 'rations',
-                'MaterialValue': 30217.63,
-                'MaterialAmount': 429,
-                'MaterialTicker': 'RAT',
-                'MaterialVolume': 0.10000000149011612,
-                'MaterialWeight': 0.20999999344348907,
-                'MaterialCategory': '3f047ec3043bdd795fd7272d6be98799',
-                'MaterialValueCurrency': 'NCC',
-            },
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': '9788890100fd2191fb065cb0d5e624cb',
-                'TotalVolume': 1.1,
-                'TotalWeight': 0.88,
-                'MaterialName': 'pioneerClothing',
-                'MaterialValue': 0,
-                'MaterialAmount': 44,
-                'MaterialTicker': 'OVE',
-                'MaterialVolume': 0.02500000037252903,
-                'MaterialWeight': 0.019999999552965164,
-                'MaterialCategory': '3f047ec3043bdd795fd7272d6be98799',
-                'MaterialValueCurrency': 'NCC',
-            },
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': 'b5744244bb7913cee262ec29abc3b9d0',
-                'TotalVolume': 1.6,
-                'TotalWeight': 2,
-                'MaterialName': 'settlerTools',
-                'MaterialValue': 4824.52,
-                'MaterialAmount': 8,
-                'MaterialTicker': 'PT',
-                'MaterialVolume': 0.20000000298023224,
-                'MaterialWeight': 0.25,
-                'MaterialCategory': '3f047ec3043bdd795fd7272d6be98799',
-                'MaterialValueCurrency': 'NCC',
-            },
-        ],
-        'AddressableId': '99a22fb0e16edacbe639800bb19a2e03',
-        'VolumeCapacity': 6500,
-        'WeightCapacity': 6500,
-        'UserNameSubmitted': 'SFSCORPIO',
-    },
-    {
-        'Name': 'Ruthenium',
-        'Type': 'FTL_FUEL_STORE',
-        'StorageId': '7198ec410f48fa47e16d7180971c3e08',
-        'Timestamp': '2026-03-02T15:31:47.378343Z',
-        'VolumeLoad': 20,
-        'WeightLoad': 100,
-        'StorageItems': [
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': '7a2a12cd6872b89a6b97532618788a4d',
-                'TotalVolume': 20,
-                'TotalWeight': 100,
-                'MaterialName': 'ftlFuel',
-                'MaterialValue': 5080.86,
-                'MaterialAmount': 2000,
-                'MaterialTicker': 'FF',
-                'MaterialVolume': 0.009999999776482582,
-                'MaterialWeight': 0.05000000074505806,
-                'MaterialCategory': 'ba98fa0cf77040a96cd8a608ad0d08e9',
-                'MaterialValueCurrency': 'NCC',
-            }
-        ],
-        'AddressableId': 'f3296b313d2f98774a9aeab4a9eb7e59',
-        'VolumeCapacity': 20,
-        'WeightCapacity': 100,
-        'UserNameSubmitted': 'SFSCORPIO',
-    },
-    {
-        'Name': 'Indium',
-        'Type': 'FTL_FUEL_STORE',
-        'StorageId': '7339c77033e4f92008fd80f74484ea21',
-        'Timestamp': '2026-03-02T15:31:47.378343Z',
-        'VolumeLoad': 16.68,
-        'WeightLoad': 83.4,
-        'StorageItems': [
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': '7a2a12cd6872b89a6b97532618788a4d',
-                'TotalVolume': 16.68,
-                'TotalWeight': 83.4,
-                'MaterialName': 'ftlFuel',
-                'MaterialValue': 484.55,
-                'MaterialAmount': 1668,
-                'MaterialTicker': 'FF',
-                'MaterialVolume': 0.009999999776482582,
-                'MaterialWeight': 0.05000000074505806,
-                'MaterialCategory': 'ba98fa0cf77040a96cd8a608ad0d08e9',
-                'MaterialValueCurrency': 'NCC',
-            }
-        ],
-        'AddressableId': 'd3e384b2c5135773788e17e193a17690',
-        'VolumeCapacity': 20,
-        'WeightCapacity': 100,
-        'UserNameSubmitted': 'SFSCORPIO',
-    },
-    {
-        'Name': 'Iron',
-        'Type': 'FTL_FUEL_STORE',
-        'StorageId': '74fa6a8d921433da3eba6bdd64c33d5a',
-        'Timestamp': '2026-03-02T15:31:47.378343Z',
-        'VolumeLoad': 20,
-        'WeightLoad': 100,
-        'StorageItems': [
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': '7a2a12cd6872b89a6b97532618788a4d',
-                'TotalVolume': 20,
-                'TotalWeight': 100,
-                'MaterialName': 'ftlFuel',
-                'MaterialValue': 34555.15,
-                'MaterialAmount': 2000,
-                'MaterialTicker': 'FF',
-                'MaterialVolume': 0.009999999776482582,
-                'MaterialWeight': 0.05000000074505806,
-                'MaterialCategory': 'ba98fa0cf77040a96cd8a608ad0d08e9',
-                'MaterialValueCurrency': 'NCC',
-            }
-        ],
-        'AddressableId': 'd1f8c4e5ba748868f93811eb9e3e967e',
-        'VolumeCapacity': 20,
-        'WeightCapacity': 100,
-        'UserNameSubmitted': 'SFSCORPIO',
-    },
-    {
-        'Name': 'Titanium',
-        'Type': 'SHIP_STORE',
-        'StorageId': '76fa7ab2ab52b936f8d52a02cf015df9',
-        'Timestamp': '2026-03-02T15:31:47.378343Z',
-        'VolumeLoad': 0,
-        'WeightLoad': 0,
-        'StorageItems': [],
-        'AddressableId': '22f309cda9d4e088545376dd40bc4b9f',
-        'VolumeCapacity': 2000,
-        'WeightCapacity': 2000,
-        'UserNameSubmitted': 'SFSCORPIO',
-    },
-    {
-        'Name': 'Arsenic',
-        'Type': 'FTL_FUEL_STORE',
-        'StorageId': '7883dec2455007404ae87b1e755a6617',
-        'Timestamp': '2026-03-02T15:31:47.378343Z',
-        'VolumeLoad': 7.58,
-        'WeightLoad': 37.9,
-        'StorageItems': [
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': '7a2a12cd6872b89a6b97532618788a4d',
-                'TotalVolume': 7.58,
-                'TotalWeight': 37.9,
-                'MaterialName': 'ftlFuel',
-                'MaterialValue': 15142.29,
-                'MaterialAmount': 758,
-                'MaterialTicker': 'FF',
-                'MaterialVolume': 0.009999999776482582,
-                'MaterialWeight': 0.05000000074505806,
-                'MaterialCategory': 'ba98fa0cf77040a96cd8a608ad0d08e9',
-                'MaterialValueCurrency': 'NCC',
-            }
-        ],
-        'AddressableId': 'a4f8006868f4836fec0a3385304f243c',
-        'VolumeCapacity': 8,
-        'WeightCapacity': 40,
-        'UserNameSubmitted': 'SFSCORPIO',
-    },
-    {
-        'Name': 'Fluorine',
-        'Type': 'STL_FUEL_STORE',
-        'StorageId': '794ce655d60e4fd53b3157dfc3b50f4e',
-        'Timestamp': '2026-03-02T15:31:47.378343Z',
-        'VolumeLoad': 210,
-        'WeightLoad': 210,
-        'StorageItems': [
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': '7756a0779efe67f0f293f41eda4944d4',
-                'TotalVolume': 210,
-                'TotalWeight': 210,
-                'MaterialName': 'stlFuel',
-                'MaterialValue': 54750.82,
-                'MaterialAmount': 3500,
-                'MaterialTicker': 'SF',
-                'MaterialVolume': 0.05999999865889549,
-                'MaterialWeight': 0.05999999865889549,
-                'MaterialCategory': 'ba98fa0cf77040a96cd8a608ad0d08e9',
-                'MaterialValueCurrency': 'NCC',
-            }
-        ],
-        'AddressableId': '95a21e5c9e8a1e14cf93394a1e48d3d9',
-        'VolumeCapacity': 210,
-        'WeightCapacity': 210,
-        'UserNameSubmitted': 'SFSCORPIO',
-    },
-    {
-        'Name': 'Fluorine',
-        'Type': 'FTL_FUEL_STORE',
-        'StorageId': '7adb092655a6b928bfdcf27edd6968ea',
-        'Timestamp': '2026-03-02T15:31:47.378343Z',
-        'VolumeLoad': 20,
-        'WeightLoad': 100,
-        'StorageItems': [
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': '7a2a12cd6872b89a6b97532618788a4d',
-                'TotalVolume': 20,
-                'TotalWeight': 100,
-                'MaterialName': 'ftlFuel',
-                'MaterialValue': 35431.38,
-                'MaterialAmount': 2000,
-                'MaterialTicker': 'FF',
-                'MaterialVolume': 0.009999999776482582,
-                'MaterialWeight': 0.05000000074505806,
-                'MaterialCategory': 'ba98fa0cf77040a96cd8a608ad0d08e9',
-                'MaterialValueCurrency': 'NCC',
-            }
-        ],
-        'AddressableId': '95a21e5c9e8a1e14cf93394a1e48d3d9',
-        'VolumeCapacity': 20,
-        'WeightCapacity': 100,
-        'UserNameSubmitted': 'SFSCORPIO',
-    },
-    {
-        'Name': 'Silver',
-        'Type': 'SHIP_STORE',
-        'StorageId': '7b3b86a1d64cd3ecc97cf0573dbe1a80',
-        'Timestamp': '2026-03-02T15:31:47.378343Z',
-        'VolumeLoad': 0,
-        'WeightLoad': 0,
-        'StorageItems': [],
-        'AddressableId': '4dadd0112370ca4b4c141d95c6a8cf21',
-        'VolumeCapacity': 2000,
-        'WeightCapacity': 2000,
-        'UserNameSubmitted': 'SFSCORPIO',
-    },
-    {
-        'Name': 'Tellurium',
-        'Type': 'SHIP_STORE',
-        'StorageId': '7ba3ebb28b24de18804ad1d773fccf00',
-        'Timestamp': '2026-03-02T15:31:47.378343Z',
-        'VolumeLoad': 0,
-        'WeightLoad': 0,
-        'StorageItems': [],
-        'AddressableId': '477742fec32e2b0feb0771bb944696d6',
-        'VolumeCapacity': 2000,
-        'WeightCapacity': 2000,
-        'UserNameSubmitted': 'SFSCORPIO',
-    },
-    {
-        'Name': 'Selenium',
-        'Type': 'FTL_FUEL_STORE',
-        'StorageId': '7c6300b08e172d5c4e32aab24dab4072',
-        'Timestamp': '2026-03-02T15:31:47.378343Z',
-        'VolumeLoad': 20,
-        'WeightLoad': 100,
-        'StorageItems': [
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': '7a2a12cd6872b89a6b97532618788a4d',
-                'TotalVolume': 20,
-                'TotalWeight': 100,
-                'MaterialName': 'ftlFuel',
-                'MaterialValue': 12910.93,
-                'MaterialAmount': 2000,
-                'MaterialTicker': 'FF',
-                'MaterialVolume': 0.009999999776482582,
-                'MaterialWeight': 0.05000000074505806,
-                'MaterialCategory': 'ba98fa0cf77040a96cd8a608ad0d08e9',
-                'MaterialValueCurrency': 'NCC',
-            }
-        ],
-        'AddressableId': '4eece2c7f352df023c43b14d65b3237a',
-        'VolumeCapacity': 20,
-        'WeightCapacity': 100,
-        'UserNameSubmitted': 'SFSCORPIO',
-    },
-    {
-        'Name': 'Neon',
-        'Type': 'FTL_FUEL_STORE',
-        'StorageId': '7e1fb462121ed3838e58f3a2b768bd4d',
-        'Timestamp': '2026-03-02T15:31:47.378343Z',
-        'VolumeLoad': 20,
-        'WeightLoad': 100,
-        'StorageItems': [
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': '7a2a12cd6872b89a6b97532618788a4d',
-                'TotalVolume': 20,
-                'TotalWeight': 100,
-                'MaterialName': 'ftlFuel',
-                'MaterialValue': 34035.88,
-                'MaterialAmount': 2000,
-                'MaterialTicker': 'FF',
-                'MaterialVolume': 0.009999999776482582,
-                'MaterialWeight': 0.05000000074505806,
-                'MaterialCategory': 'ba98fa0cf77040a96cd8a608ad0d08e9',
-                'MaterialValueCurrency': 'NCC',
-            }
-        ],
-        'AddressableId': 'b87025991fbc969ce70f9210caa51110',
-        'VolumeCapacity': 20,
-        'WeightCapacity': 100,
-        'UserNameSubmitted': 'SFSCORPIO',
-    },
-    {
-        'Name': 'Manganese',
-        'Type': 'SHIP_STORE',
-        'StorageId': '7eb744a18c6668e822157a88712f5875',
-        'Timestamp': '2026-03-02T15:31:47.378343Z',
-        'VolumeLoad': 0,
-        'WeightLoad': 0,
-        'StorageItems': [],
-        'AddressableId': '3528adb0e89f733b199363da3ed8aa1b',
-        'VolumeCapacity': 2000,
-        'WeightCapacity': 2000,
-        'UserNameSubmitted': 'SFSCORPIO',
-    },
-    {
-        'Name': '53 Iodine',
-        'Type': 'SHIP_STORE',
-        'StorageId': '7ec07f84e2dd177e794d32fab0e4f1e3',
-        'Timestamp': '2026-03-02T15:31:47.378343Z',
-        'VolumeLoad': 0,
-        'WeightLoad': 0,
-        'StorageItems': [],
-        'AddressableId': '0f99161e9049c837a4c72956502dd9a3',
-        'VolumeCapacity': 2000,
-        'WeightCapacity': 2000,
-        'UserNameSubmitted': 'SFSCORPIO',
-    },
-    {
-        'Name': 'Nitrogen',
-        'Type': 'FTL_FUEL_STORE',
-        'StorageId': '7f1162ec905d640139034486ee73bb10',
-        'Timestamp': '2026-03-02T15:31:47.378343Z',
-        'VolumeLoad': 20,
-        'WeightLoad': 100,
-        'StorageItems': [
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': '7a2a12cd6872b89a6b97532618788a4d',
-                'TotalVolume': 20,
-                'TotalWeight': 100,
-                'MaterialName': 'ftlFuel',
-                'MaterialValue': 34585.44,
-                'MaterialAmount': 2000,
-                'MaterialTicker': 'FF',
-                'MaterialVolume': 0.009999999776482582,
-                'MaterialWeight': 0.05000000074505806,
-                'MaterialCategory': 'ba98fa0cf77040a96cd8a608ad0d08e9',
-                'MaterialValueCurrency': 'NCC',
-            }
-        ],
-        'AddressableId': 'f42fa27da9ff072f8cb8c90d87aa0727',
-        'VolumeCapacity': 20,
-        'WeightCapacity': 100,
-        'UserNameSubmitted': 'SFSCORPIO',
-    },
-    {
-        'Name': 'Cobalt',
-        'Type': 'STL_FUEL_STORE',
-        'StorageId': '7f79b88b9406192a4459213a0541afb1',
-        'Timestamp': '2026-03-02T15:31:47.378343Z',
-        'VolumeLoad': 210,
-        'WeightLoad': 210,
-        'StorageItems': [
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': '7756a0779efe67f0f293f41eda4944d4',
-                'TotalVolume': 210,
-                'TotalWeight': 210,
-                'MaterialName': 'stlFuel',
-                'MaterialValue': 57195.86,
-                'MaterialAmount': 3500,
-                'MaterialTicker': 'SF',
-                'MaterialVolume': 0.05999999865889549,
-                'MaterialWeight': 0.05999999865889549,
-                'MaterialCategory': 'ba98fa0cf77040a96cd8a608ad0d08e9',
-                'MaterialValueCurrency': 'NCC',
-            }
-        ],
-        'AddressableId': 'bb606e05994019edd659b35322990904',
-        'VolumeCapacity': 210,
-        'WeightCapacity': 210,
-        'UserNameSubmitted': 'SFSCORPIO',
-    },
-    {
-        'Name': 'Tin',
-        'Type': 'FTL_FUEL_STORE',
-        'StorageId': '7facd06c6743c71a5dc5dbf46fc7e634',
-        'Timestamp': '2026-03-02T15:31:47.378343Z',
-        'VolumeLoad': 20,
-        'WeightLoad': 100,
-        'StorageItems': [
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': '7a2a12cd6872b89a6b97532618788a4d',
-                'TotalVolume': 20,
-                'TotalWeight': 100,
-                'MaterialName': 'ftlFuel',
-                'MaterialValue': 1,
-                'MaterialAmount': 2000,
-                'MaterialTicker': 'FF',
-                'MaterialVolume': 0.009999999776482582,
-                'MaterialWeight': 0.05000000074505806,
-                'MaterialCategory': 'ba98fa0cf77040a96cd8a608ad0d08e9',
-                'MaterialValueCurrency': 'NCC',
-            }
-        ],
-        'AddressableId': '88722534103087695b5daf5321cc2281',
-        'VolumeCapacity': 20,
-        'WeightCapacity': 100,
-        'UserNameSubmitted': 'SFSCORPIO',
-    },
-    {
-        'Name': 'Helium',
-        'Type': 'STL_FUEL_STORE',
-        'StorageId': '815cbfb9ad7b2be3362e7eea60dce675',
-        'Timestamp': '2026-03-02T15:31:47.378343Z',
-        'VolumeLoad': 90,
-        'WeightLoad': 90,
-        'StorageItems': [
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': '7756a0779efe67f0f293f41eda4944d4',
-                'TotalVolume': 90,
-                'TotalWeight': 90,
-                'MaterialName': 'stlFuel',
-                'MaterialValue': 24784.08,
-                'MaterialAmount': 1500,
-                'MaterialTicker': 'SF',
-                'MaterialVolume': 0.05999999865889549,
-                'MaterialWeight': 0.05999999865889549,
-                'MaterialCategory': 'ba98fa0cf77040a96cd8a608ad0d08e9',
-                'MaterialValueCurrency': 'NCC',
-            }
-        ],
-        'AddressableId': '5c24c3953be8753479b742a05b162ffa',
-        'VolumeCapacity': 90,
-        'WeightCapacity': 90,
-        'UserNameSubmitted': 'SFSCORPIO',
-    },
-    {
-        'Name': None,
-        'Type': 'STORE',
-        'StorageId': '822c66c5f9d227fb1b3138031e56e429',
-        'Timestamp': '2026-03-02T15:31:47.378343Z',
-        'VolumeLoad': 473.9,
-        'WeightLoad': 547.88,
-        'StorageItems': [
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': 'd6c283d4480cacbca31bec0bbb55b940',
-                'TotalVolume': 1.05,
-                'TotalWeight': 1.05,
-                'MaterialName': 'scientistClothing',
-                'MaterialValue': 134597.94,
-                'MaterialAmount': 21,
-                'MaterialTicker': 'LC',
-                'MaterialVolume': 0.05000000074505806,
-                'MaterialWeight': 0.05000000074505806,
-                'MaterialCategory': '3f047ec3043bdd795fd7272d6be98799',
-                'MaterialValueCurrency': 'NCC',
-            },
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': '5d36829593b5fd61674320cd66e4bb5c',
-                'TotalVolume': 5,
-                'TotalWeight': 15,
-                'MaterialName': 'technicianHealth',
-                'MaterialValue': 150736.56,
-                'MaterialAmount': 50,
-                'MaterialTicker': 'MED',
-                'MaterialVolume': 0.10000000149011612,
-                'MaterialWeight': 0.30000001192092896,
-                'MaterialCategory': '3f047ec3043bdd795fd7272d6be98799',
-                'MaterialValueCurrency': 'NCC',
-            },
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': 'a5de3e325e87c874fe395949728bb276',
-                'TotalVolume': 350.5,
-                'TotalWeight': 420.6,
-                'MaterialName': 'scientistFood',
-                'MaterialValue': 0.03,
-                'MaterialAmount': 701,
-                'MaterialTicker': 'MEA',
-                'MaterialVolume': 0.5,
-                'MaterialWeight': 0.6000000238418579,
-                'MaterialCategory': '3f047ec3043bdd795fd7272d6be98799',
-                'MaterialValueCurrency': 'NCC',
-            },
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': 'a4eeeb1b4c85b0637cfa7ca0a47c78d6',
-                'TotalVolume': 6,
-                'TotalWeight': 0.6,
-                'MaterialName': 'scientistTools',
-                'MaterialValue': 99324.07,
-                'MaterialAmount': 12,
-                'MaterialTicker': 'WS',
-                'MaterialVolume': 0.5,
-                'MaterialWeight': 0.05000000074505806,
-                'MaterialCategory': '3f047ec3043bdd795fd7272d6be98799',
-                'MaterialValueCurrency': 'NCC',
-            },
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': '4fca6f5b5e6c3b8a1b887c6dc99db146',
-                'TotalVolume': 100,
-                'TotalWeight': 100,
-                'MaterialName': 'drinkingWater',
-                'MaterialValue': 26652.25,
-                'MaterialAmount': 1000,
-                'MaterialTicker': 'DW',
-                'MaterialVolume': 0.10000000149011612,
-                'MaterialWeight': 0.10000000149011612,
-                'MaterialCategory': '3f047ec3043bdd795fd7272d6be98799',
-                'MaterialValueCurrency': 'NCC',
-            },
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': '9030ca612b7a761bc458240461fc8057',
-                'TotalVolume': 10,
-                'TotalWeight': 10,
-                'MaterialName': 'scientistLuxuryDrink',
-                'MaterialValue': 693925.75,
-                'MaterialAmount': 100,
-                'MaterialTicker': 'WIN',
-                'MaterialVolume': 0.10000000149011612,
-                'MaterialWeight': 0.10000000149011612,
-                'MaterialCategory': '8a0bd8b6a329c3d632da9da63c818b3d',
-                'MaterialValueCurrency': 'NCC',
-            },
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': '5cd2b3729f1de46d80cbf7300c905bef',
-                'TotalVolume': 0.8,
-                'TotalWeight': 0.08,
-                'MaterialName': 'informationDataCore',
-                'MaterialValue': 0,
-                'MaterialAmount': 80,
-                'MaterialTicker': 'IDC',
-                'MaterialVolume': 0.009999999776482582,
-                'MaterialWeight': 0.0010000000474974513,
-                'MaterialCategory': '9e8bc2a092cc3361b6949eca3e95921a',
-                'MaterialValueCurrency': 'NCC',
-            },
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': 'a636755a8531daa76ab6b1f95fd5d5e3',
-                'TotalVolume': 0.55,
-                'TotalWeight': 0.55,
-                'MaterialName': 'scientistLuxuryHealth',
-                'MaterialValue': 18949.75,
-                'MaterialAmount': 11,
-                'MaterialTicker': 'NST',
-                'MaterialVolume': 0.05000000074505806,
-                'MaterialWeight': 0.05000000074505806,
-                'MaterialCategory': '8a0bd8b6a329c3d632da9da63c818b3d',
-                'MaterialValueCurrency': 'NCC',
-            },
-        ],
-        'AddressableId': '60f8b6e22ed1e68b19cd5d0c3e3387fb',
-        'VolumeCapacity': 1500,
-        'WeightCapacity': 1500,
-        'UserNameSubmitted': 'SFSCORPIO',
-    },
-    {
-        'Name': 'Aluminium',
-        'Type': 'STL_FUEL_STORE',
-        'StorageId': '8354ac18f5ac71ffd54f4a549d0dd4ac',
-        'Timestamp': '2026-03-02T15:31:47.378343Z',
-        'VolumeLoad': 171.84,
-        'WeightLoad': 171.84,
-        'StorageItems': [
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': '7756a0779efe67f0f293f41eda4944d4',
-                'TotalVolume': 171.84,
-                'TotalWeight': 171.84,
-                'MaterialName': 'stlFuel',
-                'MaterialValue': 48134.16,
-                'MaterialAmount': 2864,
-                'MaterialTicker': 'SF',
-                'MaterialVolume': 0.05999999865889549,
-                'MaterialWeight': 0.05999999865889549,
-                'MaterialCategory': 'ba98fa0cf77040a96cd8a608ad0d08e9',
-                'MaterialValueCurrency': 'NCC',
-            }
-        ],
-        'AddressableId': 'e641f1296919ffdea8f19f5e48db1b42',
-        'VolumeCapacity': 210,
-        'WeightCapacity': 210,
-        'UserNameSubmitted': 'SFSCORPIO',
-    },
-    {
-        'Name': 'Sodium',
-        'Type': 'FTL_FUEL_STORE',
-        'StorageId': '837d78f6ae34687eaba7bc28bb089eb0',
-        'Timestamp': '2026-03-02T15:31:47.378343Z',
-        'VolumeLoad': 20,
-        'WeightLoad': 100,
-        'StorageItems': [
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': '7a2a12cd6872b89a6b97532618788a4d',
-                'TotalVolume': 20,
-                'TotalWeight': 100,
-                'MaterialName': 'ftlFuel',
-                'MaterialValue': 34282.2,
-                'MaterialAmount': 2000,
-                'MaterialTicker': 'FF',
-                'MaterialVolume': 0.009999999776482582,
-                'MaterialWeight': 0.05000000074505806,
-                'MaterialCategory': 'ba98fa0cf77040a96cd8a608ad0d08e9',
-                'MaterialValueCurrency': 'NCC',
-            }
-        ],
-        'AddressableId': 'dcad2c65b4b05a1a75f005d912a25ff6',
-        'VolumeCapacity': 20,
-        'WeightCapacity': 100,
-        'UserNameSubmitted': 'SFSCORPIO',
-    },
-    {
-        'Name': 'Potassium',
-        'Type': 'SHIP_STORE',
-        'StorageId': '83c050cd64fae115977ecc6172e371df',
-        'Timestamp': '2026-03-02T15:31:47.378343Z',
-        'VolumeLoad': 0,
-        'WeightLoad': 0,
-        'StorageItems': [],
-        'AddressableId': 'd971f7b29931540f77302c4c72a0a07e',
-        'VolumeCapacity': 2000,
-        'WeightCapacity': 2000,
-        'UserNameSubmitted': 'SFSCORPIO',
-    },
-    {
-        'Name': 'Palladium',
-        'Type': 'STL_FUEL_STORE',
-        'StorageId': '85b9462b5bc03c0f314823ab859c9264',
-        'Timestamp': '2026-03-02T15:31:47.378343Z',
-        'VolumeLoad': 210,
-        'WeightLoad': 210,
-        'StorageItems': [
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': '7756a0779efe67f0f293f41eda4944d4',
-                'TotalVolume': 210,
-                'TotalWeight': 210,
-                'MaterialName': 'stlFuel',
-                'MaterialValue': 1124.26,
-                'MaterialAmount': 3500,
-                'MaterialTicker': 'SF',
-                'MaterialVolume': 0.05999999865889549,
-                'MaterialWeight': 0.05999999865889549,
-                'MaterialCategory': 'ba98fa0cf77040a96cd8a608ad0d08e9',
-                'MaterialValueCurrency': 'NCC',
-            }
-        ],
-        'AddressableId': '3e8a23cf3dc8fe97f89f20dbdc992a28',
-        'VolumeCapacity': 210,
-        'WeightCapacity': 210,
-        'UserNameSubmitted': 'SFSCORPIO',
-    },
-    {
-        'Name': 'Sulfur',
-        'Type': 'STL_FUEL_STORE',
-        'StorageId': '88d5947230155d6e1a15abfb79d76ad8',
-        'Timestamp': '2026-03-02T15:31:47.378343Z',
-        'VolumeLoad': 210,
-        'WeightLoad': 210,
-        'StorageItems': [
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': '7756a0779efe67f0f293f41eda4944d4',
-                'TotalVolume': 210,
-                'TotalWeight': 210,
-                'MaterialName': 'stlFuel',
-                'MaterialValue': 47197.55,
-                'MaterialAmount': 3500,
-                'MaterialTicker': 'SF',
-                'MaterialVolume': 0.05999999865889549,
-                'MaterialWeight': 0.05999999865889549,
-                'MaterialCategory': 'ba98fa0cf77040a96cd8a608ad0d08e9',
-                'MaterialValueCurrency': 'NCC',
-            }
-        ],
-        'AddressableId': '8d18fa846e0bb56da7fcb8a01e5ba4a2',
-        'VolumeCapacity': 210,
-        'WeightCapacity': 210,
-        'UserNameSubmitted': 'SFSCORPIO',
-    },
-    {
-        'Name': 'Sulfur',
-        'Type': 'FTL_FUEL_STORE',
-        'StorageId': '8c0e783e69bd3c20de6f449e3dff149a',
-        'Timestamp': '2026-03-02T15:31:47.378343Z',
-        'VolumeLoad': 20,
-        'WeightLoad': 100,
-        'StorageItems': [
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': '7a2a12cd6872b89a6b97532618788a4d',
-                'TotalVolume': 20,
-                'TotalWeight': 100,
-                'MaterialName': 'ftlFuel',
-                'MaterialValue': 36062.54,
-                'MaterialAmount': 2000,
-                'MaterialTicker': 'FF',
-                'MaterialVolume': 0.009999999776482582,
-                'MaterialWeight': 0.05000000074505806,
-                'MaterialCategory': 'ba98fa0cf77040a96cd8a608ad0d08e9',
-                'MaterialValueCurrency': 'NCC',
-            }
-        ],
-        'AddressableId': '8d18fa846e0bb56da7fcb8a01e5ba4a2',
-        'VolumeCapacity': 20,
-        'WeightCapacity': 100,
-        'UserNameSubmitted': 'SFSCORPIO',
-    },
-    {
-        'Name': 'Lithium',
-        'Type': 'SHIP_STORE',
-        'StorageId': '8ca3bc50f316cfda8f63e5dd3373e52d',
-        'Timestamp': '2026-03-02T15:31:47.378343Z',
-        'VolumeLoad': 0,
-        'WeightLoad': 0,
-        'StorageItems': [],
-        'AddressableId': 'bb42c6e0de182b7d86dc35b61b8bf9b9',
-        'VolumeCapacity': 2000,
-        'WeightCapacity': 2000,
-        'UserNameSubmitted': 'SFSCORPIO',
-    },
-    {
-        'Name': 'Chromium',
-        'Type': 'FTL_FUEL_STORE',
-        'StorageId': '91447e553ee5cbee650dce8c8f8534f6',
-        'Timestamp': '2026-03-02T15:31:47.378343Z',
-        'VolumeLoad': 20,
-        'WeightLoad': 100,
-        'StorageItems': [
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': '7a2a12cd6872b89a6b97532618788a4d',
-                'TotalVolume': 20,
-                'TotalWeight': 100,
-                'MaterialName': 'ftlFuel',
-                'MaterialValue': 35237.62,
-                'MaterialAmount': 2000,
-                'MaterialTicker': 'FF',
-                'MaterialVolume': 0.009999999776482582,
-                'MaterialWeight': 0.05000000074505806,
-                'MaterialCategory': 'ba98fa0cf77040a96cd8a608ad0d08e9',
-                'MaterialValueCurrency': 'NCC',
-            }
-        ],
-        'AddressableId': 'd95ef01aead4472e8dce94cdab8aeccb',
-        'VolumeCapacity': 20,
-        'WeightCapacity': 100,
-        'UserNameSubmitted': 'SFSCORPIO',
-    },
-    {
-        'Name': 'Manganese',
-        'Type': 'FTL_FUEL_STORE',
-        'StorageId': '9145bd9150d93f38d5a5c01d9f729ebd',
-        'Timestamp': '2026-03-02T15:31:47.378343Z',
-        'VolumeLoad': 20,
-        'WeightLoad': 100,
-        'StorageItems': [
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': '7a2a12cd6872b89a6b97532618788a4d',
-                'TotalVolume': 20,
-                'TotalWeight': 100,
-                'MaterialName': 'ftlFuel',
-                'MaterialValue': 34514.41,
-                'MaterialAmount': 2000,
-                'MaterialTicker': 'FF',
-                'MaterialVolume': 0.009999999776482582,
-                'MaterialWeight': 0.05000000074505806,
-                'MaterialCategory': 'ba98fa0cf77040a96cd8a608ad0d08e9',
-                'MaterialValueCurrency': 'NCC',
-            }
-        ],
-        'AddressableId': '3528adb0e89f733b199363da3ed8aa1b',
-        'VolumeCapacity': 20,
-        'WeightCapacity': 100,
-        'UserNameSubmitted': 'SFSCORPIO',
-    },
-    {
-        'Name': 'Gallium',
-        'Type': 'FTL_FUEL_STORE',
-        'StorageId': '921a8bcd869a26bb38e9146eecf19449',
-        'Timestamp': '2026-03-02T15:31:47.378343Z',
-        'VolumeLoad': 8,
-        'WeightLoad': 40,
-        'StorageItems': [
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': '7a2a12cd6872b89a6b97532618788a4d',
-                'TotalVolume': 8,
-                'TotalWeight': 40,
-                'MaterialName': 'ftlFuel',
-                'MaterialValue': 14716.72,
-                'MaterialAmount': 800,
-                'MaterialTicker': 'FF',
-                'MaterialVolume': 0.009999999776482582,
-                'MaterialWeight': 0.05000000074505806,
-                'MaterialCategory': 'ba98fa0cf77040a96cd8a608ad0d08e9',
-                'MaterialValueCurrency': 'NCC',
-            }
-        ],
-        'AddressableId': 'c314789df16a9920317a230ef7e9ac66',
-        'VolumeCapacity': 8,
-        'WeightCapacity': 40,
-        'UserNameSubmitted': 'SFSCORPIO',
-    },
-    {
-        'Name': 'Chlorine',
-        'Type': 'SHIP_STORE',
-        'StorageId': '92241d817b3f05f58e9c31c895bdcce5',
-        'Timestamp': '2026-03-02T15:31:47.378343Z',
-        'VolumeLoad': 0,
-        'WeightLoad': 0,
-        'StorageItems': [],
-        'AddressableId': 'b1e1ed9eb0c4841118a99435edfb0c94',
-        'VolumeCapacity': 2000,
-        'WeightCapacity': 2000,
-        'UserNameSubmitted': 'SFSCORPIO',
-    },
-    {
-        'Name': 'Silver',
-        'Type': 'STL_FUEL_STORE',
-        'StorageId': '924a55f6bf81567832186424803a7a21',
-        'Timestamp': '2026-03-02T15:31:47.378343Z',
-        'VolumeLoad': 210,
-        'WeightLoad': 210,
-        'StorageItems': [
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': '7756a0779efe67f0f293f41eda4944d4',
-                'TotalVolume': 210,
-                'TotalWeight': 210,
-                'MaterialName': 'stlFuel',
-                'MaterialValue': 1178.61,
-                'MaterialAmount': 3500,
-                'MaterialTicker': 'SF',
-                'MaterialVolume': 0.05999999865889549,
-                'MaterialWeight': 0.05999999865889549,
-                'MaterialCategory': 'ba98fa0cf77040a96cd8a608ad0d08e9',
-                'MaterialValueCurrency': 'NCC',
-            }
-        ],
-        'AddressableId': '4dadd0112370ca4b4c141d95c6a8cf21',
-        'VolumeCapacity': 210,
-        'WeightCapacity': 210,
-        'UserNameSubmitted': 'SFSCORPIO',
-    },
-    {
-        'Name': 'Niobium',
-        'Type': 'FTL_FUEL_STORE',
-        'StorageId': '9463365586538c290b4462caff23c1d3',
-        'Timestamp': '2026-03-02T15:31:47.378343Z',
-        'VolumeLoad': 20,
-        'WeightLoad': 100,
-        'StorageItems': [
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': '7a2a12cd6872b89a6b97532618788a4d',
-                'TotalVolume': 20,
-                'TotalWeight': 100,
-                'MaterialName': 'ftlFuel',
-                'MaterialValue': 1,
-                'MaterialAmount': 2000,
-                'MaterialTicker': 'FF',
-                'MaterialVolume': 0.009999999776482582,
-                'MaterialWeight': 0.05000000074505806,
-                'MaterialCategory': 'ba98fa0cf77040a96cd8a608ad0d08e9',
-                'MaterialValueCurrency': 'NCC',
-            }
-        ],
-        'AddressableId': 'e0e7cb8ce2b0c29c6d6f12f7a9409994',
-        'VolumeCapacity': 20,
-        'WeightCapacity': 100,
-        'UserNameSubmitted': 'SFSCORPIO',
-    },
-    {
-        'Name': 'Rhodium',
-        'Type': 'SHIP_STORE',
-        'StorageId': '95d557b20aa9a8d218204a84b6d7d6c2',
-        'Timestamp': '2026-03-02T15:31:47.378343Z',
-        'VolumeLoad': 0,
-        'WeightLoad': 0,
-        'StorageItems': [],
-        'AddressableId': '978f94d7689f3e77ea90bdc438ab9024',
-        'VolumeCapacity': 2000,
-        'WeightCapacity': 2000,
-        'UserNameSubmitted': 'SFSCORPIO',
-    },
-    {
-        'Name': 'Carbon',
-        'Type': 'FTL_FUEL_STORE',
-        'StorageId': '960e8bbc0773d3b903a5404a07004e00',
-        'Timestamp': '2026-03-02T15:31:47.378343Z',
-        'VolumeLoad': 8,
-        'WeightLoad': 40,
-        'StorageItems': [
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': '7a2a12cd6872b89a6b97532618788a4d',
-                'TotalVolume': 8,
-                'TotalWeight': 40,
-                'MaterialName': 'ftlFuel',
-                'MaterialValue': 14885.68,
-                'MaterialAmount': 800,
-                'MaterialTicker': 'FF',
-                'MaterialVolume': 0.009999999776482582,
-                'MaterialWeight': 0.05000000074505806,
-                'MaterialCategory': 'ba98fa0cf77040a96cd8a608ad0d08e9',
-                'MaterialValueCurrency': 'NCC',
-            }
-        ],
-        'AddressableId': '672a6acd3e13304c0d3f7db21244a4cf',
-        'VolumeCapacity': 8,
-        'WeightCapacity': 40,
-        'UserNameSubmitted': 'SFSCORPIO',
-    },
-    {
-        'Name': 'Calcium',
-        'Type': 'SHIP_STORE',
-        'StorageId': '963ef57a155122f81dc8e9ae85a1cc8e',
-        'Timestamp': '2026-03-02T15:31:47.378343Z',
-        'VolumeLoad': 0,
-        'WeightLoad': 0,
-        'StorageItems': [],
-        'AddressableId': '490df9657539e5eecb445c3ffd2d6cc6',
-        'VolumeCapacity': 2000,
-        'WeightCapacity': 2000,
-        'UserNameSubmitted': 'SFSCORPIO',
-    },
-    {
-        'Name': 'Titanium',
-        'Type': 'STL_FUEL_STORE',
-        'StorageId': '9652a3526c68b902acf5816572153229',
-        'Timestamp': '2026-03-02T15:31:47.378343Z',
-        'VolumeLoad': 210,
-        'WeightLoad': 210,
-        'StorageItems': [
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': '7756a0779efe67f0f293f41eda4944d4',
-                'TotalVolume': 210,
-                'TotalWeight': 210,
-                'MaterialName': 'stlFuel',
-                'MaterialValue': 46925.22,
-                'MaterialAmount': 3500,
-                'MaterialTicker': 'SF',
-                'MaterialVolume': 0.05999999865889549,
-                'MaterialWeight': 0.05999999865889549,
-                'MaterialCategory': 'ba98fa0cf77040a96cd8a608ad0d08e9',
-                'MaterialValueCurrency': 'NCC',
-            }
-        ],
-        'AddressableId': '22f309cda9d4e088545376dd40bc4b9f',
-        'VolumeCapacity': 210,
-        'WeightCapacity': 210,
-        'UserNameSubmitted': 'SFSCORPIO',
-    },
-    {
-        'Name': 'Scandium',
-        'Type': 'SHIP_STORE',
-        'StorageId': '96be6caca30592d8c491e66ef58daecf',
-        'Timestamp': '2026-03-02T15:31:47.378343Z',
-        'VolumeLoad': 0,
-        'WeightLoad': 0,
-        'StorageItems': [],
-        'AddressableId': '98e0a736ee0e789e99e494629369c53d',
-        'VolumeCapacity': 2000,
-        'WeightCapacity': 2000,
-        'UserNameSubmitted': 'SFSCORPIO',
-    },
-    {
-        'Name': 'Niobium',
-        'Type': 'SHIP_STORE',
-        'StorageId': '97557759875426110874a90fcad70246',
-        'Timestamp': '2026-03-02T15:31:47.378343Z',
-        'VolumeLoad': 0,
-        'WeightLoad': 0,
-        'StorageItems': [],
-        'AddressableId': 'e0e7cb8ce2b0c29c6d6f12f7a9409994',
-        'VolumeCapacity': 2000,
-        'WeightCapacity': 2000,
-        'UserNameSubmitted': 'SFSCORPIO',
-    },
-    {
-        'Name': 'Palladium',
-        'Type': 'FTL_FUEL_STORE',
-        'StorageId': '98c6744302aeac946ca731ebea2b8c63',
-        'Timestamp': '2026-03-02T15:31:47.378343Z',
-        'VolumeLoad': 20,
-        'WeightLoad': 100,
-        'StorageItems': [
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': '7a2a12cd6872b89a6b97532618788a4d',
-                'TotalVolume': 20,
-                'TotalWeight': 100,
-                'MaterialName': 'ftlFuel',
-                'MaterialValue': 1,
-                'MaterialAmount': 2000,
-                'MaterialTicker': 'FF',
-                'MaterialVolume': 0.009999999776482582,
-                'MaterialWeight': 0.05000000074505806,
-                'MaterialCategory': 'ba98fa0cf77040a96cd8a608ad0d08e9',
-                'MaterialValueCurrency': 'NCC',
-            }
-        ],
-        'AddressableId': '3e8a23cf3dc8fe97f89f20dbdc992a28',
-        'VolumeCapacity': 20,
-        'WeightCapacity': 100,
-        'UserNameSubmitted': 'SFSCORPIO',
-    },
-    {
-        'Name': 'Nickel',
-        'Type': 'FTL_FUEL_STORE',
-        'StorageId': '991aea22ce1fa6ac3f0c4d8f0979631d',
-        'Timestamp': '2026-03-02T15:31:47.378343Z',
-        'VolumeLoad': 8,
-        'WeightLoad': 40,
-        'StorageItems': [
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': '7a2a12cd6872b89a6b97532618788a4d',
-                'TotalVolume': 8,
-                'TotalWeight': 40,
-                'MaterialName': 'ftlFuel',
-                'MaterialValue': 14178.55,
-                'MaterialAmount': 800,
-                'MaterialTicker': 'FF',
-                'MaterialVolume': 0.009999999776482582,
-                'MaterialWeight': 0.05000000074505806,
-                'MaterialCategory': 'ba98fa0cf77040a96cd8a608ad0d08e9',
-                'MaterialValueCurrency': 'NCC',
-            }
-        ],
-        'AddressableId': 'a065bb621216956949eef6ed89514436',
-        'VolumeCapacity': 8,
-        'WeightCapacity': 40,
-        'UserNameSubmitted': 'SFSCORPIO',
-    },
-    {
-        'Name': None,
-        'Type': 'STORE',
-        'StorageId': '9be21bb65a84cb30b7f310c09b6247fc',
-        'Timestamp': '2026-03-02T15:31:47.378343Z',
-        'VolumeLoad': 1867.15,
-        'WeightLoad': 1994.75,
-        'StorageItems': [
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': 'ec8dbb1d3f51d89c61b6f58fdd64a7f0',
-                'TotalVolume': 375.6,
-                'TotalWeight': 375.6,
-                'MaterialName': 'water',
-                'MaterialValue': 0,
-                'MaterialAmount': 1878,
-                'MaterialTicker': 'H2O',
-                'MaterialVolume': 0.20000000298023224,
-                'MaterialWeight': 0.20000000298023224,
-                'MaterialCategory': '473218d3618453bf25d2cd0b5616a72f',
-                'MaterialValueCurrency': 'NCC',
-            },
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': '820d081096fd3e8fbd98b4344f6250ad',
-                'TotalVolume': 1.2,
-                'TotalWeight': 1.2,
-                'MaterialName': 'pioneerLuxuryClothing',
-                'MaterialValue': 8109.71,
-                'MaterialAmount': 24,
-                'MaterialTicker': 'PWO',
-                'MaterialVolume': 0.05000000074505806,
-                'MaterialWeight': 0.05000000074505806,
-                'MaterialCategory': '8a0bd8b6a329c3d632da9da63c818b3d',
-                'MaterialValueCurrency': 'NCC',
-            },
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': '9788890100fd2191fb065cb0d5e624cb',
-                'TotalVolume': 1.55,
-                'TotalWeight': 1.24,
-                'MaterialName': 'pioneerClothing',
-                'MaterialValue': 0,
-                'MaterialAmount': 62,
-                'MaterialTicker': 'OVE',
-                'MaterialVolume': 0.02500000037252903,
-                'MaterialWeight': 0.019999999552965164,
-                'MaterialCategory': '3f047ec3043bdd795fd7272d6be98799',
-                'MaterialValueCurrency': 'NCC',
-            },
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': '83d83e8cf6fb9018ae7138a1b5d4b19c',
-                'TotalVolume': 504,
-                'TotalWeight': 453.6,
-                'MaterialName': 'carbohydrateGrains',
-                'MaterialValue': 0,
-                'MaterialAmount': 504,
-                'MaterialTicker': 'GRN',
-                'MaterialVolume': 1,
-                'MaterialWeight': 0.8999999761581421,
-                'MaterialCategory': '510e7751c0eb6a51fd0fa73565365d1c',
-                'MaterialValueCurrency': 'NCC',
-            },
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': '4fca6f5b5e6c3b8a1b887c6dc99db146',
-                'TotalVolume': 49.3,
-                'TotalWeight': 49.3,
-                'MaterialName': 'drinkingWater',
-                'MaterialValue': 26717.79,
-                'MaterialAmount': 493,
-                'MaterialTicker': 'DW',
-                'MaterialVolume': 0.10000000149011612,
-                'MaterialWeight': 0.10000000149011612,
-                'MaterialCategory': '3f047ec3043bdd795fd7272d6be98799',
-                'MaterialValueCurrency': 'NCC',
-            },
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': '6e16dbf050b98d9c4fc9c615b3367a0f',
-                'TotalVolume': 880,
-                'TotalWeight': 1004.08,
-                'MaterialName': 'oxygen',
-                'MaterialValue': 0,
-                'MaterialAmount': 880,
-                'MaterialTicker': 'O',
-                'MaterialVolume': 1,
-                'MaterialWeight': 1.1410000324249268,
-                'MaterialCategory': '54dec1e42eba44dda423dd774393326a',
-                'MaterialValueCurrency': 'NCC',
-            },
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': '83dd61885cf6879ff49fe1419f068f10',
-                'TotalVolume': 49.3,
-                'TotalWeight': 103.53,
-                'MaterialName': 'rations',
-                'MaterialValue': 33486.66,
-                'MaterialAmount': 493,
-                'MaterialTicker': 'RAT',
-                'MaterialVolume': 0.10000000149011612,
-                'MaterialWeight': 0.20999999344348907,
-                'MaterialCategory': '3f047ec3043bdd795fd7272d6be98799',
-                'MaterialValueCurrency': 'NCC',
-            },
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': '9842ad8d9dfdf8e4c2e80117e7b5ebaf',
-                'TotalVolume': 6.2,
-                'TotalWeight': 6.2,
-                'MaterialName': 'pioneerLuxuryDrink',
-                'MaterialValue': 0,
-                'MaterialAmount': 62,
-                'MaterialTicker': 'COF',
-                'MaterialVolume': 0.10000000149011612,
-                'MaterialWeight': 0.10000000149011612,
-                'MaterialCategory': '8a0bd8b6a329c3d632da9da63c818b3d',
-                'MaterialValueCurrency': 'NCC',
-            },
-        ],
-        'AddressableId': 'a9c8d809a125651e8894bb4aed9911f9',
-        'VolumeCapacity': 6500,
-        'WeightCapacity': 6500,
-        'UserNameSubmitted': 'SFSCORPIO',
-    },
-    {
-        'Name': 'Arsenic',
-        'Type': 'SHIP_STORE',
-        'StorageId': 'a1225e6d244827c266c4b97da427eff1',
-        'Timestamp': '2026-03-02T15:31:47.378343Z',
-        'VolumeLoad': 0,
-        'WeightLoad': 0,
-        'StorageItems': [],
-        'AddressableId': 'a4f8006868f4836fec0a3385304f243c',
-        'VolumeCapacity': 2000,
-        'WeightCapacity': 2000,
-        'UserNameSubmitted': 'SFSCORPIO',
-    },
-    {
-        'Name': 'Sodium',
-        'Type': 'SHIP_STORE',
-        'StorageId': 'a30e10cf81109a93d301b502047967b1',
-        'Timestamp': '2026-03-02T15:31:47.378343Z',
-        'VolumeLoad': 0,
-        'WeightLoad': 0,
-        'StorageItems': [],
-        'AddressableId': 'dcad2c65b4b05a1a75f005d912a25ff6',
-        'VolumeCapacity': 2000,
-        'WeightCapacity': 2000,
-        'UserNameSubmitted': 'SFSCORPIO',
-    },
-    {
-        'Name': 'Rhodium',
-        'Type': 'STL_FUEL_STORE',
-        'StorageId': 'a56d8cf037ef4bdecd513441a4f3a2aa',
-        'Timestamp': '2026-03-02T15:31:47.378343Z',
-        'VolumeLoad': 210,
-        'WeightLoad': 210,
-        'StorageItems': [
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': '7756a0779efe67f0f293f41eda4944d4',
-                'TotalVolume': 210,
-                'TotalWeight': 210,
-                'MaterialName': 'stlFuel',
-                'MaterialValue': 1142.38,
-                'MaterialAmount': 3500,
-                'MaterialTicker': 'SF',
-                'MaterialVolume': 0.05999999865889549,
-                'MaterialWeight': 0.05999999865889549,
-                'MaterialCategory': 'ba98fa0cf77040a96cd8a608ad0d08e9',
-                'MaterialValueCurrency': 'NCC',
-            }
-        ],
-        'AddressableId': '978f94d7689f3e77ea90bdc438ab9024',
-        'VolumeCapacity': 210,
-        'WeightCapacity': 210,
-        'UserNameSubmitted': 'SFSCORPIO',
-    },
-    {
-        'Name': 'Molybdenum',
-        'Type': 'FTL_FUEL_STORE',
-        'StorageId': 'a68826e8a1627203ea043c9418043161',
-        'Timestamp': '2026-03-02T15:31:47.378343Z',
-        'VolumeLoad': 20,
-        'WeightLoad': 100,
-        'StorageItems': [
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': '7a2a12cd6872b89a6b97532618788a4d',
-                'TotalVolume': 20,
-                'TotalWeight': 100,
-                'MaterialName': 'ftlFuel',
-                'MaterialValue': 1,
-                'MaterialAmount': 2000,
-                'MaterialTicker': 'FF',
-                'MaterialVolume': 0.009999999776482582,
-                'MaterialWeight': 0.05000000074505806,
-                'MaterialCategory': 'ba98fa0cf77040a96cd8a608ad0d08e9',
-                'MaterialValueCurrency': 'NCC',
-            }
-        ],
-        'AddressableId': '260f304a705e06d8bb003296dd5f8953',
-        'VolumeCapacity': 20,
-        'WeightCapacity': 100,
-        'UserNameSubmitted': 'SFSCORPIO',
-    },
-    {
-        'Name': 'Copper',
-        'Type': 'STL_FUEL_STORE',
-        'StorageId': 'a873533390adb49da9e677b0f621f8a0',
-        'Timestamp': '2026-03-02T15:31:47.378343Z',
-        'VolumeLoad': 210,
-        'WeightLoad': 210,
-        'StorageItems': [
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': '7756a0779efe67f0f293f41eda4944d4',
-                'TotalVolume': 210,
-                'TotalWeight': 210,
-                'MaterialName': 'stlFuel',
-                'MaterialValue': 57732.71,
-                'MaterialAmount': 3500,
-                'MaterialTicker': 'SF',
-                'MaterialVolume': 0.05999999865889549,
-                'MaterialWeight': 0.05999999865889549,
-                'MaterialCategory': 'ba98fa0cf77040a96cd8a608ad0d08e9',
-                'MaterialValueCurrency': 'NCC',
-            }
-        ],
-        'AddressableId': '815f5c70425fce2c4942de12f40a561a',
-        'VolumeCapacity': 210,
-        'WeightCapacity': 210,
-        'UserNameSubmitted': 'SFSCORPIO',
-    },
-    {
-        'Name': 'Tin',
-        'Type': 'STL_FUEL_STORE',
-        'StorageId': 'aa578cf7bf878a90a7103bd82463137a',
-        'Timestamp': '2026-03-02T15:31:47.378343Z',
-        'VolumeLoad': 210,
-        'WeightLoad': 210,
-        'StorageItems': [
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': '7756a0779efe67f0f293f41eda4944d4',
-                'TotalVolume': 210,
-                'TotalWeight': 210,
-                'MaterialName': 'stlFuel',
-                'MaterialValue': 1134.98,
-                'MaterialAmount': 3500,
-                'MaterialTicker': 'SF',
-                'MaterialVolume': 0.05999999865889549,
-                'MaterialWeight': 0.05999999865889549,
-                'MaterialCategory': 'ba98fa0cf77040a96cd8a608ad0d08e9',
-                'MaterialValueCurrency': 'NCC',
-            }
-        ],
-        'AddressableId': '88722534103087695b5daf5321cc2281',
-        'VolumeCapacity': 210,
-        'WeightCapacity': 210,
-        'UserNameSubmitted': 'SFSCORPIO',
-    },
-    {
-        'Name': 'Nickel',
-        'Type': 'STL_FUEL_STORE',
-        'StorageId': 'aa6e27fb86874559117e325f5772467d',
-        'Timestamp': '2026-03-02T15:31:47.378343Z',
-        'VolumeLoad': 210,
-        'WeightLoad': 210,
-        'StorageItems': [
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': '7756a0779efe67f0f293f41eda4944d4',
-                'TotalVolume': 210,
-                'TotalWeight': 210,
-                'MaterialName': 'stlFuel',
-                'MaterialValue': 56247.96,
-                'MaterialAmount': 3500,
-                'MaterialTicker': 'SF',
-                'MaterialVolume': 0.05999999865889549,
-                'MaterialWeight': 0.05999999865889549,
-                'MaterialCategory': 'ba98fa0cf77040a96cd8a608ad0d08e9',
-                'MaterialValueCurrency': 'NCC',
-            }
-        ],
-        'AddressableId': 'a065bb621216956949eef6ed89514436',
-        'VolumeCapacity': 210,
-        'WeightCapacity': 210,
-        'UserNameSubmitted': 'SFSCORPIO',
-    },
-    {
-        'Name': 'Arsenic',
-        'Type': 'STL_FUEL_STORE',
-        'StorageId': 'ab7e280261450d245623e9592fe65fea',
-        'Timestamp': '2026-03-02T15:31:47.378343Z',
-        'VolumeLoad': 201.78,
-        'WeightLoad': 201.78,
-        'StorageItems': [
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': '7756a0779efe67f0f293f41eda4944d4',
-                'TotalVolume': 201.78,
-                'TotalWeight': 201.78,
-                'MaterialName': 'stlFuel',
-                'MaterialValue': 57140.39,
-                'MaterialAmount': 3363,
-                'MaterialTicker': 'SF',
-                'MaterialVolume': 0.05999999865889549,
-                'MaterialWeight': 0.05999999865889549,
-                'MaterialCategory': 'ba98fa0cf77040a96cd8a608ad0d08e9',
-                'MaterialValueCurrency': 'NCC',
-            }
-        ],
-        'AddressableId': 'a4f8006868f4836fec0a3385304f243c',
-        'VolumeCapacity': 210,
-        'WeightCapacity': 210,
-        'UserNameSubmitted': 'SFSCORPIO',
-    },
-    {
-        'Name': 'Krypton',
-        'Type': 'SHIP_STORE',
-        'StorageId': 'ab9240a2897368d5c0660f4a59c1cd72',
-        'Timestamp': '2026-03-02T15:31:47.378343Z',
-        'VolumeLoad': 0,
-        'WeightLoad': 0,
-        'StorageItems': [],
-        'AddressableId': 'da3e544a5882353437092caa05ab7ea9',
-        'VolumeCapacity': 2000,
-        'WeightCapacity': 2000,
-        'UserNameSubmitted': 'SFSCORPIO',
-    },
-    {
-        'Name': 'Nitrogen',
-        'Type': 'STL_FUEL_STORE',
-        'StorageId': 'ac71e9bf7973070bbe673ebcde8651b9',
-        'Timestamp': '2026-03-02T15:31:47.378343Z',
-        'VolumeLoad': 210,
-        'WeightLoad': 210,
-        'StorageItems': [
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': '7756a0779efe67f0f293f41eda4944d4',
-                'TotalVolume': 210,
-                'TotalWeight': 210,
-                'MaterialName': 'stlFuel',
-                'MaterialValue': 52438.99,
-                'MaterialAmount': 3500,
-                'MaterialTicker': 'SF',
-                'MaterialVolume': 0.05999999865889549,
-                'MaterialWeight': 0.05999999865889549,
-                'MaterialCategory': 'ba98fa0cf77040a96cd8a608ad0d08e9',
-                'MaterialValueCurrency': 'NCC',
-            }
-        ],
-        'AddressableId': 'f42fa27da9ff072f8cb8c90d87aa0727',
-        'VolumeCapacity': 210,
-        'WeightCapacity': 210,
-        'UserNameSubmitted': 'SFSCORPIO',
-    },
-    {
-        'Name': 'Antimony',
-        'Type': 'FTL_FUEL_STORE',
-        'StorageId': 'ac94ea19b1622a21899beb9875a93012',
-        'Timestamp': '2026-03-02T15:31:47.378343Z',
-        'VolumeLoad': 20,
-        'WeightLoad': 100,
-        'StorageItems': [
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': '7a2a12cd6872b89a6b97532618788a4d',
-                'TotalVolume': 20,
-                'TotalWeight': 100,
-                'MaterialName': 'ftlFuel',
-                'MaterialValue': 575.24,
-                'MaterialAmount': 2000,
-                'MaterialTicker': 'FF',
-                'MaterialVolume': 0.009999999776482582,
-                'MaterialWeight': 0.05000000074505806,
-                'MaterialCategory': 'ba98fa0cf77040a96cd8a608ad0d08e9',
-                'MaterialValueCurrency': 'NCC',
-            }
-        ],
-        'AddressableId': 'f2085c49847885ef760ee305cd6cd7e2',
-        'VolumeCapacity': 20,
-        'WeightCapacity': 100,
-        'UserNameSubmitted': 'SFSCORPIO',
-    },
-    {
-        'Name': None,
-        'Type': 'STORE',
-        'StorageId': 'b0f79363d425c9e50ad3251e91717fe1',
-        'Timestamp': '2026-03-02T15:31:47.378343Z',
-        'VolumeLoad': 2976.4649999999997,
-        'WeightLoad': 3105.074,
-        'StorageItems': [
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': '1f9a0293d9ba9bf519f71432e695edeb',
-                'TotalVolume': 86,
-                'TotalWeight': 234.78,
-                'MaterialName': 'limestone',
-                'MaterialValue': 0,
-                'MaterialAmount': 86,
-                'MaterialTicker': 'LST',
-                'MaterialVolume': 1,
-                'MaterialWeight': 2.7300000190734863,
-                'MaterialCategory': '79f3917448cc4f6034ece865c41aea34',
-                'MaterialValueCurrency': 'NCC',
-            },
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': '83dd61885cf6879ff49fe1419f068f10',
-                'TotalVolume': 80.7,
-                'TotalWeight': 169.47,
-                'MaterialName': 'rations',
-                'MaterialValue': 47606.09,
-                'MaterialAmount': 807,
-                'MaterialTicker': 'RAT',
-                'MaterialVolume': 0.10000000149011612,
-                'MaterialWeight': 0.20999999344348907,
-                'MaterialCategory': '3f047ec3043bdd795fd7272d6be98799',
-                'MaterialValueCurrency': 'NCC',
-            },
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': 'c04de28c3e717f236d6ed177b89d9523',
-                'TotalVolume': 278,
-                'TotalWeight': 19.46,
-                'MaterialName': 'hydrogen',
-                'MaterialValue': 35322.61,
-                'MaterialAmount': 278,
-                'MaterialTicker': 'H',
-                'MaterialVolume': 1,
-                'MaterialWeight': 0.07000000029802322,
-                'MaterialCategory': '54dec1e42eba44dda423dd774393326a',
-                'MaterialValueCurrency': 'NCC',
-            },
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': '64666b2eb0faaba594a62818e48229b8',
-                'TotalVolume': 0.3,
-                'TotalWeight': 0.6,
-                'MaterialName': 'polymerGranulate',
-                'MaterialValue': 0,
-                'MaterialAmount': 300,
-                'MaterialTicker': 'PG',
-                'MaterialVolume': 0.0010000000474974513,
-                'MaterialWeight': 0.0020000000949949026,
-                'MaterialCategory': '6316282906a9f68b0c7bb4396a26aa95',
-                'MaterialValueCurrency': 'NCC',
-            },
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': 'd9cfb2948188f49bfae2b6d9972837c8',
-                'TotalVolume': 16,
-                'TotalWeight': 19.2,
-                'MaterialName': 'nutrientSolution',
-                'MaterialValue': 0,
-                'MaterialAmount': 32,
-                'MaterialTicker': 'NS',
-                'MaterialVolume': 0.5,
-                'MaterialWeight': 0.6000000238418579,
-                'MaterialCategory': '9b32ea2333917ee2632ba7ae7675643f',
-                'MaterialValueCurrency': 'NCC',
-            },
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': '9842ad8d9dfdf8e4c2e80117e7b5ebaf',
-                'TotalVolume': 3.1,
-                'TotalWeight': 3.1,
-                'MaterialName': 'pioneerLuxuryDrink',
-                'MaterialValue': 0,
-                'MaterialAmount': 31,
-                'MaterialTicker': 'COF',
-                'MaterialVolume': 0.10000000149011612,
-                'MaterialWeight': 0.10000000149011612,
-                'MaterialCategory': '8a0bd8b6a329c3d632da9da63c818b3d',
-                'MaterialValueCurrency': 'NCC',
-            },
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': '5d59ddddb1ce9a26eb81b78b8378b3ac',
-                'TotalVolume': 1602,
-                'TotalWeight': 1292.814,
-                'MaterialName': 'nitrogen',
-                'MaterialValue': 249382.84,
-                'MaterialAmount': 1602,
-                'MaterialTicker': 'N',
-                'MaterialVolume': 1,
-                'MaterialWeight': 0.8069999814033508,
-                'MaterialCategory': '54dec1e42eba44dda423dd774393326a',
-                'MaterialValueCurrency': 'NCC',
-            },
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': 'b5744244bb7913cee262ec29abc3b9d0',
-                'TotalVolume': 9.4,
-                'TotalWeight': 11.75,
-                'MaterialName': 'settlerTools',
-                'MaterialValue': 28671.64,
-                'MaterialAmount': 47,
-                'MaterialTicker': 'PT',
-                'MaterialVolume': 0.20000000298023224,
-                'MaterialWeight': 0.25,
-                'MaterialCategory': '3f047ec3043bdd795fd7272d6be98799',
-                'MaterialValueCurrency': 'NCC',
-            },
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': '7756a0779efe67f0f293f41eda4944d4',
-                'TotalVolume': 154.8,
-                'TotalWeight': 154.8,
-                'MaterialName': 'stlFuel',
-                'MaterialValue': 24490.22,
-                'MaterialAmount': 2580,
-                'MaterialTicker': 'SF',
-                'MaterialVolume': 0.05999999865889549,
-                'MaterialWeight': 0.05999999865889549,
-                'MaterialCategory': 'ba98fa0cf77040a96cd8a608ad0d08e9',
-                'MaterialValueCurrency': 'NCC',
-            },
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': '4bbcc7dc5dd16e9af90528ed04d9c6ba',
-                'TotalVolume': 278,
-                'TotalWeight': 625.5,
-                'MaterialName': 'carbon',
-                'MaterialValue': 0,
-                'MaterialAmount': 278,
-                'MaterialTicker': 'C',
-                'MaterialVolume': 1,
-                'MaterialWeight': 2.25,
-                'MaterialCategory': 'ef1d03e7ef924395c2173fc4e4ee8a6f',
-                'MaterialValueCurrency': 'NCC',
-            },
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': 'a1d1d61f8085de53455dd4e8a7813788',
-                'TotalVolume': 9.4,
-                'TotalWeight': 9.4,
-                'MaterialName': 'settlerLuxuryDrink',
-                'MaterialValue': 93900.95,
-                'MaterialAmount': 94,
-                'MaterialTicker': 'KOM',
-                'MaterialVolume': 0.10000000149011612,
-                'MaterialWeight': 0.10000000149011612,
-                'MaterialCategory': '8a0bd8b6a329c3d632da9da63c818b3d',
-                'MaterialValueCurrency': 'NCC',
-            },
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': '833efac228452f5d770c0693c3fb3d50',
-                'TotalVolume': 44.48,
-                'TotalWeight': 75.06,
-                'MaterialName': 'magnesium',
-                'MaterialValue': 35034.13,
-                'MaterialAmount': 278,
-                'MaterialTicker': 'MG',
-                'MaterialVolume': 0.1599999964237213,
-                'MaterialWeight': 0.27000001072883606,
-                'MaterialCategory': 'ef1d03e7ef924395c2173fc4e4ee8a6f',
-                'MaterialValueCurrency': 'NCC',
-            },
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': '7a2a12cd6872b89a6b97532618788a4d',
-                'TotalVolume': 17.77,
-                'TotalWeight': 88.85,
-                'MaterialName': 'ftlFuel',
-                'MaterialValue': 21865.54,
-                'MaterialAmount': 1777,
-                'MaterialTicker': 'FF',
-                'MaterialVolume': 0.009999999776482582,
-                'MaterialWeight': 0.05000000074505806,
-                'MaterialCategory': 'ba98fa0cf77040a96cd8a608ad0d08e9',
-                'MaterialValueCurrency': 'NCC',
-            },
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': '820d081096fd3e8fbd98b4344f6250ad',
-                'TotalVolume': 0.65,
-                'TotalWeight': 0.65,
-                'MaterialName': 'pioneerLuxuryClothing',
-                'MaterialValue': 4394.09,
-                'MaterialAmount': 13,
-                'MaterialTicker': 'PWO',
-                'MaterialVolume': 0.05000000074505806,
-                'MaterialWeight': 0.05000000074505806,
-                'MaterialCategory': '8a0bd8b6a329c3d632da9da63c818b3d',
-                'MaterialValueCurrency': 'NCC',
-            },
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': 'ec8dbb1d3f51d89c61b6f58fdd64a7f0',
-                'TotalVolume': 320.4,
-                'TotalWeight': 320.4,
-                'MaterialName': 'water',
-                'MaterialValue': 310.31,
-                'MaterialAmount': 1602,
-                'MaterialTicker': 'H2O',
-                'MaterialVolume': 0.20000000298023224,
-                'MaterialWeight': 0.20000000298023224,
-                'MaterialCategory': '473218d3618453bf25d2cd0b5616a72f',
-                'MaterialValueCurrency': 'NCC',
-            },
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': '9788890100fd2191fb065cb0d5e624cb',
-                'TotalVolume': 0.775,
-                'TotalWeight': 0.62,
-                'MaterialName': 'pioneerClothing',
-                'MaterialValue': 0,
-                'MaterialAmount': 31,
-                'MaterialTicker': 'OVE',
-                'MaterialVolume': 0.02500000037252903,
-                'MaterialWeight': 0.019999999552965164,
-                'MaterialCategory': '3f047ec3043bdd795fd7272d6be98799',
-                'MaterialValueCurrency': 'NCC',
-            },
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': '7171933481f022ca74200b216f98ca60',
-                'TotalVolume': 0.04,
-                'TotalWeight': 0.12,
-                'MaterialName': 'settlerLuxuryTools',
-                'MaterialValue': 13725.49,
-                'MaterialAmount': 20,
-                'MaterialTicker': 'REP',
-                'MaterialVolume': 0.0020000000949949026,
-                'MaterialWeight': 0.006000000052154064,
-                'MaterialCategory': '8a0bd8b6a329c3d632da9da63c818b3d',
-                'MaterialValueCurrency': 'NCC',
-            },
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': '87dd9b56a69e118e8c778de2dce11e8c',
-                'TotalVolume': 2.35,
-                'TotalWeight': 4.7,
-                'MaterialName': 'settlerClothing',
-                'MaterialValue': 0,
-                'MaterialAmount': 47,
-                'MaterialTicker': 'EXO',
-                'MaterialVolume': 0.05000000074505806,
-                'MaterialWeight': 0.10000000149011612,
-                'MaterialCategory': '3f047ec3043bdd795fd7272d6be98799',
-                'MaterialValueCurrency': 'NCC',
-            },
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': '4fca6f5b5e6c3b8a1b887c6dc99db146',
-                'TotalVolume': 71.3,
-                'TotalWeight': 71.3,
-                'MaterialName': 'drinkingWater',
-                'MaterialValue': 30916.24,
-                'MaterialAmount': 713,
-                'MaterialTicker': 'DW',
-                'MaterialVolume': 0.10000000149011612,
-                'MaterialWeight': 0.10000000149011612,
-                'MaterialCategory': '3f047ec3043bdd795fd7272d6be98799',
-                'MaterialValueCurrency': 'NCC',
-            },
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': '51c829b6e62e70223024ffa6688db9f7',
-                'TotalVolume': 1,
-                'TotalWeight': 2.5,
-                'MaterialName': 'flux',
-                'MaterialValue': 0,
-                'MaterialAmount': 10,
-                'MaterialTicker': 'FLX',
-                'MaterialVolume': 0.10000000149011612,
-                'MaterialWeight': 0.25,
-                'MaterialCategory': '9b32ea2333917ee2632ba7ae7675643f',
-                'MaterialValueCurrency': 'NCC',
-            },
-        ],
-        'AddressableId': 'd45320db099700d9aa8b99ca252a8830',
-        'VolumeCapacity': 11500,
-        'WeightCapacity': 11500,
-        'UserNameSubmitted': 'SFSCORPIO',
-    },
-    {
-        'Name': 'Tellurium',
-        'Type': 'STL_FUEL_STORE',
-        'StorageId': 'b349076c45d3c1d76947b4b044fe5e17',
-        'Timestamp': '2026-03-02T15:31:47.378343Z',
-        'VolumeLoad': 210,
-        'WeightLoad': 210,
-        'StorageItems': [
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': '7756a0779efe67f0f293f41eda4944d4',
-                'TotalVolume': 210,
-                'TotalWeight': 210,
-                'MaterialName': 'stlFuel',
-                'MaterialValue': 1116.98,
-                'MaterialAmount': 3500,
-                'MaterialTicker': 'SF',
-                'MaterialVolume': 0.05999999865889549,
-                'MaterialWeight': 0.05999999865889549,
-                'MaterialCategory': 'ba98fa0cf77040a96cd8a608ad0d08e9',
-                'MaterialValueCurrency': 'NCC',
-            }
-        ],
-        'AddressableId': '477742fec32e2b0feb0771bb944696d6',
-        'VolumeCapacity': 210,
-        'WeightCapacity': 210,
-        'UserNameSubmitted': 'SFSCORPIO',
-    },
-    {
-        'Name': 'Aluminium',
-        'Type': 'SHIP_STORE',
-        'StorageId': 'b4082fb987348e5f8dec2453afc99d2d',
-        'Timestamp': '2026-03-02T15:31:47.378343Z',
-        'VolumeLoad': 0,
-        'WeightLoad': 0,
-        'StorageItems': [],
-        'AddressableId': 'e641f1296919ffdea8f19f5e48db1b42',
-        'VolumeCapacity': 2000,
-        'WeightCapacity': 2000,
-        'UserNameSubmitted': 'SFSCORPIO',
-    },
-    {
-        'Name': 'Fluorine',
-        'Type': 'SHIP_STORE',
-        'StorageId': 'b5eb3fbf14b92ec0c208afc8bfb81424',
-        'Timestamp': '2026-03-02T15:31:47.378343Z',
-        'VolumeLoad': 0,
-        'WeightLoad': 0,
-        'StorageItems': [],
-        'AddressableId': '95a21e5c9e8a1e14cf93394a1e48d3d9',
-        'VolumeCapacity': 2000,
-        'WeightCapacity': 2000,
-        'UserNameSubmitted': 'SFSCORPIO',
-    },
-    {
-        'Name': 'Neon',
-        'Type': 'SHIP_STORE',
-        'StorageId': 'b616870e7d0e023d7b2f6af8f8c04585',
-        'Timestamp': '2026-03-02T15:31:47.378343Z',
-        'VolumeLoad': 0,
-        'WeightLoad': 0,
-        'StorageItems': [],
-        'AddressableId': 'b87025991fbc969ce70f9210caa51110',
-        'VolumeCapacity': 2000,
-        'WeightCapacity': 2000,
-        'UserNameSubmitted': 'SFSCORPIO',
-    },
-    {
-        'Name': 'Copper',
-        'Type': 'FTL_FUEL_STORE',
-        'StorageId': 'b6ada540b48451de04a32d70d5813802',
-        'Timestamp': '2026-03-02T15:31:47.378343Z',
-        'VolumeLoad': 8,
-        'WeightLoad': 40,
-        'StorageItems': [
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': '7a2a12cd6872b89a6b97532618788a4d',
-                'TotalVolume': 8,
-                'TotalWeight': 40,
-                'MaterialName': 'ftlFuel',
-                'MaterialValue': 14989.26,
-                'MaterialAmount': 800,
-                'MaterialTicker': 'FF',
-                'MaterialVolume': 0.009999999776482582,
-                'MaterialWeight': 0.05000000074505806,
-                'MaterialCategory': 'ba98fa0cf77040a96cd8a608ad0d08e9',
-                'MaterialValueCurrency': 'NCC',
-            }
-        ],
-        'AddressableId': '815f5c70425fce2c4942de12f40a561a',
-        'VolumeCapacity': 8,
-        'WeightCapacity': 40,
-        'UserNameSubmitted': 'SFSCORPIO',
-    },
-    {
-        'Name': 'Krypton',
-        'Type': 'FTL_FUEL_STORE',
-        'StorageId': 'b9e52585314a2e86fe1b71dc2e3a0386',
-        'Timestamp': '2026-03-02T15:31:47.378343Z',
-        'VolumeLoad': 20,
-        'WeightLoad': 100,
-        'StorageItems': [
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': '7a2a12cd6872b89a6b97532618788a4d',
-                'TotalVolume': 20,
-                'TotalWeight': 100,
-                'MaterialName': 'ftlFuel',
-                'MaterialValue': 3347.51,
-                'MaterialAmount': 2000,
-                'MaterialTicker': 'FF',
-                'MaterialVolume': 0.009999999776482582,
-                'MaterialWeight': 0.05000000074505806,
-                'MaterialCategory': 'ba98fa0cf77040a96cd8a608ad0d08e9',
-                'MaterialValueCurrency': 'NCC',
-            }
-        ],
-        'AddressableId': 'da3e544a5882353437092caa05ab7ea9',
-        'VolumeCapacity': 20,
-        'WeightCapacity': 100,
-        'UserNameSubmitted': 'SFSCORPIO',
-    },
-    {
-        'Name': 'Hydrogen',
-        'Type': 'FTL_FUEL_STORE',
-        'StorageId': 'ba7f0bcf3f55085e465ee5bfe98eca1e',
-        'Timestamp': '2026-03-02T15:31:47.378343Z',
-        'VolumeLoad': 3,
-        'WeightLoad': 15,
-        'StorageItems': [
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': '7a2a12cd6872b89a6b97532618788a4d',
-                'TotalVolume': 3,
-                'TotalWeight': 15,
-                'MaterialName': 'ftlFuel',
-                'MaterialValue': 5515.91,
-                'MaterialAmount': 300,
-                'MaterialTicker': 'FF',
-                'MaterialVolume': 0.009999999776482582,
-                'MaterialWeight': 0.05000000074505806,
-                'MaterialCategory': 'ba98fa0cf77040a96cd8a608ad0d08e9',
-                'MaterialValueCurrency': 'NCC',
-            }
-        ],
-        'AddressableId': '09b5c5080f7c1e2c46aff0b66a33bf09',
-        'VolumeCapacity': 3,
-        'WeightCapacity': 15,
-        'UserNameSubmitted': 'SFSCORPIO',
-    },
-    {
-        'Name': 'Technetium',
-        'Type': 'FTL_FUEL_STORE',
-        'StorageId': 'bcc78d1e3f9709aeb26b2fdf83ee3d72',
-        'Timestamp': '2026-03-02T15:31:47.378343Z',
-        'VolumeLoad': 20,
-        'WeightLoad': 100,
-        'StorageItems': [
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': '7a2a12cd6872b89a6b97532618788a4d',
-                'TotalVolume': 20,
-                'TotalWeight': 100,
-                'MaterialName': 'ftlFuel',
-                'MaterialValue': 9565.12,
-                'MaterialAmount': 2000,
-                'MaterialTicker': 'FF',
-                'MaterialVolume': 0.009999999776482582,
-                'MaterialWeight': 0.05000000074505806,
-                'MaterialCategory': 'ba98fa0cf77040a96cd8a608ad0d08e9',
-                'MaterialValueCurrency': 'NCC',
-            }
-        ],
-        'AddressableId': '85f6886a99c04bf77317f2e5ab992ffc',
-        'VolumeCapacity': 20,
-        'WeightCapacity': 100,
-        'UserNameSubmitted': 'SFSCORPIO',
-    },
-    {
-        'Name': 'Bromine',
-        'Type': 'STL_FUEL_STORE',
-        'StorageId': 'bce70f472066e85da75961de48e7d012',
-        'Timestamp': '2026-03-02T15:31:47.378343Z',
-        'VolumeLoad': 175.5,
-        'WeightLoad': 175.5,
-        'StorageItems': [
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': '7756a0779efe67f0f293f41eda4944d4',
-                'TotalVolume': 175.5,
-                'TotalWeight': 175.5,
-                'MaterialName': 'stlFuel',
-                'MaterialValue': 20432.7,
-                'MaterialAmount': 2925,
-                'MaterialTicker': 'SF',
-                'MaterialVolume': 0.05999999865889549,
-                'MaterialWeight': 0.05999999865889549,
-                'MaterialCategory': 'ba98fa0cf77040a96cd8a608ad0d08e9',
-                'MaterialValueCurrency': 'NCC',
-            }
-        ],
-        'AddressableId': '985b1255ea002b44e81767cfb54cafba',
-        'VolumeCapacity': 210,
-        'WeightCapacity': 210,
-        'UserNameSubmitted': 'SFSCORPIO',
-    },
-    {
-        'Name': 'Lithium',
-        'Type': 'STL_FUEL_STORE',
-        'StorageId': 'bd22d7ecd7b643f6c726128470f0ab5c',
-        'Timestamp': '2026-03-02T15:31:47.378343Z',
-        'VolumeLoad': 210,
-        'WeightLoad': 210,
-        'StorageItems': [
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': '7756a0779efe67f0f293f41eda4944d4',
-                'TotalVolume': 210,
-                'TotalWeight': 210,
-                'MaterialName': 'stlFuel',
-                'MaterialValue': 53672.32,
-                'MaterialAmount': 3500,
-                'MaterialTicker': 'SF',
-                'MaterialVolume': 0.05999999865889549,
-                'MaterialWeight': 0.05999999865889549,
-                'MaterialCategory': 'ba98fa0cf77040a96cd8a608ad0d08e9',
-                'MaterialValueCurrency': 'NCC',
-            }
-        ],
-        'AddressableId': 'bb42c6e0de182b7d86dc35b61b8bf9b9',
-        'VolumeCapacity': 210,
-        'WeightCapacity': 210,
-        'UserNameSubmitted': 'SFSCORPIO',
-    },
-    {
-        'Name': None,
-        'Type': 'STORE',
-        'StorageId': 'c094dfdd06087f9f032afc581f1b9b1f',
-        'Timestamp': '2026-03-02T15:31:47.378343Z',
-        'VolumeLoad': 3502.425,
-        'WeightLoad': 4080.23,
-        'StorageItems': [
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': '9842ad8d9dfdf8e4c2e80117e7b5ebaf',
-                'TotalVolume': 8.7,
-                'TotalWeight': 8.7,
-                'MaterialName': 'pioneerLuxuryDrink',
-                'MaterialValue': 6594.99,
-                'MaterialAmount': 87,
-                'MaterialTicker': 'COF',
-                'MaterialVolume': 0.10000000149011612,
-                'MaterialWeight': 0.10000000149011612,
-                'MaterialCategory': '8a0bd8b6a329c3d632da9da63c818b3d',
-                'MaterialValueCurrency': 'NCC',
-            },
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': '83dd61885cf6879ff49fe1419f068f10',
-                'TotalVolume': 69.4,
-                'TotalWeight': 145.74,
-                'MaterialName': 'rations',
-                'MaterialValue': 40846.85,
-                'MaterialAmount': 694,
-                'MaterialTicker': 'RAT',
-                'MaterialVolume': 0.10000000149011612,
-                'MaterialWeight': 0.20999999344348907,
-                'MaterialCategory': '3f047ec3043bdd795fd7272d6be98799',
-                'MaterialValueCurrency': 'NCC',
-            },
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': '4fca6f5b5e6c3b8a1b887c6dc99db146',
-                'TotalVolume': 69.4,
-                'TotalWeight': 69.4,
-                'MaterialName': 'drinkingWater',
-                'MaterialValue': 30722.86,
-                'MaterialAmount': 694,
-                'MaterialTicker': 'DW',
-                'MaterialVolume': 0.10000000149011612,
-                'MaterialWeight': 0.10000000149011612,
-                'MaterialCategory': '3f047ec3043bdd795fd7272d6be98799',
-                'MaterialValueCurrency': 'NCC',
-            },
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': '820d081096fd3e8fbd98b4344f6250ad',
-                'TotalVolume': 1.75,
-                'TotalWeight': 1.75,
-                'MaterialName': 'pioneerLuxuryClothing',
-                'MaterialValue': 11833.44,
-                'MaterialAmount': 35,
-                'MaterialTicker': 'PWO',
-                'MaterialVolume': 0.05000000074505806,
-                'MaterialWeight': 0.05000000074505806,
-                'MaterialCategory': '8a0bd8b6a329c3d632da9da63c818b3d',
-                'MaterialValueCurrency': 'NCC',
-            },
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': '83d83e8cf6fb9018ae7138a1b5d4b19c',
-                'TotalVolume': 2731,
-                'TotalWeight': 2457.9,
-                'MaterialName': 'carbohydrateGrains',
-                'MaterialValue': 1.94,
-                'MaterialAmount': 2731,
-                'MaterialTicker': 'GRN',
-                'MaterialVolume': 1,
-                'MaterialWeight': 0.8999999761581421,
-                'MaterialCategory': '510e7751c0eb6a51fd0fa73565365d1c',
-                'MaterialValueCurrency': 'NCC',
-            },
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': '9788890100fd2191fb065cb0d5e624cb',
-                'TotalVolume': 2.175,
-                'TotalWeight': 1.74,
-                'MaterialName': 'pioneerClothing',
-                'MaterialValue': 0,
-                'MaterialAmount': 87,
-                'MaterialTicker': 'OVE',
-                'MaterialVolume': 0.02500000037252903,
-                'MaterialWeight': 0.019999999552965164,
-                'MaterialCategory': '3f047ec3043bdd795fd7272d6be98799',
-                'MaterialValueCurrency': 'NCC',
-            },
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': '4bbcc7dc5dd16e9af90528ed04d9c6ba',
-                'TotalVolume': 620,
-                'TotalWeight': 1395,
-                'MaterialName': 'carbon',
-                'MaterialValue': 0,
-                'MaterialAmount': 620,
-                'MaterialTicker': 'C',
-                'MaterialVolume': 1,
-                'MaterialWeight': 2.25,
-                'MaterialCategory': 'ef1d03e7ef924395c2173fc4e4ee8a6f',
-                'MaterialValueCurrency': 'NCC',
-            },
-        ],
-        'AddressableId': '3455b6772f451ee3ae0f4b9d557d50d6',
-        'VolumeCapacity': 11500,
-        'WeightCapacity': 11500,
-        'UserNameSubmitted': 'SFSCORPIO',
-    },
-    {
-        'Name': 'Germanium',
-        'Type': 'FTL_FUEL_STORE',
-        'StorageId': 'c0b49860f357b839ba74e66f1504d8be',
-        'Timestamp': '2026-03-02T15:31:47.378343Z',
-        'VolumeLoad': 8,
-        'WeightLoad': 40,
-        'StorageItems': [
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': '7a2a12cd6872b89a6b97532618788a4d',
-                'TotalVolume': 8,
-                'TotalWeight': 40,
-                'MaterialName': 'ftlFuel',
-                'MaterialValue': 15692.79,
-                'MaterialAmount': 800,
-                'MaterialTicker': 'FF',
-                'MaterialVolume': 0.009999999776482582,
-                'MaterialWeight': 0.05000000074505806,
-                'MaterialCategory': 'ba98fa0cf77040a96cd8a608ad0d08e9',
-                'MaterialValueCurrency': 'NCC',
-            }
-        ],
-        'AddressableId': '13c545faa7e5bac208310aba8193cb1f',
-        'VolumeCapacity': 8,
-        'WeightCapacity': 40,
-        'UserNameSubmitted': 'SFSCORPIO',
-    },
-    {
-        'Name': 'Titanium',
-        'Type': 'FTL_FUEL_STORE',
-        'StorageId': 'c9c0cd3b4fe083c8b25c62aac800e887',
-        'Timestamp': '2026-03-02T15:31:47.378343Z',
-        'VolumeLoad': 20,
-        'WeightLoad': 100,
-        'StorageItems': [
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': '7a2a12cd6872b89a6b97532618788a4d',
-                'TotalVolume': 20,
-                'TotalWeight': 100,
-                'MaterialName': 'ftlFuel',
-                'MaterialValue': 35883.96,
-                'MaterialAmount': 2000,
-                'MaterialTicker': 'FF',
-                'MaterialVolume': 0.009999999776482582,
-                'MaterialWeight': 0.05000000074505806,
-                'MaterialCategory': 'ba98fa0cf77040a96cd8a608ad0d08e9',
-                'MaterialValueCurrency': 'NCC',
-            }
-        ],
-        'AddressableId': '22f309cda9d4e088545376dd40bc4b9f',
-        'VolumeCapacity': 20,
-        'WeightCapacity': 100,
-        'UserNameSubmitted': 'SFSCORPIO',
-    },
-    {
-        'Name': 'Magnesium',
-        'Type': 'SHIP_STORE',
-        'StorageId': 'cae48a5e7ce9ed0f08c137a382d78f42',
-        'Timestamp': '2026-03-02T15:31:47.378343Z',
-        'VolumeLoad': 0,
-        'WeightLoad': 0,
-        'StorageItems': [],
-        'AddressableId': '70f3646bcd1e077928b399807012778d',
-        'VolumeCapacity': 2000,
-        'WeightCapacity': 2000,
-        'UserNameSubmitted': 'SFSCORPIO',
-    },
-    {
-        'Name': 'Sulfur',
-        'Type': 'SHIP_STORE',
-        'StorageId': 'caeb0b439d05a3102da84bbdca7dbe16',
-        'Timestamp': '2026-03-02T15:31:47.378343Z',
-        'VolumeLoad': 0,
-        'WeightLoad': 0,
-        'StorageItems': [],
-        'AddressableId': '8d18fa846e0bb56da7fcb8a01e5ba4a2',
-        'VolumeCapacity': 2000,
-        'WeightCapacity': 2000,
-        'UserNameSubmitted': 'SFSCORPIO',
-    },
-    {
-        'Name': None,
-        'Type': 'STORE',
-        'StorageId': 'cdc3a9dd0417723ed345da4cff2d04c6',
-        'Timestamp': '2026-03-02T15:31:47.378343Z',
-        'VolumeLoad': 1629.936,
-        'WeightLoad': 1668.442,
-        'StorageItems': [
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': '87488698340ed6d9db87e26e35360c20',
-                'TotalVolume': 194,
-                'TotalWeight': 174.6,
-                'MaterialName': 'fattyNuts',
-                'MaterialValue': 0,
-                'MaterialAmount': 194,
-                'MaterialTicker': 'NUT',
-                'MaterialVolume': 1,
-                'MaterialWeight': 0.8999999761581421,
-                'MaterialCategory': '510e7751c0eb6a51fd0fa73565365d1c',
-                'MaterialValueCurrency': 'NCC',
-            },
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': 'e97e2535fec019710299709a7462c066',
-                'TotalVolume': 185,
-                'TotalWeight': 148,
-                'MaterialName': 'proteinBeans',
-                'MaterialValue': 0,
-                'MaterialAmount': 185,
-                'MaterialTicker': 'BEA',
-                'MaterialVolume': 1,
-                'MaterialWeight': 0.800000011920929,
-                'MaterialCategory': '510e7751c0eb6a51fd0fa73565365d1c',
-                'MaterialValueCurrency': 'NCC',
-            },
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': '9788890100fd2191fb065cb0d5e624cb',
-                'TotalVolume': 3.375,
-                'TotalWeight': 2.7,
-                'MaterialName': 'pioneerClothing',
-                'MaterialValue': 0,
-                'MaterialAmount': 135,
-                'MaterialTicker': 'OVE',
-                'MaterialVolume': 0.02500000037252903,
-                'MaterialWeight': 0.019999999552965164,
-                'MaterialCategory': '3f047ec3043bdd795fd7272d6be98799',
-                'MaterialValueCurrency': 'NCC',
-            },
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': '83d83e8cf6fb9018ae7138a1b5d4b19c',
-                'TotalVolume': 844,
-                'TotalWeight': 759.6,
-                'MaterialName': 'carbohydrateGrains',
-                'MaterialValue': 0,
-                'MaterialAmount': 844,
-                'MaterialTicker': 'GRN',
-                'MaterialVolume': 1,
-                'MaterialWeight': 0.8999999761581421,
-                'MaterialCategory': '510e7751c0eb6a51fd0fa73565365d1c',
-                'MaterialValueCurrency': 'NCC',
-            },
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': '4fca6f5b5e6c3b8a1b887c6dc99db146',
-                'TotalVolume': 163.3,
-                'TotalWeight': 163.3,
-                'MaterialName': 'drinkingWater',
-                'MaterialValue': 0,
-                'MaterialAmount': 1633,
-                'MaterialTicker': 'DW',
-                'MaterialVolume': 0.10000000149011612,
-                'MaterialWeight': 0.10000000149011612,
-                'MaterialCategory': '3f047ec3043bdd795fd7272d6be98799',
-                'MaterialValueCurrency': 'NCC',
-            },
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': '820d081096fd3e8fbd98b4344f6250ad',
-                'TotalVolume': 2.7,
-                'TotalWeight': 2.7,
-                'MaterialName': 'pioneerLuxuryClothing',
-                'MaterialValue': 18239.78,
-                'MaterialAmount': 54,
-                'MaterialTicker': 'PWO',
-                'MaterialVolume': 0.05000000074505806,
-                'MaterialWeight': 0.05000000074505806,
-                'MaterialCategory': '8a0bd8b6a329c3d632da9da63c818b3d',
-                'MaterialValueCurrency': 'NCC',
-            },
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': 'ec8dbb1d3f51d89c61b6f58fdd64a7f0',
-                'TotalVolume': 60.4,
-                'TotalWeight': 60.4,
-                'MaterialName': 'water',
-                'MaterialValue': 0,
-                'MaterialAmount': 302,
-                'MaterialTicker': 'H2O',
-                'MaterialVolume': 0.20000000298023224,
-                'MaterialWeight': 0.20000000298023224,
-                'MaterialCategory': '473218d3618453bf25d2cd0b5616a72f',
-                'MaterialValueCurrency': 'NCC',
-            },
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': '64666b2eb0faaba594a62818e48229b8',
-                'TotalVolume': 0.461,
-                'TotalWeight': 0.922,
-                'MaterialName': 'polymerGranulate',
-                'MaterialValue': 0.41,
-                'MaterialAmount': 461,
-                'MaterialTicker': 'PG',
-                'MaterialVolume': 0.0010000000474974513,
-                'MaterialWeight': 0.0020000000949949026,
-                'MaterialCategory': '6316282906a9f68b0c7bb4396a26aa95',
-                'MaterialValueCurrency': 'NCC',
-            },
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': '9842ad8d9dfdf8e4c2e80117e7b5ebaf',
-                'TotalVolume': 13.5,
-                'TotalWeight': 13.5,
-                'MaterialName': 'pioneerLuxuryDrink',
-                'MaterialValue': 0,
-                'MaterialAmount': 135,
-                'MaterialTicker': 'COF',
-                'MaterialVolume': 0.10000000149011612,
-                'MaterialWeight': 0.10000000149011612,
-                'MaterialCategory': '8a0bd8b6a329c3d632da9da63c818b3d',
-                'MaterialValueCurrency': 'NCC',
-            },
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': '83dd61885cf6879ff49fe1419f068f10',
-                'TotalVolume': 163.2,
-                'TotalWeight': 342.72,
-                'MaterialName': 'rations',
-                'MaterialValue': 0,
-                'MaterialAmount': 1632,
-                'MaterialTicker': 'RAT',
-                'MaterialVolume': 0.10000000149011612,
-                'MaterialWeight': 0.20999999344348907,
-                'MaterialCategory': '3f047ec3043bdd795fd7272d6be98799',
-                'MaterialValueCurrency': 'NCC',
-            },
-        ],
-        'AddressableId': 'cce8a71a1d9a0672c927aebe65072491',
-        'VolumeCapacity': 6500,
-        'WeightCapacity': 6500,
-        'UserNameSubmitted': 'SFSCORPIO',
-    },
-    {
-        'Name': 'Gallium',
-        'Type': 'STL_FUEL_STORE',
-        'StorageId': 'cf24c81d7c22d16409d11d35866466a1',
-        'Timestamp': '2026-03-02T15:31:47.378343Z',
-        'VolumeLoad': 210,
-        'WeightLoad': 210,
-        'StorageItems': [
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': '7756a0779efe67f0f293f41eda4944d4',
-                'TotalVolume': 210,
-                'TotalWeight': 210,
-                'MaterialName': 'stlFuel',
-                'MaterialValue': 56879.31,
-                'MaterialAmount': 3500,
-                'MaterialTicker': 'SF',
-                'MaterialVolume': 0.05999999865889549,
-                'MaterialWeight': 0.05999999865889549,
-                'MaterialCategory': 'ba98fa0cf77040a96cd8a608ad0d08e9',
-                'MaterialValueCurrency': 'NCC',
-            }
-        ],
-        'AddressableId': 'c314789df16a9920317a230ef7e9ac66',
-        'VolumeCapacity': 210,
-        'WeightCapacity': 210,
-        'UserNameSubmitted': 'SFSCORPIO',
-    },
-    {
-        'Name': 'Argon',
-        'Type': 'FTL_FUEL_STORE',
-        'StorageId': 'd047916d44251e0a985008487d5d47df',
-        'Timestamp': '2026-03-02T15:31:47.378343Z',
-        'VolumeLoad': 19.58,
-        'WeightLoad': 97.9,
-        'StorageItems': [
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': '7a2a12cd6872b89a6b97532618788a4d',
-                'TotalVolume': 19.58,
-                'TotalWeight': 97.9,
-                'MaterialName': 'ftlFuel',
-                'MaterialValue': 35895.13,
-                'MaterialAmount': 1958,
-                'MaterialTicker': 'FF',
-                'MaterialVolume': 0.009999999776482582,
-                'MaterialWeight': 0.05000000074505806,
-                'MaterialCategory': 'ba98fa0cf77040a96cd8a608ad0d08e9',
-                'MaterialValueCurrency': 'NCC',
-            }
-        ],
-        'AddressableId': 'c6bd8fa4139dcc7bdaf0cb722db30489',
-        'VolumeCapacity': 20,
-        'WeightCapacity': 100,
-        'UserNameSubmitted': 'SFSCORPIO',
-    },
-    {
-        'Name': 'Yttrium',
-        'Type': 'STL_FUEL_STORE',
-        'StorageId': 'd05384b48b6c00b11b8b6fbcaf73c01b',
-        'Timestamp': '2026-03-02T15:31:47.378343Z',
-        'VolumeLoad': 210,
-        'WeightLoad': 210,
-        'StorageItems': [
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': '7756a0779efe67f0f293f41eda4944d4',
-                'TotalVolume': 210,
-                'TotalWeight': 210,
-                'MaterialName': 'stlFuel',
-                'MaterialValue': 8605.09,
-                'MaterialAmount': 3500,
-                'MaterialTicker': 'SF',
-                'MaterialVolume': 0.05999999865889549,
-                'MaterialWeight': 0.05999999865889549,
-                'MaterialCategory': 'ba98fa0cf77040a96cd8a608ad0d08e9',
-                'MaterialValueCurrency': 'NCC',
-            }
-        ],
-        'AddressableId': 'b6c3e584b96f887b029268c712a32821',
-        'VolumeCapacity': 210,
-        'WeightCapacity': 210,
-        'UserNameSubmitted': 'SFSCORPIO',
-    },
-    {
-        'Name': 'Potassium',
-        'Type': 'FTL_FUEL_STORE',
-        'StorageId': 'd18fa4b24a32e5f00b6feee755083025',
-        'Timestamp': '2026-03-02T15:31:47.378343Z',
-        'VolumeLoad': 20,
-        'WeightLoad': 100,
-        'StorageItems': [
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': '7a2a12cd6872b89a6b97532618788a4d',
-                'TotalVolume': 20,
-                'TotalWeight': 100,
-                'MaterialName': 'ftlFuel',
-                'MaterialValue': 33871.87,
-                'MaterialAmount': 2000,
-                'MaterialTicker': 'FF',
-                'MaterialVolume': 0.009999999776482582,
-                'MaterialWeight': 0.05000000074505806,
-                'MaterialCategory': 'ba98fa0cf77040a96cd8a608ad0d08e9',
-                'MaterialValueCurrency': 'NCC',
-            }
-        ],
-        'AddressableId': 'd971f7b29931540f77302c4c72a0a07e',
-        'VolumeCapacity': 20,
-        'WeightCapacity': 100,
-        'UserNameSubmitted': 'SFSCORPIO',
-    },
-    {
-        'Name': 'Beryllium',
-        'Type': 'SHIP_STORE',
-        'StorageId': 'd206396f01cfdcba89cfd5078c7ce233',
-        'Timestamp': '2026-03-02T15:31:47.378343Z',
-        'VolumeLoad': 0,
-        'WeightLoad': 0,
-        'StorageItems': [],
-        'AddressableId': 'cdecb2bd28a30d5f4d49d13a33b23dbc',
-        'VolumeCapacity': 2000,
-        'WeightCapacity': 2000,
-        'UserNameSubmitted': 'SFSCORPIO',
-    },
-    {
-        'Name': 'Oxygen',
-        'Type': 'SHIP_STORE',
-        'StorageId': 'd3a9fab26c46e49b90c4b7fe00b92efb',
-        'Timestamp': '2026-03-02T15:31:47.378343Z',
-        'VolumeLoad': 0,
-        'WeightLoad': 0,
-        'StorageItems': [],
-        'AddressableId': 'e1b36a7b1fba4354356a091f8f413ecf',
-        'VolumeCapacity': 2000,
-        'WeightCapacity': 2000,
-        'UserNameSubmitted': 'SFSCORPIO',
-    },
-    {
-        'Name': 'Molybdenum',
-        'Type': 'STL_FUEL_STORE',
-        'StorageId': 'd3bda61a55b9a88f63954c3e1ade2861',
-        'Timestamp': '2026-03-02T15:31:47.378343Z',
-        'VolumeLoad': 210,
-        'WeightLoad': 210,
-        'StorageItems': [
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': '7756a0779efe67f0f293f41eda4944d4',
-                'TotalVolume': 210,
-                'TotalWeight': 210,
-                'MaterialName': 'stlFuel',
-                'MaterialValue': 3523.59,
-                'MaterialAmount': 3500,
-                'MaterialTicker': 'SF',
-                'MaterialVolume': 0.05999999865889549,
-                'MaterialWeight': 0.05999999865889549,
-                'MaterialCategory': 'ba98fa0cf77040a96cd8a608ad0d08e9',
-                'MaterialValueCurrency': 'NCC',
-            }
-        ],
-        'AddressableId': '260f304a705e06d8bb003296dd5f8953',
-        'VolumeCapacity': 210,
-        'WeightCapacity': 210,
-        'UserNameSubmitted': 'SFSCORPIO',
-    },
-    {
-        'Name': 'Antimony',
-        'Type': 'STL_FUEL_STORE',
-        'StorageId': 'd51f955e1e28ad7bf422dffe4db925b2',
-        'Timestamp': '2026-03-02T15:31:47.378343Z',
-        'VolumeLoad': 201.9,
-        'WeightLoad': 201.9,
-        'StorageItems': [
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': '7756a0779efe67f0f293f41eda4944d4',
-                'TotalVolume': 201.9,
-                'TotalWeight': 201.9,
-                'MaterialName': 'stlFuel',
-                'MaterialValue': 14993.81,
-                'MaterialAmount': 3365,
-                'MaterialTicker': 'SF',
-                'MaterialVolume': 0.05999999865889549,
-                'MaterialWeight': 0.05999999865889549,
-                'MaterialCategory': 'ba98fa0cf77040a96cd8a608ad0d08e9',
-                'MaterialValueCurrency': 'NCC',
-            }
-        ],
-        'AddressableId': 'f2085c49847885ef760ee305cd6cd7e2',
-        'VolumeCapacity': 210,
-        'WeightCapacity': 210,
-        'UserNameSubmitted': 'SFSCORPIO',
-    },
-    {
-        'Name': 'Iron',
-        'Type': 'SHIP_STORE',
-        'StorageId': 'd5d7529918edb555a94a58e1e0f61f0d',
-        'Timestamp': '2026-03-02T15:31:47.378343Z',
-        'VolumeLoad': 0,
-        'WeightLoad': 0,
-        'StorageItems': [],
-        'AddressableId': 'd1f8c4e5ba748868f93811eb9e3e967e',
-        'VolumeCapacity': 2000,
-        'WeightCapacity': 2000,
-        'UserNameSubmitted': 'SFSCORPIO',
-    },
-    {
-        'Name': 'Zinc',
-        'Type': 'FTL_FUEL_STORE',
-        'StorageId': 'd5dbd776d0f50d5ac450e15151df2ad5',
-        'Timestamp': '2026-03-02T15:31:47.378343Z',
-        'VolumeLoad': 8,
-        'WeightLoad': 40,
-        'StorageItems': [
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': '7a2a12cd6872b89a6b97532618788a4d',
-                'TotalVolume': 8,
-                'TotalWeight': 40,
-                'MaterialName': 'ftlFuel',
-                'MaterialValue': 13492.35,
-                'MaterialAmount': 800,
-                'MaterialTicker': 'FF',
-                'MaterialVolume': 0.009999999776482582,
-                'MaterialWeight': 0.05000000074505806,
-                'MaterialCategory': 'ba98fa0cf77040a96cd8a608ad0d08e9',
-                'MaterialValueCurrency': 'NCC',
-            }
-        ],
-        'AddressableId': '6c9ad6b6462bbce6667ff6361c424ba4',
-        'VolumeCapacity': 8,
-        'WeightCapacity': 40,
-        'UserNameSubmitted': 'SFSCORPIO',
-    },
-    {
-        'Name': 'Beryllium',
-        'Type': 'STL_FUEL_STORE',
-        'StorageId': 'd6ba8ba4a66123f481acd7b6c995e246',
-        'Timestamp': '2026-03-02T15:31:47.378343Z',
-        'VolumeLoad': 192.36,
-        'WeightLoad': 192.36,
-        'StorageItems': [
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': '7756a0779efe67f0f293f41eda4944d4',
-                'TotalVolume': 192.36,
-                'TotalWeight': 192.36,
-                'MaterialName': 'stlFuel',
-                'MaterialValue': 52994.98,
-                'MaterialAmount': 3206,
-                'MaterialTicker': 'SF',
-                'MaterialVolume': 0.05999999865889549,
-                'MaterialWeight': 0.05999999865889549,
-                'MaterialCategory': 'ba98fa0cf77040a96cd8a608ad0d08e9',
-                'MaterialValueCurrency': 'NCC',
-            }
-        ],
-        'AddressableId': 'cdecb2bd28a30d5f4d49d13a33b23dbc',
-        'VolumeCapacity': 210,
-        'WeightCapacity': 210,
-        'UserNameSubmitted': 'SFSCORPIO',
-    },
-    {
-        'Name': 'Iron',
-        'Type': 'STL_FUEL_STORE',
-        'StorageId': 'd6f646dcbec2cd20b46d065a1b194efc',
-        'Timestamp': '2026-03-02T15:31:47.378343Z',
-        'VolumeLoad': 210,
-        'WeightLoad': 210,
-        'StorageItems': [
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': '7756a0779efe67f0f293f41eda4944d4',
-                'TotalVolume': 210,
-                'TotalWeight': 210,
-                'MaterialName': 'stlFuel',
-                'MaterialValue': 56286.15,
-                'MaterialAmount': 3500,
-                'MaterialTicker': 'SF',
-                'MaterialVolume': 0.05999999865889549,
-                'MaterialWeight': 0.05999999865889549,
-                'MaterialCategory': 'ba98fa0cf77040a96cd8a608ad0d08e9',
-                'MaterialValueCurrency': 'NCC',
-            }
-        ],
-        'AddressableId': 'd1f8c4e5ba748868f93811eb9e3e967e',
-        'VolumeCapacity': 210,
-        'WeightCapacity': 210,
-        'UserNameSubmitted': 'SFSCORPIO',
-    },
-    {
-        'Name': 'Cadmium',
-        'Type': 'SHIP_STORE',
-        'StorageId': 'd84ad4a6da4a68e77fd9cb74f8627fc0',
-        'Timestamp': '2026-03-02T15:31:47.378343Z',
-        'VolumeLoad': 0,
-        'WeightLoad': 0,
-        'StorageItems': [],
-        'AddressableId': '50dfff773688cc2285e4813a1078a544',
-        'VolumeCapacity': 2000,
-        'WeightCapacity': 2000,
-        'UserNameSubmitted': 'SFSCORPIO',
-    },
-    {
-        'Name': 'Chromium',
-        'Type': 'STL_FUEL_STORE',
-        'StorageId': 'd955d92feeb3b0ffea4c0f1a7c89a611',
-        'Timestamp': '2026-03-02T15:31:47.378343Z',
-        'VolumeLoad': 210,
-        'WeightLoad': 210,
-        'StorageItems': [
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': '7756a0779efe67f0f293f41eda4944d4',
-                'TotalVolume': 210,
-                'TotalWeight': 210,
-                'MaterialName': 'stlFuel',
-                'MaterialValue': 57165.81,
-                'MaterialAmount': 3500,
-                'MaterialTicker': 'SF',
-                'MaterialVolume': 0.05999999865889549,
-                'MaterialWeight': 0.05999999865889549,
-                'MaterialCategory': 'ba98fa0cf77040a96cd8a608ad0d08e9',
-                'MaterialValueCurrency': 'NCC',
-            }
-        ],
-        'AddressableId': 'd95ef01aead4472e8dce94cdab8aeccb',
-        'VolumeCapacity': 210,
-        'WeightCapacity': 210,
-        'UserNameSubmitted': 'SFSCORPIO',
-    },
-    {
-        'Name': 'Ruthenium',
-        'Type': 'STL_FUEL_STORE',
-        'StorageId': 'de2499ab5eb90ea04edf5b8323ec6b24',
-        'Timestamp': '2026-03-02T15:31:47.378343Z',
-        'VolumeLoad': 210,
-        'WeightLoad': 210,
-        'StorageItems': [
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': '7756a0779efe67f0f293f41eda4944d4',
-                'TotalVolume': 210,
-                'TotalWeight': 210,
-                'MaterialName': 'stlFuel',
-                'MaterialValue': 6624.92,
-                'MaterialAmount': 3500,
-                'MaterialTicker': 'SF',
-                'MaterialVolume': 0.05999999865889549,
-                'MaterialWeight': 0.05999999865889549,
-                'MaterialCategory': 'ba98fa0cf77040a96cd8a608ad0d08e9',
-                'MaterialValueCurrency': 'NCC',
-            }
-        ],
-        'AddressableId': 'f3296b313d2f98774a9aeab4a9eb7e59',
-        'VolumeCapacity': 210,
-        'WeightCapacity': 210,
-        'UserNameSubmitted': 'SFSCORPIO',
-    },
-    {
-        'Name': 'Argon',
-        'Type': 'SHIP_STORE',
-        'StorageId': 'def4ed53c1d69b4f927845e82c5dd195',
-        'Timestamp': '2026-03-02T15:31:47.378343Z',
-        'VolumeLoad': 1480,
-        'WeightLoad': 787.2,
-        'StorageItems': [
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': 'c76b4100059661084315938999623c26',
-                'TotalVolume': 244,
-                'TotalWeight': 195.2,
-                'MaterialName': 'hydrocarbonPlants',
-                'MaterialValue': 0,
-                'MaterialAmount': 244,
-                'MaterialTicker': 'HCP',
-                'MaterialVolume': 1,
-                'MaterialWeight': 0.800000011920929,
-                'MaterialCategory': '510e7751c0eb6a51fd0fa73565365d1c',
-                'MaterialValueCurrency': 'NCC',
-            },
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': '1a1f13b7fc3e0fb6aa292b7c28764f93',
-                'TotalVolume': 992,
-                'TotalWeight': 396.8,
-                'MaterialName': 'herbs',
-                'MaterialValue': 0,
-                'MaterialAmount': 992,
-                'MaterialTicker': 'HER',
-                'MaterialVolume': 1,
-                'MaterialWeight': 0.4000000059604645,
-                'MaterialCategory': '510e7751c0eb6a51fd0fa73565365d1c',
-                'MaterialValueCurrency': 'NCC',
-            },
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': 'e97e2535fec019710299709a7462c066',
-                'TotalVolume': 244,
-                'TotalWeight': 195.2,
-                'MaterialName': 'proteinBeans',
-                'MaterialValue': 0,
-                'MaterialAmount': 244,
-                'MaterialTicker': 'BEA',
-                'MaterialVolume': 1,
-                'MaterialWeight': 0.800000011920929,
-                'MaterialCategory': '510e7751c0eb6a51fd0fa73565365d1c',
-                'MaterialValueCurrency': 'NCC',
-            },
-        ],
-        'AddressableId': 'c6bd8fa4139dcc7bdaf0cb722db30489',
-        'VolumeCapacity': 2000,
-        'WeightCapacity': 2000,
-        'UserNameSubmitted': 'SFSCORPIO',
-    },
-    {
-        'Name': 'Cobalt',
-        'Type': 'SHIP_STORE',
-        'StorageId': 'e45400e5fdb2f91118617e5703e2894c',
-        'Timestamp': '2026-03-02T15:31:47.378343Z',
-        'VolumeLoad': 0,
-        'WeightLoad': 0,
-        'StorageItems': [],
-        'AddressableId': 'bb606e05994019edd659b35322990904',
-        'VolumeCapacity': 2000,
-        'WeightCapacity': 2000,
-        'UserNameSubmitted': 'SFSCORPIO',
-    },
-    {
-        'Name': 'Tin',
-        'Type': 'SHIP_STORE',
-        'StorageId': 'e6acc7c466c44b3fe51f6f1bf0302883',
-        'Timestamp': '2026-03-02T15:31:47.378343Z',
-        'VolumeLoad': 0,
-        'WeightLoad': 0,
-        'StorageItems': [],
-        'AddressableId': '88722534103087695b5daf5321cc2281',
-        'VolumeCapacity': 2000,
-        'WeightCapacity': 2000,
-        'UserNameSubmitted': 'SFSCORPIO',
-    },
-    {
-        'Name': 'Neon',
-        'Type': 'STL_FUEL_STORE',
-        'StorageId': 'e77bad9a750768c359bc314a9d7113e6',
-        'Timestamp': '2026-03-02T15:31:47.378343Z',
-        'VolumeLoad': 210,
-        'WeightLoad': 210,
-        'StorageItems': [
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': '7756a0779efe67f0f293f41eda4944d4',
-                'TotalVolume': 210,
-                'TotalWeight': 210,
-                'MaterialName': 'stlFuel',
-                'MaterialValue': 52698.4,
-                'MaterialAmount': 3500,
-                'MaterialTicker': 'SF',
-                'MaterialVolume': 0.05999999865889549,
-                'MaterialWeight': 0.05999999865889549,
-                'MaterialCategory': 'ba98fa0cf77040a96cd8a608ad0d08e9',
-                'MaterialValueCurrency': 'NCC',
-            }
-        ],
-        'AddressableId': 'b87025991fbc969ce70f9210caa51110',
-        'VolumeCapacity': 210,
-        'WeightCapacity': 210,
-        'UserNameSubmitted': 'SFSCORPIO',
-    },
-    {
-        'Name': 'Oxygen',
-        'Type': 'STL_FUEL_STORE',
-        'StorageId': 'e7f2cb50a215b6525518194aa4ac7509',
-        'Timestamp': '2026-03-02T15:31:47.378343Z',
-        'VolumeLoad': 210,
-        'WeightLoad': 210,
-        'StorageItems': [
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': '7756a0779efe67f0f293f41eda4944d4',
-                'TotalVolume': 210,
-                'TotalWeight': 210,
-                'MaterialName': 'stlFuel',
-                'MaterialValue': 52407.61,
-                'MaterialAmount': 3500,
-                'MaterialTicker': 'SF',
-                'MaterialVolume': 0.05999999865889549,
-                'MaterialWeight': 0.05999999865889549,
-                'MaterialCategory': 'ba98fa0cf77040a96cd8a608ad0d08e9',
-                'MaterialValueCurrency': 'NCC',
-            }
-        ],
-        'AddressableId': 'e1b36a7b1fba4354356a091f8f413ecf',
-        'VolumeCapacity': 210,
-        'WeightCapacity': 210,
-        'UserNameSubmitted': 'SFSCORPIO',
-    },
-    {
-        'Name': 'Boron',
-        'Type': 'FTL_FUEL_STORE',
-        'StorageId': 'e866d57d6031632c141aa4b012fffe57',
-        'Timestamp': '2026-03-02T15:31:47.378343Z',
-        'VolumeLoad': 19.14,
-        'WeightLoad': 95.7,
-        'StorageItems': [
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': '7a2a12cd6872b89a6b97532618788a4d',
-                'TotalVolume': 19.14,
-                'TotalWeight': 95.7,
-                'MaterialName': 'ftlFuel',
-                'MaterialValue': 33976.62,
-                'MaterialAmount': 1914,
-                'MaterialTicker': 'FF',
-                'MaterialVolume': 0.009999999776482582,
-                'MaterialWeight': 0.05000000074505806,
-                'MaterialCategory': 'ba98fa0cf77040a96cd8a608ad0d08e9',
-                'MaterialValueCurrency': 'NCC',
-            }
-        ],
-        'AddressableId': '2b14db4e8fd72dd90e0b1a9b3a91e005',
-        'VolumeCapacity': 20,
-        'WeightCapacity': 100,
-        'UserNameSubmitted': 'SFSCORPIO',
-    },
-    {
-        'Name': 'Chlorine',
-        'Type': 'STL_FUEL_STORE',
-        'StorageId': 'e8f01e84fd5bf9a9995b2a63f6564deb',
-        'Timestamp': '2026-03-02T15:31:47.378343Z',
-        'VolumeLoad': 210,
-        'WeightLoad': 210,
-        'StorageItems': [
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': '7756a0779efe67f0f293f41eda4944d4',
-                'TotalVolume': 210,
-                'TotalWeight': 210,
-                'MaterialName': 'stlFuel',
-                'MaterialValue': 57245.9,
-                'MaterialAmount': 3500,
-                'MaterialTicker': 'SF',
-                'MaterialVolume': 0.05999999865889549,
-                'MaterialWeight': 0.05999999865889549,
-                'MaterialCategory': 'ba98fa0cf77040a96cd8a608ad0d08e9',
-                'MaterialValueCurrency': 'NCC',
-            }
-        ],
-        'AddressableId': 'b1e1ed9eb0c4841118a99435edfb0c94',
-        'VolumeCapacity': 210,
-        'WeightCapacity': 210,
-        'UserNameSubmitted': 'SFSCORPIO',
-    },
-    {
-        'Name': 'Selenium',
-        'Type': 'SHIP_STORE',
-        'StorageId': 'ea3adcff3ca3517ff6f0935315a02bcd',
-        'Timestamp': '2026-03-02T15:31:47.378343Z',
-        'VolumeLoad': 0,
-        'WeightLoad': 0,
-        'StorageItems': [],
-        'AddressableId': '4eece2c7f352df023c43b14d65b3237a',
-        'VolumeCapacity': 2000,
-        'WeightCapacity': 2000,
-        'UserNameSubmitted': 'SFSCORPIO',
-    },
-    {
-        'Name': '53 Iodine',
-        'Type': 'FTL_FUEL_STORE',
-        'StorageId': 'ed6b06d30e59af388e0fd727403a33f8',
-        'Timestamp': '2026-03-02T15:31:47.378343Z',
-        'VolumeLoad': 19.71,
-        'WeightLoad': 98.55,
-        'StorageItems': [
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': '7a2a12cd6872b89a6b97532618788a4d',
-                'TotalVolume': 19.71,
-                'TotalWeight': 98.55,
-                'MaterialName': 'ftlFuel',
-                'MaterialValue': 7548.68,
-                'MaterialAmount': 1971,
-                'MaterialTicker': 'FF',
-                'MaterialVolume': 0.009999999776482582,
-                'MaterialWeight': 0.05000000074505806,
-                'MaterialCategory': 'ba98fa0cf77040a96cd8a608ad0d08e9',
-                'MaterialValueCurrency': 'NCC',
-            }
-        ],
-        'AddressableId': '0f99161e9049c837a4c72956502dd9a3',
-        'VolumeCapacity': 20,
-        'WeightCapacity': 100,
-        'UserNameSubmitted': 'SFSCORPIO',
-    },
-    {
-        'Name': 'Lithium',
-        'Type': 'FTL_FUEL_STORE',
-        'StorageId': 'edd92e134aedd9b75c21373cf190da83',
-        'Timestamp': '2026-03-02T15:31:47.378343Z',
-        'VolumeLoad': 20,
-        'WeightLoad': 100,
-        'StorageItems': [
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': '7a2a12cd6872b89a6b97532618788a4d',
-                'TotalVolume': 20,
-                'TotalWeight': 100,
-                'MaterialName': 'ftlFuel',
-                'MaterialValue': 36075.5,
-                'MaterialAmount': 2000,
-                'MaterialTicker': 'FF',
-                'MaterialVolume': 0.009999999776482582,
-                'MaterialWeight': 0.05000000074505806,
-                'MaterialCategory': 'ba98fa0cf77040a96cd8a608ad0d08e9',
-                'MaterialValueCurrency': 'NCC',
-            }
-        ],
-        'AddressableId': 'bb42c6e0de182b7d86dc35b61b8bf9b9',
-        'VolumeCapacity': 20,
-        'WeightCapacity': 100,
-        'UserNameSubmitted': 'SFSCORPIO',
-    },
-    {
-        'Name': 'Phosphorus',
-        'Type': 'FTL_FUEL_STORE',
-        'StorageId': 'f2974f84b5de34db6e0e0219e41c81a5',
-        'Timestamp': '2026-03-02T15:31:47.378343Z',
-        'VolumeLoad': 20,
-        'WeightLoad': 100,
-        'StorageItems': [
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': '7a2a12cd6872b89a6b97532618788a4d',
-                'TotalVolume': 20,
-                'TotalWeight': 100,
-                'MaterialName': 'ftlFuel',
-                'MaterialValue': 34370.89,
-                'MaterialAmount': 2000,
-                'MaterialTicker': 'FF',
-                'MaterialVolume': 0.009999999776482582,
-                'MaterialWeight': 0.05000000074505806,
-                'MaterialCategory': 'ba98fa0cf77040a96cd8a608ad0d08e9',
-                'MaterialValueCurrency': 'NCC',
-            }
-        ],
-        'AddressableId': 'eaeb72e975eba33df85e530c14f810ec',
-        'VolumeCapacity': 20,
-        'WeightCapacity': 100,
-        'UserNameSubmitted': 'SFSCORPIO',
-    },
-    {
-        'Name': 'Silicon',
-        'Type': 'SHIP_STORE',
-        'StorageId': 'f56ebd1c13daf6fe8c80cd953bc53c7f',
-        'Timestamp': '2026-03-02T15:31:47.378343Z',
-        'VolumeLoad': 0,
-        'WeightLoad': 0,
-        'StorageItems': [],
-        'AddressableId': '4d249613111db220f2f6bbe3d060238f',
-        'VolumeCapacity': 2000,
-        'WeightCapacity': 2000,
-        'UserNameSubmitted': 'SFSCORPIO',
-    },
-    {
-        'Name': 'Hydrogen',
-        'Type': 'STL_FUEL_STORE',
-        'StorageId': 'fa7e608a026510ae9c54eeaf1d81c5f2',
-        'Timestamp': '2026-03-02T15:31:47.378343Z',
-        'VolumeLoad': 90,
-        'WeightLoad': 90,
-        'StorageItems': [
-            {
-                'Type': 'INVENTORY',
-                'MaterialId': '7756a0779efe67f0f293f41eda4944d4',
-                'TotalVolume': 90,
-                'TotalWeight': 90,
-                'MaterialName': 'stlFuel',
-                'MaterialValue': 24885.36,
-                'MaterialAmount': 1500,
-                'MaterialTicker': 'SF',
-                'MaterialVolume': 0.05999999865889549,
-                'MaterialWeight': 0.05999999865889549,
-                'MaterialCategory': 'ba98fa0cf77040a96cd8a608ad0d08e9',
-                'MaterialValueCurrency': 'NCC',
-            }
-        ],
-        'AddressableId': '09b5c5080f7c1e2c46aff0b66a33bf09',
-        'VolumeCapacity': 90,
-        'WeightCapacity': 90,
-        'UserNameSubmitted': 'SFSCORPIO',
-    },
-]
+from gamedata.fio.standin import load_standin_payload
+
+fio_storage_data = load_standin_payload('storage')
@@ -1,87 +1,3 @@
-fio_warehouse_data = [
-    {
-        'Units': 4,
-        'StoreId': '6692d0681e4c1aab14b1cc7fa0c28249',
-        'FeeAmount': 400,
-        'Timestamp': '2026-03-02T15:31:46.691977Z',
-        'FeeCurrency': 'ICA',
-        'WarehouseId': 'd5e09edac5e0f21d66f460c56ddb8094-6692d0681e4c1aab14b1cc7fa0c28249',
-        'LocationName': 'Hortus Station',
-        'FeeCollectorId': None,
-        'VolumeCapacity': 2000,
-        'WeightCapacity': 2000,
-        'FeeCollectorCode': None,
-        'FeeCollectorName': None,
-        'LocationNaturalId': 'HRT',
-        'UserNameSubmitted': 'SFSCORPIO',
-        'NextPaymentTimestampEpochMs': 1772522509219,
-    },
-    {
-        'Units': 6,
-        'StoreId': '6590b6e7c9e416a548e5ad761670c7b2',
-        'FeeAmount': 600,
-        'Timestamp': '2026-03-02T15:31:46.691977Z',
-        'FeeCurrency': 'AIC',
-        'WarehouseId': '3dcb8cb1af434538a31d927b5afc10e8-6590b6e7c9e416a548e5ad761670c7b2',
-        'LocationName': 'Deimos',
-        'FeeCollectorId': None,
-        'VolumeCapacity': 3000,
-        'WeightCapacity': 3000,
-        'FeeCollectorCode': None,
-        'FeeCollectorName': None,
-        'LocationNaturalId': 'ZV-759c',
-        'UserNameSubmitted': 'SFSCORPIO',
-        'NextPaymentTimestampEpochMs': 1773040202042,
-    },
-    {
-        'Units': 4,
-        'StoreId': '5d817c73ae8c9c366d1f12da24b80c6e',
-        'FeeAmount': 400,
-        'Timestamp': '2026-03-02T15:31:46.691977Z',
-        'FeeCurrency': 'NCC',
-        'WarehouseId': 'e83d8b9da72479e292363c9d16ade4e5-5d817c73ae8c9c366d1f12da24b80c6e',
-        'LocationName': 'Moria Station',
-        'FeeCollectorId': None,
-        'VolumeCapacity': 2000,
-        'WeightCapacity': 2000,
-        'FeeCollectorCode': None,
-        'FeeCollectorName': None,
-        'LocationNaturalId': 'MOR',
-        'UserNameSubmitted': 'SFSCORPIO',
-        'NextPaymentTimestampEpochMs': 1772637463947,
-    },
-    {
-        'Units': 215,
-        'StoreId': '5d238f91f74c890e532ccb3fb47dcca3',
-        'FeeAmount': 21500,
-        'Timestamp': '2026-03-02T15:31:46.691977Z',
-        'FeeCurrency': 'AIC',
-        'WarehouseId': 'd4022e28a230c1b2f4354e373d169601-5d238f91f74c890e532ccb3fb47dcca3',
-        'LocationName': 'Antares Station',
-        'FeeCollectorId': None,
-        'VolumeCapacity': 107500,
-        'WeightCapacity': 107500,
-        'FeeCollectorCode': None,
-        'FeeCollectorName': None,
-        'LocationNaturalId': 'ANT',
-        'UserNameSubmitted': 'SFSCORPIO',
-        'NextPaymentTimestampEpochMs': 1772623106342,
-    },
-    {
-        'Units': 1,
-        'StoreId': '5331561fb3a9391cd173dd5205c2ed6f',
-        'FeeAmount': 100,
-        'Timestamp': '2026-03-02T15:31:46.691977Z',
-        'FeeCurrency': 'CIS',
-        'WarehouseId': 'f7aec400e11912141df1685b27cd7422-5331561fb3a9391cd173dd5205c2ed6f',
-        'LocationName': 'Benten Station',
-        'FeeCollectorId': None,
-        'VolumeCapacity': 500,
-        'WeightCapacity': 500,
-        'FeeCollectorCode': None,
-        'FeeCollectorName': None,
-        'LocationNaturalId': 'BEN',
-        'UserNameSubmitted': 'SFSCORPIO',
-        'NextPaymentTimestampEpochMs': 1772798082875,
-    },
-]
+from gamedata.fio.standin import load_standin_payload
+
+fio_warehouse_data = load_standin_payload('warehouses')
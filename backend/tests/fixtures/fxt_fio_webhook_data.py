@@ -0,0 +1,38 @@
+from typing import Any
+
+
+def fio_webhook_cx_entry(ticker: str = 'RAT', exchange_code: str = 'AI1', **overrides: Any) -> dict[str, Any]:
+    entry = {
+        'CXEntryId': f'{ticker}{exchange_code}'.ljust(32, '0')[:32],
+        'MaterialId': 'a' * 32,
+        'ExchangeId': 'b' * 32,
+        'MaterialTicker': ticker,
+        'ExchangeCode': exchange_code,
+        'CurrencyCode': 'AIC',
+        'Timestamp': '2026-03-02T15:31:47.378343Z',
+        'Demand': 120,
+        'Supply': 80,
+        'Traded': 10,
+        'BuyOrders': [],
+        'SellOrders': [],
+        'Price': 51.0,
+        'Ask': 52.0,
+        'AskCount': 4,
+        'Bid': 50.0,
+        'BidCount': 6,
+        'PriceAverage': 51.5,
+    }
+    entry.update(overrides)
+    return entry
+
+
+def fio_webhook_payload(*messages: dict[str, Any]) -> dict[str, Any]:
+    return {'Data': list(messages)}
+
+
+def fio_webhook_cx_message(*entries: dict[str, Any]) -> dict[str, Any]:
+    return {'Endpoint': '/cx', 'Data': list(entries)}
+
+
+def fio_webhook_user_message(endpoint: str, user_name: str, *entries: dict[str, Any]) -> dict[str, Any]:
+    return {'Endpoint': endpoint, 'UserName': user_name, 'Data': list(entries)}
@@ -1,9 +1,7 @@
-from pathlib import Path
-
 import pytest
+from gamedata.fio.standin import STANDIN_DATA_DIR
 
 
 @pytest.fixture
 def montem_raw_bytes():
-    path = Path('backend/tests/fixtures/fxt_fio_montem.json')
-    return path.read_bytes()
+    return (STANDIN_DATA_DIR / 'montem.json').read_bytes()
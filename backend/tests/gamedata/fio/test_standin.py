@@ -0,0 +1,53 @@
+import asyncio
+
+import httpx
+import pytest
+from gamedata.fio.schemas import FIOExchangeCXPC, FIOPlanetSchema, FIORecipeSchema, FIOUserStorageSchema
+from gamedata.fio.services import FIOURL
+from gamedata.fio.standin import STANDIN_PLANET_PREFIX, FIOStandinApp
+from pydantic import TypeAdapter
+
+
+def _get(app: FIOStandinApp, path: str) -> httpx.Response:
+    async def fetch():
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url='http://standin') as client:
+            return await client.get(path)
+
+    return asyncio.run(fetch())
+
+
+class TestFIOStandinApp:
+    @pytest.mark.parametrize(
+        'endpoint, suffix, schema',
+        [
+            ('allplanets', '', list[FIOPlanetSchema]),
+            ('planet', 'OT-580b', FIOPlanetSchema),
+            ('allrecipes', '', list[FIORecipeSchema]),
+            ('cxpc', 'BMA.AI1', list[FIOExchangeCXPC]),
+            ('user_storage', 'someone', list[FIOUserStorageSchema]),
+        ],
+    )
+    def test_serves_schema_valid_payloads(self, endpoint, suffix, schema):
+        app = FIOStandinApp(scale=1, cxpc_days=10)
+
+        response = _get(app, f'/{FIOURL.endpoint_path[endpoint]}{suffix}')
+
+        assert response.status_code == 200
+        assert TypeAdapter(schema).validate_json(response.content)
+
+    def test_scales_synthetic_data(self):
+        app = FIOStandinApp(scale=2)
+
+        planets = TypeAdapter(list[FIOPlanetSchema]).validate_json(_get(app, '/planet/allplanets/full').content)
+
+        assert len(planets) == 200
+        assert all(p.planet_natural_id.startswith(STANDIN_PLANET_PREFIX) for p in planets)
+
+    def test_error_rate_and_unknown_paths(self):
+        app = FIOStandinApp(error_rate=1.0, seed=1)
+        assert _get(app, '/recipes/allrecipes').status_code == 503
+        assert app.error_count == 1
+
+        app = FIOStandinApp()
+        assert _get(app, '/does/not/exist').status_code == 404
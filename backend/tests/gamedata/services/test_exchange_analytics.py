@@ -0,0 +1,56 @@
+from unittest.mock import patch
+
+import pytest
+from django.db import connection
+from gamedata.services.exchange_analytics import ExchangeAnalyticsService
+
+
+@pytest.mark.django_db
+class TestExchangeAnalyticsService:
+    def test_noop_outside_postgres(self):
+        with patch.object(connection, 'cursor') as mock_cursor:
+            assert ExchangeAnalyticsService.refresh(['RAT']) == 0
+            assert ExchangeAnalyticsService.refresh_stale() == 0
+
+        mock_cursor.assert_not_called()
+
+    def test_refresh_tickers(self):
+        with patch.object(connection, 'vendor', 'postgresql'), patch.object(connection, 'cursor') as mock_cursor:
+            cursor = mock_cursor.return_value.__enter__.return_value
+            cursor.rowcount = 5
+
+            assert ExchangeAnalyticsService.refresh(['RAT', 'DW', 'RAT']) == 5
+
+        # transaction.atomic issues its SAVEPOINTs through the same cursor
+        upsert, delete = [c for c in cursor.execute.call_args_list if len(c.args) == 2]
+        assert 'INSERT INTO prunplanner_game_exchanges_analytics' in upsert.args[0]
+        assert 'ON CONFLICT (ticker, exchange_code, date_epoch) DO UPDATE' in upsert.args[0]
+        assert delete.args[0].lstrip().startswith('DELETE FROM prunplanner_game_exchanges_analytics')
+        assert upsert.args[1] == delete.args[1]
+        assert upsert.args[1]['tickers'] == ['DW', 'RAT']
+        # bound as a plain value, so the planner can prune CXPC partitions
+        assert '%(since_epoch)s' in upsert.args[0]
+        assert upsert.args[1]['since_epoch'] % 86_400_000 == 0
+
+    def test_refresh_all_and_empty(self):
+        with patch.object(connection, 'vendor', 'postgresql'), patch.object(connection, 'cursor') as mock_cursor:
+            cursor = mock_cursor.return_value.__enter__.return_value
+
+            assert ExchangeAnalyticsService.refresh([]) == 0
+            cursor.execute.assert_not_called()
+
+            ExchangeAnalyticsService.refresh()
+
+        assert [c.args[1]['tickers'] for c in cursor.execute.call_args_list if len(c.args) == 2] == [None] * 2
+
+    def test_refresh_stale(self):
+        with (
+            patch.object(connection, 'vendor', 'postgresql'),
+            patch.object(connection, 'cursor') as mock_cursor,
+            patch.object(ExchangeAnalyticsService, 'refresh', return_value=3) as mock_refresh,
+        ):
+            mock_cursor.return_value.__enter__.return_value.fetchall.return_value = [('RAT',), ('DW',)]
+
+            assert ExchangeAnalyticsService.refresh_stale() == 3
+
+        mock_refresh.assert_called_once_with(['RAT', 'DW'])
@@ -0,0 +1,98 @@
+from decimal import Decimal
+
+import pytest
+from gamedata.models.game_exchange import GameExchangeCXPC
+from gamedata.services.exchange_cxpc import DAY_MS, CXPCHistoryService, CXPCQuery
+
+# 2026-03-02 00:00 UTC, a Monday
+MONDAY = 1772409600000
+
+
+def _day(offset: int, **kwargs) -> dict:
+    return {
+        'ticker': 'DW',
+        'exchange_code': 'AI1',
+        'date_epoch': MONDAY + offset * DAY_MS,
+        'open_p': Decimal(10),
+        'close_p': Decimal(10),
+        'high_p': Decimal(10),
+        'low_p': Decimal(10),
+        'volume': Decimal(0),
+        'traded': Decimal(0),
+    } | kwargs
+
+
+class TestCXPCHistoryService:
+    @pytest.mark.parametrize(
+        'interval, date_epoch, expected',
+        [
+            ('day', MONDAY + 3 * DAY_MS + 1234, MONDAY + 3 * DAY_MS),
+            ('week', MONDAY + 6 * DAY_MS, MONDAY),
+            ('week', MONDAY - DAY_MS, MONDAY - 7 * DAY_MS),
+            ('month', MONDAY + 20 * DAY_MS, 1772323200000),
+        ],
+    )
+    def test_bucket_start(self, interval, date_epoch, expected):
+        assert CXPCHistoryService.bucket_start(date_epoch, interval) == expected
+
+    def test_normalize_and_cache_key(self):
+        query = CXPCHistoryService.normalize('week', from_epoch=MONDAY + DAY_MS + 5, to_epoch=MONDAY + 8 * DAY_MS + 5)
+
+        assert query == CXPCQuery('week', MONDAY, MONDAY + 8 * DAY_MS, None)
+        assert query.cache_key == f'week:{MONDAY}:{MONDAY + 8 * DAY_MS}:'
+        assert CXPCHistoryService.normalize().cache_key is None
+
+    @pytest.mark.django_db
+    def test_aggregate_volume_weighted_close(self, exchange_cxpc_factory):
+        for row in [
+            _day(0, open_p=Decimal(8), high_p=Decimal(12), volume=Decimal(100), traded=Decimal(10)),
+            _day(1, close_p=Decimal(11), low_p=Decimal(7), volume=Decimal(300), traded=Decimal(20)),
+            # next week, no trades: close falls back to the last daily close
+            _day(7, close_p=Decimal(9)),
+            _day(8, close_p=Decimal(6)),
+        ]:
+            exchange_cxpc_factory(**row)
+
+        next_week, week = CXPCHistoryService.aggregate(GameExchangeCXPC.objects.all(), 'week')
+
+        assert week == {
+            'ticker': 'DW',
+            'exchange_code': 'AI1',
+            'date_epoch': MONDAY,
+            'open_p': Decimal(8),
+            'close_p': Decimal('13.3333'),
+            'high_p': Decimal(12),
+            'low_p': Decimal(7),
+            'volume': Decimal(400),
+            'traded': Decimal(30),
+        }
+        assert next_week['date_epoch'] == MONDAY + 7 * DAY_MS
+        assert next_week['close_p'] == Decimal(6)
+
+        # 2026-03-02 and 2026-03-10 share their month
+        (month,) = CXPCHistoryService.aggregate(GameExchangeCXPC.objects.all(), 'month')
+        assert month['date_epoch'] == 1772323200000
+        assert month['traded'] == Decimal(30)
+
+    def test_normalize_bounds_bucketed_range(self):
+        query = CXPCHistoryService.normalize('week', to_epoch=MONDAY)
+        assert query.from_epoch == CXPCHistoryService.bucket_start(MONDAY - 730 * DAY_MS, 'week')
+
+        # a limit reaching further back widens the range
+        query = CXPCHistoryService.normalize('month', to_epoch=MONDAY, limit=100)
+        assert query.from_epoch == CXPCHistoryService.bucket_start(MONDAY - 3100 * DAY_MS, 'month')
+
+    @pytest.mark.django_db
+    def test_fetch_buckets_newest_first_with_limit(self, exchange_cxpc_factory):
+        for exchange_code in ('AI1', 'NC1'):
+            for i in range(21):
+                exchange_cxpc_factory(ticker='DW', exchange_code=exchange_code, date_epoch=MONDAY + i * DAY_MS)
+
+        query = CXPCHistoryService.normalize('week', limit=3)
+        buckets = CXPCHistoryService.fetch('DW', ['AI1', 'NC1'], query)
+
+        assert [(b['date_epoch'], b['exchange_code']) for b in buckets] == [
+            (MONDAY + 14 * DAY_MS, 'AI1'),
+            (MONDAY + 14 * DAY_MS, 'NC1'),
+            (MONDAY + 7 * DAY_MS, 'AI1'),
+        ]
@@ -0,0 +1,60 @@
+from datetime import UTC, datetime
+from unittest.mock import patch
+
+import pytest
+from django.db import connection
+from gamedata.services.exchange_cxpc import CXPCHistoryService
+from gamedata.services.exchange_cxpc_storage import CXPCStorageService
+
+
+@pytest.mark.django_db
+class TestCXPCStorageService:
+    def test_noop_outside_postgres(self):
+        with patch.object(connection, 'cursor') as mock_cursor:
+            assert CXPCStorageService.ensure_partitions() == []
+            assert CXPCStorageService.compact() == 0
+
+        mock_cursor.assert_not_called()
+
+    def test_retention_cutoff(self):
+        with patch('gamedata.services.exchange_cxpc_storage.timezone.now') as mock_now:
+            mock_now.return_value = datetime(2028, 2, 29, 15, tzinfo=UTC)
+            cutoff = CXPCStorageService.retention_cutoff()
+
+        # 2025-02-28 is a Friday, its week starts on Monday 2025-02-24
+        assert cutoff == int(datetime(2025, 2, 24, tzinfo=UTC).timestamp() * 1000)
+        assert CXPCHistoryService.bucket_start(cutoff, 'week') == cutoff
+
+    def test_ensure_partitions(self):
+        with (
+            patch.object(connection, 'vendor', 'postgresql'),
+            patch.object(connection, 'cursor') as mock_cursor,
+            patch('gamedata.services.exchange_cxpc_storage.timezone.now') as mock_now,
+        ):
+            mock_now.return_value = datetime(2026, 10, 19, tzinfo=UTC)
+            cursor = mock_cursor.return_value.__enter__.return_value
+            # this year's partition exists, next year's not
+            cursor.fetchone.side_effect = [('prunplanner_game_exchanges_cxpc_y2026',), (None,)]
+
+            assert CXPCStorageService.ensure_partitions() == ['prunplanner_game_exchanges_cxpc_y2027']
+
+        create = cursor.execute.call_args_list[-1].args[0]
+        assert create.startswith('CREATE TABLE prunplanner_game_exchanges_cxpc_y2027 PARTITION OF')
+        assert f'FROM ({int(datetime(2027, 1, 1, tzinfo=UTC).timestamp() * 1000)})' in create
+        assert f'TO ({int(datetime(2028, 1, 1, tzinfo=UTC).timestamp() * 1000)})' in create
+
+    def test_compact(self):
+        with (
+            patch.object(connection, 'vendor', 'postgresql'),
+            patch.object(connection, 'cursor') as mock_cursor,
+            patch.object(CXPCStorageService, 'retention_cutoff', return_value=1234),
+        ):
+            cursor = mock_cursor.return_value.__enter__.return_value
+            cursor.rowcount = 2
+
+            assert CXPCStorageService.compact() == 2
+
+        # transaction.atomic issues its SAVEPOINTs through the same cursor
+        statements = [c.args for c in cursor.execute.call_args_list if 'cxpc_rollup' in c.args[0]]
+        assert [s[0].split()[0] for s in statements] == ['CREATE', 'DELETE', 'INSERT']
+        assert statements[0][1] == statements[1][1] == {'cutoff': 1234}
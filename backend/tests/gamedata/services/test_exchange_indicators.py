@@ -0,0 +1,149 @@
+from datetime import date
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+from gamedata.services.exchange_cxpc import DAY_MS
+from gamedata.services.exchange_cxpc_storage import CXPCStorageService
+from gamedata.services.exchange_indicators import CXPCIndicatorService
+from model_bakery import baker
+
+# 2026-03-02 00:00 UTC
+START = 1772409600000
+
+
+def _series(close: list[float], volume: list[float] | None = None, traded: list[float] | None = None) -> dict:
+    prices = np.array(close, dtype=np.float64)
+    return {
+        'close': prices,
+        'high': prices + 1,
+        'low': prices - 1,
+        'volume': np.array(volume if volume is not None else close, dtype=np.float64),
+        'traded': np.array(traded if traded is not None else [1.0] * len(close), dtype=np.float64),
+    }
+
+
+class TestCXPCIndicatorService:
+    def test_compute(self):
+        result = CXPCIndicatorService.compute(
+            _series([1, 2, 4, 8], volume=[10, 0, 40, 80], traded=[1, 0, 10, 10]), window=2
+        )
+
+        assert np.isnan(result['sma'][0])
+        assert result['sma'][1:].tolist() == [1.5, 3.0, 6.0]
+        # days without trades only add nothing, a window without any is empty
+        assert result['vwap'][1:].tolist() == [10.0, 4.0, 6.0]
+        assert result['high'][1:].tolist() == [3.0, 5.0, 9.0]
+        assert result['low'][1:].tolist() == [0.0, 1.0, 3.0]
+        # seeded with the first SMA, alpha = 2/3
+        assert result['ema'][1:].tolist() == pytest.approx([1.5, 3.1666666, 6.3888888])
+        # doubling every day, constant log returns
+        assert np.isnan(result['volatility'][1])
+        assert result['volatility'][2:].tolist() == pytest.approx([0.0, 0.0])
+
+    def test_compute_short_and_empty_windows(self):
+        result = CXPCIndicatorService.compute(_series([np.nan, np.nan, 3.0]), window=2)
+        assert all(np.isnan(result[name]).all() for name in ('sma', 'ema', 'high', 'low', 'volatility'))
+
+        result = CXPCIndicatorService.compute(_series([1.0]), window=2)
+        assert all(np.isnan(values).all() for values in result.values())
+
+    @pytest.mark.django_db
+    def test_load_fills_gaps(self):
+        for offset, close in ((1, 10), (3, 20)):
+            baker.make(
+                'gamedata.GameExchangeCXPC',
+                ticker='DW',
+                exchange_code='AI1',
+                date_epoch=START + offset * DAY_MS,
+                close_p=close,
+                high_p=close,
+                low_p=close,
+                volume=close * 2,
+                traded=2,
+            )
+        baker.make('gamedata.GameExchangeCXPC', ticker='DW', exchange_code='NC1', date_epoch=START)
+
+        series = CXPCIndicatorService.load(['DW', 'RAT'], 'AI1', START, START + 4 * DAY_MS)
+
+        assert list(series) == ['DW']
+        assert np.isnan(series['DW']['close'][0])
+        assert series['DW']['close'][1:].tolist() == [10.0, 10.0, 20.0, 20.0]
+        assert series['DW']['traded'].tolist() == [0.0, 2.0, 0.0, 2.0, 0.0]
+
+    @pytest.mark.django_db
+    def test_load_skips_weekly_rollups(self):
+        for offset in range(3):
+            baker.make(
+                'gamedata.GameExchangeCXPC',
+                ticker='DW',
+                exchange_code='AI1',
+                date_epoch=START + offset * DAY_MS,
+                close_p=10,
+                traded=1,
+            )
+
+        # START + 1 day is the retention cutoff, the row before it is a weekly rollup
+        with patch.object(CXPCStorageService, 'retention_cutoff', return_value=START + DAY_MS):
+            series = CXPCIndicatorService.load(['DW'], 'AI1', START, START + 2 * DAY_MS)
+
+        assert np.isnan(series['DW']['close'][0])
+        assert series['DW']['traded'].tolist() == [0.0, 1.0, 1.0]
+
+    @pytest.mark.django_db
+    def test_indicators(self):
+        for offset in range(6):
+            baker.make(
+                'gamedata.GameExchangeCXPC',
+                ticker='DW',
+                exchange_code='AI1',
+                date_epoch=START + offset * DAY_MS,
+                close_p=5,
+                high_p=5,
+                low_p=5,
+                volume=10,
+                traded=2,
+            )
+
+        result = CXPCIndicatorService.indicators(['DW'], 'AI1', window=3, days=2, until=date(2026, 3, 7))
+
+        assert result['date_epoch'] == [START + 4 * DAY_MS, START + 5 * DAY_MS]
+        assert result['tickers']['DW']['sma'] == [5.0, 5.0]
+        assert result['tickers']['DW']['vwap'] == [5.0, 5.0]
+
+    @pytest.mark.django_db
+    def test_load_aggregates_universe(self):
+        for exchange_code, close, traded in (('AI1', 10, 1), ('NC1', 20, 3), ('CI2', 100, 100)):
+            baker.make(
+                'gamedata.GameExchangeCXPC',
+                ticker='DW',
+                exchange_code=exchange_code,
+                date_epoch=START,
+                close_p=close,
+                high_p=close + 1,
+                low_p=close - 1,
+                volume=close * traded,
+                traded=traded,
+            )
+        # no trades on the next day, the plain average of close
+        for exchange_code, close in (('AI1', 10), ('IC1', 30)):
+            baker.make(
+                'gamedata.GameExchangeCXPC',
+                ticker='DW',
+                exchange_code=exchange_code,
+                date_epoch=START + DAY_MS,
+                close_p=close,
+                high_p=close,
+                low_p=close,
+                volume=0,
+                traded=0,
+            )
+
+        series = CXPCIndicatorService.load(['DW'], 'UNIVERSE', START, START + DAY_MS)['DW']
+
+        # weighted by traded amount, exchanges outside the universe left out
+        assert series['close'].tolist() == [17.5, 20.0]
+        assert series['high'].tolist() == [21.0, 30.0]
+        assert series['low'].tolist() == [9.0, 10.0]
+        assert series['volume'].tolist() == [70.0, 0.0]
+        assert series['traded'].tolist() == [4.0, 0.0]
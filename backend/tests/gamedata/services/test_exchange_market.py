@@ -0,0 +1,113 @@
+from unittest.mock import MagicMock, patch
+
+import orjson
+import pytest
+from django.utils import timezone
+from gamedata.models.game_exchange import GameExchange
+from gamedata.services.exchange_market import ExchangeMarketCache
+from model_bakery import baker
+from redis.exceptions import WatchError
+
+
+@pytest.fixture
+def mock_redis():
+    r = MagicMock()
+    with patch('gamedata.services.exchange_market.get_redis_connection', return_value=r):
+        yield r
+
+
+@pytest.mark.django_db
+class TestExchangeMarketCache:
+    def test_build_rows_merges_live_quotes(self, exchange_analytics_factory):
+        today = timezone.now().date()
+        exchange_analytics_factory(ticker='RAT', exchange_code='AI1', calendar_date=today, vwap_7d=5, avg_traded_7d=1)
+        exchange_analytics_factory(ticker='RAT', exchange_code='UNIVERSE', calendar_date=today)
+        exchange_analytics_factory(ticker='DW', exchange_code='AI1', calendar_date=today)
+        baker.make(GameExchange, ticker_id='RAT.AI1', ticker='RAT', exchange_code='AI1', ask=10, bid=None)
+
+        rows = ExchangeMarketCache.build_rows(['RAT'])
+
+        assert set(rows) == {'RAT.AI1', 'RAT.UNIVERSE'}
+        assert rows['RAT.AI1']['exchange_status'] == 'ACTIVE'
+        assert rows['RAT.AI1']['ask'] == 10
+        assert rows['RAT.AI1']['bid'] == 0.0
+        assert rows['RAT.UNIVERSE']['ask'] == 0.0
+
+    def test_rebuild(self, mock_redis, exchange_analytics_factory):
+        exchange_analytics_factory(ticker='RAT', exchange_code='AI1', calendar_date=timezone.now().date())
+        pipe = mock_redis.pipeline.return_value.__enter__.return_value
+
+        encoded = ExchangeMarketCache.rebuild(['RAT'])
+        assert orjson.loads(encoded['RAT.AI1'])['ticker_id'] == 'RAT.AI1'
+        pipe.delete.assert_not_called()
+        pipe.hset.assert_called_once_with(ExchangeMarketCache.KEY, mapping=encoded)
+
+        # full rebuild replaces the hash within one MULTI
+        ExchangeMarketCache.rebuild()
+        mock_redis.pipeline.assert_called_with(transaction=True)
+        pipe.delete.assert_called_once_with(ExchangeMarketCache.KEY)
+
+    def test_update_quotes_only_patches_known_rows(self, mock_redis):
+        pipe = mock_redis.pipeline.return_value.__enter__.return_value
+        pipe.hmget.return_value = [orjson.dumps({'ticker_id': 'RAT.AI1', 'vwap_7d': 5.0, 'ask': 1.0}), None]
+
+        patched = ExchangeMarketCache.update_quotes(
+            [
+                GameExchange(ticker_id='RAT.AI1', ask=2.0, bid=1.5, supply=3, demand=None),
+                GameExchange(ticker_id='DW.AI1', ask=4.0),
+            ]
+        )
+
+        assert patched == 1
+        pipe.watch.assert_called_once_with(ExchangeMarketCache.KEY)
+        pipe.multi.assert_called_once()
+        mapping = pipe.hset.call_args.kwargs['mapping']
+        assert orjson.loads(mapping['RAT.AI1']) == {
+            'ticker_id': 'RAT.AI1',
+            'vwap_7d': 5.0,
+            'ask': 2.0,
+            'bid': 1.5,
+            'supply': 3,
+            'demand': 0.0,
+        }
+
+    def test_update_quotes_retries_on_concurrent_rebuild(self, mock_redis):
+        pipe = mock_redis.pipeline.return_value.__enter__.return_value
+        # a rebuild wrote the row between the read and the write of the first attempt
+        pipe.hmget.side_effect = [
+            [orjson.dumps({'ticker_id': 'RAT.AI1', 'vwap_7d': 5.0})],
+            [orjson.dumps({'ticker_id': 'RAT.AI1', 'vwap_7d': 7.0})],
+        ]
+        pipe.execute.side_effect = [WatchError(), [1]]
+
+        assert ExchangeMarketCache.update_quotes([GameExchange(ticker_id='RAT.AI1', ask=2.0)]) == 1
+
+        assert pipe.watch.call_count == 2
+        assert orjson.loads(pipe.hset.call_args.kwargs['mapping']['RAT.AI1'])['vwap_7d'] == 7.0
+
+    def test_raw_rows_sorted_and_rebuilt_when_missing(self, mock_redis):
+        mock_redis.hgetall.return_value = {b'RAT.AI1': b'{"r":1}', b'AAR.AI1': b'{"a":1}'}
+        assert ExchangeMarketCache.raw_rows() == [b'{"a":1}', b'{"r":1}']
+
+        mock_redis.hgetall.return_value = {}
+        mock_redis.set.return_value = True
+        with patch.object(ExchangeMarketCache, 'rebuild', return_value={'DW.AI1': b'{"d":1}'}) as mock_rebuild:
+            assert ExchangeMarketCache.raw_rows() == [b'{"d":1}']
+        mock_rebuild.assert_called_once_with()
+        mock_redis.set.assert_called_once_with(
+            ExchangeMarketCache.REBUILD_LOCK_KEY, 1, nx=True, ex=ExchangeMarketCache.REBUILD_LOCK_TTL
+        )
+        mock_redis.delete.assert_called_once_with(ExchangeMarketCache.REBUILD_LOCK_KEY)
+
+    def test_raw_rows_waits_for_concurrent_rebuild(self, mock_redis):
+        # another request holds the lock and fills the hash meanwhile
+        mock_redis.hgetall.side_effect = [{}, {}, {b'DW.AI1': b'{"d":1}'}]
+        mock_redis.set.return_value = None
+
+        with (
+            patch.object(ExchangeMarketCache, 'rebuild') as mock_rebuild,
+            patch('gamedata.services.exchange_market.time.sleep'),
+        ):
+            assert ExchangeMarketCache.raw_rows() == [b'{"d":1}']
+
+        mock_rebuild.assert_not_called()
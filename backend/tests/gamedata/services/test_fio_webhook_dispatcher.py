@@ -0,0 +1,93 @@
+from unittest.mock import MagicMock, patch
+
+import pytest
+from gamedata.fio.schemas.fio_webhook import FIOWebhookRootSchema
+from gamedata.services.fio_webhook_dedup import FIOWebhookDeduplicator
+from gamedata.services.fio_webhook_dispatcher import FIOWebhookDispatcher
+from gamedata.services.fio_webhook_handlers import FIOCXWebhookHandler
+from gamedata.services.fio_webhook_stream import FIOWebhookStream
+from tests.fixtures.fxt_fio_webhook_data import fio_webhook_cx_entry, fio_webhook_cx_message, fio_webhook_payload
+
+
+@pytest.fixture
+def mock_redis():
+    r = MagicMock()
+    with patch('gamedata.services.fio_webhook_dedup.get_redis_connection', return_value=r):
+        yield r
+
+
+def _payload(*entries) -> FIOWebhookRootSchema:
+    return FIOWebhookRootSchema.model_validate(fio_webhook_payload(fio_webhook_cx_message(*entries)))
+
+
+class TestFIOWebhookDispatcherBatch:
+    def test_dispatch_batch_merges_endpoint_data(self, mock_redis):
+        mock_redis.pipeline.return_value.__enter__.return_value.execute.side_effect = [
+            [True, True],
+            [2, 0],
+            [True, True],
+        ]
+        payloads = [_payload(fio_webhook_cx_entry('A')), _payload(fio_webhook_cx_entry('B'))]
+
+        with patch.object(FIOCXWebhookHandler, 'process') as mock_process:
+            FIOWebhookDispatcher.dispatch_batch(payloads)
+
+        mock_process.assert_called_once()
+        assert [e.material_ticker for e in mock_process.call_args.args[0]] == ['A', 'B']
+
+
+class TestFIOWebhookDispatcherDedup:
+    def test_duplicates_never_reach_handler(self, mock_redis):
+        pipe = mock_redis.pipeline.return_value.__enter__.return_value
+        # first claim wins, the redelivery loses it
+        pipe.execute.side_effect = [[True, None, True], [1, 1], [True, True]]
+
+        entries = [
+            fio_webhook_cx_entry(),
+            fio_webhook_cx_entry(),
+            fio_webhook_cx_entry(Timestamp='2026-03-02T15:32:00Z'),
+        ]
+
+        with patch.object(FIOCXWebhookHandler, 'process') as mock_process:
+            FIOWebhookDispatcher.dispatch(_payload(*entries))
+
+        assert len(mock_process.call_args.args[0]) == 2
+        keys = [c.args[0] for c in pipe.set.call_args_list]
+        assert keys[0] == keys[1] != keys[2]
+        assert all(c.kwargs == {'nx': True, 'ex': FIOWebhookDeduplicator.CLAIM_TTL} for c in pipe.set.call_args_list)
+        pipe.hincrby.assert_any_call(FIOWebhookDeduplicator.STATS_KEY, '/cx:duplicates', 1)
+        # claims of the processed items are kept for the full TTL
+        assert [c.args for c in pipe.expire.call_args_list] == [
+            (keys[0], FIOWebhookDeduplicator.TTL),
+            (keys[2], FIOWebhookDeduplicator.TTL),
+        ]
+
+    def test_all_duplicates_skip_handler(self, mock_redis):
+        mock_redis.pipeline.return_value.__enter__.return_value.execute.side_effect = [[None], [1, 1]]
+
+        with patch.object(FIOCXWebhookHandler, 'process') as mock_process:
+            FIOWebhookDispatcher.dispatch_batch([_payload(fio_webhook_cx_entry())])
+
+        mock_process.assert_not_called()
+
+    def test_handler_failure_releases_claims(self, mock_redis):
+        mock_redis.pipeline.return_value.__enter__.return_value.execute.side_effect = [[True], [1, 0]]
+
+        with (
+            patch.object(FIOCXWebhookHandler, 'process', side_effect=Exception('DB down')),
+            pytest.raises(Exception, match='DB down'),
+        ):
+            FIOWebhookDispatcher.dispatch_batch([_payload(fio_webhook_cx_entry())])
+
+        mock_redis.delete.assert_called_once()
+        mock_redis.pipeline.return_value.__enter__.return_value.expire.assert_not_called()
+        assert mock_redis.delete.call_args.args[0].startswith(f'{FIOWebhookDeduplicator.KEY_PREFIX}:/cx:')
+
+    def test_claims_expire_before_stream_reclaim(self):
+        # entries of a killed consumer must not be dropped as duplicates when re-claimed
+        assert FIOWebhookDeduplicator.CLAIM_TTL * 1000 < FIOWebhookStream.CLAIM_IDLE_MS
+
+    def test_stats_hit_rate_per_endpoint(self, mock_redis):
+        mock_redis.hgetall.return_value = {b'/cx:received': b'200', b'/cx:duplicates': b'50'}
+
+        assert FIOWebhookDeduplicator.stats() == {'/cx': {'received': 200, 'duplicates': 50, 'hit_rate': 0.25}}
@@ -0,0 +1,215 @@
+from unittest.mock import MagicMock, patch
+
+import orjson
+import pytest
+from django.db import connection
+from gamedata.fio.schemas.fio_webhook import FIOWebhookExchangeEndpointSchema, FIOWebhookRootSchema
+from gamedata.models.game_exchange import GameExchange
+from gamedata.services.exchange_state import ExchangeStateCache
+from gamedata.services.fio_webhook_handlers import FIOCXWebhookHandler, FIOStorageWebhookHandler
+from model_bakery import baker
+from tests.fixtures.fxt_fio_storage_data import fio_storage_data
+from tests.fixtures.fxt_fio_webhook_data import fio_webhook_cx_entry, fio_webhook_payload, fio_webhook_user_message
+
+
+def _entry(**overrides) -> FIOWebhookExchangeEndpointSchema:
+    return FIOWebhookExchangeEndpointSchema.model_validate(fio_webhook_cx_entry(**overrides))
+
+
+@pytest.fixture
+def mock_redis():
+    r = MagicMock()
+    # empty exchange state snapshot unless a test says otherwise
+    r.hmget.side_effect = lambda key, ticker_ids: [None] * len(ticker_ids)
+    # reads under WATCH (ExchangeMarketCache.update_quotes) go through the pipeline
+    r.pipeline.return_value.__enter__.return_value.hmget.side_effect = lambda *args: r.hmget(*args)
+    with (
+        patch('gamedata.services.fio_webhook_handlers.get_redis_connection', return_value=r),
+        patch('gamedata.services.exchange_state.get_redis_connection', return_value=r),
+        patch('gamedata.services.exchange_market.get_redis_connection', return_value=r),
+    ):
+        yield r
+
+
+class TestFIOCXWebhookHandler:
+    def test_extract_coalesces_to_latest_per_ticker(self):
+        handler = FIOCXWebhookHandler()
+
+        updates = handler._extract(
+            [
+                _entry(Timestamp='2026-03-02T15:31:50Z', Ask=60.0),
+                _entry(Timestamp='2026-03-02T15:31:40Z', Ask=40.0),
+                _entry(exchange_code='NC1', Ask=10.0),
+            ]
+        )
+
+        assert set(updates) == {'RAT.AI1', 'RAT.NC1'}
+        # the out-of-order older update must not overwrite the newer one
+        assert updates['RAT.AI1'].ask == 60.0
+
+    @pytest.mark.django_db
+    def test_process_writes_coalesced_changes(self, mock_redis):
+        baker.make(GameExchange, ticker_id='RAT.AI1', ticker='RAT', exchange_code='AI1', ask=1.0, supply=1)
+        baker.make(GameExchange, ticker_id='RAT.NC1', ticker='RAT', exchange_code='NC1', ask=52.0, supply=80)
+
+        FIOCXWebhookHandler().process(
+            [
+                _entry(Timestamp='2026-03-02T15:31:40Z', Ask=40.0),
+                _entry(Timestamp='2026-03-02T15:31:50Z', Ask=60.0, Supply=5),
+                _entry(exchange_code='NC1'),
+            ]
+        )
+
+        assert GameExchange.objects.get(ticker_id='RAT.AI1').ask == 60.0
+        assert GameExchange.objects.get(ticker_id='RAT.AI1').supply == 5
+        # one pipelined stream push per flush, one entry per ticker
+        assert mock_redis.pipeline.return_value.__enter__.return_value.xadd.call_count == 2
+
+    @pytest.mark.django_db
+    def test_process_merges_latest_stream_state(self, mock_redis):
+        baker.make(GameExchange, ticker_id='RAT.AI1', ticker='RAT', exchange_code='AI1', ask=52.0)
+
+        FIOCXWebhookHandler().process([_entry(Ask=None, Bid=49.0)])
+
+        pipe = mock_redis.pipeline.return_value.__enter__.return_value
+        latest = [c for c in pipe.hset.call_args_list if c.args and c.args[0] == 'cx:latest:RAT.AI1']
+        # None values are omitted, so the previous ask survives in the hash
+        assert 'ask' not in latest[0].kwargs['mapping']
+        assert orjson.loads(latest[0].kwargs['mapping']['bid']) == 49.0
+        pipe.sadd.assert_called_once_with(FIOCXWebhookHandler.LATEST_INDEX_KEY, 'RAT.AI1')
+
+    @pytest.mark.django_db
+    def test_process_populates_state_snapshot_on_miss(self, mock_redis):
+        baker.make(GameExchange, ticker_id='RAT.AI1', ticker='RAT', exchange_code='AI1', ask=52.0)
+
+        FIOCXWebhookHandler().process([_entry()])
+
+        pipe = mock_redis.pipeline.return_value.__enter__.return_value
+        mapping = next(c for c in pipe.hset.call_args_list if c.args[0] == ExchangeStateCache.KEY).kwargs['mapping']
+        assert orjson.loads(mapping['RAT.AI1']) == list(
+            ExchangeStateCache.from_instance(GameExchange.objects.get(ticker_id='RAT.AI1'))
+        )
+        # the TTL is only set on a fresh hash, writes do not extend it
+        pipe.expire.assert_called_once_with(ExchangeStateCache.KEY, ExchangeStateCache.TTL, nx=True)
+
+    @pytest.mark.django_db
+    def test_process_noop_update_skips_database(self, mock_redis, django_assert_num_queries):
+        obj = baker.make(
+            GameExchange,
+            ticker_id='RAT.AI1',
+            ticker='RAT',
+            exchange_code='AI1',
+            price_average=51.5,
+            ask=52.0,
+            bid=50.0,
+            ask_count=4,
+            bid_count=6,
+            supply=80,
+            demand=120,
+        )
+        mock_redis.hmget.side_effect = None
+        mock_redis.hmget.return_value = [orjson.dumps(ExchangeStateCache.from_instance(obj))]
+
+        with django_assert_num_queries(0):
+            FIOCXWebhookHandler().process([_entry()])
+
+        pipe = mock_redis.pipeline.return_value.__enter__.return_value
+        assert all(c.args[0] != ExchangeStateCache.KEY for c in pipe.hset.call_args_list)
+        # unchanged data is still streamed to listeners
+        assert pipe.xadd.call_count == 1
+
+    @pytest.mark.django_db
+    def test_process_changed_update_writes_without_select(self, mock_redis, django_assert_num_queries):
+        obj = baker.make(GameExchange, ticker_id='RAT.AI1', ticker='RAT', exchange_code='AI1', ask=1.0)
+        state = orjson.dumps(ExchangeStateCache.from_instance(obj))
+        # known to the state snapshot, not (yet) listed in the market snapshot
+        mock_redis.hmget.side_effect = lambda key, ticker_ids: [state if key == ExchangeStateCache.KEY else None]
+
+        # the UPDATE only, no SELECT
+        with django_assert_num_queries(1):
+            FIOCXWebhookHandler().process([_entry(Ask=60.0)])
+
+        assert GameExchange.objects.get(ticker_id='RAT.AI1').ask == 60.0
+
+    def test_write_changes_postgres_single_statement(self):
+        objs = [
+            GameExchange(ticker_id='RAT.AI1', ask=1.0, supply=2),
+            GameExchange(ticker_id='DW.AI1', ask=3.0, supply=4),
+        ]
+
+        with patch.object(connection, 'vendor', 'postgresql'), patch.object(connection, 'cursor') as mock_cursor:
+            FIOCXWebhookHandler()._write_changes(objs)
+
+        cursor = mock_cursor.return_value.__enter__.return_value
+
+        cursor.execute.assert_called_once()
+        sql, params = cursor.execute.call_args.args
+        assert sql.startswith(f'UPDATE {GameExchange._meta.db_table} AS t SET')
+        assert 'FROM (VALUES' in sql
+        assert 'WHERE t.ticker_id = v.ticker_id' in sql
+        assert len(params) == len(objs) * (len(FIOCXWebhookHandler.SYNC_FIELDS) + 1)
+        assert params[0] == 'RAT.AI1'
+
+
+def _storage_items(user_name: str, *entries: dict) -> list:
+    root = FIOWebhookRootSchema.model_validate(
+        fio_webhook_payload(fio_webhook_user_message('/storage', user_name, *entries))
+    )
+    return FIOStorageWebhookHandler.extract_items(root.Data[0])
+
+
+@pytest.mark.django_db
+class TestFIOUserDataWebhookHandler:
+    @pytest.fixture
+    def player_data(self):
+        user = baker.make('user.User', prun_username='SFSCORPIO')
+        return baker.make('gamedata.GameFIOPlayerData', user=user, storage_data=fio_storage_data[:2])
+
+    def test_patches_changed_entry_and_appends_new(self, player_data, django_capture_on_commit_callbacks):
+        changed = {**fio_storage_data[0], 'WeightLoad': 1.0, 'Timestamp': '2026-03-03T00:00:00Z'}
+
+        with (
+            patch('gamedata.services.fio_webhook_handlers.GamedataCacheManager.delete') as mock_delete,
+            django_capture_on_commit_callbacks(execute=True),
+        ):
+            FIOStorageWebhookHandler().process(_storage_items('SFSCORPIO', changed, fio_storage_data[5]))
+
+        player_data.refresh_from_db()
+        assert [e['StorageId'] for e in player_data.storage_data] == [
+            fio_storage_data[0]['StorageId'],
+            fio_storage_data[1]['StorageId'],
+            fio_storage_data[5]['StorageId'],
+        ]
+        assert player_data.storage_data[0]['WeightLoad'] == 1.0
+        assert player_data.storage_webhook_at is not None
+        assert player_data.ship_webhook_at is None
+        mock_delete.assert_called_once()
+
+    def test_unchanged_or_older_data_does_not_invalidate(self, player_data, django_capture_on_commit_callbacks):
+        older = {**fio_storage_data[1], 'WeightLoad': 1.0, 'Timestamp': '2020-01-01T00:00:00Z'}
+        unchanged = FIOStorageWebhookHandler.extract_items(
+            FIOWebhookRootSchema.model_validate(
+                fio_webhook_payload(fio_webhook_user_message('/storage', 'SFSCORPIO', fio_storage_data[0]))
+            ).Data[0]
+        )[0].record.model_dump(mode='json')
+        player_data.storage_data = [unchanged, fio_storage_data[1]]
+        player_data.save()
+
+        with (
+            patch('gamedata.services.fio_webhook_handlers.GamedataCacheManager.delete') as mock_delete,
+            django_capture_on_commit_callbacks(execute=True),
+        ):
+            FIOStorageWebhookHandler().process(_storage_items('SFSCORPIO', fio_storage_data[0], older))
+
+        player_data.refresh_from_db()
+        assert player_data.storage_data[1]['WeightLoad'] == fio_storage_data[1]['WeightLoad']
+        assert player_data.storage_webhook_at is not None
+        assert player_data.ship_webhook_at is None
+        mock_delete.assert_not_called()
+
+    def test_dedup_key_includes_user_entry_and_timestamp(self):
+        item = _storage_items('SFSCORPIO', fio_storage_data[0])[0]
+
+        assert FIOStorageWebhookHandler.dedup_key(item) == (
+            f'SFSCORPIO:{fio_storage_data[0]["StorageId"]}:{item.record.Timestamp.isoformat()}'
+        )
@@ -0,0 +1,152 @@
+from unittest.mock import MagicMock, patch
+
+import orjson
+import pytest
+from gamedata.services.fio_webhook_dispatcher import FIOWebhookDispatcher
+from gamedata.services.fio_webhook_stream import FIOWebhookStream
+from redis.exceptions import ResponseError
+from tests.fixtures.fxt_fio_webhook_data import fio_webhook_cx_entry, fio_webhook_cx_message, fio_webhook_payload
+
+
+@pytest.fixture
+def mock_redis():
+    r = MagicMock()
+    with patch('gamedata.services.fio_webhook_stream.get_redis_connection', return_value=r):
+        FIOWebhookStream._group_ready = False
+        yield r
+
+
+class TestFIOWebhookStream:
+    def test_append_raw_bytes(self, mock_redis):
+        FIOWebhookStream.append(b'{"Data": []}')
+
+        mock_redis.xadd.assert_called_once_with(
+            FIOWebhookStream.STREAM_KEY,
+            {'payload': b'{"Data": []}'},
+            maxlen=FIOWebhookStream.MAX_LEN,
+            approximate=True,
+        )
+
+    def test_ensure_group_tolerates_existing_group(self, mock_redis):
+        mock_redis.xgroup_create.side_effect = ResponseError('BUSYGROUP Consumer Group name already exists')
+        FIOWebhookStream.ensure_group(mock_redis)
+        assert FIOWebhookStream._group_ready is True
+
+    def test_consume_dispatches_batch_and_acks(self, mock_redis):
+        valid = orjson.dumps(fio_webhook_payload(fio_webhook_cx_message(fio_webhook_cx_entry())))
+        mock_redis.xautoclaim.return_value = ['0-0', [], []]
+        mock_redis.xreadgroup.side_effect = [
+            [[b'stream:fio_webhook', [(b'1-0', {b'payload': valid}), (b'2-0', {b'payload': b'{"broken'})]]],
+            [],
+        ]
+
+        with patch.object(FIOWebhookDispatcher, 'dispatch_batch') as mock_dispatch:
+            assert FIOWebhookStream.consume('test') == 2
+
+        # invalid entries are dropped, but still acknowledged
+        assert len(mock_dispatch.call_args.args[0]) == 1
+        mock_redis.xack.assert_called_once_with(FIOWebhookStream.STREAM_KEY, FIOWebhookStream.GROUP, b'1-0', b'2-0')
+
+    def test_consume_does_not_ack_on_dispatch_failure(self, mock_redis):
+        valid = orjson.dumps(fio_webhook_payload(fio_webhook_cx_message(fio_webhook_cx_entry())))
+        mock_redis.xautoclaim.return_value = ['0-0', [], []]
+        mock_redis.xreadgroup.return_value = [[b'stream:fio_webhook', [(b'1-0', {b'payload': valid})]]]
+
+        with (
+            patch.object(FIOWebhookDispatcher, 'dispatch_batch', side_effect=Exception('DB down')),
+            pytest.raises(Exception, match='DB down'),
+        ):
+            FIOWebhookStream.consume('test', window_ms=0)
+
+        mock_redis.xack.assert_not_called()
+
+    def test_consume_retries_reclaimed_entries_one_at_a_time(self, mock_redis):
+        valid = orjson.dumps(fio_webhook_payload(fio_webhook_cx_message(fio_webhook_cx_entry())))
+        mock_redis.xautoclaim.return_value = [
+            '0-0',
+            [(b'1-0', {b'payload': valid}), (b'2-0', {b'payload': valid})],
+            [],
+        ]
+        mock_redis.pipeline.return_value.__enter__.return_value.execute.return_value = [
+            [{'message_id': b'1-0', 'times_delivered': 2}],
+            [{'message_id': b'2-0', 'times_delivered': 2}],
+        ]
+
+        with patch.object(FIOWebhookDispatcher, 'dispatch_batch', side_effect=[Exception('poison'), None]):
+            assert FIOWebhookStream.consume('test') == 2
+
+        # the failing entry stays pending, the good one is not held back
+        mock_redis.xreadgroup.assert_not_called()
+        mock_redis.xack.assert_called_once_with(FIOWebhookStream.STREAM_KEY, FIOWebhookStream.GROUP, b'2-0')
+
+    def test_consume_dead_letters_poison_entries(self, mock_redis):
+        valid = orjson.dumps(fio_webhook_payload(fio_webhook_cx_message(fio_webhook_cx_entry())))
+        mock_redis.xautoclaim.return_value = [
+            '0-0',
+            [(b'1-0', {b'payload': b'poison'}), (b'2-0', {b'payload': valid})],
+            [],
+        ]
+        pipe = mock_redis.pipeline.return_value.__enter__.return_value
+        pipe.execute.return_value = [
+            [{'message_id': b'1-0', 'times_delivered': FIOWebhookStream.MAX_DELIVERIES + 1}],
+            [{'message_id': b'2-0', 'times_delivered': 2}],
+        ]
+
+        with patch.object(FIOWebhookDispatcher, 'dispatch_batch') as mock_dispatch:
+            assert FIOWebhookStream.consume('test') == 1
+
+        pipe.xadd.assert_called_once()
+        assert pipe.xadd.call_args.args == (
+            FIOWebhookStream.DEAD_LETTER_KEY,
+            {'payload': b'poison', 'entry_id': b'1-0', 'deliveries': FIOWebhookStream.MAX_DELIVERIES + 1},
+        )
+        pipe.xack.assert_called_once_with(FIOWebhookStream.STREAM_KEY, FIOWebhookStream.GROUP, b'1-0')
+        # delivery counts of exactly the claimed entries, held by this consumer
+        pipe.xpending_range.assert_any_call(
+            FIOWebhookStream.STREAM_KEY, FIOWebhookStream.GROUP, min=b'2-0', max=b'2-0', count=1, consumername='test'
+        )
+        mock_dispatch.assert_called_once()
+        mock_redis.xack.assert_called_once_with(FIOWebhookStream.STREAM_KEY, FIOWebhookStream.GROUP, b'2-0')
+
+    def test_consume_recreates_missing_group(self, mock_redis):
+        mock_redis.xautoclaim.side_effect = [ResponseError('NOGROUP No such key'), ['0-0', [], []]]
+        mock_redis.xreadgroup.return_value = []
+
+        assert FIOWebhookStream.consume('test') == 0
+        assert FIOWebhookStream._group_ready is False
+
+        assert FIOWebhookStream.consume('test') == 0
+        assert mock_redis.xgroup_create.call_count == 2
+
+    def test_consume_empty(self, mock_redis):
+        mock_redis.xautoclaim.return_value = ['0-0', [], []]
+        mock_redis.xreadgroup.return_value = []
+
+        assert FIOWebhookStream.consume('test') == 0
+
+    def test_consume_collects_window_until_batch_full(self, mock_redis):
+        valid = orjson.dumps(fio_webhook_payload(fio_webhook_cx_message(fio_webhook_cx_entry())))
+        mock_redis.xautoclaim.return_value = ['0-0', [], []]
+        mock_redis.xreadgroup.side_effect = [
+            [[b'stream:fio_webhook', [(b'1-0', {b'payload': valid})]]],
+            [[b'stream:fio_webhook', [(b'2-0', {b'payload': valid}), (b'3-0', {b'payload': valid})]]],
+        ]
+
+        with patch.object(FIOWebhookDispatcher, 'dispatch_batch') as mock_dispatch:
+            assert FIOWebhookStream.consume('test', count=3, window_ms=10000) == 3
+
+        # the follow-up read only asks for the remaining capacity and never blocks forever
+        follow_up = mock_redis.xreadgroup.call_args_list[1]
+        assert follow_up.kwargs['count'] == 2
+        assert 0 < follow_up.kwargs['block'] <= 10000
+        assert len(mock_dispatch.call_args.args[0]) == 3
+
+    def test_consume_without_window_flushes_first_read(self, mock_redis):
+        valid = orjson.dumps(fio_webhook_payload(fio_webhook_cx_message(fio_webhook_cx_entry())))
+        mock_redis.xautoclaim.return_value = ['0-0', [], []]
+        mock_redis.xreadgroup.return_value = [[b'stream:fio_webhook', [(b'1-0', {b'payload': valid})]]]
+
+        with patch.object(FIOWebhookDispatcher, 'dispatch_batch'):
+            assert FIOWebhookStream.consume('test', window_ms=0) == 1
+
+        mock_redis.xreadgroup.assert_called_once()
@@ -0,0 +1,198 @@
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import orjson
+from gamedata.services.sse_hub import SSEFilter, SSEHub, SSEMessage, SSESubscription
+
+
+def _entry(entry_id: str, payload: bytes = b'{}') -> tuple[bytes, dict[bytes, bytes]]:
+    return entry_id.encode(), {b'payload': payload}
+
+
+def _subscription(maxsize: int = 10) -> SSESubscription:
+    sub = SSESubscription(streams=['stream:cx'], queue=asyncio.Queue(), capacity=maxsize)
+    sub.pending = None
+    return sub
+
+
+def _hub(redis: MagicMock | None = None) -> SSEHub:
+    hub = SSEHub('redis://unused')
+    hub._client = MagicMock(return_value=redis or MagicMock())  # ty: ignore[invalid-assignment]
+    return hub
+
+
+class TestSSEHub:
+    def test_fan_out_shares_messages_and_skips_delivered(self):
+        hub = _hub()
+        first, second = _subscription(), _subscription()
+        hub.subscribers['stream:cx'] = {first, second}
+        first.last_ids['stream:cx'] = (1, 0)
+
+        messages = SSEHub._to_messages('stream:cx', [_entry('1-0'), _entry('2-0')])
+        hub.fan_out('stream:cx', messages)
+
+        assert first.queue.qsize() == 1
+        assert second.queue.qsize() == 2
+        # the same message object (and rendered frame) is shared by all connections
+        second.queue.get_nowait()
+        assert first.queue.get_nowait() is second.queue.get_nowait()
+
+    def test_slow_consumer_is_evicted(self):
+        hub = _hub()
+        slow, fast = _subscription(maxsize=1), _subscription()
+        hub.subscribers['stream:cx'] = {slow, fast}
+        hub.stream_ids['stream:cx'] = '0-0'
+
+        hub.fan_out('stream:cx', SSEHub._to_messages('stream:cx', [_entry('1-0'), _entry('2-0')]))
+
+        assert slow.evicted
+        assert slow.queue.get_nowait() is None
+        assert hub.subscribers['stream:cx'] == {fast}
+        assert slow.conn_id in hub._disconnected
+
+    def test_subscribe_catches_up_before_live_messages(self):
+        redis = MagicMock()
+        redis.xrevrange = AsyncMock(return_value=[_entry('5-0')])
+
+        async def xrange(stream, min, count):
+            # a live message arrives while the catch-up read is in flight
+            hub.fan_out('stream:cx', SSEHub._to_messages('stream:cx', [_entry('6-0')]))
+            return [_entry('4-0'), _entry('5-0'), _entry('6-0')]
+
+        redis.xrange = xrange
+        hub = _hub(redis)
+
+        async def run():
+            sub = await hub.subscribe(['stream:cx'], '3-0')
+            return [sub.queue.get_nowait().id for _ in range(sub.queue.qsize())]
+
+        assert asyncio.run(run()) == ['4-0', '5-0', '6-0']
+        assert hub.stream_ids == {'stream:cx': '5-0'}
+
+    def test_catch_up_larger_than_the_queue_is_delivered(self):
+        redis = MagicMock()
+        redis.xrevrange = AsyncMock(return_value=[_entry('1000-0')])
+        redis.xrange = AsyncMock(return_value=[_entry(f'{i}-0') for i in range(1, SSEHub.QUEUE_SIZE + 11)])
+        hub = _hub(redis)
+
+        async def run():
+            sub = await hub.subscribe(['stream:cx'], '0-1')
+            # live messages still get the regular headroom on top of the catch-up
+            hub.fan_out('stream:cx', SSEHub._to_messages('stream:cx', [_entry('1001-0')]))
+            return sub
+
+        sub = asyncio.run(run())
+
+        assert not sub.evicted
+        assert sub.queue.qsize() == SSEHub.QUEUE_SIZE + 11
+        assert sub.capacity == 2 * SSEHub.QUEUE_SIZE + 10
+
+    def test_last_unsubscribe_releases_stream(self):
+        hub = _hub()
+        sub = _subscription()
+        hub.subscribers['stream:cx'] = {sub}
+        hub.stream_ids['stream:cx'] = '1-0'
+        hub._has_subscribers.set()
+
+        hub.unsubscribe(sub)
+
+        assert hub.subscribers == {}
+        assert hub.stream_ids == {}
+        assert not hub._has_subscribers.is_set()
+
+    def test_accounting_is_flushed_in_one_pipeline(self):
+        redis = MagicMock()
+        pipe = MagicMock(execute=AsyncMock())
+        redis.pipeline.return_value.__aenter__.return_value = pipe
+        hub = _hub(redis)
+        hub._connected = {'a', 'b'}
+        hub._disconnected = {'c'}
+
+        asyncio.run(hub.flush_accounting())
+
+        assert set(pipe.zadd.call_args.args[1]) == {'a', 'b'}
+        pipe.zrem.assert_called_once_with(SSEHub.STATS_KEY, 'c')
+        pipe.execute.assert_awaited_once()
+        assert hub._disconnected == set()
+
+    def test_frame(self):
+        message = SSEMessage(stream='stream:cx', id='1-0', payload=b'{"a":1}')
+        assert message.frame == 'id: 1-0\ndata: {"a":1}\n\n'
+
+
+def _cx_message(entry_id: str, ticker: str = 'RAT', exchange_code: str = 'AI1') -> SSEMessage:
+    payload = orjson.dumps(
+        {'material_ticker': ticker, 'exchange_code': exchange_code, 'timestamp': 't', 'ask': 1.0, 'bid': 2.0}
+    )
+    return SSEMessage(stream='stream:cx', id=entry_id, payload=payload)
+
+
+class TestSSEFilter:
+    def test_matches_tickers_and_exchanges(self):
+        sse_filter = SSEFilter(tickers=frozenset({'RAT'}), exchanges=frozenset({'NC1'}))
+
+        assert sse_filter.matches(_cx_message('1-0', 'RAT', 'NC1'))
+        assert not sse_filter.matches(_cx_message('1-0', 'RAT', 'AI1'))
+        assert not sse_filter.matches(_cx_message('1-0', 'DW', 'NC1'))
+        # non exchange payloads are never filtered
+        assert sse_filter.matches(SSEMessage(stream='stream:beat', id='1-0', payload=b'"beat"'))
+
+    def test_filtered_messages_are_not_queued(self):
+        sub = _subscription()
+        sub.filter = SSEFilter(tickers=frozenset({'DW'}))
+
+        assert sub.offer(_cx_message('1-0'))
+        assert sub.queue.empty()
+        assert sub.last_ids['stream:cx'] == (1, 0)
+
+    def test_fields_projection_is_shared(self):
+        message = _cx_message('1-0')
+        sub = _subscription()
+        sub.filter = SSEFilter(fields=('ask',))
+
+        assert orjson.loads(sub.filter.payload(message)) == {
+            'material_ticker': 'RAT',
+            'exchange_code': 'AI1',
+            'timestamp': 't',
+            'ask': 1.0,
+        }
+        assert sub.filter.payload(message) is SSEFilter(fields=('ask',)).payload(message)
+
+    def test_batch_frame(self):
+        sub = _subscription()
+        sub.filter = SSEFilter(fields=('bid',))
+
+        frame = sub.batch_frame([_cx_message('1-0'), _cx_message('2-0', 'DW')])
+
+        header, data = frame.split('data: ')
+        assert header == 'id: 2-0\nevent: batch\n'
+        assert [e['material_ticker'] for e in orjson.loads(data)] == ['RAT', 'DW']
+
+
+class TestSSEHubSnapshot:
+    def _redis(self, states: list[dict]) -> MagicMock:
+        redis = MagicMock()
+        redis.smembers = AsyncMock(return_value={b'RAT.AI1', b'RAT.NC1', b'DW.AI1'})
+        pipe = MagicMock(execute=AsyncMock(return_value=states))
+        redis.pipeline.return_value.__aenter__.return_value = pipe
+        return redis
+
+    def test_snapshot_filters_index_and_fields(self):
+        state = {b'material_ticker': b'"RAT"', b'exchange_code': b'"AI1"', b'ask': b'1.5', b'bid': b'1.0'}
+        redis = self._redis([state, {}])
+        hub = _hub(redis)
+
+        snapshot = asyncio.run(hub.cx_snapshot(SSEFilter(tickers=frozenset({'RAT'}), fields=('ask',))))
+
+        pipe = redis.pipeline.return_value.__aenter__.return_value
+        assert [c.args[0] for c in pipe.hgetall.call_args_list] == ['cx:latest:RAT.AI1', 'cx:latest:RAT.NC1']
+        # missing hashes are skipped, fields are projected
+        assert snapshot == [{'material_ticker': 'RAT', 'exchange_code': 'AI1', 'ask': 1.5}]
+
+    def test_snapshot_with_tickers_and_exchanges_skips_index(self):
+        redis = self._redis([{}])
+        hub = _hub(redis)
+
+        asyncio.run(hub.cx_snapshot(SSEFilter(tickers=frozenset({'DW'}), exchanges=frozenset({'IC1'}))))
+
+        redis.smembers.assert_not_called()
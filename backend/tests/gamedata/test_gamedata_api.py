@@ -1,13 +1,21 @@
 from datetime import timedelta
+from unittest.mock import MagicMock, patch
 
+import orjson
 import pytest
 from django.urls import reverse
 from django.utils import timezone
+from gamedata.services.exchange_cxpc import CXPCHistoryService
+from gamedata.services.exchange_indicators import CXPCIndicatorService
+from gamedata.services.exchange_market import ExchangeMarketCache
+from model_bakery import baker
 from rest_framework import status
 from tests.fixtures.fxt_fio_ship_data import fio_ship_data
 from tests.fixtures.fxt_fio_sites_data import fio_sites_data
 from tests.fixtures.fxt_fio_storage_data import fio_storage_data
 from tests.fixtures.fxt_fio_warehouse_data import fio_warehouse_data
+from tests.fixtures.fxt_fio_webhook_data import fio_webhook_cx_entry, fio_webhook_cx_message, fio_webhook_payload
+from user.models import GlobalConfigWebhook, WebhookSenderChoices
 
 pytestmark = pytest.mark.django_db
 
@@ -127,7 +135,21 @@ class TestGamePlanetViewSet:
         assert len(response.data) == 1
 
 
-class GameExchangeViewSet:
+class TestGameExchangeViewSet:
+    @pytest.fixture(autouse=True)
+    def market_hash(self):
+        # dict-backed stand-in for the single Redis hash behind ExchangeMarketCache
+        store: dict[str, bytes] = {}
+        r = MagicMock()
+        r.hgetall.side_effect = lambda key: dict(store)
+        r.hmget.side_effect = lambda key, fields: [store.get(f) for f in fields]
+        r.hset.side_effect = lambda key, mapping: store.update(mapping)
+        r.delete.side_effect = lambda key: store.clear() if key == ExchangeMarketCache.KEY else None
+        r.pipeline.return_value.__enter__.return_value = r
+
+        with patch('gamedata.services.exchange_market.get_redis_connection', return_value=r):
+            yield store
+
     def test_list_exchanges_logic(self, api_client, exchange_analytics_factory):
         url = reverse('data:exchange-list')  # Adjust namespace if needed
         now = timezone.now().date()
@@ -168,8 +190,7 @@ class GameExchangeViewSet:
 
     def test_distinct_ordering_logic(self, api_client, exchange_analytics_factory):
         """
-        In SQLite, we expect both records to be returned.
-        We verify the order_by ensures the newest record is first.
+        Only the latest record per ticker_id makes it into the market snapshot.
         """
         url = reverse('data:exchange-list')
 
@@ -181,12 +202,34 @@ class GameExchangeViewSet:
 
         h2o_records = [i for i in data if i['ticker'] == 'H2O']
 
-        # Because we are in SQLite, we get 2 records instead of 1
-        assert len(h2o_records) == 2
-
-        # Crucial: Verify the first record is the one with the LATEST epoch (5000)
+        assert len(h2o_records) == 1
         assert h2o_records[0]['date_epoch'] == 5000
-        assert h2o_records[1]['date_epoch'] == 1000
+
+    def test_live_quotes_patched_without_rebuild(self, api_client, exchange_analytics_factory):
+        exchange_analytics_factory(ticker='RAT', exchange_code='AI1', calendar_date=timezone.now().date())
+        exchange = baker.make('gamedata.GameExchange', ticker_id='RAT.AI1', ticker='RAT', exchange_code='AI1', ask=10)
+
+        url = reverse('data:exchange-list')
+        assert api_client.get(url).json()[0]['ask'] == 10
+
+        exchange.ask = 12
+        assert ExchangeMarketCache.update_quotes([exchange]) == 1
+
+        response = api_client.get(url)
+        assert response.json()[0]['ask'] == 12
+        assert response['Cache-Control'] == f'public, max-age={ExchangeMarketCache.MAX_AGE}'
+
+    def test_list_columns_layout(self, api_client, exchange_analytics_factory):
+        exchange_analytics_factory(ticker='RAT', exchange_code='AI1', vwap_7d=5)
+        exchange_analytics_factory(ticker='DW', exchange_code='AI1', vwap_7d=3)
+
+        with patch('gamedata.api.viewsets.GamedataCacheManager.get', return_value=None):
+            response = api_client.get(reverse('data:exchange-list'), {'layout': 'columns'})
+
+        assert response.status_code == 200
+        assert response.data['columns'] == ExchangeMarketCache.COLUMNS
+        assert response.data['data']['ticker_id'] == ['DW.AI1', 'RAT.AI1']
+        assert response.data['data']['vwap_7d'] == [3.0, 5.0]
 
     def test_csv_export_format_and_headers(self, api_client, exchange_analytics_factory):
 
@@ -204,7 +247,7 @@ class GameExchangeViewSet:
         expected_header = (
             'ticker,exchange_code,ticker_id,date_epoch,calendar_date,exchange_status,'
             'vwap_daily,vwap_7d,vwap_30d,traded_daily,sum_traded_7d,sum_traded_30d,'
-            'avg_traded_7d,avg_traded_30d'
+            'avg_traded_7d,avg_traded_30d,ask,bid,supply,demand'
         )
 
         assert lines[0] == expected_header
@@ -268,3 +311,124 @@ class TestExchangeCXPCViewSet:
         url_wrong = reverse('data:cxpc-market-data-full', kwargs={'ticker': 'DW', 'exchange_code': 'foo'})
         response_wrong = api_client.get(url_wrong)
         assert response_wrong.status_code == 400
+
+    def test_cxpc_range_and_interval(self, api_client, exchange_cxpc_factory):
+        day = 86_400_000
+        # 2026-03-02 is a Monday
+        monday = 1772409600000
+        for i in range(14):
+            exchange_cxpc_factory(ticker='DW', exchange_code='AI1', date_epoch=monday + i * day, volume=10, traded=1)
+
+        url = reverse('data:cxpc-market-data-full', kwargs={'ticker': 'DW', 'exchange_code': 'AI1'})
+
+        response = api_client.get(url, {'from': monday + 2 * day + 5, 'to': monday + 4 * day, 'limit': 2})
+        assert response.status_code == 200
+        assert [r['date_epoch'] for r in response.data] == [monday + 4 * day, monday + 3 * day]
+
+        response_weeks = api_client.get(url, {'interval': 'week'})
+        assert [(r['date_epoch'], r['traded']) for r in response_weeks.data] == [(monday + 7 * day, 7), (monday, 7)]
+
+        assert api_client.get(url, {'from': 2, 'to': 1}).status_code == 400
+        assert api_client.get(url, {'interval': 'year'}).status_code == 400
+
+    @pytest.mark.parametrize('interval', ['day', 'week'])
+    def test_cxpc_columns_layout(self, api_client, exchange_cxpc_factory, interval):
+        exchange_cxpc_factory(ticker='DW', exchange_code='AI1', date_epoch=1772409600000, open_p='1.5', traded=2)
+
+        url = reverse('data:cxpc-market-data-full', kwargs={'ticker': 'DW', 'exchange_code': 'AI1'})
+        with patch('gamedata.api.viewsets.GamedataCacheManager.get', return_value=None):
+            response = api_client.get(url, {'layout': 'columns', 'interval': interval})
+
+        assert response.status_code == 200
+        assert response.data['columns'] == CXPCHistoryService.FIELDS
+        assert response.data['data']['ticker'] == ['DW']
+        assert response.data['data']['open_p'] == [1.5]
+        assert response.data['data']['traded'] == [2.0]
+
+
+class TestExchangeIndicatorViewSet:
+    def test_indicators(self, api_client, exchange_cxpc_factory):
+        day = 86_400_000
+        today = CXPCIndicatorService.day_epoch(timezone.now().date())
+        for i in range(10):
+            exchange_cxpc_factory(
+                ticker='DW',
+                exchange_code='AI1',
+                date_epoch=today - i * day,
+                close_p=10,
+                high_p=12,
+                low_p=8,
+                volume=20,
+                traded=2,
+            )
+
+        url = reverse('data:cxpc-indicators')
+        with patch('gamedata.api.viewsets.GamedataCacheManager.get', return_value=None):
+            response = api_client.get(url, {'tickers': 'DW,RAT,DW', 'exchange_code': 'AI1', 'window': 3, 'days': 5})
+
+        assert response.status_code == 200
+        assert response.data['date_epoch'] == [today - i * day for i in range(4, -1, -1)]
+        # RAT has no CXPC
+        assert list(response.data['tickers']) == ['DW']
+        assert response.data['tickers']['DW']['vwap'] == [10.0] * 5
+        assert response.data['tickers']['DW']['high'] == [12.0] * 5
+        assert response.data['tickers']['DW']['volatility'] == [0.0] * 5
+
+    def test_indicators_default_universe(self, api_client, exchange_cxpc_factory):
+        day = 86_400_000
+        today = CXPCIndicatorService.day_epoch(timezone.now().date())
+        for i in range(5):
+            for exchange_code, close in (('AI1', 10), ('NC1', 30)):
+                exchange_cxpc_factory(
+                    ticker='DW',
+                    exchange_code=exchange_code,
+                    date_epoch=today - i * day,
+                    close_p=close,
+                    high_p=close,
+                    low_p=close,
+                    volume=close,
+                    traded=1,
+                )
+
+        with patch('gamedata.api.viewsets.GamedataCacheManager.get', return_value=None):
+            response = api_client.get(reverse('data:cxpc-indicators'), {'tickers': 'DW', 'window': 2, 'days': 3})
+
+        assert response.status_code == 200
+        assert response.data['exchange_code'] == 'UNIVERSE'
+        # both exchanges traded alike, the universe sits between them
+        assert response.data['tickers']['DW']['sma'] == [20.0] * 3
+        assert response.data['tickers']['DW']['vwap'] == [20.0] * 3
+
+    @pytest.mark.parametrize(
+        'params',
+        [
+            {},
+            {'tickers': ' , '},
+            {'tickers': 'DW', 'window': 1},
+            {'tickers': 'DW', 'exchange_code': 'foo'},
+            # reaches past the daily CXPC history
+            {'tickers': 'DW', 'window': 365, 'days': CXPCIndicatorService.MAX_DAYS},
+        ],
+    )
+    def test_indicators_invalid(self, api_client, params):
+        assert api_client.get(reverse('data:cxpc-indicators'), params).status_code == 400
+
+
+class TestFIOWebhookIngest:
+    def test_ingest_validates_and_streams_raw_body(self, api_client):
+        config = GlobalConfigWebhook.objects.create(sender=WebhookSenderChoices.FIOAPI)
+        url = reverse('data:fio-webhook-ingest', kwargs={'token': config.path})
+        body = orjson.dumps(fio_webhook_payload(fio_webhook_cx_message(fio_webhook_cx_entry())))
+
+        with patch('gamedata.api.viewsets.FIOWebhookStream.append') as mock_append:
+            response = api_client.post(url, data=body, content_type='application/json')
+            assert response.status_code == 202
+            mock_append.assert_called_once_with(body)
+
+            broken_body = b'{"Data": [{"Endpoint": "/cx"'
+            response_invalid = api_client.post(url, data=broken_body, content_type='application/json')
+            assert response_invalid.status_code == 400
+            assert mock_append.call_count == 1
+
+        config.refresh_from_db()
+        assert config.total_calls == 1
@@ -12,7 +12,6 @@ class TestGamedataCacheManager:
             ('key_material_list', [], ['material', 'list']),
             ('key_recipe_list', [], ['recipe', 'list']),
             ('key_building_list', [], ['building', 'list']),
-            ('key_exchange_list', ['csv'], ['exchange', 'list', 'csv']),
             ('key_planet_list', [], ['planet', 'list']),
             ('key_planet_get', ['MORIA'], ['planet', 'MORIA']),
             ('key_planet_searchterm', ['term'], ['planet', 'search_term', 'term']),
@@ -38,6 +37,20 @@ class TestGamedataCacheManager:
     def test_key_exchange_cxpc(self, ticker, code, expected):
         assert GamedataCacheManager.key_exchange_cxpc_response(ticker, code) == expected
 
+    def test_key_exchange_cxpc_query(self):
+        assert (
+            GamedataCacheManager.key_exchange_cxpc_response('FE', None, 'week:0::10')
+            == 'GAMEDATA:exchange:cxpc:FE:all:week:0::10'
+        )
+        assert (
+            GamedataCacheManager.key_exchange_cxpc_response('FE', 'AI1', None, 'columns')
+            == 'GAMEDATA:exchange:cxpc:FE:AI1:columns'
+        )
+
+    def test_key_exchange_cxpc_indicators(self):
+        key = GamedataCacheManager.key_exchange_cxpc_indicators(['DW', 'RAT'], 'AI1', 7, 30, 1772409600000)
+        assert key == 'GAMEDATA:exchange:cxpc:indicators:AI1:7:30:1772409600000:DW,RAT'
+
     def test_key_planet_search_complex(self):
         search_req: dict[str, list[str] | bool] = {
             'materials': ['iron', 'copper'],
@@ -56,7 +69,6 @@ class TestGamedataCacheManager:
             ('get_material_list_response', [], 86400),
             ('get_recipe_list_response', [], 86400),
             ('get_building_list_response', [], 86400),
-            ('get_exchange_list_response', [], 86400),
             ('get_planet_list_response', [], 86400),
             ('get_planet_get_response', ['M1'], 86400),
             ('get_planet_multiple_response', [['M1']], 1800),
@@ -64,6 +76,7 @@ class TestGamedataCacheManager:
             ('get_planet_search_response', [{}], 1800),
             ('get_planet_searchterm', ['Complex-Term!'], 1800),
             ('get_exchange_cxpc_response', ['F', 'A'], 10800),
+            ('get_exchange_cxpc_indicators_response', [['F'], 'A', 7, 30, 0], 10800),
             ('get_planet_latest_popr', ['M1'], 86400),
         ],
     )
@@ -0,0 +1,63 @@
+import asyncio
+
+import orjson
+from django.test import RequestFactory
+from gamedata.api.sse import MAX_BATCH_MS, _batch_ms, _build_filter, _collect, _snapshot_frame
+from gamedata.services.sse_hub import SSEMessage
+
+
+def _message(entry_id: str) -> SSEMessage:
+    return SSEMessage(stream='stream:cx', id=entry_id, payload=b'{}')
+
+
+class TestSSEStreamParameters:
+    def test_build_filter(self):
+        params = {'tickers': 'rat, dw', 'exchanges': 'ai1', 'fields': 'bid,ask,x'}
+        request = RequestFactory().get('/data/stream/', params)
+
+        sse_filter = _build_filter(request)
+
+        assert sse_filter.tickers == {'RAT', 'DW'}
+        assert sse_filter.exchanges == {'AI1'}
+        # unknown fields are dropped, order is normalized
+        assert sse_filter.fields == ('ask', 'bid')
+
+    def test_batch_ms_is_bounded(self):
+        factory = RequestFactory()
+
+        assert _batch_ms(factory.get('/', {'batch_ms': '250'})) == 250
+        assert _batch_ms(factory.get('/', {'batch_ms': '999999'})) == MAX_BATCH_MS
+        assert _batch_ms(factory.get('/', {'batch_ms': 'x'})) == 0
+
+    def test_snapshot_frame(self):
+        frame = _snapshot_frame('5-0', [{'material_ticker': 'RAT'}])
+
+        header, data = frame.split('data: ')
+        assert header == 'id: 5-0\nevent: snapshot\n'
+        assert orjson.loads(data) == [{'material_ticker': 'RAT'}]
+
+
+class TestSSECollect:
+    def test_collect_drains_queue_without_batching(self):
+        async def run():
+            queue: asyncio.Queue = asyncio.Queue()
+            queue.put_nowait(_message('2-0'))
+            queue.put_nowait(None)
+            return await _collect(queue, _message('1-0'), batch_ms=0)
+
+        messages, evicted = asyncio.run(run())
+
+        assert [m.id for m in messages] == ['1-0', '2-0']
+        assert evicted
+
+    def test_collect_waits_for_batch_window(self):
+        async def run():
+            queue: asyncio.Queue = asyncio.Queue()
+            loop = asyncio.get_running_loop()
+            loop.call_later(0.01, queue.put_nowait, _message('2-0'))
+            return await _collect(queue, _message('1-0'), batch_ms=50)
+
+        messages, evicted = asyncio.run(run())
+
+        assert [m.id for m in messages] == ['1-0', '2-0']
+        assert not evicted
@@ -4,9 +4,11 @@ from unittest.mock import MagicMock, patch
 
 import pytest
 from django.utils import timezone
+from gamedata.models.game_exchange import GameExchangeCXPC
 from gamedata.models.game_playerdata import GameFIOPlayerData
 from gamedata.tasks import (
     gamedata_clean_user_fiodata,
+    gamedata_compact_cxpc,
     gamedata_dispatch_fio_updates,
     gamedata_refresh_cxpc,
     gamedata_refresh_planet,
@@ -58,22 +60,49 @@ class TestGamedataTasks:
         mock_get_fio.return_value.__enter__.return_value.get_all_exchanges.return_value = [
             SimpleNamespace(ticker='F', exchange_code='A')
         ]
-        gamedata_trigger_refresh_cxpc()
+        with patch('gamedata.tasks.refresh_exchange_analytics.si') as mock_callback:
+            gamedata_trigger_refresh_cxpc()
         assert mock_chord.called
+        # analytics are refreshed once per ticker after the chord, not by every exchange task
+        mock_callback.assert_called_once_with(['F'])
 
         with patch('gamedata.tasks.get_fio_service') as m:
             f = m.return_value.__enter__.return_value
+            now_epoch = int(timezone.now().timestamp() * 1000)
             f.get_cxpc.return_value = [
-                SimpleNamespace(interval='DAY_ONE', date_epoch=1, open=1, close=1, high=1, low=1, volume=1, traded=1)
+                SimpleNamespace(interval='DAY_ONE', date_epoch=d, open=1, close=1, high=1, low=1, volume=1, traded=1)
+                for d in (1, now_epoch)
             ]
-            assert gamedata_refresh_cxpc('F', 'A') is True
+            with patch('gamedata.services.exchange_analytics.ExchangeAnalyticsService.refresh') as mock_refresh:
+                assert gamedata_refresh_cxpc('F', 'A') is True
+            mock_refresh.assert_not_called()
+            # days past retention are not stored again
+            assert list(GameExchangeCXPC.objects.values_list('date_epoch', flat=True)) == [now_epoch]
             f.get_cxpc.side_effect = Exception
             assert gamedata_refresh_cxpc('F', 'A') is False
 
+    def test_compact_cxpc(self):
+        with (
+            patch('gamedata.services.exchange_cxpc_storage.CXPCStorageService.ensure_partitions') as mock_partitions,
+            patch('gamedata.services.exchange_cxpc_storage.CXPCStorageService.compact', return_value=4),
+            patch('gamedata.tasks.GamedataCacheManager') as m,
+        ):
+            assert gamedata_compact_cxpc() is True
+            assert mock_partitions.called
+            m.delete_pattern.assert_called_once_with('*cxpc*')
+
     def test_analytics_and_cleanup(self):
-        with patch('django.db.connection.cursor'), patch('gamedata.tasks.GamedataCacheManager') as m:
+        with (
+            patch('gamedata.services.exchange_analytics.ExchangeAnalyticsService.refresh') as mock_refresh,
+            patch('gamedata.services.exchange_analytics.ExchangeAnalyticsService.refresh_stale') as mock_stale,
+            patch('gamedata.tasks.GamedataCacheManager') as m,
+        ):
             assert refresh_exchange_analytics() is True
-            assert m.delete.called
+            mock_refresh.assert_not_called()
+            assert refresh_exchange_analytics(['F', 'H2O']) is True
+            mock_refresh.assert_called_once_with(['F', 'H2O'])
+            assert mock_stale.call_count == 2
+            m.delete_pattern.assert_called_with('*cxpc*')
         user = baker.make('user.User')
         baker.make('gamedata.GameFIOPlayerData', user=user)
         gamedata_clean_user_fiodata(user.id)
@@ -92,3 +121,28 @@ class TestGamedataTasks:
 
         assert 'Dispatched 1' in gamedata_dispatch_fio_updates()
         assert mock_async.called
+
+    @pytest.mark.parametrize(
+        'refreshed_hours_ago, covered, expected',
+        [
+            (7, GameFIOPlayerData.WEBHOOK_FIELDS, 0),
+            (25, GameFIOPlayerData.WEBHOOK_FIELDS, 1),
+            # ships are not pushed, the polled ship data would go stale
+            (7, ('storage_webhook_at', 'site_webhook_at', 'warehouse_webhook_at'), 1),
+        ],
+    )
+    @patch('gamedata.tasks.gamedata_refresh_user_fiodata.apply_async')
+    def test_dispatch_fio_updates_webhook_covered(self, mock_async, refreshed_hours_ago, covered, expected):
+        user = baker.make('user.User', prun_username='T', fio_apikey='K', last_login=timezone.now())
+        baker.make(
+            'gamedata.GameFIOPlayerData',
+            user=user,
+            automation_error_count=0,
+            automation_refresh_status='success',
+            automation_last_refreshed_at=timezone.now() - timedelta(hours=refreshed_hours_ago),
+        )
+        GameFIOPlayerData.objects.filter(user=user).update(
+            **dict.fromkeys(covered, timezone.now() - timedelta(minutes=5))
+        )
+
+        assert f'Dispatched {expected}' in gamedata_dispatch_fio_updates()
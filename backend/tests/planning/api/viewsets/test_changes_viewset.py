@@ -0,0 +1,94 @@
+from datetime import timedelta
+
+import pytest
+from django.urls import reverse
+from django.utils import timezone
+from model_bakery import baker
+from planning.models import PlanningDeletion, PlanningEmpire, PlanningPlan
+from planning.services.changes_service import PlanningChangesService
+
+pytestmark = pytest.mark.django_db
+
+
+def _age(model, uuid, days: int) -> None:
+    model.objects.filter(uuid=uuid).update(modified_at=timezone.now() - timedelta(days=days))
+
+
+class TestChangesViewSet:
+    def test_changes(self, api_client, user_factory, plan_factory):
+        user = user_factory(id=1)
+        other = user_factory(id=2)
+        old_plan = plan_factory(user=user)
+        new_plan = plan_factory(user=user)
+        deleted_plan = plan_factory(user=user)
+        empire = baker.make('planning.PlanningEmpire', user=user)
+        plan_factory(user=other)
+
+        for plan in (old_plan, new_plan, deleted_plan):
+            _age(PlanningPlan, plan.uuid, days=2)
+        _age(PlanningEmpire, empire.uuid, days=2)
+
+        since = timezone.now() - timedelta(days=1)
+
+        new_plan.plan_name = 'Changed'
+        new_plan.save()
+        deleted_uuid = deleted_plan.uuid
+        deleted_plan.delete()
+
+        url = reverse('planning:changes')
+        assert api_client.get(url, {'since': since.isoformat()}).status_code == 401
+
+        response = api_client.as_user(user).get(url, {'since': since.isoformat()})
+
+        assert response.status_code == 200
+        assert [plan['uuid'] for plan in response.data['plans']] == [str(new_plan.uuid)]
+        assert response.data['plans'][0]['plan_name'] == 'Changed'
+        assert response.data['empires'] == []
+        assert response.data['deleted'] == {'plans': [str(deleted_uuid)], 'empires': [], 'cxs': []}
+        assert response.data['until'] >= since.isoformat()
+
+    def test_links_mark_empire_and_plan_changed(self, api_client, user_factory, plan_factory):
+        user = user_factory(id=1)
+        plan = plan_factory(user=user)
+        empire = baker.make('planning.PlanningEmpire', user=user)
+        _age(PlanningPlan, plan.uuid, days=2)
+        _age(PlanningEmpire, empire.uuid, days=2)
+
+        since = timezone.now() - timedelta(days=1)
+        baker.make('planning.PlanningEmpirePlan', user=user, empire=empire, plan=plan)
+
+        response = api_client.as_user(user).get(reverse('planning:changes'), {'since': since.isoformat()})
+
+        assert [e['uuid'] for e in response.data['empires']] == [str(empire.uuid)]
+        assert [p['uuid'] for p in response.data['plans']] == [str(plan.uuid)]
+
+    def test_expired_since(self, api_client, user_factory):
+        user = user_factory(id=1)
+        since = timezone.now() - timedelta(days=PlanningChangesService.RETENTION_DAYS + 1)
+
+        response = api_client.as_user(user).get(reverse('planning:changes'), {'since': since.isoformat()})
+
+        assert response.status_code == 410
+        assert api_client.as_user(user).get(reverse('planning:changes')).status_code == 400
+
+
+class TestPlanningDeletions:
+    def test_deleting_user_leaves_no_tombstones(self, user_factory, plan_factory):
+        user = user_factory(id=1)
+        plan_factory(user=user)
+        baker.make('planning.PlanningCX', user=user)
+
+        user.delete()
+
+        assert not PlanningDeletion.objects.exists()
+
+    def test_purge_deletions(self, user_factory):
+        user = user_factory(id=1)
+        expired = baker.make('planning.PlanningDeletion', user=user, object_type='plan')
+        kept = baker.make('planning.PlanningDeletion', user=user, object_type='cx')
+        PlanningDeletion.objects.filter(pk=expired.pk).update(
+            deleted_at=timezone.now() - timedelta(days=PlanningChangesService.RETENTION_DAYS + 1)
+        )
+
+        assert PlanningChangesService.purge_deletions() == 1
+        assert list(PlanningDeletion.objects.values_list('pk', flat=True)) == [kept.pk]
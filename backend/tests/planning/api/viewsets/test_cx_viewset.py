@@ -0,0 +1,16 @@
+import pytest
+from django.urls import reverse
+from model_bakery import baker
+
+pytestmark = pytest.mark.django_db
+
+
+class TestCXViewSet:
+    def test_list_fields(self, api_client, user_factory):
+        user = user_factory(id=1)
+        cx = baker.make('planning.PlanningCX', user=user, cx_name='Prefs')
+
+        response = api_client.as_user(user).get(reverse('planning:cx'), {'fields': 'uuid,cx_name'})
+
+        assert response.status_code == 200
+        assert response.data == [{'uuid': cx.uuid, 'cx_name': 'Prefs'}]
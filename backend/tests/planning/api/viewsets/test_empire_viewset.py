@@ -0,0 +1,87 @@
+import pytest
+from django.urls import reverse
+from model_bakery import baker
+
+pytestmark = pytest.mark.django_db
+
+
+class TestEmpireViewSet:
+    def test_list_fields_and_pagination(self, api_client, user_factory):
+        user = user_factory(id=1)
+        for name in ['B', 'A']:
+            baker.make('planning.PlanningEmpire', user=user, empire_name=name, empire_state={'empire_total': {}})
+
+        response = api_client.as_user(user).get(reverse('planning:empire'), {'fields': 'empire_name', 'page_size': 1})
+
+        assert response.status_code == 200
+        assert response.data['results'] == [{'empire_name': 'A'}]
+        assert response.data['next'] is not None
+
+        response = api_client.as_user(user).get(reverse('planning:empire'), {'fields': '-plans'})
+        assert [row['empire_name'] for row in response.data] == ['A', 'B']
+        assert 'plans' not in response.data[0]
+        assert 'empire_state' not in response.data[0]
+
+    def test_documents_are_not_publicly_cacheable(self, api_client, user_factory):
+        user = user_factory(id=1)
+        empire = baker.make('planning.PlanningEmpire', user=user, empire_name='A', empire_state={'empire_total': {}})
+
+        for url in [reverse('planning:empire'), reverse('planning:empire-detail', kwargs={'pk': empire.uuid})]:
+            response = api_client.as_user(user).get(url)
+
+            assert response.status_code == 200
+            assert not response.has_header('Cache-Control')
+
+    def test_patch_state(self, api_client, user_factory):
+        user = user_factory(id=1)
+        empire = baker.make(
+            'planning.PlanningEmpire',
+            user=user,
+            empire_state={
+                'metadata': {
+                    'faction': 'MORIA',
+                    'permits_used': 2,
+                    'permits_total': 3,
+                    'plan_count': 0,
+                    'timestamp': 'now',
+                },
+                'empire_total': {},
+                'plan_details': {},
+            },
+        )
+        url = reverse('planning:empire-state-patch', kwargs={'pk': empire.uuid})
+
+        response = api_client.as_user(user).patch(
+            url, [{'op': 'replace', 'path': '/metadata/permits_used', 'value': 3}], format='json'
+        )
+
+        assert response.status_code == 200
+        empire.refresh_from_db()
+        assert empire.empire_state['metadata']['permits_used'] == 3
+        assert empire.needs_state_sync is True
+
+        # totals and plan details are server-computed
+        for path in ['/empire_total/FE', '/plan_details/x']:
+            response = api_client.as_user(user).patch(url, [{'op': 'add', 'path': path, 'value': {}}], format='json')
+            assert response.status_code == 400
+
+        empire.refresh_from_db()
+        assert empire.empire_state['empire_total'] == {}
+
+    def test_sync_state_ignores_client_totals(self, api_client, user_factory):
+        user = user_factory(id=1)
+        empire = baker.make('planning.PlanningEmpire', user=user, empire_faction='MORIA', empire_state={})
+        plan = baker.make('planning.PlanningPlan', user=user, material_io={'FE': {'p': 2.0, 'c': 0.0, 'd': 2.0}})
+        baker.make('planning.PlanningEmpirePlan', user=user, empire=empire, plan=plan)
+
+        response = api_client.as_user(user).patch(
+            reverse('planning:empire-sync-state', kwargs={'pk': empire.uuid}),
+            {'empire_total': {'FE': {'p': 99, 'c': 0, 'd': 99}}, 'plan_details': {}},
+            format='json',
+        )
+
+        assert response.status_code == 200
+        empire.refresh_from_db()
+        assert empire.empire_state['empire_total'] == {'FE': {'p': 2.0, 'c': 0.0, 'd': 2.0}}
+        assert list(empire.empire_state['plan_details']) == [str(plan.uuid)]
+        assert response.data['uuid'] == str(empire.uuid)
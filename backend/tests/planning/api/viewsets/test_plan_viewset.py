@@ -0,0 +1,154 @@
+import json
+from unittest.mock import patch
+
+import pytest
+from django.urls import reverse
+from model_bakery import baker
+from planning.models import PlanningEmpirePlan, PlanningPlan
+from tests.fixtures.planning.fxt_plan_vallis import plan_data_vallis
+
+pytestmark = pytest.mark.django_db
+
+
+class TestPlanViewSet:
+    def test_production(self, api_client, user_factory, plan_factory):
+        user_1 = user_factory(id=1)
+        user_2 = user_factory(id=2)
+        plan = plan_factory(user=user_1, plan_cogc='---', plan_data=plan_data_vallis)
+
+        url = reverse('planning:plan-production', kwargs={'pk': plan.uuid})
+
+        assert api_client.get(url).status_code == 401
+        assert api_client.as_user(user_2).get(url).status_code == 404
+
+        response = api_client.as_user(user_1).get(url)
+        assert response.status_code == 200
+        # no game data, nothing is produced
+        assert response.data['materials'] == {}
+        assert set(response.data['workforce']) == {'pioneers', 'settlers', 'technicians', 'engineers', 'scientists'}
+
+    def test_bulk(self, api_client, user_factory, plan_factory):
+        user_1 = user_factory(id=1)
+        user_2 = user_factory(id=2)
+        to_update = plan_factory(user=user_1, plan_name='Old', plan_data=plan_data_vallis)
+        to_delete = plan_factory(user=user_1)
+        foreign = plan_factory(user=user_2)
+        empire = baker.make('planning.PlanningEmpire', user=user_1)
+
+        payload = {
+            'plan_name': 'Vallis',
+            'planet_natural_id': 'VH-331a',
+            'plan_permits_used': 1,
+            'plan_cogc': 'METALLURGY',
+            'plan_corphq': False,
+            'plan_data': plan_data_vallis,
+        }
+        operations = [
+            {'op': 'create', 'data': {**payload, 'empire_uuid': str(empire.uuid)}},
+            {'op': 'update', 'uuid': str(to_update.uuid), 'data': {**payload, 'plan_name': 'New'}},
+            {'op': 'delete', 'uuid': str(to_delete.uuid)},
+            {'op': 'delete', 'uuid': str(foreign.uuid)},
+            {'op': 'create', 'data': {**payload, 'plan_permits_used': 9}},
+            {'op': 'delete', 'uuid': str(to_delete.uuid)},
+        ]
+
+        url = reverse('planning:plan-bulk')
+        assert api_client.post(url, {'operations': operations}, format='json').status_code == 401
+
+        with patch('core.services.cache_invalidation.CacheManager.purge') as purge:
+            response = api_client.as_user(user_1).post(url, {'operations': operations}, format='json')
+
+        assert response.status_code == 200
+        results = response.data['results']
+        assert [r['status'] for r in results] == ['created', 'updated', 'deleted', 'failed', 'failed', 'failed']
+        assert 'plan_permits_used' in results[4]['errors']
+        # on commit only
+        purge.assert_not_called()
+
+        created = PlanningPlan.objects.get(uuid=results[0]['uuid'])
+        assert created.user == user_1
+        assert PlanningEmpirePlan.objects.filter(empire=empire, plan=created).exists()
+        assert PlanningPlan.objects.get(uuid=to_update.uuid).plan_name == 'New'
+        assert not PlanningPlan.objects.filter(uuid=to_delete.uuid).exists()
+        assert PlanningPlan.objects.filter(uuid=foreign.uuid).exists()
+
+    def test_bulk_rejects_malformed_operations(self, api_client, user_factory):
+        user = user_factory(id=1)
+        url = reverse('planning:plan-bulk')
+
+        for operations in [[], [{'op': 'update', 'data': {}}], [{'op': 'delete'}], [{'op': 'create'}]]:
+            response = api_client.as_user(user).post(url, {'operations': operations}, format='json')
+            assert response.status_code == 400
+
+    def test_list_fields(self, api_client, user_factory, plan_factory):
+        user = user_factory(id=1)
+        plan = plan_factory(user=user, plan_name='Vallis', planet_natural_id='VH-331a', plan_data=plan_data_vallis)
+        empire = baker.make('planning.PlanningEmpire', user=user, empire_name='Main')
+        baker.make('planning.PlanningEmpirePlan', user=user, empire=empire, plan=plan)
+
+        url = reverse('planning:plan')
+        client = api_client.as_user(user)
+
+        response = client.get(url, {'fields': 'uuid,plan_name'})
+        assert response.status_code == 200
+        assert response.data == [{'uuid': plan.uuid, 'plan_name': 'Vallis'}]
+
+        response = client.get(url, {'fields': '-plan_data'})
+        assert response.status_code == 200
+        assert 'plan_data' not in response.data[0]
+        assert response.data[0]['empires'][0]['empire_name'] == 'Main'
+
+        assert client.get(url, {'fields': 'material_io'}).status_code == 400
+        assert client.get(url, {'fields': 'empire_uuid'}).status_code == 400
+
+    def test_list_cursor_pagination(self, api_client, user_factory, plan_factory):
+        user = user_factory(id=1)
+        for name in ['C', 'A', 'B']:
+            plan_factory(user=user, plan_name=name)
+
+        url = reverse('planning:plan')
+        client = api_client.as_user(user)
+
+        # plain list without pagination parameters
+        assert len(client.get(url).data) == 3
+
+        names = []
+        response = client.get(url, {'page_size': 2, 'fields': 'plan_name'})
+        while True:
+            assert response.status_code == 200
+            names += [row['plan_name'] for row in response.data['results']]
+            if not response.data['next']:
+                break
+            response = client.get(response.data['next'])
+
+        assert names == ['A', 'B', 'C']
+
+        response = client.get(url, {'page_size': 2})
+        assert [row['plan_name'] for row in response.data['results']] == ['A', 'B']
+        assert 'plan_data' in response.data['results'][0]
+
+    def test_patch_plan_data(self, api_client, user_factory, plan_factory):
+        user = user_factory(id=1)
+        plan = plan_factory(user=user, plan_data=plan_data_vallis)
+        url = reverse('planning:plan-data-patch', kwargs={'pk': plan.uuid})
+        operations = [
+            {'op': 'test', 'path': '/buildings/0/amount', 'value': plan_data_vallis['buildings'][0]['amount']},
+            {'op': 'replace', 'path': '/buildings/0/amount', 'value': 7},
+        ]
+
+        assert api_client.patch(url, operations, format='json').status_code == 401
+        assert api_client.as_user(user_factory(id=2)).patch(url, operations, format='json').status_code == 404
+
+        response = api_client.as_user(user).patch(
+            url, json.dumps(operations), content_type='application/json-patch+json'
+        )
+
+        assert response.status_code == 200
+        assert response.data['uuid'] == str(plan.uuid)
+        plan.refresh_from_db()
+        assert plan.plan_data['buildings'][0]['amount'] == 7
+
+        # the test operation no longer matches
+        assert api_client.as_user(user).patch(url, operations, format='json').status_code == 409
+        invalid = [{'op': 'replace', 'path': '/buildings/0/amount', 'value': -1}]
+        assert api_client.as_user(user).patch(url, invalid, format='json').status_code == 400
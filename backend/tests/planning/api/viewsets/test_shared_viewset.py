@@ -1,3 +1,5 @@
+from unittest.mock import MagicMock, patch
+
 import pytest
 from django.urls import reverse
 from tests.fixtures.planning.fxt_plan_vallis import plan_data_vallis
@@ -5,6 +7,13 @@ from tests.fixtures.planning.fxt_plan_vallis import plan_data_vallis
 pytestmark = pytest.mark.django_db
 
 
+@pytest.fixture(autouse=True)
+def mock_redis():
+    r = MagicMock()
+    with patch('planning.services.shared_view_service.get_redis_connection', return_value=r):
+        yield r
+
+
 class TestSharedViewSet:
     def test_shared_get(self, api_client, user_factory, plan_factory, shared_factory):
 
@@ -89,3 +98,31 @@ class TestSharedViewSet:
         # clone auth
         response_clone = api_client.as_user(user_1).post(url_clone)
         assert response_clone.status_code == 201
+
+    def test_shared_retrieve_cached(self, api_client, user_factory, plan_factory, shared_factory, mock_redis):
+        user_1 = user_factory(id=1)
+        shared_1 = shared_factory(user=user_1, plan=plan_factory(user=user_1, plan_data=plan_data_vallis))
+        url_get = reverse('planning:shared-detail', kwargs={'pk': shared_1.uuid})
+
+        response = api_client.get(url_get)
+        assert response.status_code == 200
+        assert response.json()['uuid'] == str(shared_1.uuid)
+        assert response['Cache-Control'] == 'public, max-age=60'
+        etag = response['ETag']
+
+        # views are buffered, not written per request
+        mock_redis.hincrby.assert_called_once_with('planning:shared:views', str(shared_1.uuid), 1)
+        shared_1.refresh_from_db()
+        assert shared_1.view_count == 0
+
+        response_304 = api_client.get(url_get, HTTP_IF_NONE_MATCH=etag)
+        assert response_304.status_code == 304
+        assert response_304['ETag'] == etag
+        assert mock_redis.hincrby.call_count == 2
+
+        cached = {'data': b'{"uuid": "cached"}', 'etag': '"cached"'}
+        with patch('planning.planning_cache_manager.PlanningCacheManager.get_shared_retrieve', return_value=cached):
+            response_hit = api_client.get(url_get)
+
+        assert response_hit.json() == {'uuid': 'cached'}
+        assert response_hit['ETag'] == '"cached"'
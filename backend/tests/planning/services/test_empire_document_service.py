@@ -0,0 +1,81 @@
+from unittest.mock import patch
+
+import orjson
+import pytest
+from django.core.cache import cache
+from model_bakery import baker
+from planning.models import PlanningEmpirePlan
+from planning.services.empire_document_service import EmpireDocumentService
+
+pytestmark = pytest.mark.django_db
+
+
+@pytest.fixture(autouse=True)
+def locmem_cache(settings):
+    settings.CACHES = {'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}}
+    # locmem has no patterns, the signals only purge unrelated keys with them
+    with (
+        patch(
+            'core.services.cache_invalidation.CacheManager.purge',
+            side_effect=lambda keys, patterns: cache.delete_many(list(keys)),
+        ),
+        patch('planning.tasks.planning_refresh_plan_contribution.delay'),
+        patch('planning.tasks.planning_attach_empire_plan.delay'),
+        patch('planning.tasks.planning_detach_empire_plan.delay'),
+    ):
+        yield
+
+
+def make_empire(user, name):
+    return baker.make(
+        'planning.PlanningEmpire', user=user, empire_name=name, empire_permits_used=1, empire_permits_total=2
+    )
+
+
+def names(user_id: int) -> list:
+    return [empire['empire_name'] for empire in orjson.loads(EmpireDocumentService.empire_list(user_id))]
+
+
+class TestEmpireDocumentService:
+    def test_reads_are_served_from_documents(self, user_factory, django_assert_num_queries):
+        user = user_factory(id=1)
+        empire = make_empire(user, 'B')
+        make_empire(user, 'A')
+        plan = baker.make('planning.PlanningPlan', user=user, plan_name='Vallis')
+        baker.make('planning.PlanningEmpirePlan', user=user, empire=empire, plan=plan)
+
+        assert names(user.id) == ['A', 'B']
+
+        with django_assert_num_queries(0):
+            assert names(user.id) == ['A', 'B']
+            document = orjson.loads(EmpireDocumentService.empire(user.id, empire.uuid))  # type: ignore
+
+        assert document['plans'] == [
+            {'uuid': str(plan.uuid), 'plan_name': 'Vallis', 'planet_natural_id': plan.planet_natural_id}
+        ]
+        assert EmpireDocumentService.empire(user_factory(id=2).id, empire.uuid) is None
+
+    def test_writes_update_affected_documents(self, user_factory, django_capture_on_commit_callbacks):
+        user = user_factory(id=1)
+        empire = make_empire(user, 'B')
+        plan = baker.make('planning.PlanningPlan', user=user, plan_name='Vallis')
+        names(user.id)
+
+        with django_capture_on_commit_callbacks(execute=True):
+            PlanningEmpirePlan.objects.create(user=user, empire=empire, plan=plan)
+        assert orjson.loads(EmpireDocumentService.empire(user.id, empire.uuid))['plans'][0]['plan_name'] == 'Vallis'  # type: ignore
+
+        with django_capture_on_commit_callbacks(execute=True):
+            plan.plan_name = 'Renamed'
+            plan.save(update_fields=['plan_name'])
+        assert orjson.loads(EmpireDocumentService.empire(user.id, empire.uuid))['plans'][0]['plan_name'] == 'Renamed'  # type: ignore
+
+        with django_capture_on_commit_callbacks(execute=True):
+            other = make_empire(user, 'A')
+        assert names(user.id) == ['A', 'B']
+
+        with django_capture_on_commit_callbacks(execute=True):
+            other.delete()
+            plan.delete()
+        assert names(user.id) == ['B']
+        assert orjson.loads(EmpireDocumentService.empire(user.id, empire.uuid))['plans'] == []  # type: ignore
@@ -0,0 +1,179 @@
+from unittest.mock import patch
+
+import pytest
+from model_bakery import baker
+from planning.models import PlanningEmpire, PlanningEmpirePlan, PlanningPlan
+from planning.services.empire_state_service import EmpireStateService
+
+pytestmark = pytest.mark.django_db
+
+PLAN_A = {'FE': {'p': 10.0, 'c': 0.0, 'd': 10.0}, 'FEO': {'p': 0.0, 'c': 4.5, 'd': -4.5}}
+PLAN_B = {'FE': {'p': 0.0, 'c': 3.0, 'd': -3.0}, 'O': {'p': 2.0, 'c': 0.0, 'd': 2.0}}
+
+
+def evaluated(materials: dict) -> dict:
+    return {'materials': materials, 'workforce': {}}
+
+
+@pytest.fixture
+def empire_with_plans():
+    empire = baker.make(
+        'planning.PlanningEmpire', empire_faction='MORIA', empire_permits_used=2, empire_permits_total=3
+    )
+    plan_a = baker.make('planning.PlanningPlan', user=empire.user, planet_natural_id='VH-331a', material_io=PLAN_A)
+    plan_b = baker.make('planning.PlanningPlan', user=empire.user, planet_natural_id='OT-580b', material_io=PLAN_B)
+    for plan in (plan_a, plan_b):
+        baker.make('planning.PlanningEmpirePlan', user=empire.user, empire=empire, plan=plan)
+
+    return empire, plan_a, plan_b
+
+
+class TestEmpireStateService:
+    def test_rebuild_sums_plan_deltas(self, empire_with_plans):
+        empire, plan_a, plan_b = empire_with_plans
+
+        EmpireStateService.rebuild(empire)
+
+        empire.refresh_from_db()
+        state = empire.empire_state
+        assert state['empire_total'] == {
+            'FE': {'p': 10.0, 'c': 3.0, 'd': 7.0},
+            'FEO': {'p': 0.0, 'c': 4.5, 'd': -4.5},
+            'O': {'p': 2.0, 'c': 0.0, 'd': 2.0},
+        }
+        assert state['plan_details'][str(plan_a.uuid)]['deltas'] == PLAN_A
+        assert state['metadata']['plan_count'] == 2
+        assert state['metadata']['faction'] == 'MORIA'
+        assert empire.needs_state_sync is True
+
+    def test_refresh_plan_swaps_only_its_contribution(self, empire_with_plans):
+        empire, plan_a, plan_b = empire_with_plans
+        EmpireStateService.rebuild(empire)
+
+        changed = {'FE': {'p': 4.0, 'c': 0.0, 'd': 4.0}}
+        with patch(
+            'planning.services.empire_state_service.PlanProductionService.evaluate_plan',
+            return_value=evaluated(changed),
+        ) as evaluate:
+            assert EmpireStateService.refresh_plan(plan_a.uuid) == 1
+
+        # only the changed plan is evaluated
+        assert evaluate.call_count == 1
+        assert PlanningPlan.objects.get(uuid=plan_a.uuid).material_io == changed
+
+        empire.refresh_from_db()
+        # FEO consumption of plan a is gone, plan b untouched
+        assert empire.empire_state['empire_total'] == {
+            'FE': {'p': 4.0, 'c': 3.0, 'd': 1.0},
+            'O': {'p': 2.0, 'c': 0.0, 'd': 2.0},
+        }
+        assert empire.empire_state['plan_details'][str(plan_b.uuid)]['deltas'] == PLAN_B
+
+    def test_refresh_plan_updates_every_empire(self, empire_with_plans):
+        empire, plan_a, _ = empire_with_plans
+        other = baker.make(
+            'planning.PlanningEmpire',
+            user=empire.user,
+            empire_faction='MORIA',
+            empire_permits_used=1,
+            empire_permits_total=2,
+        )
+        baker.make('planning.PlanningEmpirePlan', user=empire.user, empire=other, plan=plan_a)
+
+        with patch(
+            'planning.services.empire_state_service.PlanProductionService.evaluate_plan',
+            return_value=evaluated(PLAN_A),
+        ):
+            assert EmpireStateService.refresh_plan(plan_a.uuid) == 2
+
+        other.refresh_from_db()
+        assert other.empire_state['empire_total'] == PLAN_A
+
+    def test_refresh_unknown_plan(self):
+        assert EmpireStateService.refresh_plan('00000000-0000-0000-0000-000000000000') == 0
+
+    def test_attach_and_detach(self, empire_with_plans):
+        empire, plan_a, plan_b = empire_with_plans
+        EmpireStateService.rebuild(empire)
+
+        EmpireStateService.detach_plan(empire.uuid, plan_b.uuid)
+        # idempotent
+        EmpireStateService.detach_plan(empire.uuid, plan_b.uuid)
+
+        empire.refresh_from_db()
+        assert empire.empire_state['empire_total'] == PLAN_A
+        assert empire.empire_state['metadata']['plan_count'] == 1
+
+        EmpireStateService.attach_plan(empire.uuid, plan_b.uuid)
+
+        empire.refresh_from_db()
+        assert empire.empire_state['empire_total']['FE'] == {'p': 10.0, 'c': 3.0, 'd': 7.0}
+        assert empire.empire_state['metadata']['plan_count'] == 2
+
+    def test_attach_requires_link(self, empire_with_plans):
+        empire, _, _ = empire_with_plans
+        unlinked = baker.make('planning.PlanningPlan', user=empire.user, material_io=PLAN_A)
+
+        EmpireStateService.attach_plan(empire.uuid, unlinked.uuid)
+
+        empire.refresh_from_db()
+        assert str(unlinked.uuid) not in (empire.empire_state or {}).get('plan_details', {})
+
+    def test_backfill_replaces_client_state(self, empire_with_plans):
+        empire, plan_a, plan_b = empire_with_plans
+        PlanningPlan.objects.update(material_io={})
+        # totals computed by an older frontend
+        PlanningEmpire.objects.filter(pk=empire.pk).update(
+            empire_state={'empire_total': {'FE': {'p': 99.0, 'c': 0.0, 'd': 99.0}}, 'plan_details': {}}
+        )
+
+        with patch(
+            'planning.services.empire_state_service.PlanProductionService.evaluate',
+            side_effect=lambda plans: [evaluated(PLAN_A if p.pk == plan_a.pk else PLAN_B) for p in plans],
+        ):
+            assert EmpireStateService.backfill() == (2, 1)
+
+        plan_b.refresh_from_db()
+        empire.refresh_from_db()
+        assert plan_b.material_io == PLAN_B
+        assert empire.empire_state['empire_total']['FE'] == {'p': 10.0, 'c': 3.0, 'd': 7.0}
+        assert set(empire.empire_state['plan_details']) == {str(plan_a.uuid), str(plan_b.uuid)}
+
+
+class TestEmpireContributionSignals:
+    @pytest.fixture(autouse=True)
+    def no_cache_purge(self):
+        with patch('core.services.cache_invalidation.CacheManager.purge'):
+            yield
+
+    def test_plan_save_enqueues_refresh(self, empire_with_plans, django_capture_on_commit_callbacks):
+        _, plan_a, _ = empire_with_plans
+
+        with (
+            patch('planning.tasks.planning_refresh_plan_contribution.delay') as refresh,
+            django_capture_on_commit_callbacks(execute=True),
+        ):
+            plan_a.plan_data = {'buildings': []}
+            plan_a.save()
+            # fields the contribution does not depend on
+            plan_a.save(update_fields=['plan_name'])
+
+        refresh.assert_called_once_with(str(plan_a.uuid))
+
+    def test_junction_changes_enqueue_attach_and_detach(self, django_capture_on_commit_callbacks):
+        empire = baker.make('planning.PlanningEmpire')
+        plan = baker.make('planning.PlanningPlan', user=empire.user)
+
+        with (
+            patch('planning.tasks.planning_attach_empire_plan.delay') as attach,
+            patch('planning.tasks.planning_detach_empire_plan.delay') as detach,
+            patch('planning.tasks.planning_refresh_plan_contribution.delay'),
+            django_capture_on_commit_callbacks(execute=True),
+        ):
+            link = baker.make('planning.PlanningEmpirePlan', user=empire.user, empire=empire, plan=plan)
+            link.delete()
+
+        attach.assert_called_once_with(str(empire.uuid), str(plan.uuid))
+        detach.assert_called_once_with(str(empire.uuid), str(plan.uuid))
+        assert not PlanningEmpirePlan.objects.exists()
+        assert PlanningEmpire.objects.filter(uuid=empire.uuid).exists()
@@ -0,0 +1,128 @@
+import copy
+from unittest.mock import patch
+
+import pytest
+from planning.api.serializers.empire import PlanningEmpireStateUpdateSerializer
+from planning.schemas.latest_schemas import LATEST_SCHEMA
+from planning.services.json_patch_service import JSONPatchError, JSONPatchService, JSONPatchTestFailed, PatchSchema
+from tests.fixtures.planning.fxt_plan_vallis import plan_data_vallis
+
+PLAN_SCHEMA = PatchSchema.from_pydantic(LATEST_SCHEMA['PLANNING_DATA'])
+EMPIRE_SCHEMA = PatchSchema.from_serializer(PlanningEmpireStateUpdateSerializer())
+
+EMPIRE_STATE = {
+    'metadata': {'faction': 'MORIA', 'permits_used': 2, 'permits_total': 3, 'plan_count': 1, 'timestamp': 'now'},
+    'empire_total': {'FE': {'p': 10.0, 'c': 0.0, 'd': 10.0}},
+    'plan_details': {},
+}
+
+
+def plan_data() -> dict:
+    return copy.deepcopy(plan_data_vallis)
+
+
+class TestJSONPatchService:
+    @pytest.mark.parametrize(
+        'pointer, expected',
+        [('', []), ('/buildings/0', ['buildings', '0']), ('/a~1b/c~0d', ['a/b', 'c~d'])],
+    )
+    def test_parse_pointer(self, pointer, expected):
+        assert JSONPatchService.parse_pointer(pointer) == expected
+
+    def test_path_literal(self):
+        assert JSONPatchService.path_literal(['buildings', '0', 'a"b']) == '{"buildings","0","a\\"b"}'
+
+    def test_operations(self):
+        document = {'a': [1, 2], 'b': {'c': 1}}
+
+        for operation in [
+            {'op': 'add', 'path': '/a/-', 'value': 3},
+            {'op': 'add', 'path': '/a/0', 'value': 0},
+            {'op': 'remove', 'path': '/a/1'},
+            {'op': 'replace', 'path': '/b/c', 'value': 2},
+            {'op': 'copy', 'from': '/b', 'path': '/d'},
+            {'op': 'move', 'from': '/d/c', 'path': '/b/e'},
+            {'op': 'test', 'path': '/a', 'value': [0, 2, 3]},
+        ]:
+            JSONPatchService._apply_operation(document, operation)
+
+        assert document == {'a': [0, 2, 3], 'b': {'c': 2, 'e': 2}, 'd': {}}
+
+    @pytest.mark.parametrize(
+        'operation',
+        [
+            {'op': 'remove', 'path': '/missing'},
+            {'op': 'replace', 'path': '/a/5', 'value': 1},
+            {'op': 'add', 'path': '/a/01', 'value': 1},
+            {'op': 'add', 'path': '/a'},
+            {'op': 'move', 'from': '/b', 'path': '/b/c'},
+            {'op': 'patch', 'path': '/a'},
+            {'op': 'remove', 'path': ''},
+            {'op': 'remove', 'path': 'a'},
+        ],
+    )
+    def test_invalid_operations(self, operation):
+        with pytest.raises(JSONPatchError):
+            JSONPatchService._apply_operation({'a': [1], 'b': {'c': 1}}, operation)
+
+    def test_failed_test_operation(self):
+        with pytest.raises(JSONPatchTestFailed):
+            JSONPatchService.apply(
+                plan_data(), [{'op': 'test', 'path': '/buildings/0/amount', 'value': -1}], PLAN_SCHEMA
+            )
+
+    def test_nested_edit_validates_the_element_only(self):
+        operations = [{'op': 'replace', 'path': '/buildings/1/amount', 'value': 4}]
+
+        with patch.dict(PLAN_SCHEMA.sections, {'buildings': lambda _: pytest.fail('section validated')}):
+            document, changed = JSONPatchService.apply(plan_data(), operations, PLAN_SCHEMA)
+
+        assert document['buildings'][1]['amount'] == 4
+        assert changed == [['buildings', '1']]
+
+    def test_list_insert_validates_the_section(self):
+        building = {'name': 'FRM', 'amount': 1, 'active_recipes': [], 'ignored': True}
+
+        document, changed = JSONPatchService.apply(
+            plan_data(), [{'op': 'add', 'path': '/buildings/-', 'value': building}], PLAN_SCHEMA
+        )
+
+        assert changed == [['buildings']]
+        # normalized like PydanticJSONField
+        assert document['buildings'][-1] == {'name': 'FRM', 'amount': 1, 'active_recipes': []}
+
+    @pytest.mark.parametrize(
+        'operations',
+        [
+            [{'op': 'replace', 'path': '/buildings/0/amount', 'value': -1}],
+            [{'op': 'add', 'path': '/buildings/-', 'value': {'name': 'FRM'}}],
+            [{'op': 'remove', 'path': '/buildings'}],
+            [{'op': 'add', 'path': '/unknown', 'value': 1}],
+            [],
+        ],
+    )
+    def test_invalid_result(self, operations):
+        with pytest.raises(JSONPatchError):
+            JSONPatchService.apply(plan_data(), operations, PLAN_SCHEMA)
+
+    def test_object_sections(self):
+        operations = [
+            {'op': 'add', 'path': '/empire_total/O', 'value': {'p': 1, 'c': 0, 'd': 1}},
+            {'op': 'remove', 'path': '/empire_total/FE'},
+        ]
+
+        document, changed = JSONPatchService.apply(copy.deepcopy(EMPIRE_STATE), operations, EMPIRE_SCHEMA)
+
+        assert document['empire_total'] == {'O': {'p': 1.0, 'c': 0.0, 'd': 1.0}}
+        assert sorted(changed) == [['empire_total', 'FE'], ['empire_total', 'O']]
+
+        with pytest.raises(JSONPatchError):
+            JSONPatchService.apply(
+                copy.deepcopy(EMPIRE_STATE),
+                [{'op': 'replace', 'path': '/metadata/faction', 'value': 'NOPE'}],
+                EMPIRE_SCHEMA,
+            )
+
+    def test_expression_without_postgres(self):
+        document = {'a': 1}
+        assert JSONPatchService.expression('plan_data', document, [['a']]) is document
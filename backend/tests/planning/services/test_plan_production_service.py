@@ -0,0 +1,97 @@
+import pytest
+from model_bakery import baker
+from planning.services.plan_production_service import PlanProductionService
+from tests.fixtures.planning.fxt_plan_vallis import plan_data_vallis
+
+pytestmark = pytest.mark.django_db
+
+
+@pytest.fixture(autouse=True)
+def fresh_matrices():
+    PlanProductionService.invalidate()
+    yield
+    PlanProductionService.invalidate()
+
+
+@pytest.fixture
+def vallis_game_data():
+    for ticker in ['O', 'FEO', 'C', 'FE']:
+        baker.make('gamedata.GameMaterial', material_id=ticker.lower(), ticker=ticker)
+
+    for ticker, expertise, pioneers in [
+        ('COL', 'RESOURCE_EXTRACTION', 50),
+        ('EXT', 'RESOURCE_EXTRACTION', 60),
+        ('SME', 'METALLURGY', 50),
+        ('HB1', None, 0),
+    ]:
+        baker.make(
+            'gamedata.GameBuilding',
+            building_ticker=ticker,
+            expertise=expertise,
+            pioneers=pioneers,
+            settlers=0,
+            technicians=0,
+            engineers=0,
+            scientists=0,
+        )
+
+    recipe = baker.make(
+        'gamedata.GameRecipe', building_ticker='SME', recipe_name='6xFEO 1xC 1xO=>3xFE', time_ms=43_200_000
+    )
+    for ticker, amount in [('FEO', 6), ('C', 1), ('O', 1)]:
+        baker.make('gamedata.GameRecipeInput', recipe=recipe, material_ticker=ticker, material_amount=amount)
+    baker.make('gamedata.GameRecipeOutput', recipe=recipe, material_ticker='FE', material_amount=3)
+
+    planet = baker.make('gamedata.GamePlanet', planet_natural_id='VH-331a', fertility=0.0)
+    # 0.5 * 60 gaseous, 0.2 * 70 mineral
+    baker.make('gamedata.GamePlanetResource', planet=planet, material_id='o', resource_type='GASEOUS', factor=0.5)
+    baker.make('gamedata.GamePlanetResource', planet=planet, material_id='feo', resource_type='MINERAL', factor=0.2)
+
+
+class TestPlanProductionService:
+    def test_evaluate_plan(self, vallis_game_data, plan_factory):
+        plan = plan_factory(
+            planet_natural_id='VH-331a', plan_cogc='METALLURGY', plan_corphq=False, plan_data=plan_data_vallis
+        )
+
+        result = PlanProductionService.evaluate_plan(plan)
+        materials = result['materials']
+
+        # pioneers with lux1, 3 experts each
+        extraction = 0.89 * 1.1248
+        smelting = extraction * 1.25 * 2 * 5
+
+        assert materials['O']['p'] == pytest.approx(30 * extraction * 2)
+        assert materials['O']['c'] == pytest.approx(smelting)
+        assert materials['FEO']['p'] == pytest.approx(14 * extraction * 3)
+        assert materials['FEO']['c'] == pytest.approx(6 * smelting)
+        assert materials['FE'] == pytest.approx({'p': 3 * smelting, 'c': 0, 'd': 3 * smelting})
+
+        # 530 pioneers: essentials and lux1, no lux2
+        assert materials['DW']['c'] == pytest.approx(4 * 5.3)
+        assert materials['COF']['c'] == pytest.approx(0.5 * 5.3)
+        assert 'PWO' not in materials
+
+        assert result['workforce']['pioneers'] == {'required': 530.0, 'capacity': 300.0}
+        assert result['workforce']['settlers'] == {'required': 0.0, 'capacity': 0.0}
+
+    def test_evaluate_batch_and_unknown_data(self, vallis_game_data, plan_factory):
+        unknown = {
+            'buildings': [
+                {'name': 'XXX', 'amount': 1, 'active_recipes': []},
+                {'name': 'SME', 'amount': 1, 'active_recipes': [{'recipeid': 'SME#unknown', 'amount': 1}]},
+            ]
+        }
+        plans = [
+            plan_factory(planet_natural_id='VH-331a', plan_cogc='---', plan_corphq=True, plan_data=plan_data_vallis),
+            plan_factory(planet_natural_id='ZZ-000z', plan_cogc='---', plan_corphq=False, plan_data=unknown),
+        ]
+
+        first, second = PlanProductionService.evaluate(plans)
+
+        # CorpHQ instead of the COGC bonus
+        assert first['materials']['FE']['p'] == pytest.approx(0.89 * 1.1248 * 1.1 * 2 * 5 * 3)
+        # unknown buildings and recipes produce nothing, their staff still needs supplies
+        assert set(second['materials']) == {'DW', 'RAT', 'OVE'}
+        assert second['workforce']['pioneers']['required'] == 50.0
+        assert PlanProductionService.evaluate([]) == []
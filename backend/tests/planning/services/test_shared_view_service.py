@@ -0,0 +1,52 @@
+from unittest.mock import MagicMock, patch
+
+import pytest
+from planning.services.shared_view_service import SharedViewService
+from tests.fixtures.planning.fxt_plan_vallis import plan_data_vallis
+
+
+@pytest.fixture
+def mock_redis():
+    r = MagicMock()
+    with patch('planning.services.shared_view_service.get_redis_connection', return_value=r):
+        yield r
+
+
+def buffer(r: MagicMock, counts: dict) -> MagicMock:
+    pipe = r.pipeline.return_value.__enter__.return_value
+    pipe.execute.return_value = [{key.encode(): str(value).encode() for key, value in counts.items()}, 1]
+    return pipe
+
+
+@pytest.mark.django_db
+class TestSharedViewService:
+    def test_flush(self, mock_redis, user_factory, plan_factory, shared_factory):
+        user = user_factory(id=1)
+        shared_1 = shared_factory(user=user, plan=plan_factory(user=user, plan_data=plan_data_vallis), view_count=5)
+        shared_2 = shared_factory(user=user, plan=plan_factory(user=user, plan_data=plan_data_vallis))
+        buffer(mock_redis, {str(shared_1.uuid): 3, str(shared_2.uuid): 1, '356da85a-494a-45a9-b20e-16d0f128c5b8': 2})
+
+        with patch('planning.services.shared_view_service.PlanningCacheManager.delete_many') as delete_many:
+            assert SharedViewService.flush() == 6
+
+        shared_1.refresh_from_db()
+        shared_2.refresh_from_db()
+        assert (shared_1.view_count, shared_2.view_count) == (8, 1)
+        assert sorted(delete_many.call_args.args[0]) == sorted(
+            [f'PLANNING:1:shared:retrieve:{shared_1.uuid}', f'PLANNING:1:shared:retrieve:{shared_2.uuid}']
+        )
+
+    def test_flush_empty(self, mock_redis):
+        buffer(mock_redis, {})
+        assert SharedViewService.flush() == 0
+
+    def test_flush_failure_restores_counts(self, mock_redis):
+        pipe = buffer(mock_redis, {'356da85a-494a-45a9-b20e-16d0f128c5b8': 2})
+
+        with (
+            patch('planning.services.shared_view_service.PlanningShared.objects.filter', side_effect=RuntimeError),
+            pytest.raises(RuntimeError),
+        ):
+            SharedViewService.flush()
+
+        pipe.hincrby.assert_called_once_with(SharedViewService.KEY, '356da85a-494a-45a9-b20e-16d0f128c5b8', 2)
@@ -11,8 +11,8 @@ class TestPlanningCacheManager:
         [
             ('key_for_plan_list', [1], ['1', 'plan', 'list']),
             ('key_plan_retrieve', [1, uuid4()], ['1', 'plan', 'retrieve']),
-            ('key_for_empire_list', [1], ['1', 'empire', 'list']),
-            ('key_for_empire_retrieve', [1, uuid4()], ['1', 'empire', 'retrieve']),
+            ('key_for_empire_index', [1], ['1', 'empire', 'index']),
+            ('key_for_empire_document', [1, uuid4()], ['1', 'empire', 'document']),
             ('key_for_empire_retrieve_plans', [1, uuid4()], ['1', 'empire', 'retrieve', 'plans']),
             ('key_for_cx_list', [1], ['1', 'cx', 'list']),
             ('key_for_cx_retrieve', [1, uuid4()], ['1', 'cx', 'retrieve']),
@@ -34,8 +34,6 @@ class TestPlanningCacheManager:
         [
             ('get_plan_list_response', []),
             ('get_plan_retrieve_response', [uuid4()]),
-            ('get_empire_list_response', []),
-            ('get_empire_retrieve_response', [uuid4()]),
             ('get_empire_retrieve_plans_response', [uuid4()]),
             ('get_cx_list_response', []),
             ('get_cx_retrieve_response', [uuid4()]),